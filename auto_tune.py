@@ -0,0 +1,441 @@
+import argparse
+import csv
+import math
+import os
+import re
+import sys
+import tempfile
+import unittest
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from cog_expressions import canonical, format_number, is_expression
+from distributions import Veins, serialize
+from excel_table import TableLocation, find_table, get_table_data, iter_workbook_tables
+from ore_simulation import default_quantiles, expected_ore_columns, row_settings, simulated_settings, veins_table
+from presets import PresetResolver
+from setting_sampling import SettingTable
+
+# Works out the modifiers of the Distribution_Parameters table in "Ore Amount Calculation Assistant.xlsx": how much
+# to multiply each setting of a COG preset by, to get the same amount of ore per chunk as without COG.
+#
+# Usage:
+#   python auto_tune.py                               # tunes every row of the table, prints the modifier columns
+#   python auto_tune.py --tune MotherlodeFrequency --tune BranchLength --format veins
+#   python auto_tune.py --only "Vanilla - Iron" --format xml
+#   python auto_tune.py --target 40 --only "Vanilla - Iron"
+#
+# The target of each row is the table's "Ore density (without COG)": half the max ores per cluster times the
+# clusters per chunk. The presets come from the Veins_Presets table of the Sprocket2 workbook.
+#
+# Only the modifiers named by --tune are changed; the others keep their values from the table. A modifier scales a
+# setting's avg and range together. Many sets of modifiers give the same amount of ore, so the tuner looks for the
+# one closest to the modifiers it started from: it minimises
+#     log(ore / target) ^ 2 + regularization * (sum of log(modifier / starting modifier) ^ 2)
+# with a Nelder-Mead search in log space, kept within the bounds. Each step of the search works out its four
+# candidate points (reflection, expansion and both contractions) in one call of ore_simulation.expected_ore_columns.
+#
+# Output formats:
+#   modifiers: a tab-separated row per ore with the seven modifier columns, in the table's order, to paste over them.
+#   veins:     Veins_Presets rows that inherit the preset, with the scaled settings.
+#   xml:       those rows rendered as COG XML.
+
+default_assistant = "Ore Amount Calculation Assistant.xlsx"
+default_presets = "Sprocket2 Spreadsheet.xlsx"
+parameters_table = "Distribution_Parameters"
+
+# The modifier columns of the Distribution_Parameters table, in order, and the Veins setting each one scales.
+# For Veins, "radius" and "thickness" are both MotherlodeSize.
+modifier_columns = OrderedDict([
+    ("Veins per chunk - Modifier", "MotherlodeFrequency"),
+    ("Motherlode Size / Cloud Radius - Modifier", "MotherlodeSize"),
+    ("Motherlode Size / Cloud Thickness - Modifier", "MotherlodeSize"),
+    ("Branch Frequency - Modifier", "BranchFrequency"),
+    ("Branch Length - Modifier", "BranchLength"),
+    ("Branch Radius - Modifier", "SegmentRadius"),
+    ("Ore Density × Noise Cutoff - Modifier", "OreDensity"),
+])
+
+default_tuned = ("MotherlodeFrequency", "MotherlodeSize", "BranchLength")
+default_bounds = (0.1, 10.0)
+regularization = 1e-4
+
+# One row of the Distribution_Parameters table. modifiers is {setting: modifier}.
+TuneTarget = namedtuple("TuneTarget", "name preset ore_per_chunk modifiers")
+
+# modifiers is {setting: modifier}, for every simulated setting.
+TuneResult = namedtuple("TuneResult", "target modifiers ore_per_chunk iterations")
+
+
+def _modifier(row, column) -> float:
+    value = row.get(column)
+    if value in (None, ""):
+        return 1.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError("%s %r is not a number." % (column, value)) from None
+
+
+def _modifiers(row) -> OrderedDict:
+    # {setting: modifier} from a Distribution_Parameters row. Blank cells are 1; a 0 is kept. MotherlodeSize gets the
+    # modifier that keeps radius ^ 2 * thickness, i.e. the spreadsheet's motherlode volume.
+    # Raises ValueError for a modifier that isn't a number.
+    values = OrderedDict((column, _modifier(row, column)) for column in modifier_columns)
+    modifiers = OrderedDict((setting, 1.0) for setting in simulated_settings)
+    for column, setting in modifier_columns.items():
+        modifiers[setting] = values[column]
+    radius, thickness = list(values.values())[1:3]
+    modifiers["MotherlodeSize"] = (radius * radius * thickness) ** (1.0 / 3.0) if radius * thickness > 0 else 0.0
+    return modifiers
+
+
+def read_targets(path):
+    # The rows of the Distribution_Parameters table that have an ore name and its vanilla numbers, as TuneTarget.
+    # Returns (targets, skipped), with skipped a list of (cell, name, reason) for rows with a modifier that isn't a
+    # number.
+    worksheet, table = find_table(openpyxl.load_workbook(path), parameters_table)
+    table_data = get_table_data(worksheet, table)
+    location = TableLocation.of_table(worksheet, table, table_data)
+    targets, skipped = [], []
+    for index, row in enumerate(table_data):
+        clusters = row.get("Clusters per chunk (without COG)")
+        ores = row.get("Max ores per cluster (without COG)")
+        if row.get("Ore") is None or not isinstance(clusters, (int, float)) or not isinstance(ores, (int, float)):
+            continue
+        try:
+            modifiers = _modifiers(row)
+        except ValueError as e:
+            skipped.append((location.row_reference(index), row["Ore"], str(e)))
+            continue
+        targets.append(TuneTarget(row["Ore"], row.get("Preset"), 0.5 * ores * clusters, modifiers))
+    return targets, skipped
+
+
+def read_presets(path) -> PresetResolver:
+    tables = iter_workbook_tables(openpyxl.load_workbook(path))
+    return PresetResolver(row for table_name, table_data, location in tables if table_name == veins_table
+                          for row in table_data)
+
+
+def nelder_mead(function, start, lower, upper, step=0.5, max_iterations=400, tolerance=1e-12):
+    # Minimises function within the box [lower, upper]. function takes an array of points, of shape (k, n), and
+    # returns their k values. Each iteration evaluates its four candidates together, and a shrink evaluates its n
+    # points together.
+    # The search runs in an unbounded space that a sigmoid maps into the box, so that no step can leave it. Clipping
+    # the steps instead would flatten the simplex onto a face or corner of the box, where it stops for good, short of
+    # a minimum inside. A start on the box's surface begins a little inside it.
+    # Returns (best point, its value, iterations).
+    start, lower, upper = (np.asarray(a, dtype=float) for a in (start, lower, upper))
+    width = upper - lower
+
+    def to_box(points):
+        with np.errstate(over="ignore"):
+            return lower + width / (1.0 + np.exp(-points))
+
+    def evaluate(points):
+        return function(to_box(points))
+
+    fraction = np.clip((start - lower) / width, 1e-3, 1.0 - 1e-3)
+    start = np.log(fraction / (1.0 - fraction))
+    simplex = np.vstack([start, start + step * np.eye(len(start))])
+    values = evaluate(simplex)
+    coefficients = np.array([1.0, 2.0, 0.5, -0.5])[:, np.newaxis]  # reflect, expand, contract out, contract in
+
+    for iteration in range(1, max_iterations + 1):
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        if values[-1] - values[0] <= tolerance and np.ptp(to_box(simplex), axis=0).max() <= 1e-9:
+            break
+        centroid = simplex[:-1].mean(axis=0)
+        candidates = centroid + coefficients * (centroid - simplex[-1])
+        reflected, expanded, outside, inside = evaluate(candidates)
+        if reflected < values[0]:
+            choice = (1, expanded) if expanded < reflected else (0, reflected)
+        elif reflected < values[-2]:
+            choice = (0, reflected)
+        elif reflected < values[-1] and outside <= reflected:
+            choice = (2, outside)
+        elif reflected >= values[-1] and inside < values[-1]:
+            choice = (3, inside)
+        else:
+            choice = None
+        if choice is not None:
+            simplex[-1], values[-1] = candidates[choice[0]], choice[1]
+        else:
+            simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+            values[1:] = evaluate(simplex[1:])
+    best = np.argmin(values)
+    return to_box(simplex[best]), values[best], iteration
+
+
+def _scaled_columns(settings, tuned, multipliers) -> OrderedDict:
+    # {setting name: SettingTable} with a row per row of multipliers (shape (k, len(tuned))), which scale the tuned
+    # settings' avg and range.
+    k = len(multipliers)
+    columns = OrderedDict()
+    for name, setting in settings.items():
+        scale = multipliers[:, tuned.index(name)] if name in tuned else np.ones(k)
+        columns[name] = SettingTable(range(k), setting.avg * scale, setting.range * scale, np.full(k, setting.type))
+    return columns
+
+
+@instrumentation.timed("tune")
+def tune(target: TuneTarget, preset_row, tuned=default_tuned, bounds=default_bounds,
+         quantiles=default_quantiles) -> TuneResult:
+    # Tunes the modifiers named in tuned, so that the preset, scaled by the modifiers, gives target.ore_per_chunk.
+    # Raises ValueError if the preset's settings can't be worked out.
+    tuned = list(tuned)
+    modifiers = OrderedDict(target.modifiers)
+    settings = row_settings(preset_row)
+    fixed = OrderedDict((name, setting._replace(avg=setting.avg * modifiers[name],
+                                                range=setting.range * modifiers[name]))
+                        for name, setting in settings.items() if name not in tuned)
+    settings = OrderedDict((name, fixed.get(name, setting)) for name, setting in settings.items())
+    start = np.log(np.clip([modifiers[name] for name in tuned], *bounds))
+    goal = math.log(target.ore_per_chunk)
+
+    def objective(points):
+        motherlode, branches = expected_ore_columns(_scaled_columns(settings, tuned, np.exp(points)), quantiles)
+        with np.errstate(divide="ignore"):
+            miss = np.log(motherlode + branches) - goal
+        return np.where(np.isfinite(miss), miss * miss, np.inf) + regularization * ((points - start) ** 2).sum(axis=1)
+
+    best, value, iterations = nelder_mead(objective, start, np.full(len(tuned), math.log(bounds[0])),
+                                          np.full(len(tuned), math.log(bounds[1])))
+    modifiers.update(zip(tuned, np.exp(best).tolist()))
+    motherlode, branches = expected_ore_columns(_scaled_columns(settings, tuned, np.exp(best)[np.newaxis]),
+                                                quantiles)
+    return TuneResult(target, modifiers, float(motherlode[0] + branches[0]), iterations)
+
+
+def scaled_cell(value, multiplier):
+    # A setting cell multiplied by a modifier: a number for a number, a canonical ":=" expression for an expression.
+    # The modifier is rounded to the 4 significant digits that write_modifiers() prints.
+    multiplier = float("%.4g" % multiplier)
+    if value is None or multiplier == 1:
+        return value
+    if is_expression(value):
+        return canonical(":= %s * (%s)" % (format_number(multiplier), value.lstrip()[2:]))
+    return format_number(float(value) * multiplier)
+
+
+def distribution_name(ore_name) -> str:
+    # "Vanilla - Iron" -> "VanillaIron"
+    return re.sub(r"\W+", "", ore_name)
+
+
+def veins_row(result: TuneResult, preset_row) -> OrderedDict:
+    # A Veins_Presets row for a result: it inherits the preset, and has the scaled cells of the modified settings.
+    # A setting the preset leaves blank is scaled from its default, i.e. OreDensity 1. Raises ValueError if the
+    # preset's settings can't be worked out.
+    row = OrderedDict([("Type", "Distribution"), ("name", distribution_name(result.target.name)),
+                       ("inherits", result.target.preset)])
+    settings = row_settings(preset_row)
+    for setting, modifier in result.modifiers.items():
+        if not math.isclose(modifier, 1.0):
+            for attribute in ("avg", "range"):
+                value = preset_row.get("%s_%s" % (setting, attribute))
+                if value is None and getattr(settings[setting], attribute) != 0:
+                    value = format_number(getattr(settings[setting], attribute))
+                value = scaled_cell(value, modifier)
+                if value is not None:
+                    row["%s_%s" % (setting, attribute)] = value
+    return row
+
+
+def write_modifiers(results, file):
+    writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+    writer.writerow(["Ore", "Preset", "Target ore per chunk", "Tuned ore per chunk"] + list(modifier_columns))
+    for result in results:
+        writer.writerow([result.target.name, result.target.preset, "%.6g" % result.target.ore_per_chunk,
+                         "%.6g" % result.ore_per_chunk] +
+                        ["%.4g" % result.modifiers[setting] for setting in modifier_columns.values()])
+
+
+def write_rows(rows, file):
+    header = []
+    for row in rows:
+        header.extend(key for key in row if key not in header)
+    writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow([row.get(key, "") for key in header])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune COG preset modifiers to match vanilla ore amounts.")
+    parser.add_argument("--assistant", default=default_assistant, help="Workbook with the Distribution_Parameters "
+                                                                       "table.")
+    parser.add_argument("--presets", default=default_presets, help="Workbook with the Veins presets.")
+    parser.add_argument("--tune", action="append", choices=simulated_settings, metavar="SETTING",
+                        help="A setting whose modifier may change; can be repeated. Default: %s." %
+                             ", ".join(default_tuned))
+    parser.add_argument("--bounds", default="%g:%g" % default_bounds, metavar="LOW:HIGH",
+                        help="Lowest and highest modifier.")
+    parser.add_argument("--only", action="append", metavar="ORE", help="Only tune this row; can be repeated.")
+    parser.add_argument("--target", type=float, help="Ore per chunk to aim for, instead of the table's.")
+    parser.add_argument("--format", choices=("modifiers", "veins", "xml"), default="modifiers")
+    args = parser.parse_args(argv)
+
+    try:
+        bounds = tuple(float(value) for value in args.bounds.split(":"))
+        if len(bounds) != 2 or not 0 < bounds[0] < bounds[1]:
+            raise ValueError
+    except ValueError:
+        parser.error("--bounds should be LOW:HIGH, with 0 < LOW < HIGH.")
+
+    presets = read_presets(args.presets)
+    targets, skipped = read_targets(args.assistant)
+    for cell, name, reason in skipped:
+        if not args.only or name in args.only:
+            print("%s %s %s: skipped, %s" % (args.assistant, cell, name, reason), file=sys.stderr)
+    results, rows, elements = [], [], []
+    for target in targets:
+        if args.only and target.name not in args.only:
+            continue
+        if args.target is not None:
+            target = target._replace(ore_per_chunk=args.target)
+        preset_row = presets.resolve_name(target.preset)
+        try:
+            if preset_row is None:
+                raise ValueError("%s is not a Veins preset in %s." % (target.preset, args.presets))
+            result = tune(target, preset_row, args.tune or default_tuned, bounds)
+            row = veins_row(result, preset_row)
+            element = Veins(dict(row)) if args.format == "xml" else None
+        except ValueError as e:
+            print("%s: skipped, %s" % (target.name, e), file=sys.stderr)
+            continue
+        if not math.isclose(result.ore_per_chunk, target.ore_per_chunk, rel_tol=0.01):
+            print("%s: %.4g ore per chunk is the closest to %.4g found within the bounds." %
+                  (target.name, result.ore_per_chunk, target.ore_per_chunk), file=sys.stderr)
+        results.append(result)
+        rows.append(row)
+        elements.append(element)
+
+    if args.format == "modifiers":
+        write_modifiers(results, sys.stdout)
+    elif args.format == "veins":
+        write_rows(rows, sys.stdout)
+    else:
+        sys.stdout.write(serialize(elements).decode("utf-8"))
+
+
+class TestNelderMead(unittest.TestCase):
+    def test_minimises_within_bounds(self):
+        def function(points):
+            return ((points - np.array([1.0, -2.0])) ** 2).sum(axis=1)
+
+        best, value, iterations = nelder_mead(function, [0.0, 0.0], [-5, -5], [5, 5])
+        self.assertTrue(np.allclose(best, [1.0, -2.0], atol=1e-4))
+        best, value, iterations = nelder_mead(function, [0.0, 0.0], [-5, -1], [5, 5])
+        self.assertTrue(np.allclose(best, [1.0, -1.0], atol=1e-4))
+
+    def test_steps_that_hit_the_bounds(self):
+        # The minimum is inside the box, but the first expansions run into its far corner; clipped steps would stop
+        # there.
+        def miss(points):
+            return np.log(np.exp(3 * points).sum(axis=1)) - 6.5
+
+        best, value, iterations = nelder_mead(lambda points: miss(points) ** 2 + 1e-4 * (points ** 2).sum(axis=1),
+                                              [0.0, 0.0, 0.0], [-2.3] * 3, [2.3] * 3)
+        self.assertLess(abs(miss(best[np.newaxis])[0]), 0.01)
+        self.assertTrue(((best > -2.3) & (best < 2.3)).all())
+
+    def test_start_on_bound(self):
+        best, value, iterations = nelder_mead(lambda points: ((points - 0.3) ** 2).sum(axis=1), [1.0], [0], [1])
+        self.assertAlmostEqual(best[0], 0.3, places=4)
+
+
+class TestTune(unittest.TestCase):
+    preset = {"name": "PresetTest", "MotherlodeFrequency_avg": ":= 0.5 * oreFreq", "MotherlodeSize_avg": "2",
+              "MotherlodeSize_range": "1", "BranchFrequency_avg": "2", "BranchLength_avg": "30",
+              "BranchLength_range": "10", "SegmentRadius_avg": "1"}
+
+    def target(self, ore_per_chunk, **modifiers):
+        values = OrderedDict((setting, 1.0) for setting in simulated_settings)
+        values.update(modifiers)
+        return TuneTarget("Test - Ore", "PresetTest", ore_per_chunk, values)
+
+    def test_hits_target(self):
+        for ore_per_chunk in (5.0, 50.0, 500.0):
+            result = tune(self.target(ore_per_chunk), self.preset)
+            self.assertAlmostEqual(result.ore_per_chunk / ore_per_chunk, 1.0, delta=0.01)
+            self.assertEqual(result.modifiers["OreDensity"], 1.0)
+
+    def test_only_tuned_modifiers_change(self):
+        result = tune(self.target(50.0, OreDensity=0.5), self.preset, ["MotherlodeFrequency"])
+        self.assertEqual(result.modifiers["OreDensity"], 0.5)
+        self.assertEqual(result.modifiers["BranchLength"], 1.0)
+        # With only the frequency free, the answer is exact: per motherlode, E[U(1, 3) ^ 3] = (3 ^ 4 - 1) / 8 of the
+        # sphere, plus two branches of radius 1 and mean length 30, all at half density.
+        per_motherlode = 0.5 * (4 / 3 * math.pi * (3 ** 4 - 1) / 8 + 2 * math.pi * 30)
+        frequency = row_settings(self.preset)["MotherlodeFrequency"].avg
+        self.assertAlmostEqual(result.modifiers["MotherlodeFrequency"] * frequency * per_motherlode / 50.0, 1.0,
+                               places=3)
+        self.assertAlmostEqual(result.ore_per_chunk, 50.0, delta=0.05)
+
+    def test_bounds(self):
+        result = tune(self.target(1e6), self.preset, bounds=(0.5, 2.0))
+        self.assertTrue(all(0.5 - 1e-9 <= result.modifiers[name] <= 2.0 + 1e-9 for name in default_tuned))
+        self.assertLess(result.ore_per_chunk, 1e6)
+
+    def test_rows(self):
+        result = tune(self.target(50.0), self.preset)
+        row = veins_row(result, self.preset)
+        self.assertEqual((row["Type"], row["name"], row["inherits"]), ("Distribution", "TestOre", "PresetTest"))
+        self.assertTrue(row["MotherlodeFrequency_avg"].startswith(":= "))
+        self.assertIn("oreFreq", row["MotherlodeFrequency_avg"])
+        self.assertNotIn("BranchFrequency_avg", row)
+        # OreDensity is blank in the preset, so its default of 1 is scaled.
+        result = tune(self.target(50.0, OreDensity=1.736), self.preset, ["MotherlodeFrequency"])
+        row = veins_row(result, self.preset)
+        self.assertEqual((row["OreDensity_avg"], "OreDensity_range" in row), ("1.736", False))
+        self.assertEqual(scaled_cell("4", 0.5), "2")
+        self.assertEqual(scaled_cell(":= 2 * oreSize", 2), ":= 4*oreSize")
+        self.assertEqual(scaled_cell(":= 0.025 * oreFreq", 1), ":= 0.025 * oreFreq")
+        self.assertEqual(scaled_cell("3", 1.23456789), "3.705")
+
+    def test_workbooks(self):
+        targets, skipped = read_targets(default_assistant)
+        self.assertEqual(skipped, [])
+        iron = next(target for target in targets if target.name == "Vanilla - Iron")
+        self.assertEqual((iron.preset, iron.ore_per_chunk), ("PresetLayeredVeins", 80.0))
+        self.assertAlmostEqual(iron.modifiers["MotherlodeSize"], (3 * 3 * 2) ** (1 / 3))
+        presets = read_presets(default_presets)
+        result = tune(iron, presets.resolve_name(iron.preset))
+        self.assertAlmostEqual(result.ore_per_chunk / 80.0, 1.0, delta=0.01)
+        xml = serialize([Veins(dict(veins_row(result, presets.resolve_name(iron.preset))))]).decode("utf-8")
+        self.assertIn('<Veins name="VanillaIron" inherits="PresetLayeredVeins">', xml)
+        # Reachable within the bounds, i.e. between modifiers (10, 8, 10) and (10, 10, 10).
+        coal = next(target for target in targets if target.name == "Vanilla - Coal")
+        result = tune(coal, presets.resolve_name(coal.preset))
+        self.assertAlmostEqual(result.ore_per_chunk / 160.0, 1.0, delta=0.01)
+
+    def test_text_modifier(self):
+        workbook = openpyxl.load_workbook(default_assistant)
+        worksheet, table = find_table(workbook, parameters_table)
+        table_data = get_table_data(worksheet, table)
+        location = TableLocation.of_table(worksheet, table, table_data)
+        index = next(i for i, row in enumerate(table_data) if row["Ore"] == "Vanilla - Iron")
+        worksheet[location.cell_reference(index, "Branch Length - Modifier").split("!")[1]] = "double"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "assistant.xlsx")
+            workbook.save(path)
+            targets, skipped = read_targets(path)
+        self.assertEqual(skipped, [(location.row_reference(index), "Vanilla - Iron",
+                                    "Branch Length - Modifier 'double' is not a number.")])
+        self.assertEqual(len(targets), len(read_targets(default_assistant)[0]) - 1)
+
+    def test_blank_and_zero_modifiers(self):
+        modifiers = _modifiers({"Branch Frequency - Modifier": 0, "Branch Length - Modifier": "",
+                                "Veins per chunk - Modifier": 2})
+        self.assertEqual((modifiers["BranchFrequency"], modifiers["BranchLength"], modifiers["MotherlodeFrequency"]),
+                         (0.0, 1.0, 2.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import unittest
+import warnings
+from collections import OrderedDict
+
+import openpyxl
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.table import Table
+
+import instrumentation
+from distributions import Veins, render_rows, serialize, veins_setting_names
+from excel_table import find_table, get_table_data, read_csv_table
+
+# Benchmarks the whole pipeline - from find_table()/get_table_data() through Veins() and serialize() - against
+# synthetic workbooks that follow the Veins_Presets schema of the Sprocket2 spreadsheet.
+#
+# Usage:
+#   python benchmark.py                                  # 100, 10k and 100k rows, XLSX and CSV
+#   python benchmark.py --sizes 100 1000 --save baseline.json
+#   python benchmark.py --baseline baseline.json         # exits with status 1 if any stage regressed
+
+veins_fixed_columns = [
+    "Type", "OFF?", "Description", "name", "filename", "seed", "inherits", "Child of other distribution", "color",
+    "branchType", "OreBlock", "Replaces", "ReplacesOre", "ReplacesRegExp",
+    "PlacesAbove (not implemented in Sprocket2)", "PlacesBelow (not implemented in Sprocket2)",
+    "PlacesBeside (not implemented in Sprocket2)", "Biome", "BiomeType", "BiomeSet (not implemented in Sprocket2)",
+    "Dimension",
+]
+
+# Columns that are never left blank, because Veins() can't render a row without them.
+required_columns = ("Type", "name")
+
+synthetic_presets = ("PresetLayeredVeins", "PresetVerticalVeins", "PresetSmallDeposits", "PresetHugeVeins",
+                     "PresetSparseVeins", "PresetPipeVeins")
+synthetic_blocks = ("minecraft:coal_ore", "minecraft:iron_ore", "minecraft:gold_ore", "minecraft:diamond_ore",
+                    "minecraft:redstone_ore", "minecraft:lapis_ore", "minecraft:emerald_ore", "minecraft:stone",
+                    "minecraft:dirt", "minecraft:gravel", "minecraft:granite", "minecraft:andesite")
+synthetic_biomes = ("Plains", "Forest", "Desert", "Taiga", "Swampland", "Jungle", "Extreme Hills", "Ocean")
+synthetic_ore_dicts = ("oreIron", "oreGold", "oreCopper", "oreTin", "stone")
+
+default_sizes = (100, 10000, 100000)
+default_formats = ("xlsx", "csv")
+
+
+def veins_header(settings=len(veins_setting_names)):
+    # The Veins_Presets header, with the first `settings` Veins settings.
+    header = list(veins_fixed_columns)
+    for setting_name in veins_setting_names[:settings]:
+        header += [setting_name + "_avg", setting_name + "_range", setting_name + "_type"]
+    return header
+
+
+def _weighted_list(rng, choices, length):
+    return " ".join("%s, %.2f;" % (rng.choice(choices), rng.uniform(0.01, 1.0)) for _ in range(length))
+
+
+def _setting_value(rng):
+    # A mix of plain numbers and COG expressions, like the real spreadsheets.
+    if rng.random() < 0.3:
+        return ":= %s * %s" % (round(rng.uniform(0.1, 10), 3), rng.choice(("oreSize", "oreFreq")))
+    return str(round(rng.uniform(0, 64), 3))
+
+
+def synthetic_veins_rows(rows, settings=len(veins_setting_names), weighted_list_length=4, blank_fraction=0.3,
+                         seed=0):
+    # Yields `rows` rows of plausible Veins_Presets data, as lists in veins_header() order.
+    #
+    # rows                 = number of data rows
+    # settings             = number of Veins settings (each is three columns: _avg, _range, _type)
+    # weighted_list_length = number of entries in each OreBlock / Replaces / Biome / ... list
+    # blank_fraction       = chance that any optional cell is left blank
+    rng = random.Random(seed)
+    header = veins_header(settings)
+
+    for i in range(rows):
+        is_preset = rng.random() < 0.05
+        values = {
+            "Type": "Preset" if is_preset else "Distribution",
+            "Description": "Synthetic distribution number %d." % i,
+            "name": "Synthetic_%06d" % i,
+            "filename": "synthetic_%d.xml" % (i % 10),
+            "seed": "%04d" % rng.randrange(10000),
+            "inherits": None if is_preset else rng.choice(synthetic_presets),
+            "color": "%06X" % rng.randrange(1 << 24),
+            "branchType": "Bezier",
+            "OreBlock": _weighted_list(rng, synthetic_blocks, weighted_list_length),
+            "Replaces": _weighted_list(rng, synthetic_blocks, weighted_list_length),
+            "ReplacesOre": _weighted_list(rng, synthetic_ore_dicts, weighted_list_length),
+            "ReplacesRegExp": ".*,1.00;",
+            "Biome": _weighted_list(rng, synthetic_biomes, weighted_list_length),
+        }
+        for setting_name in veins_setting_names[:settings]:
+            values[setting_name + "_avg"] = _setting_value(rng)
+            values[setting_name + "_range"] = _setting_value(rng)
+            values[setting_name + "_type"] = rng.choice(("uniform", "normal"))
+
+        row = []
+        for column in header:
+            value = values.get(column)
+            if column not in required_columns and rng.random() < blank_fraction:
+                value = None
+            row.append(value)
+        yield row
+
+
+def write_xlsx(path, header, rows, table_name="Veins_Presets"):
+    # Writes the rows as an Excel table, the way find_table() expects to find them.
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Veins")
+    worksheet.append(header)
+    row_count = 0
+    for row in rows:
+        worksheet.append(row)
+        row_count += 1
+
+    ref = "A1:%s%d" % (get_column_letter(len(header)), row_count + 1)
+    table = Table(displayName=table_name, ref=ref)
+    table._initialise_columns()  # write-only worksheets can't read the header back, so name the columns ourselves.
+    for column, name in zip(table.tableColumns, header):
+        column.name = name
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "In write-only mode you must add table columns manually")
+        worksheet.add_table(table)
+    workbook.save(path)
+
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(["" if value is None else value for value in row])
+
+
+def run_pipeline(path, file_format, table_name="Veins_Presets"):
+    # Runs one file through the pipeline with instrumentation switched on.
+    # Returns the per-stage report - see instrumentation.report().
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        with instrumentation.stage("total"):
+            if file_format == "xlsx":
+                with instrumentation.stage("load_workbook"):
+                    workbook = openpyxl.load_workbook(path)
+                worksheet, table = find_table(workbook, table_name)
+                table_data = get_table_data(worksheet, table)
+            elif file_format == "csv":
+                table_data = read_csv_table(path)
+            else:
+                raise ValueError("Unknown file format %s." % file_format)
+
+            rendered = render_rows(table_data, Veins)
+            serialize([xml_element for filename, xml_element in rendered])
+        return instrumentation.report()
+    finally:
+        if not was_enabled:
+            instrumentation.disable()
+
+
+def run_benchmarks(sizes=default_sizes, formats=default_formats, settings=len(veins_setting_names),
+                   weighted_list_length=4, blank_fraction=0.3, seed=0, work_dir=None, log=None):
+    # Generates one synthetic file per size and format, and runs each through the pipeline.
+    # Returns a JSON-ready dictionary; results["runs"]["xlsx/10000"] holds the per-stage report for that run.
+    results = OrderedDict()
+    results["parameters"] = OrderedDict([
+        ("settings", settings),
+        ("weighted_list_length", weighted_list_length),
+        ("blank_fraction", blank_fraction),
+        ("seed", seed),
+    ])
+    results["environment"] = OrderedDict([
+        ("python", platform.python_version()),
+        ("platform", platform.platform()),
+        ("openpyxl", openpyxl.__version__),
+        ("date", time.strftime("%Y-%m-%d %H:%M:%S")),
+    ])
+    results["runs"] = OrderedDict()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = work_dir or temp_dir
+        header = veins_header(settings)
+        for size in sizes:
+            for file_format in formats:
+                path = os.path.join(work_dir, "synthetic_%d.%s" % (size, file_format))
+                rows = synthetic_veins_rows(size, settings, weighted_list_length, blank_fraction, seed)
+                if file_format == "xlsx":
+                    write_xlsx(path, header, rows)
+                else:
+                    write_csv(path, header, rows)
+
+                run_name = "%s/%d" % (file_format, size)
+                results["runs"][run_name] = run_pipeline(path, file_format)
+                if log is not None:
+                    log("\n%s rows=%d\n%s" % (file_format, size, instrumentation.report_table()))
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, min_seconds=0.005):
+    # Returns a list of regressions: stages that got slower than the baseline by more than `tolerance`
+    # (0.25 = 25%), ignoring differences smaller than min_seconds, which are mostly timer noise.
+    regressions = []
+    for run_name, stages in results["runs"].items():
+        baseline_stages = baseline.get("runs", {}).get(run_name)
+        if baseline_stages is None:
+            continue
+        for stage_name, entry in stages.items():
+            if stage_name not in baseline_stages:
+                continue
+            old = baseline_stages[stage_name]["seconds"]
+            new = entry["seconds"]
+            if new > old * (1 + tolerance) and new - old > min_seconds:
+                regressions.append("%s %s: %.3f s -> %.3f s (%+.0f%%)"
+                                   % (run_name, stage_name, old, new, 100 * (new - old) / old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the generator against synthetic Veins workbooks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(default_sizes), help="Numbers of rows.")
+    parser.add_argument("--formats", nargs="+", choices=default_formats, default=list(default_formats))
+    parser.add_argument("--settings", type=int, default=len(veins_setting_names),
+                        help="Number of Veins settings to fill in (3 columns each).")
+    parser.add_argument("--weighted-list-length", type=int, default=4)
+    parser.add_argument("--blank-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", metavar="DIR", help="Keep the synthetic workbooks in this directory.")
+    parser.add_argument("--save", metavar="PATH", help="Save the results as a JSON baseline.")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare the results to a saved baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown, i.e. 0.25 for 25%%.")
+    args = parser.parse_args(argv)
+
+    if args.keep:
+        os.makedirs(args.keep, exist_ok=True)
+
+    results = run_benchmarks(args.sizes, args.formats, args.settings, args.weighted_list_length,
+                             args.blank_fraction, args.seed, work_dir=args.keep, log=print)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION: " + regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against %s." % args.baseline)
+
+
+class TestSyntheticWorkbook(unittest.TestCase):
+    def test_rows_match_header(self):
+        header = veins_header(settings=4)
+        self.assertEqual(len(header), len(veins_fixed_columns) + 12)
+        rows = list(synthetic_veins_rows(50, settings=4))
+        self.assertEqual(len(rows), 50)
+        self.assertTrue(all(len(row) == len(header) for row in rows))
+
+    def test_blank_fraction(self):
+        header = veins_header()
+        optional = [i for i, column in enumerate(header) if column not in required_columns]
+
+        for row in synthetic_veins_rows(20, blank_fraction=1.0):
+            self.assertTrue(all(row[i] is None for i in optional))
+            self.assertIsNotNone(row[header.index("name")])
+
+    def test_weighted_list_length(self):
+        header = veins_header()
+        row = next(synthetic_veins_rows(1, weighted_list_length=7, blank_fraction=0))
+        self.assertEqual(row[header.index("OreBlock")].count(";"), 7)
+
+    def test_pipeline_xlsx_and_csv(self):
+        results = run_benchmarks(sizes=(20,), settings=4)
+        for run_name in ("xlsx/20", "csv/20"):
+            run = results["runs"][run_name]
+            self.assertEqual(run["Veins"]["rows"], 20)
+            self.assertIn("serialize", run)
+        self.assertIn("find_table", results["runs"]["xlsx/20"])
+        self.assertIn("read_csv_table", results["runs"]["csv/20"])
+
+
+class TestCompareToBaseline(unittest.TestCase):
+    def test_regression_detected(self):
+        baseline = {"runs": {"csv/100": {"Veins": {"seconds": 1.0}, "serialize": {"seconds": 0.001}}}}
+        results = {"runs": {"csv/100": {"Veins": {"seconds": 2.0}, "serialize": {"seconds": 0.002}}}}
+
+        regressions = compare_to_baseline(results, baseline)
+        self.assertEqual(len(regressions), 1)  # serialize doubled too, but only by a millisecond.
+        self.assertTrue(regressions[0].startswith("csv/100 Veins"))
+
+    def test_no_regression(self):
+        baseline = {"runs": {"csv/100": {"Veins": {"seconds": 1.0}}}}
+        results = {"runs": {"csv/100": {"Veins": {"seconds": 1.1}}, "csv/200": {"Veins": {"seconds": 9.0}}}}
+        self.assertEqual(compare_to_baseline(results, baseline), [])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+import re
+import unittest
+from collections import defaultdict, namedtuple
+from typing import Iterable, Tuple
+
+from catalog_store import PackedCatalog, biome_types_path, biomes_path
+from fuzzy_index import TrigramIndex
+from weighted_list import weighted_list_references, weighted_pair_list_parser
+
+# kind is "unknown type", "bad regex" or "no biomes" (a Biome pattern that matches no biome in the catalog).
+BiomeProblem = namedtuple("BiomeProblem", "cell name kind suggestions")
+
+# How many of the catalog's biomes one distribution row can generate in. biomes is a sorted tuple of biome IDs.
+BiomeTargets = namedtuple("BiomeTargets", "row name count total biomes")
+
+
+class BiomeCatalog:
+    # An index over biomes and their BiomeDictionary types, such as the packed catalog in linting_data/biomes.tsv
+    # (the vanilla 1.12 biomes, tagged the way Forge tags them).
+    #
+    # catalog = BiomeCatalog.default()
+    # catalog.tags("minecraft:taiga")          -> frozenset({"COLD", "CONIFEROUS", "FOREST"})
+    # catalog.biomes_with_tag("swamp")         -> ("minecraft:mutated_swampland", "minecraft:swampland")
+    # catalog.match_biome(".*Taiga")           -> ("minecraft:redwood_taiga", "minecraft:taiga", ...)
+    # catalog.targets({"BiomeType": "Swamp, 1.0;"}) -> frozenset({"minecraft:swampland", ...})
+    #
+    # Both directions (biome -> types and type -> biomes) are built once, when the catalog is first used, so
+    # expanding a BiomeType list is a dictionary lookup per type rather than a scan over the biomes.
+
+    _default = None
+
+    def __init__(self, biomes: Iterable[Tuple[str, str, Iterable[str]]] = None, types: Iterable[str] = None,
+                 packed: PackedCatalog = None, packed_types: PackedCatalog = None):
+        # Pass either biomes, as (biome_id, display_name, types), or a PackedCatalog.
+        # types are the known BiomeDictionary types; by default, just the types that some biome has.
+        self._packed = packed
+        self._packed_types = packed_types
+        self._biomes = [(biome_id, name, tuple(tags)) for biome_id, name, tags in biomes] if biomes is not None \
+            else None
+        self._types = frozenset(tag.upper() for tag in types) if types is not None else None
+        self._display_names = None
+        self._tags = None
+        self._by_tag = None
+        self._trigram_index = None
+        self._regex_cache = {}
+
+    @classmethod
+    def default(cls):
+        # The catalog in linting_data/biomes.tsv. Nothing is read until it is first used.
+        if cls._default is None:
+            cls._default = cls(packed=PackedCatalog(biomes_path), packed_types=PackedCatalog(biome_types_path))
+        return cls._default
+
+    def _build_indexes(self):
+        if self._tags is not None:
+            return
+        if self._biomes is None:
+            self._biomes = []
+            for biome_id, value in self._packed.items():
+                name, separator, tags = value.partition("\t")
+                self._biomes.append((biome_id, name, tuple(tag for tag in tags.split(",") if tag)))
+
+        self._display_names = {}
+        self._tags = {}
+        by_tag = defaultdict(list)
+        for biome_id, name, tags in self._biomes:
+            self._display_names[biome_id] = name
+            self._tags[biome_id] = frozenset(tag.upper() for tag in tags)
+            for tag in self._tags[biome_id]:
+                by_tag[tag].append(biome_id)
+        self._by_tag = {tag: tuple(sorted(ids)) for tag, ids in by_tag.items()}
+
+        if self._types is None:
+            self._types = frozenset(self._packed_types.keys()) if self._packed_types is not None else frozenset()
+        self._types |= frozenset(self._by_tag)
+
+    @property
+    def ids(self) -> Tuple[str]:
+        self._build_indexes()
+        return tuple(sorted(self._tags))
+
+    @property
+    def types(self) -> frozenset:
+        self._build_indexes()
+        return self._types
+
+    def __contains__(self, biome_id: str) -> bool:
+        self._build_indexes()
+        return biome_id in self._tags
+
+    def __len__(self):
+        self._build_indexes()
+        return len(self._tags)
+
+    def display_name(self, biome_id: str) -> str:
+        self._build_indexes()
+        return self._display_names.get(biome_id)
+
+    def tags(self, biome_id: str) -> frozenset:
+        self._build_indexes()
+        return self._tags.get(biome_id, frozenset())
+
+    def biomes_with_tag(self, tag: str) -> Tuple[str]:
+        # Forge looks types up by their upper case name, so "Swamp" and "SWAMP" are the same type.
+        self._build_indexes()
+        return self._by_tag.get(tag.upper(), ())
+
+    def is_type(self, tag: str) -> bool:
+        return tag.upper() in self.types
+
+    def suggest_type(self, tag: str, k: int = 3) -> Tuple[str]:
+        if self._trigram_index is None:
+            self._trigram_index = TrigramIndex(sorted(self.types))
+        return self._trigram_index.suggest(tag.upper(), k)
+
+    def match_biome(self, pattern: str) -> Tuple[str]:
+        # The IDs of the biomes whose ID or display name the regular expression pattern matches (in full).
+        # Raises re.error for patterns that don't compile. Results are memoized.
+        result = self._regex_cache.get(pattern)
+        if result is not None:
+            return result
+        self._build_indexes()
+        fullmatch = re.compile(pattern).fullmatch
+        result = tuple(biome_id for biome_id, name, tags in sorted(self._biomes)
+                       if fullmatch(biome_id) or fullmatch(name))
+        self._regex_cache[pattern] = result
+        return result
+
+    def expand_types(self, tags: Iterable[str]) -> frozenset:
+        # Every biome that has at least one of the given types.
+        self._build_indexes()
+        biomes = set()
+        for tag in tags:
+            biomes.update(self._by_tag.get(tag.upper(), ()))
+        return frozenset(biomes)
+
+    def targets(self, row: dict) -> frozenset:
+        # The biomes a distribution row can generate in, from its Biome and BiomeType columns.
+        #
+        # A biome is targeted if any Biome pattern or BiomeType with a positive weight selects it, and no entry with
+        # a weight of zero or less does. A row with neither column filled in targets every biome.
+        # Raises ValueError if either column isn't a valid weighted list. Patterns that don't compile match nothing.
+        self._build_indexes()
+        included, excluded = set(), set()
+        specified = False
+
+        value = row.get("Biome")
+        if isinstance(value, str):
+            for pattern, weight in weighted_pair_list_parser(value):
+                specified = True
+                try:
+                    matches = self.match_biome(pattern)
+                except re.error:
+                    continue
+                (included if float(weight) > 0 else excluded).update(matches)
+
+        value = row.get("BiomeType")
+        if isinstance(value, str):
+            for tag, weight in weighted_pair_list_parser(value):
+                specified = True
+                (included if float(weight) > 0 else excluded).update(self.biomes_with_tag(tag))
+
+        if not specified:
+            return frozenset(self._tags)
+        return frozenset(included - excluded)
+
+    def coverage(self, tables) -> list:
+        # Estimates how many biomes each distribution in a workbook targets.
+        #
+        # tables is an iterable of (table_name, table_data, location), as produced by
+        # excel_table.iter_workbook_tables().
+        # Returns a list of BiomeTargets(row, name, count, total, biomes). Rows whose Biome or BiomeType cells
+        # aren't valid weighted lists are skipped; rendering reports those.
+        total = len(self)
+        results = []
+        for table_name, table_data, location in tables:
+            for row_index, row in enumerate(table_data):
+                if "Biome" not in row and "BiomeType" not in row:
+                    continue
+                try:
+                    biomes = self.targets(row)
+                except ValueError:
+                    continue
+                results.append(BiomeTargets(location.row_reference(row_index), row.get("name"), len(biomes), total,
+                                            tuple(sorted(biomes))))
+        return results
+
+    def problems(self, tables) -> list:
+        # Checks every Biome and BiomeType list in a workbook.
+        # Returns a list of BiomeProblem(cell, name, kind, suggestions).
+        problems = []
+        for tag, cells in weighted_list_references(tables, ("BiomeType",)).items():
+            if not self.is_type(tag):
+                suggestions = self.suggest_type(tag)
+                problems.extend(BiomeProblem(cell, tag, "unknown type", suggestions) for cell in cells)
+
+        for pattern, cells in weighted_list_references(tables, ("Biome",)).items():
+            try:
+                matches = self.match_biome(pattern)
+            except re.error as e:
+                problems.extend(BiomeProblem(cell, pattern, "bad regex", (str(e),)) for cell in cells)
+                continue
+            if not matches:
+                problems.extend(BiomeProblem(cell, pattern, "no biomes", ()) for cell in cells)
+        return problems
+
+
+class TestBiomeCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = BiomeCatalog([
+            ("minecraft:plains", "Plains", ["PLAINS"]),
+            ("minecraft:swampland", "Swampland", ["WET", "SWAMP"]),
+            ("minecraft:taiga", "Taiga", ["COLD", "CONIFEROUS", "FOREST"]),
+            ("minecraft:forest", "Forest", ["FOREST"]),
+            ("minecraft:hell", "Hell", ["HOT", "DRY", "NETHER"]),
+        ], types=["MAGICAL"])
+
+    def test_indexes(self):
+        self.assertEqual(self.catalog.tags("minecraft:taiga"), {"COLD", "CONIFEROUS", "FOREST"})
+        self.assertEqual(self.catalog.biomes_with_tag("Forest"), ("minecraft:forest", "minecraft:taiga"))
+        self.assertEqual(self.catalog.biomes_with_tag("MAGICAL"), ())
+        self.assertEqual(self.catalog.display_name("minecraft:hell"), "Hell")
+
+    def test_types(self):
+        self.assertTrue(self.catalog.is_type("swamp"))
+        self.assertTrue(self.catalog.is_type("MAGICAL"))  # Known, although no biome has it.
+        self.assertFalse(self.catalog.is_type("FROZEN"))
+        self.assertEqual(self.catalog.suggest_type("SWAMPY")[0], "SWAMP")
+
+    def test_match_biome(self):
+        self.assertEqual(self.catalog.match_biome(".*"), self.catalog.ids)
+        self.assertEqual(self.catalog.match_biome("Taiga"), ("minecraft:taiga",))
+        self.assertEqual(self.catalog.match_biome("minecraft:.*land"), ("minecraft:swampland",))
+        with self.assertRaises(re.error):
+            self.catalog.match_biome("(")
+
+    def test_targets(self):
+        self.assertEqual(self.catalog.targets({}), set(self.catalog.ids))
+        self.assertEqual(self.catalog.targets({"BiomeType": "Swamp, 1.0; Cold, 1.0;"}),
+                         {"minecraft:swampland", "minecraft:taiga"})
+        self.assertEqual(self.catalog.targets({"Biome": ".*, 1.0; Hell, 0;"}),
+                         set(self.catalog.ids) - {"minecraft:hell"})
+        self.assertEqual(self.catalog.targets({"Biome": "Forest, 1.0;", "BiomeType": "Plains, 1.0;"}),
+                         {"minecraft:forest", "minecraft:plains"})
+        with self.assertRaises(ValueError):
+            self.catalog.targets({"BiomeType": "Swamp"})
+
+    def test_coverage_and_problems(self):
+        from excel_table import TableLocation
+        table_data = [
+            {"name": "a", "Biome": ".*, 1.0;", "BiomeType": None},
+            {"name": "b", "Biome": None, "BiomeType": "Swamp, 1.0; Frozen, 1.0;"},
+            {"name": "c", "Biome": "Tundra, 1.0; (, 1.0;", "BiomeType": None},
+        ]
+        location = TableLocation("Veins", 1, 1, ["name", "Biome", "BiomeType"])
+        tables = [("Veins_Presets", table_data, location)]
+
+        coverage = self.catalog.coverage(tables)
+        self.assertEqual([(t.row, t.name, t.count, t.total) for t in coverage],
+                         [("Veins!A2:C2", "a", 5, 5), ("Veins!A3:C3", "b", 1, 5), ("Veins!A4:C4", "c", 0, 5)])
+
+        problems = self.catalog.problems(tables)
+        self.assertEqual([(p.cell, p.name, p.kind) for p in problems],
+                         [("Veins!C3", "Frozen", "unknown type"), ("Veins!B4", "Tundra", "no biomes"),
+                          ("Veins!B4", "(", "bad regex")])
+
+    def test_default_catalog(self):
+        catalog = BiomeCatalog(packed=PackedCatalog(biomes_path), packed_types=PackedCatalog(biome_types_path))
+        self.assertIn("minecraft:plains", catalog)
+        self.assertIn("minecraft:swampland", catalog.biomes_with_tag("SWAMP"))
+        self.assertEqual(catalog.tags("minecraft:hell"), {"HOT", "DRY", "NETHER"})
+        self.assertTrue(catalog.is_type("MAGICAL"))
+        self.assertEqual(len(catalog.targets({"Biome": ".*, 1.00;"})), len(catalog))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,319 @@
+import re
+import unittest
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+from typing import Iterable, Tuple
+
+from catalog_store import PackedCatalog, blocks_path
+from fuzzy_index import TrigramIndex
+from weighted_list import weighted_list_references, weighted_pair_list_parser
+
+# Columns whose weighted lists name blocks.
+block_columns = ("OreBlock", "Replaces")
+
+UnknownBlock = namedtuple("UnknownBlock", "cell block_id suggestions")
+
+# error is None if the pattern compiled. samples holds the first few matching IDs.
+# replaces_overlap holds the matching IDs that the same row also lists in its Replaces column.
+RegexUsage = namedtuple("RegexUsage", "cell pattern error match_count samples replaces_overlap")
+
+
+def normalize_block_id(block_id: str) -> str:
+    # COG accepts block names with or without the "minecraft:" prefix, and with an optional metadata suffix:
+    # "stone" -> "minecraft:stone"
+    # "ic2:resource:1" -> "ic2:resource"
+    block_id = block_id.strip()
+    parts = block_id.split(":")
+    if len(parts) == 1:
+        return "minecraft:" + block_id
+    return parts[0] + ":" + parts[1]
+
+
+_regex_special = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(pattern: str) -> str:
+    # The literal text every match of pattern must start with.
+    # "quark:.*" -> "quark:", "minecraft:stone_?ore" -> "minecraft:stone", ".*_ore" -> ""
+    if "|" in pattern:
+        return ""  # Each alternative could start differently.
+    prefix = []
+    for char in pattern:
+        if char in _regex_special:
+            if char in "*?{" and prefix:
+                prefix.pop()  # The quantifier makes the previous character optional.
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+class BlockCatalog:
+    # An index over (block_id, display_name) pairs, such as the packed catalog in linting_data/blocks.tsv.
+    #
+    # catalog = BlockCatalog.default()
+    # "minecraft:iron_ore" in catalog        -> True
+    # catalog.display_name("minecraft:iron_ore") -> "Iron Ore"
+    # catalog.modid_blocks("quark")          -> ("quark:basalt", ...)
+    # catalog.find_by_display_name("iron ore") -> ("minecraft:iron_ore",)
+    # catalog.suggest("minecraft:iron_oer")  -> ("minecraft:iron_ore", ...)
+    # catalog.match_regex("minecraft:.*_ore") -> ("minecraft:coal_ore", ...)
+
+    _default = None
+
+    def __init__(self, entries: Iterable[Tuple[str, str]] = None, packed: PackedCatalog = None):
+        # Pass either entries, or a PackedCatalog.
+        #
+        # Every index is built on first use. Over a PackedCatalog, single lookups (in, display_name, modid_blocks)
+        # are answered by binary search over the file, so a catalog that is only asked a few questions never gets
+        # parsed at all.
+        self._packed = packed
+        self._display_names = dict(entries) if entries is not None else None
+        self._ids = None
+        self._sorted_ids = None
+        self._by_modid = None
+        self._by_display_name = None
+        self._trigram_index = None
+        self._regex_cache = {}
+
+    @classmethod
+    def default(cls):
+        # The catalog in linting_data/blocks.tsv. Nothing is read until it is first used.
+        if cls._default is None:
+            cls._default = cls(packed=PackedCatalog(blocks_path))
+        return cls._default
+
+    def _entries(self):
+        if self._packed is not None:
+            return self._packed.items()
+        return self._display_names.items()
+
+    @property
+    def ids(self) -> frozenset:
+        if self._ids is None:
+            self._ids = frozenset(self._sorted())
+        return self._ids
+
+    def _sorted(self) -> list:
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(block_id for block_id, display_name in self._entries())
+        return self._sorted_ids
+
+    def _build_indexes(self):
+        if self._by_modid is not None:
+            return
+        by_modid = defaultdict(list)
+        by_display_name = defaultdict(list)
+        for block_id, display_name in self._entries():
+            by_modid[block_id.split(":", 1)[0]].append(block_id)
+            by_display_name[display_name.casefold()].append(block_id)
+        self._by_modid = {modid: tuple(sorted(ids)) for modid, ids in by_modid.items()}
+        self._by_display_name = {name: tuple(sorted(ids)) for name, ids in by_display_name.items()}
+
+    def __contains__(self, block_id: str) -> bool:
+        block_id = normalize_block_id(block_id)
+        if self._ids is None and self._packed is not None:
+            return block_id in self._packed
+        return block_id in self.ids
+
+    def __len__(self):
+        return len(self._sorted())
+
+    def display_name(self, block_id: str) -> str:
+        block_id = normalize_block_id(block_id)
+        if self._packed is not None:
+            return self._packed.get(block_id)
+        return self._display_names.get(block_id)
+
+    def modids(self) -> Tuple[str]:
+        self._build_indexes()
+        return tuple(sorted(self._by_modid))
+
+    def modid_blocks(self, modid: str) -> Tuple[str]:
+        if self._by_modid is None and self._packed is not None:
+            return self._packed.with_prefix(modid + ":")
+        self._build_indexes()
+        return self._by_modid.get(modid, ())
+
+    def find_by_display_name(self, display_name: str) -> Tuple[str]:
+        self._build_indexes()
+        return self._by_display_name.get(display_name.strip().casefold(), ())
+
+    def suggest(self, block_id: str, k: int = 3) -> Tuple[str]:
+        # The k known block IDs most similar to block_id, best first.
+        if self._trigram_index is None:
+            self._trigram_index = TrigramIndex(self._sorted())
+        return self._trigram_index.suggest(normalize_block_id(block_id), k)
+
+    def match_regex(self, pattern: str) -> Tuple[str]:
+        # All known block IDs that the whole pattern matches, as COG would match a ReplacesRegExp.
+        # Raises re.error if the pattern isn't a valid regular expression. Results are memoized per pattern.
+        #
+        # Most patterns start with some literal text, i.e. "quark:" in "quark:.*". Only IDs that start with that text
+        # can match, and since the IDs are sorted, bisect finds them without looking at the rest.
+        result = self._regex_cache.get(pattern)
+        if result is not None:
+            return result
+
+        compiled = re.compile(pattern)
+        prefix = _literal_prefix(pattern)
+        sorted_ids = self._sorted()
+        start = bisect_left(sorted_ids, prefix)
+        end = bisect_left(sorted_ids, prefix + "\U0010ffff", start) if prefix else len(sorted_ids)
+        fullmatch = compiled.fullmatch
+        result = tuple(block_id for block_id in sorted_ids[start:end] if fullmatch(block_id))
+
+        self._regex_cache[pattern] = result
+        return result
+
+    def regex_usage(self, tables, samples: int = 5) -> list:
+        # Evaluates every ReplacesRegExp pattern in a workbook against the catalog.
+        # Returns a list of RegexUsage, one per pattern per cell.
+        usages = []
+        for table_name, table_data, location in tables:
+            for row_index, row in enumerate(table_data):
+                value = row.get("ReplacesRegExp")
+                if not isinstance(value, str):
+                    continue
+                try:
+                    patterns = [pattern for pattern, weight in weighted_pair_list_parser(value)]
+                    replaces = row.get("Replaces")
+                    replaces = weighted_pair_list_parser(replaces) if isinstance(replaces, str) else []
+                except ValueError:
+                    continue
+                replaced_ids = {normalize_block_id(block_id) for block_id, weight in replaces}
+
+                cell = location.cell_reference(row_index, "ReplacesRegExp")
+                for pattern in patterns:
+                    try:
+                        matches = self.match_regex(pattern)
+                    except re.error as e:
+                        usages.append(RegexUsage(cell, pattern, str(e), None, (), ()))
+                        continue
+                    overlap = tuple(block_id for block_id in matches if block_id in replaced_ids)
+                    usages.append(RegexUsage(cell, pattern, None, len(matches), matches[:samples], overlap))
+        return usages
+
+    def unknown_blocks(self, tables) -> list:
+        # Checks every block reference in a workbook.
+        #
+        # tables is an iterable of (table_name, table_data, location), as produced by
+        # excel_table.iter_workbook_tables().
+        # Returns a list of UnknownBlock(cell, block_id, suggestions), in table order.
+        #
+        # Each distinct block ID is normalized and looked up once, however many cells it appears in.
+        unknown = []
+        for block_id, cells in weighted_list_references(tables, block_columns).items():
+            if normalize_block_id(block_id) not in self.ids:
+                suggestions = self.suggest(block_id)
+                unknown.extend(UnknownBlock(cell, block_id, suggestions) for cell in cells)
+        return unknown
+
+
+class TestNormalizeBlockId(unittest.TestCase):
+    def test_variations(self):
+        self.assertEqual(normalize_block_id("stone"), "minecraft:stone")
+        self.assertEqual(normalize_block_id(" minecraft:stone "), "minecraft:stone")
+        self.assertEqual(normalize_block_id("ic2:resource:1"), "ic2:resource")
+
+
+class TestLiteralPrefix(unittest.TestCase):
+    def test_prefixes(self):
+        self.assertEqual(_literal_prefix("quark:.*"), "quark:")
+        self.assertEqual(_literal_prefix("minecraft:stone_?ore"), "minecraft:stone")
+        self.assertEqual(_literal_prefix("minecraft:(iron|gold)_ore"), "")
+        self.assertEqual(_literal_prefix("a+b"), "a")
+        self.assertEqual(_literal_prefix(".*"), "")
+        self.assertEqual(_literal_prefix("minecraft:stone"), "minecraft:stone")
+
+
+class TestBlockCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = BlockCatalog([
+            ("minecraft:iron_ore", "Iron Ore"),
+            ("minecraft:stone", "Stone"),
+            ("quark:basalt", "Basalt"),
+            ("quark:marble", "Marble"),
+            ("chisel:basalt", "Basalt"),
+        ])
+
+    def test_membership(self):
+        self.assertIn("minecraft:iron_ore", self.catalog)
+        self.assertIn("stone", self.catalog)
+        self.assertNotIn("minecraft:iron_oer", self.catalog)
+        self.assertEqual(len(self.catalog), 5)
+
+    def test_modids(self):
+        self.assertEqual(self.catalog.modids(), ("chisel", "minecraft", "quark"))
+        self.assertEqual(self.catalog.modid_blocks("quark"), ("quark:basalt", "quark:marble"))
+        self.assertEqual(self.catalog.modid_blocks("nuclearcraft"), ())
+
+    def test_display_names(self):
+        self.assertEqual(self.catalog.display_name("stone"), "Stone")
+        self.assertEqual(self.catalog.find_by_display_name("basalt"), ("chisel:basalt", "quark:basalt"))
+
+    def test_unknown_blocks(self):
+        from excel_table import TableLocation
+        header = ["name", "OreBlock", "Replaces"]
+        table_data = [
+            {"name": "a", "OreBlock": "minecraft:iron_oer, 1.0;", "Replaces": "stone, 1.0;"},
+            {"name": "b", "OreBlock": "minecraft:iron_ore, 1.0; quark:marbel, 1.0;", "Replaces": None},
+            {"name": "c", "OreBlock": "not a weighted list", "Replaces": "minecraft:iron_oer, 1.0;"},
+        ]
+        location = TableLocation("Veins", 1, 1, header)
+
+        unknown = self.catalog.unknown_blocks([("Veins_Presets", table_data, location)])
+        self.assertEqual([(u.cell, u.block_id) for u in unknown], [
+            ("Veins!B2", "minecraft:iron_oer"),
+            ("Veins!C4", "minecraft:iron_oer"),
+            ("Veins!B3", "quark:marbel"),
+        ])
+        self.assertEqual(unknown[0].suggestions[0], "minecraft:iron_ore")
+        self.assertEqual(unknown[2].suggestions[0], "quark:marble")
+
+    def test_suggest(self):
+        self.assertEqual(self.catalog.suggest("minecraft:stnoe", k=1), ("minecraft:stone",))
+        self.assertEqual(self.catalog.suggest("iron_ore", k=1), ("minecraft:iron_ore",))
+
+    def test_match_regex(self):
+        self.assertEqual(self.catalog.match_regex(".*"), tuple(sorted(self.catalog.ids)))
+        self.assertEqual(self.catalog.match_regex("quark:.*"), ("quark:basalt", "quark:marble"))
+        self.assertEqual(self.catalog.match_regex(".*:basalt|minecraft:stone"),
+                         ("chisel:basalt", "minecraft:stone", "quark:basalt"))
+        self.assertEqual(self.catalog.match_regex("stone"), ())  # must match the whole ID.
+        self.assertIs(self.catalog.match_regex("quark:.*"), self.catalog.match_regex("quark:.*"))
+
+    def test_match_regex_with_quantified_prefix(self):
+        self.assertEqual(self.catalog.match_regex("quark:[^_]*"), ("quark:basalt", "quark:marble"))
+        self.assertEqual(self.catalog.match_regex("minecraft:iron_ores?"), ("minecraft:iron_ore",))
+        self.assertEqual(self.catalog.match_regex("minecraft:stonex*"), ("minecraft:stone",))
+
+    def test_regex_usage(self):
+        from excel_table import TableLocation
+        header = ["name", "Replaces", "ReplacesRegExp"]
+        table_data = [
+            {"name": "a", "Replaces": "quark:marble, 1.0;", "ReplacesRegExp": "quark:.*, 1.0;"},
+            {"name": "b", "Replaces": None, "ReplacesRegExp": "quark:(, 1.0;"},
+        ]
+        location = TableLocation("Veins", 1, 1, header)
+
+        first, second = self.catalog.regex_usage([("Veins_Presets", table_data, location)])
+        self.assertEqual(first, RegexUsage("Veins!C2", "quark:.*", None, 2, ("quark:basalt", "quark:marble"),
+                                           ("quark:marble",)))
+        self.assertEqual(second.cell, "Veins!C3")
+        self.assertIsNotNone(second.error)
+
+    def test_default_catalog(self):
+        catalog = BlockCatalog(packed=PackedCatalog(blocks_path))
+        self.assertIn("minecraft:iron_ore", catalog)
+        self.assertNotIn("minecraft:iron_oer", catalog)
+        self.assertEqual(catalog.display_name("iron_ore"), "Iron Ore")
+        self.assertGreater(len(catalog.modid_blocks("nuclearcraft")), 100)
+        self.assertIsNone(catalog._ids)  # None of the above needed the whole catalog in memory.
+
+        self.assertEqual(catalog.modid_blocks("quark"), catalog._packed.with_prefix("quark:"))
+        self.assertIn("quark", catalog.modids())
+        self.assertEqual(catalog.suggest("minecraft:iron_oer")[0], "minecraft:iron_ore")
+
+
+if __name__ == '__main__':
+    unittest.main()
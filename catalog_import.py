@@ -0,0 +1,350 @@
+import argparse
+import csv
+import os
+import re
+import tempfile
+import unittest
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, Set
+
+from catalog_store import PackedCatalog, blocks_path, oredict_path, write_packed
+
+# Imports block and ore dictionary registry dumps into the packed linting catalogs.
+#
+# Usage:
+#   python catalog_import.py dumps/              # merge every dump in dumps/ into linting_data/
+#   python catalog_import.py dumps/ --dry-run    # just show what would change
+#
+# Dumps are recognised by file name: files with "oredict" (or "ore_dict", "ore-dict") in their name are ore
+# dictionary dumps, other files with "block" in their name are block dumps. Each may be:
+#
+#  - CSV with a header row, i.e. "Mod name,Registry name,Display name,...". The ID is taken from the first column
+#    called something like "Registry name" / "ID" / "Name" (blocks) or "Ore name" / "Key" / "Name" (ore dictionary),
+#    and block display names from a "Display name" / "Localized name" column if there is one.
+#  - Plain text with one entry per line, optionally followed by a tab and a display name. Entries may be wrapped in
+#    angle brackets as CraftTweaker prints them: "<minecraft:stone>", "<ore:oreIron>".
+#
+# Blocks are merged per modid. A block dump is taken to be the complete list of blocks for every modid that appears
+# in it: blocks of those mods that the dump doesn't list are removed. Mods the dump doesn't mention are left alone,
+# so dumps from different modpacks can be imported one after another.
+#
+# Ore dictionary names aren't namespaced, so new names are added but nothing is removed unless --prune-oredict is
+# given, in which case the ore dictionary catalog becomes exactly the names in the dumps.
+
+_block_id_columns = ("registryname", "registry", "resourcelocation", "blockname", "id", "name")
+_display_name_columns = ("displayname", "localizedname", "localisedname", "display")
+_oredict_columns = ("orename", "oredictname", "oredictkey", "oredict", "key", "name")
+
+
+def _normalize_header(name: str) -> str:
+    return re.sub(r"[^a-z]", "", name.lower())
+
+
+def _strip_brackets(entry: str) -> str:
+    entry = entry.strip()
+    if entry.startswith("<") and entry.endswith(">"):
+        entry = entry[1:-1]
+    return entry
+
+
+def _block_id(entry: str) -> str:
+    # "<minecraft:stone:1>" -> "minecraft:stone". Returns None if entry isn't a modid:name ID.
+    parts = _strip_brackets(entry).split(":")
+    if len(parts) < 2 or not parts[0] or not parts[1]:
+        return None
+    return parts[0] + ":" + parts[1]
+
+
+def _oredict_name(entry: str) -> str:
+    entry = _strip_brackets(entry)
+    if entry.startswith("ore:"):
+        entry = entry[len("ore:"):]
+    return entry or None
+
+
+def _find_column(header, candidates):
+    normalized = [_normalize_header(name) for name in header]
+    for candidate in candidates:
+        if candidate in normalized:
+            return normalized.index(candidate)
+    return None
+
+
+def read_block_dump(path: str) -> Dict[str, str]:
+    # Returns {block_id: display_name}. Display names are "" when the dump doesn't have them.
+    blocks = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.reader(f)
+            header = next(reader, [])
+            id_column = _find_column(header, _block_id_columns)
+            if id_column is None:
+                raise ValueError("%s: no registry name column in header %r." % (path, header))
+            name_column = _find_column(header, _display_name_columns)
+            rows = ((row[id_column] if id_column < len(row) else "",
+                     row[name_column] if name_column is not None and name_column < len(row) else "")
+                    for row in reader)
+        else:
+            rows = (line.rstrip("\r\n").partition("\t")[::2] for line in f)
+
+        for entry, display_name in rows:
+            block_id = _block_id(entry)
+            if block_id is not None:
+                # A dump lists every metadata variant; keep the first display name we see.
+                blocks.setdefault(block_id, display_name.replace("\t", " ").strip("\r\n"))
+    return blocks
+
+
+def read_oredict_dump(path: str) -> Set[str]:
+    names = set()
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.reader(f)
+            header = next(reader, [])
+            column = _find_column(header, _oredict_columns)
+            if column is None:
+                raise ValueError("%s: no ore dictionary name column in header %r." % (path, header))
+            entries = (row[column] for row in reader if column < len(row))
+        else:
+            entries = (line.partition("\t")[0] for line in f)
+
+        for entry in entries:
+            name = _oredict_name(entry)
+            if name is not None and not any(char.isspace() for char in name):
+                names.add(name)
+    return names
+
+
+def find_dumps(directory: str):
+    # Returns (block_dump_paths, oredict_dump_paths), sorted by file name.
+    block_dumps, oredict_dumps = [], []
+    for file_name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, file_name)
+        if not os.path.isfile(path):
+            continue
+        lower = file_name.lower()
+        if any(key in lower for key in ("oredict", "ore_dict", "ore-dict")):
+            oredict_dumps.append(path)
+        elif "block" in lower:
+            block_dumps.append(path)
+    return block_dumps, oredict_dumps
+
+
+class ModidChanges:
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.renamed = []  # display name changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.renamed)
+
+
+def merge_blocks(existing: Dict[str, str], dumped: Dict[str, str]):
+    # Returns (merged, changes), where changes is an OrderedDict of {modid: ModidChanges}, for changed mods only.
+    dumped_by_modid = defaultdict(dict)
+    for block_id, display_name in dumped.items():
+        dumped_by_modid[block_id.split(":", 1)[0]][block_id] = display_name
+    existing_by_modid = defaultdict(dict)
+    for block_id, display_name in existing.items():
+        existing_by_modid[block_id.split(":", 1)[0]][block_id] = display_name
+
+    merged = dict(existing)
+    changes = OrderedDict()
+    for modid in sorted(dumped_by_modid):
+        old = existing_by_modid.get(modid, {})
+        new = dumped_by_modid[modid]
+        modid_changes = ModidChanges()
+
+        for block_id in sorted(new.keys() - old.keys()):
+            modid_changes.added.append(block_id)
+            merged[block_id] = new[block_id]
+        for block_id in sorted(old.keys() - new.keys()):
+            modid_changes.removed.append(block_id)
+            del merged[block_id]
+        for block_id in sorted(old.keys() & new.keys()):
+            # Keep the old display name if the dump doesn't have one.
+            if new[block_id] and new[block_id] != old[block_id]:
+                modid_changes.renamed.append(block_id)
+                merged[block_id] = new[block_id]
+
+        if modid_changes:
+            changes[modid] = modid_changes
+    return merged, changes
+
+
+def merge_oredict(existing: Iterable[str], dumped: Set[str], prune: bool = False):
+    # Returns (merged, added, removed).
+    existing = set(existing)
+    added = sorted(dumped - existing)
+    removed = sorted(existing - dumped) if prune else []
+    merged = dumped if prune else existing | dumped
+    return merged, added, removed
+
+
+def import_dumps(directory: str, blocks_file: str = blocks_path, oredict_file: str = oredict_path,
+                 prune_oredict: bool = False, dry_run: bool = False) -> str:
+    # Merges every dump in directory into the packed catalogs. Returns a summary of the changes.
+    block_dumps, oredict_dumps = find_dumps(directory)
+    lines = []
+
+    if block_dumps:
+        dumped = {}
+        for path in block_dumps:
+            for block_id, display_name in read_block_dump(path).items():
+                dumped.setdefault(block_id, display_name)
+        existing = {}
+        if os.path.exists(blocks_file):
+            with PackedCatalog(blocks_file) as catalog:  # Closed before write_packed replaces the file.
+                existing = dict(catalog.items())
+        merged, changes = merge_blocks(existing, dumped)
+
+        lines.append("Blocks: %d in %d dump(s), %d in catalog before, %d after."
+                     % (len(dumped), len(block_dumps), len(existing), len(merged)))
+        for modid, modid_changes in changes.items():
+            lines.append("  %-24s +%d -%d ~%d" % (modid, len(modid_changes.added), len(modid_changes.removed),
+                                                  len(modid_changes.renamed)))
+        if not dry_run and changes:
+            write_packed(blocks_file, merged)
+
+    if oredict_dumps:
+        dumped = set()
+        for path in oredict_dumps:
+            dumped |= read_oredict_dump(path)
+        existing = ()
+        if os.path.exists(oredict_file):
+            with PackedCatalog(oredict_file) as catalog:
+                existing = catalog.keys()
+        merged, added, removed = merge_oredict(existing, dumped, prune_oredict)
+
+        lines.append("Ore dictionary: %d in %d dump(s), +%d -%d, %d in catalog after."
+                     % (len(dumped), len(oredict_dumps), len(added), len(removed), len(merged)))
+        if not dry_run and (added or removed):
+            write_packed(oredict_file, merged)
+
+    if not lines:
+        lines.append("No block or ore dictionary dumps found in %s." % directory)
+    elif dry_run:
+        lines.append("Dry run: no files were changed.")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge block and ore dictionary registry dumps into the "
+                                                 "linting catalogs.")
+    parser.add_argument("directory", help="Directory holding the dump files.")
+    parser.add_argument("--blocks", default=blocks_path, help="Packed block catalog to update.")
+    parser.add_argument("--oredict", default=oredict_path, help="Packed ore dictionary catalog to update.")
+    parser.add_argument("--prune-oredict", action="store_true",
+                        help="Remove ore dictionary names that no dump lists.")
+    parser.add_argument("--dry-run", action="store_true", help="Report the changes without writing anything.")
+    args = parser.parse_args(argv)
+
+    print(import_dumps(args.directory, args.blocks, args.oredict, args.prune_oredict, args.dry_run))
+
+
+class TestReadDumps(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, file_name, text):
+        path = os.path.join(self.temp_dir.name, file_name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_block_csv(self):
+        path = self.write("blocks.csv", "Mod name,Registry name,BlockID,Display name\n"
+                                        "Minecraft,minecraft:stone,1,Stone\n"
+                                        "Minecraft,minecraft:stone:1,1,Granite\n"
+                                        "Quark,quark:marble,2000,Marble\n")
+        self.assertEqual(read_block_dump(path), {"minecraft:stone": "Stone", "quark:marble": "Marble"})
+
+    def test_block_text(self):
+        path = self.write("block_dump.txt", "<minecraft:stone>\nquark:marble\tMarble\nnot an id\n\n")
+        self.assertEqual(read_block_dump(path), {"minecraft:stone": "", "quark:marble": "Marble"})
+
+    def test_block_csv_without_id_column(self):
+        path = self.write("blocks.csv", "Colour,Shape\nRed,Square\n")
+        with self.assertRaises(ValueError):
+            read_block_dump(path)
+
+    def test_oredict(self):
+        csv_path = self.write("oredict.csv", "Ore Name,Items\noreIron,minecraft:iron_ore\n")
+        text_path = self.write("oredict.txt", "<ore:ingotIron>\ndustIron\n\nnot a name\n")
+        self.assertEqual(read_oredict_dump(csv_path), {"oreIron"})
+        self.assertEqual(read_oredict_dump(text_path), {"ingotIron", "dustIron"})
+
+    def test_find_dumps(self):
+        self.write("block_dump.csv", "")
+        self.write("oredict_dump.txt", "")
+        self.write("readme.txt", "")
+        block_dumps, oredict_dumps = find_dumps(self.temp_dir.name)
+        self.assertEqual([os.path.basename(p) for p in block_dumps], ["block_dump.csv"])
+        self.assertEqual([os.path.basename(p) for p in oredict_dumps], ["oredict_dump.txt"])
+
+
+class TestMerge(unittest.TestCase):
+    def test_merge_blocks_per_modid(self):
+        existing = {"minecraft:stone": "Stone", "quark:marble": "Marble", "quark:old": "Old",
+                    "chisel:basalt": "Basalt"}
+        dumped = {"quark:marble": "Marble (Polished)", "quark:new": "New", "minecraft:stone": ""}
+
+        merged, changes = merge_blocks(existing, dumped)
+        self.assertEqual(merged, {"minecraft:stone": "Stone", "quark:marble": "Marble (Polished)",
+                                  "quark:new": "New", "chisel:basalt": "Basalt"})
+        self.assertEqual(list(changes), ["quark"])  # minecraft didn't change; chisel wasn't in the dump.
+        self.assertEqual(changes["quark"].added, ["quark:new"])
+        self.assertEqual(changes["quark"].removed, ["quark:old"])
+        self.assertEqual(changes["quark"].renamed, ["quark:marble"])
+
+    def test_merge_oredict(self):
+        self.assertEqual(merge_oredict(["oreIron", "oreOld"], {"oreIron", "oreTin"}),
+                         ({"oreIron", "oreOld", "oreTin"}, ["oreTin"], []))
+        self.assertEqual(merge_oredict(["oreIron", "oreOld"], {"oreIron", "oreTin"}, prune=True),
+                         ({"oreIron", "oreTin"}, ["oreTin"], ["oreOld"]))
+
+
+class TestImportDumps(unittest.TestCase):
+    def test_import(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dumps = os.path.join(temp_dir, "dumps")
+            os.mkdir(dumps)
+            blocks_file = os.path.join(temp_dir, "blocks.tsv")
+            oredict_file = os.path.join(temp_dir, "oredict.txt")
+            write_packed(blocks_file, {"minecraft:stone": "Stone", "quark:old": "Old"})
+            write_packed(oredict_file, ["oreIron"])
+
+            with open(os.path.join(dumps, "block_registry.txt"), "w") as f:
+                f.write("quark:marble\tMarble\n")
+            with open(os.path.join(dumps, "oredict.txt"), "w") as f:
+                f.write("oreTin\n")
+
+            summary = import_dumps(dumps, blocks_file, oredict_file, dry_run=True)
+            self.assertIn("Dry run", summary)
+            self.assertEqual(PackedCatalog(blocks_file).keys(), ("minecraft:stone", "quark:old"))
+
+            summary = import_dumps(dumps, blocks_file, oredict_file)
+            self.assertIn("quark", summary)
+            self.assertEqual(PackedCatalog(blocks_file).keys(), ("minecraft:stone", "quark:marble"))
+            self.assertEqual(PackedCatalog(oredict_file).keys(), ("oreIron", "oreTin"))
+
+    def test_large_dump(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dumps = os.path.join(temp_dir, "dumps")
+            os.mkdir(dumps)
+            with open(os.path.join(dumps, "blocks.csv"), "w") as f:
+                f.write("Registry name,Display name\n")
+                for i in range(60000):
+                    f.write("mod%d:block_%d,Block %d\n" % (i % 50, i, i))
+            blocks_file = os.path.join(temp_dir, "blocks.tsv")
+
+            import_dumps(dumps, blocks_file, os.path.join(temp_dir, "oredict.txt"))
+            self.assertEqual(len(PackedCatalog(blocks_file)), 60000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+import mmap
+import os
+import tempfile
+import unittest
+from typing import Iterable, Mapping, Tuple, Union
+
+from output_writer import write_if_changed
+
+# The linting catalogs are stored as sorted, packed text files in linting_data/:
+#
+#   blocks.tsv   - one "block_id<TAB>display name" line per block
+#   oredict.txt  - one ore dictionary name per line
+#   biomes.tsv   - one "biome_id<TAB>display name<TAB>TYPE,TYPE,..." line per biome
+#   biome_types.txt - one BiomeDictionary type per line
+#
+# Lines are sorted by key (byte order, which for UTF-8 is also Python's string order). That lets a PackedCatalog
+# answer lookups with a binary search straight over the memory-mapped file, without parsing it first.
+# Nothing is read until the first lookup, so commands that never lint never pay for the catalogs.
+
+linting_data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linting_data")
+blocks_path = os.path.join(linting_data_dir, "blocks.tsv")
+oredict_path = os.path.join(linting_data_dir, "oredict.txt")
+biomes_path = os.path.join(linting_data_dir, "biomes.tsv")
+biome_types_path = os.path.join(linting_data_dir, "biome_types.txt")
+
+
+class PackedCatalog:
+    def __init__(self, path: str):
+        self.path = path
+        self._data = None
+        self._items = None
+
+    def _open(self):
+        if self._data is None:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._data = b""
+                else:
+                    self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data
+
+    def close(self):
+        # Unmaps the file, so that it can be replaced (Windows won't replace a mapped file). Parsed items are kept,
+        # and the next lookup maps the file again.
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _line_at(self, start: int) -> Tuple[bytes, bytes, int]:
+        # Returns (key, value, end) for the line starting at offset start. end is the offset of its newline.
+        data = self._data
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = len(data)
+        line = data[start:end]
+        key, separator, value = line.partition(b"\t")
+        return key, value, end
+
+    def _lower_bound(self, key: bytes) -> int:
+        # The offset of the first line whose key is >= key (or the end of the file).
+        # lo and hi are always the starts of lines; every line before lo has a smaller key.
+        data = self._open()
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", lo, mid) + 1 or lo
+            line_key, value, end = self._line_at(start)
+            if line_key < key:
+                lo = end + 1
+            else:
+                hi = start
+        return lo
+
+    def get(self, key: str, default=None):
+        # The value stored for key ("" for catalogs without values), or default.
+        key_bytes = key.encode("utf-8")
+        start = self._lower_bound(key_bytes)
+        if start >= len(self._data):
+            return default
+        line_key, value, end = self._line_at(start)
+        if line_key != key_bytes:
+            return default
+        return value.decode("utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def with_prefix(self, prefix: str) -> Tuple[str]:
+        # All keys starting with prefix, in sorted order.
+        prefix_bytes = prefix.encode("utf-8")
+        start = self._lower_bound(prefix_bytes)
+        keys = []
+        while start < len(self._data):
+            line_key, value, end = self._line_at(start)
+            if not line_key.startswith(prefix_bytes):
+                break
+            keys.append(line_key.decode("utf-8"))
+            start = end + 1
+        return tuple(keys)
+
+    def items(self) -> Tuple[Tuple[str, str]]:
+        # Every (key, value) pair, in sorted order. Parses the whole file, once.
+        if self._items is None:
+            text = bytes(self._open()).decode("utf-8")
+            self._items = tuple(tuple(line.partition("\t")[::2]) for line in text.split("\n") if line)
+        return self._items
+
+    def keys(self) -> Tuple[str]:
+        return tuple(key for key, value in self.items())
+
+    def __len__(self):
+        return len(self.items())
+
+
+def pack(entries: Union[Mapping[str, str], Iterable[str]]) -> bytes:
+    # Packs either a {key: value} mapping (i.e. block ID -> display name) or plain keys (i.e. ore dictionary names).
+    if isinstance(entries, Mapping):
+        pairs = sorted(entries.items())
+    else:
+        pairs = [(key, None) for key in sorted(set(entries))]
+
+    lines = []
+    for key, value in pairs:
+        if not key or any(char in key for char in "\t\n"):
+            raise ValueError("Catalog key %r is empty or contains a tab or newline." % key)
+        if value is None:
+            lines.append(key)
+        else:
+            if "\n" in value:
+                raise ValueError("Catalog value %r for %r contains a newline." % (value, key))
+            lines.append(key + "\t" + value)
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+def write_packed(path: str, entries: Union[Mapping[str, str], Iterable[str]]) -> bool:
+    # Writes a packed catalog file. Returns False if the file already had exactly this content.
+    return write_if_changed(path, pack(entries))
+
+
+class TestPackedCatalog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.blocks = os.path.join(self.temp_dir.name, "blocks.tsv")
+        self.oredict = os.path.join(self.temp_dir.name, "oredict.txt")
+        write_packed(self.blocks, {
+            "minecraft:stone": "Stone",
+            "minecraft:iron_ore": "Iron Ore",
+            "quark:marble": "Marble",
+            "astralsorcery:blockfaketree": "",
+            "minecolonies:frame": " Leading Space",
+        })
+        write_packed(self.oredict, ["oreIron", "ingotIron", "oreGold", "stone"])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_file_is_sorted_text(self):
+        with open(self.oredict, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "ingotIron\noreGold\noreIron\nstone\n")
+
+    def test_get(self):
+        catalog = PackedCatalog(self.blocks)
+        self.assertEqual(catalog.get("minecraft:iron_ore"), "Iron Ore")
+        self.assertEqual(catalog.get("minecolonies:frame"), " Leading Space")
+        self.assertEqual(catalog.get("astralsorcery:blockfaketree"), "")
+        self.assertIsNone(catalog.get("minecraft:iron"))
+        self.assertIsNone(catalog.get("zzz:last"))
+        self.assertIsNone(catalog.get("aaa:first"))
+
+    def test_every_key_is_found(self):
+        catalog = PackedCatalog(self.blocks)
+        for key, value in catalog.items():
+            self.assertIn(key, catalog)
+        self.assertEqual(len(catalog), 5)
+
+    def test_keys_without_values(self):
+        catalog = PackedCatalog(self.oredict)
+        self.assertIn("oreGold", catalog)
+        self.assertNotIn("ore", catalog)
+        self.assertEqual(catalog.keys(), ("ingotIron", "oreGold", "oreIron", "stone"))
+
+    def test_with_prefix(self):
+        catalog = PackedCatalog(self.oredict)
+        self.assertEqual(catalog.with_prefix("ore"), ("oreGold", "oreIron"))
+        self.assertEqual(catalog.with_prefix("z"), ())
+
+    def test_lazy(self):
+        catalog = PackedCatalog(os.path.join(self.temp_dir.name, "does_not_exist.txt"))  # Nothing is opened yet.
+        with self.assertRaises(FileNotFoundError):
+            catalog.get("anything")
+
+    def test_empty(self):
+        path = os.path.join(self.temp_dir.name, "empty.txt")
+        write_packed(path, [])
+        self.assertNotIn("oreIron", PackedCatalog(path))
+
+    def test_close(self):
+        with PackedCatalog(self.oredict) as catalog:
+            self.assertIn("oreGold", catalog)
+        self.assertIsNone(catalog._data)
+        write_packed(self.oredict, ["oreTin"])  # Replaces the file, which Windows refuses while it is mapped.
+        self.assertIn("oreTin", catalog)
+        catalog.close()
+
+    def test_bad_keys(self):
+        with self.assertRaises(ValueError):
+            pack(["ore\tIron"])
+
+    def test_shipped_catalogs(self):
+        blocks = PackedCatalog(blocks_path)
+        self.assertEqual(blocks.get("minecraft:iron_ore"), "Iron Ore")
+        self.assertEqual(list(blocks.keys()), sorted(blocks.keys()))
+        self.assertIn("oreIron", PackedCatalog(oredict_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
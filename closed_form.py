@@ -0,0 +1,500 @@
+import argparse
+import functools
+import math
+import re
+import sys
+import time
+import unittest
+from collections import OrderedDict, namedtuple
+from statistics import NormalDist
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from cog_expressions import default_bindings, dimension_profiles
+from excel_table import TableLocation, iter_workbook_tables
+from ore_simulation import counts_from_frequencies
+from presets import PresetResolver
+from setting_sampling import SettingDistribution, SettingTable, generator, normal_spread, sample
+from setting_sampling import row_settings as _row_settings
+
+# Works out the ore per chunk of StandardGen and Cloud distributions, and its variance, in closed form: there is
+# nothing to simulate, and every distribution of a type is done at once, in a few NumPy calls per setting. For
+# interactive use, where ore_simulation's millions of chunks are more than is needed.
+#
+# Usage:
+#   python closed_form.py "Sprocket2 Spreadsheet.xlsx" "Ore Amount Calculation Assistant.xlsx"
+#   python closed_form.py "Sprocket2 Spreadsheet.xlsx" --cross-check --chunks 200000 --dimension nether
+#
+# The models, with every setting drawn from its avg, range and type as in setting_sampling, and negative values
+# taken as 0:
+#   StandardGen: Frequency clusters per chunk (the fraction is the chance of one more), each of Size * cluster_fill
+#                ore, if its Height is within the dimension; like the "Ore density (without COG)" column of "Ore
+#                Amount Calculation Assistant.xlsx", a cluster fills half of its Size.
+#   Cloud:       DistributionFrequency clouds per chunk, each an ellipsoid of radius CloudRadius and thickness
+#                CloudThickness, of which OreDensity * OreVolumeNoiseCutoff is ore, as in the Assistant.
+# Settings are independent, and drawn again for every cluster or cloud, so with N the clusters of a chunk and Y the
+# ore of one:
+#   mean = E[N] E[Y]
+#   variance = E[N] Var[Y] + Var[N] E[Y]^2
+# where Var[N] is the variance of the frequency plus the variance that the chance of one more adds. E[Y] and E[Y^2]
+# are products of E[max(X, 0) ^ k] of the settings, which have closed forms for both types: a uniform is a
+# polynomial integral, and COG's clipped normal is a normal between avg +- range, plus the chance of being clipped at
+# each end. Only the term for the chance of one more is taken from quantiles, as it has no simple closed form.
+#
+# --cross-check simulates each distribution with the same model, as ore_simulation does for Veins, and prints how
+# many standard errors the simulated mean is from the closed form, and the ratio of the variances.
+#
+# Rows come from the StandardGen_Presets and Cloud_Presets tables (presets and enabled distributions), and from the
+# Cloud presets of the Assistant's Preset_Parameters table, whose "sigma=" ranges are read as normal settings.
+
+standardgen_settings = ("Frequency", "Size", "Height")
+cloud_settings = ("DistributionFrequency", "CloudRadius", "CloudThickness", "OreDensity", "OreVolumeNoiseCutoff")
+
+# table is the name of the Excel table of a distribution type's rows, settings its modelled settings, frequency the
+# one of them that is drawn per chunk, and defaults the values of settings a row may leave blank.
+Model = namedtuple("Model", "table settings frequency defaults")
+
+models = OrderedDict([
+    ("StandardGen", Model("StandardGen_Presets", standardgen_settings, "Frequency", {})),
+    ("Cloud", Model("Cloud_Presets", cloud_settings, "DistributionFrequency",
+                    {"OreDensity": 1.0, "OreVolumeNoiseCutoff": 1.0})),
+])
+
+# The share of a StandardGen cluster's Size that is ore.
+cluster_fill = 0.5
+
+preset_parameters_table = "Preset_Parameters"
+
+# The Assistant's Preset_Parameters give OreDensity and OreVolumeNoiseCutoff as one product.
+preset_parameter_names = {"OreDensity × OreVolumeNoiseCutoff": "OreDensity"}
+
+default_chunks = 100000
+default_batch_size = 1 << 16
+
+# Quantiles for the variance of the chance of one more cluster.
+fraction_quantiles = 256
+
+# How many standard errors the simulated mean may be from the closed form before a cross-check fails.
+check_tolerance = 4.0
+
+# The chance of a clipped normal setting being at each end of its range.
+_tail = NormalDist().cdf(-normal_spread)
+_normal_cdf = np.vectorize(NormalDist().cdf, otypes=[float])
+
+# mean and variance are of the ore per chunk.
+FastEstimate = namedtuple("FastEstimate", "workbook name cell kind mean variance")
+
+# The closed-form estimate of a distribution, and the mean and variance of chunks simulated chunks.
+CrossCheck = namedtuple("CrossCheck", "estimate chunks sampled_mean sampled_variance")
+
+
+def _normal_pdf(t) -> np.ndarray:
+    return np.exp(-0.5 * t * t) / math.sqrt(2.0 * math.pi)
+
+
+def _partial_moment(avg, sigma, low, high, power) -> np.ndarray:
+    # The integral of x ^ power times the density of N(avg, sigma ^ 2), from low to high (low <= high). With
+    # x = avg + sigma * t, it is a sum of the integrals I_k of t ^ k times the standard normal density, which follow
+    # from I_0 = cdf(t2) - cdf(t1), I_1 = pdf(t1) - pdf(t2) and I_k = (k - 1) I_{k-2} + t1^(k-1) pdf(t1) -
+    # t2^(k-1) pdf(t2).
+    t1, t2 = (low - avg) / sigma, (high - avg) / sigma
+    pdf1, pdf2 = _normal_pdf(t1), _normal_pdf(t2)
+    integrals = [_normal_cdf(t2) - _normal_cdf(t1), pdf1 - pdf2]
+    for k in range(2, power + 1):
+        integrals.append((k - 1) * integrals[k - 2] + t1 ** (k - 1) * pdf1 - t2 ** (k - 1) * pdf2)
+    return sum(math.comb(power, k) * avg ** (power - k) * sigma ** k * integrals[k] for k in range(power + 1))
+
+
+def positive_moment(table: SettingTable, power) -> np.ndarray:
+    # E[max(X, 0) ^ power] for each setting X of table.
+    avg, spread = table.avg, np.abs(table.range)
+    low, high = np.maximum(avg - spread, 0.0), np.maximum(avg + spread, 0.0)
+    result = np.maximum(avg, 0.0) ** power
+    uniform = (table.types == "uniform") & (spread != 0)
+    result[uniform] = (high[uniform] ** (power + 1) - low[uniform] ** (power + 1)) / \
+        ((power + 1) * 2.0 * spread[uniform])
+    normal = (table.types == "normal") & (spread != 0)
+    if normal.any():
+        result[normal] = _tail * (low[normal] ** power + high[normal] ** power) + _partial_moment(
+            avg[normal], spread[normal] / normal_spread, low[normal], high[normal], power)
+    return result
+
+
+def probability_between(table: SettingTable, low, high) -> np.ndarray:
+    # P(low <= X < high) for each setting X of table.
+    avg, spread = table.avg, np.abs(table.range)
+    result = ((avg >= low) & (avg < high)).astype(float)
+    uniform = (table.types == "uniform") & (spread != 0)
+    overlap = np.minimum(avg + spread, high) - np.maximum(avg - spread, low)
+    result[uniform] = np.maximum(overlap[uniform], 0.0) / (2.0 * spread[uniform])
+    normal = (table.types == "normal") & (spread != 0)
+    if normal.any():
+        avg, spread = avg[normal], spread[normal]
+        ends = sum(((end >= low) & (end < high)).astype(float) for end in (avg - spread, avg + spread))
+        sigma = spread / normal_spread
+        result[normal] = _tail * ends + _normal_cdf(np.clip((high - avg) / sigma, -normal_spread, normal_spread)) - \
+            _normal_cdf(np.clip((low - avg) / sigma, -normal_spread, normal_spread))
+    return result
+
+
+def fraction_variance(table: SettingTable, quantiles=fraction_quantiles) -> np.ndarray:
+    # The variance that rounding max(X, 0) up or down, with the chance of its fraction, adds: E[f (1 - f)], where f
+    # is the fraction of X. Taken over quantiles of X.
+    fractions = np.maximum(table.quantiles(quantiles), 0.0) % 1.0
+    return (fractions * (1.0 - fractions)).mean(axis=1)
+
+
+def row_settings(row, kind, bindings=None) -> OrderedDict:
+    # The modelled settings of a resolved row of a distribution type, as {setting name: SettingDistribution}.
+    # Raises ValueError if a required setting is blank, or a cell can't be evaluated.
+    model = models[kind]
+    return _row_settings(row, model.settings, bindings, model.defaults)
+
+
+def _dimension_height(bindings) -> float:
+    return (bindings or {}).get("dimension.height", default_bindings["dimension.height"])
+
+
+def instance_moments(kind, columns, bindings=None):
+    # (E[Y], E[Y ^ 2]) for the ore Y of one cluster or cloud. columns is {setting name: SettingTable} with a row per
+    # distribution; the results have one item per distribution.
+    if kind == "StandardGen":
+        inside = probability_between(columns["Height"], 0.0, _dimension_height(bindings))
+        return (cluster_fill * positive_moment(columns["Size"], 1) * inside,
+                cluster_fill ** 2 * positive_moment(columns["Size"], 2) * inside)
+    volume = 4.0 / 3.0 * math.pi
+    first, second = volume * positive_moment(columns["CloudRadius"], 2), volume ** 2 * positive_moment(
+        columns["CloudRadius"], 4)
+    for name in ("CloudThickness", "OreDensity", "OreVolumeNoiseCutoff"):
+        first = first * positive_moment(columns[name], 1)
+        second = second * positive_moment(columns[name], 2)
+    return first, second
+
+
+def closed_form(kind, columns, bindings=None):
+    # (mean, variance) of the ore per chunk of every distribution in columns, as for instance_moments().
+    frequency = columns[models[kind].frequency]
+    clusters = positive_moment(frequency, 1)
+    cluster_variance = positive_moment(frequency, 2) - clusters ** 2 + fraction_variance(frequency)
+    first, second = instance_moments(kind, columns, bindings)
+    return clusters * first, clusters * (second - first ** 2) + np.maximum(cluster_variance, 0.0) * first ** 2
+
+
+def _instance_ores(kind, values, bindings) -> np.ndarray:
+    # The ore of clusters or clouds, from {setting name: array of values}; the sampled counterpart of
+    # instance_moments().
+    if kind == "StandardGen":
+        heights = values["Height"]
+        return cluster_fill * np.maximum(values["Size"], 0.0) * ((heights >= 0) & (heights < _dimension_height(
+            bindings)))
+    ores = 4.0 / 3.0 * math.pi * np.maximum(values["CloudRadius"], 0.0) ** 2
+    for name in ("CloudThickness", "OreDensity", "OreVolumeNoiseCutoff"):
+        ores *= np.maximum(values[name], 0.0)
+    return ores
+
+
+@instrumentation.timed("simulate_clusters")
+def simulate(kind, settings, chunks=default_chunks, seed=None, bindings=None,
+             batch_size=default_batch_size) -> np.ndarray:
+    # Ore per chunk for each of chunks simulated chunks of a distribution type, from {setting name:
+    # SettingDistribution}. seed is a seed or a np.random.Generator, as for ore_simulation.simulate().
+    rng = np.random.default_rng(seed)
+    frequency = settings[models[kind].frequency]
+    table = SettingTable.from_settings(OrderedDict((name, setting) for name, setting in settings.items()
+                                                   if name != models[kind].frequency))
+    result = np.empty(chunks)
+    for start in range(0, chunks, batch_size):
+        stop = min(start + batch_size, chunks)
+        counts = counts_from_frequencies(np.maximum(sample(frequency, stop - start, rng), 0.0), rng)
+        ores = _instance_ores(kind, table.sample_dict(int(counts.sum()), rng), bindings)
+        result[start:stop] = np.bincount(np.repeat(np.arange(stop - start), counts), weights=ores,
+                                         minlength=stop - start)
+    if instrumentation.is_enabled():
+        instrumentation.count("simulate_clusters", "chunks", chunks)
+    return result
+
+
+def _parameter_range(text):
+    # (range, type) from a Preset_Parameters range: "±0.5" is uniform, "σ=8" a normal of standard deviation 8.
+    # Raises ValueError for anything else.
+    if isinstance(text, (int, float)):
+        return float(text), "uniform"
+    match = _parameter_range_pattern.fullmatch(str(text))
+    if match is None:
+        raise ValueError("Range %r is neither a number, ±x nor σ=x." % text)
+    if (match.group(1) or "").startswith("σ"):
+        return float(match.group(2)) * normal_spread, "normal"
+    return float(match.group(2)), "uniform"
+
+
+_parameter_range_pattern = re.compile(r"\s*(±|σ\s*=)?\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*")
+
+
+def _parameter_names(parameters) -> OrderedDict:
+    # {setting name: parameter number} of a row of the Preset_Parameters table.
+    names = OrderedDict()
+    for i in range(1, 8):
+        name = parameters.get("Param %d Name" % i)
+        if name is not None:
+            names[preset_parameter_names.get(name, name)] = i
+    return names
+
+
+def preset_parameter_kind(parameters):
+    # The modelled type whose settings are all of the parameters of a Preset_Parameters row, or None (i.e. for the
+    # Veins presets).
+    names = set(_parameter_names(parameters))
+    for kind, model in models.items():
+        if names and names <= set(model.settings):
+            return kind
+    return None
+
+
+def preset_parameter_row(parameters) -> OrderedDict:
+    # A Preset_Parameters row as a row like those of StandardGen_Presets. Raises ValueError for a range that can't
+    # be read.
+    row = OrderedDict([("Type", "Preset"), ("name", parameters.get("Preset"))])
+    for name, i in _parameter_names(parameters).items():
+        try:
+            spread, setting_type = _parameter_range(parameters.get("Param %d Range" % i) or 0)
+        except ValueError as e:
+            raise ValueError("Param %d %s" % (i, e)) from e
+        row.update([(name + "_avg", parameters.get("Param %d Avg" % i)), (name + "_range", spread),
+                    (name + "_type", setting_type)])
+    return row
+
+
+def distribution_rows(tables):
+    # Yields (kind, row, cell, resolve) for the presets and enabled distributions of every modelled type in tables
+    # (as produced by iter_workbook_tables()). resolve() returns the row with what it inherits filled in, and raises
+    # ValueError if a Preset_Parameters row can't be read.
+    tables = list(tables)
+    resolver = PresetResolver(row for table_name, table_data, location in tables for row in table_data)
+    kinds = {model.table: kind for kind, model in models.items()}
+    for table_name, table_data, location in tables:
+        if table_name in kinds:
+            for row_index, row in enumerate(table_data):
+                if row.get("Type") == "Preset" or (row.get("Type") == "Distribution" and not row.get("OFF?")):
+                    yield kinds[table_name], row, location.row_reference(row_index), \
+                        functools.partial(resolver.resolve, row)
+        elif table_name == preset_parameters_table:
+            for row_index, parameters in enumerate(table_data):
+                kind = preset_parameter_kind(parameters)
+                if kind is not None:
+                    yield kind, OrderedDict([("Type", "Preset"), ("name", parameters.get("Preset"))]), \
+                        location.row_reference(row_index), functools.partial(preset_parameter_row, parameters)
+
+
+@instrumentation.timed("closed_form")
+def _estimates(workbook, tables, bindings):
+    # Returns ([(FastEstimate, row, settings)], skipped), for estimate_tables() and cross_check_tables().
+    entries, skipped = OrderedDict((kind, []) for kind in models), []
+    for kind, row, cell, resolve in distribution_rows(tables):
+        try:
+            entries[kind].append((row, cell, row_settings(resolve(), kind, bindings)))
+        except ValueError as e:
+            skipped.append((cell, row.get("name"), str(e)))
+
+    estimates = []
+    for kind, rows in entries.items():
+        if not rows:
+            continue
+        settings_list = [settings for row, cell, settings in rows]
+        columns = {name: SettingTable.from_column(settings_list, name) for name in models[kind].settings}
+        means, variances = closed_form(kind, columns, bindings)
+        estimates.extend((FastEstimate(workbook, row.get("name"), cell, kind, float(mean), float(variance)), row,
+                          settings) for (row, cell, settings), mean, variance in zip(rows, means, variances))
+    return estimates, skipped
+
+
+def estimate_tables(workbook, tables, bindings=None):
+    # Returns (estimates, skipped): a FastEstimate for every row of distribution_rows(), worked out for all the rows
+    # of a type at once, and a list of (cell, name, reason) for the rows whose settings couldn't be worked out.
+    estimates, skipped = _estimates(workbook, tables, bindings)
+    return [estimate for estimate, row, settings in estimates], skipped
+
+
+def cross_check_tables(workbook, tables, chunks=default_chunks, salt=0, bindings=None):
+    # The same as estimate_tables(), with each estimate checked against chunks simulated chunks, drawn from the
+    # generator of the row's seed and salt. Returns (cross checks, skipped).
+    estimates, skipped = _estimates(workbook, tables, bindings)
+    checks = []
+    for estimate, row, settings in estimates:
+        ores = simulate(estimate.kind, settings, chunks, generator(row, salt), bindings)
+        checks.append(CrossCheck(estimate, chunks, float(ores.mean()), float(ores.var())))
+    return checks, skipped
+
+
+def standard_errors(check: CrossCheck) -> float:
+    # How many standard errors of its mean the simulated mean is from the closed form.
+    error = math.sqrt(check.estimate.variance / check.chunks)
+    if error == 0:
+        return 0.0 if math.isclose(check.sampled_mean, check.estimate.mean, abs_tol=1e-9) else math.inf
+    return (check.sampled_mean - check.estimate.mean) / error
+
+
+def format_estimate(estimate: FastEstimate) -> str:
+    return "%s %s (%s): %.3f ore/chunk (std %.3f)" % (estimate.cell, estimate.name, estimate.kind, estimate.mean,
+                                                      math.sqrt(estimate.variance))
+
+
+def format_check(check: CrossCheck) -> str:
+    errors = standard_errors(check)
+    variance_ratio = check.sampled_variance / check.estimate.variance if check.estimate.variance else math.nan
+    return "%s; sampled %.3f (std %.3f), %+.1f standard errors, variance ratio %.3f%s" % (
+        format_estimate(check.estimate), check.sampled_mean, math.sqrt(check.sampled_variance), errors,
+        variance_ratio, "" if abs(errors) <= check_tolerance else " MISMATCH")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Closed-form ore per chunk of StandardGen and Cloud distributions.")
+    parser.add_argument("workbooks", nargs="+", help="Excel workbooks (.xlsx) to read distributions from.")
+    parser.add_argument("--dimension", choices=list(dimension_profiles), default="overworld",
+                        help="Dimension to evaluate expressions and heights for.")
+    parser.add_argument("--cross-check", action="store_true",
+                        help="Compare each estimate with a simulation of the same model.")
+    parser.add_argument("--chunks", type=int, default=default_chunks, help="Chunks to simulate per distribution.")
+    parser.add_argument("--salt", type=int, default=0,
+                        help="Combined with each distribution's seed; change it for another independent run.")
+    args = parser.parse_args(argv)
+
+    bindings = dict(default_bindings, **dimension_profiles[args.dimension])
+    for path in args.workbooks:
+        start = time.perf_counter()
+        tables = iter_workbook_tables(openpyxl.load_workbook(path))
+        if args.cross_check:
+            results, skipped = cross_check_tables(path, tables, args.chunks, args.salt, bindings)
+            lines = [format_check(check) for check in results]
+        else:
+            results, skipped = estimate_tables(path, tables, bindings)
+            lines = [format_estimate(estimate) for estimate in results]
+        for line in lines:
+            print(line)
+        for cell, name, reason in skipped:
+            print("%s %s %s: skipped, %s" % (path, cell, name, reason), file=sys.stderr)
+        print("%s: %d distributions in %.2fs" % (path, len(results), time.perf_counter() - start), file=sys.stderr)
+
+
+def _table(*settings):
+    return SettingTable(range(len(settings)), [s.avg for s in settings], [s.range for s in settings],
+                        [s.type for s in settings])
+
+
+class TestMoments(unittest.TestCase):
+    settings = [SettingDistribution(2.0, 0.0, "uniform"), SettingDistribution(-1.0, 0.0, "normal"),
+                SettingDistribution(2.0, 1.0, "uniform"), SettingDistribution(0.5, 1.5, "uniform"),
+                SettingDistribution(2.0, 1.0, "normal"), SettingDistribution(0.2, 1.0, "normal"),
+                SettingDistribution(-3.0, 1.0, "normal")]
+
+    def test_positive_moment(self):
+        table = _table(*self.settings)
+        values = np.maximum(table.quantiles(200000), 0.0)
+        for power in (1, 2, 4):
+            self.assertTrue(np.allclose(positive_moment(table, power), (values ** power).mean(axis=1), rtol=1e-4,
+                                        atol=1e-9), power)
+        self.assertAlmostEqual(positive_moment(table, 3)[2], (3 ** 4 - 1) / 8)
+
+    def test_probability_between(self):
+        table = _table(*self.settings)
+        values = table.quantiles(200000)
+        for low, high in ((0.0, 2.5), (-10.0, 0.0), (1.0, 10.0)):
+            self.assertTrue(np.allclose(probability_between(table, low, high),
+                                        ((values >= low) & (values < high)).mean(axis=1), atol=1e-4), (low, high))
+
+    def test_fraction_variance(self):
+        self.assertTrue(np.allclose(fraction_variance(_table(SettingDistribution(1.25, 0.0, "uniform"),
+                                                             SettingDistribution(5.0, 3.0, "uniform"))),
+                                    [0.1875, 1.0 / 6.0], atol=1e-4))
+
+
+class TestClosedForm(unittest.TestCase):
+    standardgen = OrderedDict([("Frequency", SettingDistribution(2.5, 1.0, "uniform")),
+                               ("Size", SettingDistribution(8.0, 4.0, "normal")),
+                               ("Height", SettingDistribution(20.0, 40.0, "uniform"))])
+    cloud = OrderedDict([("DistributionFrequency", SettingDistribution(0.3, 0.1, "normal")),
+                         ("CloudRadius", SettingDistribution(6.0, 2.0, "uniform")),
+                         ("CloudThickness", SettingDistribution(2.0, 0.5, "normal")),
+                         ("OreDensity", SettingDistribution(0.5, 0.0, "uniform")),
+                         ("OreVolumeNoiseCutoff", SettingDistribution(0.4, 0.1, "uniform"))])
+
+    def check(self, kind, settings):
+        columns = {name: SettingTable.from_settings(OrderedDict([(name, setting)]))
+                   for name, setting in settings.items()}
+        (mean,), (variance,) = closed_form(kind, columns)
+        ores = simulate(kind, settings, 400000, seed=1)
+        self.assertLess(abs(ores.mean() - mean), check_tolerance * math.sqrt(variance / len(ores)))
+        self.assertAlmostEqual(ores.var() / variance, 1.0, delta=0.03)
+        return mean
+
+    def test_matches_simulation(self):
+        # A quarter of the heights, (0 - -20) / 80, are below 0, so 3 / 4 of the clusters count.
+        self.assertAlmostEqual(self.check("StandardGen", self.standardgen), 2.5 * 0.5 * 8.0 * 0.75)
+        self.check("Cloud", self.cloud)
+
+    def test_without_spread(self):
+        settings = OrderedDict((name, setting._replace(range=0.0)) for name, setting in self.cloud.items())
+        columns = {name: SettingTable.from_settings(OrderedDict([(name, setting)]))
+                   for name, setting in settings.items()}
+        (mean,), (variance,) = closed_form("Cloud", columns)
+        volume = 4.0 / 3.0 * math.pi * 6.0 ** 2 * 2.0 * 0.5 * 0.4
+        self.assertAlmostEqual(mean, 0.3 * volume)
+        self.assertAlmostEqual(variance, 0.3 * 0.7 * volume ** 2)
+
+    def test_vectorised(self):
+        settings_list = [self.standardgen,
+                         OrderedDict(self.standardgen, Frequency=SettingDistribution(5.0, 0.0, "uniform"))]
+        columns = {name: SettingTable.from_column(settings_list, name) for name in standardgen_settings}
+        means, variances = closed_form("StandardGen", columns, {"dimension.height": 40.0})
+        self.assertEqual(means.shape, (2,))
+        self.assertAlmostEqual(means[1] / means[0], 2.0)
+
+    def test_workbooks(self):
+        path = "Sprocket2 Spreadsheet.xlsx"
+        estimates, skipped = estimate_tables(path, iter_workbook_tables(openpyxl.load_workbook(path)))
+        preset = next(estimate for estimate in estimates if estimate.name == "PresetStandardGen")
+        # 20 clusters of 8 blocks, half of them ore, at heights from 0 to 128.
+        self.assertEqual((preset.kind, preset.cell), ("StandardGen", "StandardGen!A9:AE9"))
+        self.assertAlmostEqual(preset.mean, 80.0)
+        self.assertAlmostEqual(preset.variance, 0.0)
+
+        path = "Ore Amount Calculation Assistant.xlsx"
+        checks, skipped = cross_check_tables(path, iter_workbook_tables(openpyxl.load_workbook(path)), 20000)
+        self.assertEqual(sorted(check.estimate.name for check in checks), ["PresetStrategicCloud", "PresetStratum"])
+        for check in checks:
+            self.assertLessEqual(abs(standard_errors(check)), check_tolerance, format_check(check))
+        stratum = next(check.estimate for check in checks if check.estimate.name == "PresetStratum")
+        # Above the Assistant's 0.01 * 4/3 pi 16^2 * 1 = 10.7, because E[radius^2] > 16^2.
+        self.assertGreater(stratum.mean, 0.01 * 4.0 / 3.0 * math.pi * 16 ** 2)
+
+    def test_rows(self):
+        location = TableLocation("Clouds", 1, 1, ("Type", "name", "DistributionFrequency_avg", "CloudRadius_avg"))
+        rows = [{"Type": "Distribution", "name": "Broken", "DistributionFrequency_avg": "1"},
+                {"Type": "Distribution", "name": "Off", "OFF?": "OFF"},
+                {"Type": "Distribution", "name": "Ok", "DistributionFrequency_avg": "1", "CloudRadius_avg": "2",
+                 "CloudThickness_avg": "1"}]
+        estimates, skipped = estimate_tables("a.xlsx", [("Cloud_Presets", rows, location)])
+        self.assertEqual([estimate.name for estimate in estimates], ["Ok"])
+        self.assertEqual(skipped, [("Clouds!A2:D2", "Broken", "CloudRadius_avg is blank.")])
+        self.assertEqual(_parameter_range("σ=8"), (8 * normal_spread, "normal"))
+        self.assertEqual(_parameter_range("σ = 8"), (8 * normal_spread, "normal"))
+        self.assertEqual(_parameter_range("±0.5"), (0.5, "uniform"))
+
+    def test_bad_preset_parameters(self):
+        location = TableLocation("Preset Parameters", 1, 1, ("Preset", "Param 1 Name", "Param 1 Avg"))
+        rows = [{"Preset": "Odd", "Param 1 Name": "DistributionFrequency", "Param 1 Avg": 0.01,
+                 "Param 1 Range": "±0.5 blocks", "Param 2 Name": "CloudRadius", "Param 2 Avg": 16,
+                 "Param 3 Name": "CloudThickness", "Param 3 Avg": 1},
+                {"Preset": "Fine", "Param 1 Name": "DistributionFrequency", "Param 1 Avg": 0.01,
+                 "Param 2 Name": "CloudRadius", "Param 2 Avg": 16, "Param 2 Range": "σ = 8",
+                 "Param 3 Name": "CloudThickness", "Param 3 Avg": 1},
+                {"Preset": "Veins", "Param 1 Name": "MotherlodeFrequency", "Param 1 Avg": 1}]
+        checks, skipped = cross_check_tables("a.xlsx", [(preset_parameters_table, rows, location)], 1000)
+        self.assertEqual([check.estimate.name for check in checks], ["Fine"])
+        self.assertEqual([(cell, name) for cell, name, reason in skipped], [("Preset Parameters!A2:C2", "Odd")])
+        self.assertIn("±0.5 blocks", skipped[0][2])
+
+
+if __name__ == '__main__':
+    main()
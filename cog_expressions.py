@@ -0,0 +1,917 @@
+import math
+import re
+import unittest
+from collections import OrderedDict, namedtuple
+from decimal import Decimal
+from functools import reduce
+
+import numpy as np
+
+# Parses and evaluates the ":=" expressions COG accepts in setting values, such as
+#
+#   := 8 * oreSize
+#   := 64/64 * dimension.groundLevel
+#   := max(4, 0.5 * oreFreq)
+#
+# Each distinct expression is parsed once into an AST, and the AST is compiled into a Python function once. Both are
+# cached by source text, so evaluating the same cell again for other bindings only calls the compiled function.
+#
+# compile_expression(":= 8 * oreSize")({"oreSize": 2})  -> 16.0
+# setting_value(":= 32/64 * dimension.groundLevel")     -> 32.0, with default_bindings
+#
+# The grammar, from lowest to highest precedence:
+#
+#   condition ? a : b
+#   a | b                   logical or
+#   a & b                   logical and
+#   a = b, a != b, a < b, a <= b, a > b, a >= b
+#   a + b, a - b
+#   a * b, a / b, a % b
+#   -a, +a, !a
+#   a ^ b                   power, right associative, so -2^2 is -(2^2)
+#   number, name, name(arguments), (expression)
+#
+# Names may be dotted (dimension.groundLevel). Comparisons and logical operators give 1.0 or 0.0. As in Java, a % b
+# takes the sign of a (-7 % 3 is -1), and round() rounds halves up (round(-2.5) is -2).
+
+# The bindings used when nothing else is given: a normal overworld, with COG's ore size and frequency multipliers at 1.
+default_bindings = {
+    "oreSize": 1.0,
+    "oreFreq": 1.0,
+    "dimension.groundLevel": 64.0,
+    "dimension.height": 256.0,
+}
+
+Number = namedtuple("Number", "value")
+Name = namedtuple("Name", "name")
+Unary = namedtuple("Unary", "op operand")
+Binary = namedtuple("Binary", "op left right")
+Conditional = namedtuple("Conditional", "test then otherwise")
+Call = namedtuple("Call", "function args")
+
+
+class ExpressionError(ValueError):
+    # Raised for expressions that don't parse, and for evaluating with names that aren't bound.
+    # position is the offset into the expression, after its ":=", or None.
+    def __init__(self, message, source=None, position=None):
+        super().__init__(message)
+        self.source = source
+        self.position = position
+
+
+_token_pattern = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+      | (?P<op><=|>=|==|!=|[-+*/%^()<>=!&|?:,])
+    )""", re.VERBOSE)
+
+_comparison_operators = ("=", "==", "!=", "<", "<=", ">", ">=")
+_additive_operators = ("+", "-")
+_multiplicative_operators = ("*", "/", "%")
+
+
+def _tokenize(source):
+    # Returns a list of (kind, text, position), ending with ("end", "", len(source)).
+    tokens = []
+    position = 0
+    while True:
+        while position < len(source) and source[position].isspace():
+            position += 1
+        if position == len(source):
+            break
+        match = _token_pattern.match(source, position)
+        if match is None:
+            raise ExpressionError("Unexpected character %r in expression %r." % (source[position], source),
+                                  source, position)
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind), match.start(kind)))
+        position = match.end()
+    tokens.append(("end", "", len(source)))
+    return tokens
+
+
+class _Parser:
+    # A recursive descent parser over the token list, one method per precedence level.
+
+    def __init__(self, source):
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def take(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def error(self, message, token=None):
+        kind, text, position = token or self.peek()
+        found = "the end" if kind == "end" else repr(text)
+        return ExpressionError("%s, found %s at position %d of %r." % (message, found, position, self.source),
+                               self.source, position)
+
+    def accept(self, *operators):
+        kind, text, position = self.peek()
+        if kind == "op" and text in operators:
+            self.index += 1
+            return text
+        return None
+
+    def expect(self, operator):
+        if self.accept(operator) is None:
+            raise self.error("Expected %r" % operator)
+
+    def parse(self):
+        node = self.conditional()
+        if self.peek()[0] != "end":
+            raise self.error("Expected an operator")
+        return node
+
+    def conditional(self):
+        test = self.logical_or()
+        if self.accept("?"):
+            then = self.conditional()
+            self.expect(":")
+            otherwise = self.conditional()
+            return Conditional(test, then, otherwise)
+        return test
+
+    def _left_associative(self, operand, operators):
+        node = operand()
+        while True:
+            op = self.accept(*operators)
+            if op is None:
+                return node
+            node = Binary("=" if op == "==" else op, node, operand())
+
+    def logical_or(self):
+        return self._left_associative(self.logical_and, ("|",))
+
+    def logical_and(self):
+        return self._left_associative(self.comparison, ("&",))
+
+    def comparison(self):
+        return self._left_associative(self.additive, _comparison_operators)
+
+    def additive(self):
+        return self._left_associative(self.multiplicative, _additive_operators)
+
+    def multiplicative(self):
+        return self._left_associative(self.unary, _multiplicative_operators)
+
+    def unary(self):
+        op = self.accept("-", "+", "!")
+        if op is not None:
+            return Unary(op, self.unary())
+        return self.power()
+
+    def power(self):
+        base = self.primary()
+        if self.accept("^"):
+            return Binary("^", base, self.unary())
+        return base
+
+    def primary(self):
+        kind, text, position = self.take()
+        if kind == "number":
+            return Number(float(text))
+        if kind == "name":
+            if self.accept("("):
+                args = []
+                if not self.accept(")"):
+                    args.append(self.conditional())
+                    while self.accept(","):
+                        args.append(self.conditional())
+                    self.expect(")")
+                if text not in _scalar_functions:
+                    raise ExpressionError("Unknown function %r in expression %r." % (text, self.source),
+                                          self.source, position)
+                fewest, most = _function_arguments[text]
+                if len(args) < fewest or (most is not None and len(args) > most):
+                    raise ExpressionError("%s() takes %s argument%s, not %d, in expression %r." % (
+                        text, fewest if fewest == most else "%d or more" % fewest if most is None else
+                        "%d to %d" % (fewest, most), "" if fewest == most == 1 else "s", len(args), self.source),
+                        self.source, position)
+                return Call(text, tuple(args))
+            return Name(text)
+        if kind == "op" and text == "(":
+            node = self.conditional()
+            self.expect(")")
+            return node
+        raise self.error("Expected a number, name or '('", (kind, text, position))
+
+
+_parse_cache = {}
+
+
+def _strip(source: str) -> str:
+    source = source.strip()
+    if source.startswith(":="):
+        source = source[2:]
+    return source.strip()
+
+
+def parse(source: str):
+    # Parses an expression, with or without its leading ":=", into an AST of Number, Name, Unary, Binary,
+    # Conditional and Call tuples. Raises ExpressionError. Results are cached by source text.
+    node = _parse_cache.get(source)
+    if node is None:
+        node = _Parser(_strip(source)).parse()
+        _parse_cache[source] = node
+    return node
+
+
+def names(node) -> frozenset:
+    # The names an AST refers to.
+    if isinstance(node, Name):
+        return frozenset((node.name,))
+    if isinstance(node, Number):
+        return frozenset()
+    if isinstance(node, Call):
+        children = node.args
+    elif isinstance(node, Unary):
+        children = (node.operand,)
+    elif isinstance(node, Binary):
+        children = (node.left, node.right)
+    else:
+        children = node
+    return frozenset().union(*(names(child) for child in children))
+
+
+# The functions compiled code calls. Operators that Python spells differently, or that give a truth value, go
+# through these too, so that the same AST can be compiled against another namespace.
+_scalar_functions = {
+    "min": min,
+    "max": max,
+    "abs": abs,
+    "sqrt": math.sqrt,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "round": lambda x, digits=0: math.floor(x * 10.0 ** digits + 0.5) / 10.0 ** digits,
+    "exp": math.exp,
+    "log": math.log,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "pow": math.pow,
+}
+
+# (fewest, most) arguments of each function; None is no limit.
+_function_arguments = {
+    "min": (1, None),
+    "max": (1, None),
+    "abs": (1, 1),
+    "sqrt": (1, 1),
+    "floor": (1, 1),
+    "ceil": (1, 1),
+    "round": (1, 2),
+    "exp": (1, 1),
+    "log": (1, 2),
+    "sin": (1, 1),
+    "cos": (1, 1),
+    "tan": (1, 1),
+    "pow": (2, 2),
+}
+
+_scalar_operators = {
+    "_pow": lambda a, b: a ** b,
+    "_mod": math.fmod,
+    "_not": lambda a: 0.0 if a else 1.0,
+    "_and": lambda a, b: 1.0 if a and b else 0.0,
+    "_or": lambda a, b: 1.0 if a or b else 0.0,
+    "_if": lambda test, then, otherwise: then if test else otherwise,
+    "_eq": lambda a, b: 1.0 if a == b else 0.0,
+    "_ne": lambda a, b: 1.0 if a != b else 0.0,
+    "_lt": lambda a, b: 1.0 if a < b else 0.0,
+    "_le": lambda a, b: 1.0 if a <= b else 0.0,
+    "_gt": lambda a, b: 1.0 if a > b else 0.0,
+    "_ge": lambda a, b: 1.0 if a >= b else 0.0,
+}
+
+# The same for NumPy arrays, so that one call evaluates an expression for a whole array of bindings.
+_vector_functions = {
+    "min": lambda *args: reduce(np.minimum, args),
+    "max": lambda *args: reduce(np.maximum, args),
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "round": lambda x, digits=0: np.floor(x * np.power(10.0, digits) + 0.5) / np.power(10.0, digits),
+    "exp": np.exp,
+    "log": lambda x, base=None: np.log(x) if base is None else np.log(x) / np.log(base),  # np.log's 2nd is out.
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "pow": np.power,
+}
+
+_vector_operators = {
+    "_pow": np.power,
+    "_mod": np.fmod,
+    "_not": lambda a: np.equal(a, 0).astype(float),
+    "_and": lambda a, b: np.logical_and(a, b).astype(float),
+    "_or": lambda a, b: np.logical_or(a, b).astype(float),
+    "_if": lambda test, then, otherwise: np.where(test, then, otherwise),
+    "_eq": lambda a, b: np.equal(a, b).astype(float),
+    "_ne": lambda a, b: np.not_equal(a, b).astype(float),
+    "_lt": lambda a, b: np.less(a, b).astype(float),
+    "_le": lambda a, b: np.less_equal(a, b).astype(float),
+    "_gt": lambda a, b: np.greater(a, b).astype(float),
+    "_ge": lambda a, b: np.greater_equal(a, b).astype(float),
+}
+
+_operator_functions = {"^": "_pow", "%": "_mod", "&": "_and", "|": "_or", "=": "_eq", "!=": "_ne", "<": "_lt",
+                       "<=": "_le", ">": "_gt", ">=": "_ge"}
+
+
+def _python_source(node) -> str:
+    # Python source for an AST. Names are looked up in the bindings dictionary b.
+    if isinstance(node, Number):
+        # repr() gives inf and nan for folded constants that overflow, which aren't Python names.
+        return repr(node.value) if math.isfinite(node.value) else "float('%r')" % node.value
+    if isinstance(node, Name):
+        return "b[%r]" % node.name
+    if isinstance(node, Unary):
+        if node.op == "!":
+            return "_not(%s)" % _python_source(node.operand)
+        return "(%s%s)" % (node.op, _python_source(node.operand))
+    if isinstance(node, Binary):
+        left, right = _python_source(node.left), _python_source(node.right)
+        if node.op in _operator_functions:
+            return "%s(%s, %s)" % (_operator_functions[node.op], left, right)
+        return "(%s %s %s)" % (left, node.op, right)
+    if isinstance(node, Conditional):
+        return "_if(%s, %s, %s)" % tuple(_python_source(child) for child in node)
+    if isinstance(node, Call):
+        return "%s(%s)" % (node.function, ", ".join(_python_source(arg) for arg in node.args))
+    raise TypeError("Not an expression node: %r" % (node,))
+
+
+def compile_ast(node, namespace):
+    # Compiles an AST into a function of one argument, the bindings dictionary. namespace supplies the functions and
+    # operator helpers (see _scalar_functions and _scalar_operators).
+    code = compile("lambda b: %s" % _python_source(node), "<cog expression>", "eval")
+    return eval(code, dict(namespace))
+
+
+class CompiledExpression:
+    def __init__(self, source: str):
+        self.source = source
+        self.ast = parse(source)
+        self.names = names(self.ast)
+        self._function = compile_ast(self.ast, _scalar_namespace)
+        self._vector_function = None
+
+    def __call__(self, bindings=None) -> float:
+        # Evaluates the expression. Names missing from bindings are looked up in default_bindings.
+        if bindings is None:
+            bindings = default_bindings
+        elif not self.names <= bindings.keys():
+            bindings = dict(default_bindings, **bindings)
+        try:
+            value = self._function(bindings)
+        except KeyError as e:
+            raise ExpressionError("%r is not bound in expression %r." % (e.args[0], self.source), self.source) \
+                from None
+        except (ArithmeticError, ValueError, TypeError, NameError) as e:
+            # TypeError is i.e. comparing a complex number, from a fractional power of a negative one.
+            raise ExpressionError("Can't evaluate %r: %s." % (self.source, e), self.source) from None
+        if isinstance(value, complex):
+            raise ExpressionError("Can't evaluate %r: %r is not a real number." % (self.source, value), self.source)
+        return float(value)
+
+    def evaluate_arrays(self, bindings, shape=()) -> np.ndarray:
+        # Evaluates the expression for arrays of bindings, i.e. {"dimension.groundLevel": np.array([64, 4, 32])}.
+        # The bindings must broadcast together; the result is broadcast to shape as well. Invalid results (i.e. a
+        # division by zero) come out as inf or nan rather than raising.
+        if self._vector_function is None:
+            self._vector_function = compile_ast(self.ast, _vector_namespace)
+        try:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                result = self._vector_function(bindings)
+            return np.broadcast_to(np.asarray(result, dtype=float), shape)
+        except KeyError as e:
+            raise ExpressionError("%r is not bound in expression %r." % (e.args[0], self.source), self.source) \
+                from None
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise ExpressionError("Can't evaluate %r: %s." % (self.source, e), self.source) from None
+
+    def __repr__(self):
+        return "CompiledExpression(%r)" % self.source
+
+
+_scalar_namespace = dict(_scalar_functions, **_scalar_operators)
+_vector_namespace = dict(_vector_functions, **_vector_operators)
+_compiled_cache = {}
+
+
+def compile_expression(source: str) -> CompiledExpression:
+    # Cached by source text. Raises ExpressionError if source doesn't parse.
+    compiled = _compiled_cache.get(source)
+    if compiled is None:
+        compiled = CompiledExpression(source)
+        _compiled_cache[source] = compiled
+    return compiled
+
+
+def is_expression(value) -> bool:
+    return isinstance(value, str) and value.lstrip().startswith(":=")
+
+
+def setting_value(value, bindings=None):
+    # The number a setting cell stands for: None for a blank cell, the number itself, or the value of a ":="
+    # expression for the given bindings. Raises ExpressionError for expressions that can't be evaluated, and
+    # ValueError for text that is neither.
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if is_expression(value):
+        return compile_expression(value)(bindings)
+    return float(value)
+
+
+def _evaluate_constant(node):
+    # The value of an AST without names, or None if it can't be evaluated (i.e. a division by zero, or a fractional
+    # power of a negative number, which float() rejects with TypeError) or isn't finite, which has no source text.
+    try:
+        value = float(compile_ast(node, _scalar_namespace)({}))
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _is_finite(node) -> bool:
+    # Whether every number in an AST is finite. A literal such as 1e400 parses to inf.
+    if isinstance(node, Number):
+        return math.isfinite(node.value)
+    if isinstance(node, Name):
+        return True
+    return all(_is_finite(child) for child in (node.args if isinstance(node, Call) else node[1:]
+                                                 if isinstance(node, (Unary, Binary)) else node))
+
+
+def _folded(node, *children):
+    # Node rebuilt from already folded children, evaluated if they are all constants.
+    if all(isinstance(child, Number) for child in children):
+        value = _evaluate_constant(node)
+        if value is not None:
+            return Number(value)
+    return node
+
+
+def _product_factors(node, numerator, factors):
+    # Flattens a chain of * and / into (factor, is_numerator) pairs. a / (b * c) is a * 1/b * 1/c.
+    if isinstance(node, Binary) and node.op in ("*", "/"):
+        _product_factors(node.left, numerator, factors)
+        _product_factors(node.right, numerator if node.op == "*" else not numerator, factors)
+    else:
+        factors.append((fold(node), numerator))
+
+
+def _fold_product(node):
+    factors = []
+    _product_factors(node, True, factors)
+
+    coefficient = 1.0
+    numerators, denominators = [], []
+    for factor, numerator in factors:
+        if isinstance(factor, Unary) and factor.op == "-":
+            coefficient = -coefficient
+            factor = factor.operand
+        if isinstance(factor, Number):
+            if numerator:
+                coefficient *= factor.value
+            elif factor.value == 0:
+                return node  # Leave divisions by zero for COG to complain about.
+            else:
+                coefficient /= factor.value
+        else:
+            (numerators if numerator else denominators).append(factor)
+
+    if not math.isfinite(coefficient):
+        return node  # inf has no source text; 1e400 * x stays as written.
+    if coefficient == 0 and not denominators:
+        return Number(0.0)
+    if not numerators:
+        product = Number(coefficient)
+    else:
+        product = numerators[0]
+        for factor in numerators[1:]:
+            product = Binary("*", product, factor)
+        if coefficient == -1:
+            product = Unary("-", product)
+        elif coefficient != 1:
+            product = Binary("*", Number(coefficient), product)
+    for factor in denominators:
+        product = Binary("/", product, factor)
+    return product
+
+
+def fold(node):
+    # Returns an equivalent AST with constant subexpressions evaluated, constant factors of a product collected
+    # into one coefficient, and identities such as 1 * x, x + 0 and x ^ 1 removed.
+    if isinstance(node, (Number, Name)):
+        return node
+    if isinstance(node, Unary):
+        operand = fold(node.operand)
+        if node.op == "+":
+            return operand
+        if node.op == "-" and isinstance(operand, Unary) and operand.op == "-":
+            return operand.operand
+        return _folded(Unary(node.op, operand), operand)
+    if isinstance(node, Binary):
+        if node.op in ("*", "/"):
+            return _fold_product(node)
+        left, right = fold(node.left), fold(node.right)
+        zero, one = Number(0.0), Number(1.0)
+        if node.op == "+" and left == zero:
+            return right
+        if node.op in ("+", "-") and right == zero:
+            return left
+        if node.op == "-" and left == zero:
+            return fold(Unary("-", right))
+        if node.op == "^" and right == one:
+            return left
+        if node.op == "^" and right == zero:
+            return one
+        return _folded(Binary(node.op, left, right), left, right)
+    if isinstance(node, Conditional):
+        test = fold(node.test)
+        if isinstance(test, Number):
+            return fold(node.then if test.value else node.otherwise)
+        return Conditional(test, fold(node.then), fold(node.otherwise))
+    if isinstance(node, Call):
+        args = tuple(fold(arg) for arg in node.args)
+        return _folded(Call(node.function, args), *args)
+    raise TypeError("Not an expression node: %r" % (node,))
+
+
+_precedence = {"?": 1, "|": 2, "&": 3, "=": 4, "!=": 4, "<": 4, "<=": 4, ">": 4, ">=": 4, "+": 5, "-": 5, "*": 6,
+               "/": 6, "%": 6, "^": 8}
+_unary_precedence = 7
+_atom_precedence = 9
+
+
+def _node_precedence(node):
+    if isinstance(node, Number):
+        return _unary_precedence if node.value < 0 else _atom_precedence
+    if isinstance(node, Unary):
+        return _unary_precedence
+    if isinstance(node, Binary):
+        return _precedence[node.op]
+    if isinstance(node, Conditional):
+        return _precedence["?"]
+    return _atom_precedence
+
+
+def format_number(value: float) -> str:
+    # The shortest decimal text for value, to 15 significant digits, and without an exponent.
+    # 64.0 -> "64", 0.46875 -> "0.46875", 0.1 * 3 -> "0.3", 1e-05 -> "0.00001"
+    if value == 0:
+        return "0"
+    text = "%.15g" % value
+    if "e" in text:
+        text = format(Decimal(text), "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
+def format_expression(node) -> str:
+    # Source text for an AST, with no spaces and only the brackets the grammar needs.
+    def wrap(child, needs_brackets):
+        text = format_expression(child)
+        return "(%s)" % text if needs_brackets else text
+
+    if isinstance(node, Number):
+        return format_number(node.value)
+    if isinstance(node, Name):
+        return node.name
+    if isinstance(node, Call):
+        return "%s(%s)" % (node.function, ",".join(format_expression(arg) for arg in node.args))
+    if isinstance(node, Unary):
+        return node.op + wrap(node.operand, _node_precedence(node.operand) < _unary_precedence)
+    if isinstance(node, Binary):
+        precedence = _precedence[node.op]
+        if node.op == "^":
+            # Right associative, and the exponent may be a unary minus: (-2)^x, 2^-x.
+            return wrap(node.left, _node_precedence(node.left) <= precedence) + "^" + \
+                wrap(node.right, _node_precedence(node.right) < _unary_precedence)
+        return wrap(node.left, _node_precedence(node.left) < precedence) + node.op + \
+            wrap(node.right, _node_precedence(node.right) <= precedence)
+    if isinstance(node, Conditional):
+        return "%s?%s:%s" % (wrap(node.test, _node_precedence(node.test) <= _precedence["?"]),
+                             format_expression(node.then), format_expression(node.otherwise))
+    raise TypeError("Not an expression node: %r" % (node,))
+
+
+_canonical_cache = {}
+
+
+def canonical(source: str) -> str:
+    # The folded, canonical form of a ":=" setting value: just the number if the whole expression is constant,
+    # otherwise ":= " and the shortest source text of the folded AST.
+    #
+    # canonical(":= 64/64 * dimension.groundLevel") -> ":= dimension.groundLevel"
+    # canonical(":= 30 * dimension.groundLevel/64") -> ":= 0.46875*dimension.groundLevel"
+    # canonical(":= 8 * 2")                         -> "16"
+    #
+    # Equivalent spellings come out as the same string (the same object, even), so they are only folded once.
+    # Expressions with a number too large for a float (i.e. 1e400) are returned as they are.
+    # Raises ExpressionError if source doesn't parse.
+    result = _canonical_cache.get(source)
+    if result is None:
+        node = fold(parse(source))
+        if not _is_finite(node):
+            _canonical_cache[source] = source
+            return source
+        text = format_number(node.value) if isinstance(node, Number) else ":= " + format_expression(node)
+        result = _canonical_cache.setdefault(text, text)
+        _canonical_cache[source] = result
+    return result
+
+
+# Bindings for the dimensions previews are usually run for. dimension.groundLevel is what COG gets from the world
+# provider: sea level + 1 in a normal or amplified overworld, 4 on a superflat world. The Nether values are rough.
+dimension_profiles = OrderedDict([
+    ("overworld", {"dimension.groundLevel": 64.0, "dimension.height": 256.0}),
+    ("superflat", {"dimension.groundLevel": 4.0, "dimension.height": 256.0}),
+    ("nether", {"dimension.groundLevel": 32.0, "dimension.height": 128.0}),
+])
+
+
+def profile_bindings(profiles) -> dict:
+    # Turns a list of P binding dictionaries into one dictionary of arrays of shape (P,), with default_bindings
+    # filling in the names a profile doesn't set. Names no profile or default sets are nan where missing.
+    keys = set(default_bindings).union(*profiles)
+    return {key: np.array([profile.get(key, default_bindings.get(key, np.nan)) for profile in profiles], dtype=float)
+            for key in keys}
+
+
+# Numbers in expression source, but not the digits of a name such as "ore2".
+_number_pattern = re.compile(r"(?<![\w.])(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_template_cache = {}
+
+
+def _template(source: str):
+    # Splits an expression into a template with its numbers replaced by parameters, and the numbers:
+    # ":= 2.5 * oreSize + 1" -> (":= __c0 * oreSize + __c1", (2.5, 1.0)).
+    # Cells that only differ in their constants share a template, and so one compiled function. Cached.
+    result = _template_cache.get(source)
+    if result is None:
+        constants = []
+
+        def parameter(match):
+            constants.append(float(match.group()))
+            return "__c%d" % (len(constants) - 1)
+
+        result = (_number_pattern.sub(parameter, source), tuple(constants))
+        _template_cache[source] = result
+    return result
+
+
+def evaluate_column(values, profiles) -> np.ndarray:
+    # Evaluates a column of setting cells for every profile at once.
+    #
+    # values is a sequence of N cells: blanks, numbers, numeric text or ":=" expressions. profiles is a list of P
+    # binding dictionaries, i.e. list(dimension_profiles.values()).
+    # Returns an array of shape (P, N). Blank cells, and cells that can't be evaluated, are nan.
+    #
+    # Numbers are written into the result in one assignment. Expressions are grouped by template (their source with
+    # the numbers taken out), so ":= 2.5 * oreSize" and ":= 8 * oreSize" are one group. Each group is evaluated with
+    # one call of its compiled function, over an array of shape (P, rows in the group): the profile bindings vary
+    # along the first axis, and each row's constants along the second.
+    profiles = list(profiles)
+    result = np.full((len(profiles), len(values)), np.nan)
+    bindings = {name: array[:, np.newaxis] for name, array in profile_bindings(profiles).items()}
+
+    # This loop runs once per cell, so it avoids function calls where it can.
+    constant_rows, constants = [], []
+    groups = {}  # template -> (rows, constants of each row)
+    templates = _template_cache
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        if value.__class__ is str and value.lstrip().startswith(":="):
+            template, template_constants = templates.get(value) or _template(value)
+            group = groups.get(template)
+            if group is None:
+                group = groups[template] = ([], [])
+            group[0].append(row)
+            group[1].append(template_constants)
+            continue
+        try:
+            constants.append(float(value))
+        except (TypeError, ValueError):  # i.e. text, or a date.
+            continue
+        constant_rows.append(row)
+    result[:, constant_rows] = constants
+
+    for template, (rows, row_constants) in groups.items():
+        try:
+            compiled = compile_expression(template)
+        except ExpressionError:
+            continue
+        parameters = np.array(row_constants, dtype=float).reshape(len(rows), -1)
+        group_bindings = dict(bindings)
+        for i in range(parameters.shape[1]):
+            group_bindings["__c%d" % i] = parameters[:, i]
+        try:
+            result[:, rows] = compiled.evaluate_arrays(group_bindings, (len(profiles), len(rows)))
+        except ExpressionError:
+            continue
+    return result
+
+
+def evaluate_settings(rows, setting_names, profiles, attributes=("avg", "range")):
+    # Evaluates the settings of many rows (i.e. 10k Veins rows, for its 16 settings) for every profile.
+    # Returns {(setting_name, attribute): array of shape (P, N)}, i.e. {("MotherlodeHeight", "avg"): ...}.
+    rows = list(rows)
+    profiles = list(profiles)
+    return OrderedDict(((setting, attribute),
+                        evaluate_column([row.get(setting + "_" + attribute) for row in rows], profiles))
+                       for setting in setting_names for attribute in attributes)
+
+
+class TestParse(unittest.TestCase):
+    def test_precedence(self):
+        self.assertEqual(parse(":= 1 + 2 * 3"), Binary("+", Number(1.0), Binary("*", Number(2.0), Number(3.0))))
+        self.assertEqual(parse("-2^2"), Unary("-", Binary("^", Number(2.0), Number(2.0))))
+        self.assertEqual(parse("2^3^2"), Binary("^", Number(2.0), Binary("^", Number(3.0), Number(2.0))))
+        self.assertEqual(parse("64/64 * dimension.groundLevel"),
+                         Binary("*", Binary("/", Number(64.0), Number(64.0)), Name("dimension.groundLevel")))
+
+    def test_names(self):
+        self.assertEqual(names(parse(":= max(oreSize, 2) * dimension.groundLevel")),
+                         {"oreSize", "dimension.groundLevel"})
+
+    def test_errors(self):
+        for source in (":= 1.5 * oreSize'", ":= (8 / 64 * oreSize", ":= 8 *", ":= 8 oreSize", ":= nope(1)", "",
+                       ":= min()", ":= sqrt(1, 2)", ":= pow(2)"):
+            with self.assertRaises(ExpressionError):
+                parse(source)
+        with self.assertRaises(ExpressionError) as context:
+            parse(":= 1.5 * oreSize'")
+        self.assertEqual(context.exception.position, 13)  # Counted from after the ":=".
+
+    def test_cached(self):
+        self.assertIs(parse(":= 8 * oreSize"), parse(":= 8 * oreSize"))
+        self.assertIs(compile_expression(":= 8 * oreSize"), compile_expression(":= 8 * oreSize"))
+
+
+class TestEvaluate(unittest.TestCase):
+    def test_sheet_expressions(self):
+        self.assertEqual(compile_expression(":= 8 * oreSize")({"oreSize": 2}), 16.0)
+        self.assertEqual(compile_expression(":= 20 * oreFreq")(), 20.0)
+        self.assertEqual(compile_expression(":= 48/64 * dimension.groundLevel")({"dimension.groundLevel": 128}), 96.0)
+        self.assertEqual(compile_expression(":= 30 * dimension.groundLevel/64")(), 30.0)
+
+    def test_operators(self):
+        evaluate = lambda source, **bindings: compile_expression(source)(bindings)
+        self.assertEqual(evaluate("7 % 4 + 2^3"), 11.0)
+        self.assertEqual(evaluate("x > 1 & x <= 3", x=2), 1.0)
+        self.assertEqual(evaluate("!(x = 2) | 0", x=2), 0.0)
+        self.assertEqual(evaluate("x < 0 ? -x : x", x=-5), 5.0)
+        self.assertEqual(evaluate("min(3, max(x, 1))", x=10), 3.0)
+
+    def test_java_semantics(self):
+        evaluate = lambda source: compile_expression(source)()
+        self.assertEqual(evaluate("-7 % 3"), -1.0)
+        self.assertEqual(evaluate("7 % -3"), 1.0)
+        self.assertEqual(evaluate("round(2.5)"), 3.0)
+        self.assertEqual(evaluate("round(-2.5)"), -2.0)
+        self.assertEqual(evaluate("round(1.25, 1)"), 1.3)
+        self.assertEqual(canonical(":= -7 % 3 * oreSize"), ":= -oreSize")
+
+    def test_errors(self):
+        with self.assertRaises(ExpressionError):
+            compile_expression(":= 8 * _default_")()
+        with self.assertRaises(ExpressionError):
+            compile_expression(":= 1 / oreSize")({"oreSize": 0})
+        for source in (":= (dimension.groundLevel - 80)^0.5", ":= (-8)^(1/3)", ":= min((-8)^0.5, 1)"):
+            with self.assertRaises(ExpressionError):
+                compile_expression(source)()
+
+    def test_non_finite_constants(self):
+        self.assertEqual(compile_ast(Number(math.inf), _scalar_namespace)({}), math.inf)
+        self.assertTrue(math.isnan(compile_ast(Unary("-", Number(math.nan)), _scalar_namespace)({})))
+        with self.assertRaises(ExpressionError):
+            compile_expression(":= floor(1e400)")()
+
+    def test_setting_value(self):
+        self.assertIsNone(setting_value(None))
+        self.assertEqual(setting_value(3), 3.0)
+        self.assertEqual(setting_value("0.25"), 0.25)
+        self.assertEqual(setting_value(":= 16/64 * dimension.groundLevel"), 16.0)
+        with self.assertRaises(ValueError):
+            setting_value("lots")
+
+
+class TestFold(unittest.TestCase):
+    def test_canonical(self):
+        self.assertEqual(canonical(":= 64/64 * dimension.groundLevel"), ":= dimension.groundLevel")
+        self.assertEqual(canonical(":= 32/64 * dimension.groundLevel"), ":= 0.5*dimension.groundLevel")
+        self.assertEqual(canonical(":= 8 * 2"), "16")
+        self.assertEqual(canonical(":= 1 * oreSize + 0"), ":= oreSize")
+        self.assertEqual(canonical(":= 0.1 * 3 * oreFreq"), ":= 0.3*oreFreq")
+        self.assertEqual(canonical(":= -(-(oreSize ^ 1))"), ":= oreSize")
+        self.assertEqual(canonical(":= (1 > 0) ? oreSize : oreFreq"), ":= oreSize")
+        self.assertEqual(canonical(":= 2 * x / 0"), ":= 2*x/0")
+        self.assertEqual(canonical(":= (0-8)^0.5*oreSize"), ":= (-8)^0.5*oreSize")
+        with self.assertRaises(ExpressionError):
+            canonical(":= min()")
+
+    def test_non_finite_folds(self):
+        for source in (":= 1e400 * x", ":= 0 * 1e400 * x"):
+            self.assertEqual(canonical(source), source)
+        self.assertEqual(canonical(":= x + 10^400"), ":= x+10^400")
+        folded = canonical(":= 1e200 * 1e200 * x")
+        self.assertNotIn("inf", folded)
+        self.assertEqual(compile_expression(folded)({"x": 1}), math.inf)
+        self.assertEqual(canonical(":= x + 10^400 - 10^400 + 2*3"), ":= x+10^400-10^400+6")
+        self.assertEqual(canonical(":= exp(1000) > x ? x : 2"), ":= exp(1000)>x?x:2")
+
+    def test_equivalent_spellings_are_deduplicated(self):
+        first = canonical(":= 30 * dimension.groundLevel/64")
+        self.assertEqual(first, ":= 0.46875*dimension.groundLevel")
+        self.assertIs(canonical(":=30/64*dimension.groundLevel"), first)
+        self.assertIs(canonical(":= dimension.groundLevel * 30 / 64"), first)
+
+    def test_brackets(self):
+        for source, expected in ((":= (a + b) * c", "(a+b)*c"), (":= a - (b - c)", "a-(b-c)"),
+                                 (":= (-a) ^ 2", "(-a)^2"), (":= 2 ^ -a", "2^-a"), (":= a ^ (b ^ c)", "a^b^c"),
+                                 (":= (a ? b : c) ? d : e", "(a?b:c)?d:e"), (":= max(a, 1 + 1)", "max(a,2)")):
+            self.assertEqual(canonical(source), ":= " + expected)
+
+    def test_same_value(self):
+        import random
+        generator = random.Random(3)
+        sources = [":= 48/64 * dimension.groundLevel - 3 * (oreSize - 2) / 4", ":= -oreFreq * -2 / (oreSize * 8)",
+                   ":= 2 ^ -oreSize * 10 % 3", ":= oreSize > 1 ? 8 * 8 : -(4 / 2) * oreFreq",
+                   ":= max(oreSize, 0.25 * 4) + min(1, 2) * dimension.groundLevel"]
+        for source in sources:
+            for i in range(20):
+                bindings = {"oreSize": generator.uniform(0.1, 3), "oreFreq": generator.uniform(0.1, 3),
+                            "dimension.groundLevel": generator.uniform(32, 128)}
+                self.assertAlmostEqual(compile_expression(canonical(source))(bindings),
+                                       compile_expression(source)(bindings), places=9, msg=source)
+
+
+class TestEvaluateColumn(unittest.TestCase):
+    def test_column(self):
+        import datetime
+        values = [None, 3, "0.5", ":= 0.5 * dimension.groundLevel", ":= 32/64*dimension.groundLevel", "lots",
+                  ":= (oops", ":= 8 * _default_", ":= dimension.height - dimension.groundLevel",
+                  datetime.date(2020, 1, 1)]
+        profiles = list(dimension_profiles.values())
+        result = evaluate_column(values, profiles)
+
+        self.assertEqual(result.shape, (3, len(values)))
+        np.testing.assert_array_equal(result[:, 3], [32.0, 2.0, 16.0])
+        np.testing.assert_array_equal(result[:, 4], result[:, 3])
+        np.testing.assert_array_equal(result[:, 1], [3.0, 3.0, 3.0])
+        np.testing.assert_array_equal(result[:, 8], [192.0, 252.0, 96.0])
+        for column in (0, 5, 6, 7, 9):
+            self.assertTrue(np.isnan(result[:, column]).all())
+
+    def test_templates(self):
+        self.assertEqual(_template(":= 2.5e1 * ore2 + .5"), (":= __c0 * ore2 + __c1", (25.0, 0.5)))
+        result = evaluate_column([":= 2 * oreSize", ":= 3 * oreFreq", ":= 4 * oreSize"],
+                                 [{"oreSize": 1.0, "oreFreq": 10.0}, {"oreSize": 2.0, "oreFreq": 20.0}])
+        np.testing.assert_array_equal(result, [[2.0, 30.0, 4.0], [4.0, 60.0, 8.0]])
+
+    def test_function_constants(self):
+        # The template turns the base of log() and the digits of round() into arrays too.
+        sources = [":= log(oreSize, 2)", ":= round(oreSize * 3, 1)", ":= log(oreSize, 10) + round(oreSize, 0)"]
+        profiles = [{"oreSize": 8.0}, {"oreSize": 0.35}]
+        result = evaluate_column(sources, profiles)
+        for column, source in enumerate(sources):
+            for row, profile in enumerate(profiles):
+                self.assertAlmostEqual(result[row, column], compile_expression(source)(profile), places=12, msg=source)
+
+    def test_matches_scalar_evaluation(self):
+        sources = [":= x > 1 & x <= 3 ? min(x, 2) : -x ^ 2", ":= !(x = 2) | 0", ":= max(x, 1, 2.5) % 2 + sqrt(x)",
+                   ":= 2 ^ -x / (x - 2)", ":= (x - 3) % 2 + round(x - 1.5)", ":= log(x, 2) + log(x)",
+                   ":= round(x / 3, 1) + round(x * 2.5)"]
+        xs = np.array([0.5, 1.0, 2.0, 3.0, 4.0])
+        for source in sources:
+            vector = compile_expression(source).evaluate_arrays({"x": xs}, xs.shape)
+            for x, value in zip(xs.tolist(), vector):
+                try:
+                    self.assertEqual(value, compile_expression(source)({"x": x}), source)
+                except ExpressionError:
+                    self.assertFalse(np.isfinite(value), source)  # i.e. a division by zero.
+
+    def test_settings(self):
+        rows = [{"Height_avg": ":= 0.5 * dimension.groundLevel", "Height_range": 4}, {"Height_avg": "10"}]
+        result = evaluate_settings(rows, ["Height"], [dimension_profiles["overworld"], {"dimension.groundLevel": 128}])
+        np.testing.assert_array_equal(result["Height", "avg"], [[32.0, 10.0], [64.0, 10.0]])
+        np.testing.assert_array_equal(result["Height", "range"], [[4.0, np.nan], [4.0, np.nan]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+import argparse
+import heapq
+import re
+import unittest
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+
+import openpyxl
+
+from biome_catalog import BiomeCatalog
+from block_catalog import BlockCatalog, normalize_block_id
+from cog_expressions import setting_value
+from excel_table import TableLocation, iter_workbook_tables
+from presets import PresetResolver
+from setting_sampling import default_branch_height_limit
+from weighted_list import weighted_pair_list_parser
+
+# Finds distributions that replace the same blocks, in the same biomes, at overlapping heights. In COG, whichever
+# generates second overwrites the first, so one of them ends up with less ore than planned.
+#
+# Usage:
+#   python conflicts.py "Sprocket2 Spreadsheet.xlsx" other.xlsx ...
+#
+# Each distribution's effective height band comes from its settings, after filling in what it inherits:
+#   StandardGen: Height avg +- range
+#   Veins:       MotherlodeHeight avg +- range, widened by BranchHeightLimit avg + range for the branches.
+# ":=" expressions are evaluated with cog_expressions.default_bindings (or the bindings given). Settings that still
+# can't be worked out (missing, or an expression using a name that isn't bound) are treated conservatively: the band
+# becomes the whole height of the world, so a possible conflict is reported rather than missed.
+#
+# The bands are put into one IntervalIndex per distinct set of replaced blocks (a ReplacesRegExp such as ".*" can
+# match thousands of blocks, but is one set). Each index is swept once for overlapping pairs, and each pair of sets
+# that share a block is checked with the index's binary search, so the work grows with the number of distributions,
+# sets and overlaps, not with every possible pair.
+
+world_height = 256
+
+# blocks holds the replaced block IDs, plus "ore:<name>" for ore dictionary entries. biomes is a frozenset of biome
+# IDs. exact is False if the height band had to be guessed.
+DistributionSpan = namedtuple("DistributionSpan", "workbook name cell low high exact blocks biomes dimension")
+
+# low and high are where the two bands overlap. blocks and biomes are the ones both distributions have in common.
+Conflict = namedtuple("Conflict", "first second low high blocks biomes")
+
+
+def setting_number(value, bindings=None):
+    # The numeric value of a setting cell, or None if it is blank or can't be evaluated. TypeError is for cells
+    # openpyxl reads as something other than a number or text, i.e. a date.
+    try:
+        return setting_value(value, bindings)
+    except (ValueError, TypeError):
+        return None
+
+
+def _band(row, setting, bindings=None):
+    # (avg - range, avg + range) for a setting, or None if it can't be worked out. A missing range counts as 0.
+    avg = setting_number(row.get(setting + "_avg"), bindings)
+    if avg is None:
+        return None
+    spread = setting_number(row.get(setting + "_range"), bindings) if row.get(setting + "_range") is not None \
+        else 0.0
+    if spread is None:
+        return None
+    return avg - abs(spread), avg + abs(spread)
+
+
+def height_band(row, bindings=None):
+    # Returns (low, high, exact) for a row whose inherited values have already been filled in.
+    if "MotherlodeHeight_avg" in row or "BranchHeightLimit_avg" in row:
+        band = _band(row, "MotherlodeHeight", bindings)
+        if row.get("BranchHeightLimit_avg") is None:
+            branch = (default_branch_height_limit, default_branch_height_limit)
+        else:
+            branch = _band(row, "BranchHeightLimit", bindings)
+        if band is not None and branch is not None:
+            band = band[0] - branch[1], band[1] + branch[1]
+    else:
+        band = _band(row, "Height", bindings)
+
+    if band is None:
+        return 0.0, float(world_height - 1), False
+    low, high = band
+    return max(low, 0.0), min(high, float(world_height - 1)), True
+
+
+def _weighted_names(row, column):
+    # The names of a weighted list with a positive weight. Lists that don't parse are the linter's business.
+    value = row.get(column)
+    if not isinstance(value, str):
+        return []
+    try:
+        return [name for name, weight in weighted_pair_list_parser(value) if float(weight) > 0]
+    except ValueError:
+        return []
+
+
+def replaced_blocks(row, block_catalog: BlockCatalog) -> frozenset:
+    blocks = {normalize_block_id(name) for name in _weighted_names(row, "Replaces")}
+    blocks.update("ore:" + name for name in _weighted_names(row, "ReplacesOre"))
+    for pattern in _weighted_names(row, "ReplacesRegExp"):
+        try:
+            blocks.update(block_catalog.match_regex(pattern))
+        except re.error:
+            continue
+    return frozenset(blocks)
+
+
+class IntervalIndex:
+    # Closed intervals [low, high], each with an item.
+    #
+    # Intervals are kept sorted by low. overlapping() only looks at the intervals whose low is within max_length of
+    # the query, found by binary search; overlapping_pairs() finds every overlapping pair in one sweep.
+
+    def __init__(self):
+        self._intervals = []
+        self._sorted = True
+        self._lows = None
+        self._max_length = 0.0
+
+    def add(self, low, high, item):
+        self._intervals.append((low, high, item))
+        self._max_length = max(self._max_length, high - low)
+        self._sorted = False
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def _sort(self):
+        if not self._sorted:
+            self._intervals.sort(key=lambda interval: (interval[0], interval[1]))
+            self._lows = [interval[0] for interval in self._intervals]
+            self._sorted = True
+        elif self._lows is None:
+            self._lows = [interval[0] for interval in self._intervals]
+
+    def overlapping(self, low, high) -> list:
+        # The (low, high, item) intervals that overlap [low, high].
+        self._sort()
+        start = bisect_right(self._lows, low - self._max_length - 1e-9)
+        end = bisect_right(self._lows, high)
+        return [interval for interval in self._intervals[start:end] if interval[1] >= low]
+
+    def overlapping_pairs(self, other=None):
+        # Yields (interval, interval) for every overlapping pair, each once. With other, the pairs are an interval of
+        # this index and an overlapping one of other.
+        if other is not None:
+            for interval in self._intervals:
+                for other_interval in other.overlapping(interval[0], interval[1]):
+                    yield interval, other_interval
+            return
+        self._sort()
+        active = []  # heap of (high, position)
+        for position, interval in enumerate(self._intervals):
+            low = interval[0]
+            while active and active[0][0] < low:
+                heapq.heappop(active)
+            for high, other in active:
+                yield self._intervals[other], interval
+            heapq.heappush(active, (interval[1], position))
+
+
+def distribution_spans(workbook, tables, block_catalog: BlockCatalog = None, biome_catalog: BiomeCatalog = None,
+                       bindings=None):
+    # One DistributionSpan per enabled Distribution row in tables (as produced by iter_workbook_tables()).
+    # bindings are passed on to the ":=" expressions; by default, cog_expressions.default_bindings.
+    block_catalog = block_catalog or BlockCatalog.default()
+    biome_catalog = biome_catalog or BiomeCatalog.default()
+    tables = list(tables)
+    resolver = PresetResolver(row for table_name, table_data, location in tables for row in table_data)
+
+    spans = []
+    for table_name, table_data, location in tables:
+        for row_index, row in enumerate(table_data):
+            if row.get("Type") != "Distribution" or row.get("OFF?"):
+                continue
+            resolved = resolver.resolve(row)
+            low, high, exact = height_band(resolved, bindings)
+            try:
+                biomes = biome_catalog.targets(resolved)
+            except ValueError:
+                biomes = frozenset(biome_catalog.ids)
+            spans.append(DistributionSpan(workbook, row.get("name"), location.row_reference(row_index), low, high,
+                                          exact, replaced_blocks(resolved, block_catalog), biomes,
+                                          resolved.get("Dimension")))
+    return spans
+
+
+def find_conflicts(spans) -> list:
+    # Returns a list of Conflict, one per pair of spans that share a replaced block, a biome and some height.
+    indexes = defaultdict(IntervalIndex)  # blocks -> index of the spans that replace them
+    for position, span in enumerate(spans):
+        if span.blocks:
+            indexes[span.blocks].add(span.low, span.high, position)
+
+    shared_blocks = {}
+    block_sets = list(indexes)
+    for i, blocks_a in enumerate(block_sets):
+        for j in range(i, len(block_sets)):
+            blocks_b = block_sets[j]
+            if i != j and blocks_a.isdisjoint(blocks_b):
+                continue
+            shared = tuple(sorted(blocks_a & blocks_b))
+            pairs = indexes[blocks_a].overlapping_pairs(indexes[blocks_b] if i != j else None)
+            for (low_a, high_a, a), (low_b, high_b, b) in pairs:
+                shared_blocks[min(a, b), max(a, b)] = shared
+
+    conflicts = []
+    for (a, b), blocks in sorted(shared_blocks.items()):
+        first, second = spans[a], spans[b]
+        if first.dimension is not None and second.dimension is not None and first.dimension != second.dimension:
+            continue
+        biomes = first.biomes & second.biomes
+        if not biomes:
+            continue
+        conflicts.append(Conflict(first, second, max(first.low, second.low), min(first.high, second.high),
+                                  blocks, biomes))
+    return conflicts
+
+
+def format_conflict(conflict: Conflict) -> str:
+    first, second = conflict.first, conflict.second
+    guessed = [span.name for span in (first, second) if not span.exact]
+    text = "%s (%s) and %s (%s) both replace %s at y=%g..%g in %d biome(s)." % (
+        first.name, first.cell, second.name, second.cell, ", ".join(conflict.blocks), conflict.low, conflict.high,
+        len(conflict.biomes))
+    if guessed:
+        text += " Height of %s assumed to be the whole world." % " and ".join(guessed)
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find distributions that compete for the same blocks.")
+    parser.add_argument("workbooks", nargs="+")
+    args = parser.parse_args(argv)
+
+    spans = []
+    for path in args.workbooks:
+        spans.extend(distribution_spans(path, iter_workbook_tables(openpyxl.load_workbook(path))))
+    conflicts = find_conflicts(spans)
+    for conflict in conflicts:
+        print(format_conflict(conflict))
+    print("%d distribution(s), %d conflict(s)." % (len(spans), len(conflicts)))
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_overlapping(self):
+        index = IntervalIndex()
+        index.add(0, 10, "a")
+        index.add(5, 6, "b")
+        index.add(20, 30, "c")
+        index.add(30, 40, "d")
+        self.assertEqual([item for low, high, item in index.overlapping(8, 25)], ["a", "c"])
+        self.assertEqual([item for low, high, item in index.overlapping(30, 30)], ["c", "d"])
+        self.assertEqual(index.overlapping(11, 19), [])
+
+    def test_overlapping_pairs_matches_all_pairs(self):
+        import random
+        generator = random.Random(1)
+        intervals = []
+        index = IntervalIndex()
+        for i in range(200):
+            low = generator.uniform(0, 256)
+            high = low + generator.uniform(0, 30)
+            intervals.append((low, high, i))
+            index.add(low, high, i)
+
+        expected = {(a[2], b[2]) for a in intervals for b in intervals
+                    if a[2] < b[2] and a[0] <= b[1] and b[0] <= a[1]}
+        found = {tuple(sorted((a[2], b[2]))) for a, b in index.overlapping_pairs()}
+        self.assertEqual(found, expected)
+
+
+class TestHeightBand(unittest.TestCase):
+    def test_standard_gen(self):
+        self.assertEqual(height_band({"Height_avg": "32", "Height_range": "8"}), (24.0, 40.0, True))
+
+    def test_veins(self):
+        row = {"MotherlodeHeight_avg": 40, "MotherlodeHeight_range": 10, "BranchHeightLimit_avg": "5",
+               "BranchHeightLimit_range": "1"}
+        self.assertEqual(height_band(row), (24.0, 56.0, True))
+        self.assertEqual(height_band({"MotherlodeHeight_avg": 8}), (0.0, 24.0, True))
+
+    def test_expressions(self):
+        row = {"Height_avg": ":= 0.5 * dimension.groundLevel", "Height_range": ":= 4 * oreSize"}
+        self.assertEqual(height_band(row), (28.0, 36.0, True))
+        self.assertEqual(height_band(row, {"dimension.groundLevel": 128}), (60.0, 68.0, True))
+
+    def test_unknown_is_whole_world(self):
+        self.assertEqual(height_band({"Height_avg": ":= 0.5 * _default_"}), (0.0, 255.0, False))
+        self.assertEqual(height_band({"Height_avg": ":= (0.5"}), (0.0, 255.0, False))
+        self.assertEqual(height_band({"Height_avg": ":= min()"}), (0.0, 255.0, False))
+        self.assertEqual(height_band({"Height_avg": ":= (dimension.groundLevel - 80)^0.5"}), (0.0, 255.0, False))
+
+
+class TestFindConflicts(unittest.TestCase):
+    def setUp(self):
+        self.blocks = BlockCatalog([("minecraft:stone", "Stone"), ("minecraft:dirt", "Dirt"),
+                                    ("quark:marble", "Marble")])
+        self.biomes = BiomeCatalog([("minecraft:plains", "Plains", ["PLAINS"]),
+                                    ("minecraft:swampland", "Swampland", ["SWAMP"])])
+
+    def test_replaced_blocks(self):
+        row = {"Replaces": "stone, 1;", "ReplacesRegExp": "minecraft:(st, 1; quark:.*, 1;"}
+        self.assertEqual(replaced_blocks(row, self.blocks), {"minecraft:stone", "quark:marble"})
+
+    def spans(self, rows):
+        header = sorted({key for row in rows for key in row})
+        location = TableLocation("Veins", 1, 1, header)
+        return distribution_spans("a.xlsx", [("Veins_Presets", rows, location)], self.blocks, self.biomes)
+
+    def test_conflicts(self):
+        spans = self.spans([
+            {"Type": "Preset", "name": "Deep", "Replaces": "stone, 1;", "Height_avg": "16", "Height_range": "16"},
+            {"Type": "Distribution", "name": "Iron", "inherits": "Deep"},
+            {"Type": "Distribution", "name": "Gold", "inherits": "Deep", "Height_avg": "40", "Height_range": "10"},
+            {"Type": "Distribution", "name": "Tin", "Replaces": "minecraft:dirt, 1;", "Height_avg": "20"},
+            {"Type": "Distribution", "name": "Copper", "ReplacesRegExp": "minecraft:st.*, 1;", "Height_avg": "10",
+             "BiomeType": "Plains, 1;"},
+            {"Type": "Distribution", "name": "Zinc", "Replaces": "stone, 1;", "Height_avg": "10",
+             "BiomeType": "Swamp, 1;", "Dimension": "nether"},
+            {"Type": "Distribution", "name": "Off", "OFF?": "OFF", "Replaces": "stone, 1;", "Height_avg": "10"},
+        ])
+        self.assertEqual([span.name for span in spans], ["Iron", "Gold", "Tin", "Copper", "Zinc"])
+
+        conflicts = find_conflicts(spans)
+        self.assertEqual([(c.first.name, c.second.name, c.low, c.high) for c in conflicts],
+                         [("Iron", "Gold", 30.0, 32.0), ("Iron", "Copper", 10.0, 10.0),
+                          ("Iron", "Zinc", 10.0, 10.0)])
+        self.assertEqual(conflicts[1].biomes, {"minecraft:plains"})
+        self.assertIn("Iron (Veins!A3:", format_conflict(conflicts[0]))
+
+    def test_matches_all_pairs(self):
+        import random
+        generator = random.Random(2)
+        block_sets = [frozenset(generator.sample("abcdefgh", generator.randint(1, 5))) for i in range(6)]
+        spans = []
+        for i in range(60):
+            low = generator.uniform(0, 240)
+            spans.append(DistributionSpan("a.xlsx", str(i), "", low, low + generator.uniform(0, 20), True,
+                                          generator.choice(block_sets), frozenset(["plains"]), None))
+        expected = [(a.name, b.name, tuple(sorted(a.blocks & b.blocks)))
+                    for i, a in enumerate(spans) for b in spans[i + 1:]
+                    if a.blocks & b.blocks and a.low <= b.high and b.low <= a.high]
+        self.assertEqual([(c.first.name, c.second.name, c.blocks) for c in find_conflicts(spans)], expected)
+
+    def test_spreadsheet(self):
+        path = "./Sprocket2 Spreadsheet.xlsx"
+        spans = distribution_spans(path, iter_workbook_tables(openpyxl.load_workbook(path)))
+        self.assertEqual([span.name for span in spans], ["LotsOfIron"])
+        self.assertEqual(find_conflicts(spans), [])
+
+
+if __name__ == '__main__':
+    main()
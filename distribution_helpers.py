@@ -4,22 +4,35 @@ from collections import defaultdict
 from contracts import contract
 from lxml import etree
 
+import instrumentation
+
+
+class CellValueError(ValueError):
+    # Raised when one particular cell of a row can't be rendered.
+    # column is the name of the column the bad value is in, i.e. "OreBlock".
+    def __init__(self, column, message):
+        super().__init__(message)
+        self.column = column
+
+
+# The presets COG defines itself, which distributions can inherit from without defining them first.
+known_presets = ("PresetStandardGen",  # StandardGenPreset
+                 "PresetLayeredVeins",  # VeinsPreset
+                 "PresetVerticalVeins",  # VeinsPreset
+                 "PresetSmallDeposits",  # VeinsPreset
+                 "PresetLavaDeposits",  # VeinsPreset
+                 "PresetHugeVeins",  # VeinsPreset
+                 "PresetHintVeins",  # VeinsPreset
+                 "PresetSparseVeins",  # VeinsPreset
+                 "PresetPipeVeins",  # VeinsPreset
+                 "PresetStrategicCloud",  # CloudPreset
+                 "PresetStratum",  # CloudPreset
+                 )
+
 
 @contract(xml_element=etree._Element, name="str|None", seed="str|None", inherits="str|None")
 def add_standard_attributes(xml_element, name, seed=None, inherits=None):
-    assert inherits in (None,
-                        "PresetStandardGen",  # StandardGenPreset
-                        "PresetLayeredVeins",  # VeinsPreset
-                        "PresetVerticalVeins",  # VeinsPreset
-                        "PresetSmallDeposits",  # VeinsPreset
-                        "PresetLavaDeposits",  # VeinsPreset
-                        "PresetHugeVeins",  # VeinsPreset
-                        "PresetHintVeins",  # VeinsPreset
-                        "PresetSparseVeins",  # VeinsPreset
-                        "PresetPipeVeins",  # VeinsPreset
-                        "PresetStrategicCloud",  # CloudPreset
-                        "PresetStratum",  # CloudPreset
-                        )
+    assert inherits is None or inherits in known_presets
 
     if (name is None) or (name == "") or (name.strip() == ""):
         raise ValueError("Attempted to create a distribution without a name. All distributions must have a name.")
@@ -101,6 +114,7 @@ class TestAddDebugDisplayAttributes(unittest.TestCase):
     pass
 
 
+@instrumentation.timed("add_setting_elements")
 @contract(p=defaultdict, setting_names="list(str)", distribution_element=etree._Element)
 def add_setting_elements(p, setting_names, distribution_element):
     # Adds one or more <Setting> elements to the parent distribution element, i.e. a <Veins> element.
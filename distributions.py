@@ -1,11 +1,19 @@
-from collections import defaultdict
-from pprint import pprint
+import argparse
+import os
+import sys
+import unittest
+from collections import defaultdict, OrderedDict
 
 import openpyxl
 from lxml import etree
 
-from distribution_helpers import add_standard_attributes, add_debug_display_attributes, add_setting_elements
-from excel_table import find_table, get_table_data
+import instrumentation
+from cog_expressions import ExpressionError, canonical, is_expression
+from distribution_helpers import add_standard_attributes, add_debug_display_attributes, add_setting_elements, \
+    CellValueError
+from excel_table import find_table, get_table_data, TableLocation
+from memory_profile import MemoryProfiler
+from output_writer import OutputSummary
 from weighted_list import weighted_list_generator
 
 # Note to self; does lxml automatically escape special characters?
@@ -47,6 +55,36 @@ def StandardGen():
     return xml_element
 
 
+def _weighted_list(parent_xml_element, type_of_element, name_of_attribute, p, column):
+    # weighted_list_generator(), for the weighted list in p[column].
+    # If the list can't be parsed, the error says which column it came from.
+    try:
+        weighted_list_generator(parent_xml_element, type_of_element, name_of_attribute, p[column])
+    except ValueError as e:
+        raise CellValueError(column, str(e)) from e
+
+
+veins_setting_names = [
+    "OreDensity",
+    "OreRadiusMult",
+    "MotherlodeFrequency",
+    "MotherlodeRangeLimit",
+    "MotherlodeSize",
+    "MotherlodeHeight",
+    "BranchFrequency",
+    "BranchInclination",
+    "BranchLength",
+    "BranchHeightLimit",
+    "SegmentForkFrequency",
+    "SegmentForkLengthMult",
+    "SegmentLength",
+    "SegmentAngle",
+    "SegmentPitch",  # New feature in COG: Revival? Not on wiki.
+    "SegmentRadius",
+]
+
+
+@instrumentation.timed("Veins")
 def Veins(params):
     # Veins
     # ==========
@@ -107,68 +145,62 @@ def Veins(params):
     elif "Type" in p and p["Type"] == "Distribution":
         xml_element = etree.Element("Veins")
     else:
-        raise ValueError
+        raise CellValueError("Type", "Type must be 'Preset' or 'Distribution', not %r." % p["Type"])
 
     # Set attributes of parent element.
-    add_standard_attributes(xml_element, p["name"], p["seed"], p["inherits"])
+    try:
+        add_standard_attributes(xml_element, p["name"], p["seed"], p["inherits"])
+    except ValueError as e:
+        raise CellValueError("name", str(e)) from e
+    except AssertionError as e:
+        raise CellValueError("inherits", "%r is not a known preset." % p["inherits"]) from e
 
     if "branchType" in p:
         xml_element.attrib["branchType"] = p["branchType"]
 
-    add_debug_display_attributes(xml_element, p["color"])
+    try:
+        add_debug_display_attributes(xml_element, p["color"])
+    except AssertionError as e:
+        raise CellValueError("color", str(e.args[0]) if e.args else "Invalid colour %r." % p["color"]) from e
 
     if "Description" in p:
         desc = etree.SubElement(xml_element,"Description")
         desc.text = p["Description"]
 
     # Add <Settings> elements.
-    setting_names = [
-        "OreDensity",
-        "OreRadiusMult",
-        "MotherlodeFrequency",
-        "MotherlodeRangeLimit",
-        "MotherlodeSize",
-        "MotherlodeHeight",
-        "BranchFrequency",
-        "BranchInclination",
-        "BranchLength",
-        "BranchHeightLimit",
-        "SegmentForkFrequency",
-        "SegmentForkLengthMult",
-        "SegmentLength",
-        "SegmentAngle",
-        "SegmentPitch",  # New feature in COG: Revival? Not on wiki.
-        "SegmentRadius",
-    ]
-    add_setting_elements(p, setting_names, xml_element)
+    add_setting_elements(p, veins_setting_names, xml_element)
 
     # Add <OreBlock> elements.
     # In the spreadsheet, these are defined in the column OreBlock in a format like:
     # minecraft:coal_ore,0.99; minecraft:diamond_ore,0.01;
 
     if "OreBlock" in p:
-        weighted_list_generator(xml_element, "OreBlock", "block", p["OreBlock"])
+        _weighted_list(xml_element, "OreBlock", "block", p, "OreBlock")
 
 
 
     # Add <Replaces> elements.
 
     if "Replaces" in p:
-        weighted_list_generator(xml_element, "Replaces", "block", p["Replaces"])
+        _weighted_list(xml_element, "Replaces", "block", p, "Replaces")
 
     if "ReplacesOre" in p:
-        weighted_list_generator(xml_element, "ReplacesOre", "block", p["ReplacesOre"])
+        _weighted_list(xml_element, "ReplacesOre", "block", p, "ReplacesOre")
 
     if "ReplacesRegExp" in p:
-        weighted_list_generator(xml_element, "ReplacesRegExp", "block", p["ReplacesRegExp"])
+        _weighted_list(xml_element, "ReplacesRegExp", "block", p, "ReplacesRegExp")
 
     # Add <Biome> elements.
 
     if "Biome" in p:
-        weighted_list_generator(xml_element, "Biome", "name", p["Biome"])
+        _weighted_list(xml_element, "Biome", "name", p, "Biome")
 
     # Add <Option*> elements
 
+    if instrumentation.is_enabled():
+        instrumentation.count("Veins", "rows")
+        instrumentation.count("Veins", "elements", len(xml_element) + 1)
+
     return xml_element
 
 
@@ -244,36 +276,380 @@ def Substitute():
     return xml_element
 
 
-test_params = {
-    "Type":"Preset",
-    "name": "copper",
-    "seed": "1234",
-    "inherits": "PresetLayeredVeins",
-    "MotherlodeSize_avg": "1.234",
-    "MotherlodeSize_type": "uniform",
-    "BranchLength_range": "5.0",
-    "OreBlock ID 3": "minecraft:iron_ore",
-    "OreBlock Weight 3": "1.0",
-    "color": "FFFFFF"
-}
-test_element = Veins(test_params)
-s = (etree.tostring(test_element, pretty_print=True, encoding="unicode"))
-# s = s.decode(encoding="utf-8")
-print(s)
-
-test_file_path = "./Sprocket2 Spreadsheet.xlsx"
-workbook = openpyxl.load_workbook(test_file_path)
-worksheet, my_table = find_table(workbook, "Veins_Presets")
-table_data = get_table_data(worksheet, my_table)
-# pprint(table_data)
-
-for row in table_data:
-    print("----")
-    if all([v is None for v in row.values()]): # empty row
-        continue
+# The tables we know how to render, in the order they are written out.
+table_renderers = OrderedDict([
+    ("Veins_Presets", Veins),
+])
+
+# Rows without a "filename" go into this file.
+default_filename = "distributions.xml"
+
+
+@instrumentation.timed("clean_row")
+def clean_row(row):
+    # Removes blank cells from a row of table data, in place.
+    # Returns None if the whole row is blank, otherwise the row.
+    if all([v is None for v in row.values()]):  # empty row
+        return None
     for k in list(row.keys()):
         if row[k] is None:
             del row[k]
-    xml = Veins(row)
-    s = (etree.tostring(xml, pretty_print=True, encoding="unicode"))
-    print(s)
\ No newline at end of file
+    return row
+
+
+def render_table(workbook, table_name, renderer, errors=None, names=None):
+    # Renders every non-blank row of a table.
+    # Returns a list of (filename, xml_element) pairs, in table order.
+    worksheet, table = find_table(workbook, table_name)
+    table_data = get_table_data(worksheet, table)
+    return render_rows(table_data, renderer, errors, TableLocation.of_table(worksheet, table, table_data), names)
+
+
+def render_rows(table_data, renderer, errors=None, location=None, names=None):
+    # Same as render_table(), for table data that has already been read, i.e. from a CSV file.
+    #
+    # By default the first bad row raises an exception, which stops the run.
+    # If errors is a RowErrors, bad rows are recorded in it instead, and every other row is still rendered.
+    # If names is a NameRegistry, the name of every rendered row is added to it.
+    # location (a TableLocation) is used to turn a bad row into a cell reference such as "Veins!K12".
+    rendered = []
+    for row_index, row in enumerate(table_data):
+        row = clean_row(row)
+        if row is None:
+            continue
+        filename = row.get("filename", default_filename)
+        if errors is None:
+            xml_element = renderer(row)
+        else:
+            try:
+                xml_element = renderer(row)
+            except Exception as e:
+                errors.add(location, row_index, row.get("name"), e)
+                continue
+        rendered.append((filename, xml_element))
+        if names is not None:
+            kind = "preset" if xml_element.tag.endswith("Preset") else "distribution"
+            names.add(xml_element.attrib["name"], kind, _reference(location, row_index, "name"))
+    return rendered
+
+
+def render_workbook(workbook, errors=None, names=None):
+    # Renders all known tables in a workbook, and groups the elements by output filename.
+    # Returns an OrderedDict of {filename: [xml_element, ...]}.
+    return render_tables(read_tables(workbook), errors, names)
+
+
+def read_tables(workbook):
+    # Reads all known tables in a workbook.
+    # Returns an OrderedDict of {table_name: (table_data, location)}, where location is a TableLocation.
+    tables = OrderedDict()
+    for table_name in table_renderers:
+        worksheet, table = find_table(workbook, table_name)
+        table_data = get_table_data(worksheet, table)
+        tables[table_name] = (table_data, TableLocation.of_table(worksheet, table, table_data))
+    return tables
+
+
+def render_tables(tables, errors=None, names=None):
+    # Renders tables returned by read_tables(), and groups the elements by output filename.
+    files = OrderedDict()
+    for table_name, (table_data, location) in tables.items():
+        for filename, xml_element in render_rows(table_data, table_renderers[table_name], errors, location, names):
+            files.setdefault(filename, []).append(xml_element)
+    return files
+
+
+def _reference(location, row_index, column=None):
+    # "Veins!K12" for a cell, "Veins!A12:BQ12" for a whole row, or "row 5" if there is no location.
+    if location is None:
+        return "row %d" % (row_index + 1)
+    if column is None:
+        return location.row_reference(row_index)
+    return location.cell_reference(row_index, column)
+
+
+@instrumentation.timed("fold_setting_expressions")
+def fold_setting_expressions(xml_elements):
+    # Rewrites the ":=" avg and range values of every <Setting> in canonical, constant-folded form, i.e.
+    # ":= 64/64 * dimension.groundLevel" becomes ":= dimension.groundLevel", and ":= 8 * 2" becomes "16", so that COG
+    # has less to evaluate for every chunk. The elements are modified in place. Returns the number of values changed.
+    #
+    # Expressions that don't parse are left alone; lint.py reports those.
+    changed = 0
+    for xml_element in xml_elements:
+        for setting in xml_element.iter("Setting"):
+            for attribute in ("avg", "range"):
+                value = setting.get(attribute)
+                if not is_expression(value):
+                    continue
+                try:
+                    folded = canonical(value)
+                except ExpressionError:
+                    continue
+                if folded != value:
+                    setting.set(attribute, folded)
+                    changed += 1
+    instrumentation.count("fold_setting_expressions", "changed", changed)
+    return changed
+
+
+class RowErrors:
+    # Collects the rows that couldn't be rendered, so that they can all be reported at once.
+
+    def __init__(self):
+        self.errors = []  # list of (cell_reference, row_name, message)
+
+    def add(self, location, row_index, row_name, exception):
+        reference = _reference(location, row_index, getattr(exception, "column", None))
+        message = str(exception) or type(exception).__name__
+        self.errors.append((reference, row_name, message))
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __str__(self):
+        lines = ["%d row(s) could not be rendered:" % len(self.errors)]
+        for reference, row_name, message in self.errors:
+            if row_name is None:
+                lines.append("  %s: %s" % (reference, message))
+            else:
+                lines.append("  %s (%s): %s" % (reference, row_name, message))
+        return "\n".join(lines)
+
+
+class NameRegistry:
+    # Every preset and distribution name rendered so far. In COG, a later distribution with the same name silently
+    # replaces the earlier one, so clashes are recorded to be reported.
+    #
+    # One registry can be shared across tables and workbooks. Set source (i.e. to the workbook's file name) to tell
+    # the inputs apart in the report.
+
+    def __init__(self):
+        self.source = None
+        self._first = {}  # name -> (kind, reference)
+        self.clashes = []  # list of (name, kind, reference, first_kind, first_reference)
+
+    def add(self, name, kind, reference):
+        # kind is "preset" or "distribution". Returns False if the name was already taken.
+        if self.source is not None:
+            reference = "%s %s" % (self.source, reference)
+        first = self._first.get(name)
+        if first is None:
+            self._first[name] = (kind, reference)
+            return True
+        self.clashes.append((name, kind, reference) + first)
+        return False
+
+    def first(self, name):
+        # (kind, reference) of the first row with this name, or None.
+        return self._first.get(name)
+
+    def __contains__(self, name):
+        return name in self._first
+
+    def __len__(self):
+        return len(self.clashes)
+
+    def __str__(self):
+        lines = ["%d name(s) are used more than once:" % len(self.clashes)]
+        for name, kind, reference, first_kind, first_reference in self.clashes:
+            lines.append("  %s: %s %r has the same name as the %s at %s." % (reference, kind, name, first_kind,
+                                                                             first_reference))
+        return "\n".join(lines)
+
+
+@instrumentation.timed("serialize")
+def serialize(xml_elements):
+    # Wraps distribution elements in the <Config><ConfigSection> structure COG expects,
+    # and returns the file contents as bytes.
+    config = etree.Element("Config")
+    section = etree.SubElement(config, "ConfigSection")
+    section.extend(xml_elements)
+    if instrumentation.is_enabled():
+        instrumentation.count("serialize", "elements", sum(1 for _ in config.iter()))
+    return etree.tostring(config, pretty_print=True, xml_declaration=True, encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate COG configuration files from a Sprocket2 spreadsheet.")
+    parser.add_argument("workbook", nargs="?", default="./Sprocket2 Spreadsheet.xlsx")
+    parser.add_argument("--output-dir", help="Write one XML file per 'filename' into this directory. "
+                                             "Unchanged files are left untouched. "
+                                             "If omitted, the XML is printed instead.")
+    parser.add_argument("--stats", action="store_true", help="Print per-stage timings and counters.")
+    parser.add_argument("--stats-json", metavar="PATH", help="Write per-stage timings and counters to a JSON file.")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Take tracemalloc snapshots at each stage and report where the memory went.")
+    parser.add_argument("--collect-errors", action="store_true",
+                        help="Don't stop at the first bad row. Render every valid row, then report all bad rows.")
+    parser.add_argument("--fold-expressions", action="store_true",
+                        help="Write ':=' setting values in constant-folded, canonical form.")
+    args = parser.parse_args(argv)
+
+    errors = RowErrors() if args.collect_errors else None
+    names = NameRegistry()
+
+    if args.stats or args.stats_json:
+        instrumentation.enable()
+
+    with MemoryProfiler(enabled=args.profile_memory) as profiler:
+        with profiler.stage("load_workbook"), instrumentation.stage("load_workbook"):
+            workbook = openpyxl.load_workbook(args.workbook)
+
+        with profiler.stage("get_table_data") as stage:
+            tables = read_tables(workbook)
+            stage.rows = sum(len(table_data) for table_data, location in tables.values())
+
+        with profiler.stage("render") as stage:
+            files = render_tables(tables, errors, names)
+            stage.rows = sum(len(xml_elements) for xml_elements in files.values())
+
+        if args.fold_expressions:
+            with profiler.stage("fold_expressions"):
+                for xml_elements in files.values():
+                    fold_setting_expressions(xml_elements)
+
+        with profiler.stage("serialize"):
+            write_files(files, args.output_dir)
+
+    if args.profile_memory:
+        print(profiler.report())
+
+    if names:
+        print(names)
+
+    if errors:
+        print(errors)
+        sys.exit(1)
+
+    if args.stats:
+        print(instrumentation.report_table())
+    if args.stats_json:
+        with open(args.stats_json, "w") as f:
+            f.write(instrumentation.report_json())
+
+
+def write_files(files, output_dir):
+    # Prints the rendered elements, or writes them out as one file per filename if output_dir is given.
+    if output_dir is None:
+        for xml_elements in files.values():
+            for xml_element in xml_elements:
+                print("----")
+                print(etree.tostring(xml_element, pretty_print=True, encoding="unicode"))
+        return
+
+    summary = OutputSummary()
+    for filename, xml_elements in files.items():
+        summary.write(os.path.join(output_dir, filename), serialize(xml_elements))
+    print(summary)
+
+
+class TestVeins(unittest.TestCase):
+    def test_preset(self):
+        params = {
+            "Type": "Preset",
+            "name": "copper",
+            "seed": "1234",
+            "inherits": "PresetLayeredVeins",
+            "MotherlodeSize_avg": "1.234",
+            "MotherlodeSize_type": "uniform",
+            "BranchLength_range": "5.0",
+            "color": "FFFFFF"
+        }
+        xml_element = Veins(params)
+
+        self.assertEqual(xml_element.tag, "VeinsPreset")
+        self.assertEqual(xml_element.attrib["name"], "copper")
+        settings = {s.attrib["name"]: dict(s.attrib) for s in xml_element.findall("Setting")}
+        self.assertEqual(settings["MotherlodeSize"], {"name": "MotherlodeSize", "avg": "1.234", "type": "uniform"})
+        self.assertEqual(settings["BranchLength"], {"name": "BranchLength", "range": "5.0"})
+
+    def test_type_is_required(self):
+        with self.assertRaises(ValueError):
+            Veins({"name": "copper"})
+
+
+class TestRenderWorkbook(unittest.TestCase):
+    test_file_path = "./Sprocket2 Spreadsheet.xlsx"
+
+    def test_clean_row(self):
+        self.assertIsNone(clean_row(OrderedDict([("a", None), ("b", None)])))
+        self.assertEqual(clean_row(OrderedDict([("a", None), ("b", "1")])), {"b": "1"})
+
+    def test_grouped_by_filename(self):
+        workbook = openpyxl.load_workbook(self.test_file_path)
+        files = render_workbook(workbook)
+
+        self.assertIn("0_presets.xml", files)
+        names = [e.attrib["name"] for e in files["0_presets.xml"]]
+        self.assertIn("PresetLayeredVeins", names)
+
+    def test_collect_errors(self):
+        header = ["Type", "name", "OreBlock", "color"]
+        table_data = [
+            OrderedDict(zip(header, ["Distribution", "Good", "minecraft:iron_ore, 1.0;", None])),
+            OrderedDict(zip(header, ["Distribution", "BadWeight", "minecraft:iron_ore, lots;", None])),
+            OrderedDict(zip(header, ["Distribution", None, "minecraft:iron_ore, 1.0;", None])),
+            OrderedDict(zip(header, ["Distribution", "BadColour", None, "12345"])),
+            OrderedDict(zip(header, ["Distribution", "AlsoGood", None, "FF0000"])),
+        ]
+        location = TableLocation("Veins", 8, 1, header)
+
+        errors = RowErrors()
+        rendered = render_rows(table_data, Veins, errors, location)
+
+        self.assertEqual([e.attrib["name"] for filename, e in rendered], ["Good", "AlsoGood"])
+        self.assertEqual([(reference, name) for reference, name, message in errors.errors],
+                         [("Veins!C10", "BadWeight"), ("Veins!B11", None), ("Veins!D12", "BadColour")])
+        self.assertIn("3 row(s) could not be rendered", str(errors))
+
+    def test_name_registry(self):
+        header = ["Type", "name"]
+        table_data = [
+            OrderedDict(zip(header, ["Preset", "Iron"])),
+            OrderedDict(zip(header, ["Distribution", "Gold"])),
+            OrderedDict(zip(header, ["Distribution", "Iron"])),
+        ]
+        names = NameRegistry()
+        render_rows(table_data, Veins, location=TableLocation("Veins", 8, 1, header), names=names)
+        names.source = "other.xlsx"
+        render_rows(table_data[1:2], Veins, names=names)
+
+        self.assertEqual(names.clashes, [
+            ("Iron", "distribution", "Veins!B11", "preset", "Veins!B9"),
+            ("Gold", "distribution", "other.xlsx row 1", "distribution", "Veins!B10"),
+        ])
+        self.assertIn("2 name(s) are used more than once", str(names))
+
+    def test_first_error_raises_by_default(self):
+        table_data = [OrderedDict([("Type", "Distribution"), ("name", "Bad"), ("OreBlock", "iron;")])]
+        with self.assertRaises(CellValueError) as context:
+            render_rows(table_data, Veins)
+        self.assertEqual(context.exception.column, "OreBlock")
+
+    def test_fold_setting_expressions(self):
+        xml_element = Veins({"Type": "Distribution", "name": "a",
+                             "MotherlodeHeight_avg": ":= 32/64 * dimension.groundLevel",
+                             "MotherlodeHeight_range": ":= 8 * 2",
+                             "MotherlodeSize_avg": "3",
+                             "MotherlodeSize_range": ":= (oops",
+                             "BranchLength_avg": ":= min()",
+                             "BranchLength_range": ":= 1e400 * oreSize",
+                             "OreDensity_avg": ":= (0-8)^0.5*oreSize"})
+        self.assertEqual(fold_setting_expressions([xml_element]), 3)
+        settings = {s.attrib["name"]: dict(s.attrib) for s in xml_element.findall("Setting")}
+        self.assertEqual(settings["MotherlodeHeight"]["avg"], ":= 0.5*dimension.groundLevel")
+        self.assertEqual(settings["MotherlodeHeight"]["range"], "16")
+        self.assertEqual(settings["MotherlodeSize"], {"name": "MotherlodeSize", "avg": "3", "range": ":= (oops"})
+        self.assertEqual(settings["BranchLength"], {"name": "BranchLength", "avg": ":= min()",
+                                                    "range": ":= 1e400 * oreSize"})
+        self.assertEqual(settings["OreDensity"]["avg"], ":= (-8)^0.5*oreSize")
+
+    def test_serialize(self):
+        content = serialize([etree.Element("Veins", name="a")])
+        self.assertTrue(content.startswith(b"<?xml"))
+        self.assertIn(b"<Config>\n  <ConfigSection>\n    <Veins name=\"a\"/>", content)
+
+
+if __name__ == '__main__':
+    main()
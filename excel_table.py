@@ -1,11 +1,25 @@
+import csv
+import os
+import tempfile
 import unittest
 from typing import Mapping, Any, List
 
 import openpyxl
+from openpyxl.utils import get_column_letter, range_boundaries
 
 from collections import OrderedDict
 
+import instrumentation
 
+
+def _worksheet_tables(worksheet: openpyxl.worksheet.worksheet.Worksheet) -> List[openpyxl.worksheet.table.Table]:
+    tables = worksheet._tables
+    if isinstance(tables, dict):  # openpyxl >= 3.0 keys the tables by name.
+        tables = tables.values()
+    return list(tables)
+
+
+@instrumentation.timed("find_table")
 def find_table(workbook: openpyxl.workbook.workbook.Workbook, table_name: str) \
         -> (openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet.table.Table):
     # Given a Workbook and the name of that table, return the Worksheet the table is on, and the Table object.
@@ -13,12 +27,13 @@ def find_table(workbook: openpyxl.workbook.workbook.Workbook, table_name: str) \
 
     for worksheet_name in workbook.sheetnames:
         worksheet = workbook[worksheet_name]
-        for table in worksheet._tables:
+        for table in _worksheet_tables(worksheet):
             if table_name == table.name:
                 return worksheet, table
 
     raise ValueError("Table %s doesn't exist." % table_name)
 
+@instrumentation.timed("get_table_data")
 def get_table_data(worksheet: openpyxl.worksheet.worksheet.Worksheet,
                    table: openpyxl.worksheet.table.Table) -> List[Mapping[str, Any]]:
     # Given a Worksheet, and a Table that is on that Worksheet,
@@ -63,6 +78,73 @@ def get_table_data(worksheet: openpyxl.worksheet.worksheet.Worksheet,
     for row in data[1:]:
         # data_rows.append(dict(zip(header, row)))
         data_rows.append(OrderedDict(zip(header, row)))
+    instrumentation.count("get_table_data", "rows", len(data_rows))
+    return data_rows
+
+
+class TableLocation:
+    # Where a table's data came from, so that a row of table data can be traced back to a cell reference
+    # such as "Veins!K12".
+    #
+    # sheet      = worksheet title (or CSV file name)
+    # first_row  = spreadsheet row number of the header row
+    # first_col  = spreadsheet column number of the first column (A = 1)
+    # header     = column names, in order
+
+    def __init__(self, sheet: str, first_row: int, first_col: int, header: List[str]):
+        self.sheet = sheet
+        self.first_row = first_row
+        self.first_col = first_col
+        self.header = list(header)
+        self._column_index = {name: i for i, name in enumerate(self.header)}
+
+    @classmethod
+    def of_table(cls, worksheet, table, table_data):
+        min_col, min_row, max_col, max_row = range_boundaries(table.ref)
+        header = list(table_data[0].keys()) if table_data else []
+        return cls(worksheet.title, min_row, min_col, header)
+
+    def _row_number(self, row_index: int) -> int:
+        # row_index counts data rows from 0. The header row comes first.
+        return self.first_row + 1 + row_index
+
+    def cell_reference(self, row_index: int, column: str) -> str:
+        if column not in self._column_index:
+            return self.row_reference(row_index)
+        letter = get_column_letter(self.first_col + self._column_index[column])
+        return "%s!%s%d" % (self.sheet, letter, self._row_number(row_index))
+
+    def row_reference(self, row_index: int) -> str:
+        row_number = self._row_number(row_index)
+        first = get_column_letter(self.first_col)
+        last = get_column_letter(self.first_col + max(len(self.header), 1) - 1)
+        return "%s!%s%d:%s%d" % (self.sheet, first, row_number, last, row_number)
+
+
+def iter_workbook_tables(workbook: openpyxl.workbook.workbook.Workbook):
+    # Yields (table_name, table_data, location) for every table on every worksheet of a workbook.
+    for worksheet_name in workbook.sheetnames:
+        worksheet = workbook[worksheet_name]
+        for table in _worksheet_tables(worksheet):
+            table_data = get_table_data(worksheet, table)
+            yield table.name, table_data, TableLocation.of_table(worksheet, table, table_data)
+
+
+@instrumentation.timed("read_csv_table")
+def read_csv_table(path: str) -> List[Mapping[str, Any]]:
+    # Reads a CSV file holding a single table - header row first - and returns the same
+    # list of dictionaries that get_table_data() would return for the equivalent Excel table.
+    #
+    # CSV has no concept of an empty cell, so empty strings are turned into None, as openpyxl does.
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        try:
+            header = next(reader)
+        except StopIteration:
+            return []
+        data_rows = [OrderedDict(zip(header, [value if value != "" else None for value in row])) for row in reader]
+    instrumentation.count("read_csv_table", "rows", len(data_rows))
     return data_rows
 
 
@@ -122,6 +204,34 @@ class TestExcelTables(unittest.TestCase):
         self.assertEqual(table_data, expected)
         pass
 
+    def test_iter_workbook_tables(self):
+        workbook = openpyxl.load_workbook(self.test_file_path)
+        names = [table_name for table_name, table_data, location in iter_workbook_tables(workbook)]
+        self.assertIn("Colour_Shape_And_Number", names)
+
+    def test_table_location(self):
+        workbook = openpyxl.load_workbook(self.test_file_path)
+        worksheet, my_table = find_table(workbook, "Colour_Shape_And_Number")
+        table_data = get_table_data(worksheet, my_table)
+        location = TableLocation.of_table(worksheet, my_table, table_data)
+
+        # The table starts at C6, so the first data row is row 7, and "Shape" is column D.
+        self.assertEqual(location.cell_reference(0, "Shape"), "%s!D7" % worksheet.title)
+        self.assertEqual(location.row_reference(2), "%s!C9:E9" % worksheet.title)
+        self.assertEqual(location.cell_reference(2, "No such column"), "%s!C9:E9" % worksheet.title)
+
+    def test_read_csv_table(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "Colour_Shape_And_Number.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                f.write("Colour,Shape,Number\nRed,Square,1.2\nYellow,,3.4\n")
+
+            expected = [
+                {'Colour': 'Red', 'Shape': 'Square', 'Number': '1.2'},
+                {'Colour': 'Yellow', 'Shape': None, 'Number': '3.4'},
+            ]
+            self.assertEqual(read_csv_table(path), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
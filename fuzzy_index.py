@@ -0,0 +1,93 @@
+import unittest
+from collections import defaultdict
+from typing import Iterable, Tuple
+
+import numpy as np
+
+
+def trigrams(word: str) -> set:
+    # "iron" -> {"  i", " ir", "iro", "ron", "on "}
+    # The padding means that the start and end of a word count for more than the middle.
+    padded = "  " + word.casefold() + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    # Finds the words most similar to a (probably misspelled) word, for "did you mean ...?" suggestions.
+    #
+    # index = TrigramIndex(["minecraft:iron_ore", "minecraft:gold_ore", ...])
+    # index.suggest("minecraft:iron_oer") -> ("minecraft:iron_ore", ...)
+    #
+    # Similarity is the Jaccard similarity of the two words' trigram sets. Rather than comparing the query to every
+    # word, we look up the posting list of each of the query's trigrams, and count the shared trigrams of all words at
+    # once with numpy.bincount(). Suggestions are cached per query, since the same misspelling tends to be repeated
+    # all down a column.
+
+    def __init__(self, words: Iterable[str]):
+        self.words = tuple(words)
+
+        postings = defaultdict(list)
+        sizes = []
+        for i, word in enumerate(self.words):
+            word_trigrams = trigrams(word)
+            sizes.append(len(word_trigrams))
+            for trigram in word_trigrams:
+                postings[trigram].append(i)
+        self._postings = {trigram: np.array(ids, dtype=np.int32) for trigram, ids in postings.items()}
+        self._sizes = np.array(sizes, dtype=np.int32)
+        self._lengths = np.array([len(word) for word in self.words], dtype=np.int32)
+        self._cache = {}
+
+    def suggest(self, word: str, k: int = 3, min_similarity: float = 0.3) -> Tuple[str]:
+        key = (word, k, min_similarity)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        query = trigrams(word)
+        lists = [self._postings[trigram] for trigram in query if trigram in self._postings]
+        if not lists:
+            self._cache[key] = ()
+            return ()
+
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.words))
+        similarity = shared / (len(query) + self._sizes - shared)
+
+        candidates = np.flatnonzero(similarity >= min_similarity)
+        # Best similarity first. Ties go to the word closest in length, then to the word that comes first.
+        order = np.lexsort((np.abs(self._lengths[candidates] - len(word)), -similarity[candidates]))
+        result = tuple(self.words[i] for i in candidates[order[:k]])
+
+        self._cache[key] = result
+        return result
+
+
+class TestTrigrams(unittest.TestCase):
+    def test_trigrams(self):
+        self.assertEqual(trigrams("Iron"), {"  i", " ir", "iro", "ron", "on "})
+
+
+class TestTrigramIndex(unittest.TestCase):
+    words = ["minecraft:iron_ore", "minecraft:gold_ore", "minecraft:iron_block", "minecraft:stone", "quark:marble"]
+
+    def test_misspelling(self):
+        index = TrigramIndex(self.words)
+        self.assertEqual(index.suggest("minecraft:iron_oer")[0], "minecraft:iron_ore")
+        self.assertEqual(index.suggest("quark:marbel", k=1), ("quark:marble",))
+
+    def test_k(self):
+        index = TrigramIndex(self.words)
+        self.assertEqual(len(index.suggest("minecraft:iron", k=2)), 2)
+
+    def test_nothing_similar(self):
+        index = TrigramIndex(self.words)
+        self.assertEqual(index.suggest("zzzzzz"), ())
+
+    def test_cached(self):
+        index = TrigramIndex(self.words)
+        first = index.suggest("minecraft:stnoe")
+        self.assertIs(index.suggest("minecraft:stnoe"), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
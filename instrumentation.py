@@ -0,0 +1,215 @@
+import functools
+import json
+import time
+import unittest
+from collections import OrderedDict
+
+# Per-stage wall time and call counts.
+#
+# Instrumentation is off by default. While it is off, timed() functions do a single global lookup before calling
+# straight through to the wrapped function, and stage() hands back a shared do-nothing context manager.
+#
+# Times are inclusive: the time recorded for "Veins" includes the time spent in "weighted_pair_list_parser"
+# while rendering those Veins.
+
+_enabled = False
+_stages = OrderedDict()  # stage name -> _StageStats
+
+
+class _StageStats:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.counters = OrderedDict()  # i.e. {"rows": 10000, "elements": 250000}
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _stages.clear()
+
+
+def _stats_for(name: str) -> _StageStats:
+    stats = _stages.get(name)
+    if stats is None:
+        stats = _stages[name] = _StageStats()
+    return stats
+
+
+def record(name: str, seconds: float, calls: int = 1):
+    stats = _stats_for(name)
+    stats.calls += calls
+    stats.seconds += seconds
+
+
+def count(name: str, counter: str, n: int = 1):
+    # Adds n to a counter belonging to a stage, i.e. count("Veins", "rows").
+    # The report turns each counter into a rate, using the stage's total time.
+    if not _enabled:
+        return
+    counters = _stats_for(name).counters
+    counters[counter] = counters.get(counter, 0) + n
+
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_stage = _NullStage()
+
+
+def stage(name: str):
+    # Times a block of code:
+    #
+    # with instrumentation.stage("load_workbook"):
+    #     workbook = openpyxl.load_workbook(path)
+    if not _enabled:
+        return _null_stage
+    return _Stage(name)
+
+
+def timed(name: str):
+    # Decorator that times every call of a function as the stage called name.
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def report() -> OrderedDict:
+    # Returns the collected statistics as plain dictionaries, ready for json.dump().
+    result = OrderedDict()
+    for name, stats in _stages.items():
+        entry = OrderedDict()
+        entry["calls"] = stats.calls
+        entry["seconds"] = stats.seconds
+        for counter, n in stats.counters.items():
+            entry[counter] = n
+            entry[counter + "_per_second"] = (n / stats.seconds) if stats.seconds > 0 else None
+        result[name] = entry
+    return result
+
+
+def report_json(indent=2) -> str:
+    return json.dumps(report(), indent=indent)
+
+
+def report_table() -> str:
+    # Example:
+    #
+    # stage                          calls    total s    mean ms  throughput
+    # ----------------------------------------------------------------------
+    # load_workbook                      1      0.412    412.000
+    # Veins                             10      0.004      0.400  2500 rows/s, 40000 elements/s
+    lines = ["%-28s %8s %10s %10s  %s" % ("stage", "calls", "total s", "mean ms", "throughput"),
+             "-" * 70]
+    for name, stats in _stages.items():
+        mean_ms = (1000 * stats.seconds / stats.calls) if stats.calls else 0.0
+        rates = ", ".join("%.0f %s/s" % (n / stats.seconds, counter)
+                          for counter, n in stats.counters.items() if stats.seconds > 0)
+        lines.append("%-28s %8d %10.3f %10.3f  %s" % (name, stats.calls, stats.seconds, mean_ms, rates))
+    return "\n".join(lines)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        reset()
+        enable()
+
+    def tearDown(self):
+        disable()
+        reset()
+
+    def test_timed_function(self):
+        @timed("double")
+        def double(x):
+            return 2 * x
+
+        self.assertEqual(double(3), 6)
+        self.assertEqual(double(4), 8)
+        self.assertEqual(report()["double"]["calls"], 2)
+        self.assertEqual(double.__name__, "double")
+
+    def test_timed_function_that_raises(self):
+        @timed("fails")
+        def fails():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            fails()
+        self.assertEqual(report()["fails"]["calls"], 1)
+
+    def test_stage_and_counters(self):
+        with stage("Veins"):
+            count("Veins", "rows", 10)
+            count("Veins", "rows", 5)
+
+        entry = report()["Veins"]
+        self.assertEqual(entry["calls"], 1)
+        self.assertEqual(entry["rows"], 15)
+        self.assertIn("rows_per_second", entry)
+
+    def test_disabled_records_nothing(self):
+        disable()
+
+        @timed("double")
+        def double(x):
+            return 2 * x
+
+        double(1)
+        with stage("load_workbook"):
+            pass
+        count("Veins", "rows")
+        self.assertEqual(report(), {})
+
+    def test_report_formats(self):
+        with stage("serialize"):
+            count("serialize", "elements", 3)
+
+        self.assertEqual(json.loads(report_json())["serialize"]["elements"], 3)
+        table = report_table()
+        self.assertIn("serialize", table)
+        self.assertIn("elements/s", table)
+
+
+if __name__ == '__main__':
+    unittest.main()
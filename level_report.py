@@ -0,0 +1,248 @@
+import argparse
+import csv
+import math
+import sys
+import time
+import unittest
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from cog_expressions import default_bindings, dimension_profiles
+from excel_table import TableLocation, iter_workbook_tables
+from ore_simulation import default_quantiles, expected_ore, veins_distributions
+from setting_sampling import SettingTable
+from voxel_simulation import replaceable_levels, row_settings
+from weighted_list import weighted_pair_list_parser
+
+# Expected ore per chunk at each y level, for every Veins distribution in a workbook and every block in its
+# OreBlock list, so the vertical spread of a pack's ores can be looked at before a world is generated.
+#
+# Usage:
+#   python level_report.py "Sprocket2 Spreadsheet.xlsx" other.xlsx --csv levels.csv --chart
+#   python level_report.py pack.xlsx --dimension nether --stone-fraction 0.8 --chart
+#
+# For each distribution, motherlode centres are spread over y like MotherlodeHeight. Around each centre, the
+# motherlode's ore is spread like the slices of a sphere of radius MotherlodeSize, and its branches' ore evenly over
+# the smaller of BranchHeightLimit and BranchLength above and below. The amounts are the expected values of the
+# ore_simulation model (ore_simulation.expected_ore). Ore at levels that can't be replaced (bedrock, and from ground
+# level up) is dropped, as in voxel_simulation; each block then gets its share of what is left, by its OreBlock
+# weight.
+#
+# Expected values come from each setting at evenly spaced quantiles (SettingTable.quantiles) rather than from
+# random samples, so the report is the same every time. All distributions are worked out together, as arrays of
+# (distribution, quantile, y level), a batch of distributions at a time.
+
+# Distributions worked out at once; bounds the (distribution, quantile, y level) arrays.
+batch_size = 256
+
+# Symbols for the blocks in the chart, most ore first.
+chart_symbols = "#*+=%@&$ox"
+
+# levels is an array of expected ore per chunk at each y.
+LevelProfile = namedtuple("LevelProfile", "workbook name cell block levels")
+
+
+@instrumentation.timed("expected_levels")
+def expected_levels(settings_list, bindings=None, stone_fraction=1.0, quantiles=default_quantiles) -> np.ndarray:
+    # Expected ore per chunk at each y level, for a list of D settings (from voxel_simulation.row_settings()).
+    # Returns an array of shape (D, dimension.height).
+    bindings = dict(default_bindings, **(bindings or {}))
+    height = int(bindings["dimension.height"])
+    motherlode_ore, branch_ore = expected_ore(settings_list, quantiles)
+    heights = SettingTable.from_column(settings_list, "MotherlodeHeight").quantiles(quantiles)
+    average = {name: np.array([settings[name].avg for settings in settings_list])
+               for name in ("MotherlodeSize", "BranchHeightLimit", "BranchLength")}
+    radius = np.maximum(average["MotherlodeSize"], 1.0)
+    reach = np.maximum(np.minimum(average["BranchHeightLimit"], average["BranchLength"]), 1.0)
+
+    result = np.empty((len(settings_list), height))
+    levels = np.arange(height) + 0.5
+    for start in range(0, len(settings_list), batch_size):
+        batch = slice(start, start + batch_size)
+        offsets = levels - heights[batch, :, np.newaxis]
+        offsets *= offsets
+        # Slices of a sphere, and a box; each integrates to 1 over all y.
+        sphere = np.maximum(radius[batch, np.newaxis, np.newaxis] ** 2 - offsets, 0.0).mean(axis=1)
+        sphere /= (4.0 / 3.0 * radius[batch] ** 3)[:, np.newaxis]
+        box = (offsets <= reach[batch, np.newaxis, np.newaxis] ** 2).mean(axis=1)
+        box /= (2.0 * reach[batch])[:, np.newaxis]
+        result[batch] = motherlode_ore[batch, np.newaxis] * sphere + branch_ore[batch, np.newaxis] * box
+    result *= replaceable_levels(height, bindings["dimension.groundLevel"], stone_fraction)
+    return result
+
+
+def ore_block_shares(row) -> list:
+    # [(block, share of the ore)] from a row's OreBlock list; the shares add up to 1.
+    # Raises ValueError if the list is blank, doesn't parse, or has no positive weights.
+    value = row.get("OreBlock")
+    if not value:
+        raise ValueError("OreBlock is blank.")
+    pairs = [(block, float(weight)) for block, weight in weighted_pair_list_parser(value)]
+    total = sum(weight for block, weight in pairs if weight > 0)
+    if total <= 0:
+        raise ValueError("OreBlock has no positive weights.")
+    return [(block, weight / total) for block, weight in pairs if weight > 0]
+
+
+def level_profiles(workbook, tables, bindings=None, stone_fraction=1.0, quantiles=default_quantiles):
+    # One LevelProfile per block of every enabled Veins distribution in tables (as produced by
+    # iter_workbook_tables()). Returns (profiles, skipped), with skipped a list of (cell, name, reason).
+    distributions, skipped = [], []
+    for row, cell, resolved in veins_distributions(tables):
+        try:
+            distributions.append((row, cell, row_settings(resolved, bindings), ore_block_shares(resolved)))
+        except ValueError as e:
+            skipped.append((cell, row.get("name"), str(e)))
+
+    profiles = []
+    if distributions:
+        levels = expected_levels([settings for row, cell, settings, shares in distributions], bindings,
+                                 stone_fraction, quantiles)
+        for (row, cell, settings, shares), row_levels in zip(distributions, levels):
+            profiles.extend(LevelProfile(workbook, row.get("name"), cell, block, row_levels * share)
+                            for block, share in shares)
+    return profiles, skipped
+
+
+def block_totals(profiles) -> OrderedDict:
+    # {block: levels summed over distributions}, the block with the most ore first.
+    totals = OrderedDict()
+    for profile in profiles:
+        if profile.block in totals:
+            totals[profile.block] = totals[profile.block] + profile.levels
+        else:
+            totals[profile.block] = profile.levels.copy()
+    return OrderedDict(sorted(totals.items(), key=lambda item: -item[1].sum()))
+
+
+def write_csv(profiles, file):
+    # One row per y level: the total, each block's total, then each distribution's share of each block.
+    totals = block_totals(profiles)
+    columns = [sum(totals.values())] + list(totals.values()) + [profile.levels for profile in profiles]
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(["y", "total"] + list(totals) + ["%s %s: %s" % (profile.workbook, profile.name, profile.block)
+                                                     for profile in profiles])
+    for y, values in enumerate(np.column_stack(columns)):
+        writer.writerow([y] + ["%.6g" % value for value in values])
+
+
+def ascii_chart(profiles, rows=32, width=60) -> str:
+    # Ore per chunk against y, top of the world first, as stacked bars of one symbol per block. Each bar is the ore
+    # in height / rows levels. Blocks beyond the symbols there are share the last one.
+    totals = block_totals(profiles)
+    if not totals:
+        return "(no ore)"
+    blocks = list(totals)
+    stacked = np.array(list(totals.values()))
+    height = stacked.shape[1]
+    step = max(1, -(-height // rows))
+    buckets = np.add.reduceat(stacked, np.arange(0, height, step), axis=1)  # (blocks, bars)
+    scale = width / max(buckets.sum(axis=0).max(), 1e-12)
+
+    lines = []
+    for bar in reversed(range(buckets.shape[1])):
+        low = bar * step
+        ends = np.round(np.cumsum(buckets[:, bar]) * scale).astype(int)
+        text = "".join(chart_symbols[min(i, len(chart_symbols) - 1)] * (end - start)
+                       for i, (start, end) in enumerate(zip(np.concatenate(([0], ends[:-1])), ends)))
+        lines.append("%3d-%-3d |%-*s %8.2f" % (low, min(low + step, height) - 1, width, text,
+                                              buckets[:, bar].sum()))
+    lines.append("ore per chunk in each band of %d levels; %s" % (step, ", ".join(
+        "%s %s" % (chart_symbols[min(i, len(chart_symbols) - 1)], block) for i, block in enumerate(blocks))))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report expected ore per chunk at each y level.")
+    parser.add_argument("workbooks", nargs="+", help="Excel workbooks (.xlsx) to read distributions from.")
+    parser.add_argument("--csv", metavar="FILE", help="Write the levels to this CSV file ('-' for stdout).")
+    parser.add_argument("--chart", action="store_true", help="Print a chart of ore against y.")
+    parser.add_argument("--dimension", choices=list(dimension_profiles), default="overworld",
+                        help="Dimension to evaluate the settings for.")
+    parser.add_argument("--stone-fraction", type=float, default=1.0,
+                        help="Fraction of the blocks between bedrock and ground level that can be replaced.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    bindings = dimension_profiles[args.dimension]
+    profiles = []
+    for path in args.workbooks:
+        workbook_profiles, skipped = level_profiles(path, iter_workbook_tables(openpyxl.load_workbook(path)),
+                                                    bindings, args.stone_fraction)
+        profiles.extend(workbook_profiles)
+        for cell, name, reason in skipped:
+            print("%s %s %s: skipped, %s" % (path, cell, name, reason), file=sys.stderr)
+
+    if args.csv == "-":
+        write_csv(profiles, sys.stdout)
+    elif args.csv:
+        with open(args.csv, "w", newline="") as file:
+            write_csv(profiles, file)
+    if args.chart:
+        print(ascii_chart(profiles))
+    print("%d distribution blocks in %.2fs" % (len(profiles), time.perf_counter() - start), file=sys.stderr)
+
+
+def _row(**values):
+    row = {"Type": "Distribution", "name": "Test", "OreBlock": "minecraft:iron_ore,3; minecraft:stone,1;",
+           "MotherlodeFrequency_avg": "1", "MotherlodeSize_avg": "3", "MotherlodeHeight_avg": "32"}
+    row.update(values)
+    return row
+
+
+class TestExpectedLevels(unittest.TestCase):
+    def test_matches_volume(self):
+        settings = row_settings(_row(MotherlodeSize_range="1", BranchFrequency_avg="2", BranchLength_avg="30",
+                                     SegmentRadius_avg="1", MotherlodeHeight_range="10"))
+        levels = expected_levels([settings], quantiles=200)[0]
+        size_cubed = (3 ** 4 - 2 ** 4 + 4 ** 4 - 3 ** 4) / 4 / 2  # E[U(2, 4)^3]
+        expected = 4.0 / 3.0 * math.pi * size_cubed + 2 * math.pi * 30
+        self.assertAlmostEqual(levels.sum() / expected, 1.0, delta=0.03)
+        self.assertEqual(levels[:32 - 10 - 16].sum(), 0)  # below the lowest motherlode and its branches
+        self.assertGreater(levels[32], levels[20])
+
+    def test_clipped_at_ground_level(self):
+        settings = [row_settings(_row()), row_settings(_row(MotherlodeHeight_avg="64"))]
+        levels = expected_levels(settings)
+        self.assertAlmostEqual(levels[1].sum() / levels[0].sum(), 0.5, delta=0.05)
+        self.assertEqual(levels[1][64:].sum(), 0)
+        nether = expected_levels(settings, dimension_profiles["nether"])
+        self.assertEqual(nether.shape, (2, 128))
+        self.assertEqual(nether[1].sum(), 0)
+
+
+class TestLevelProfiles(unittest.TestCase):
+    def test_blocks(self):
+        location = TableLocation("Veins", 1, 1, ("Type", "name", "OreBlock"))
+        rows = [_row(), _row(name="Bad", OreBlock=None), _row(name="Complex", MotherlodeSize_avg=":= (-8)^(1/3)")]
+        profiles, skipped = level_profiles("a.xlsx", [("Veins_Presets", rows, location)])
+        self.assertEqual([profile.block for profile in profiles], ["minecraft:iron_ore", "minecraft:stone"])
+        self.assertAlmostEqual(profiles[0].levels.sum(), 3 * profiles[1].levels.sum())
+        self.assertEqual(skipped[0], ("Veins!A3:C3", "Bad", "OreBlock is blank."))
+        self.assertEqual(skipped[1][:2], ("Veins!A4:C4", "Complex"))
+
+        totals = block_totals(profiles + profiles)
+        self.assertEqual(list(totals), ["minecraft:iron_ore", "minecraft:stone"])
+        self.assertAlmostEqual(totals["minecraft:stone"].sum(), 2 * profiles[1].levels.sum())
+
+    def test_reports(self):
+        import io
+        path = "Sprocket2 Spreadsheet.xlsx"
+        profiles, skipped = level_profiles(path, iter_workbook_tables(openpyxl.load_workbook(path)))
+        self.assertIn("minecraft:iron_ore", [profile.block for profile in profiles])
+        file = io.StringIO()
+        write_csv(profiles, file)
+        lines = file.getvalue().splitlines()
+        self.assertEqual(len(lines), 257)
+        self.assertTrue(lines[0].startswith("y,total,minecraft:stone,minecraft:iron_ore,"))
+        chart = ascii_chart(profiles)
+        self.assertIn("# minecraft:stone, * minecraft:iron_ore", chart)
+        self.assertEqual(len(chart.splitlines()), 33)
+        self.assertEqual(ascii_chart([]), "(no ore)")
+
+
+if __name__ == '__main__':
+    main()
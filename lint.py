@@ -0,0 +1,431 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import openpyxl
+
+import instrumentation
+from biome_catalog import BiomeCatalog
+from block_catalog import BlockCatalog
+from cog_expressions import ExpressionError, compile_expression, is_expression
+from distribution_helpers import known_presets
+from distributions import NameRegistry
+from excel_table import TableLocation, iter_workbook_tables
+from oredict_catalog import OreDictCatalog
+from weighted_list import weighted_pair_list_parser
+
+# Checks Sprocket2 workbooks for mistakes, without rendering them.
+#
+# Usage:
+#   python lint.py "Sprocket2 Spreadsheet.xlsx" other.xlsx ...
+#   python lint.py *.xlsx --json lint.json        # also write a machine-readable report
+#
+# Every distribution table (any table with "Type" and "name" columns) is split into chunks of rows, and the chunks
+# are checked in parallel, in a pool of worker processes. Each worker opens the packed catalogs itself; they are
+# memory-mapped, so that is cheap. Checks that need the whole workbook at once (duplicate names, what "inherits"
+# refers to) are done afterwards, from the names the workers send back.
+#
+# Each issue has a severity:
+#   error   - COG will reject the row, or distributions.py can't render it.
+#   warning - probably a mistake, i.e. a block that isn't in the catalog (it could come from a mod we don't know).
+#   info    - worth a look, i.e. a regular expression that also matches a block listed in Replaces.
+
+LintIssue = namedtuple("LintIssue", "workbook cell severity check message")
+
+# The name and inherits cells of each named row, for the checks across a whole workbook.
+NamedRow = namedtuple("NamedRow", "cell name type inherits inherits_cell")
+
+row_types = ("Preset", "Distribution")
+setting_types = ("uniform", "normal")
+weighted_list_columns = ("OreBlock", "Replaces", "ReplacesOre", "ReplacesRegExp", "Biome", "BiomeType")
+
+def is_distribution_table(location: TableLocation) -> bool:
+    return "Type" in location.header and "name" in location.header
+
+
+def _is_blank(row) -> bool:
+    return all(value is None for value in row.values())
+
+
+def _number_problem(value):
+    # Returns None if value is a valid setting value: a number, or a ":=" expression. Otherwise a message.
+    if isinstance(value, (int, float)):
+        return None
+    text = str(value).strip()
+    if is_expression(text):
+        try:
+            compile_expression(text)
+        except ExpressionError as e:
+            return str(e)
+        return None
+    try:
+        float(text)
+    except ValueError:
+        return "%r is neither a number nor a ':=' expression." % text
+    return None
+
+
+def lint_row(row, row_index, location):
+    # Checks one row on its own. Yields (cell, severity, check, message).
+    cell = lambda column: location.cell_reference(row_index, column)
+
+    if row.get("Type") not in row_types:
+        yield cell("Type"), "error", "type", "Type must be 'Preset' or 'Distribution', not %r." % row.get("Type")
+
+    name = row.get("name")
+    if name is None or str(name).strip() == "":
+        yield cell("name"), "error", "name", "Every distribution needs a name."
+    elif re.search(r"\s", str(name)):
+        yield cell("name"), "warning", "name", "Name %r contains whitespace." % name
+
+    color = row.get("color")
+    if color is not None and not re.fullmatch(r"[0-9A-Fa-f]{6}", str(color)):
+        yield cell("color"), "error", "color", \
+            "Colour %s is not 6 hexadecimal characters. Example of correct format: 3366FF." % color
+
+    for column, value in row.items():
+        if value is None:
+            continue
+        setting, separator, attribute = column.rpartition("_")
+        if not separator:
+            continue
+        if attribute in ("avg", "range"):
+            problem = _number_problem(value)
+            if problem is not None:
+                yield cell(column), "error", "setting", problem
+            elif attribute == "range" and isinstance(value, (int, float, str)) and _is_negative(value):
+                yield cell(column), "warning", "setting", "%s range %s is negative." % (setting, value)
+        elif attribute == "type":
+            if value in setting_types:
+                continue
+            if str(value).lower() in setting_types:
+                yield cell(column), "warning", "setting", "Setting type %r should be lower case." % value
+            else:
+                yield cell(column), "error", "setting", \
+                    "Setting type %r is not one of %s." % (value, ", ".join(setting_types))
+
+    for column in weighted_list_columns:
+        value = row.get(column)
+        if value is None:
+            continue
+        try:
+            weighted_pair_list_parser(str(value))
+        except ValueError as e:
+            yield cell(column), "error", "weighted list", str(e)
+
+
+def _is_negative(value) -> bool:
+    try:
+        return float(value) < 0
+    except ValueError:
+        return False  # An expression.
+
+
+def lint_rows(workbook, table_name, table_data, location):
+    # Checks a chunk of rows: each row on its own, then every block, ore dictionary and biome reference in them.
+    # Returns (issues, named_rows).
+    issues = []
+    named_rows = []
+    for row_index, row in enumerate(table_data):
+        if _is_blank(row):
+            continue
+        for cell, severity, check, message in lint_row(row, row_index, location):
+            issues.append(LintIssue(workbook, cell, severity, check, message))
+        name = row.get("name")
+        if name is not None and str(name).strip():
+            named_rows.append(NamedRow(location.cell_reference(row_index, "name"), str(name), row.get("Type"),
+                                       row.get("inherits"), location.cell_reference(row_index, "inherits")))
+
+    tables = [(table_name, table_data, location)]
+    for problem in BlockCatalog.default().unknown_blocks(tables):
+        message = "Unknown block %r." % problem.block_id
+        if problem.suggestions:
+            message += " Did you mean %s?" % " or ".join(problem.suggestions)
+        issues.append(LintIssue(workbook, problem.cell, "warning", "block", message))
+
+    for usage in BlockCatalog.default().regex_usage(tables):
+        if usage.error is not None:
+            issues.append(LintIssue(workbook, usage.cell, "error", "regex",
+                                    "Bad regular expression %r: %s." % (usage.pattern, usage.error)))
+        elif usage.match_count == 0:
+            issues.append(LintIssue(workbook, usage.cell, "warning", "regex",
+                                    "Regular expression %r matches no known block." % usage.pattern))
+        elif usage.replaces_overlap:
+            issues.append(LintIssue(workbook, usage.cell, "info", "regex",
+                                    "Regular expression %r also matches %s, which Replaces already lists."
+                                    % (usage.pattern, ", ".join(usage.replaces_overlap))))
+
+    for problem in OreDictCatalog.default().problems(tables):
+        severity = "error" if problem.kind == "wrong case" else "warning"
+        message = "%s ore dictionary name %r." % (problem.kind.capitalize(), problem.name)
+        if problem.suggestions:
+            message += " Did you mean %s?" % " or ".join(problem.suggestions)
+        issues.append(LintIssue(workbook, problem.cell, severity, "oredict", message))
+
+    for problem in BiomeCatalog.default().problems(tables):
+        if problem.kind == "bad regex":
+            message = "Bad regular expression %r: %s." % (problem.name, problem.suggestions[0])
+            severity = "error"
+        elif problem.kind == "unknown type":
+            message = "Unknown BiomeType %r." % problem.name
+            if problem.suggestions:
+                message += " Did you mean %s?" % " or ".join(problem.suggestions)
+            severity = "warning"
+        else:
+            message = "Biome %r matches no known biome." % problem.name
+            severity = "warning"
+        issues.append(LintIssue(workbook, problem.cell, severity, "biome", message))
+
+    return issues, named_rows
+
+
+def lint_names(workbook, named_rows, names: NameRegistry = None):
+    # The checks that need every named row of a workbook: duplicate names, and what "inherits" refers to.
+    # Pass the same NameRegistry for every workbook to also find names that clash across workbooks.
+    names = names if names is not None else NameRegistry()
+    issues = []
+    for row in named_rows:
+        kind = "preset" if row.type == "Preset" else "distribution"
+        if not names.add(row.name, kind, row.cell):
+            name, kind, reference, first_kind, first_reference = names.clashes[-1]
+            issues.append(LintIssue(workbook, row.cell, "error", "name", "Name %r is already used by the %s at %s."
+                                    % (row.name, first_kind, first_reference)))
+
+    defined = {row.name for row in named_rows}
+    presets = {row.name for row in named_rows if row.type == "Preset"}
+    for row in named_rows:
+        if row.inherits is None or row.inherits in known_presets or row.inherits in presets:
+            continue
+        if row.inherits in defined:
+            issues.append(LintIssue(workbook, row.inherits_cell, "warning", "inherits",
+                                    "%r inherits from %r, which is a distribution, not a preset."
+                                    % (row.name, row.inherits)))
+        else:
+            issues.append(LintIssue(workbook, row.inherits_cell, "error", "inherits",
+                                    "%r inherits from %r, which is not a known preset." % (row.name, row.inherits)))
+    return issues
+
+
+def read_workbook_tables(path):
+    # Returns (path, [(table_name, table_data, location), ...]) for the distribution tables of a workbook.
+    workbook = openpyxl.load_workbook(path, read_only=False)
+    tables = [(table_name, table_data, location) for table_name, table_data, location in iter_workbook_tables(workbook)
+              if is_distribution_table(location)]
+    return path, tables
+
+
+def chunk_table(workbook, table_name, table_data, location, chunk_size):
+    # Splits a table into chunks of at most chunk_size rows. Each chunk gets its own TableLocation, so that cell
+    # references still point at the right spreadsheet rows.
+    for start in range(0, max(len(table_data), 1), chunk_size):
+        chunk_location = TableLocation(location.sheet, location.first_row + start, location.first_col,
+                                       location.header)
+        yield workbook, table_name, table_data[start:start + chunk_size], chunk_location
+
+
+def _lint_chunk(chunk):
+    return lint_rows(*chunk)
+
+
+class LintReport:
+    def __init__(self):
+        self.workbooks = 0
+        self.tables = 0
+        self.rows = 0
+        self.issues = []
+
+    def counts(self) -> Counter:
+        return Counter(issue.severity for issue in self.issues)
+
+    @property
+    def has_errors(self) -> bool:
+        return any(issue.severity == "error" for issue in self.issues)
+
+    def to_json(self) -> str:
+        counts = self.counts()
+        return json.dumps(OrderedDict([
+            ("workbooks", self.workbooks),
+            ("tables", self.tables),
+            ("rows", self.rows),
+            ("counts", OrderedDict((severity, counts[severity]) for severity in ("error", "warning", "info"))),
+            ("issues", [issue._asdict() for issue in self.issues]),
+        ]), indent=2)
+
+    def __str__(self):
+        lines = ["%s: %s [%s] %s" % (issue.cell, issue.severity, issue.check, issue.message)
+                 if self.workbooks == 1 else
+                 "%s %s: %s [%s] %s" % (os.path.basename(issue.workbook), issue.cell, issue.severity, issue.check,
+                                        issue.message)
+                 for issue in self.issues]
+        counts = self.counts()
+        lines.append("Checked %d row(s) in %d table(s) of %d workbook(s): %d error(s), %d warning(s), %d info."
+                     % (self.rows, self.tables, self.workbooks, counts["error"], counts["warning"], counts["info"]))
+        return "\n".join(lines)
+
+
+@instrumentation.timed("lint_workbooks")
+def lint_workbooks(paths, jobs=None, chunk_size=250):
+    # Lints every workbook in paths. jobs is the number of worker processes (default: one per CPU);
+    # with jobs=1 everything runs in this process.
+    report = LintReport()
+    executor = ProcessPoolExecutor(jobs) if jobs != 1 else None
+    map_function = executor.map if executor is not None else map
+    try:
+        workbook_tables = list(map_function(read_workbook_tables, paths))
+
+        chunks = []
+        for path, tables in workbook_tables:
+            report.workbooks += 1
+            for table_name, table_data, location in tables:
+                report.tables += 1
+                report.rows += sum(1 for row in table_data if not _is_blank(row))
+                chunks.extend(chunk_table(path, table_name, table_data, location, chunk_size))
+
+        named_rows = defaultdict(list)
+        issues_by_workbook = defaultdict(list)
+        for chunk, (issues, names) in zip(chunks, map_function(_lint_chunk, chunks)):
+            issues_by_workbook[chunk[0]].extend(issues)
+            named_rows[chunk[0]].extend(names)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    names = NameRegistry()
+    for path, tables in workbook_tables:
+        names.source = os.path.basename(path) if len(workbook_tables) > 1 else None
+        report.issues.extend(issues_by_workbook[path])
+        report.issues.extend(lint_names(path, named_rows[path], names))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check Sprocket2 workbooks for mistakes.")
+    parser.add_argument("workbooks", nargs="+", help="Workbooks to check.")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON to this file ('-' for stdout).")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of worker processes. Default: one per CPU.")
+    parser.add_argument("--chunk-size", type=int, default=250, help="Rows per unit of work.")
+    parser.add_argument("--stats", action="store_true", help="Print timings.")
+    args = parser.parse_args(argv)
+
+    if args.stats:
+        instrumentation.enable()
+
+    report = lint_workbooks(args.workbooks, args.jobs, args.chunk_size)
+
+    if args.json == "-":
+        print(report.to_json())
+    else:
+        print(report)
+        if args.json:
+            with open(args.json, "w") as f:
+                f.write(report.to_json())
+    if args.stats:
+        print(instrumentation.report_table())
+
+    sys.exit(1 if report.has_errors else 0)
+
+
+class TestLintRow(unittest.TestCase):
+    header = ["Type", "name", "inherits", "color", "OreBlock", "Size_avg", "Size_range", "Size_type"]
+    location = TableLocation("Veins", 8, 1, header)
+
+    def lint(self, **values):
+        row = OrderedDict((column, values.get(column)) for column in self.header)
+        return [(cell, severity, check) for cell, severity, check, message in lint_row(row, 0, self.location)]
+
+    def test_good_row(self):
+        self.assertEqual(self.lint(Type="Distribution", name="Iron", color="3366ff", OreBlock="minecraft:iron_ore, 1;",
+                                   Size_avg=":= 1.5 * oreSize", Size_range=2, Size_type="normal"), [])
+
+    def test_bad_cells(self):
+        self.assertEqual(self.lint(Type="Distrib", name=" ", color="33", OreBlock="minecraft:iron_ore;",
+                                   Size_avg=":= 1.5 * oreSize'", Size_range="-1", Size_type="Gaussian"),
+                         [("Veins!A9", "error", "type"), ("Veins!B9", "error", "name"),
+                          ("Veins!D9", "error", "color"), ("Veins!F9", "error", "setting"),
+                          ("Veins!G9", "warning", "setting"), ("Veins!H9", "error", "setting"),
+                          ("Veins!E9", "error", "weighted list")])
+
+    def test_number_problems(self):
+        self.assertIsNone(_number_problem("0.25"))
+        self.assertIsNone(_number_problem(":= (8 / 64) * dimension.groundLevel"))
+        self.assertIn("Expected ')'", _number_problem(":= (8 / 64 * oreSize"))
+        self.assertIn("Unexpected character \"'\"", _number_problem(":= 1.5 * oreSize'"))
+        self.assertIn("neither", _number_problem("lots"))
+
+
+class TestLintNames(unittest.TestCase):
+    def test_names(self):
+        named_rows = [
+            NamedRow("Veins!D9", "PresetMine", "Preset", None, "Veins!E9"),
+            NamedRow("Veins!D10", "Iron", "Distribution", "PresetMine", "Veins!E10"),
+            NamedRow("Veins!D11", "Iron", "Distribution", "PresetHugeVeins", "Veins!E11"),
+            NamedRow("Veins!D12", "Gold", "Distribution", "Iron", "Veins!E12"),
+            NamedRow("Veins!D13", "Tin", "Distribution", "PresetNope", "Veins!E13"),
+        ]
+        issues = lint_names("a.xlsx", named_rows)
+        self.assertEqual([(i.cell, i.severity, i.check) for i in issues],
+                         [("Veins!D11", "error", "name"), ("Veins!E12", "warning", "inherits"),
+                          ("Veins!E13", "error", "inherits")])
+
+    def test_names_across_workbooks(self):
+        names = NameRegistry()
+        names.source = "a.xlsx"
+        lint_names("a.xlsx", [NamedRow("Veins!D9", "Iron", "Distribution", None, "Veins!E9")], names)
+        names.source = "b.xlsx"
+        issues = lint_names("b.xlsx", [NamedRow("Veins!D20", "Iron", "Preset", None, "Veins!E20")], names)
+        self.assertEqual([(i.workbook, i.cell) for i in issues], [("b.xlsx", "Veins!D20")])
+        self.assertIn("distribution at a.xlsx Veins!D9", issues[0].message)
+
+
+class TestChunks(unittest.TestCase):
+    def test_cell_references_survive_chunking(self):
+        header = ["Type", "name"]
+        table_data = [OrderedDict(zip(header, ["Distribution", "row%d" % i])) for i in range(5)]
+        location = TableLocation("Veins", 8, 1, header)
+        chunks = list(chunk_table("a.xlsx", "Veins_Presets", table_data, location, 2))
+        self.assertEqual(len(chunks), 3)
+        workbook, table_name, rows, chunk_location = chunks[2]
+        self.assertEqual(rows[0]["name"], "row4")
+        self.assertEqual(chunk_location.cell_reference(0, "name"), location.cell_reference(4, "name"))
+
+
+class TestLintWorkbooks(unittest.TestCase):
+    test_file_path = "./Sprocket2 Spreadsheet.xlsx"
+
+    def test_spreadsheet(self):
+        report = lint_workbooks([self.test_file_path], jobs=1, chunk_size=3)
+        self.assertEqual(report.tables, 2)
+        # The StandardGen examples inherit from "CoalAndDiamonds", which the workbook never defines.
+        self.assertIn(("StandardGen!F11", "inherits"), [(i.cell, i.check) for i in report.issues])
+        # ":= 1.5 * oreSize'" has a stray quote.
+        self.assertIn("setting", [i.check for i in report.issues if i.severity == "error"])
+
+        data = json.loads(report.to_json())
+        self.assertEqual(data["counts"]["error"], report.counts()["error"])
+
+    def test_parallel_matches_serial(self):
+        serial = lint_workbooks([self.test_file_path], jobs=1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            copy_path = os.path.join(temp_dir, "copy.xlsx")
+            shutil.copyfile(self.test_file_path, copy_path)
+            parallel = lint_workbooks([self.test_file_path, copy_path], jobs=2, chunk_size=4)
+        self.assertEqual(parallel.workbooks, 2)
+        self.assertEqual([i for i in parallel.issues if i.workbook == self.test_file_path], serial.issues)
+        copy_issues = [i for i in parallel.issues if i.workbook == copy_path]
+        self.assertEqual([i for i in copy_issues if i.check != "name"], [i._replace(workbook=copy_path)
+                                                                          for i in serial.issues])
+        # Every name in the copy clashes with the same name in the original.
+        clashes = [i for i in copy_issues if i.check == "name"]
+        self.assertEqual(len(clashes), 13)
+        self.assertIn("Sprocket2 Spreadsheet.xlsx Veins!", clashes[-1].message)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5629 +0,0 @@
-blocks = [
-    ("abyssalcraft:abybrick", "tile.abybrick.name",),
-    ("abyssalcraft:abybutton", "Abyssal Stone Button",),
-    ("abyssalcraft:abycopore", "Abyssal Copper Ore",),
-    ("abyssalcraft:abycorore", "Abyssal Coralium Ore",),
-    ("abyssalcraft:abydiaore", "Abyssal Diamond Ore",),
-    ("abyssalcraft:abydreadbrick", "tile.abydreadbrick.name",),
-    ("abyssalcraft:abydreadbrickfence", "Abyssalnite Stone Brick Fence",),
-    ("abyssalcraft:abydreadbrickslab1", "Abyssalnite Stone Brick Slab",),
-    ("abyssalcraft:abydreadbrickslab2", "Abyssalnite Stone Brick Doubleslab",),
-    ("abyssalcraft:abydreadbrickstairs", "Abyssalnite Stone Brick Stairs",),
-    ("abyssalcraft:abydreadore", "Dreadlands Abyssalnite Ore",),
-    ("abyssalcraft:abyfence", "Abyssal Stone Brick Fence",),
-    ("abyssalcraft:abygolore", "Abyssal Gold Ore",),
-    ("abyssalcraft:abyiroore", "Abyssal Iron Ore",),
-    ("abyssalcraft:abylcorore", "Liquified Coralium Ore",),
-    ("abyssalcraft:abynitore", "Abyssal Nitre Ore",),
-    ("abyssalcraft:abyore", "Abyssalnite Ore",),
-    ("abyssalcraft:abypcorore", "Pearlescent Coralium Ore",),
-    ("abyssalcraft:abyportal", "Abyssal Gateway",),
-    ("abyssalcraft:abypplate", "Abyssal Stone Pressure Plate",),
-    ("abyssalcraft:abyslab1", "Abyssal Stone Brick Slab",),
-    ("abyssalcraft:abyslab2", "Abyssal Stone Brick Doubleslab",),
-    ("abyssalcraft:abyssalcobblestoneslab1", "Abyssal Cobblestone Slab",),
-    ("abyssalcraft:abyssalcobblestoneslab2", "Abyssal Cobblestone Slab",),
-    ("abyssalcraft:abyssalcobblestonestairs", "Abyssal Cobblestone Stairs",),
-    ("abyssalcraft:abyssalcobblestonewall", "tile.abyssalcobblestonewall.normal.name",),
-    ("abyssalcraft:abyssalnitecobblestoneslab1", "Abyssalnite Cobblestone Slab",),
-    ("abyssalcraft:abyssalnitecobblestoneslab2", "Abyssalnite Cobblestone Slab",),
-    ("abyssalcraft:abyssalnitecobblestonestairs", "Abyssalnite Cobblestone Stairs",),
-    ("abyssalcraft:abyssalnitecobblestonewall", "tile.abyssalnitecobblestonewall.normal.name",),
-    ("abyssalcraft:abyssalsand", "Abyssal Sand",),
-    ("abyssalcraft:abyssalsandglass", "Abyssal Sand Glass",),
-    ("abyssalcraft:abystairs", "Abyssal Stone Brick Stairs",),
-    ("abyssalcraft:abytinore", "Abyssal Tin Ore",),
-    ("abyssalcraft:altar", "Altar",),
-    ("abyssalcraft:antiwater", "Liquid Antimatter",),
-    ("abyssalcraft:chagarothspawner", "Cha'garoth Spawner Block",),
-    ("abyssalcraft:cobblestone", "tile.cobblestone.name",),
-    ("abyssalcraft:coraliumcobblestoneslab1", "Coralium Cobblestone Slab",),
-    ("abyssalcraft:coraliumcobblestoneslab2", "Coralium Cobblestone Slab",),
-    ("abyssalcraft:coraliumcobblestonestairs", "Coralium Cobblestone Stairs",),
-    ("abyssalcraft:coraliumcobblestonewall", "tile.coraliumcobblestonewall.normal.name",),
-    ("abyssalcraft:coraliumfire", "Coralium Fire",),
-    ("abyssalcraft:coraliumore", "Coralium Ore",),
-    ("abyssalcraft:coraliumstone", "Coralium Infused Stone",),
-    ("abyssalcraft:crate", "Crate",),
-    ("abyssalcraft:crystalcluster", "tile.crystalcluster.name",),
-    ("abyssalcraft:crystalcluster2", "tile.crystalcluster2.name",),
-    ("abyssalcraft:crystallizer", "Crystallizer",),
-    ("abyssalcraft:crystallizer_on", "tile.crystallizer_on.name",),
-    ("abyssalcraft:cstonebrick", "tile.cstonebrick.name",),
-    ("abyssalcraft:cstonebrickfence", "Coralium Brick Fence",),
-    ("abyssalcraft:cstonebrickslab1", "Coralium Brick Slab",),
-    ("abyssalcraft:cstonebrickslab2", "Coralium Brick Doubleslab",),
-    ("abyssalcraft:cstonebrickstairs", "Coralium Brick Stairs",),
-    ("abyssalcraft:cstonebutton", "Coralium Stone Button",),
-    ("abyssalcraft:cstonepplate", "Coralium Stone Pressure Plate",),
-    ("abyssalcraft:cwater", "Liquid Coralium",),
-    ("abyssalcraft:darkbrickslab1", "Darkstone Brick Slab",),
-    ("abyssalcraft:darkbrickslab2", "Darkstone Brick Doubleslab",),
-    ("abyssalcraft:darkcobbleslab1", "Darkstone Cobblestone Slab",),
-    ("abyssalcraft:darkcobbleslab2", "Darkstone Cobblestone Doubleslab",),
-    ("abyssalcraft:darkethaxiumbrick", "tile.darkethaxiumbrick.name",),
-    ("abyssalcraft:darkethaxiumbrickfence", "Dark Ethaxium Brick Fence",),
-    ("abyssalcraft:darkethaxiumbrickslab1", "Dark Ethaxium Brick Slab",),
-    ("abyssalcraft:darkethaxiumbrickslab2", "Dark Ethaxium Brick Doubleslab",),
-    ("abyssalcraft:darkethaxiumbrickstairs", "Dark Ethaxium Brick Stairs",),
-    ("abyssalcraft:darkethaxiumpillar", "Dark Ethaxium Pillar",),
-    ("abyssalcraft:darkstone_brick", "tile.darkstone_brick.name",),
-    ("abyssalcraft:darkstoneslab1", "Darkstone Slab",),
-    ("abyssalcraft:darkstoneslab2", "Darkstone Doubleslab",),
-    ("abyssalcraft:dbstairs", "Darkstone Brick Stairs",),
-    ("abyssalcraft:dcstairs", "Darkstone Cobblestone Stairs",),
-    ("abyssalcraft:decorativestatue", "tile.statue.name",),
-    ("abyssalcraft:dghead", "Depths Ghoul head",),
-    ("abyssalcraft:dltbutton", "Darklands Oak Wood Button",),
-    ("abyssalcraft:dltfence", "Darklands Oak Wood Fence",),
-    ("abyssalcraft:dltleaves", "Darklands Oak Leaves",),
-    ("abyssalcraft:dltlog", "Darklands Oak Wood",),
-    ("abyssalcraft:dltplank", "Darklands Oak Wood Planks",),
-    ("abyssalcraft:dltpplate", "Darklands Oak Wood Pressure Plate",),
-    ("abyssalcraft:dltsapling", "tile.dltsapling.oak.name",),
-    ("abyssalcraft:dltslab1", "Darklands Oak Wood Slab",),
-    ("abyssalcraft:dltslab2", "Darklands Oak Wood Doubleslab",),
-    ("abyssalcraft:dltstairs", "Darklands Oak Wood Stairs",),
-    ("abyssalcraft:dreadaltarbottom", "Altar of Cha'garoth (bottom)",),
-    ("abyssalcraft:dreadaltartop", "Altar of Cha'garoth (top)",),
-    ("abyssalcraft:dreadbrick", "tile.dreadbrick.name",),
-    ("abyssalcraft:dreadbrickfence", "Dreadstone Brick Fence",),
-    ("abyssalcraft:dreadbrickslab1", "Dreadstone Brick Slab",),
-    ("abyssalcraft:dreadbrickslab2", "Dreadstone Brick Doubleslab",),
-    ("abyssalcraft:dreadbrickstairs", "Dreadstone Brick Stairs",),
-    ("abyssalcraft:dreadfire", "Dreaded Fire",),
-    ("abyssalcraft:dreadgrass", "Dreadlands Grass",),
-    ("abyssalcraft:dreadguardspawner", "Dreadguard Spawner Block",),
-    ("abyssalcraft:dreadlandsdirt", "Dreadlands Dirt",),
-    ("abyssalcraft:dreadleaves", "Dreadlands Wood Leaves",),
-    ("abyssalcraft:dreadlog", "Dreadlands Wood Log",),
-    ("abyssalcraft:dreadore", "Dreaded Abyssalnite Ore",),
-    ("abyssalcraft:dreadplanks", "Dreadlands Wood Planks",),
-    ("abyssalcraft:dreadportal", "Dreadlands Gateway",),
-    ("abyssalcraft:dreadsapling", "tile.dreadsapling.oak.name",),
-    ("abyssalcraft:dreadstonecobblestoneslab1", "Dreadstone Cobblestone Slab",),
-    ("abyssalcraft:dreadstonecobblestoneslab2", "Dreadstone Cobblestone Slab",),
-    ("abyssalcraft:dreadstonecobblestonestairs", "Dreadstone Cobblestone Stairs",),
-    ("abyssalcraft:dreadstonecobblestonewall", "tile.dreadstonecobblestonewall.normal.name",),
-    ("abyssalcraft:drtfence", "Dreadlands Wood Fence",),
-    ("abyssalcraft:dsbfence", "Darkstone Brick Fence",),
-    ("abyssalcraft:dsbutton", "Darkstone Button",),
-    ("abyssalcraft:dscwall", "tile.dscwall.normal.name",),
-    ("abyssalcraft:dsglow", "Glowing Darkstone Bricks",),
-    ("abyssalcraft:dspplate", "Darkstone Pressure Plate",),
-    ("abyssalcraft:energycollector", "Energy Collector",),
-    ("abyssalcraft:energycontainer", "Energy Container",),
-    ("abyssalcraft:energydepositioner", "Energy Depositioner",),
-    ("abyssalcraft:energypedestal", "Energy Pedestal",),
-    ("abyssalcraft:energyrelay", "Energy Relay",),
-    ("abyssalcraft:engraver", "Engraver",),
-    ("abyssalcraft:engraver_on", "A House",),
-    ("abyssalcraft:ethaxiumbrick", "tile.ethaxiumbrick.name",),
-    ("abyssalcraft:ethaxiumbrickslab1", "Ethaxium Brick Slab",),
-    ("abyssalcraft:ethaxiumbrickslab2", "Ethaxium Brick Doubleslab",),
-    ("abyssalcraft:ethaxiumbrickstairs", "Ethaxium Brick Stairs",),
-    ("abyssalcraft:ethaxiumfence", "Ethaxium Brick Fence",),
-    ("abyssalcraft:ethaxiumpillar", "Ethaxium Pillar",),
-    ("abyssalcraft:fire", "Fire",),
-    ("abyssalcraft:fusedabyssalsand", "Fused Abyssal Sand",),
-    ("abyssalcraft:gatekeeperminionspawner", "Minion of The Gatekeeper Spawner Block",),
-    ("abyssalcraft:ingotblock", "tile.ingotblock.name",),
-    ("abyssalcraft:jzaharspawner", "J'zahar Spawner Block",),
-    ("abyssalcraft:luminousthistle", "Luminous Thistle",),
-    ("abyssalcraft:materializer", "Materializer",),
-    ("abyssalcraft:monolithpillar", "Monolith Stone Pillar",),
-    ("abyssalcraft:nitreore", "Nitre Ore",),
-    ("abyssalcraft:odb", "Oblivion Deathbomb",),
-    ("abyssalcraft:odbcore", "ODB Core",),
-    ("abyssalcraft:ohead", "Dr. Orange's head",),
-    ("abyssalcraft:omotholfire", "Omothol Fire",),
-    ("abyssalcraft:omotholportal", "Omothol Gateway",),
-    ("abyssalcraft:phead", "Pete's head",),
-    ("abyssalcraft:psdl", "Dreadlands Infused Powerstone",),
-    ("abyssalcraft:rendingpedestal", "Rending Pedestal",),
-    ("abyssalcraft:ritualaltar", "Ritual Altar",),
-    ("abyssalcraft:ritualpedestal", "Ritual Pedestal",),
-    ("abyssalcraft:sacrificialaltar", "Sacrificial Altar",),
-    ("abyssalcraft:shoggothbiomass", "Shoggoth Biomass",),
-    ("abyssalcraft:shoggothblock", "Shoggoth Ooze",),
-    ("abyssalcraft:solidlava", "Solid lava",),
-    ("abyssalcraft:statetransformer", "State Transformer",),
-    ("abyssalcraft:statue", "tile.statue.name",),
-    ("abyssalcraft:stone", "tile.stone.name",),
-    ("abyssalcraft:tieredenergycollector", "tile.tieredenergycollector.name",),
-    ("abyssalcraft:tieredenergycontainer", "tile.tieredenergycontainer.name",),
-    ("abyssalcraft:tieredenergypedestal", "tile.tieredenergypedestal.name",),
-    ("abyssalcraft:tieredenergyrelay", "tile.tieredenergyrelay.name",),
-    ("abyssalcraft:tieredsacrificialaltar", "tile.tieredsacrificialaltar.name",),
-    ("abyssalcraft:transmutator", "Transmutator",),
-    ("abyssalcraft:transmutator_on", "tile.transmutator_on.name",),
-    ("abyssalcraft:wastelandsthorn", "Wasteland's Thorn",),
-    ("abyssalcraft:whead", "Mr. Wilson's head",),
-    ("acintegration:moltenabyssalnite", "Molten Abyssalnite",),
-    ("acintegration:moltencoralium", "Molten Refined Coralium",),
-    ("acintegration:moltendreadium", "Molten Dreadium",),
-    ("actuallyadditions:block_atomic_reconstructor", "Atomic Reconstructor",),
-    ("actuallyadditions:block_battery_box", "Battery Box",),
-    ("actuallyadditions:block_bio_reactor", "Bio Reactor",),
-    ("actuallyadditions:block_black_lotus", "Black Lotus",),
-    ("actuallyadditions:block_breaker", "Auto-Breaker",),
-    ("actuallyadditions:block_canola", "Canola Plant",),
-    ("actuallyadditions:block_canola_oil", "Canola Oil",),
-    ("actuallyadditions:block_canola_press", "Canola Press",),
-    ("actuallyadditions:block_chiseled_quartz_slab", "Chiseled Black Quartz Slab",),
-    ("actuallyadditions:block_chiseled_quartz_stair", "Chiseled Black Quartz Stairs",),
-    ("actuallyadditions:block_chiseled_quartz_wall", "Chiseled Black Quartz Wall",),
-    ("actuallyadditions:block_coal_generator", "Coal Generator",),
-    ("actuallyadditions:block_coffee", "Coffee Plant",),
-    ("actuallyadditions:block_coffee_machine", "Coffee Maker",),
-    ("actuallyadditions:block_colored_lamp", "tile.actuallyadditions.block_colored_lamp.name",),
-    ("actuallyadditions:block_colored_lamp_on", "tile.actuallyadditions.block_colored_lamp_on.name",),
-    ("actuallyadditions:block_compost", "Compost",),
-    ("actuallyadditions:block_crystal", "tile.actuallyadditions.block_crystal.name",),
-    ("actuallyadditions:block_crystal_cluster_coal", "Black Crystal Cluster",),
-    ("actuallyadditions:block_crystal_cluster_diamond", "Light Blue Crystal Cluster",),
-    ("actuallyadditions:block_crystal_cluster_emerald", "Green Crystal Cluster",),
-    ("actuallyadditions:block_crystal_cluster_iron", "White Crystal Cluster",),
-    ("actuallyadditions:block_crystal_cluster_lapis", "Blue Crystal Cluster",),
-    ("actuallyadditions:block_crystal_cluster_redstone", "Red Crystal Cluster",),
-    ("actuallyadditions:block_crystal_empowered", "tile.actuallyadditions.block_crystal_empowered.name",),
-    ("actuallyadditions:block_crystal_oil", "Crystallized Oil",),
-    ("actuallyadditions:block_directional_breaker", "Long-Range Breaker",),
-    ("actuallyadditions:block_display_stand", "Display Stand",),
-    ("actuallyadditions:block_dropper", "Automatic Precision Dropper",),
-    ("actuallyadditions:block_empowered_oil", "Empowered Oil",),
-    ("actuallyadditions:block_empowerer", "Empowerer",),
-    ("actuallyadditions:block_energizer", "Energizer",),
-    ("actuallyadditions:block_enervator", "Enervator",),
-    ("actuallyadditions:block_farmer", "Farmer",),
-    ("actuallyadditions:block_feeder", "Automatic Feeder",),
-    ("actuallyadditions:block_fermenting_barrel", "Fermenting Barrel",),
-    ("actuallyadditions:block_firework_box", "Firework Box",),
-    ("actuallyadditions:block_fishing_net", "Fishing Net",),
-    ("actuallyadditions:block_flax", "Flax Plant",),
-    ("actuallyadditions:block_fluid_collector", "Fluid Collector",),
-    ("actuallyadditions:block_fluid_placer", "Fluid Placer",),
-    ("actuallyadditions:block_furnace_double", "Powered Furnace",),
-    ("actuallyadditions:block_furnace_solar", "Solar Panel",),
-    ("actuallyadditions:block_giant_chest", "Small Storage Crate",),
-    ("actuallyadditions:block_giant_chest_large", "Large Storage Crate",),
-    ("actuallyadditions:block_giant_chest_medium", "Medium Storage Crate",),
-    ("actuallyadditions:block_greenhouse_glass", "Greenhouse Glass",),
-    ("actuallyadditions:block_grinder", "Crusher",),
-    ("actuallyadditions:block_grinder_double", "Double Crusher",),
-    ("actuallyadditions:block_heat_collector", "Heat Collector",),
-    ("actuallyadditions:block_inputter", "ESD",),
-    ("actuallyadditions:block_inputter_advanced", "Advanced ESD",),
-    ("actuallyadditions:block_item_repairer", "Item Repairer",),
-    ("actuallyadditions:block_item_viewer", "Item Interface",),
-    ("actuallyadditions:block_item_viewer_hopping", "Hopping Item Interface",),
-    ("actuallyadditions:block_lamp_powerer", "Lamp Controller",),
-    ("actuallyadditions:block_laser_relay", "Energy Laser Relay",),
-    ("actuallyadditions:block_laser_relay_advanced", "Advanced Energy Laser Relay",),
-    ("actuallyadditions:block_laser_relay_extreme", "Extreme Energy Laser Relay",),
-    ("actuallyadditions:block_laser_relay_fluids", "Fluid Laser Relay",),
-    ("actuallyadditions:block_laser_relay_item", "Item Laser Relay",),
-    ("actuallyadditions:block_laser_relay_item_whitelist", "Advanced Item Laser Relay",),
-    ("actuallyadditions:block_lava_factory_controller", "Lava Factory Controller",),
-    ("actuallyadditions:block_leaf_generator", "Leaf-Eating Generator",),
-    ("actuallyadditions:block_miner", "Vertical Digger",),
-    ("actuallyadditions:block_misc", "tile.actuallyadditions.block_misc.name",),
-    ("actuallyadditions:block_oil_generator", "Oil Generator",),
-    ("actuallyadditions:block_phantom_booster", "Phantom Booster",),
-    ("actuallyadditions:block_phantom_breaker", "Phantom Breaker",),
-    ("actuallyadditions:block_phantom_energyface", "Phantom Energyface",),
-    ("actuallyadditions:block_phantom_liquiface", "Phantom Liquiface",),
-    ("actuallyadditions:block_phantom_placer", "Phantom Placer",),
-    ("actuallyadditions:block_phantom_redstoneface", "Phantom Redstoneface",),
-    ("actuallyadditions:block_phantomface", "Phantomface",),
-    ("actuallyadditions:block_pillar_quartz_slab", "Black Quartz Pillar Slab",),
-    ("actuallyadditions:block_pillar_quartz_stair", "Black Quartz Pillar Stairs",),
-    ("actuallyadditions:block_pillar_quartz_wall", "Black Quartz Pillar Wall",),
-    ("actuallyadditions:block_placer", "Auto-Placer",),
-    ("actuallyadditions:block_player_interface", "Player Interface",),
-    ("actuallyadditions:block_quartz_slab", "Black Quartz Slab",),
-    ("actuallyadditions:block_quartz_stair", "Black Quartz Stairs",),
-    ("actuallyadditions:block_quartz_wall", "Black Quartz Wall",),
-    ("actuallyadditions:block_ranged_collector", "Ranged Collector",),
-    ("actuallyadditions:block_refined_canola_oil", "Refined Canola Oil",),
-    ("actuallyadditions:block_rice", "Rice Plant",),
-    ("actuallyadditions:block_shock_suppressor", "Shock Absorber",),
-    ("actuallyadditions:block_smiley_cloud", "Smiley Cloud",),
-    ("actuallyadditions:block_testifi_bucks_green_fence", "Ethetic Green Wall",),
-    ("actuallyadditions:block_testifi_bucks_green_slab", "Ethetic Green Slab",),
-    ("actuallyadditions:block_testifi_bucks_green_stairs", "Ethetic Green Stairs",),
-    ("actuallyadditions:block_testifi_bucks_green_wall", "Ethetic Green Block",),
-    ("actuallyadditions:block_testifi_bucks_white_fence", "Ethetic Quartz Wall",),
-    ("actuallyadditions:block_testifi_bucks_white_slab", "Ethetic Quartz Slab",),
-    ("actuallyadditions:block_testifi_bucks_white_stairs", "Ethetic Quartz Stairs",),
-    ("actuallyadditions:block_testifi_bucks_white_wall", "Ethetic Quartz",),
-    ("actuallyadditions:block_tiny_torch", "Tiny Torch",),
-    ("actuallyadditions:block_treasure_chest", "Treasure Chest",),
-    ("actuallyadditions:block_wild", "tile.actuallyadditions.block_wild.name",),
-    ("actuallyadditions:block_xp_solidifier", "Experience Solidifier",),
-    ("advancedrocketry:advrocketmotor", "Advanced Rocket Engine",),
-    ("advancedrocketry:airlock_door", "item.smallAirlockDoor.name",),
-    ("advancedrocketry:alienleaves", "Lightwood Leaves",),
-    ("advancedrocketry:aliensapling", "Lightwood Sapling",),
-    ("advancedrocketry:alienwood", "Wood",),
-    ("advancedrocketry:altitudecontroller", "Altitude Controller",),
-    ("advancedrocketry:arcfurnace", "Electric Arc Furnace",),
-    ("advancedrocketry:astrobed", "tile.astroBed.name",),
-    ("advancedrocketry:beacon", "Beacon",),
-    ("advancedrocketry:biomescanner", "Biome Scanner",),
-    ("advancedrocketry:blastbrick", "HeatProof Brick",),
-    ("advancedrocketry:blocklens", "Lens",),
-    ("advancedrocketry:charcoallog", "Charcoal Log",),
-    ("advancedrocketry:chemicalreactor", "Chemical Reactor",),
-    ("advancedrocketry:circlelight", "Station Light",),
-    ("advancedrocketry:concrete", "Concrete",),
-    ("advancedrocketry:crystal", "Celestial Crystal",),
-    ("advancedrocketry:crystallizer", "Crystallizer",),
-    ("advancedrocketry:cuttingmachine", "Cutting Machine",),
-    ("advancedrocketry:datapipe", "Data Cable(Deprecated)",),
-    ("advancedrocketry:deployablerocketbuilder", "Unmanned Vehicle Assembler",),
-    ("advancedrocketry:drill", "Drill",),
-    ("advancedrocketry:electricmushroom", "Electric Mushroom",),
-    ("advancedrocketry:electrolyser", "Electrolyser",),
-    ("advancedrocketry:energypipe", "Energy Pipe(Deprecated)",),
-    ("advancedrocketry:forcefield", "Force Field",),
-    ("advancedrocketry:forcefieldprojector", "Force Field Projector",),
-    ("advancedrocketry:fuelingstation", "Fueling station",),
-    ("advancedrocketry:fueltank", "Liquid Fuel Tank",),
-    ("advancedrocketry:geode", "Geode Block",),
-    ("advancedrocketry:gravitycontroller", "Gravity Controller",),
-    ("advancedrocketry:gravitymachine", "Gravity Controller",),
-    ("advancedrocketry:guidancecomputer", "Guidance Computer",),
-    ("advancedrocketry:hotturf", "Oxidized Ferric Sand",),
-    ("advancedrocketry:hydrogenfluid", "Hydrogen",),
-    ("advancedrocketry:intake", "Gas Intake",),
-    ("advancedrocketry:landingpad", "Docking Pad",),
-    ("advancedrocketry:lathe", "Lathe",),
-    ("advancedrocketry:launchpad", "Launch Pad",),
-    ("advancedrocketry:lightsource", "tile.lightSource.name",),
-    ("advancedrocketry:liquidpipe", "Liquid Pipe(Deprecated)",),
-    ("advancedrocketry:liquidtank", "Pressurized Tank",),
-    ("advancedrocketry:loader", "tile.loader.name",),
-    ("advancedrocketry:metal0", "tile.metal.name",),
-    ("advancedrocketry:microwavereciever", "Microwave Receiver",),
-    ("advancedrocketry:monitoringstation", "Rocket Monitoring Station",),
-    ("advancedrocketry:moonturf", "Moon Turf",),
-    ("advancedrocketry:moonturf_dark", "Dark Moon Turf",),
-    ("advancedrocketry:nitrogenfluid", "Nitrogen",),
-    ("advancedrocketry:observatory", "Observatory",),
-    ("advancedrocketry:orientationcontroller", "Orientation Controller",),
-    ("advancedrocketry:oxygencharger", "Gas Charge Pad",),
-    ("advancedrocketry:oxygendetection", "Atmosphere Detector",),
-    ("advancedrocketry:oxygenfluid", "Oxygen",),
-    ("advancedrocketry:oxygenscrubber", "CO2 Scrubber",),
-    ("advancedrocketry:oxygenvent", "Oxygen Vent",),
-    ("advancedrocketry:pipesealer", "Pipe Seal",),
-    ("advancedrocketry:planetanalyser", "Astrobody Data Processor",),
-    ("advancedrocketry:planetholoselector", "Holographic Planet Selector",),
-    ("advancedrocketry:planetselector", "Planet Selector",),
-    ("advancedrocketry:planks", "Lightwood planks",),
-    ("advancedrocketry:platepress", "Small Plate Presser",),
-    ("advancedrocketry:precisionassemblingmachine", "Precision Assembler",),
-    ("advancedrocketry:quartzcrucible", "Quartz Crucible",),
-    ("advancedrocketry:railgun", "Railgun",),
-    ("advancedrocketry:rocketbuilder", "Rocket Assembling Machine",),
-    ("advancedrocketry:rocketfuel", "Rocket Fuel",),
-    ("advancedrocketry:rocketmotor", "Liquid Fueled Engine",),
-    ("advancedrocketry:rollingmachine", "Rolling Machine",),
-    ("advancedrocketry:satellitebuilder", "Satellite Builder",),
-    ("advancedrocketry:satellitecontrolcenter", "Satellite Terminal",),
-    ("advancedrocketry:sawblade", "Saw Blade Assembly",),
-    ("advancedrocketry:seat", "Seat",),
-    ("advancedrocketry:solargenerator", "Solar Generator",),
-    ("advancedrocketry:solarpanel", "Solar Panel",),
-    ("advancedrocketry:spaceelevatorcontroller", "Space Elevator",),
-    ("advancedrocketry:spacelaser", "Orbital Laser Drill",),
-    ("advancedrocketry:stationbuilder", "Space Station Assembler",),
-    ("advancedrocketry:stationmarker", "Station Docking Port",),
-    ("advancedrocketry:structuretower", "Structure Tower",),
-    ("advancedrocketry:suitworkstation", "Suit Workstation",),
-    ("advancedrocketry:terraformer", "Atmosphere Terraformer",),
-    ("advancedrocketry:thermitetorch", "Thermite Torch",),
-    ("advancedrocketry:unlittorch", "Extinguished Torch",),
-    ("advancedrocketry:vitrifiedsand", "Vitrified Sand",),
-    ("advancedrocketry:warpcore", "Warp Core",),
-    ("advancedrocketry:warpmonitor", "Warp Controller",),
-    ("advancedrocketry:wirelesstransciever", "Wireless Transciever",),
-    ("advgenerators:control", "Redstone Control Module",),
-    ("advgenerators:efficiency_upgrade_tier1", "Fuel/Air Mixer",),
-    ("advgenerators:efficiency_upgrade_tier2", "Gas Mix Compressor",),
-    ("advgenerators:eu_output_ev", "Extreme Voltage Emitter",),
-    ("advgenerators:eu_output_hv", "High Voltage Emitter",),
-    ("advgenerators:eu_output_iv", "Insane Voltage Emitter",),
-    ("advgenerators:eu_output_lv", "Low Voltage Emitter",),
-    ("advgenerators:eu_output_mv", "Medium Voltage Emitter",),
-    ("advgenerators:exchanger_controller", "Heat Exchanger Controller",),
-    ("advgenerators:fluid_input", "Fluid Intake Valve",),
-    ("advgenerators:fluid_output_select", "Fluid Output Valve",),
-    ("advgenerators:forge_output", "Forge Energy Emitter",),
-    ("advgenerators:fuel_tank", "Fuel Tank",),
-    ("advgenerators:gas_input", "Gas Intake Valve",),
-    ("advgenerators:generators_data_port", "Machine Data Port",),
-    ("advgenerators:heat_exchanger", "Heat Exchanger",),
-    ("advgenerators:heating_chamber", "Heating Chamber",),
-    ("advgenerators:item_input", "Item Input Port",),
-    ("advgenerators:item_output", "Item Output Port",),
-    ("advgenerators:mixing_chamber", "Mixing Chamber",),
-    ("advgenerators:power_capacitor_advanced", "Advanced Power Capacitor",),
-    ("advgenerators:power_capacitor_dense", "High Density Power Capacitor",),
-    ("advgenerators:power_capacitor_redstone", "Basic Power Capacitor",),
-    ("advgenerators:pressure_input", "Pressurized Input Valve",),
-    ("advgenerators:pressure_output_select", "Pressurized Output Valve",),
-    ("advgenerators:rf_output", "Flux Generator",),
-    ("advgenerators:sensor", "Sensor Module",),
-    ("advgenerators:steam", "Steam",),
-    ("advgenerators:steam_turbine_controller", "Steam Turbine Controller",),
-    ("advgenerators:syngas", "Syngas",),
-    ("advgenerators:syngas_controller", "Syngas Producer Controller",),
-    ("advgenerators:syngas_flaming", "tile.advgenerators.syngas_flaming.name",),
-    ("advgenerators:turbine_adv_alloy", "Advanced Alloy Turbine",),
-    ("advgenerators:turbine_bronze", "Bronze Turbine",),
-    ("advgenerators:turbine_controller", "Gas Turbine controller",),
-    ("advgenerators:turbine_enderium", "Enderium Turbine",),
-    ("advgenerators:turbine_gold", "Gold Plated Turbine",),
-    ("advgenerators:turbine_iron", "Iron Turbine",),
-    ("advgenerators:turbine_manyullyn", "Manyullyn Turbine",),
-    ("advgenerators:turbine_steel", "Steel Turbine",),
-    ("ae2stuff:encoder", "Pattern Encoder",),
-    ("ae2stuff:grower", "Crystal Growth Chamber",),
-    ("ae2stuff:inscriber", "Advanced Inscriber",),
-    ("ae2stuff:wireless", "Wireless Connector",),
-    ("appliedenergistics2:cable_bus", "AE2 Cable and/or Bus",),
-    ("appliedenergistics2:cell_workbench", "Cell Workbench",),
-    ("appliedenergistics2:charged_quartz_ore", "Charged Certus Quartz Ore",),
-    ("appliedenergistics2:charger", "Charger",),
-    ("appliedenergistics2:chest", "ME Chest",),
-    ("appliedenergistics2:chiseled_quartz_block", "Chiseled Certus Quartz Block",),
-    ("appliedenergistics2:chiseled_quartz_double_slab", "tile.appliedenergistics2.chiseled_quartz_double_slab.name",),
-    ("appliedenergistics2:chiseled_quartz_slab", "Chiseled Certus Quartz Slabs",),
-    ("appliedenergistics2:chiseled_quartz_stairs", "Chiseled Certus Quartz Stairs",),
-    ("appliedenergistics2:condenser", "Matter Condenser",),
-    ("appliedenergistics2:controller", "ME Controller",),
-    ("appliedenergistics2:crafting_accelerator", "Crafting Co-Processing Unit",),
-    ("appliedenergistics2:crafting_monitor", "Crafting Monitor",),
-    ("appliedenergistics2:crafting_storage_16k", "16k Crafting Storage",),
-    ("appliedenergistics2:crafting_storage_1k", "1k Crafting Storage",),
-    ("appliedenergistics2:crafting_storage_4k", "4k Crafting Storage",),
-    ("appliedenergistics2:crafting_storage_64k", "64k Crafting Storage",),
-    ("appliedenergistics2:crafting_unit", "Crafting Unit",),
-    ("appliedenergistics2:crank", "Wooden Crank",),
-    ("appliedenergistics2:creative_energy_cell", "Creative Energy Cell",),
-    ("appliedenergistics2:dense_energy_cell", "Dense Energy Cell",),
-    ("appliedenergistics2:drive", "ME Drive",),
-    ("appliedenergistics2:energy_acceptor", "Energy Acceptor",),
-    ("appliedenergistics2:energy_cell", "Energy Cell",),
-    ("appliedenergistics2:fluix_block", "Fluix Block",),
-    ("appliedenergistics2:fluix_double_slab", "tile.appliedenergistics2.fluix_double_slab.name",),
-    ("appliedenergistics2:fluix_slab", "Fluix Slabs",),
-    ("appliedenergistics2:fluix_stairs", "Fluix Stairs",),
-    ("appliedenergistics2:grindstone", "Quartz Grindstone",),
-    ("appliedenergistics2:inscriber", "Inscriber",),
-    ("appliedenergistics2:interface", "ME Interface",),
-    ("appliedenergistics2:io_port", "ME IO Port",),
-    ("appliedenergistics2:light_detector", "Light Detecting Fixture",),
-    ("appliedenergistics2:matrix_frame", "Matrix Frame",),
-    ("appliedenergistics2:molecular_assembler", "Molecular Assembler",),
-    ("appliedenergistics2:paint", "tile.appliedenergistics2.paint.name",),
-    ("appliedenergistics2:quantum_link", "ME Quantum Link Chamber",),
-    ("appliedenergistics2:quantum_ring", "ME Quantum Ring",),
-    ("appliedenergistics2:quartz_block", "Certus Quartz Block",),
-    ("appliedenergistics2:quartz_double_slab", "tile.appliedenergistics2.quartz_double_slab.name",),
-    ("appliedenergistics2:quartz_fixture", "Charged Quartz Fixture",),
-    ("appliedenergistics2:quartz_glass", "Quartz Glass",),
-    ("appliedenergistics2:quartz_growth_accelerator", "Crystal Growth Accelerator",),
-    ("appliedenergistics2:quartz_ore", "Certus Quartz Ore",),
-    ("appliedenergistics2:quartz_pillar", "Certus Quartz Pillar",),
-    ("appliedenergistics2:quartz_pillar_double_slab", "tile.appliedenergistics2.quartz_pillar_double_slab.name",),
-    ("appliedenergistics2:quartz_pillar_slab", "Certus Quartz Pillar Slabs",),
-    ("appliedenergistics2:quartz_pillar_stairs", "Certus Quartz Pillar Stairs",),
-    ("appliedenergistics2:quartz_slab", "Certus Quartz Slabs",),
-    ("appliedenergistics2:quartz_stairs", "Certus Quartz Stairs",),
-    ("appliedenergistics2:quartz_vibrant_glass", "Vibrant Quartz Glass",),
-    ("appliedenergistics2:security_station", "ME Security Terminal",),
-    ("appliedenergistics2:sky_compass", "Meteorite Compass",),
-    ("appliedenergistics2:sky_stone_block", "Sky Stone",),
-    ("appliedenergistics2:sky_stone_brick", "Sky Stone Brick",),
-    ("appliedenergistics2:sky_stone_brick_double_slab", "tile.appliedenergistics2.sky_stone_brick_double_slab.name",),
-    ("appliedenergistics2:sky_stone_brick_slab", "Sky Stone Brick Slabs",),
-    ("appliedenergistics2:sky_stone_brick_stairs", "Sky Stone Brick Stairs",),
-    ("appliedenergistics2:sky_stone_chest", "Sky Stone Chest",),
-    ("appliedenergistics2:sky_stone_double_slab", "tile.appliedenergistics2.sky_stone_double_slab.name",),
-    ("appliedenergistics2:sky_stone_slab", "Sky Stone Slabs",),
-    ("appliedenergistics2:sky_stone_small_brick", "Sky Stone Small Brick",),
-    ("appliedenergistics2:sky_stone_small_brick_double_slab",
-     "tile.appliedenergistics2.sky_stone_small_brick_double_slab.name",),
-    ("appliedenergistics2:sky_stone_small_brick_slab", "Sky Stone Small Brick Slabs",),
-    ("appliedenergistics2:sky_stone_small_brick_stairs", "Sky Stone Small Brick Stairs",),
-    ("appliedenergistics2:sky_stone_stairs", "Sky Stone Stairs",),
-    ("appliedenergistics2:smooth_sky_stone_block", "Sky Stone Block",),
-    ("appliedenergistics2:smooth_sky_stone_chest", "Sky Stone Block Chest",),
-    ("appliedenergistics2:smooth_sky_stone_double_slab", "tile.appliedenergistics2.smooth_sky_stone_double_slab.name",),
-    ("appliedenergistics2:smooth_sky_stone_slab", "Sky Stone Block Slabs",),
-    ("appliedenergistics2:smooth_sky_stone_stairs", "Sky Stone Block Stairs",),
-    ("appliedenergistics2:spatial_io_port", "Spatial IO Port",),
-    ("appliedenergistics2:spatial_pylon", "Spatial Pylon",),
-    ("appliedenergistics2:tiny_tnt", "Tiny TNT",),
-    ("appliedenergistics2:vibration_chamber", "Vibration Chamber",),
-    ("appliedenergistics2:wireless_access_point", "ME Wireless Access Point",),
-    ("aroma1997sdimension:miningore", "tile.aroma1997sdimension:miningOre.name",),
-    ("aroma1997sdimension:miningportal", "tile.null.name",),
-    ("aroma1997sdimension:portalframe", "Portal Frame",),
-    ("astralsorcery:blockaltar", "tile.blockaltar.name",),
-    ("astralsorcery:blockattunementaltar", "Attunement Altar",),
-    ("astralsorcery:blockattunementrelay", "Spectral Relay",),
-    ("astralsorcery:blockblackmarble", "tile.blockblackmarble.name",),
-    ("astralsorcery:blockbore", "Evershifting Fountain",),
-    ("astralsorcery:blockborehead", "tile.blockborehead.name",),
-    ("astralsorcery:blockcelestialcollectorcrystal", "Floating Crystal",),
-    ("astralsorcery:blockcelestialcrystals", "Celestial Crystal Cluster",),
-    ("astralsorcery:blockcelestialgateway", "Celestial Gateway",),
-    ("astralsorcery:blockchalice", "Containment Chalice",),
-    ("astralsorcery:blockcollectorcrystal", "Floating Crystal",),
-    ("astralsorcery:blockcustomflower", "tile.blockcustomflower.name",),
-    ("astralsorcery:blockcustomore", "tile.blockcustomore.name",),
-    ("astralsorcery:blockcustomsandore", "tile.blockcustomsandore.name",),
-    ("astralsorcery:blockfaketree", "",),
-    ("astralsorcery:blockflarelight", "Volatile Flare",),
-    ("astralsorcery:blocklens", "Lens",),
-    ("astralsorcery:blockmachine", "tile.blockmachine.name",),
-    ("astralsorcery:blockmapdrawingtable", "Stellar Refraction Table",),
-    ("astralsorcery:blockmarble", "tile.blockmarble.name",),
-    ("astralsorcery:blockmarbledoubleslab", "tile.blockmarbledoubleslab.name",),
-    ("astralsorcery:blockmarbleslab", "tile.blockmarbleslab.name",),
-    ("astralsorcery:blockmarblestairs", "Marble Stairs",),
-    ("astralsorcery:blockprism", "PrismLens",),
-    ("astralsorcery:blockrituallink", "Ritual Anchor",),
-    ("astralsorcery:blockritualpedestal", "Ritual Pedestal",),
-    ("astralsorcery:blockstarlightinfuser", "Starlight Infuser",),
-    ("astralsorcery:blockstructural", "tile.blockstructural.name",),
-    ("astralsorcery:blocktranslucentblock", "Translucent Block",),
-    ("astralsorcery:blocktreebeacon", "Tree Beacon",),
-    ("astralsorcery:blockvanishing", "tile.blockvanishing.name",),
-    ("astralsorcery:blockwell", "Lightwell",),
-    ("astralsorcery:blockworldilluminator", "Cave Illuminator",),
-    ("astralsorcery:fluidblockliquidstarlight", "tile.fluidblockliquidstarlight.name",),
-    ("bibliocraft:armorstand", "tile.BiblioCraft:ArmorStand.name",),
-    ("bibliocraft:bell", "Desk Bell",),
-    ("bibliocraft:bookcase", "tile.BiblioCraft:Bookcase.name",),
-    ("bibliocraft:bookcasecreative", "tile.BiblioCraft:BookcaseCreative.name",),
-    ("bibliocraft:case", "tile.BiblioCraft:Case.name",),
-    ("bibliocraft:clipboard", "tile.BiblioCraft:Clipboard.name",),
-    ("bibliocraft:clock", "tile.BiblioCraft:Clock.name",),
-    ("bibliocraft:cookiejar", "Cookie Jar",),
-    ("bibliocraft:desk", "tile.BiblioCraft:Desk.name",),
-    ("bibliocraft:dinnerplate", "Dinner Plate",),
-    ("bibliocraft:discrack", "Disc Rack",),
-    ("bibliocraft:fancysign", "tile.BiblioCraft:FancySign.name",),
-    ("bibliocraft:fancyworkbench", "tile.BiblioCraft:FancyWorkbench.name",),
-    ("bibliocraft:framedchest", "tile.BiblioCraft:FramedChest.name",),
-    ("bibliocraft:furniturepaneler", "tile.BiblioCraft:FurniturePaneler.name",),
-    ("bibliocraft:label", "tile.BiblioCraft:Label.name",),
-    ("bibliocraft:lampgold", "tile.BiblioCraft:LampGold.name",),
-    ("bibliocraft:lampiron", "tile.BiblioCraft:LampIron.name",),
-    ("bibliocraft:lanterngold", "tile.BiblioCraft:LanternGold.name",),
-    ("bibliocraft:lanterniron", "tile.BiblioCraft:LanternIron.name",),
-    ("bibliocraft:mapframe", "tile.BiblioCraft:MapFrame.name",),
-    ("bibliocraft:markerpole", "tile.BiblioCraft:MarkerPole.name",),
-    ("bibliocraft:paintingframeborderless", "tile.BiblioCraft:PaintingFrameBorderless.name",),
-    ("bibliocraft:paintingframefancy", "tile.BiblioCraft:PaintingFrameFancy.name",),
-    ("bibliocraft:paintingframeflat", "tile.BiblioCraft:PaintingFrameFlat.name",),
-    ("bibliocraft:paintingframemiddle", "tile.BiblioCraft:PaintingFrameMiddle.name",),
-    ("bibliocraft:paintingframesimple", "tile.BiblioCraft:PaintingFrameSimple.name",),
-    ("bibliocraft:paintingpress", "Painting Press",),
-    ("bibliocraft:potionshelf", "tile.BiblioCraft:PotionShelf.name",),
-    ("bibliocraft:printingpress", "Printing Press",),
-    ("bibliocraft:seat", "tile.BiblioCraft:Seat.name",),
-    ("bibliocraft:shelf", "tile.BiblioCraft:Shelf.name",),
-    ("bibliocraft:swordpedestal", "tile.BiblioCraft:SwordPedestal.name",),
-    ("bibliocraft:table", "tile.BiblioCraft:Table.name",),
-    ("bibliocraft:toolrack", "tile.BiblioCraft:ToolRack.name",),
-    ("bibliocraft:typesettingtable", "Typesetting Table",),
-    ("bibliocraft:typewriter", "tile.BiblioCraft:Typewriter.name",),
-    ("bigreactors:blockmetals", "tile.bigreactors:blockmetals.name",),
-    ("bigreactors:brore", "tile.bigreactors:brore.name",),
-    ("bigreactors:cyanite", "tile.bigreactors:cyanite.name",),
-    ("bigreactors:reactoraccessport", "tile.bigreactors:reactoraccessport.name",),
-    ("bigreactors:reactorcasing", "tile.bigreactors:reactorcasing.name",),
-    ("bigreactors:reactorcomputerport", "tile.bigreactors:reactorcomputerport.name",),
-    ("bigreactors:reactorcontroller", "tile.bigreactors:reactorcontroller.name",),
-    ("bigreactors:reactorcontrolrod", "tile.bigreactors:reactorcontrolrod.name",),
-    ("bigreactors:reactorcoolantport", "tile.bigreactors:reactorcoolantport.name",),
-    ("bigreactors:reactorcreativecoolantport", "tile.bigreactors:reactorcreativecoolantport.name",),
-    ("bigreactors:reactorfuelrod", "tile.bigreactors:reactorfuelrod.name",),
-    ("bigreactors:reactorglass", "tile.bigreactors:reactorglass.name",),
-    ("bigreactors:reactorpowertaprf", "tile.bigreactors:reactorpowertaprf.name",),
-    ("bigreactors:reactorpowertaptesla", "tile.bigreactors:reactorpowertaptesla.name",),
-    ("bigreactors:reactorrednetport", "tile.bigreactors:reactorrednetport.name",),
-    ("bigreactors:reactorredstoneport", "tile.bigreactors:reactorredstoneport.name",),
-    ("bigreactors:turbinebearing", "tile.bigreactors:turbinebearing.name",),
-    ("bigreactors:turbinecomputerport", "tile.bigreactors:turbinecomputerport.name",),
-    ("bigreactors:turbinecontroller", "tile.bigreactors:turbinecontroller.name",),
-    ("bigreactors:turbinecreativesteamgenerator", "tile.bigreactors:turbinecreativesteamgenerator.name",),
-    ("bigreactors:turbinefluidport", "tile.bigreactors:turbinefluidport.name",),
-    ("bigreactors:turbineglass", "tile.bigreactors:turbineglass.name",),
-    ("bigreactors:turbinehousing", "tile.bigreactors:turbinehousing.name",),
-    ("bigreactors:turbinepowertaprf", "tile.bigreactors:turbinepowertaprf.name",),
-    ("bigreactors:turbinepowertaptesla", "tile.bigreactors:turbinepowertaptesla.name",),
-    ("bigreactors:turbinerotorblade", "tile.bigreactors:turbinerotorblade.name",),
-    ("bigreactors:turbinerotorshaft", "tile.bigreactors:turbinerotorshaft.name",),
-    ("bigreactors:yellorium", "tile.bigreactors:yellorium.name",),
-    ("binniecore:storage", "tile.null.name",),
-    ("biomesoplenty:ash_block", "Ash Block",),
-    ("biomesoplenty:bamboo", "Bamboo",),
-    ("biomesoplenty:bamboo_thatching", "Bamboo Thatching",),
-    ("biomesoplenty:biome_block", "Biome Essence Ore",),
-    ("biomesoplenty:blood", "tile.null.name",),
-    ("biomesoplenty:cherry_door_block", "item.cherry_door_block.name",),
-    ("biomesoplenty:cherry_fence", "Cherry Fence",),
-    ("biomesoplenty:cherry_fence_gate", "Cherry Fence Gate",),
-    ("biomesoplenty:cherry_stairs", "Cherry Wood Stairs",),
-    ("biomesoplenty:coral", "tile.coral.name",),
-    ("biomesoplenty:crystal", "Celestial Crystal",),
-    ("biomesoplenty:dirt", "Dirt",),
-    ("biomesoplenty:double_other_slab", "tile.double_other_slab.name",),
-    ("biomesoplenty:double_plant", "tile.double_plant.name",),
-    ("biomesoplenty:double_wood_slab_0", "tile.double_wood_slab_0.name",),
-    ("biomesoplenty:double_wood_slab_1", "tile.double_wood_slab_1.name",),
-    ("biomesoplenty:dried_sand", "Dried Sand",),
-    ("biomesoplenty:ebony_door_block", "item.ebony_door_block.name",),
-    ("biomesoplenty:ebony_fence", "Ebony Fence",),
-    ("biomesoplenty:ebony_fence_gate", "Ebony Fence Gate",),
-    ("biomesoplenty:ebony_stairs", "Ebony Wood Stairs",),
-    ("biomesoplenty:ethereal_door_block", "item.ethereal_door_block.name",),
-    ("biomesoplenty:ethereal_fence", "Ethereal Fence",),
-    ("biomesoplenty:ethereal_fence_gate", "Ethereal Fence Gate",),
-    ("biomesoplenty:ethereal_stairs", "Ethereal Wood Stairs",),
-    ("biomesoplenty:eucalyptus_door_block", "item.eucalyptus_door_block.name",),
-    ("biomesoplenty:eucalyptus_fence", "Eucalyptus Fence",),
-    ("biomesoplenty:eucalyptus_fence_gate", "Eucalyptus Fence Gate",),
-    ("biomesoplenty:eucalyptus_stairs", "Eucalyptus Wood Stairs",),
-    ("biomesoplenty:farmland_0", "tile.farmland_0.name",),
-    ("biomesoplenty:farmland_1", "tile.farmland_1.name",),
-    ("biomesoplenty:fir_door_block", "item.fir_door_block.name",),
-    ("biomesoplenty:fir_fence", "Fir Fence",),
-    ("biomesoplenty:fir_fence_gate", "Fir Fence Gate",),
-    ("biomesoplenty:fir_stairs", "Fir Wood Stairs",),
-    ("biomesoplenty:flesh", "Flesh",),
-    ("biomesoplenty:flower_0", "tile.flower_0.name",),
-    ("biomesoplenty:flower_1", "tile.flower_1.name",),
-    ("biomesoplenty:flower_vine", "Flowering Vines",),
-    ("biomesoplenty:gem_block", "tile.gem_block.name",),
-    ("biomesoplenty:gem_ore", "tile.gem_ore.name",),
-    ("biomesoplenty:grass", "Grass Block",),
-    ("biomesoplenty:grass_path", "tile.grass_path.name",),
-    ("biomesoplenty:hard_ice", "Hardened Ice",),
-    ("biomesoplenty:hellbark_door_block", "item.hellbark_door_block.name",),
-    ("biomesoplenty:hellbark_fence", "Hellbark Fence",),
-    ("biomesoplenty:hellbark_fence_gate", "Hellbark Fence Gate",),
-    ("biomesoplenty:hellbark_stairs", "Hellbark Wood Stairs",),
-    ("biomesoplenty:hive", "tile.hive.name",),
-    ("biomesoplenty:honey", "tile.null.name",),
-    ("biomesoplenty:honey_block", "Honey Block",),
-    ("biomesoplenty:hot_spring_water", "tile.null.name",),
-    ("biomesoplenty:ivy", "Ivy",),
-    ("biomesoplenty:jacaranda_door_block", "item.jacaranda_door_block.name",),
-    ("biomesoplenty:jacaranda_fence", "Jacaranda Fence",),
-    ("biomesoplenty:jacaranda_fence_gate", "Jacaranda Fence Gate",),
-    ("biomesoplenty:jacaranda_stairs", "Jacaranda Wood Stairs",),
-    ("biomesoplenty:jelled_poison", "Jelled Poison",),
-    ("biomesoplenty:leaves_0", "tile.leaves_0.name",),
-    ("biomesoplenty:leaves_1", "tile.leaves_1.name",),
-    ("biomesoplenty:leaves_2", "tile.leaves_2.name",),
-    ("biomesoplenty:leaves_3", "tile.leaves_3.name",),
-    ("biomesoplenty:leaves_4", "tile.leaves_4.name",),
-    ("biomesoplenty:leaves_5", "tile.leaves_5.name",),
-    ("biomesoplenty:leaves_6", "tile.leaves_6.name",),
-    ("biomesoplenty:log_0", "tile.log_0.name",),
-    ("biomesoplenty:log_1", "tile.log_1.name",),
-    ("biomesoplenty:log_2", "tile.log_2.name",),
-    ("biomesoplenty:log_3", "tile.log_3.name",),
-    ("biomesoplenty:log_4", "tile.log_4.name",),
-    ("biomesoplenty:magic_door_block", "item.magic_door_block.name",),
-    ("biomesoplenty:magic_fence", "Magic Fence",),
-    ("biomesoplenty:magic_fence_gate", "Magic Fence Gate",),
-    ("biomesoplenty:magic_stairs", "Magic Wood Stairs",),
-    ("biomesoplenty:mahogany_door_block", "item.mahogany_door_block.name",),
-    ("biomesoplenty:mahogany_fence", "Mahogany Fence",),
-    ("biomesoplenty:mahogany_fence_gate", "Mahogany Fence Gate",),
-    ("biomesoplenty:mahogany_stairs", "Mahogany Wood Stairs",),
-    ("biomesoplenty:mangrove_door_block", "item.mangrove_door_block.name",),
-    ("biomesoplenty:mangrove_fence", "Mangrove Fence",),
-    ("biomesoplenty:mangrove_fence_gate", "Mangrove Fence Gate",),
-    ("biomesoplenty:mangrove_stairs", "Mangrove Wood Stairs",),
-    ("biomesoplenty:mud", "tile.mud.name",),
-    ("biomesoplenty:mud_brick_block", "Mud Bricks",),
-    ("biomesoplenty:mud_brick_stairs", "Mud Bricks Stairs",),
-    ("biomesoplenty:mushroom", "Mushroom",),
-    ("biomesoplenty:other_slab", "tile.other_slab.name",),
-    ("biomesoplenty:palm_door_block", "item.palm_door_block.name",),
-    ("biomesoplenty:palm_fence", "Palm Fence",),
-    ("biomesoplenty:palm_fence_gate", "Palm Fence Gate",),
-    ("biomesoplenty:palm_stairs", "Palm Wood Stairs",),
-    ("biomesoplenty:pine_door_block", "item.pine_door_block.name",),
-    ("biomesoplenty:pine_fence", "Pine Fence",),
-    ("biomesoplenty:pine_fence_gate", "Pine Fence Gate",),
-    ("biomesoplenty:pine_stairs", "Pine Wood Stairs",),
-    ("biomesoplenty:planks_0", "tile.planks_0.name",),
-    ("biomesoplenty:plant_0", "tile.plant_0.name",),
-    ("biomesoplenty:plant_1", "tile.plant_1.name",),
-    ("biomesoplenty:poison", "tile.null.name",),
-    ("biomesoplenty:redwood_door_block", "item.redwood_door_block.name",),
-    ("biomesoplenty:redwood_fence", "Redwood Fence",),
-    ("biomesoplenty:redwood_fence_gate", "Redwood Fence Gate",),
-    ("biomesoplenty:redwood_stairs", "Redwood Wood Stairs",),
-    ("biomesoplenty:sacred_oak_door_block", "item.sacred_oak_door_block.name",),
-    ("biomesoplenty:sacred_oak_fence", "Sacred Oak Fence",),
-    ("biomesoplenty:sacred_oak_fence_gate", "Sacred Oak Fence Gate",),
-    ("biomesoplenty:sacred_oak_stairs", "Sacred Oak Wood Stairs",),
-    ("biomesoplenty:sand", "tile.null.name",),
-    ("biomesoplenty:sapling_0", "tile.sapling_0.name",),
-    ("biomesoplenty:sapling_1", "tile.sapling_1.name",),
-    ("biomesoplenty:sapling_2", "tile.sapling_2.name",),
-    ("biomesoplenty:seaweed", "tile.seaweed.name",),
-    ("biomesoplenty:stone_formations", "tile.stone_formations.name",),
-    ("biomesoplenty:terrarium", "tile.terrarium.name",),
-    ("biomesoplenty:tree_moss", "Umbran Tree Moss",),
-    ("biomesoplenty:turnip_block", "Turnip",),
-    ("biomesoplenty:umbran_door_block", "item.umbran_door_block.name",),
-    ("biomesoplenty:umbran_fence", "Umbran Fence",),
-    ("biomesoplenty:umbran_fence_gate", "Umbran Fence Gate",),
-    ("biomesoplenty:umbran_stairs", "Umbran Wood Stairs",),
-    ("biomesoplenty:waterlily", "Lily Pad",),
-    ("biomesoplenty:white_sand", "White Sand",),
-    ("biomesoplenty:white_sandstone", "tile.white_sandstone.name",),
-    ("biomesoplenty:white_sandstone_stairs", "White Sandstone Stairs",),
-    ("biomesoplenty:willow_door_block", "item.willow_door_block.name",),
-    ("biomesoplenty:willow_fence", "Willow Fence",),
-    ("biomesoplenty:willow_fence_gate", "Willow Fence Gate",),
-    ("biomesoplenty:willow_stairs", "Willow Wood Stairs",),
-    ("biomesoplenty:willow_vine", "Willow Vine",),
-    ("biomesoplenty:wood_slab_0", "tile.wood_slab_0.name",),
-    ("biomesoplenty:wood_slab_1", "tile.wood_slab_1.name",),
-    ("blockcraftery:editable_block", "Framed Block",),
-    ("blockcraftery:editable_double_slab", "tile.editable_double_slab.name",),
-    ("blockcraftery:editable_inner_corner", "Framed Inner Corner",),
-    ("blockcraftery:editable_outer_corner", "Framed Outer Corner",),
-    ("blockcraftery:editable_slab", "Framed Slab",),
-    ("blockcraftery:editable_slant", "Framed Slant",),
-    ("blockcraftery:editable_stairs", "Framed Stairs",),
-    ("blockcraftery:editable_wall", "tile.editable_wall.normal.name",),
-    ("bloodmagic:alchemy_array", "&r&fAlchemy Array",),
-    ("bloodmagic:alchemy_table", "Alchemy Table",),
-    ("bloodmagic:altar", "Blood Altar",),
-    ("bloodmagic:blood_light", "Blood Light",),
-    ("bloodmagic:blood_rune", "tile.bloodmagic.rune..name",),
-    ("bloodmagic:blood_tank", "Blood Tank",),
-    ("bloodmagic:decorative_brick", "tile.bloodmagic..name",),
-    ("bloodmagic:demon_brick_1", "tile.bloodmagic.bricks1..name",),
-    ("bloodmagic:demon_brick_2", "tile.bloodmagic.bricks2..name",),
-    ("bloodmagic:demon_crucible", "Demon Crucible",),
-    ("bloodmagic:demon_crystal", "tile.bloodmagic.demonCrystal..name",),
-    ("bloodmagic:demon_crystallizer", "Demon Crystallizer",),
-    ("bloodmagic:demon_extras", "tile.bloodmagic.extras..name",),
-    ("bloodmagic:demon_light", "tile.bloodmagic.demonlight..name",),
-    ("bloodmagic:demon_pillar_1", "tile.bloodmagic.pillar1..name",),
-    ("bloodmagic:demon_pillar_2", "tile.bloodmagic.pillar2..name",),
-    ("bloodmagic:demon_pillar_cap_1", "tile.bloodmagic.pillarCap1..name",),
-    ("bloodmagic:demon_pillar_cap_2", "tile.bloodmagic.pillarCap2..name",),
-    ("bloodmagic:demon_pillar_cap_3", "tile.bloodmagic.pillarCap3..name",),
-    ("bloodmagic:demon_pylon", "Demon Pylon",),
-    ("bloodmagic:demon_stairs_1", "tile.bloodmagic.stairs1..name",),
-    ("bloodmagic:demon_stairs_2", "tile.bloodmagic.stairs2..name",),
-    ("bloodmagic:demon_stairs_3", "tile.bloodmagic.stairs3..name",),
-    ("bloodmagic:demon_wall_1", "tile.bloodmagic.wall1..name",),
-    ("bloodmagic:dimensional_portal", "Dimensional Portal",),
-    ("bloodmagic:incense_altar", "Incense Altar",),
-    ("bloodmagic:input_routing_node", "Input Routing Node",),
-    ("bloodmagic:inversion_pillar", "tile.bloodmagic.inversionpillar..name",),
-    ("bloodmagic:inversion_pillar_end", "tile.bloodmagic.inversionpillarend..name",),
-    ("bloodmagic:item_routing_node", "Routing Node",),
-    ("bloodmagic:life_essence", "Life Essence",),
-    ("bloodmagic:master_routing_node", "Master Routing Node",),
-    ("bloodmagic:mimic", "tile.bloodmagic.mimic..name",),
-    ("bloodmagic:output_routing_node", "Output Routing Node",),
-    ("bloodmagic:path", "tile.bloodmagic.path..name",),
-    ("bloodmagic:phantom", "Phantom Block",),
-    ("bloodmagic:ritual_controller", "tile.bloodmagic.stone.ritual..name",),
-    ("bloodmagic:ritual_stone", "tile.bloodmagic.ritualStone..name",),
-    ("bloodmagic:soul_forge", "Hellfire Forge",),
-    ("bloodmagic:spectral", "tile.bloodmagic.spectral.name",),
-    ("bloodmagic:teleposer", "Teleposer",),
-    ("botania:alchemycatalyst", "tile.alchemyCatalyst.name",),
-    ("botania:alfheimportal", "tile.alfheimPortal.name",),
-    ("botania:altar", "Altar",),
-    ("botania:altgrass", "tile.altGrass.name",),
-    ("botania:animatedtorch", "tile.animatedTorch.name",),
-    ("botania:avatar", "tile.avatar.name",),
-    ("botania:bellows", "tile.bellows.name",),
-    ("botania:bifrost", "tile.bifrost.name",),
-    ("botania:bifrostperm", "tile.bifrostPerm.name",),
-    ("botania:bifrostpermpane", "tile.bifrostPermPane.name",),
-    ("botania:biomestonea", "tile.biomeStoneA.name",),
-    ("botania:biomestonea0slab", "tile.biomeStoneA0Slab.name",),
-    ("botania:biomestonea0slabfull", "tile.biomeStoneA0SlabFull.name",),
-    ("botania:biomestonea0stairs", "tile.biomeStoneA0Stairs.name",),
-    ("botania:biomestonea0wall", "tile.biomeStoneA0Wall.normal.name",),
-    ("botania:biomestonea10slab", "tile.biomeStoneA10Slab.name",),
-    ("botania:biomestonea10slabfull", "tile.biomeStoneA10SlabFull.name",),
-    ("botania:biomestonea10stairs", "tile.biomeStoneA10Stairs.name",),
-    ("botania:biomestonea11slab", "tile.biomeStoneA11Slab.name",),
-    ("botania:biomestonea11slabfull", "tile.biomeStoneA11SlabFull.name",),
-    ("botania:biomestonea11stairs", "tile.biomeStoneA11Stairs.name",),
-    ("botania:biomestonea12slab", "tile.biomeStoneA12Slab.name",),
-    ("botania:biomestonea12slabfull", "tile.biomeStoneA12SlabFull.name",),
-    ("botania:biomestonea12stairs", "tile.biomeStoneA12Stairs.name",),
-    ("botania:biomestonea13slab", "tile.biomeStoneA13Slab.name",),
-    ("botania:biomestonea13slabfull", "tile.biomeStoneA13SlabFull.name",),
-    ("botania:biomestonea13stairs", "tile.biomeStoneA13Stairs.name",),
-    ("botania:biomestonea14slab", "tile.biomeStoneA14Slab.name",),
-    ("botania:biomestonea14slabfull", "tile.biomeStoneA14SlabFull.name",),
-    ("botania:biomestonea14stairs", "tile.biomeStoneA14Stairs.name",),
-    ("botania:biomestonea15slab", "tile.biomeStoneA15Slab.name",),
-    ("botania:biomestonea15slabfull", "tile.biomeStoneA15SlabFull.name",),
-    ("botania:biomestonea15stairs", "tile.biomeStoneA15Stairs.name",),
-    ("botania:biomestonea1slab", "tile.biomeStoneA1Slab.name",),
-    ("botania:biomestonea1slabfull", "tile.biomeStoneA1SlabFull.name",),
-    ("botania:biomestonea1stairs", "tile.biomeStoneA1Stairs.name",),
-    ("botania:biomestonea2slab", "tile.biomeStoneA2Slab.name",),
-    ("botania:biomestonea2slabfull", "tile.biomeStoneA2SlabFull.name",),
-    ("botania:biomestonea2stairs", "tile.biomeStoneA2Stairs.name",),
-    ("botania:biomestonea3slab", "tile.biomeStoneA3Slab.name",),
-    ("botania:biomestonea3slabfull", "tile.biomeStoneA3SlabFull.name",),
-    ("botania:biomestonea3stairs", "tile.biomeStoneA3Stairs.name",),
-    ("botania:biomestonea4slab", "tile.biomeStoneA4Slab.name",),
-    ("botania:biomestonea4slabfull", "tile.biomeStoneA4SlabFull.name",),
-    ("botania:biomestonea4stairs", "tile.biomeStoneA4Stairs.name",),
-    ("botania:biomestonea5slab", "tile.biomeStoneA5Slab.name",),
-    ("botania:biomestonea5slabfull", "tile.biomeStoneA5SlabFull.name",),
-    ("botania:biomestonea5stairs", "tile.biomeStoneA5Stairs.name",),
-    ("botania:biomestonea6slab", "tile.biomeStoneA6Slab.name",),
-    ("botania:biomestonea6slabfull", "tile.biomeStoneA6SlabFull.name",),
-    ("botania:biomestonea6stairs", "tile.biomeStoneA6Stairs.name",),
-    ("botania:biomestonea7slab", "tile.biomeStoneA7Slab.name",),
-    ("botania:biomestonea7slabfull", "tile.biomeStoneA7SlabFull.name",),
-    ("botania:biomestonea7stairs", "tile.biomeStoneA7Stairs.name",),
-    ("botania:biomestonea8slab", "tile.biomeStoneA8Slab.name",),
-    ("botania:biomestonea8slabfull", "tile.biomeStoneA8SlabFull.name",),
-    ("botania:biomestonea8stairs", "tile.biomeStoneA8Stairs.name",),
-    ("botania:biomestonea9slab", "tile.biomeStoneA9Slab.name",),
-    ("botania:biomestonea9slabfull", "tile.biomeStoneA9SlabFull.name",),
-    ("botania:biomestonea9stairs", "tile.biomeStoneA9Stairs.name",),
-    ("botania:biomestoneb", "tile.biomeStoneB.name",),
-    ("botania:biomestoneb0slab", "tile.biomeStoneB0Slab.name",),
-    ("botania:biomestoneb0slabfull", "tile.biomeStoneB0SlabFull.name",),
-    ("botania:biomestoneb0stairs", "tile.biomeStoneB0Stairs.name",),
-    ("botania:biomestoneb1slab", "tile.biomeStoneB1Slab.name",),
-    ("botania:biomestoneb1slabfull", "tile.biomeStoneB1SlabFull.name",),
-    ("botania:biomestoneb1stairs", "tile.biomeStoneB1Stairs.name",),
-    ("botania:biomestoneb2slab", "tile.biomeStoneB2Slab.name",),
-    ("botania:biomestoneb2slabfull", "tile.biomeStoneB2SlabFull.name",),
-    ("botania:biomestoneb2stairs", "tile.biomeStoneB2Stairs.name",),
-    ("botania:biomestoneb3slab", "tile.biomeStoneB3Slab.name",),
-    ("botania:biomestoneb3slabfull", "tile.biomeStoneB3SlabFull.name",),
-    ("botania:biomestoneb3stairs", "tile.biomeStoneB3Stairs.name",),
-    ("botania:biomestoneb4slab", "tile.biomeStoneB4Slab.name",),
-    ("botania:biomestoneb4slabfull", "tile.biomeStoneB4SlabFull.name",),
-    ("botania:biomestoneb4stairs", "tile.biomeStoneB4Stairs.name",),
-    ("botania:biomestoneb5slab", "tile.biomeStoneB5Slab.name",),
-    ("botania:biomestoneb5slabfull", "tile.biomeStoneB5SlabFull.name",),
-    ("botania:biomestoneb5stairs", "tile.biomeStoneB5Stairs.name",),
-    ("botania:biomestoneb6slab", "tile.biomeStoneB6Slab.name",),
-    ("botania:biomestoneb6slabfull", "tile.biomeStoneB6SlabFull.name",),
-    ("botania:biomestoneb6stairs", "tile.biomeStoneB6Stairs.name",),
-    ("botania:biomestoneb7slab", "tile.biomeStoneB7Slab.name",),
-    ("botania:biomestoneb7slabfull", "tile.biomeStoneB7SlabFull.name",),
-    ("botania:biomestoneb7stairs", "tile.biomeStoneB7Stairs.name",),
-    ("botania:blazeblock", "tile.blazeBlock.name",),
-    ("botania:brewery", "tile.brewery.name",),
-    ("botania:buriedpetals", "tile.buriedPetals.name",),
-    ("botania:cacophoniumblock", "tile.cacophoniumBlock.name",),
-    ("botania:cellblock", "tile.cellBlock.name",),
-    ("botania:cocoon", "tile.cocoon.name",),
-    ("botania:conjurationcatalyst", "tile.conjurationCatalyst.name",),
-    ("botania:corporeacrystalcube", "tile.corporeaCrystalCube.name",),
-    ("botania:corporeafunnel", "tile.corporeaFunnel.name",),
-    ("botania:corporeaindex", "tile.corporeaIndex.name",),
-    ("botania:corporeainterceptor", "tile.corporeaInterceptor.name",),
-    ("botania:corporearetainer", "tile.corporeaRetainer.name",),
-    ("botania:custombrick", "tile.customBrick.name",),
-    ("botania:distributor", "tile.distributor.name",),
-    ("botania:doubleflower1", "tile.doubleFlower1.name",),
-    ("botania:doubleflower2", "tile.doubleFlower2.name",),
-    ("botania:dreamwood", "tile.dreamwood.name",),
-    ("botania:dreamwood0slab", "tile.dreamwood0Slab.name",),
-    ("botania:dreamwood0slabfull", "tile.dreamwood0SlabFull.name",),
-    ("botania:dreamwood0stairs", "tile.dreamwood0Stairs.name",),
-    ("botania:dreamwood0wall", "tile.dreamwood0Wall.normal.name",),
-    ("botania:dreamwood1slab", "tile.dreamwood1Slab.name",),
-    ("botania:dreamwood1slabfull", "tile.dreamwood1SlabFull.name",),
-    ("botania:dreamwood1stairs", "tile.dreamwood1Stairs.name",),
-    ("botania:elfglass", "tile.elfGlass.name",),
-    ("botania:elfglasspane", "tile.elfGlassPane.name",),
-    ("botania:enchantedsoil", "tile.enchantedSoil.name",),
-    ("botania:enchanter", "tile.enchanter.name",),
-    ("botania:endereyeblock", "tile.enderEyeBlock.name",),
-    ("botania:fakeair", "tile.fakeAir.name",),
-    ("botania:felpumpkin", "tile.felPumpkin.name",),
-    ("botania:floatingspecialflower", "tile.floatingSpecialFlower.name",),
-    ("botania:flower", "tile.flower.name",),
-    ("botania:forestdrum", "tile.forestDrum.name",),
-    ("botania:foresteye", "tile.forestEye.name",),
-    ("botania:gaiaheadblock", "tile.skull.skeleton.name",),
-    ("botania:ghostrail", "tile.ghostRail.name",),
-    ("botania:hourglass", "tile.hourglass.name",),
-    ("botania:incenseplate", "tile.incensePlate.name",),
-    ("botania:lightlauncher", "tile.lightLauncher.name",),
-    ("botania:lightrelay", "tile.lightRelay.name",),
-    ("botania:livingrock", "tile.livingrock.name",),
-    ("botania:livingrock0slab", "tile.livingrock0Slab.name",),
-    ("botania:livingrock0slabfull", "tile.livingrock0SlabFull.name",),
-    ("botania:livingrock0stairs", "tile.livingrock0Stairs.name",),
-    ("botania:livingrock0wall", "tile.livingrock0Wall.normal.name",),
-    ("botania:livingrock1slab", "tile.livingrock1Slab.name",),
-    ("botania:livingrock1slabfull", "tile.livingrock1SlabFull.name",),
-    ("botania:livingrock1stairs", "tile.livingrock1Stairs.name",),
-    ("botania:livingwood", "tile.livingwood.name",),
-    ("botania:livingwood0slab", "tile.livingwood0Slab.name",),
-    ("botania:livingwood0slabfull", "tile.livingwood0SlabFull.name",),
-    ("botania:livingwood0stairs", "tile.livingwood0Stairs.name",),
-    ("botania:livingwood0wall", "tile.livingwood0Wall.normal.name",),
-    ("botania:livingwood1slab", "tile.livingwood1Slab.name",),
-    ("botania:livingwood1slabfull", "tile.livingwood1SlabFull.name",),
-    ("botania:livingwood1stairs", "tile.livingwood1Stairs.name",),
-    ("botania:manabomb", "tile.manaBomb.name",),
-    ("botania:manadetector", "tile.manaDetector.name",),
-    ("botania:manaflame", "tile.manaFlame.name",),
-    ("botania:managlass", "tile.manaGlass.name",),
-    ("botania:managlasspane", "tile.manaGlassPane.name",),
-    ("botania:manavoid", "tile.manaVoid.name",),
-    ("botania:miniisland", "tile.miniIsland.name",),
-    ("botania:mushroom", "Mushroom",),
-    ("botania:opencrate", "tile.openCrate.name",),
-    ("botania:pavement", "tile.pavement.name",),
-    ("botania:pavement0slab", "tile.pavement0Slab.name",),
-    ("botania:pavement0slabfull", "tile.pavement0SlabFull.name",),
-    ("botania:pavement0stairs", "tile.pavement0Stairs.name",),
-    ("botania:pavement1slab", "tile.pavement1Slab.name",),
-    ("botania:pavement1slabfull", "tile.pavement1SlabFull.name",),
-    ("botania:pavement1stairs", "tile.pavement1Stairs.name",),
-    ("botania:pavement2slab", "tile.pavement2Slab.name",),
-    ("botania:pavement2slabfull", "tile.pavement2SlabFull.name",),
-    ("botania:pavement2stairs", "tile.pavement2Stairs.name",),
-    ("botania:pavement3slab", "tile.pavement3Slab.name",),
-    ("botania:pavement3slabfull", "tile.pavement3SlabFull.name",),
-    ("botania:pavement3stairs", "tile.pavement3Stairs.name",),
-    ("botania:pavement4slab", "tile.pavement4Slab.name",),
-    ("botania:pavement4slabfull", "tile.pavement4SlabFull.name",),
-    ("botania:pavement4stairs", "tile.pavement4Stairs.name",),
-    ("botania:pavement5slab", "tile.pavement5Slab.name",),
-    ("botania:pavement5slabfull", "tile.pavement5SlabFull.name",),
-    ("botania:pavement5stairs", "tile.pavement5Stairs.name",),
-    ("botania:petalblock", "tile.petalBlock.name",),
-    ("botania:pistonrelay", "tile.pistonRelay.name",),
-    ("botania:platform", "tile.platform.name",),
-    ("botania:pool", "tile.pool.name",),
-    ("botania:prism", "tile.prism.name",),
-    ("botania:pump", "Fluid Extractor",),
-    ("botania:pylon", "tile.pylon.name",),
-    ("botania:quartzslabblazefull", "tile.quartzSlabBlazeFull.name",),
-    ("botania:quartzslabblazehalf", "tile.quartzSlabBlazeHalf.name",),
-    ("botania:quartzslabdarkfull", "tile.quartzSlabDarkFull.name",),
-    ("botania:quartzslabdarkhalf", "tile.quartzSlabDarkHalf.name",),
-    ("botania:quartzslabelffull", "tile.quartzSlabElfFull.name",),
-    ("botania:quartzslabelfhalf", "tile.quartzSlabElfHalf.name",),
-    ("botania:quartzslablavenderfull", "tile.quartzSlabLavenderFull.name",),
-    ("botania:quartzslablavenderhalf", "tile.quartzSlabLavenderHalf.name",),
-    ("botania:quartzslabmanafull", "tile.quartzSlabManaFull.name",),
-    ("botania:quartzslabmanahalf", "tile.quartzSlabManaHalf.name",),
-    ("botania:quartzslabredfull", "tile.quartzSlabRedFull.name",),
-    ("botania:quartzslabredhalf", "tile.quartzSlabRedHalf.name",),
-    ("botania:quartzslabsunnyfull", "tile.quartzSlabSunnyFull.name",),
-    ("botania:quartzslabsunnyhalf", "tile.quartzSlabSunnyHalf.name",),
-    ("botania:quartzstairsblaze", "tile.quartzStairsBlaze.name",),
-    ("botania:quartzstairsdark", "tile.quartzStairsDark.name",),
-    ("botania:quartzstairself", "tile.quartzStairsElf.name",),
-    ("botania:quartzstairslavender", "tile.quartzStairsLavender.name",),
-    ("botania:quartzstairsmana", "tile.quartzStairsMana.name",),
-    ("botania:quartzstairsred", "tile.quartzStairsRed.name",),
-    ("botania:quartzstairssunny", "tile.quartzStairsSunny.name",),
-    ("botania:quartztypeblaze", "tile.quartzTypeBlaze.name",),
-    ("botania:quartztypedark", "tile.quartzTypeDark.name",),
-    ("botania:quartztypeelf", "tile.quartzTypeElf.name",),
-    ("botania:quartztypelavender", "tile.quartzTypeLavender.name",),
-    ("botania:quartztypemana", "tile.quartzTypeMana.name",),
-    ("botania:quartztypered", "tile.quartzTypeRed.name",),
-    ("botania:quartztypesunny", "tile.quartzTypeSunny.name",),
-    ("botania:redstringcomparator", "tile.redStringComparator.name",),
-    ("botania:redstringcontainer", "tile.redStringContainer.name",),
-    ("botania:redstringdispenser", "tile.redStringDispenser.name",),
-    ("botania:redstringfertilizer", "tile.redStringFertilizer.name",),
-    ("botania:redstringinterceptor", "tile.redStringInterceptor.name",),
-    ("botania:redstringrelay", "tile.redStringRelay.name",),
-    ("botania:rfgenerator", "tile.rfGenerator.name",),
-    ("botania:root", "tile.root.name",),
-    ("botania:runealtar", "tile.runeAltar.name",),
-    ("botania:shimmerrock", "tile.shimmerrock.name",),
-    ("botania:shimmerrock0slab", "tile.shimmerrock0Slab.name",),
-    ("botania:shimmerrock0slabfull", "tile.shimmerrock0SlabFull.name",),
-    ("botania:shimmerrock0stairs", "tile.shimmerrock0Stairs.name",),
-    ("botania:shimmerwoodplanks", "tile.shimmerwoodPlanks.name",),
-    ("botania:shimmerwoodplanks0slab", "tile.shimmerwoodPlanks0Slab.name",),
-    ("botania:shimmerwoodplanks0slabfull", "tile.shimmerwoodPlanks0SlabFull.name",),
-    ("botania:shimmerwoodplanks0stairs", "tile.shimmerwoodPlanks0Stairs.name",),
-    ("botania:shinyflower", "tile.shinyFlower.name",),
-    ("botania:solidvine", "tile.solidVine.name",),
-    ("botania:sparkchanger", "tile.sparkChanger.name",),
-    ("botania:spawnerclaw", "tile.spawnerClaw.name",),
-    ("botania:specialflower", "tile.specialFlower.name",),
-    ("botania:spreader", "tile.spreader.name",),
-    ("botania:starfield", "tile.starfield.name",),
-    ("botania:storage", "tile.storage.name",),
-    ("botania:terraplate", "tile.terraPlate.name",),
-    ("botania:teruterubozu", "tile.teruTeruBozu.name",),
-    ("botania:tinyplanetblock", "tile.tinyPlanetBlock.name",),
-    ("botania:tinypotato", "tile.tinyPotato.name",),
-    ("botania:turntable", "tile.turntable.name",),
-    ("botany:ceramic", "tile.null.name",),
-    ("botany:ceramicbrick", "tile.null.name",),
-    ("botany:ceramicpattern", "tile.null.name",),
-    ("botany:flower", "tile.null.name",),
-    ("botany:flowerbed", "botany.soil.flowerbed.name",),
-    ("botany:flowerbed_no_weed", "botany.soil.flowerbed.name",),
-    ("botany:loam", "botany.soil.loam.name",),
-    ("botany:loam_no_weed", "botany.soil.loam.name",),
-    ("botany:machine", "tile.null.name",),
-    ("botany:plant", "tile.null.name",),
-    ("botany:soil", "botany.soil.soil.name",),
-    ("botany:soil_no_weed", "botany.soil.soil.name",),
-    ("botany:stained", "tile.null.name",),
-    ("careerbees:alveary_frame", "Alveary Frame Holder",),
-    ("careerbees:flower_pedastal", "Flower Pedastal",),
-    ("ceramics:channel", "Porcelain Channel",),
-    ("ceramics:clay_barrel", "tile.ceramics.clay_barrel.name",),
-    ("ceramics:clay_barrel_stained", "tile.ceramics.clay_barrel_stained.name",),
-    ("ceramics:clay_barrel_stained_extension", "tile.ceramics.clay_barrel_stained_extension.name",),
-    ("ceramics:clay_barrel_unfired", "tile.ceramics.clay_barrel_unfired.name",),
-    ("ceramics:clay_bucket_block", "Unfired Clay Bucket",),
-    ("ceramics:clay_hard", "tile.ceramics.clay_hard.name",),
-    ("ceramics:clay_slab", "tile.ceramics.clay_slab.name",),
-    ("ceramics:clay_soft", "tile.ceramics.clay_soft.name",),
-    ("ceramics:clay_wall", "tile.ceramics.clay_wall.normal.name",),
-    ("ceramics:dark_bricks_stairs", "Dark Bricks Stairs",),
-    ("ceramics:dragon_bricks_stairs", "Dragon Bricks Stairs",),
-    ("ceramics:faucet", "Porcelain Faucet",),
-    ("ceramics:golden_bricks_stairs", "Golden Bricks Stairs",),
-    ("ceramics:lava_bricks_stairs", "Lava Bricks Stairs",),
-    ("ceramics:marine_bricks_stairs", "Marine Bricks Stairs",),
-    ("ceramics:porcelain", "tile.ceramics.porcelain.name",),
-    ("ceramics:porcelain_barrel", "tile.ceramics.porcelain_barrel.name",),
-    ("ceramics:porcelain_barrel_extension", "tile.ceramics.porcelain_barrel_extension.name",),
-    ("ceramics:porcelain_bricks_stairs", "Porcelain Bricks Stairs",),
-    ("ceramics:rainbow_bricks_stairs", "Rainbow Bricks Stairs",),
-    ("ceramics:rainbow_clay", "tile.ceramics.rainbow_clay.name",),
-    ("chisel:andesite", "Andesite",),
-    ("chisel:andesite1", "Andesite",),
-    ("chisel:andesite2", "Andesite",),
-    ("chisel:antiblock", "Antiblock",),
-    ("chisel:auto_chisel", "Auto Chisel",),
-    ("chisel:basalt", "Basalt",),
-    ("chisel:basalt1", "Basalt",),
-    ("chisel:basalt2", "Basalt",),
-    ("chisel:block_charcoal", "Block of Charcoal",),
-    ("chisel:block_charcoal1", "Block of Charcoal",),
-    ("chisel:block_charcoal2", "Block of Charcoal",),
-    ("chisel:block_coal", "Block of Coal",),
-    ("chisel:block_coal1", "Block of Coal",),
-    ("chisel:block_coal2", "Block of Coal",),
-    ("chisel:block_coal_coke", "Block of Coal Coke",),
-    ("chisel:block_coal_coke1", "Block of Coal Coke",),
-    ("chisel:block_coal_coke2", "Block of Coal Coke",),
-    ("chisel:blockaluminum", "Block of Aluminum",),
-    ("chisel:blockbronze", "Block of Bronze",),
-    ("chisel:blockcobalt", "Block of Cobalt",),
-    ("chisel:blockcopper", "Block of Copper",),
-    ("chisel:blockelectrum", "Block of Electrum",),
-    ("chisel:blockgold", "Block of Gold",),
-    ("chisel:blockinvar", "Block of Invar",),
-    ("chisel:blockiron", "Block of Iron",),
-    ("chisel:blocklead", "Block of Lead",),
-    ("chisel:blocknickel", "Block of Nickel",),
-    ("chisel:blockplatinum", "Block of Platinum",),
-    ("chisel:blocksilver", "Block of Silver",),
-    ("chisel:blocksteel", "Block of Steel",),
-    ("chisel:blocktin", "Block of Tin",),
-    ("chisel:blockuranium", "Block of Uranium",),
-    ("chisel:bloodmagic", "Chiseled Blood Rune",),
-    ("chisel:bookshelf_acacia", "Acacia Bookshelf",),
-    ("chisel:bookshelf_birch", "Birch Bookshelf",),
-    ("chisel:bookshelf_darkoak", "Dark Oak Bookshelf",),
-    ("chisel:bookshelf_jungle", "Jungle Bookshelf",),
-    ("chisel:bookshelf_oak", "Oak Bookshelf",),
-    ("chisel:bookshelf_spruce", "Spruce Bookshelf",),
-    ("chisel:bricks", "Bricks",),
-    ("chisel:bricks1", "Bricks",),
-    ("chisel:bricks2", "Bricks",),
-    ("chisel:brownstone", "Brownstone",),
-    ("chisel:carpet_black", "Black Wool",),
-    ("chisel:carpet_blue", "Blue Wool",),
-    ("chisel:carpet_brown", "Brown Wool",),
-    ("chisel:carpet_cyan", "Cyan Wool",),
-    ("chisel:carpet_gray", "Gray Wool",),
-    ("chisel:carpet_green", "Green Wool",),
-    ("chisel:carpet_lightblue", "Light Blue Wool",),
-    ("chisel:carpet_lightgray", "Light Gray Wool",),
-    ("chisel:carpet_lime", "Lime Wool",),
-    ("chisel:carpet_magenta", "Magenta Wool",),
-    ("chisel:carpet_orange", "Orange Wool",),
-    ("chisel:carpet_pink", "Pink Wool",),
-    ("chisel:carpet_purple", "Purple Wool",),
-    ("chisel:carpet_red", "Red Wool",),
-    ("chisel:carpet_white", "Wool",),
-    ("chisel:carpet_yellow", "Yellow Wool",),
-    ("chisel:cloud", "Cloud",),
-    ("chisel:cobblestone", "Cobblestone",),
-    ("chisel:cobblestone1", "Cobblestone",),
-    ("chisel:cobblestone2", "Cobblestone",),
-    ("chisel:cobblestonemossy", "Mossy Cobblestone",),
-    ("chisel:cobblestonemossy1", "Mossy Cobblestone",),
-    ("chisel:cobblestonemossy2", "Mossy Cobblestone",),
-    ("chisel:concrete_black", "Black Concrete",),
-    ("chisel:concrete_black1", "Black Concrete",),
-    ("chisel:concrete_black2", "Black Concrete",),
-    ("chisel:concrete_blue", "Blue Concrete",),
-    ("chisel:concrete_blue1", "Blue Concrete",),
-    ("chisel:concrete_blue2", "Blue Concrete",),
-    ("chisel:concrete_brown", "Brown Concrete",),
-    ("chisel:concrete_brown1", "Brown Concrete",),
-    ("chisel:concrete_brown2", "Brown Concrete",),
-    ("chisel:concrete_cyan", "Cyan Concrete",),
-    ("chisel:concrete_cyan1", "Cyan Concrete",),
-    ("chisel:concrete_cyan2", "Cyan Concrete",),
-    ("chisel:concrete_gray", "Gray Concrete",),
-    ("chisel:concrete_gray1", "Gray Concrete",),
-    ("chisel:concrete_gray2", "Gray Concrete",),
-    ("chisel:concrete_green", "Green Concrete",),
-    ("chisel:concrete_green1", "Green Concrete",),
-    ("chisel:concrete_green2", "Green Concrete",),
-    ("chisel:concrete_lightblue", "Light Blue Concrete",),
-    ("chisel:concrete_lightblue1", "Light Blue Concrete",),
-    ("chisel:concrete_lightblue2", "Light Blue Concrete",),
-    ("chisel:concrete_lightgray", "Light Gray Concrete",),
-    ("chisel:concrete_lightgray1", "Light Gray Concrete",),
-    ("chisel:concrete_lightgray2", "Light Gray Concrete",),
-    ("chisel:concrete_lime", "Lime Concrete",),
-    ("chisel:concrete_lime1", "Lime Concrete",),
-    ("chisel:concrete_lime2", "Lime Concrete",),
-    ("chisel:concrete_magenta", "Magenta Concrete",),
-    ("chisel:concrete_magenta1", "Magenta Concrete",),
-    ("chisel:concrete_magenta2", "Magenta Concrete",),
-    ("chisel:concrete_orange", "Orange Concrete",),
-    ("chisel:concrete_orange1", "Orange Concrete",),
-    ("chisel:concrete_orange2", "Orange Concrete",),
-    ("chisel:concrete_pink", "Pink Concrete",),
-    ("chisel:concrete_pink1", "Pink Concrete",),
-    ("chisel:concrete_pink2", "Pink Concrete",),
-    ("chisel:concrete_purple", "Purple Concrete",),
-    ("chisel:concrete_purple1", "Purple Concrete",),
-    ("chisel:concrete_purple2", "Purple Concrete",),
-    ("chisel:concrete_red", "Red Concrete",),
-    ("chisel:concrete_red1", "Red Concrete",),
-    ("chisel:concrete_red2", "Red Concrete",),
-    ("chisel:concrete_white", "White Concrete",),
-    ("chisel:concrete_white1", "White Concrete",),
-    ("chisel:concrete_white2", "White Concrete",),
-    ("chisel:concrete_yellow", "Yellow Concrete",),
-    ("chisel:concrete_yellow1", "Yellow Concrete",),
-    ("chisel:concrete_yellow2", "Yellow Concrete",),
-    ("chisel:diamond", "Block of Diamond",),
-    ("chisel:diorite", "Diorite",),
-    ("chisel:diorite1", "Diorite",),
-    ("chisel:diorite2", "Diorite",),
-    ("chisel:dirt", "Dirt",),
-    ("chisel:emerald", "Block of Emerald",),
-    ("chisel:endstone", "Endstone",),
-    ("chisel:endstone1", "Endstone",),
-    ("chisel:endstone2", "Endstone",),
-    ("chisel:energizedvoidstone", "Primal Voidstone",),
-    ("chisel:factory", "Factory Block",),
-    ("chisel:factory1", "Factory Block",),
-    ("chisel:futura", "Futura Block",),
-    ("chisel:glass", "Glass",),
-    ("chisel:glassdyedblack", "Black Stained Glass",),
-    ("chisel:glassdyedblue", "Blue Stained Glass",),
-    ("chisel:glassdyedbrown", "Brown Stained Glass",),
-    ("chisel:glassdyedcyan", "Cyan Stained Glass",),
-    ("chisel:glassdyedgray", "Gray Stained Glass",),
-    ("chisel:glassdyedgreen", "Green Stained Glass",),
-    ("chisel:glassdyedlightblue", "Light Blue Stained Glass",),
-    ("chisel:glassdyedlightgray", "Light Gray Stained Glass",),
-    ("chisel:glassdyedlime", "Lime Stained Glass",),
-    ("chisel:glassdyedmagenta", "Magenta Stained Glass",),
-    ("chisel:glassdyedorange", "Orange Stained Glass",),
-    ("chisel:glassdyedpink", "Pink Stained Glass",),
-    ("chisel:glassdyedpurple", "Purple Stained Glass",),
-    ("chisel:glassdyedred", "Red Stained Glass",),
-    ("chisel:glassdyedwhite", "White Stained Glass",),
-    ("chisel:glassdyedyellow", "Yellow Stained Glass",),
-    ("chisel:glowstone", "Glowstone",),
-    ("chisel:glowstone1", "Glowstone",),
-    ("chisel:glowstone2", "Glowstone",),
-    ("chisel:gold", "Block of Gold",),
-    ("chisel:granite", "Granite",),
-    ("chisel:granite1", "Granite",),
-    ("chisel:granite2", "Granite",),
-    ("chisel:hardenedclay", "Terracotta",),
-    ("chisel:hardenedclay1", "Terracotta",),
-    ("chisel:hardenedclay2", "Terracotta",),
-    ("chisel:ice", "Ice",),
-    ("chisel:ice1", "Ice",),
-    ("chisel:ice2", "Ice",),
-    ("chisel:icepillar", "Ice Pillar",),
-    ("chisel:iron", "Block of Iron",),
-    ("chisel:ironpane", "Iron Bars (WIP!)",),
-    ("chisel:laboratory", "Laboratory Block",),
-    ("chisel:lapis", "Lapis Lazuli Block",),
-    ("chisel:lavastone", "Lavastone",),
-    ("chisel:lavastone1", "Lavastone",),
-    ("chisel:lavastone2", "Lavastone",),
-    ("chisel:limestone", "Limestone",),
-    ("chisel:limestone1", "Limestone",),
-    ("chisel:limestone2", "Limestone",),
-    ("chisel:marble", "Marble",),
-    ("chisel:marble1", "Marble",),
-    ("chisel:marble2", "Marble",),
-    ("chisel:marblepillar", "Marble Pillar",),
-    ("chisel:netherbrick", "Nether Bricks",),
-    ("chisel:netherrack", "Netherrack",),
-    ("chisel:obsidian", "Obsidian",),
-    ("chisel:paper", "Paper Wall",),
-    ("chisel:planks-acacia", "Acacia Planks",),
-    ("chisel:planks-birch", "Birch Planks",),
-    ("chisel:planks-dark-oak", "Dark Oak Planks",),
-    ("chisel:planks-jungle", "Jungle Planks",),
-    ("chisel:planks-oak", "Oak Planks",),
-    ("chisel:planks-spruce", "Spruce Planks",),
-    ("chisel:prismarine", "Prismarine",),
-    ("chisel:prismarine1", "Prismarine",),
-    ("chisel:prismarine2", "Prismarine",),
-    ("chisel:purpur", "Purpur Block",),
-    ("chisel:purpur1", "Purpur Block",),
-    ("chisel:purpur2", "Purpur Block",),
-    ("chisel:quartz", "Block of Quartz",),
-    ("chisel:quartz1", "Block of Quartz",),
-    ("chisel:redstone", "Block of Redstone",),
-    ("chisel:redstone1", "Block of Redstone",),
-    ("chisel:sandstone-scribbles", "Sandstone Scribbles",),
-    ("chisel:sandstonered", "Red Sandstone",),
-    ("chisel:sandstonered1", "Red Sandstone",),
-    ("chisel:sandstonered2", "Red Sandstone",),
-    ("chisel:sandstoneyellow", "Sandstone",),
-    ("chisel:sandstoneyellow1", "Sandstone",),
-    ("chisel:sandstoneyellow2", "Sandstone",),
-    ("chisel:stonebrick", "Chiseled Stone",),
-    ("chisel:stonebrick1", "Chiseled Stone",),
-    ("chisel:stonebrick2", "Chiseled Stone",),
-    ("chisel:technical", "Factory Block",),
-    ("chisel:technical1", "Factory Block",),
-    ("chisel:technicalnew", "Factory Block",),
-    ("chisel:temple", "Temple Block",),
-    ("chisel:templemossy", "Mossy Temple Block",),
-    ("chisel:tyrian", "Tyrian",),
-    ("chisel:valentines", "Valentines' Block",),
-    ("chisel:voidstone", "Voidstone",),
-    ("chisel:voidstonerunic", "Runed Voidstone",),
-    ("chisel:waterstone", "Waterstone",),
-    ("chisel:waterstone1", "Waterstone",),
-    ("chisel:waterstone2", "Waterstone",),
-    ("chisel:wool_black", "Black Wool",),
-    ("chisel:wool_blue", "Blue Wool",),
-    ("chisel:wool_brown", "Brown Wool",),
-    ("chisel:wool_cyan", "Cyan Wool",),
-    ("chisel:wool_gray", "Gray Wool",),
-    ("chisel:wool_green", "Green Wool",),
-    ("chisel:wool_lightblue", "Light Blue Wool",),
-    ("chisel:wool_lightgray", "Light Gray Wool",),
-    ("chisel:wool_lime", "Lime Wool",),
-    ("chisel:wool_magenta", "Magenta Wool",),
-    ("chisel:wool_orange", "Orange Wool",),
-    ("chisel:wool_pink", "Pink Wool",),
-    ("chisel:wool_purple", "Purple Wool",),
-    ("chisel:wool_red", "Red Wool",),
-    ("chisel:wool_white", "Wool",),
-    ("chisel:wool_yellow", "Yellow Wool",),
-    ("chiselsandbits:bittank", "Chiseled Fluid Bit Tank",),
-    ("chiselsandbits:chiseled_clay", "Chiseled Clay",),
-    ("chiselsandbits:chiseled_cloth", "Chiseled Cloth",),
-    ("chiselsandbits:chiseled_fluid", "Chiseled Fluid",),
-    ("chiselsandbits:chiseled_glass", "Chiseled Glass",),
-    ("chiselsandbits:chiseled_grass", "Chiseled Grass",),
-    ("chiselsandbits:chiseled_ground", "Chiseled Ground",),
-    ("chiselsandbits:chiseled_ice", "Chiseled Ice",),
-    ("chiselsandbits:chiseled_iron", "Chiseled Metal",),
-    ("chiselsandbits:chiseled_leaves", "Chiseled Leaves",),
-    ("chiselsandbits:chiseled_packedice", "Chiseled Packed Ice",),
-    ("chiselsandbits:chiseled_rock", "Chiseled Rock",),
-    ("chiselsandbits:chiseled_sand", "Chiseled Sand",),
-    ("chiselsandbits:chiseled_snow", "Chiseled Snow",),
-    ("chiselsandbits:chiseled_wood", "Chiseled Wood",),
-    ("colossalchests:chest_wall", "Colossal Chest Wall",),
-    ("colossalchests:colossal_chest", "Colossal Chest Core",),
-    ("colossalchests:interface", "Colossal Chest Interface",),
-    ("colossalchests:uncolossal_chest", "Uncolossal Chest",),
-    ("compactmachines3:craftinghologram", "tile.compactmachines3.craftinghologram.name",),
-    ("compactmachines3:fieldprojector", "Miniaturization Field Projector",),
-    ("compactmachines3:machine", "tile.compactmachines3.machine.name",),
-    ("compactmachines3:redstonetunnel", "Redstone Tunnel",),
-    ("compactmachines3:tunnel", "Tunnel",),
-    ("compactmachines3:wall", "Solid Compact Machine Wall",),
-    ("compactmachines3:wallbreakable", "Compact Machine Wall",),
-    ("compactsolars:compact_solar_block", "tile.compactsolars.compact_solar_block.name",),
-    ("computercraft:advanced_modem", "Ender Modem",),
-    ("computercraft:cable", "Networking Cable",),
-    ("computercraft:command_computer", "Command Computer",),
-    ("computercraft:computer", "Computer",),
-    ("computercraft:peripheral", "tile.computercraft:peripheral.name",),
-    ("computercraft:turtle", "Turtle",),
-    ("computercraft:turtle_advanced", "Turtle",),
-    ("computercraft:turtle_expanded", "Turtle",),
-    ("computronics:audio_cable", "Audio Cable",),
-    ("computronics:camera", "Camera",),
-    ("computronics:chat_box", "Chat Box",),
-    ("computronics:cipher", "Cipher Block",),
-    ("computronics:cipher_advanced", "Advanced Cipher Block",),
-    ("computronics:colorful_lamp", "Colorful Lamp",),
-    ("computronics:iron_note_block", "Iron Note Block",),
-    ("computronics:radar", "Radar",),
-    ("computronics:sound_board", "Sound Board",),
-    ("computronics:speaker", "Speaker",),
-    ("computronics:speech_box", "Speech Box",),
-    ("computronics:tape_reader", "Tape Drive",),
-    ("cookingforblockheads:cooking_table", "Cooking Table",),
-    ("cookingforblockheads:corner", "Kitchen Corner",),
-    ("cookingforblockheads:counter", "Kitchen Counter",),
-    ("cookingforblockheads:cow_jar", "Cow in a Jar",),
-    ("cookingforblockheads:fridge", "Fridge",),
-    ("cookingforblockheads:kitchen_floor", "Kitchen Floor",),
-    ("cookingforblockheads:milk_jar", "Milk Jar",),
-    ("cookingforblockheads:oven", "Oven",),
-    ("cookingforblockheads:sink", "Sink",),
-    ("cookingforblockheads:spice_rack", "Spice Rack",),
-    ("cookingforblockheads:toaster", "Toaster",),
-    ("cookingforblockheads:tool_rack", "Tool Rack",),
-    ("cyclicmagic:apple", "Apple Sprout",),
-    ("cyclicmagic:auto_crafter", "Auto Crafter",),
-    ("cyclicmagic:beacon_potion", "Pharos Beacon",),
-    ("cyclicmagic:beacon_redstone", "Empty Beacon",),
-    ("cyclicmagic:block_anvil", "Powered Anvil",),
-    ("cyclicmagic:block_disenchanter", "Unchant Pylon",),
-    ("cyclicmagic:block_enchanter", "Powered Enchanter",),
-    ("cyclicmagic:block_fishing", "Automatic Fishing Net",),
-    ("cyclicmagic:block_forester", "Forester",),
-    ("cyclicmagic:block_fragile", "Fragile Scaffolding",),
-    ("cyclicmagic:block_fragile_auto", "Responsive Scaffolding",),
-    ("cyclicmagic:block_fragile_weak", "Replaceable Scaffolding",),
-    ("cyclicmagic:block_hydrator", "Hydrator",),
-    ("cyclicmagic:block_library", "Ender Bookshelf",),
-    ("cyclicmagic:block_library_ctrl", "Ender Library",),
-    ("cyclicmagic:block_miner", "Block Miner",),
-    ("cyclicmagic:block_miner_smart", "Controlled Miner",),
-    ("cyclicmagic:block_screen", "Digital Typewriter",),
-    ("cyclicmagic:block_shears", "Shearing Block",),
-    ("cyclicmagic:block_soundproofing", "Soundproofing",),
-    ("cyclicmagic:block_storeempty", "Fluid Storage Tank",),
-    ("cyclicmagic:block_user", "Automated User",),
-    ("cyclicmagic:block_vacuum", "Item Collector",),
-    ("cyclicmagic:block_workbench", "Workbench",),
-    ("cyclicmagic:builder_block", "Structure Builder",),
-    ("cyclicmagic:builder_pattern", "Pattern Replicator",),
-    ("cyclicmagic:bundled_pipe", "Bundled Cable",),
-    ("cyclicmagic:clock", "Redstone Clock",),
-    ("cyclicmagic:dropper_exact", "Precise Dropper",),
-    ("cyclicmagic:end_coal_ore", "End Coal Ore",),
-    ("cyclicmagic:end_diamond_ore", "End Diamond Ore",),
-    ("cyclicmagic:end_emerald_ore", "End Emerald Ore",),
-    ("cyclicmagic:end_gold_ore", "End Gold Ore",),
-    ("cyclicmagic:end_iron_ore", "End Iron Ore",),
-    ("cyclicmagic:end_lapis_ore", "End Lapis Ore",),
-    ("cyclicmagic:end_redstone_ore", "End Redstone Ore",),
-    ("cyclicmagic:energy_pipe", "Energy Cable",),
-    ("cyclicmagic:energy_pump", "Energy Extraction Cable",),
-    ("cyclicmagic:entity_detector", "Entity Detector",),
-    ("cyclicmagic:exp_pylon", "Experience Pylon",),
-    ("cyclicmagic:fan", "Fan",),
-    ("cyclicmagic:fire_dark", "Dark Fire",),
-    ("cyclicmagic:fluid_pipe", "Fluid Cable",),
-    ("cyclicmagic:fluid_placer", "Fluid Placer",),
-    ("cyclicmagic:fluid_pump", "Fluid Extraction Cable",),
-    ("cyclicmagic:harvester_block", "Harvester",),
-    ("cyclicmagic:item_pipe", "Item Pipe",),
-    ("cyclicmagic:item_pipe_sort", "Item Sorter",),
-    ("cyclicmagic:item_pump", "Item Extractor",),
-    ("cyclicmagic:magnet_anti_block", "Interdiction Plate",),
-    ("cyclicmagic:magnet_block", "Item Magnet",),
-    ("cyclicmagic:milk", "Milk",),
-    ("cyclicmagic:nether_coal_ore", "Nether Coal Ore",),
-    ("cyclicmagic:nether_diamond_ore", "Nether Diamond Ore",),
-    ("cyclicmagic:nether_emerald_ore", "Nether Emerald Ore",),
-    ("cyclicmagic:nether_gold_ore", "Nether Gold Ore",),
-    ("cyclicmagic:nether_iron_ore", "Nether Iron Ore",),
-    ("cyclicmagic:nether_lapis_ore", "Nether Lapis Ore",),
-    ("cyclicmagic:nether_redstone_ore", "Nether Redstone Ore",),
-    ("cyclicmagic:password_block", "Password Trigger",),
-    ("cyclicmagic:peat_baked", "Peat Deposit",),
-    ("cyclicmagic:peat_farm", "Peat Farmer",),
-    ("cyclicmagic:peat_generator", "Peat-fired Generator",),
-    ("cyclicmagic:peat_unbaked", "Peat Bog",),
-    ("cyclicmagic:placer_block", "Block Placer",),
-    ("cyclicmagic:plate_launch_large", "Hardened Slime Plate",),
-    ("cyclicmagic:plate_launch_med", "Slime Plate",),
-    ("cyclicmagic:plate_launch_small", "Soft Slime Plate",),
-    ("cyclicmagic:plate_push", "Slime Conveyor",),
-    ("cyclicmagic:plate_push_fast", "Fast Slime Conveyor",),
-    ("cyclicmagic:plate_push_slow", "Slow Slime Conveyor",),
-    ("cyclicmagic:plate_push_slowest", "Slowest Slime Conveyor",),
-    ("cyclicmagic:plate_vector", "Aerial Faith Plate",),
-    ("cyclicmagic:poison", "Poison",),
-    ("cyclicmagic:spikes_diamond", "Diamond Spikes",),
-    ("cyclicmagic:spikes_iron", "Iron Spikes",),
-    ("cyclicmagic:sprinkler", "Sprinkler",),
-    ("cyclicmagic:sprout", "Magic Bean Sprout",),
-    ("cyclicmagic:trash", "Trash Void",),
-    ("cyclicmagic:wireless_receiver", "Wireless Receiver",),
-    ("cyclicmagic:wireless_transmitter", "Wireless Transmitter",),
-    ("cyclicmagic:xpjuice", "Experience",),
-    ("darkutils:anti_slime", "Anti-Slime Block",),
-    ("darkutils:ender_hopper", "Ender Hopper",),
-    ("darkutils:ender_pearl_hopper", "Pearled Ender Hopper",),
-    ("darkutils:ender_tether", "Ender Tether",),
-    ("darkutils:fake_tnt", "TNT",),
-    ("darkutils:filter", "Mob Filter",),
-    ("darkutils:filter_inverted", "Inverted Mob Filter",),
-    ("darkutils:grate", "Item Grate",),
-    ("darkutils:monolith", "tile.darkutils.monolith.name",),
-    ("darkutils:pearl_block", "tile.darkutils.pearl.block.name",),
-    ("darkutils:slime_dyed", "tile.darkutils.slime.dyed.name",),
-    ("darkutils:sneaky", "Sneaky Block",),
-    ("darkutils:sneaky_bedrock", "Sneaky Bedrock",),
-    ("darkutils:sneaky_button", "Sneaky Button",),
-    ("darkutils:sneaky_ghost", "Sneaky False Block",),
-    ("darkutils:sneaky_lever", "Sneaky Lever",),
-    ("darkutils:sneaky_obsidian", "Sneaky Obsidian",),
-    ("darkutils:sneaky_plate", "Sneaky Pressure Plate",),
-    ("darkutils:sneaky_torch", "Sneaky Torch",),
-    ("darkutils:timer", "Timer",),
-    ("darkutils:trap_anchor", "Anchor Plate",),
-    ("darkutils:trap_move", "Vector Plate",),
-    ("darkutils:trap_move_fast", "Fast Vector Plate",),
-    ("darkutils:trap_move_hyper", "Extreme Vector Plate",),
-    ("darkutils:trap_tile", "tile.darkutils.trap.tile.name",),
-    ("darkutils:update_detector", "Block Update Detector",),
-    ("darkutils:wither_block", "Wither Block",),
-    ("draconicevolution:celestial_manipulator", "Celestial Manipulator",),
-    ("draconicevolution:chaos_crystal", "Chaos Crystal",),
-    ("draconicevolution:chaos_shard_atmos", "tile.draconicevolution:chaos_shard_atmos.name",),
-    ("draconicevolution:crafting_injector", "tile.draconicevolution:crafting_injector.name",),
-    ("draconicevolution:creative_rf_source", "Creative RF Source",),
-    ("draconicevolution:dislocator_pedestal", "Dislocator Pedestal",),
-    ("draconicevolution:dislocator_receptacle", "Dislocator Receptacle",),
-    ("draconicevolution:diss_enchanter", "Disenchanter",),
-    ("draconicevolution:draconic_block", "Awakened Draconium Block",),
-    ("draconicevolution:draconic_spawner", "Stabilized Mob Spawner",),
-    ("draconicevolution:draconium_block", "Draconium Block",),
-    ("draconicevolution:draconium_chest", "Draconium Chest",),
-    ("draconicevolution:draconium_ore", "tile.draconicevolution:draconium_ore.name",),
-    ("draconicevolution:energy_crystal", "tile.draconicevolution:energy_crystal.name",),
-    ("draconicevolution:energy_infuser", "Energy Infuser",),
-    ("draconicevolution:energy_pylon", "Energy Pylon",),
-    ("draconicevolution:energy_storage_core", "Energy Core",),
-    ("draconicevolution:entity_detector", "Entity Detector",),
-    ("draconicevolution:flow_gate", "tile.draconicevolution:flow_gate.name",),
-    ("draconicevolution:fusion_crafting_core", "Fusion Crafting Core",),
-    ("draconicevolution:generator", "Generator",),
-    ("draconicevolution:grinder", "Mob Grinder",),
-    ("draconicevolution:infused_obsidian", "Draconium Infused Obsidian",),
-    ("draconicevolution:invis_e_core_block", "tile.draconicevolution:invis_e_core_block.name",),
-    ("draconicevolution:item_dislocation_inhibitor", "Dislocation Normalization Field Projector",),
-    ("draconicevolution:particle_generator", "Particle Generator",),
-    ("draconicevolution:placed_item", "tile.draconicevolution:placed_item.name",),
-    ("draconicevolution:portal", "Portal",),
-    ("draconicevolution:potentiometer", "Potentiometer",),
-    ("draconicevolution:rain_sensor", "Rain Sensor",),
-    ("draconicevolution:reactor_component", "tile.draconicevolution:reactor_component.name",),
-    ("draconicevolution:reactor_core", "Draconic Reactor Core",),
-    ("elulib:multiblock_slave_empty", "tile.multiblock_slave_empty.name",),
-    ("elulib:multiblock_slave_modular", "tile.multiblock_slave_modular.name",),
-    ("elulib:test", "Test Block",),
-    ("embers:advanced_edge", "tile.advanced_edge.name",),
-    ("embers:alchemy_pedestal", "Alchemy Pedestal",),
-    ("embers:alchemy_tablet", "Exchange Tablet",),
-    ("embers:aluminum", "tile.null.name",),
-    ("embers:archaic_bricks", "Archaic Bricks",),
-    ("embers:archaic_edge", "Archaic Edge",),
-    ("embers:archaic_light", "Archaic Light",),
-    ("embers:archaic_tile", "Archaic Tile",),
-    ("embers:ashen_brick", "Ashen Brick",),
-    ("embers:ashen_brick_slab", "Ashen Brick Slab",),
-    ("embers:ashen_brick_slab_double", "Ashen Brick Double Slab",),
-    ("embers:ashen_stone", "Ashen Stone",),
-    ("embers:ashen_stone_slab", "Ashen Stone Slab",),
-    ("embers:ashen_stone_slab_double", "Ashen Stone Double Slab",),
-    ("embers:ashen_tile", "Ashen Tile",),
-    ("embers:ashen_tile_slab", "Ashen Tile Slab",),
-    ("embers:ashen_tile_slab_double", "Ashen Tile Double Slab",),
-    ("embers:auto_hammer", "Automatic Hammer",),
-    ("embers:beam_cannon", "Beam Cannon",),
-    ("embers:beam_splitter", "Beam Splitter",),
-    ("embers:bin", "Bin",),
-    ("embers:block_aluminum", "Aluminum Block",),
-    ("embers:block_bronze", "Bronze Block",),
-    ("embers:block_caminite_brick", "Caminite Bricks",),
-    ("embers:block_caminite_brick_slab", "Caminite Brick Slab",),
-    ("embers:block_caminite_brick_slab_double", "Caminite Brick Double Slab",),
-    ("embers:block_copper", "Copper Block",),
-    ("embers:block_dawnstone", "Dawnstone Block",),
-    ("embers:block_electrum", "Electrum Block",),
-    ("embers:block_furnace", "Melter",),
-    ("embers:block_lantern", "Ember Lantern",),
-    ("embers:block_lead", "Lead Block",),
-    ("embers:block_mithril", "Mithril Block",),
-    ("embers:block_nickel", "Nickel Block",),
-    ("embers:block_silver", "Silver Block",),
-    ("embers:block_tank", "Fluid Vessel",),
-    ("embers:block_tin", "Tin Block",),
-    ("embers:boiler", "Pressure Refinery",),
-    ("embers:breaker", "Automatic Breaker",),
-    ("embers:bronze", "tile.null.name",),
-    ("embers:caminite_lever", "Caminite Lever",),
-    ("embers:catalyzer", "Catalysis Chamber",),
-    ("embers:charger", "Copper Charger",),
-    ("embers:cinder_plinth", "Cinder Plinth",),
-    ("embers:combustor", "Combustion Chamber",),
-    ("embers:copper", "tile.null.name",),
-    ("embers:copper_cell", "Copper Cell",),
-    ("embers:creative_ember_source", "Creative Ember Source",),
-    ("embers:crystal_cell", "Crystal Cell",),
-    ("embers:dawnstone", "tile.null.name",),
-    ("embers:dawnstone_anvil", "Dawnstone Anvil",),
-    ("embers:electrum", "tile.null.name",),
-    ("embers:ember_activator", "Ember Activator",),
-    ("embers:ember_bore", "Ember Bore",),
-    ("embers:ember_emitter", "Ember Emitter",),
-    ("embers:ember_gauge", "Ember Dial",),
-    ("embers:ember_injector", "Ember Injector",),
-    ("embers:ember_pulser", "Ember Ejector",),
-    ("embers:ember_receiver", "Ember Receptor",),
-    ("embers:ember_relay", "Ember Relay",),
-    ("embers:field_chart", "Field Chart",),
-    ("embers:fluid_gauge", "Fluid Dial",),
-    ("embers:glow", "tile.glow.name",),
-    ("embers:gold", "tile.null.name",),
-    ("embers:heat_coil", "Hearth Coil",),
-    ("embers:inferno_forge", "Inferno Forge",),
-    ("embers:inferno_forge_edge", "tile.inferno_forge_edge.name",),
-    ("embers:iron", "tile.null.name",),
-    ("embers:item_dropper", "Item Dropper",),
-    ("embers:item_pipe", "Item Pipe",),
-    ("embers:item_pump", "Item Extractor",),
-    ("embers:item_transfer", "Item Transfer",),
-    ("embers:large_tank", "Reservoir",),
-    ("embers:lead", "tile.null.name",),
-    ("embers:mech_accessor", "Machine Accessor",),
-    ("embers:mech_core", "Mechanical Core",),
-    ("embers:mech_edge", "tile.mech_edge.name",),
-    ("embers:mixer", "Mixer Centrifuge",),
-    ("embers:nickel", "tile.null.name",),
-    ("embers:ore_aluminum", "Aluminum Ore",),
-    ("embers:ore_copper", "Copper Ore",),
-    ("embers:ore_lead", "Lead Ore",),
-    ("embers:ore_nickel", "Nickel Ore",),
-    ("embers:ore_quartz", "Quartz Ore",),
-    ("embers:ore_silver", "Silver Ore",),
-    ("embers:ore_tin", "Tin Ore",),
-    ("embers:pipe", "Fluid Pipe",),
-    ("embers:pump", "Fluid Extractor",),
-    ("embers:reactor", "Ignem Reactor",),
-    ("embers:sealed_planks", "Sealed Planks",),
-    ("embers:seed", "tile.seed.name",),
-    ("embers:silver", "tile.null.name",),
-    ("embers:stairs_ashen_brick", "Ashen Brick Stairs",),
-    ("embers:stairs_ashen_stone", "Ashen Stone Stairs",),
-    ("embers:stairs_ashen_tile", "Ashen Tile Stairs",),
-    ("embers:stairs_caminite_brick", "Caminite Brick Stairs",),
-    ("embers:stamper", "Stamper",),
-    ("embers:stamper_base", "Stamp Base",),
-    ("embers:stone_edge", "Caminite Ring",),
-    ("embers:structure_marker", "tile.structure_marker.name",),
-    ("embers:tin", "tile.null.name",),
-    ("embers:vacuum", "Item Vacuum",),
-    ("embers:wall_ashen_brick", "tile.wall_ashen_brick.normal.name",),
-    ("embers:wall_ashen_stone", "tile.wall_ashen_stone.normal.name",),
-    ("embers:wall_ashen_tile", "tile.wall_ashen_tile.normal.name",),
-    ("embers:wall_caminite_brick", "tile.wall_caminite_brick.normal.name",),
-    ("embers:wrapped_sealed_planks", "Reinforced Sealed Planks",),
-    ("enderstorage:ender_storage", "tile.ender_storage.name",),
-    ("environmentaltech:aethium", "tile.environmentaltech.aethium.name",),
-    ("environmentaltech:aethium_brick_slab", "Aethium Brick Slab",),
-    ("environmentaltech:aethium_brick_slab_double", "tile.environmentaltech.aethium_brick_slab_double.name",),
-    ("environmentaltech:aethium_brick_stairs", "Aethium Brick Stairs",),
-    ("environmentaltech:aethium_paver_slab", "Aethium Paver Slab",),
-    ("environmentaltech:aethium_paver_slab_double", "tile.environmentaltech.aethium_paver_slab_double.name",),
-    ("environmentaltech:aethium_slab", "Aethium Slab",),
-    ("environmentaltech:aethium_slab_double", "tile.environmentaltech.aethium_slab_double.name",),
-    ("environmentaltech:aethium_stairs", "Aethium Stairs",),
-    ("environmentaltech:aethium_tile_slab", "Aethium Tile Slab",),
-    ("environmentaltech:aethium_tile_slab_double", "tile.environmentaltech.aethium_tile_slab_double.name",),
-    ("environmentaltech:aethium_tile_stairs", "Aethium Tile Stairs",),
-    ("environmentaltech:erodium", "tile.environmentaltech.erodium.name",),
-    ("environmentaltech:erodium_brick_slab", "Erodium Brick Slab",),
-    ("environmentaltech:erodium_brick_slab_double", "tile.environmentaltech.erodium_brick_slab_double.name",),
-    ("environmentaltech:erodium_brick_stairs", "Erodium Brick Stairs",),
-    ("environmentaltech:erodium_paver_slab", "Erodium Paver Slab",),
-    ("environmentaltech:erodium_paver_slab_double", "tile.environmentaltech.erodium_paver_slab_double.name",),
-    ("environmentaltech:erodium_slab", "Erodium Slab",),
-    ("environmentaltech:erodium_slab_double", "tile.environmentaltech.erodium_slab_double.name",),
-    ("environmentaltech:erodium_stairs", "Erodium Stairs",),
-    ("environmentaltech:erodium_tile_slab", "Erodium Tile Slab",),
-    ("environmentaltech:erodium_tile_slab_double", "tile.environmentaltech.erodium_tile_slab_double.name",),
-    ("environmentaltech:erodium_tile_stairs", "Erodium Tile Stairs",),
-    ("environmentaltech:interconnect", "Interconnect",),
-    ("environmentaltech:ionite", "tile.environmentaltech.ionite.name",),
-    ("environmentaltech:ionite_brick_slab", "Ionite Brick Slab",),
-    ("environmentaltech:ionite_brick_slab_double", "tile.environmentaltech.ionite_brick_slab_double.name",),
-    ("environmentaltech:ionite_brick_stairs", "Ionite Brick Stairs",),
-    ("environmentaltech:ionite_paver_slab", "Ionite Paver Slab",),
-    ("environmentaltech:ionite_paver_slab_double", "tile.environmentaltech.ionite_paver_slab_double.name",),
-    ("environmentaltech:ionite_slab", "Ionite Slab",),
-    ("environmentaltech:ionite_slab_double", "tile.environmentaltech.ionite_slab_double.name",),
-    ("environmentaltech:ionite_stairs", "Ionite Stairs",),
-    ("environmentaltech:ionite_tile_slab", "Ionite Tile Slab",),
-    ("environmentaltech:ionite_tile_slab_double", "tile.environmentaltech.ionite_tile_slab_double.name",),
-    ("environmentaltech:ionite_tile_stairs", "Ionite Tile Stairs",),
-    ("environmentaltech:kyronite", "tile.environmentaltech.kyronite.name",),
-    ("environmentaltech:kyronite_brick_slab", "Kyronite Brick Slab",),
-    ("environmentaltech:kyronite_brick_slab_double", "tile.environmentaltech.kyronite_brick_slab_double.name",),
-    ("environmentaltech:kyronite_brick_stairs", "Kyronite Brick Stairs",),
-    ("environmentaltech:kyronite_paver_slab", "Kyronite Paver Slab",),
-    ("environmentaltech:kyronite_paver_slab_double", "tile.environmentaltech.kyronite_paver_slab_double.name",),
-    ("environmentaltech:kyronite_slab", "Kyronite Slab",),
-    ("environmentaltech:kyronite_slab_double", "tile.environmentaltech.kyronite_slab_double.name",),
-    ("environmentaltech:kyronite_stairs", "Kyronite Stairs",),
-    ("environmentaltech:kyronite_tile_slab", "Kyronite Tile Slab",),
-    ("environmentaltech:kyronite_tile_slab_double", "tile.environmentaltech.kyronite_tile_slab_double.name",),
-    ("environmentaltech:kyronite_tile_stairs", "Kyronite Tile Stairs",),
-    ("environmentaltech:laser_core", "Laser Core",),
-    ("environmentaltech:laser_lens", "Clear Laser Lens",),
-    ("environmentaltech:laser_lens_colored", "tile.environmentaltech.laser_lens_colored.name",),
-    ("environmentaltech:laser_lens_crystal", "Crystal Laser Lens",),
-    ("environmentaltech:lightning_cont_1", "Lightning Controller Tier 1",),
-    ("environmentaltech:lightning_cont_2", "Lightning Controller Tier 2",),
-    ("environmentaltech:lightning_cont_3", "Lightning Controller Tier 3",),
-    ("environmentaltech:lightning_cont_4", "Lightning Controller Tier 4",),
-    ("environmentaltech:lightning_cont_5", "Lightning Controller Tier 5",),
-    ("environmentaltech:lightning_cont_6", "Lightning Controller Tier 6",),
-    ("environmentaltech:lightning_rod", "Lightning Rod",),
-    ("environmentaltech:lightning_rod_insulated", "Insulated Lightning Rod",),
-    ("environmentaltech:litherite", "tile.environmentaltech.litherite.name",),
-    ("environmentaltech:litherite_brick_slab", "Litherite Brick Slab",),
-    ("environmentaltech:litherite_brick_slab_double", "tile.environmentaltech.litherite_brick_slab_double.name",),
-    ("environmentaltech:litherite_brick_stairs", "Litherite Brick Stairs",),
-    ("environmentaltech:litherite_paver_slab", "Litherite Paver Slab",),
-    ("environmentaltech:litherite_paver_slab_double", "tile.environmentaltech.litherite_paver_slab_double.name",),
-    ("environmentaltech:litherite_slab", "Litherite Slab",),
-    ("environmentaltech:litherite_slab_double", "tile.environmentaltech.litherite_slab_double.name",),
-    ("environmentaltech:litherite_stairs", "Litherite Stairs",),
-    ("environmentaltech:litherite_tile_slab", "Litherite Tile Slab",),
-    ("environmentaltech:litherite_tile_slab_double", "tile.environmentaltech.litherite_tile_slab_double.name",),
-    ("environmentaltech:litherite_tile_stairs", "Litherite Tile Stairs",),
-    ("environmentaltech:lonsdaleite", "tile.environmentaltech.lonsdaleite.name",),
-    ("environmentaltech:lonsdaleite_brick_slab", "Lonsdaleite Brick Slab",),
-    ("environmentaltech:lonsdaleite_brick_slab_double", "tile.environmentaltech.lonsdaleite_brick_slab_double.name",),
-    ("environmentaltech:lonsdaleite_brick_stairs", "Lonsdaleite Brick Stairs",),
-    ("environmentaltech:lonsdaleite_paver_slab", "Lonsdaleite Paver Slab",),
-    ("environmentaltech:lonsdaleite_paver_slab_double", "tile.environmentaltech.lonsdaleite_paver_slab_double.name",),
-    ("environmentaltech:lonsdaleite_slab", "Lonsdaleite Slab",),
-    ("environmentaltech:lonsdaleite_slab_double", "tile.environmentaltech.lonsdaleite_slab_double.name",),
-    ("environmentaltech:lonsdaleite_stairs", "Lonsdaleite Stairs",),
-    ("environmentaltech:lonsdaleite_tile_slab", "Lonsdaleite Tile Slab",),
-    ("environmentaltech:lonsdaleite_tile_slab_double", "tile.environmentaltech.lonsdaleite_tile_slab_double.name",),
-    ("environmentaltech:lonsdaleite_tile_stairs", "Lonsdaleite Tile Stairs",),
-    ("environmentaltech:mica", "Mica",),
-    ("environmentaltech:modifier_accuracy", "Accuracy Modifier",),
-    ("environmentaltech:modifier_null", "Null Modifier",),
-    ("environmentaltech:modifier_piezo", "Piezo Modifier",),
-    ("environmentaltech:modifier_speed", "Speed Modifier",),
-    ("environmentaltech:pladium", "tile.environmentaltech.pladium.name",),
-    ("environmentaltech:pladium_brick_slab", "Pladium Brick Slab",),
-    ("environmentaltech:pladium_brick_slab_double", "tile.environmentaltech.pladium_brick_slab_double.name",),
-    ("environmentaltech:pladium_brick_stairs", "Pladium Brick Stairs",),
-    ("environmentaltech:pladium_paver_slab", "Pladium Paver Slab",),
-    ("environmentaltech:pladium_paver_slab_double", "tile.environmentaltech.pladium_paver_slab_double.name",),
-    ("environmentaltech:pladium_slab", "Pladium Slab",),
-    ("environmentaltech:pladium_slab_double", "tile.environmentaltech.pladium_slab_double.name",),
-    ("environmentaltech:pladium_stairs", "Pladium Stairs",),
-    ("environmentaltech:pladium_tile_slab", "Pladium Tile Slab",),
-    ("environmentaltech:pladium_tile_slab_double", "tile.environmentaltech.pladium_tile_slab_double.name",),
-    ("environmentaltech:pladium_tile_stairs", "Pladium Tile Stairs",),
-    ("environmentaltech:solar_cell_aethium", "Aethium Solar Cell",),
-    ("environmentaltech:solar_cell_erodium", "Erodium Solar Cell",),
-    ("environmentaltech:solar_cell_ionite", "Ionite Solar Cell",),
-    ("environmentaltech:solar_cell_kyronite", "Kyronite Solar Cell",),
-    ("environmentaltech:solar_cell_litherite", "Litherite Solar Cell",),
-    ("environmentaltech:solar_cell_pladium", "Pladium Solar Cell",),
-    ("environmentaltech:solar_cont_1", "Solar Array Controller Tier 1",),
-    ("environmentaltech:solar_cont_2", "Solar Array Controller Tier 2",),
-    ("environmentaltech:solar_cont_3", "Solar Array Controller Tier 3",),
-    ("environmentaltech:solar_cont_4", "Solar Array Controller Tier 4",),
-    ("environmentaltech:solar_cont_5", "Solar Array Controller Tier 5",),
-    ("environmentaltech:solar_cont_6", "Solar Array Controller Tier 6",),
-    ("environmentaltech:structure_frame_1", "Structure Frame Tier 1",),
-    ("environmentaltech:structure_frame_2", "Structure Frame Tier 2",),
-    ("environmentaltech:structure_frame_3", "Structure Frame Tier 3",),
-    ("environmentaltech:structure_frame_4", "Structure Frame Tier 4",),
-    ("environmentaltech:structure_frame_5", "Structure Frame Tier 5",),
-    ("environmentaltech:structure_frame_6", "Structure Frame Tier 6",),
-    ("environmentaltech:structure_panel", "Structure Panel",),
-    ("environmentaltech:structure_panel_clear", "Clear Structure Panel",),
-    ("environmentaltech:thermal_cell", "Thermal Cell",),
-    ("environmentaltech:void_botanic_miner_cont_1", "Void Botanic Miner Controller Tier 1",),
-    ("environmentaltech:void_botanic_miner_cont_2", "Void Botanic Miner Controller Tier 2",),
-    ("environmentaltech:void_botanic_miner_cont_3", "Void Botanic Miner Controller Tier 3",),
-    ("environmentaltech:void_botanic_miner_cont_4", "Void Botanic Miner Controller Tier 4",),
-    ("environmentaltech:void_botanic_miner_cont_5", "Void Botanic Miner Controller Tier 5",),
-    ("environmentaltech:void_botanic_miner_cont_6", "Void Botanic Miner Controller Tier 6",),
-    ("environmentaltech:void_ore_miner_cont_1", "Void Ore Miner Controller Tier 1",),
-    ("environmentaltech:void_ore_miner_cont_2", "Void Ore Miner Controller Tier 2",),
-    ("environmentaltech:void_ore_miner_cont_3", "Void Ore Miner Controller Tier 3",),
-    ("environmentaltech:void_ore_miner_cont_4", "Void Ore Miner Controller Tier 4",),
-    ("environmentaltech:void_ore_miner_cont_5", "Void Ore Miner Controller Tier 5",),
-    ("environmentaltech:void_ore_miner_cont_6", "Void Ore Miner Controller Tier 6",),
-    ("environmentaltech:void_res_miner_cont_1", "Void Resource Miner Controller Tier 1",),
-    ("environmentaltech:void_res_miner_cont_2", "Void Resource Miner Controller Tier 2",),
-    ("environmentaltech:void_res_miner_cont_3", "Void Resource Miner Controller Tier 3",),
-    ("environmentaltech:void_res_miner_cont_4", "Void Resource Miner Controller Tier 4",),
-    ("environmentaltech:void_res_miner_cont_5", "Void Resource Miner Controller Tier 5",),
-    ("environmentaltech:void_res_miner_cont_6", "Void Resource Miner Controller Tier 6",),
-    ("extrabees:alveary", "Frame Housing",),
-    ("extrabees:ectoplasm", "Ectoplasm",),
-    ("extrabees:hive", "tile.null.name",),
-    ("extracells:certustank", "extracells.block.certustank.name",),
-    ("extracells:ecbaseblock", "tile.extracells.block.ecbaseblock.name",),
-    ("extracells:fluidcrafter", "ME Fluid Assembler",),
-    ("extracells:fluidfiller", "ME Fluid Auto Filler",),
-    ("extracells:hardmedrive", "Blast resistant ME Drive",),
-    ("extracells:vibrantchamberfluid", "Fluid Vibration Chamber",),
-    ("extracells:walrus", "Walrus",),
-    ("extrarails:comparator_rail", "Comparator Rail",),
-    ("extrarails:direction_rail", "Direction Rail",),
-    ("extrarails:locking_rail", "Locking Rail",),
-    ("extrarails:teleporting_rail", "Teleporting Rail",),
-    ("extrarails:wooden_rail", "Wooden Rail",),
-    ("extratrees:carpentry", "tile.null.name",),
-    ("extratrees:carpentrypanel", "tile.null.name",),
-    ("extratrees:doors.alder", "item.doors.alder.name",),
-    ("extratrees:doors.apple", "item.doors.apple.name",),
-    ("extratrees:doors.ash", "item.doors.ash.name",),
-    ("extratrees:doors.banana", "item.doors.banana.name",),
-    ("extratrees:doors.beech", "item.doors.beech.name",),
-    ("extratrees:doors.box", "item.doors.box.name",),
-    ("extratrees:doors.brazilwood", "item.doors.brazilwood.name",),
-    ("extratrees:doors.butternut", "item.doors.butternut.name",),
-    ("extratrees:doors.cedar", "item.doors.cedar.name",),
-    ("extratrees:doors.cypress", "item.doors.cypress.name",),
-    ("extratrees:doors.elder", "item.doors.elder.name",),
-    ("extratrees:doors.elm", "item.doors.elm.name",),
-    ("extratrees:doors.eucalyptus", "item.doors.eucalyptus.name",),
-    ("extratrees:doors.fig", "item.doors.fig.name",),
-    ("extratrees:doors.fir", "item.doors.fir.name",),
-    ("extratrees:doors.gingko", "item.doors.gingko.name",),
-    ("extratrees:doors.hawthorn", "item.doors.hawthorn.name",),
-    ("extratrees:doors.hazel", "item.doors.hazel.name",),
-    ("extratrees:doors.hemlock", "item.doors.hemlock.name",),
-    ("extratrees:doors.hickory", "item.doors.hickory.name",),
-    ("extratrees:doors.holly", "item.doors.holly.name",),
-    ("extratrees:doors.hornbeam", "item.doors.hornbeam.name",),
-    ("extratrees:doors.iroko", "item.doors.iroko.name",),
-    ("extratrees:doors.locust", "item.doors.locust.name",),
-    ("extratrees:doors.logwood", "item.doors.logwood.name",),
-    ("extratrees:doors.maclura", "item.doors.maclura.name",),
-    ("extratrees:doors.olive", "item.doors.olive.name",),
-    ("extratrees:doors.pear", "item.doors.pear.name",),
-    ("extratrees:doors.pinkivory", "item.doors.pinkivory.name",),
-    ("extratrees:doors.purpleheart", "item.doors.purpleheart.name",),
-    ("extratrees:doors.rosewood", "item.doors.rosewood.name",),
-    ("extratrees:doors.rowan", "item.doors.rowan.name",),
-    ("extratrees:doors.sweetgum", "item.doors.sweetgum.name",),
-    ("extratrees:doors.syzgium", "item.doors.syzgium.name",),
-    ("extratrees:doors.whitebeam", "item.doors.whitebeam.name",),
-    ("extratrees:doors.yew", "item.doors.yew.name",),
-    ("extratrees:fence.gates.alder", "tile.fence.gates.alder.name",),
-    ("extratrees:fence.gates.apple", "tile.fence.gates.apple.name",),
-    ("extratrees:fence.gates.ash", "tile.fence.gates.ash.name",),
-    ("extratrees:fence.gates.banana", "tile.fence.gates.banana.name",),
-    ("extratrees:fence.gates.beech", "tile.fence.gates.beech.name",),
-    ("extratrees:fence.gates.box", "tile.fence.gates.box.name",),
-    ("extratrees:fence.gates.brazilwood", "tile.fence.gates.brazilwood.name",),
-    ("extratrees:fence.gates.butternut", "tile.fence.gates.butternut.name",),
-    ("extratrees:fence.gates.cedar", "tile.fence.gates.cedar.name",),
-    ("extratrees:fence.gates.cypress", "tile.fence.gates.cypress.name",),
-    ("extratrees:fence.gates.elder", "tile.fence.gates.elder.name",),
-    ("extratrees:fence.gates.elm", "tile.fence.gates.elm.name",),
-    ("extratrees:fence.gates.eucalyptus", "tile.fence.gates.eucalyptus.name",),
-    ("extratrees:fence.gates.fig", "tile.fence.gates.fig.name",),
-    ("extratrees:fence.gates.fir", "tile.fence.gates.fir.name",),
-    ("extratrees:fence.gates.fireproof.alder", "tile.fence.gates.fireproof.alder.name",),
-    ("extratrees:fence.gates.fireproof.apple", "tile.fence.gates.fireproof.apple.name",),
-    ("extratrees:fence.gates.fireproof.ash", "tile.fence.gates.fireproof.ash.name",),
-    ("extratrees:fence.gates.fireproof.banana", "tile.fence.gates.fireproof.banana.name",),
-    ("extratrees:fence.gates.fireproof.beech", "tile.fence.gates.fireproof.beech.name",),
-    ("extratrees:fence.gates.fireproof.box", "tile.fence.gates.fireproof.box.name",),
-    ("extratrees:fence.gates.fireproof.brazilwood", "tile.fence.gates.fireproof.brazilwood.name",),
-    ("extratrees:fence.gates.fireproof.butternut", "tile.fence.gates.fireproof.butternut.name",),
-    ("extratrees:fence.gates.fireproof.cedar", "tile.fence.gates.fireproof.cedar.name",),
-    ("extratrees:fence.gates.fireproof.cypress", "tile.fence.gates.fireproof.cypress.name",),
-    ("extratrees:fence.gates.fireproof.elder", "tile.fence.gates.fireproof.elder.name",),
-    ("extratrees:fence.gates.fireproof.elm", "tile.fence.gates.fireproof.elm.name",),
-    ("extratrees:fence.gates.fireproof.eucalyptus", "tile.fence.gates.fireproof.eucalyptus.name",),
-    ("extratrees:fence.gates.fireproof.fig", "tile.fence.gates.fireproof.fig.name",),
-    ("extratrees:fence.gates.fireproof.fir", "tile.fence.gates.fireproof.fir.name",),
-    ("extratrees:fence.gates.fireproof.gingko", "tile.fence.gates.fireproof.gingko.name",),
-    ("extratrees:fence.gates.fireproof.hawthorn", "tile.fence.gates.fireproof.hawthorn.name",),
-    ("extratrees:fence.gates.fireproof.hazel", "tile.fence.gates.fireproof.hazel.name",),
-    ("extratrees:fence.gates.fireproof.hemlock", "tile.fence.gates.fireproof.hemlock.name",),
-    ("extratrees:fence.gates.fireproof.hickory", "tile.fence.gates.fireproof.hickory.name",),
-    ("extratrees:fence.gates.fireproof.holly", "tile.fence.gates.fireproof.holly.name",),
-    ("extratrees:fence.gates.fireproof.hornbeam", "tile.fence.gates.fireproof.hornbeam.name",),
-    ("extratrees:fence.gates.fireproof.iroko", "tile.fence.gates.fireproof.iroko.name",),
-    ("extratrees:fence.gates.fireproof.locust", "tile.fence.gates.fireproof.locust.name",),
-    ("extratrees:fence.gates.fireproof.logwood", "tile.fence.gates.fireproof.logwood.name",),
-    ("extratrees:fence.gates.fireproof.maclura", "tile.fence.gates.fireproof.maclura.name",),
-    ("extratrees:fence.gates.fireproof.olive", "tile.fence.gates.fireproof.olive.name",),
-    ("extratrees:fence.gates.fireproof.pear", "tile.fence.gates.fireproof.pear.name",),
-    ("extratrees:fence.gates.fireproof.pinkivory", "tile.fence.gates.fireproof.pinkivory.name",),
-    ("extratrees:fence.gates.fireproof.purpleheart", "tile.fence.gates.fireproof.purpleheart.name",),
-    ("extratrees:fence.gates.fireproof.rosewood", "tile.fence.gates.fireproof.rosewood.name",),
-    ("extratrees:fence.gates.fireproof.rowan", "tile.fence.gates.fireproof.rowan.name",),
-    ("extratrees:fence.gates.fireproof.sweetgum", "tile.fence.gates.fireproof.sweetgum.name",),
-    ("extratrees:fence.gates.fireproof.syzgium", "tile.fence.gates.fireproof.syzgium.name",),
-    ("extratrees:fence.gates.fireproof.whitebeam", "tile.fence.gates.fireproof.whitebeam.name",),
-    ("extratrees:fence.gates.fireproof.yew", "tile.fence.gates.fireproof.yew.name",),
-    ("extratrees:fence.gates.gingko", "tile.fence.gates.gingko.name",),
-    ("extratrees:fence.gates.hawthorn", "tile.fence.gates.hawthorn.name",),
-    ("extratrees:fence.gates.hazel", "tile.fence.gates.hazel.name",),
-    ("extratrees:fence.gates.hemlock", "tile.fence.gates.hemlock.name",),
-    ("extratrees:fence.gates.hickory", "tile.fence.gates.hickory.name",),
-    ("extratrees:fence.gates.holly", "tile.fence.gates.holly.name",),
-    ("extratrees:fence.gates.hornbeam", "tile.fence.gates.hornbeam.name",),
-    ("extratrees:fence.gates.iroko", "tile.fence.gates.iroko.name",),
-    ("extratrees:fence.gates.locust", "tile.fence.gates.locust.name",),
-    ("extratrees:fence.gates.logwood", "tile.fence.gates.logwood.name",),
-    ("extratrees:fence.gates.maclura", "tile.fence.gates.maclura.name",),
-    ("extratrees:fence.gates.olive", "tile.fence.gates.olive.name",),
-    ("extratrees:fence.gates.pear", "tile.fence.gates.pear.name",),
-    ("extratrees:fence.gates.pinkivory", "tile.fence.gates.pinkivory.name",),
-    ("extratrees:fence.gates.purpleheart", "tile.fence.gates.purpleheart.name",),
-    ("extratrees:fence.gates.rosewood", "tile.fence.gates.rosewood.name",),
-    ("extratrees:fence.gates.rowan", "tile.fence.gates.rowan.name",),
-    ("extratrees:fence.gates.sweetgum", "tile.fence.gates.sweetgum.name",),
-    ("extratrees:fence.gates.syzgium", "tile.fence.gates.syzgium.name",),
-    ("extratrees:fence.gates.whitebeam", "tile.fence.gates.whitebeam.name",),
-    ("extratrees:fence.gates.yew", "tile.fence.gates.yew.name",),
-    ("extratrees:fences.0", "tile.fences.0.name",),
-    ("extratrees:fences.1", "tile.fences.1.name",),
-    ("extratrees:fences.2", "tile.fences.2.name",),
-    ("extratrees:fences.fireproof.0", "tile.fences.fireproof.0.name",),
-    ("extratrees:fences.fireproof.1", "tile.fences.fireproof.1.name",),
-    ("extratrees:fences.fireproof.2", "tile.fences.fireproof.2.name",),
-    ("extratrees:hops", "tile.hops.name",),
-    ("extratrees:leaves.decorative.0", "tile.leaves.decorative.0.name",),
-    ("extratrees:leaves.decorative.1", "tile.leaves.decorative.1.name",),
-    ("extratrees:leaves.decorative.2", "tile.leaves.decorative.2.name",),
-    ("extratrees:leaves.decorative.3", "tile.leaves.decorative.3.name",),
-    ("extratrees:leaves.decorative.4", "tile.leaves.decorative.4.name",),
-    ("extratrees:leaves.decorative.5", "tile.leaves.decorative.5.name",),
-    ("extratrees:leaves.decorative.6", "tile.leaves.decorative.6.name",),
-    ("extratrees:leaves.default.0", "tile.leaves.default.0.name",),
-    ("extratrees:leaves.default.1", "tile.leaves.default.1.name",),
-    ("extratrees:leaves.default.10", "tile.leaves.default.10.name",),
-    ("extratrees:leaves.default.11", "tile.leaves.default.11.name",),
-    ("extratrees:leaves.default.12", "tile.leaves.default.12.name",),
-    ("extratrees:leaves.default.13", "tile.leaves.default.13.name",),
-    ("extratrees:leaves.default.14", "tile.leaves.default.14.name",),
-    ("extratrees:leaves.default.15", "tile.leaves.default.15.name",),
-    ("extratrees:leaves.default.16", "tile.leaves.default.16.name",),
-    ("extratrees:leaves.default.17", "tile.leaves.default.17.name",),
-    ("extratrees:leaves.default.18", "tile.leaves.default.18.name",),
-    ("extratrees:leaves.default.19", "tile.leaves.default.19.name",),
-    ("extratrees:leaves.default.2", "tile.leaves.default.2.name",),
-    ("extratrees:leaves.default.20", "tile.leaves.default.20.name",),
-    ("extratrees:leaves.default.21", "tile.leaves.default.21.name",),
-    ("extratrees:leaves.default.22", "tile.leaves.default.22.name",),
-    ("extratrees:leaves.default.23", "tile.leaves.default.23.name",),
-    ("extratrees:leaves.default.24", "tile.leaves.default.24.name",),
-    ("extratrees:leaves.default.3", "tile.leaves.default.3.name",),
-    ("extratrees:leaves.default.4", "tile.leaves.default.4.name",),
-    ("extratrees:leaves.default.5", "tile.leaves.default.5.name",),
-    ("extratrees:leaves.default.6", "tile.leaves.default.6.name",),
-    ("extratrees:leaves.default.7", "tile.leaves.default.7.name",),
-    ("extratrees:leaves.default.8", "tile.leaves.default.8.name",),
-    ("extratrees:leaves.default.9", "tile.leaves.default.9.name",),
-    ("extratrees:logs.0", "tile.logs.0.name",),
-    ("extratrees:logs.1", "tile.logs.1.name",),
-    ("extratrees:logs.2", "tile.logs.2.name",),
-    ("extratrees:logs.3", "tile.logs.3.name",),
-    ("extratrees:logs.4", "tile.logs.4.name",),
-    ("extratrees:logs.5", "tile.logs.5.name",),
-    ("extratrees:logs.6", "tile.logs.6.name",),
-    ("extratrees:logs.7", "tile.logs.7.name",),
-    ("extratrees:logs.8", "tile.logs.8.name",),
-    ("extratrees:logs.9", "tile.logs.9.name",),
-    ("extratrees:logs.fireproof.0", "tile.logs.fireproof.0.name",),
-    ("extratrees:logs.fireproof.1", "tile.logs.fireproof.1.name",),
-    ("extratrees:logs.fireproof.2", "tile.logs.fireproof.2.name",),
-    ("extratrees:logs.fireproof.3", "tile.logs.fireproof.3.name",),
-    ("extratrees:logs.fireproof.4", "tile.logs.fireproof.4.name",),
-    ("extratrees:logs.fireproof.5", "tile.logs.fireproof.5.name",),
-    ("extratrees:logs.fireproof.6", "tile.logs.fireproof.6.name",),
-    ("extratrees:logs.fireproof.7", "tile.logs.fireproof.7.name",),
-    ("extratrees:logs.fireproof.8", "tile.logs.fireproof.8.name",),
-    ("extratrees:logs.fireproof.9", "tile.logs.fireproof.9.name",),
-    ("extratrees:machine", "tile.null.name",),
-    ("extratrees:multifence", "tile.null.name",),
-    ("extratrees:planks.0", "tile.planks.0.name",),
-    ("extratrees:planks.1", "tile.planks.1.name",),
-    ("extratrees:planks.2", "tile.planks.2.name",),
-    ("extratrees:planks.fireproof.0", "tile.planks.fireproof.0.name",),
-    ("extratrees:planks.fireproof.1", "tile.planks.fireproof.1.name",),
-    ("extratrees:planks.fireproof.2", "tile.planks.fireproof.2.name",),
-    ("extratrees:shrub_log", "tile.shrub_log.name",),
-    ("extratrees:slabs.0", "tile.slabs.0.name",),
-    ("extratrees:slabs.1", "tile.slabs.1.name",),
-    ("extratrees:slabs.2", "tile.slabs.2.name",),
-    ("extratrees:slabs.3", "tile.slabs.3.name",),
-    ("extratrees:slabs.4", "tile.slabs.4.name",),
-    ("extratrees:slabs.double.0", "tile.slabs.double.0.name",),
-    ("extratrees:slabs.double.1", "tile.slabs.double.1.name",),
-    ("extratrees:slabs.double.2", "tile.slabs.double.2.name",),
-    ("extratrees:slabs.double.3", "tile.slabs.double.3.name",),
-    ("extratrees:slabs.double.4", "tile.slabs.double.4.name",),
-    ("extratrees:slabs.fireproof.0", "tile.slabs.fireproof.0.name",),
-    ("extratrees:slabs.fireproof.1", "tile.slabs.fireproof.1.name",),
-    ("extratrees:slabs.fireproof.2", "tile.slabs.fireproof.2.name",),
-    ("extratrees:slabs.fireproof.3", "tile.slabs.fireproof.3.name",),
-    ("extratrees:slabs.fireproof.4", "tile.slabs.fireproof.4.name",),
-    ("extratrees:slabs.fireproof.double.0", "tile.slabs.fireproof.double.0.name",),
-    ("extratrees:slabs.fireproof.double.1", "tile.slabs.fireproof.double.1.name",),
-    ("extratrees:slabs.fireproof.double.2", "tile.slabs.fireproof.double.2.name",),
-    ("extratrees:slabs.fireproof.double.3", "tile.slabs.fireproof.double.3.name",),
-    ("extratrees:slabs.fireproof.double.4", "tile.slabs.fireproof.double.4.name",),
-    ("extratrees:stainedglass", "tile.null.name",),
-    ("extratrees:stairs.alder", "tile.stairs.alder.name",),
-    ("extratrees:stairs.apple", "tile.stairs.apple.name",),
-    ("extratrees:stairs.ash", "tile.stairs.ash.name",),
-    ("extratrees:stairs.banana", "tile.stairs.banana.name",),
-    ("extratrees:stairs.beech", "tile.stairs.beech.name",),
-    ("extratrees:stairs.box", "tile.stairs.box.name",),
-    ("extratrees:stairs.brazilwood", "tile.stairs.brazilwood.name",),
-    ("extratrees:stairs.butternut", "tile.stairs.butternut.name",),
-    ("extratrees:stairs.cedar", "tile.stairs.cedar.name",),
-    ("extratrees:stairs.cypress", "tile.stairs.cypress.name",),
-    ("extratrees:stairs.elder", "tile.stairs.elder.name",),
-    ("extratrees:stairs.elm", "tile.stairs.elm.name",),
-    ("extratrees:stairs.eucalyptus", "tile.stairs.eucalyptus.name",),
-    ("extratrees:stairs.fig", "tile.stairs.fig.name",),
-    ("extratrees:stairs.fir", "tile.stairs.fir.name",),
-    ("extratrees:stairs.fireproof.alder", "tile.stairs.fireproof.alder.name",),
-    ("extratrees:stairs.fireproof.apple", "tile.stairs.fireproof.apple.name",),
-    ("extratrees:stairs.fireproof.ash", "tile.stairs.fireproof.ash.name",),
-    ("extratrees:stairs.fireproof.banana", "tile.stairs.fireproof.banana.name",),
-    ("extratrees:stairs.fireproof.beech", "tile.stairs.fireproof.beech.name",),
-    ("extratrees:stairs.fireproof.box", "tile.stairs.fireproof.box.name",),
-    ("extratrees:stairs.fireproof.brazilwood", "tile.stairs.fireproof.brazilwood.name",),
-    ("extratrees:stairs.fireproof.butternut", "tile.stairs.fireproof.butternut.name",),
-    ("extratrees:stairs.fireproof.cedar", "tile.stairs.fireproof.cedar.name",),
-    ("extratrees:stairs.fireproof.cypress", "tile.stairs.fireproof.cypress.name",),
-    ("extratrees:stairs.fireproof.elder", "tile.stairs.fireproof.elder.name",),
-    ("extratrees:stairs.fireproof.elm", "tile.stairs.fireproof.elm.name",),
-    ("extratrees:stairs.fireproof.eucalyptus", "tile.stairs.fireproof.eucalyptus.name",),
-    ("extratrees:stairs.fireproof.fig", "tile.stairs.fireproof.fig.name",),
-    ("extratrees:stairs.fireproof.fir", "tile.stairs.fireproof.fir.name",),
-    ("extratrees:stairs.fireproof.gingko", "tile.stairs.fireproof.gingko.name",),
-    ("extratrees:stairs.fireproof.hawthorn", "tile.stairs.fireproof.hawthorn.name",),
-    ("extratrees:stairs.fireproof.hazel", "tile.stairs.fireproof.hazel.name",),
-    ("extratrees:stairs.fireproof.hemlock", "tile.stairs.fireproof.hemlock.name",),
-    ("extratrees:stairs.fireproof.hickory", "tile.stairs.fireproof.hickory.name",),
-    ("extratrees:stairs.fireproof.holly", "tile.stairs.fireproof.holly.name",),
-    ("extratrees:stairs.fireproof.hornbeam", "tile.stairs.fireproof.hornbeam.name",),
-    ("extratrees:stairs.fireproof.iroko", "tile.stairs.fireproof.iroko.name",),
-    ("extratrees:stairs.fireproof.locust", "tile.stairs.fireproof.locust.name",),
-    ("extratrees:stairs.fireproof.logwood", "tile.stairs.fireproof.logwood.name",),
-    ("extratrees:stairs.fireproof.maclura", "tile.stairs.fireproof.maclura.name",),
-    ("extratrees:stairs.fireproof.olive", "tile.stairs.fireproof.olive.name",),
-    ("extratrees:stairs.fireproof.pear", "tile.stairs.fireproof.pear.name",),
-    ("extratrees:stairs.fireproof.pinkivory", "tile.stairs.fireproof.pinkivory.name",),
-    ("extratrees:stairs.fireproof.purpleheart", "tile.stairs.fireproof.purpleheart.name",),
-    ("extratrees:stairs.fireproof.rosewood", "tile.stairs.fireproof.rosewood.name",),
-    ("extratrees:stairs.fireproof.rowan", "tile.stairs.fireproof.rowan.name",),
-    ("extratrees:stairs.fireproof.sweetgum", "tile.stairs.fireproof.sweetgum.name",),
-    ("extratrees:stairs.fireproof.syzgium", "tile.stairs.fireproof.syzgium.name",),
-    ("extratrees:stairs.fireproof.whitebeam", "tile.stairs.fireproof.whitebeam.name",),
-    ("extratrees:stairs.fireproof.yew", "tile.stairs.fireproof.yew.name",),
-    ("extratrees:stairs.gingko", "tile.stairs.gingko.name",),
-    ("extratrees:stairs.hawthorn", "tile.stairs.hawthorn.name",),
-    ("extratrees:stairs.hazel", "tile.stairs.hazel.name",),
-    ("extratrees:stairs.hemlock", "tile.stairs.hemlock.name",),
-    ("extratrees:stairs.hickory", "tile.stairs.hickory.name",),
-    ("extratrees:stairs.holly", "tile.stairs.holly.name",),
-    ("extratrees:stairs.hornbeam", "tile.stairs.hornbeam.name",),
-    ("extratrees:stairs.iroko", "tile.stairs.iroko.name",),
-    ("extratrees:stairs.locust", "tile.stairs.locust.name",),
-    ("extratrees:stairs.logwood", "tile.stairs.logwood.name",),
-    ("extratrees:stairs.maclura", "tile.stairs.maclura.name",),
-    ("extratrees:stairs.olive", "tile.stairs.olive.name",),
-    ("extratrees:stairs.pear", "tile.stairs.pear.name",),
-    ("extratrees:stairs.pinkivory", "tile.stairs.pinkivory.name",),
-    ("extratrees:stairs.purpleheart", "tile.stairs.purpleheart.name",),
-    ("extratrees:stairs.rosewood", "tile.stairs.rosewood.name",),
-    ("extratrees:stairs.rowan", "tile.stairs.rowan.name",),
-    ("extratrees:stairs.sweetgum", "tile.stairs.sweetgum.name",),
-    ("extratrees:stairs.syzgium", "tile.stairs.syzgium.name",),
-    ("extratrees:stairs.whitebeam", "tile.stairs.whitebeam.name",),
-    ("extratrees:stairs.yew", "tile.stairs.yew.name",),
-    ("extrautils2:analogcrafter", "Analog Crafter",),
-    ("extrautils2:angelblock", "Angel Block",),
-    ("extrautils2:chunkloader", "Chunk Loading Ward",),
-    ("extrautils2:compressedcobblestone", "tile.extrautils2:compressedcobblestone.name",),
-    ("extrautils2:compresseddirt", "tile.extrautils2:compresseddirt.name",),
-    ("extrautils2:compressedgravel", "tile.extrautils2:compressedgravel.name",),
-    ("extrautils2:compressednetherrack", "tile.extrautils2:compressednetherrack.name",),
-    ("extrautils2:compressedsand", "tile.extrautils2:compressedsand.name",),
-    ("extrautils2:crafter", "Mechanical Crafter",),
-    ("extrautils2:creativechest", "Creative Chest",),
-    ("extrautils2:creativeenergy", "Creative Energy Source",),
-    ("extrautils2:creativeharvest", "Creative Harvest",),
-    ("extrautils2:cursedearth", "Cursed Earth",),
-    ("extrautils2:decorativebedrock", "tile.extrautils2:decorativebedrock.name",),
-    ("extrautils2:decorativeglass", "tile.extrautils2:decorativeglass.name",),
-    ("extrautils2:decorativesolid", "tile.extrautils2:decorativesolid.name",),
-    ("extrautils2:decorativesolidwood", "tile.extrautils2:decorativesolidwood.name",),
-    ("extrautils2:drum", "Drum",),
-    ("extrautils2:enderlilly", "Ender Lilly",),
-    ("extrautils2:indexer", "Indexer",),
-    ("extrautils2:ineffableglass", "tile.extrautils2:ineffableglass.name",),
-    ("extrautils2:klein", "Klein Bottle",),
-    ("extrautils2:largishchest", "Slightly-Larger Chest",),
-    ("extrautils2:machine", "Machine",),
-    ("extrautils2:miner", "Mechanical Miner",),
-    ("extrautils2:minichest", "Mini Chest",),
-    ("extrautils2:moonstone", "Moon Stone",),
-    ("extrautils2:opinium", "tile.extrautils2:opinium.name",),
-    ("extrautils2:passivegenerator", "tile.extrautils2:passivegenerator.name",),
-    ("extrautils2:pipe", "Transfer Pipe",),
-    ("extrautils2:pipe_1", "Transfer Pipe",),
-    ("extrautils2:pipe_2", "Transfer Pipe",),
-    ("extrautils2:pipe_3", "Transfer Pipe",),
-    ("extrautils2:playerchest", "Player Chest",),
-    ("extrautils2:powerbattery", "Wireless RF Battery",),
-    ("extrautils2:poweroverload", "Power Overload",),
-    ("extrautils2:powertransmitter", "Wireless RF Transmitter",),
-    ("extrautils2:quarry", "Quantum Quarry",),
-    ("extrautils2:quarryproxy", "Quantum Quarry Actuator",),
-    ("extrautils2:rainbowgenerator", "tile.extrautils2:rainbowgenerator.name",),
-    ("extrautils2:redorchid", "Red Orchid",),
-    ("extrautils2:redstoneclock", "Redstone Clock",),
-    ("extrautils2:redstonelantern", "Redstone Lantern",),
-    ("extrautils2:resonator", "Resonator",),
-    ("extrautils2:scanner", "Scanner",),
-    ("extrautils2:screen", "Screen",),
-    ("extrautils2:simpledecorative", "tile.extrautils2:simpledecorative.name",),
-    ("extrautils2:soundmuffler", "Sound Muffler",),
-    ("extrautils2:spike_creative", "Creative Spikes",),
-    ("extrautils2:spike_diamond", "Diamond Spikes",),
-    ("extrautils2:spike_gold", "Golden Spikes",),
-    ("extrautils2:spike_iron", "Iron Spikes",),
-    ("extrautils2:spike_stone", "Stone Spikes",),
-    ("extrautils2:spike_wood", "Wooden Spikes",),
-    ("extrautils2:spotlight", "Spotlight",),
-    ("extrautils2:supermobspawner", "Resturbed Mob Spawner",),
-    ("extrautils2:teleporter", "tile.extrautils2:teleporter.name",),
-    ("extrautils2:terraformer", "tile.extrautils2:terraformer.name",),
-    ("extrautils2:transferholder", "tile.ExtraUtils2:pipe.pipe.container.name",),
-    ("extrautils2:trashcan", "Trash Can",),
-    ("extrautils2:trashcanenergy", "Trash Can (Energy)",),
-    ("extrautils2:trashcanfluid", "Trash Can (Fluid)",),
-    ("extrautils2:trashchest", "Trash Chest",),
-    ("extrautils2:user", "Mechanical User",),
-    ("fairylights:fastener", "tile.fastener.name",),
-    ("flatcoloredblocks:flatcoloredblock0", "tile.flatcoloredblocks.flatcoloredblock.0.name",),
-    ("flatcoloredblocks:flatcoloredblock1", "tile.flatcoloredblocks.flatcoloredblock.16.name",),
-    ("flatcoloredblocks:flatcoloredblock10", "tile.flatcoloredblocks.flatcoloredblock.160.name",),
-    ("flatcoloredblocks:flatcoloredblock11", "tile.flatcoloredblocks.flatcoloredblock.176.name",),
-    ("flatcoloredblocks:flatcoloredblock12", "tile.flatcoloredblocks.flatcoloredblock.192.name",),
-    ("flatcoloredblocks:flatcoloredblock13", "tile.flatcoloredblocks.flatcoloredblock.208.name",),
-    ("flatcoloredblocks:flatcoloredblock14", "tile.flatcoloredblocks.flatcoloredblock.224.name",),
-    ("flatcoloredblocks:flatcoloredblock15", "tile.flatcoloredblocks.flatcoloredblock.240.name",),
-    ("flatcoloredblocks:flatcoloredblock16", "tile.flatcoloredblocks.flatcoloredblock.256.name",),
-    ("flatcoloredblocks:flatcoloredblock17", "tile.flatcoloredblocks.flatcoloredblock.272.name",),
-    ("flatcoloredblocks:flatcoloredblock18", "tile.flatcoloredblocks.flatcoloredblock.288.name",),
-    ("flatcoloredblocks:flatcoloredblock19", "tile.flatcoloredblocks.flatcoloredblock.304.name",),
-    ("flatcoloredblocks:flatcoloredblock2", "tile.flatcoloredblocks.flatcoloredblock.32.name",),
-    ("flatcoloredblocks:flatcoloredblock20", "tile.flatcoloredblocks.flatcoloredblock.320.name",),
-    ("flatcoloredblocks:flatcoloredblock21", "tile.flatcoloredblocks.flatcoloredblock.336.name",),
-    ("flatcoloredblocks:flatcoloredblock22", "tile.flatcoloredblocks.flatcoloredblock.352.name",),
-    ("flatcoloredblocks:flatcoloredblock23", "tile.flatcoloredblocks.flatcoloredblock.368.name",),
-    ("flatcoloredblocks:flatcoloredblock24", "tile.flatcoloredblocks.flatcoloredblock.384.name",),
-    ("flatcoloredblocks:flatcoloredblock25", "tile.flatcoloredblocks.flatcoloredblock.400.name",),
-    ("flatcoloredblocks:flatcoloredblock26", "tile.flatcoloredblocks.flatcoloredblock.416.name",),
-    ("flatcoloredblocks:flatcoloredblock27", "tile.flatcoloredblocks.flatcoloredblock.432.name",),
-    ("flatcoloredblocks:flatcoloredblock28", "tile.flatcoloredblocks.flatcoloredblock.448.name",),
-    ("flatcoloredblocks:flatcoloredblock29", "tile.flatcoloredblocks.flatcoloredblock.464.name",),
-    ("flatcoloredblocks:flatcoloredblock3", "tile.flatcoloredblocks.flatcoloredblock.48.name",),
-    ("flatcoloredblocks:flatcoloredblock30", "tile.flatcoloredblocks.flatcoloredblock.480.name",),
-    ("flatcoloredblocks:flatcoloredblock31", "tile.flatcoloredblocks.flatcoloredblock.496.name",),
-    ("flatcoloredblocks:flatcoloredblock32", "tile.flatcoloredblocks.flatcoloredblock.512.name",),
-    ("flatcoloredblocks:flatcoloredblock33", "tile.flatcoloredblocks.flatcoloredblock.528.name",),
-    ("flatcoloredblocks:flatcoloredblock34", "tile.flatcoloredblocks.flatcoloredblock.544.name",),
-    ("flatcoloredblocks:flatcoloredblock35", "tile.flatcoloredblocks.flatcoloredblock.560.name",),
-    ("flatcoloredblocks:flatcoloredblock36", "tile.flatcoloredblocks.flatcoloredblock.576.name",),
-    ("flatcoloredblocks:flatcoloredblock37", "tile.flatcoloredblocks.flatcoloredblock.592.name",),
-    ("flatcoloredblocks:flatcoloredblock38", "tile.flatcoloredblocks.flatcoloredblock.608.name",),
-    ("flatcoloredblocks:flatcoloredblock39", "tile.flatcoloredblocks.flatcoloredblock.624.name",),
-    ("flatcoloredblocks:flatcoloredblock4", "tile.flatcoloredblocks.flatcoloredblock.64.name",),
-    ("flatcoloredblocks:flatcoloredblock40", "tile.flatcoloredblocks.flatcoloredblock.640.name",),
-    ("flatcoloredblocks:flatcoloredblock41", "tile.flatcoloredblocks.flatcoloredblock.656.name",),
-    ("flatcoloredblocks:flatcoloredblock42", "tile.flatcoloredblocks.flatcoloredblock.672.name",),
-    ("flatcoloredblocks:flatcoloredblock43", "tile.flatcoloredblocks.flatcoloredblock.688.name",),
-    ("flatcoloredblocks:flatcoloredblock44", "tile.flatcoloredblocks.flatcoloredblock.704.name",),
-    ("flatcoloredblocks:flatcoloredblock45", "tile.flatcoloredblocks.flatcoloredblock.720.name",),
-    ("flatcoloredblocks:flatcoloredblock46", "tile.flatcoloredblocks.flatcoloredblock.736.name",),
-    ("flatcoloredblocks:flatcoloredblock47", "tile.flatcoloredblocks.flatcoloredblock.752.name",),
-    ("flatcoloredblocks:flatcoloredblock48", "tile.flatcoloredblocks.flatcoloredblock.768.name",),
-    ("flatcoloredblocks:flatcoloredblock49", "tile.flatcoloredblocks.flatcoloredblock.784.name",),
-    ("flatcoloredblocks:flatcoloredblock5", "tile.flatcoloredblocks.flatcoloredblock.80.name",),
-    ("flatcoloredblocks:flatcoloredblock50", "tile.flatcoloredblocks.flatcoloredblock.800.name",),
-    ("flatcoloredblocks:flatcoloredblock51", "tile.flatcoloredblocks.flatcoloredblock.816.name",),
-    ("flatcoloredblocks:flatcoloredblock52", "tile.flatcoloredblocks.flatcoloredblock.832.name",),
-    ("flatcoloredblocks:flatcoloredblock53", "tile.flatcoloredblocks.flatcoloredblock.848.name",),
-    ("flatcoloredblocks:flatcoloredblock54", "tile.flatcoloredblocks.flatcoloredblock.864.name",),
-    ("flatcoloredblocks:flatcoloredblock55", "tile.flatcoloredblocks.flatcoloredblock.880.name",),
-    ("flatcoloredblocks:flatcoloredblock56", "tile.flatcoloredblocks.flatcoloredblock.896.name",),
-    ("flatcoloredblocks:flatcoloredblock57", "tile.flatcoloredblocks.flatcoloredblock.912.name",),
-    ("flatcoloredblocks:flatcoloredblock58", "tile.flatcoloredblocks.flatcoloredblock.928.name",),
-    ("flatcoloredblocks:flatcoloredblock59", "tile.flatcoloredblocks.flatcoloredblock.944.name",),
-    ("flatcoloredblocks:flatcoloredblock6", "tile.flatcoloredblocks.flatcoloredblock.96.name",),
-    ("flatcoloredblocks:flatcoloredblock60", "tile.flatcoloredblocks.flatcoloredblock.960.name",),
-    ("flatcoloredblocks:flatcoloredblock61", "tile.flatcoloredblocks.flatcoloredblock.976.name",),
-    ("flatcoloredblocks:flatcoloredblock62", "tile.flatcoloredblocks.flatcoloredblock.992.name",),
-    ("flatcoloredblocks:flatcoloredblock63", "tile.flatcoloredblocks.flatcoloredblock.1008.name",),
-    ("flatcoloredblocks:flatcoloredblock64", "tile.flatcoloredblocks.flatcoloredblock.1024.name",),
-    ("flatcoloredblocks:flatcoloredblock65", "tile.flatcoloredblocks.flatcoloredblock.1040.name",),
-    ("flatcoloredblocks:flatcoloredblock66", "tile.flatcoloredblocks.flatcoloredblock.1056.name",),
-    ("flatcoloredblocks:flatcoloredblock67", "tile.flatcoloredblocks.flatcoloredblock.1072.name",),
-    ("flatcoloredblocks:flatcoloredblock68", "tile.flatcoloredblocks.flatcoloredblock.1088.name",),
-    ("flatcoloredblocks:flatcoloredblock69", "tile.flatcoloredblocks.flatcoloredblock.1104.name",),
-    ("flatcoloredblocks:flatcoloredblock7", "tile.flatcoloredblocks.flatcoloredblock.112.name",),
-    ("flatcoloredblocks:flatcoloredblock70", "tile.flatcoloredblocks.flatcoloredblock.1120.name",),
-    ("flatcoloredblocks:flatcoloredblock71", "tile.flatcoloredblocks.flatcoloredblock.1136.name",),
-    ("flatcoloredblocks:flatcoloredblock72", "tile.flatcoloredblocks.flatcoloredblock.1152.name",),
-    ("flatcoloredblocks:flatcoloredblock73", "tile.flatcoloredblocks.flatcoloredblock.1168.name",),
-    ("flatcoloredblocks:flatcoloredblock74", "tile.flatcoloredblocks.flatcoloredblock.1184.name",),
-    ("flatcoloredblocks:flatcoloredblock75", "tile.flatcoloredblocks.flatcoloredblock.1200.name",),
-    ("flatcoloredblocks:flatcoloredblock76", "tile.flatcoloredblocks.flatcoloredblock.1216.name",),
-    ("flatcoloredblocks:flatcoloredblock77", "tile.flatcoloredblocks.flatcoloredblock.1232.name",),
-    ("flatcoloredblocks:flatcoloredblock78", "tile.flatcoloredblocks.flatcoloredblock.1248.name",),
-    ("flatcoloredblocks:flatcoloredblock79", "tile.flatcoloredblocks.flatcoloredblock.1264.name",),
-    ("flatcoloredblocks:flatcoloredblock8", "tile.flatcoloredblocks.flatcoloredblock.128.name",),
-    ("flatcoloredblocks:flatcoloredblock80", "tile.flatcoloredblocks.flatcoloredblock.1280.name",),
-    ("flatcoloredblocks:flatcoloredblock9", "tile.flatcoloredblocks.flatcoloredblock.144.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_0", "tile.flatcoloredblocks.flatcoloredblock.0.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_1", "tile.flatcoloredblocks.flatcoloredblock.16.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_10", "tile.flatcoloredblocks.flatcoloredblock.160.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_11", "tile.flatcoloredblocks.flatcoloredblock.176.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_12", "tile.flatcoloredblocks.flatcoloredblock.192.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_13", "tile.flatcoloredblocks.flatcoloredblock.208.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_14", "tile.flatcoloredblocks.flatcoloredblock.224.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_15", "tile.flatcoloredblocks.flatcoloredblock.240.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_16", "tile.flatcoloredblocks.flatcoloredblock.256.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_17", "tile.flatcoloredblocks.flatcoloredblock.272.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_18", "tile.flatcoloredblocks.flatcoloredblock.288.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_19", "tile.flatcoloredblocks.flatcoloredblock.304.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_2", "tile.flatcoloredblocks.flatcoloredblock.32.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_20", "tile.flatcoloredblocks.flatcoloredblock.320.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_21", "tile.flatcoloredblocks.flatcoloredblock.336.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_22", "tile.flatcoloredblocks.flatcoloredblock.352.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_23", "tile.flatcoloredblocks.flatcoloredblock.368.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_24", "tile.flatcoloredblocks.flatcoloredblock.384.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_25", "tile.flatcoloredblocks.flatcoloredblock.400.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_26", "tile.flatcoloredblocks.flatcoloredblock.416.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_27", "tile.flatcoloredblocks.flatcoloredblock.432.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_28", "tile.flatcoloredblocks.flatcoloredblock.448.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_29", "tile.flatcoloredblocks.flatcoloredblock.464.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_3", "tile.flatcoloredblocks.flatcoloredblock.48.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_30", "tile.flatcoloredblocks.flatcoloredblock.480.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_31", "tile.flatcoloredblocks.flatcoloredblock.496.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_32", "tile.flatcoloredblocks.flatcoloredblock.512.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_33", "tile.flatcoloredblocks.flatcoloredblock.528.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_34", "tile.flatcoloredblocks.flatcoloredblock.544.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_35", "tile.flatcoloredblocks.flatcoloredblock.560.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_36", "tile.flatcoloredblocks.flatcoloredblock.576.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_37", "tile.flatcoloredblocks.flatcoloredblock.592.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_38", "tile.flatcoloredblocks.flatcoloredblock.608.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_39", "tile.flatcoloredblocks.flatcoloredblock.624.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_4", "tile.flatcoloredblocks.flatcoloredblock.64.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_40", "tile.flatcoloredblocks.flatcoloredblock.640.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_41", "tile.flatcoloredblocks.flatcoloredblock.656.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_42", "tile.flatcoloredblocks.flatcoloredblock.672.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_43", "tile.flatcoloredblocks.flatcoloredblock.688.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_44", "tile.flatcoloredblocks.flatcoloredblock.704.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_45", "tile.flatcoloredblocks.flatcoloredblock.720.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_46", "tile.flatcoloredblocks.flatcoloredblock.736.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_47", "tile.flatcoloredblocks.flatcoloredblock.752.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_48", "tile.flatcoloredblocks.flatcoloredblock.768.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_49", "tile.flatcoloredblocks.flatcoloredblock.784.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_5", "tile.flatcoloredblocks.flatcoloredblock.80.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_50", "tile.flatcoloredblocks.flatcoloredblock.800.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_51", "tile.flatcoloredblocks.flatcoloredblock.816.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_52", "tile.flatcoloredblocks.flatcoloredblock.832.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_53", "tile.flatcoloredblocks.flatcoloredblock.848.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_54", "tile.flatcoloredblocks.flatcoloredblock.864.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_55", "tile.flatcoloredblocks.flatcoloredblock.880.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_56", "tile.flatcoloredblocks.flatcoloredblock.896.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_57", "tile.flatcoloredblocks.flatcoloredblock.912.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_58", "tile.flatcoloredblocks.flatcoloredblock.928.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_59", "tile.flatcoloredblocks.flatcoloredblock.944.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_6", "tile.flatcoloredblocks.flatcoloredblock.96.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_60", "tile.flatcoloredblocks.flatcoloredblock.960.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_61", "tile.flatcoloredblocks.flatcoloredblock.976.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_62", "tile.flatcoloredblocks.flatcoloredblock.992.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_63", "tile.flatcoloredblocks.flatcoloredblock.1008.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_64", "tile.flatcoloredblocks.flatcoloredblock.1024.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_65", "tile.flatcoloredblocks.flatcoloredblock.1040.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_66", "tile.flatcoloredblocks.flatcoloredblock.1056.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_67", "tile.flatcoloredblocks.flatcoloredblock.1072.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_68", "tile.flatcoloredblocks.flatcoloredblock.1088.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_69", "tile.flatcoloredblocks.flatcoloredblock.1104.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_7", "tile.flatcoloredblocks.flatcoloredblock.112.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_70", "tile.flatcoloredblocks.flatcoloredblock.1120.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_71", "tile.flatcoloredblocks.flatcoloredblock.1136.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_72", "tile.flatcoloredblocks.flatcoloredblock.1152.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_73", "tile.flatcoloredblocks.flatcoloredblock.1168.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_74", "tile.flatcoloredblocks.flatcoloredblock.1184.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_75", "tile.flatcoloredblocks.flatcoloredblock.1200.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_76", "tile.flatcoloredblocks.flatcoloredblock.1216.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_77", "tile.flatcoloredblocks.flatcoloredblock.1232.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_78", "tile.flatcoloredblocks.flatcoloredblock.1248.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_79", "tile.flatcoloredblocks.flatcoloredblock.1264.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_8", "tile.flatcoloredblocks.flatcoloredblock.128.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_80", "tile.flatcoloredblocks.flatcoloredblock.1280.name",),
-    ("flatcoloredblocks:flatcoloredblock_glowing0_9", "tile.flatcoloredblocks.flatcoloredblock.144.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_0", "tile.flatcoloredblocks.flatcoloredblock.0.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_1", "tile.flatcoloredblocks.flatcoloredblock.16.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_10", "tile.flatcoloredblocks.flatcoloredblock.160.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_11", "tile.flatcoloredblocks.flatcoloredblock.176.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_12", "tile.flatcoloredblocks.flatcoloredblock.192.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_13", "tile.flatcoloredblocks.flatcoloredblock.208.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_14", "tile.flatcoloredblocks.flatcoloredblock.224.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_15", "tile.flatcoloredblocks.flatcoloredblock.240.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_16", "tile.flatcoloredblocks.flatcoloredblock.256.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_17", "tile.flatcoloredblocks.flatcoloredblock.272.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_18", "tile.flatcoloredblocks.flatcoloredblock.288.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_19", "tile.flatcoloredblocks.flatcoloredblock.304.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_2", "tile.flatcoloredblocks.flatcoloredblock.32.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_20", "tile.flatcoloredblocks.flatcoloredblock.320.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_21", "tile.flatcoloredblocks.flatcoloredblock.336.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_22", "tile.flatcoloredblocks.flatcoloredblock.352.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_23", "tile.flatcoloredblocks.flatcoloredblock.368.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_24", "tile.flatcoloredblocks.flatcoloredblock.384.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_25", "tile.flatcoloredblocks.flatcoloredblock.400.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_26", "tile.flatcoloredblocks.flatcoloredblock.416.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_27", "tile.flatcoloredblocks.flatcoloredblock.432.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_28", "tile.flatcoloredblocks.flatcoloredblock.448.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_29", "tile.flatcoloredblocks.flatcoloredblock.464.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_3", "tile.flatcoloredblocks.flatcoloredblock.48.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_30", "tile.flatcoloredblocks.flatcoloredblock.480.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_31", "tile.flatcoloredblocks.flatcoloredblock.496.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_32", "tile.flatcoloredblocks.flatcoloredblock.512.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_33", "tile.flatcoloredblocks.flatcoloredblock.528.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_34", "tile.flatcoloredblocks.flatcoloredblock.544.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_35", "tile.flatcoloredblocks.flatcoloredblock.560.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_36", "tile.flatcoloredblocks.flatcoloredblock.576.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_37", "tile.flatcoloredblocks.flatcoloredblock.592.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_38", "tile.flatcoloredblocks.flatcoloredblock.608.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_39", "tile.flatcoloredblocks.flatcoloredblock.624.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_4", "tile.flatcoloredblocks.flatcoloredblock.64.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_40", "tile.flatcoloredblocks.flatcoloredblock.640.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_41", "tile.flatcoloredblocks.flatcoloredblock.656.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_42", "tile.flatcoloredblocks.flatcoloredblock.672.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_43", "tile.flatcoloredblocks.flatcoloredblock.688.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_44", "tile.flatcoloredblocks.flatcoloredblock.704.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_45", "tile.flatcoloredblocks.flatcoloredblock.720.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_46", "tile.flatcoloredblocks.flatcoloredblock.736.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_47", "tile.flatcoloredblocks.flatcoloredblock.752.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_48", "tile.flatcoloredblocks.flatcoloredblock.768.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_49", "tile.flatcoloredblocks.flatcoloredblock.784.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_5", "tile.flatcoloredblocks.flatcoloredblock.80.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_50", "tile.flatcoloredblocks.flatcoloredblock.800.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_51", "tile.flatcoloredblocks.flatcoloredblock.816.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_52", "tile.flatcoloredblocks.flatcoloredblock.832.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_53", "tile.flatcoloredblocks.flatcoloredblock.848.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_54", "tile.flatcoloredblocks.flatcoloredblock.864.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_55", "tile.flatcoloredblocks.flatcoloredblock.880.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_56", "tile.flatcoloredblocks.flatcoloredblock.896.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_57", "tile.flatcoloredblocks.flatcoloredblock.912.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_58", "tile.flatcoloredblocks.flatcoloredblock.928.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_59", "tile.flatcoloredblocks.flatcoloredblock.944.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_6", "tile.flatcoloredblocks.flatcoloredblock.96.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_60", "tile.flatcoloredblocks.flatcoloredblock.960.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_61", "tile.flatcoloredblocks.flatcoloredblock.976.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_62", "tile.flatcoloredblocks.flatcoloredblock.992.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_63", "tile.flatcoloredblocks.flatcoloredblock.1008.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_64", "tile.flatcoloredblocks.flatcoloredblock.1024.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_65", "tile.flatcoloredblocks.flatcoloredblock.1040.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_66", "tile.flatcoloredblocks.flatcoloredblock.1056.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_67", "tile.flatcoloredblocks.flatcoloredblock.1072.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_68", "tile.flatcoloredblocks.flatcoloredblock.1088.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_69", "tile.flatcoloredblocks.flatcoloredblock.1104.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_7", "tile.flatcoloredblocks.flatcoloredblock.112.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_70", "tile.flatcoloredblocks.flatcoloredblock.1120.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_71", "tile.flatcoloredblocks.flatcoloredblock.1136.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_72", "tile.flatcoloredblocks.flatcoloredblock.1152.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_73", "tile.flatcoloredblocks.flatcoloredblock.1168.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_74", "tile.flatcoloredblocks.flatcoloredblock.1184.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_75", "tile.flatcoloredblocks.flatcoloredblock.1200.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_76", "tile.flatcoloredblocks.flatcoloredblock.1216.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_77", "tile.flatcoloredblocks.flatcoloredblock.1232.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_78", "tile.flatcoloredblocks.flatcoloredblock.1248.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_79", "tile.flatcoloredblocks.flatcoloredblock.1264.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_8", "tile.flatcoloredblocks.flatcoloredblock.128.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_80", "tile.flatcoloredblocks.flatcoloredblock.1280.name",),
-    ("flatcoloredblocks:flatcoloredblock_transparent0_9", "tile.flatcoloredblocks.flatcoloredblock.144.name",),
-    ("forestry:alveary.fan", "Alveary Fan",),
-    ("forestry:alveary.heater", "Alveary Heater",),
-    ("forestry:alveary.hygro", "Alveary Hygroregulator",),
-    ("forestry:alveary.plain", "Alveary",),
-    ("forestry:alveary.sieve", "Alveary Sieve",),
-    ("forestry:alveary.stabiliser", "Alveary Stabiliser",),
-    ("forestry:alveary.swarmer", "Alveary Swarmer",),
-    ("forestry:analyzer", "Analyzer",),
-    ("forestry:apiary", "Apiary",),
-    ("forestry:arboretum", "Arboretum",),
-    ("forestry:ash_block", "Ash Block",),
-    ("forestry:ash_brick", "Ash Bricks",),
-    ("forestry:ash_stairs", "Ash Brick Stairs",),
-    ("forestry:bee_chest", "Apiarist's Chest",),
-    ("forestry:bee_combs_0", "tile.for.bee_combs.name",),
-    ("forestry:bee_combs_1", "tile.for.bee_combs.name",),
-    ("forestry:bee_house", "Bee House",),
-    ("forestry:beehives", "tile.for.beehives.name",),
-    ("forestry:bog_earth", "tile.for.bog_earth.name",),
-    ("forestry:bottler", "Bottler",),
-    ("forestry:butterfly_chest", "Lepidopterist's Chest",),
-    ("forestry:candle", "tile.for.candle.name",),
-    ("forestry:carpenter", "Carpenter",),
-    ("forestry:centrifuge", "Centrifuge",),
-    ("forestry:charcoal", "Block of Charcoal",),
-    ("forestry:climatiser", "tile.for.climatiser.name",),
-    ("forestry:cocoon", "tile.for.cocoon.name",),
-    ("forestry:cocoon.solid", "tile.for.cocoon.solid.name",),
-    ("forestry:database", "Database",),
-    ("forestry:doors.acacia", "item.for.doors.acacia.name",),
-    ("forestry:doors.balsa", "item.for.doors.balsa.name",),
-    ("forestry:doors.baobab", "item.for.doors.baobab.name",),
-    ("forestry:doors.cherry", "item.for.doors.cherry.name",),
-    ("forestry:doors.chestnut", "item.for.doors.chestnut.name",),
-    ("forestry:doors.citrus", "item.for.doors.citrus.name",),
-    ("forestry:doors.cocobolo", "item.for.doors.cocobolo.name",),
-    ("forestry:doors.ebony", "item.for.doors.ebony.name",),
-    ("forestry:doors.giganteum", "item.for.doors.giganteum.name",),
-    ("forestry:doors.greenheart", "item.for.doors.greenheart.name",),
-    ("forestry:doors.ipe", "item.for.doors.ipe.name",),
-    ("forestry:doors.kapok", "item.for.doors.kapok.name",),
-    ("forestry:doors.larch", "item.for.doors.larch.name",),
-    ("forestry:doors.lime", "item.for.doors.lime.name",),
-    ("forestry:doors.mahoe", "item.for.doors.mahoe.name",),
-    ("forestry:doors.mahogany", "item.for.doors.mahogany.name",),
-    ("forestry:doors.maple", "item.for.doors.maple.name",),
-    ("forestry:doors.padauk", "item.for.doors.padauk.name",),
-    ("forestry:doors.palm", "item.for.doors.palm.name",),
-    ("forestry:doors.papaya", "item.for.doors.papaya.name",),
-    ("forestry:doors.pine", "item.for.doors.pine.name",),
-    ("forestry:doors.plum", "item.for.doors.plum.name",),
-    ("forestry:doors.poplar", "item.for.doors.poplar.name",),
-    ("forestry:doors.sequoia", "item.for.doors.sequoia.name",),
-    ("forestry:doors.teak", "item.for.doors.teak.name",),
-    ("forestry:doors.walnut", "item.for.doors.walnut.name",),
-    ("forestry:doors.wenge", "item.for.doors.wenge.name",),
-    ("forestry:doors.willow", "item.for.doors.willow.name",),
-    ("forestry:doors.zebrawood", "item.for.doors.zebrawood.name",),
-    ("forestry:engine_biogas", "Biogas Engine",),
-    ("forestry:engine_clockwork", "Clockwork Engine",),
-    ("forestry:engine_electrical", "Electrical Engine",),
-    ("forestry:engine_generator", "Bio Generator",),
-    ("forestry:engine_peat", "Peat-fired Engine",),
-    ("forestry:escritoire", "Escritoire",),
-    ("forestry:fabricator", "Thermionic Fabricator",),
-    ("forestry:farm_crops", "Farm",),
-    ("forestry:farm_ender", "Ender Farm",),
-    ("forestry:farm_gourd", "Gourd Farm",),
-    ("forestry:farm_mushroom", "Mushroom Farm",),
-    ("forestry:farm_nether", "Infernal Farm",),
-    ("forestry:fence.gates.acacia", "tile.for.fence.gates.acacia.name",),
-    ("forestry:fence.gates.balsa", "tile.for.fence.gates.balsa.name",),
-    ("forestry:fence.gates.baobab", "tile.for.fence.gates.baobab.name",),
-    ("forestry:fence.gates.cherry", "tile.for.fence.gates.cherry.name",),
-    ("forestry:fence.gates.chestnut", "tile.for.fence.gates.chestnut.name",),
-    ("forestry:fence.gates.citrus", "tile.for.fence.gates.citrus.name",),
-    ("forestry:fence.gates.cocobolo", "tile.for.fence.gates.cocobolo.name",),
-    ("forestry:fence.gates.ebony", "tile.for.fence.gates.ebony.name",),
-    ("forestry:fence.gates.fireproof.acacia", "tile.for.fence.gates.fireproof.acacia.name",),
-    ("forestry:fence.gates.fireproof.balsa", "tile.for.fence.gates.fireproof.balsa.name",),
-    ("forestry:fence.gates.fireproof.baobab", "tile.for.fence.gates.fireproof.baobab.name",),
-    ("forestry:fence.gates.fireproof.cherry", "tile.for.fence.gates.fireproof.cherry.name",),
-    ("forestry:fence.gates.fireproof.chestnut", "tile.for.fence.gates.fireproof.chestnut.name",),
-    ("forestry:fence.gates.fireproof.citrus", "tile.for.fence.gates.fireproof.citrus.name",),
-    ("forestry:fence.gates.fireproof.cocobolo", "tile.for.fence.gates.fireproof.cocobolo.name",),
-    ("forestry:fence.gates.fireproof.ebony", "tile.for.fence.gates.fireproof.ebony.name",),
-    ("forestry:fence.gates.fireproof.giganteum", "tile.for.fence.gates.fireproof.giganteum.name",),
-    ("forestry:fence.gates.fireproof.greenheart", "tile.for.fence.gates.fireproof.greenheart.name",),
-    ("forestry:fence.gates.fireproof.ipe", "tile.for.fence.gates.fireproof.ipe.name",),
-    ("forestry:fence.gates.fireproof.kapok", "tile.for.fence.gates.fireproof.kapok.name",),
-    ("forestry:fence.gates.fireproof.larch", "tile.for.fence.gates.fireproof.larch.name",),
-    ("forestry:fence.gates.fireproof.lime", "tile.for.fence.gates.fireproof.lime.name",),
-    ("forestry:fence.gates.fireproof.mahoe", "tile.for.fence.gates.fireproof.mahoe.name",),
-    ("forestry:fence.gates.fireproof.mahogany", "tile.for.fence.gates.fireproof.mahogany.name",),
-    ("forestry:fence.gates.fireproof.maple", "tile.for.fence.gates.fireproof.maple.name",),
-    ("forestry:fence.gates.fireproof.padauk", "tile.for.fence.gates.fireproof.padauk.name",),
-    ("forestry:fence.gates.fireproof.palm", "tile.for.fence.gates.fireproof.palm.name",),
-    ("forestry:fence.gates.fireproof.papaya", "tile.for.fence.gates.fireproof.papaya.name",),
-    ("forestry:fence.gates.fireproof.pine", "tile.for.fence.gates.fireproof.pine.name",),
-    ("forestry:fence.gates.fireproof.plum", "tile.for.fence.gates.fireproof.plum.name",),
-    ("forestry:fence.gates.fireproof.poplar", "tile.for.fence.gates.fireproof.poplar.name",),
-    ("forestry:fence.gates.fireproof.sequoia", "tile.for.fence.gates.fireproof.sequoia.name",),
-    ("forestry:fence.gates.fireproof.teak", "tile.for.fence.gates.fireproof.teak.name",),
-    ("forestry:fence.gates.fireproof.walnut", "tile.for.fence.gates.fireproof.walnut.name",),
-    ("forestry:fence.gates.fireproof.wenge", "tile.for.fence.gates.fireproof.wenge.name",),
-    ("forestry:fence.gates.fireproof.willow", "tile.for.fence.gates.fireproof.willow.name",),
-    ("forestry:fence.gates.fireproof.zebrawood", "tile.for.fence.gates.fireproof.zebrawood.name",),
-    ("forestry:fence.gates.giganteum", "tile.for.fence.gates.giganteum.name",),
-    ("forestry:fence.gates.greenheart", "tile.for.fence.gates.greenheart.name",),
-    ("forestry:fence.gates.ipe", "tile.for.fence.gates.ipe.name",),
-    ("forestry:fence.gates.kapok", "tile.for.fence.gates.kapok.name",),
-    ("forestry:fence.gates.larch", "tile.for.fence.gates.larch.name",),
-    ("forestry:fence.gates.lime", "tile.for.fence.gates.lime.name",),
-    ("forestry:fence.gates.mahoe", "tile.for.fence.gates.mahoe.name",),
-    ("forestry:fence.gates.mahogany", "tile.for.fence.gates.mahogany.name",),
-    ("forestry:fence.gates.maple", "tile.for.fence.gates.maple.name",),
-    ("forestry:fence.gates.padauk", "tile.for.fence.gates.padauk.name",),
-    ("forestry:fence.gates.palm", "tile.for.fence.gates.palm.name",),
-    ("forestry:fence.gates.papaya", "tile.for.fence.gates.papaya.name",),
-    ("forestry:fence.gates.pine", "tile.for.fence.gates.pine.name",),
-    ("forestry:fence.gates.plum", "tile.for.fence.gates.plum.name",),
-    ("forestry:fence.gates.poplar", "tile.for.fence.gates.poplar.name",),
-    ("forestry:fence.gates.sequoia", "tile.for.fence.gates.sequoia.name",),
-    ("forestry:fence.gates.teak", "tile.for.fence.gates.teak.name",),
-    ("forestry:fence.gates.vanilla.fireproof.acacia", "tile.for.fence.gates.vanilla.fireproof.acacia.name",),
-    ("forestry:fence.gates.vanilla.fireproof.birch", "tile.for.fence.gates.vanilla.fireproof.birch.name",),
-    ("forestry:fence.gates.vanilla.fireproof.dark_oak", "tile.for.fence.gates.vanilla.fireproof.dark_oak.name",),
-    ("forestry:fence.gates.vanilla.fireproof.jungle", "tile.for.fence.gates.vanilla.fireproof.jungle.name",),
-    ("forestry:fence.gates.vanilla.fireproof.oak", "tile.for.fence.gates.vanilla.fireproof.oak.name",),
-    ("forestry:fence.gates.vanilla.fireproof.spruce", "tile.for.fence.gates.vanilla.fireproof.spruce.name",),
-    ("forestry:fence.gates.walnut", "tile.for.fence.gates.walnut.name",),
-    ("forestry:fence.gates.wenge", "tile.for.fence.gates.wenge.name",),
-    ("forestry:fence.gates.willow", "tile.for.fence.gates.willow.name",),
-    ("forestry:fence.gates.zebrawood", "tile.for.fence.gates.zebrawood.name",),
-    ("forestry:fences.0", "tile.for.fences.0.name",),
-    ("forestry:fences.1", "tile.for.fences.1.name",),
-    ("forestry:fences.fireproof.0", "tile.for.fences.fireproof.0.name",),
-    ("forestry:fences.fireproof.1", "tile.for.fences.fireproof.1.name",),
-    ("forestry:fences.vanilla.fireproof.0", "tile.for.fences.vanilla.fireproof.0.name",),
-    ("forestry:fermenter", "Fermenter",),
-    ("forestry:ffarm", "tile.for.ffarm.name",),
-    ("forestry:fluid.bio.ethanol", "Ethanol",),
-    ("forestry:fluid.biomass", "Biomass",),
-    ("forestry:fluid.for.honey", "Honey",),
-    ("forestry:fluid.glass", "Liquid Glass",),
-    ("forestry:fluid.ice", "Crushed Ice",),
-    ("forestry:fluid.juice", "Fruit Juice",),
-    ("forestry:fluid.milk", "Milk",),
-    ("forestry:fluid.seed.oil", "Seed Oil",),
-    ("forestry:fluid.short.mead", "Short Mead",),
-    ("forestry:genetic_filter", "Genetic Filter",),
-    ("forestry:greenhouse", "tile.for.greenhouse.name",),
-    ("forestry:greenhouse.window", "Greenhouse Window",),
-    ("forestry:greenhouse.window_up", "Greenhouse Roof Window",),
-    ("forestry:humus", "Humus",),
-    ("forestry:leaves", "tile.for.leaves.name",),
-    ("forestry:leaves.decorative.0", "tile.for.leaves.decorative.0.name",),
-    ("forestry:leaves.decorative.1", "tile.for.leaves.decorative.1.name",),
-    ("forestry:leaves.decorative.2", "tile.for.leaves.decorative.2.name",),
-    ("forestry:leaves.default.0", "tile.for.leaves.default.0.name",),
-    ("forestry:leaves.default.1", "tile.for.leaves.default.1.name",),
-    ("forestry:leaves.default.2", "tile.for.leaves.default.2.name",),
-    ("forestry:leaves.default.3", "tile.for.leaves.default.3.name",),
-    ("forestry:leaves.default.4", "tile.for.leaves.default.4.name",),
-    ("forestry:leaves.default.5", "tile.for.leaves.default.5.name",),
-    ("forestry:leaves.default.6", "tile.for.leaves.default.6.name",),
-    ("forestry:leaves.default.7", "tile.for.leaves.default.7.name",),
-    ("forestry:leaves.default.8", "tile.for.leaves.default.8.name",),
-    ("forestry:loam", "Loam",),
-    ("forestry:logs.0", "tile.for.logs.0.name",),
-    ("forestry:logs.1", "tile.for.logs.1.name",),
-    ("forestry:logs.2", "tile.for.logs.2.name",),
-    ("forestry:logs.3", "tile.for.logs.3.name",),
-    ("forestry:logs.4", "tile.for.logs.4.name",),
-    ("forestry:logs.5", "tile.for.logs.5.name",),
-    ("forestry:logs.6", "tile.for.logs.6.name",),
-    ("forestry:logs.7", "tile.for.logs.7.name",),
-    ("forestry:logs.fireproof.0", "tile.for.logs.fireproof.0.name",),
-    ("forestry:logs.fireproof.1", "tile.for.logs.fireproof.1.name",),
-    ("forestry:logs.fireproof.2", "tile.for.logs.fireproof.2.name",),
-    ("forestry:logs.fireproof.3", "tile.for.logs.fireproof.3.name",),
-    ("forestry:logs.fireproof.4", "tile.for.logs.fireproof.4.name",),
-    ("forestry:logs.fireproof.5", "tile.for.logs.fireproof.5.name",),
-    ("forestry:logs.fireproof.6", "tile.for.logs.fireproof.6.name",),
-    ("forestry:logs.fireproof.7", "tile.for.logs.fireproof.7.name",),
-    ("forestry:logs.vanilla.fireproof.0", "tile.for.logs.vanilla.fireproof.0.name",),
-    ("forestry:logs.vanilla.fireproof.1", "tile.for.logs.vanilla.fireproof.1.name",),
-    ("forestry:mailbox", "Mailbox",),
-    ("forestry:moistener", "Moistener",),
-    ("forestry:mushroom", "tile.for.mushroom.name",),
-    ("forestry:peat_bog", "Peat Bog",),
-    ("forestry:planks.0", "tile.for.planks.0.name",),
-    ("forestry:planks.1", "tile.for.planks.1.name",),
-    ("forestry:planks.fireproof.0", "tile.for.planks.fireproof.0.name",),
-    ("forestry:planks.fireproof.1", "tile.for.planks.fireproof.1.name",),
-    ("forestry:planks.vanilla.fireproof.0", "tile.for.planks.vanilla.fireproof.0.name",),
-    ("forestry:pods.banana", "tile.for.pods.banana.name",),
-    ("forestry:pods.cocoa", "tile.for.pods.cocoa.name",),
-    ("forestry:pods.coconut", "tile.for.pods.coconut.name",),
-    ("forestry:pods.dates", "tile.for.pods.dates.name",),
-    ("forestry:pods.papaya", "tile.for.pods.papaya.name",),
-    ("forestry:pods.plantain", "tile.for.pods.plantain.name",),
-    ("forestry:pods.red_banana", "tile.for.pods.red_banana.name",),
-    ("forestry:rainmaker", "Rainmaker",),
-    ("forestry:raintank", "Rain Tank",),
-    ("forestry:resource_storage", "tile.for.resource_storage.name",),
-    ("forestry:resources", "tile.for.resources.name",),
-    ("forestry:sapling_ge", "tile.for.sapling_ge.name",),
-    ("forestry:slabs.0", "tile.for.slabs.0.name",),
-    ("forestry:slabs.1", "tile.for.slabs.1.name",),
-    ("forestry:slabs.2", "tile.for.slabs.2.name",),
-    ("forestry:slabs.3", "tile.for.slabs.3.name",),
-    ("forestry:slabs.double.0", "tile.for.slabs.double.0.name",),
-    ("forestry:slabs.double.1", "tile.for.slabs.double.1.name",),
-    ("forestry:slabs.double.2", "tile.for.slabs.double.2.name",),
-    ("forestry:slabs.double.3", "tile.for.slabs.double.3.name",),
-    ("forestry:slabs.double.fireproof.0", "tile.for.slabs.double.fireproof.0.name",),
-    ("forestry:slabs.double.fireproof.1", "tile.for.slabs.double.fireproof.1.name",),
-    ("forestry:slabs.double.fireproof.2", "tile.for.slabs.double.fireproof.2.name",),
-    ("forestry:slabs.double.fireproof.3", "tile.for.slabs.double.fireproof.3.name",),
-    ("forestry:slabs.fireproof.0", "tile.for.slabs.fireproof.0.name",),
-    ("forestry:slabs.fireproof.1", "tile.for.slabs.fireproof.1.name",),
-    ("forestry:slabs.fireproof.2", "tile.for.slabs.fireproof.2.name",),
-    ("forestry:slabs.fireproof.3", "tile.for.slabs.fireproof.3.name",),
-    ("forestry:slabs.vanilla.double.fireproof.0", "tile.for.slabs.vanilla.double.fireproof.0.name",),
-    ("forestry:slabs.vanilla.fireproof.0", "tile.for.slabs.vanilla.fireproof.0.name",),
-    ("forestry:squeezer", "Squeezer",),
-    ("forestry:stairs.acacia", "tile.for.stairs.acacia.name",),
-    ("forestry:stairs.balsa", "tile.for.stairs.balsa.name",),
-    ("forestry:stairs.baobab", "tile.for.stairs.baobab.name",),
-    ("forestry:stairs.cherry", "tile.for.stairs.cherry.name",),
-    ("forestry:stairs.chestnut", "tile.for.stairs.chestnut.name",),
-    ("forestry:stairs.citrus", "tile.for.stairs.citrus.name",),
-    ("forestry:stairs.cocobolo", "tile.for.stairs.cocobolo.name",),
-    ("forestry:stairs.ebony", "tile.for.stairs.ebony.name",),
-    ("forestry:stairs.fireproof.acacia", "tile.for.stairs.fireproof.acacia.name",),
-    ("forestry:stairs.fireproof.balsa", "tile.for.stairs.fireproof.balsa.name",),
-    ("forestry:stairs.fireproof.baobab", "tile.for.stairs.fireproof.baobab.name",),
-    ("forestry:stairs.fireproof.cherry", "tile.for.stairs.fireproof.cherry.name",),
-    ("forestry:stairs.fireproof.chestnut", "tile.for.stairs.fireproof.chestnut.name",),
-    ("forestry:stairs.fireproof.citrus", "tile.for.stairs.fireproof.citrus.name",),
-    ("forestry:stairs.fireproof.cocobolo", "tile.for.stairs.fireproof.cocobolo.name",),
-    ("forestry:stairs.fireproof.ebony", "tile.for.stairs.fireproof.ebony.name",),
-    ("forestry:stairs.fireproof.giganteum", "tile.for.stairs.fireproof.giganteum.name",),
-    ("forestry:stairs.fireproof.greenheart", "tile.for.stairs.fireproof.greenheart.name",),
-    ("forestry:stairs.fireproof.ipe", "tile.for.stairs.fireproof.ipe.name",),
-    ("forestry:stairs.fireproof.kapok", "tile.for.stairs.fireproof.kapok.name",),
-    ("forestry:stairs.fireproof.larch", "tile.for.stairs.fireproof.larch.name",),
-    ("forestry:stairs.fireproof.lime", "tile.for.stairs.fireproof.lime.name",),
-    ("forestry:stairs.fireproof.mahoe", "tile.for.stairs.fireproof.mahoe.name",),
-    ("forestry:stairs.fireproof.mahogany", "tile.for.stairs.fireproof.mahogany.name",),
-    ("forestry:stairs.fireproof.maple", "tile.for.stairs.fireproof.maple.name",),
-    ("forestry:stairs.fireproof.padauk", "tile.for.stairs.fireproof.padauk.name",),
-    ("forestry:stairs.fireproof.palm", "tile.for.stairs.fireproof.palm.name",),
-    ("forestry:stairs.fireproof.papaya", "tile.for.stairs.fireproof.papaya.name",),
-    ("forestry:stairs.fireproof.pine", "tile.for.stairs.fireproof.pine.name",),
-    ("forestry:stairs.fireproof.plum", "tile.for.stairs.fireproof.plum.name",),
-    ("forestry:stairs.fireproof.poplar", "tile.for.stairs.fireproof.poplar.name",),
-    ("forestry:stairs.fireproof.sequoia", "tile.for.stairs.fireproof.sequoia.name",),
-    ("forestry:stairs.fireproof.teak", "tile.for.stairs.fireproof.teak.name",),
-    ("forestry:stairs.fireproof.walnut", "tile.for.stairs.fireproof.walnut.name",),
-    ("forestry:stairs.fireproof.wenge", "tile.for.stairs.fireproof.wenge.name",),
-    ("forestry:stairs.fireproof.willow", "tile.for.stairs.fireproof.willow.name",),
-    ("forestry:stairs.fireproof.zebrawood", "tile.for.stairs.fireproof.zebrawood.name",),
-    ("forestry:stairs.giganteum", "tile.for.stairs.giganteum.name",),
-    ("forestry:stairs.greenheart", "tile.for.stairs.greenheart.name",),
-    ("forestry:stairs.ipe", "tile.for.stairs.ipe.name",),
-    ("forestry:stairs.kapok", "tile.for.stairs.kapok.name",),
-    ("forestry:stairs.larch", "tile.for.stairs.larch.name",),
-    ("forestry:stairs.lime", "tile.for.stairs.lime.name",),
-    ("forestry:stairs.mahoe", "tile.for.stairs.mahoe.name",),
-    ("forestry:stairs.mahogany", "tile.for.stairs.mahogany.name",),
-    ("forestry:stairs.maple", "tile.for.stairs.maple.name",),
-    ("forestry:stairs.padauk", "tile.for.stairs.padauk.name",),
-    ("forestry:stairs.palm", "tile.for.stairs.palm.name",),
-    ("forestry:stairs.papaya", "tile.for.stairs.papaya.name",),
-    ("forestry:stairs.pine", "tile.for.stairs.pine.name",),
-    ("forestry:stairs.plum", "tile.for.stairs.plum.name",),
-    ("forestry:stairs.poplar", "tile.for.stairs.poplar.name",),
-    ("forestry:stairs.sequoia", "tile.for.stairs.sequoia.name",),
-    ("forestry:stairs.teak", "tile.for.stairs.teak.name",),
-    ("forestry:stairs.vanilla.fireproof.acacia", "tile.for.stairs.vanilla.fireproof.acacia.name",),
-    ("forestry:stairs.vanilla.fireproof.birch", "tile.for.stairs.vanilla.fireproof.birch.name",),
-    ("forestry:stairs.vanilla.fireproof.dark_oak", "tile.for.stairs.vanilla.fireproof.dark_oak.name",),
-    ("forestry:stairs.vanilla.fireproof.jungle", "tile.for.stairs.vanilla.fireproof.jungle.name",),
-    ("forestry:stairs.vanilla.fireproof.oak", "tile.for.stairs.vanilla.fireproof.oak.name",),
-    ("forestry:stairs.vanilla.fireproof.spruce", "tile.for.stairs.vanilla.fireproof.spruce.name",),
-    ("forestry:stairs.walnut", "tile.for.stairs.walnut.name",),
-    ("forestry:stairs.wenge", "tile.for.stairs.wenge.name",),
-    ("forestry:stairs.willow", "tile.for.stairs.willow.name",),
-    ("forestry:stairs.zebrawood", "tile.for.stairs.zebrawood.name",),
-    ("forestry:stamp_collector", "Stamp Collector",),
-    ("forestry:still", "Still",),
-    ("forestry:stump", "Candle Stump",),
-    ("forestry:trade_station", "Trade Station",),
-    ("forestry:tree_chest", "Arborist's Chest",),
-    ("forestry:wood_pile", "Wood Pile",),
-    ("forestry:wood_pile_decorative", "Decorative Wood Pile",),
-    ("forestry:worktable", "Worktable",),
-    ("funkylocomotion:booster", "Frame Booster",),
-    ("funkylocomotion:frame_0", "Frame Block",),
-    ("funkylocomotion:frame_1", "Frame Block",),
-    ("funkylocomotion:frame_2", "Frame Block",),
-    ("funkylocomotion:frame_3", "Frame Block",),
-    ("funkylocomotion:frame_projector", "Frame Projector",),
-    ("funkylocomotion:mass_frame_corner", "Super-Frame Corner",),
-    ("funkylocomotion:mass_frame_edge", "Super-Frame Edge",),
-    ("funkylocomotion:moving", "tile.null.name",),
-    ("funkylocomotion:pusher", "tile.funkylocomotion:pusher.name",),
-    ("funkylocomotion:slider", "Frame Slider",),
-    ("funkylocomotion:teleporter", "Frame Teleporter",),
-    ("gendustry:extractor", "DNA Extractor",),
-    ("gendustry:imprinter", "Genetic Imprinter",),
-    ("gendustry:industrial_apiary", "Industrial Apiary",),
-    ("gendustry:liquiddna", "Liquid DNA",),
-    ("gendustry:liquifier", "Protein Liquifier",),
-    ("gendustry:mutagen", "Mutagen",),
-    ("gendustry:mutagen_producer", "Mutagen Producer",),
-    ("gendustry:mutatron", "Mutatron",),
-    ("gendustry:mutatron_advanced", "Advanced mutatron",),
-    ("gendustry:protein", "Protein",),
-    ("gendustry:replicator", "Genetic Replicator",),
-    ("gendustry:sampler", "Genetic Sampler",),
-    ("gendustry:transposer", "Genetic Transposer",),
-    ("genetics:adv_machine", "tile.null.name",),
-    ("genetics:lab_machine", "tile.null.name",),
-    ("genetics:machine", "tile.null.name",),
-    ("harvestcraft:almond_sapling", "Almond Sapling",),
-    ("harvestcraft:apiary", "Apiary",),
-    ("harvestcraft:apple_sapling", "Apple Sapling",),
-    ("harvestcraft:apricot_sapling", "Apricot Sapling",),
-    ("harvestcraft:aridgarden", "Arid Garden",),
-    ("harvestcraft:avocado_sapling", "Avocado Sapling",),
-    ("harvestcraft:banana_sapling", "Banana Sapling",),
-    ("harvestcraft:beehive", "Beehive",),
-    ("harvestcraft:candledeco1", "White Candle",),
-    ("harvestcraft:candledeco10", "Cyan Candle",),
-    ("harvestcraft:candledeco11", "Purple Candle",),
-    ("harvestcraft:candledeco12", "Blue Candle",),
-    ("harvestcraft:candledeco13", "Brown Candle",),
-    ("harvestcraft:candledeco14", "Green Candle",),
-    ("harvestcraft:candledeco15", "Red Candle",),
-    ("harvestcraft:candledeco16", "Black Candle",),
-    ("harvestcraft:candledeco2", "Orange Candle",),
-    ("harvestcraft:candledeco3", "Magenta Candle",),
-    ("harvestcraft:candledeco4", "Light Blue Candle",),
-    ("harvestcraft:candledeco5", "Yellow Candle",),
-    ("harvestcraft:candledeco6", "Lime Candle",),
-    ("harvestcraft:candledeco7", "Pink Candle",),
-    ("harvestcraft:candledeco8", "Dark Grey Candle",),
-    ("harvestcraft:candledeco9", "Light Grey Candle",),
-    ("harvestcraft:carrotcake", "Carrot Cake",),
-    ("harvestcraft:cashew_sapling", "Cashew Sapling",),
-    ("harvestcraft:cheesecake", "Cheese Cake",),
-    ("harvestcraft:cherry_sapling", "Cherry Sapling",),
-    ("harvestcraft:cherrycheesecake", "Cherry Cheese Cake",),
-    ("harvestcraft:chestnut_sapling", "Chestnut Sapling",),
-    ("harvestcraft:chocolatesprinklecake", "Chocolate Sprinkles Cake",),
-    ("harvestcraft:cinnamon_sapling", "Cinnamon Sapling",),
-    ("harvestcraft:coconut_sapling", "Coconut Sapling",),
-    ("harvestcraft:date_sapling", "Date Sapling",),
-    ("harvestcraft:dragonfruit_sapling", "Dragonfruit Sapling",),
-    ("harvestcraft:durian_sapling", "Durian Sapling",),
-    ("harvestcraft:fig_sapling", "Fig Sapling",),
-    ("harvestcraft:frostgarden", "Frost Garden",),
-    ("harvestcraft:gooseberry_sapling", "Gooseberry Sapling",),
-    ("harvestcraft:grapefruit_sapling", "Grapefruit Sapling",),
-    ("harvestcraft:grinder", "Grinder",),
-    ("harvestcraft:groundtrap", "Ground Trap",),
-    ("harvestcraft:holidaycake", "Holiday Cake",),
-    ("harvestcraft:honey", "Honey Block",),
-    ("harvestcraft:honeycomb", "Honeycomb Block",),
-    ("harvestcraft:lamingtoncake", "Lamington",),
-    ("harvestcraft:lemon_sapling", "Lemon Sapling",),
-    ("harvestcraft:lime_sapling", "Lime Sapling",),
-    ("harvestcraft:mango_sapling", "Mango Sapling",),
-    ("harvestcraft:maple_sapling", "Maple Sapling",),
-    ("harvestcraft:market", "Market",),
-    ("harvestcraft:nutmeg_sapling", "Nutmeg Sapling",),
-    ("harvestcraft:olive_sapling", "Olive Sapling",),
-    ("harvestcraft:orange_sapling", "Orange Sapling",),
-    ("harvestcraft:pamalmond", "Almond",),
-    ("harvestcraft:pamapple", "Apple",),
-    ("harvestcraft:pamapricot", "Apricot",),
-    ("harvestcraft:pamartichokecrop", "tile.pamartichokecrop.name",),
-    ("harvestcraft:pamasparaguscrop", "tile.pamasparaguscrop.name",),
-    ("harvestcraft:pamavocado", "Avocado",),
-    ("harvestcraft:pambambooshootcrop", "tile.pambambooshootcrop.name",),
-    ("harvestcraft:pambanana", "Banana",),
-    ("harvestcraft:pambarleycrop", "tile.pambarleycrop.name",),
-    ("harvestcraft:pambeancrop", "tile.pambeancrop.name",),
-    ("harvestcraft:pambeetcrop", "tile.pambeetcrop.name",),
-    ("harvestcraft:pambellpeppercrop", "tile.pambellpeppercrop.name",),
-    ("harvestcraft:pamblackberrycrop", "tile.pamblackberrycrop.name",),
-    ("harvestcraft:pamblueberrycrop", "tile.pamblueberrycrop.name",),
-    ("harvestcraft:pambroccolicrop", "tile.pambroccolicrop.name",),
-    ("harvestcraft:pambrusselsproutcrop", "tile.pambrusselsproutcrop.name",),
-    ("harvestcraft:pamcabbagecrop", "tile.pamcabbagecrop.name",),
-    ("harvestcraft:pamcactusfruitcrop", "tile.pamcactusfruitcrop.name",),
-    ("harvestcraft:pamcandleberrycrop", "tile.pamcandleberrycrop.name",),
-    ("harvestcraft:pamcantaloupecrop", "tile.pamcantaloupecrop.name",),
-    ("harvestcraft:pamcashew", "Cashew",),
-    ("harvestcraft:pamcauliflowercrop", "tile.pamcauliflowercrop.name",),
-    ("harvestcraft:pamcelerycrop", "tile.pamcelerycrop.name",),
-    ("harvestcraft:pamcherry", "Cherry",),
-    ("harvestcraft:pamchestnut", "Chestnut",),
-    ("harvestcraft:pamchilipeppercrop", "tile.pamchilipeppercrop.name",),
-    ("harvestcraft:pamcinnamon", "Cinnamon Wood",),
-    ("harvestcraft:pamcoconut", "Coconut",),
-    ("harvestcraft:pamcoffeebeancrop", "tile.pamcoffeebeancrop.name",),
-    ("harvestcraft:pamcorncrop", "tile.pamcorncrop.name",),
-    ("harvestcraft:pamcottoncrop", "tile.pamcottoncrop.name",),
-    ("harvestcraft:pamcranberrycrop", "tile.pamcranberrycrop.name",),
-    ("harvestcraft:pamcucumbercrop", "tile.pamcucumbercrop.name",),
-    ("harvestcraft:pamcurryleafcrop", "tile.pamcurryleafcrop.name",),
-    ("harvestcraft:pamdate", "Date",),
-    ("harvestcraft:pamdragonfruit", "Dragonfruit",),
-    ("harvestcraft:pamdurian", "Durian",),
-    ("harvestcraft:pameggplantcrop", "tile.pameggplantcrop.name",),
-    ("harvestcraft:pamfig", "Fig",),
-    ("harvestcraft:pamgarliccrop", "tile.pamgarliccrop.name",),
-    ("harvestcraft:pamgigapicklecrop", "tile.pamgigapicklecrop.name",),
-    ("harvestcraft:pamgingercrop", "tile.pamgingercrop.name",),
-    ("harvestcraft:pamgooseberry", "Gooseberry",),
-    ("harvestcraft:pamgrapecrop", "tile.pamgrapecrop.name",),
-    ("harvestcraft:pamgrapefruit", "Grapefruit",),
-    ("harvestcraft:pamkiwicrop", "tile.pamkiwicrop.name",),
-    ("harvestcraft:pamleekcrop", "tile.pamleekcrop.name",),
-    ("harvestcraft:pamlemon", "Lemon",),
-    ("harvestcraft:pamlettucecrop", "tile.pamlettucecrop.name",),
-    ("harvestcraft:pamlime", "Lime",),
-    ("harvestcraft:pammango", "Mango",),
-    ("harvestcraft:pammaple", "Maple Wood",),
-    ("harvestcraft:pammustardseedscrop", "tile.pammustardseedscrop.name",),
-    ("harvestcraft:pamnutmeg", "Nutmeg",),
-    ("harvestcraft:pamoatscrop", "tile.pamoatscrop.name",),
-    ("harvestcraft:pamokracrop", "tile.pamokracrop.name",),
-    ("harvestcraft:pamolive", "Olive",),
-    ("harvestcraft:pamonioncrop", "tile.pamonioncrop.name",),
-    ("harvestcraft:pamorange", "Orange",),
-    ("harvestcraft:pampapaya", "Papaya",),
-    ("harvestcraft:pampaperbark", "Paperbark Wood",),
-    ("harvestcraft:pamparsnipcrop", "tile.pamparsnipcrop.name",),
-    ("harvestcraft:pampeach", "Peach",),
-    ("harvestcraft:pampeanutcrop", "tile.pampeanutcrop.name",),
-    ("harvestcraft:pampear", "Pear",),
-    ("harvestcraft:pampeascrop", "tile.pampeascrop.name",),
-    ("harvestcraft:pampecan", "Pecan",),
-    ("harvestcraft:pampeppercorn", "Peppercorn",),
-    ("harvestcraft:pampersimmon", "Persimmon",),
-    ("harvestcraft:pampineapplecrop", "tile.pampineapplecrop.name",),
-    ("harvestcraft:pampistachio", "Pistachio",),
-    ("harvestcraft:pamplum", "Plum",),
-    ("harvestcraft:pampomegranate", "Pomegranate",),
-    ("harvestcraft:pamradishcrop", "tile.pamradishcrop.name",),
-    ("harvestcraft:pamraspberrycrop", "tile.pamraspberrycrop.name",),
-    ("harvestcraft:pamrhubarbcrop", "tile.pamrhubarbcrop.name",),
-    ("harvestcraft:pamricecrop", "tile.pamricecrop.name",),
-    ("harvestcraft:pamrutabagacrop", "tile.pamrutabagacrop.name",),
-    ("harvestcraft:pamryecrop", "tile.pamryecrop.name",),
-    ("harvestcraft:pamscallioncrop", "tile.pamscallioncrop.name",),
-    ("harvestcraft:pamseaweedcrop", "tile.pamseaweedcrop.name",),
-    ("harvestcraft:pamsesameseedscrop", "tile.pamsesameseedscrop.name",),
-    ("harvestcraft:pamsoybeancrop", "tile.pamsoybeancrop.name",),
-    ("harvestcraft:pamspiceleafcrop", "tile.pamspiceleafcrop.name",),
-    ("harvestcraft:pamspiderweb", "Spider Web",),
-    ("harvestcraft:pamspinachcrop", "tile.pamspinachcrop.name",),
-    ("harvestcraft:pamstarfruit", "Starfruit",),
-    ("harvestcraft:pamstrawberrycrop", "tile.pamstrawberrycrop.name",),
-    ("harvestcraft:pamsweetpotatocrop", "tile.pamsweetpotatocrop.name",),
-    ("harvestcraft:pamtealeafcrop", "tile.pamtealeafcrop.name",),
-    ("harvestcraft:pamtomatocrop", "tile.pamtomatocrop.name",),
-    ("harvestcraft:pamturnipcrop", "tile.pamturnipcrop.name",),
-    ("harvestcraft:pamvanillabean", "Vanilla Bean",),
-    ("harvestcraft:pamwalnut", "Walnut",),
-    ("harvestcraft:pamwaterchestnutcrop", "tile.pamwaterchestnutcrop.name",),
-    ("harvestcraft:pamwhitemushroomcrop", "tile.pamwhitemushroomcrop.name",),
-    ("harvestcraft:pamwintersquashcrop", "tile.pamwintersquashcrop.name",),
-    ("harvestcraft:pamzucchinicrop", "tile.pamzucchinicrop.name",),
-    ("harvestcraft:papaya_sapling", "Papaya Sapling",),
-    ("harvestcraft:paperbark_sapling", "Paperbark Sapling",),
-    ("harvestcraft:pavlovacake", "Pavlova",),
-    ("harvestcraft:peach_sapling", "Peach Sapling",),
-    ("harvestcraft:pear_sapling", "Pear Sapling",),
-    ("harvestcraft:pecan_sapling", "Pecan Sapling",),
-    ("harvestcraft:peppercorn_sapling", "Peppercorn Sapling",),
-    ("harvestcraft:persimmon_sapling", "Persimmon Sapling",),
-    ("harvestcraft:pineappleupsidedowncake", "Pineapple Upside Down Cake",),
-    ("harvestcraft:pistachio_sapling", "Pistachio Sapling",),
-    ("harvestcraft:plum_sapling", "Plum Sapling",),
-    ("harvestcraft:pomegranate_sapling", "Pomegranate Sapling",),
-    ("harvestcraft:pressedwax", "Pressed Wax Block",),
-    ("harvestcraft:presser", "Presser",),
-    ("harvestcraft:pumpkincheesecake", "Pumpkin Cheese Cake",),
-    ("harvestcraft:redvelvetcake", "Red Velvet Cake",),
-    ("harvestcraft:shadedgarden", "Shaded Garden",),
-    ("harvestcraft:shippingbin", "Shipping Bin",),
-    ("harvestcraft:soggygarden", "Soggy Garden",),
-    ("harvestcraft:spiderweb_sapling", "Spider Web Sapling",),
-    ("harvestcraft:starfruit_sapling", "Starfruit Sapling",),
-    ("harvestcraft:tropicalgarden", "Tropical Garden",),
-    ("harvestcraft:vanillabean_sapling", "Vanilla Sapling",),
-    ("harvestcraft:walnut_sapling", "Walnut Sapling",),
-    ("harvestcraft:waterfilter", "Water Filter",),
-    ("harvestcraft:watertrap", "Water Trap",),
-    ("harvestcraft:waxcomb", "Waxcomb Block",),
-    ("harvestcraft:well", "Well",),
-    ("harvestcraft:windygarden", "Windy Garden",),
-    ("ic2:air", "ic2.air.name",),
-    ("ic2:biogas", "ic2.biogas.name",),
-    ("ic2:biomass", "ic2.biomass.name",),
-    ("ic2:construction_foam", "ic2.construction_foam.name",),
-    ("ic2:coolant", "ic2.coolant.name",),
-    ("ic2:distilled_water", "ic2.distilled_water.name",),
-    ("ic2:dynamite", "Dynamite",),
-    ("ic2:fence", "ic2.fence",),
-    ("ic2:foam", "ic2.foam",),
-    ("ic2:glass", "ic2.glass",),
-    ("ic2:heavy_water", "ic2.heavy_water.name",),
-    ("ic2:hot_coolant", "ic2.hot_coolant.name",),
-    ("ic2:hot_water", "ic2.hot_water.name",),
-    ("ic2:hydrogen", "ic2.hydrogen.name",),
-    ("ic2:leaves", "Leaves",),
-    ("ic2:mining_pipe", "ic2.mining_pipe",),
-    ("ic2:oxygen", "ic2.oxygen.name",),
-    ("ic2:pahoehoe_lava", "ic2.pahoehoe_lava.name",),
-    ("ic2:reinforced_door", "ic2.reinforced_door.name",),
-    ("ic2:resource", "ic2.resource",),
-    ("ic2:rubber_wood", "Rubber Wood",),
-    ("ic2:sapling", "ic2.sapling.rubber.name",),
-    ("ic2:scaffold", "ic2.scaffold",),
-    ("ic2:sheet", "ic2.sheet",),
-    ("ic2:steam", "ic2.steam.name",),
-    ("ic2:superheated_steam", "ic2.superheated_steam.name",),
-    ("ic2:te", "ic2.te",),
-    ("ic2:uu_matter", "ic2.uu_matter.name",),
-    ("ic2:wall", "ic2.wall",),
-    ("ic2:weed_ex", "ic2.weed_ex.name",),
-    ("ichunutil:compact_porkchop", "Compact Raw Porkchop",),
-    ("immersiveengineering:aluminum_scaffolding_stairs0", "Aluminium Scaffolding Stairs",),
-    ("immersiveengineering:aluminum_scaffolding_stairs1", "Aluminium Scaffolding Stairs",),
-    ("immersiveengineering:aluminum_scaffolding_stairs2", "Aluminium Scaffolding Stairs",),
-    ("immersiveengineering:cloth_device", "tile.immersiveengineering.cloth_device.name",),
-    ("immersiveengineering:connector", "tile.immersiveengineering.connector.name",),
-    ("immersiveengineering:conveyor", "tile.immersiveengineering.conveyor.name",),
-    ("immersiveengineering:fake_light", "tile.immersiveengineering.fake_light.name",),
-    ("immersiveengineering:fluidbiodiesel", "Biodiesel",),
-    ("immersiveengineering:fluidconcrete", "Liquid Concrete",),
-    ("immersiveengineering:fluidcreosote", "Creosote Oil",),
-    ("immersiveengineering:fluidethanol", "Ethanol",),
-    ("immersiveengineering:fluidplantoil", "Plant Oil",),
-    ("immersiveengineering:hemp", "Industrial Hemp",),
-    ("immersiveengineering:metal_decoration0", "tile.immersiveengineering.metal_decoration0.name",),
-    ("immersiveengineering:metal_decoration1", "tile.immersiveengineering.metal_decoration1.name",),
-    ("immersiveengineering:metal_decoration1_slab", "tile.immersiveengineering.metal_decoration1_slab.name",),
-    ("immersiveengineering:metal_decoration2", "tile.immersiveengineering.metal_decoration2.name",),
-    ("immersiveengineering:metal_device0", "tile.immersiveengineering.metal_device0.name",),
-    ("immersiveengineering:metal_device1", "tile.immersiveengineering.metal_device1.name",),
-    ("immersiveengineering:metal_ladder", "tile.immersiveengineering.metal_ladder.name",),
-    ("immersiveengineering:metal_multiblock", "tile.immersiveengineering.metal_multiblock.name",),
-    ("immersiveengineering:molten_constantan", "Molten Constantan",),
-    ("immersiveengineering:molten_uranium", "Molten Uranium",),
-    ("immersiveengineering:ore", "tile.immersiveengineering.ore.name",),
-    ("immersiveengineering:sheetmetal", "tile.immersiveengineering.sheetmetal.name",),
-    ("immersiveengineering:sheetmetal_slab", "tile.immersiveengineering.sheetmetal_slab.name",),
-    ("immersiveengineering:steel_scaffolding_stairs0", "Steel Scaffolding Stairs",),
-    ("immersiveengineering:steel_scaffolding_stairs1", "Steel Scaffolding Stairs",),
-    ("immersiveengineering:steel_scaffolding_stairs2", "Steel Scaffolding Stairs",),
-    ("immersiveengineering:stone_decoration", "tile.immersiveengineering.stone_decoration.name",),
-    ("immersiveengineering:stone_decoration_slab", "tile.immersiveengineering.stone_decoration_slab.name",),
-    ("immersiveengineering:stone_decoration_stairs_concrete", "Concrete Stairs",),
-    ("immersiveengineering:stone_decoration_stairs_concrete_leaded", "Leaded Concrete Stairs",),
-    ("immersiveengineering:stone_decoration_stairs_concrete_tile", "Concrete Tile Stairs",),
-    ("immersiveengineering:stone_decoration_stairs_hempcrete", "Hempcrete Stairs",),
-    ("immersiveengineering:stone_device", "tile.immersiveengineering.stone_device.name",),
-    ("immersiveengineering:storage", "tile.immersiveengineering.storage.name",),
-    ("immersiveengineering:storage_slab", "tile.immersiveengineering.storage_slab.name",),
-    ("immersiveengineering:treated_wood", "tile.immersiveengineering.treated_wood.name",),
-    ("immersiveengineering:treated_wood_slab", "tile.immersiveengineering.treated_wood_slab.name",),
-    ("immersiveengineering:treated_wood_stairs0", "Treated Wood Stairs",),
-    ("immersiveengineering:treated_wood_stairs1", "Treated Wood Stairs",),
-    ("immersiveengineering:treated_wood_stairs2", "Treated Wood Stairs",),
-    ("immersiveengineering:wooden_decoration", "tile.immersiveengineering.wooden_decoration.name",),
-    ("immersiveengineering:wooden_device0", "tile.immersiveengineering.wooden_device0.name",),
-    ("immersiveengineering:wooden_device1", "tile.immersiveengineering.wooden_device1.name",),
-    ("immersivepetroleum:dummy", "tile.immersivepetroleum.dummy.name",),
-    ("immersivepetroleum:fluid_crude_oil", "Crude Oil",),
-    ("immersivepetroleum:fluid_diesel", "Diesel",),
-    ("immersivepetroleum:fluid_gasoline", "Gasoline",),
-    ("immersivepetroleum:fluid_lubricant", "Lubricant",),
-    ("immersivepetroleum:fluid_napalm", "Napalm",),
-    ("immersivepetroleum:metal_device", "tile.immersivepetroleum.metal_device.name",),
-    ("immersivepetroleum:metal_multiblock", "tile.immersivepetroleum.metal_multiblock.name",),
-    ("immersivepetroleum:stone_decoration", "tile.immersivepetroleum.stone_decoration.name",),
-    ("industrialforegoing:animal_byproduct_recolector", "Animal Sewer",),
-    ("industrialforegoing:animal_growth_increaser", "Animal Grower",),
-    ("industrialforegoing:animal_independence_selector", "Animal Baby Separator",),
-    ("industrialforegoing:animal_resource_harvester", "Animal Rancher",),
-    ("industrialforegoing:animal_stock_increaser", "Animal Feeder",),
-    ("industrialforegoing:biofuel", "tile.biofuel.name",),
-    ("industrialforegoing:biofuel_generator", "Biofuel Generator",),
-    ("industrialforegoing:bioreactor", "Bioreactor",),
-    ("industrialforegoing:black_hole_controller", "Black Hole Controller",),
-    ("industrialforegoing:black_hole_tank", "Black Hole Tank",),
-    ("industrialforegoing:black_hole_unit", "Black Hole Unit",),
-    ("industrialforegoing:block_destroyer", "Block Breaker",),
-    ("industrialforegoing:block_placer", "Block Placer",),
-    ("industrialforegoing:crop_enrich_material_injector", "Plant Fertilizer",),
-    ("industrialforegoing:crop_recolector", "Plant Gatherer",),
-    ("industrialforegoing:crop_sower", "Plant Sower",),
-    ("industrialforegoing:dye_mixer", "Dye Mixer",),
-    ("industrialforegoing:enchantment_aplicator", "Enchantment Applicator",),
-    ("industrialforegoing:enchantment_extractor", "Enchantment Extractor",),
-    ("industrialforegoing:enchantment_invoker", "Enchantment Factory",),
-    ("industrialforegoing:enchantment_refiner", "Enchantment Sorter",),
-    ("industrialforegoing:energy_field_provider", "Energy Field Provider",),
-    ("industrialforegoing:essence", "tile.essence.name",),
-    ("industrialforegoing:fluid_crafter", "Fluid Crafter",),
-    ("industrialforegoing:fluid_pump", "Fluid Pump",),
-    ("industrialforegoing:hydrator", "Hydrator",),
-    ("industrialforegoing:if.pink_slime", "tile.if.pink_slime.name",),
-    ("industrialforegoing:if.protein", "tile.if.protein.name",),
-    ("industrialforegoing:item_splitter", "Item Splitter",),
-    ("industrialforegoing:laser_base", "Laser Base",),
-    ("industrialforegoing:laser_drill", "Laser Drill",),
-    ("industrialforegoing:latex", "tile.latex.name",),
-    ("industrialforegoing:latex_processing_unit", "Latex Processing Unit",),
-    ("industrialforegoing:lava_fabricator", "Lava Fabricator",),
-    ("industrialforegoing:material_stonework_factory", "Material StoneWork Factory",),
-    ("industrialforegoing:meat", "tile.meat.name",),
-    ("industrialforegoing:milk", "Milk",),
-    ("industrialforegoing:mob_detector", "Mob Detector",),
-    ("industrialforegoing:mob_duplicator", "Mob Duplicator",),
-    ("industrialforegoing:mob_relocator", "Mob Crusher",),
-    ("industrialforegoing:mob_slaughter_factory", "Mob Slaughter Factory",),
-    ("industrialforegoing:ore_processor", "Ore Processor",),
-    ("industrialforegoing:oredictionary_converter", "Ore Dictionary Converter",),
-    ("industrialforegoing:petrified_fuel_generator", "Petrified Fuel Generator",),
-    ("industrialforegoing:plant_interactor", "Plant Interactor",),
-    ("industrialforegoing:potion_enervator", "Potion Brewer",),
-    ("industrialforegoing:protein_generator", "Protein Generator",),
-    ("industrialforegoing:protein_reactor", "Protein Reactor",),
-    ("industrialforegoing:resourceful_furnace", "Resourceful Furnace",),
-    ("industrialforegoing:sewage", "tile.sewage.name",),
-    ("industrialforegoing:sewage_composter_solidifier", "Sewage Composter",),
-    ("industrialforegoing:sludge", "tile.sludge.name",),
-    ("industrialforegoing:sludge_refiner", "Sludge Refiner",),
-    ("industrialforegoing:spores_recreator", "Spores Recreator",),
-    ("industrialforegoing:tree_fluid_extractor", "Tree Fluid Extractor",),
-    ("industrialforegoing:villager_trade_exchanger", "Villager Trade Exchanger",),
-    ("industrialforegoing:water_condensator", "Water Condensator",),
-    ("industrialforegoing:water_resources_collector", "Resources Fisher",),
-    ("industrialforegoing:wither_builder", "Wither Builder",),
-    ("industrialwires:control_panel", "tile.industrialwires.control_panel.name",),
-    ("industrialwires:general_hv", "tile.industrialwires.general_hv.name",),
-    ("industrialwires:hv_multiblock", "tile.industrialwires.hv_multiblock.name",),
-    ("industrialwires:ic2_connector", "tile.industrialwires.ic2_connector.name",),
-    ("industrialwires:jacobs_ladder", "tile.industrialwires.jacobs_ladder.name",),
-    ("industrialwires:mechanical_converter", "tile.industrialwires.mechanical_converter.name",),
-    ("integrateddynamics:block_liquid_chorus", "Liquid Chorus",),
-    ("integrateddynamics:block_menril_resin", "Menril Resin",),
-    ("integrateddynamics:cable", "Logic Cable",),
-    ("integrateddynamics:coal_generator", "Generator",),
-    ("integrateddynamics:creative_energy_battery", "Creative Energy Battery",),
-    ("integrateddynamics:crystalized_chorus_block", "Block of Crystalized Chorus",),
-    ("integrateddynamics:crystalized_chorus_block_stairs", "Crystalized Chorus Stairs",),
-    ("integrateddynamics:crystalized_chorus_brick", "Crystalized Chorus Brick",),
-    ("integrateddynamics:crystalized_chorus_brick_stairs", "Crystalized Chorus Brick Stairs",),
-    ("integrateddynamics:crystalized_menril_block", "Block of Crystalized Menril",),
-    ("integrateddynamics:crystalized_menril_block_stairs", "Crystalized Menril Stairs",),
-    ("integrateddynamics:crystalized_menril_brick", "Crystalized Menril Brick",),
-    ("integrateddynamics:crystalized_menril_brick_stairs", "Crystalized Menril Brick Stairs",),
-    ("integrateddynamics:delay", "Delayer",),
-    ("integrateddynamics:drying_basin", "Drying Basin",),
-    ("integrateddynamics:energy_battery", "Energy Battery",),
-    ("integrateddynamics:invisible_light", "Invisible Light",),
-    ("integrateddynamics:logic_programmer", "Logic Programmer",),
-    ("integrateddynamics:materializer", "Materializer",),
-    ("integrateddynamics:mechanical_drying_basin", "Mechanical Drying Basin",),
-    ("integrateddynamics:mechanical_squeezer", "Mechanical Squeezer",),
-    ("integrateddynamics:menril_door", "item.blocks.integrateddynamics.menril_door.name",),
-    ("integrateddynamics:menril_leaves", "Menril Leaves",),
-    ("integrateddynamics:menril_log", "Menril Wood",),
-    ("integrateddynamics:menril_log_filled", "Enriched Menril Wood",),
-    ("integrateddynamics:menril_planks", "Menril Wood Planks",),
-    ("integrateddynamics:menril_planks_stairs", "Menril Wood Stairs",),
-    ("integrateddynamics:menril_sapling", "tile.blocks.integrateddynamics.menril_sapling.oak.name",),
-    ("integrateddynamics:menril_torch", "Menril Torch",),
-    ("integrateddynamics:menril_torch_stone", "Menril Stone Torch",),
-    ("integrateddynamics:part_audio_reader_block", "tile.blocks.integrateddynamics.part_audio_reader_block.name",),
-    ("integrateddynamics:part_audio_writer_block", "tile.blocks.integrateddynamics.part_audio_writer_block.name",),
-    ("integrateddynamics:part_block_reader_block", "tile.blocks.integrateddynamics.part_block_reader_block.name",),
-    ("integrateddynamics:part_connector_mono_directional_block",
-     "tile.blocks.integrateddynamics.part_connector_mono_directional_block.name",),
-    ("integrateddynamics:part_connector_omni_directional_block",
-     "tile.blocks.integrateddynamics.part_connector_omni_directional_block.name",),
-    ("integrateddynamics:part_display_panel_block", "tile.blocks.integrateddynamics.part_display_panel_block.name",),
-    ("integrateddynamics:part_dynamic_light_panel_block",
-     "tile.blocks.integrateddynamics.part_dynamic_light_panel_block.name",),
-    ("integrateddynamics:part_effect_writer_block", "tile.blocks.integrateddynamics.part_effect_writer_block.name",),
-    ("integrateddynamics:part_entity_reader_block", "tile.blocks.integrateddynamics.part_entity_reader_block.name",),
-    ("integrateddynamics:part_entity_writer_block", "tile.blocks.integrateddynamics.part_entity_writer_block.name",),
-    ("integrateddynamics:part_extradimensional_reader_block",
-     "tile.blocks.integrateddynamics.part_extradimensional_reader_block.name",),
-    ("integrateddynamics:part_fluid_reader_block", "tile.blocks.integrateddynamics.part_fluid_reader_block.name",),
-    ("integrateddynamics:part_inventory_reader_block",
-     "tile.blocks.integrateddynamics.part_inventory_reader_block.name",),
-    ("integrateddynamics:part_inventory_writer_block",
-     "tile.blocks.integrateddynamics.part_inventory_writer_block.name",),
-    ("integrateddynamics:part_machine_reader_block", "tile.blocks.integrateddynamics.part_machine_reader_block.name",),
-    ("integrateddynamics:part_machine_writer_block", "tile.blocks.integrateddynamics.part_machine_writer_block.name",),
-    ("integrateddynamics:part_network_reader_block", "tile.blocks.integrateddynamics.part_network_reader_block.name",),
-    (
-    "integrateddynamics:part_redstone_reader_block", "tile.blocks.integrateddynamics.part_redstone_reader_block.name",),
-    (
-    "integrateddynamics:part_redstone_writer_block", "tile.blocks.integrateddynamics.part_redstone_writer_block.name",),
-    ("integrateddynamics:part_static_light_panel_block",
-     "tile.blocks.integrateddynamics.part_static_light_panel_block.name",),
-    ("integrateddynamics:part_world_reader_block", "tile.blocks.integrateddynamics.part_world_reader_block.name",),
-    ("integrateddynamics:proxy", "Proxy",),
-    ("integrateddynamics:squeezer", "Squeezer",),
-    ("integrateddynamics:variablestore", "Variable Store",),
-    ("integratedtunnels:part_exporter_energy_block", "tile.blocks.integratedtunnels.part_exporter_energy_block.name",),
-    ("integratedtunnels:part_exporter_fluid_block", "tile.blocks.integratedtunnels.part_exporter_fluid_block.name",),
-    ("integratedtunnels:part_exporter_item_block", "tile.blocks.integratedtunnels.part_exporter_item_block.name",),
-    ("integratedtunnels:part_exporter_world_block_block",
-     "tile.blocks.integratedtunnels.part_exporter_world_block_block.name",),
-    ("integratedtunnels:part_exporter_world_energy_block",
-     "tile.blocks.integratedtunnels.part_exporter_world_energy_block.name",),
-    ("integratedtunnels:part_exporter_world_fluid_block",
-     "tile.blocks.integratedtunnels.part_exporter_world_fluid_block.name",),
-    ("integratedtunnels:part_exporter_world_item_block",
-     "tile.blocks.integratedtunnels.part_exporter_world_item_block.name",),
-    ("integratedtunnels:part_importer_energy_block", "tile.blocks.integratedtunnels.part_importer_energy_block.name",),
-    ("integratedtunnels:part_importer_fluid_block", "tile.blocks.integratedtunnels.part_importer_fluid_block.name",),
-    ("integratedtunnels:part_importer_item_block", "tile.blocks.integratedtunnels.part_importer_item_block.name",),
-    ("integratedtunnels:part_importer_world_block_block",
-     "tile.blocks.integratedtunnels.part_importer_world_block_block.name",),
-    ("integratedtunnels:part_importer_world_energy_block",
-     "tile.blocks.integratedtunnels.part_importer_world_energy_block.name",),
-    ("integratedtunnels:part_importer_world_fluid_block",
-     "tile.blocks.integratedtunnels.part_importer_world_fluid_block.name",),
-    ("integratedtunnels:part_importer_world_item_block",
-     "tile.blocks.integratedtunnels.part_importer_world_item_block.name",),
-    (
-    "integratedtunnels:part_interface_energy_block", "tile.blocks.integratedtunnels.part_interface_energy_block.name",),
-    ("integratedtunnels:part_interface_fluid_block", "tile.blocks.integratedtunnels.part_interface_fluid_block.name",),
-    ("integratedtunnels:part_interface_item_block", "tile.blocks.integratedtunnels.part_interface_item_block.name",),
-    (
-    "integratedtunnels:part_player_simulator_block", "tile.blocks.integratedtunnels.part_player_simulator_block.name",),
-    ("ironchest:iron_chest", "tile.IronChest.name",),
-    ("ironchest:iron_shulker_box_black", "tile.IronShulkerBoxblack.name",),
-    ("ironchest:iron_shulker_box_blue", "tile.IronShulkerBoxblue.name",),
-    ("ironchest:iron_shulker_box_brown", "tile.IronShulkerBoxbrown.name",),
-    ("ironchest:iron_shulker_box_cyan", "tile.IronShulkerBoxcyan.name",),
-    ("ironchest:iron_shulker_box_gray", "tile.IronShulkerBoxgray.name",),
-    ("ironchest:iron_shulker_box_green", "tile.IronShulkerBoxgreen.name",),
-    ("ironchest:iron_shulker_box_light_blue", "tile.IronShulkerBoxlight_blue.name",),
-    ("ironchest:iron_shulker_box_lime", "tile.IronShulkerBoxlime.name",),
-    ("ironchest:iron_shulker_box_magenta", "tile.IronShulkerBoxmagenta.name",),
-    ("ironchest:iron_shulker_box_orange", "tile.IronShulkerBoxorange.name",),
-    ("ironchest:iron_shulker_box_pink", "tile.IronShulkerBoxpink.name",),
-    ("ironchest:iron_shulker_box_purple", "tile.IronShulkerBoxpurple.name",),
-    ("ironchest:iron_shulker_box_red", "tile.IronShulkerBoxred.name",),
-    ("ironchest:iron_shulker_box_silver", "tile.IronShulkerBoxsilver.name",),
-    ("ironchest:iron_shulker_box_white", "tile.IronShulkerBoxwhite.name",),
-    ("ironchest:iron_shulker_box_yellow", "tile.IronShulkerBoxyellow.name",),
-    ("jaopca:block_blockamber", "Block of %s",),
-    ("jaopca:block_blockamethyst", "Block of %s",),
-    ("jaopca:block_blockbauxite", "Block of %s",),
-    ("jaopca:block_blockcinnabar", "Block of %s",),
-    ("jaopca:block_blockdimensionalshard", "Block of %s",),
-    ("jaopca:block_blockenderbiotite", "Block of %s",),
-    ("jaopca:block_blockgalena", "Block of %s",),
-    ("jaopca:block_blockmalachite", "Block of %s",),
-    ("jaopca:block_blockpyrite", "Block of %s",),
-    ("jaopca:block_blockquartzblack", "Block of %s",),
-    ("jaopca:block_blocksodalite", "Block of %s",),
-    ("jaopca:block_blocksphalerite", "Block of %s",),
-    ("jaopca:block_blocktanzanite", "Block of %s",),
-    ("jaopca:block_blocktopaz", "Block of %s",),
-    ("jaopca:block_crystalclusterardite", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterastralstarmetal", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterboron", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclustercobalt", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterdraconium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusteriridium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterlead", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterlithium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclustermithril", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusternickel", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterosmium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterplatinum", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclustersilver", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusterthorium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclustertitanium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclustertungsten", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusteruranium", "Crystallized %s Cluster",),
-    ("jaopca:block_crystalclusteryellorium", "Crystallized %s Cluster",),
-    ("jaopca:block_fenceabyssalnite", "%s Fence",),
-    ("jaopca:block_fenceamber", "%s Fence",),
-    ("jaopca:block_fenceamethyst", "%s Fence",),
-    ("jaopca:block_fenceapatite", "%s Fence",),
-    ("jaopca:block_fenceaquamarine", "%s Fence",),
-    ("jaopca:block_fenceardite", "%s Fence",),
-    ("jaopca:block_fenceastralstarmetal", "%s Fence",),
-    ("jaopca:block_fenceboron", "%s Fence",),
-    ("jaopca:block_fencecoal", "%s Fence",),
-    ("jaopca:block_fencecobalt", "%s Fence",),
-    ("jaopca:block_fencecopper", "%s Fence",),
-    ("jaopca:block_fencecoralium", "%s Fence",),
-    ("jaopca:block_fencediamond", "%s Fence",),
-    ("jaopca:block_fencedimensionalshard", "%s Fence",),
-    ("jaopca:block_fencedraconium", "%s Fence",),
-    ("jaopca:block_fenceemerald", "%s Fence",),
-    ("jaopca:block_fenceenderbiotite", "%s Fence",),
-    ("jaopca:block_fencegold", "%s Fence",),
-    ("jaopca:block_fenceiridium", "%s Fence",),
-    ("jaopca:block_fencelapis", "%s Fence",),
-    ("jaopca:block_fencelead", "%s Fence",),
-    ("jaopca:block_fenceliquifiedcoralium", "%s Fence",),
-    ("jaopca:block_fencelithium", "%s Fence",),
-    ("jaopca:block_fencemagnesium", "%s Fence",),
-    ("jaopca:block_fencemalachite", "%s Fence",),
-    ("jaopca:block_fencemithril", "%s Fence",),
-    ("jaopca:block_fencenickel", "%s Fence",),
-    ("jaopca:block_fenceosmium", "%s Fence",),
-    ("jaopca:block_fenceperidot", "%s Fence",),
-    ("jaopca:block_fenceplatinum", "%s Fence",),
-    ("jaopca:block_fencequartz", "%s Fence",),
-    ("jaopca:block_fencequartzblack", "%s Fence",),
-    ("jaopca:block_fenceruby", "%s Fence",),
-    ("jaopca:block_fencesapphire", "%s Fence",),
-    ("jaopca:block_fencesilver", "%s Fence",),
-    ("jaopca:block_fencetanzanite", "%s Fence",),
-    ("jaopca:block_fencethorium", "%s Fence",),
-    ("jaopca:block_fencetin", "%s Fence",),
-    ("jaopca:block_fencetitanium", "%s Fence",),
-    ("jaopca:block_fencetopaz", "%s Fence",),
-    ("jaopca:block_fencetungsten", "%s Fence",),
-    ("jaopca:block_fenceuranium", "%s Fence",),
-    ("jaopca:block_fenceyellorium", "%s Fence",),
-    ("jaopca:block_glasshardenedabyssalnite", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedardite", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedastralstarmetal", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedboron", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedcobalt", "Hardened %s Glass",),
-    ("jaopca:block_glasshardeneddraconium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedgold", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenediron", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedliquifiedcoralium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedlithium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedmagnesium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedosmium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedthorium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedtitanium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedtungsten", "Hardened %s Glass",),
-    ("jaopca:block_glasshardeneduranium", "Hardened %s Glass",),
-    ("jaopca:block_glasshardenedyellorium", "Hardened %s Glass",),
-    ("jaopca:block_wallamber", "%s Wall",),
-    ("jaopca:block_wallamethyst", "%s Wall",),
-    ("jaopca:block_wallapatite", "%s Wall",),
-    ("jaopca:block_wallardite", "%s Wall",),
-    ("jaopca:block_wallcoal", "%s Wall",),
-    ("jaopca:block_wallcobalt", "%s Wall",),
-    ("jaopca:block_wallcopper", "%s Wall",),
-    ("jaopca:block_walldiamond", "%s Wall",),
-    ("jaopca:block_walldimensionalshard", "%s Wall",),
-    ("jaopca:block_walldraconium", "%s Wall",),
-    ("jaopca:block_wallemerald", "%s Wall",),
-    ("jaopca:block_wallenderbiotite", "%s Wall",),
-    ("jaopca:block_wallgold", "%s Wall",),
-    ("jaopca:block_walliridium", "%s Wall",),
-    ("jaopca:block_walliron", "%s Wall",),
-    ("jaopca:block_walllapis", "%s Wall",),
-    ("jaopca:block_walllead", "%s Wall",),
-    ("jaopca:block_wallmalachite", "%s Wall",),
-    ("jaopca:block_wallmithril", "%s Wall",),
-    ("jaopca:block_wallnickel", "%s Wall",),
-    ("jaopca:block_wallosmium", "%s Wall",),
-    ("jaopca:block_wallperidot", "%s Wall",),
-    ("jaopca:block_wallplatinum", "%s Wall",),
-    ("jaopca:block_wallquartz", "%s Wall",),
-    ("jaopca:block_wallquartzblack", "%s Wall",),
-    ("jaopca:block_wallruby", "%s Wall",),
-    ("jaopca:block_wallsapphire", "%s Wall",),
-    ("jaopca:block_wallsilver", "%s Wall",),
-    ("jaopca:block_walltanzanite", "%s Wall",),
-    ("jaopca:block_walltin", "%s Wall",),
-    ("jaopca:block_walltopaz", "%s Wall",),
-    ("jaopca:block_walltungsten", "%s Wall",),
-    ("jaopca:block_walluranium", "%s Wall",),
-    ("jaopca:block_wallyellorium", "%s Wall",),
-    ("jaopca:fluid_moltenabyssalnite", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenastralstarmetal", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenboron", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltendraconium", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenliquifiedcoralium", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenlithium", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenmagnesium", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltenmithril", "tile.jaopca.molten.name",),
-    ("jaopca:fluid_moltentungsten", "tile.jaopca.molten.name",),
-    ("libvulpes:advancedmotor", "Advanced Motor",),
-    ("libvulpes:advstructuremachine", "Advanced Machine Structure",),
-    ("libvulpes:blockphantom", "tile.blockPhantom.name",),
-    ("libvulpes:coalgenerator", "Coal Generator",),
-    ("libvulpes:coil0", "tile.coil.name",),
-    ("libvulpes:creativepowerbattery", "Creative Power Input Plug",),
-    ("libvulpes:elitemotor", "Elite Motor",),
-    ("libvulpes:enhancedmotor", "Enhanced Motor",),
-    ("libvulpes:forgepowerinput", "Power Input Plug",),
-    ("libvulpes:forgepoweroutput", "Power Output Plug",),
-    ("libvulpes:hatch", "tile.hatch.name",),
-    ("libvulpes:metal0", "tile.metal.name",),
-    ("libvulpes:motor", "Motor",),
-    ("libvulpes:ore0", "tile.ore.name",),
-    ("libvulpes:placeholder", "Machine",),
-    ("libvulpes:structuremachine", "Machine Structure",),
-    ("magicbees:effectjar", "Bee Collector's Jar",),
-    ("magicbees:enchanted_earth", "Enchanted Earth",),
-    ("magicbees:hiveblock", "tile.magicbees.hiveblock.name",),
-    ("mcmultipart:multipart", "tile.null.name",),
-    ("mekanism:basicblock", "tile.BasicBlock.name",),
-    ("mekanism:basicblock2", "tile.BasicBlock2.name",),
-    ("mekanism:boundingblock", "Bounding Block",),
-    ("mekanism:cardboardbox", "Cardboard Box",),
-    ("mekanism:energycube", "tile.EnergyCube.name",),
-    ("mekanism:gastank", "tile.GasTank.name",),
-    ("mekanism:glowpanel", "Glow Panel",),
-    ("mekanism:glowplasticblock", "Plastic Glow Block",),
-    ("mekanism:machineblock", "tile.MachineBlock.name",),
-    ("mekanism:machineblock2", "tile.MachineBlock2.name",),
-    ("mekanism:machineblock3", "tile.MachineBlock3.name",),
-    ("mekanism:obsidiantnt", "Obsidian TNT",),
-    ("mekanism:oreblock", "tile.OreBlock.name",),
-    ("mekanism:plasticblock", "Plastic Block",),
-    ("mekanism:plasticfence", "Plastic Barrier",),
-    ("mekanism:reinforcedplasticblock", "Reinforced Plastic Block",),
-    ("mekanism:roadplasticblock", "Plastic Road",),
-    ("mekanism:saltblock", "Salt Block",),
-    ("mekanism:slickplasticblock", "Slick Plastic Block",),
-    ("mekanism:transmitter", "tile.Transmitter.name",),
-    ("mekanismgenerators:generator", "tile.Generator.name",),
-    ("mekanismgenerators:reactor", "tile.Reactor.name",),
-    ("mekanismgenerators:reactorglass", "tile.ReactorGlass.name",),
-    ("minecolonies:blockconstructiontape", "Construction tape",),
-    ("minecolonies:blockhutbaker", "Bakery",),
-    ("minecolonies:blockhutbarracks", "Barracks",),
-    ("minecolonies:blockhutbarrackstower", "BarracksTower",),
-    ("minecolonies:blockhutblacksmith", "Forge (NOT IMPLEMENTED)",),
-    ("minecolonies:blockhutbuilder", "Builder's Hut",),
-    ("minecolonies:blockhutchickenherder", "ChickenHerders's Hut",),
-    ("minecolonies:blockhutcitizen", "Citizen's Hut",),
-    ("minecolonies:blockhutcook", "Restaurant",),
-    ("minecolonies:blockhutcowboy", "Cowboy's Hut",),
-    ("minecolonies:blockhutdeliveryman", "Deliveryman",),
-    ("minecolonies:blockhutfarmer", "Farm",),
-    ("minecolonies:blockhutfield", "Field",),
-    ("minecolonies:blockhutfisherman", "Fisherman's Hut",),
-    ("minecolonies:blockhutguardtower", "GuardTower",),
-    ("minecolonies:blockhutlumberjack", "Sawmill",),
-    ("minecolonies:blockhutminer", "Mine",),
-    ("minecolonies:blockhutshepherd", "Shepherd's Hut",),
-    ("minecolonies:blockhutsmeltery", "Smeltery",),
-    ("minecolonies:blockhutstonemason", "Quarry",),
-    ("minecolonies:blockhutswineherder", "SwineHerders's Hut",),
-    ("minecolonies:blockhuttownhall", "Town Hall",),
-    ("minecolonies:blockhutwarehouse", "Warehouse",),
-    ("minecolonies:blockinfoposter", "tile.minecolonies.blockInfoPoster.name",),
-    ("minecolonies:blockminecoloniesrack", "Rack",),
-    ("minecolonies:blockpaperwall", "Paper wall",),
-    ("minecolonies:blockshingle_acacia", "Acacia Shingle",),
-    ("minecolonies:blockshingle_birch", "Birch Shingle",),
-    ("minecolonies:blockshingle_dark_oak", "Dark Oak Shingle",),
-    ("minecolonies:blockshingle_jungle", "Jungle Shingle",),
-    ("minecolonies:blockshingle_oak", "Oak Shingle",),
-    ("minecolonies:blockshingle_spruce", "Spruce Shingle",),
-    ("minecolonies:blockshingleslab", "Shingle slab",),
-    ("minecolonies:blocksolidsubstitution", "Solid-Placeholderblock",),
-    ("minecolonies:blocksubstitution", "Placeholderblock",),
-    ("minecolonies:blocktimberframe_acacia_doublecrossed", " Acacia Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_downgated", " Acacia Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_framed", " Acacia Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_gateframed", " Acacia Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_horizontalnocap", " Acacia Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_horizontalplain", " Acacia Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_onecrossedlr", " Acacia Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_onecrossedrl", " Acacia Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_plain", " Acacia Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_acacia_sideframed", " Acacia Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_doublecrossed", " Birch Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_downgated", " Birch Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_framed", " Birch Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_gateframed", " Birch Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_horizontalnocap", " Birch Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_horizontalplain", " Birch Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_onecrossedlr", " Birch Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_onecrossedrl", " Birch Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_plain", " Birch Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_birch_sideframed", " Birch Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_doublecrossed", " Dark Oak Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_downgated", " Dark Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_framed", " Dark Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_gateframed", " Dark Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_horizontalnocap", " Dark Oak Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_horizontalplain", " Dark Oak Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_onecrossedlr", " Dark Oak Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_onecrossedrl", " Dark Oak Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_plain", " Dark Oak Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_dark_oak_sideframed", " Dark Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_doublecrossed", " Jungle Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_downgated", " Jungle Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_framed", " Jungle Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_gateframed", " Jungle Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_horizontalnocap", " Jungle Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_horizontalplain", " Jungle Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_onecrossedlr", " Jungle Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_onecrossedrl", " Jungle Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_plain", " Jungle Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_jungle_sideframed", " Jungle Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_doublecrossed", " Oak Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_downgated", " Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_framed", " Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_gateframed", " Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_horizontalnocap", " Oak Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_horizontalplain", " Oak Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_onecrossedlr", " Oak Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_onecrossedrl", " Oak Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_plain", " Oak Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_oak_sideframed", " Oak Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_doublecrossed", " Spruce Crossed Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_downgated", " Spruce Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_framed", " Spruce Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_gateframed", " Spruce Framed Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_horizontalnocap", " Spruce Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_horizontalplain", " Spruce Horizontal Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_onecrossedlr", " Spruce Left-Right Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_onecrossedrl", " Spruce Right-Left Diagonal Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_plain", " Spruce Plain Timber Frame",),
-    ("minecolonies:blocktimberframe_spruce_sideframed", " Spruce Framed Timber Frame",),
-    ("minecolonies:blockwaypoint", "Waypoint placeholder",),
-    ("minecolonies:multiblock", "tile.minecolonies.multiBlock.name",),
-    ("minecraft:acacia_door", "Acacia Door",),
-    ("minecraft:acacia_fence", "Acacia Fence",),
-    ("minecraft:acacia_fence_gate", "Acacia Fence Gate",),
-    ("minecraft:acacia_stairs", "Acacia Wood Stairs",),
-    ("minecraft:activator_rail", "Activator Rail",),
-    ("minecraft:air", "Air",),
-    ("minecraft:anvil", "Anvil",),
-    ("minecraft:barrier", "Barrier",),
-    ("minecraft:beacon", "Beacon",),
-    ("minecraft:bed", "tile.bed.name",),
-    ("minecraft:bedrock", "Bedrock",),
-    ("minecraft:beetroots", "Beetroots",),
-    ("minecraft:birch_door", "Birch Door",),
-    ("minecraft:birch_fence", "Birch Fence",),
-    ("minecraft:birch_fence_gate", "Birch Fence Gate",),
-    ("minecraft:birch_stairs", "Birch Wood Stairs",),
-    ("minecraft:black_glazed_terracotta", "Black Glazed Terracotta",),
-    ("minecraft:black_shulker_box", "Black Shulker Box",),
-    ("minecraft:blue_glazed_terracotta", "Blue Glazed Terracotta",),
-    ("minecraft:blue_shulker_box", "Blue Shulker Box",),
-    ("minecraft:bone_block", "Bone Block",),
-    ("minecraft:bookshelf", "Oak Bookshelf",),
-    ("minecraft:brewing_stand", "Brewing Stand",),
-    ("minecraft:brick_block", "Bricks",),
-    ("minecraft:brick_stairs", "Brick Stairs",),
-    ("minecraft:brown_glazed_terracotta", "Brown Glazed Terracotta",),
-    ("minecraft:brown_mushroom", "Mushroom",),
-    ("minecraft:brown_mushroom_block", "Mushroom",),
-    ("minecraft:brown_shulker_box", "Brown Shulker Box",),
-    ("minecraft:cactus", "Cactus",),
-    ("minecraft:cake", "Cake",),
-    ("minecraft:carpet", "Carpet",),
-    ("minecraft:carrots", "Carrots",),
-    ("minecraft:cauldron", "Cauldron",),
-    ("minecraft:chain_command_block", "Chain Command Block",),
-    ("minecraft:chest", "Oak Chest",),
-    ("minecraft:chorus_flower", "Chorus Flower",),
-    ("minecraft:chorus_plant", "Chorus Plant",),
-    ("minecraft:clay", "Clay",),
-    ("minecraft:coal_block", "Block of Coal",),
-    ("minecraft:coal_ore", "Coal Ore",),
-    ("minecraft:cobblestone", "Cobblestone",),
-    ("minecraft:cobblestone_wall", "Cobblestone Wall",),
-    ("minecraft:cocoa", "Cocoa",),
-    ("minecraft:command_block", "Command Block",),
-    ("minecraft:concrete", "Concrete",),
-    ("minecraft:concrete_powder", "tile.concretePowder.name",),
-    ("minecraft:crafting_table", "Crafting Table",),
-    ("minecraft:cyan_glazed_terracotta", "Cyan Glazed Terracotta",),
-    ("minecraft:cyan_shulker_box", "Cyan Shulker Box",),
-    ("minecraft:dark_oak_door", "Dark Oak Door",),
-    ("minecraft:dark_oak_fence", "Dark Oak Fence",),
-    ("minecraft:dark_oak_fence_gate", "Dark Oak Fence Gate",),
-    ("minecraft:dark_oak_stairs", "Dark Oak Wood Stairs",),
-    ("minecraft:daylight_detector", "Daylight Sensor",),
-    ("minecraft:daylight_detector_inverted", "Daylight Sensor",),
-    ("minecraft:deadbush", "Dead Bush",),
-    ("minecraft:detector_rail", "Detector Rail",),
-    ("minecraft:diamond_block", "Block of Diamond",),
-    ("minecraft:diamond_ore", "Diamond Ore",),
-    ("minecraft:dirt", "Dirt",),
-    ("minecraft:dispenser", "Dispenser",),
-    ("minecraft:double_plant", "Plant",),
-    ("minecraft:double_stone_slab", "Stone Slab",),
-    ("minecraft:double_stone_slab2", "Red Sandstone Slab",),
-    ("minecraft:double_wooden_slab", "Wood Slab",),
-    ("minecraft:dragon_egg", "Dragon Egg",),
-    ("minecraft:dropper", "Dropper",),
-    ("minecraft:emerald_block", "Block of Emerald",),
-    ("minecraft:emerald_ore", "Emerald Ore",),
-    ("minecraft:enchanting_table", "Enchantment Table",),
-    ("minecraft:end_bricks", "End Stone Bricks",),
-    ("minecraft:end_gateway", "tile.null.name",),
-    ("minecraft:end_portal", "tile.null.name",),
-    ("minecraft:end_portal_frame", "End Portal",),
-    ("minecraft:end_rod", "End Rod",),
-    ("minecraft:end_stone", "End Stone",),
-    ("minecraft:ender_chest", "Ender Chest",),
-    ("minecraft:farmland", "Farmland",),
-    ("minecraft:fence", "Oak Fence",),
-    ("minecraft:fence_gate", "Oak Fence Gate",),
-    ("minecraft:fire", "Fire",),
-    ("minecraft:flower_pot", "Flower Pot",),
-    ("minecraft:flowing_lava", "Lava",),
-    ("minecraft:flowing_water", "Water",),
-    ("minecraft:frosted_ice", "Frosted Ice",),
-    ("minecraft:furnace", "Furnace",),
-    ("minecraft:glass", "Glass",),
-    ("minecraft:glass_pane", "Glass Pane",),
-    ("minecraft:glowstone", "Glowstone",),
-    ("minecraft:gold_block", "Block of Gold",),
-    ("minecraft:gold_ore", "Gold Ore",),
-    ("minecraft:golden_rail", "Powered Rail",),
-    ("minecraft:grass", "Grass Block",),
-    ("minecraft:grass_path", "Grass Path",),
-    ("minecraft:gravel", "Gravel",),
-    ("minecraft:gray_glazed_terracotta", "Gray Glazed Terracotta",),
-    ("minecraft:gray_shulker_box", "Gray Shulker Box",),
-    ("minecraft:green_glazed_terracotta", "Green Glazed Terracotta",),
-    ("minecraft:green_shulker_box", "Green Shulker Box",),
-    ("minecraft:hardened_clay", "Terracotta",),
-    ("minecraft:hay_block", "Hay Bale",),
-    ("minecraft:heavy_weighted_pressure_plate", "Weighted Pressure Plate (Heavy)",),
-    ("minecraft:hopper", "Hopper",),
-    ("minecraft:ice", "Ice",),
-    ("minecraft:iron_bars", "Iron Bars",),
-    ("minecraft:iron_block", "Block of Iron",),
-    ("minecraft:iron_door", "Iron Door",),
-    ("minecraft:iron_ore", "Iron Ore",),
-    ("minecraft:iron_trapdoor", "Iron Trapdoor",),
-    ("minecraft:jukebox", "Jukebox",),
-    ("minecraft:jungle_door", "Jungle Door",),
-    ("minecraft:jungle_fence", "Jungle Fence",),
-    ("minecraft:jungle_fence_gate", "Jungle Fence Gate",),
-    ("minecraft:jungle_stairs", "Jungle Wood Stairs",),
-    ("minecraft:ladder", "Ladder",),
-    ("minecraft:lapis_block", "Lapis Lazuli Block",),
-    ("minecraft:lapis_ore", "Lapis Lazuli Ore",),
-    ("minecraft:lava", "Lava",),
-    ("minecraft:leaves", "Leaves",),
-    ("minecraft:leaves2", "Leaves",),
-    ("minecraft:lever", "Lever",),
-    ("minecraft:light_blue_glazed_terracotta", "Light Blue Glazed Terracotta",),
-    ("minecraft:light_blue_shulker_box", "Light Blue Shulker Box",),
-    ("minecraft:light_weighted_pressure_plate", "Weighted Pressure Plate (Light)",),
-    ("minecraft:lime_glazed_terracotta", "Lime Glazed Terracotta",),
-    ("minecraft:lime_shulker_box", "Lime Shulker Box",),
-    ("minecraft:lit_furnace", "Furnace",),
-    ("minecraft:lit_pumpkin", "Jack o'Lantern",),
-    ("minecraft:lit_redstone_lamp", "Redstone Lamp",),
-    ("minecraft:lit_redstone_ore", "Redstone Ore",),
-    ("minecraft:log", "Wood",),
-    ("minecraft:log2", "Wood",),
-    ("minecraft:magenta_glazed_terracotta", "Magenta Glazed Terracotta",),
-    ("minecraft:magenta_shulker_box", "Magenta Shulker Box",),
-    ("minecraft:magma", "Magma Block",),
-    ("minecraft:melon_block", "Melon",),
-    ("minecraft:melon_stem", "Pumpkin Stem",),
-    ("minecraft:mob_spawner", "Monster Spawner",),
-    ("minecraft:monster_egg", "Stone Monster Egg",),
-    ("minecraft:mossy_cobblestone", "Moss Stone",),
-    ("minecraft:mycelium", "Mycelium",),
-    ("minecraft:nether_brick", "Nether Brick",),
-    ("minecraft:nether_brick_fence", "Nether Brick Fence",),
-    ("minecraft:nether_brick_stairs", "Nether Brick Stairs",),
-    ("minecraft:nether_wart", "Nether Wart",),
-    ("minecraft:nether_wart_block", "Nether Wart Block",),
-    ("minecraft:netherrack", "Netherrack",),
-    ("minecraft:noteblock", "Note Block",),
-    ("minecraft:oak_stairs", "Oak Wood Stairs",),
-    ("minecraft:observer", "Observer",),
-    ("minecraft:obsidian", "Obsidian",),
-    ("minecraft:orange_glazed_terracotta", "Orange Glazed Terracotta",),
-    ("minecraft:orange_shulker_box", "Orange Shulker Box",),
-    ("minecraft:packed_ice", "Packed Ice",),
-    ("minecraft:pink_glazed_terracotta", "Pink Glazed Terracotta",),
-    ("minecraft:pink_shulker_box", "Pink Shulker Box",),
-    ("minecraft:piston", "Piston",),
-    ("minecraft:piston_extension", "tile.null.name",),
-    ("minecraft:piston_head", "Piston",),
-    ("minecraft:planks", "Wooden Planks",),
-    ("minecraft:portal", "Portal",),
-    ("minecraft:potatoes", "Potatoes",),
-    ("minecraft:powered_comparator", "Redstone Comparator",),
-    ("minecraft:powered_repeater", "Redstone Repeater",),
-    ("minecraft:prismarine", "Prismarine",),
-    ("minecraft:pumpkin", "Pumpkin",),
-    ("minecraft:pumpkin_stem", "Pumpkin Stem",),
-    ("minecraft:purple_glazed_terracotta", "Purple Glazed Terracotta",),
-    ("minecraft:purple_shulker_box", "Purple Shulker Box",),
-    ("minecraft:purpur_block", "Purpur Block",),
-    ("minecraft:purpur_double_slab", "Purpur Slab",),
-    ("minecraft:purpur_pillar", "Purpur Pillar",),
-    ("minecraft:purpur_slab", "Purpur Slab",),
-    ("minecraft:purpur_stairs", "Purpur Stairs",),
-    ("minecraft:quartz_block", "Block of Quartz",),
-    ("minecraft:quartz_ore", "Nether Quartz Ore",),
-    ("minecraft:quartz_stairs", "Quartz Stairs",),
-    ("minecraft:rail", "Rail",),
-    ("minecraft:red_flower", "Flower",),
-    ("minecraft:red_glazed_terracotta", "Red Glazed Terracotta",),
-    ("minecraft:red_mushroom", "Mushroom",),
-    ("minecraft:red_mushroom_block", "Mushroom",),
-    ("minecraft:red_nether_brick", "Red Nether Brick",),
-    ("minecraft:red_sandstone", "Red Sandstone",),
-    ("minecraft:red_sandstone_stairs", "Red Sandstone Stairs",),
-    ("minecraft:red_shulker_box", "Red Shulker Box",),
-    ("minecraft:redstone_block", "Block of Redstone",),
-    ("minecraft:redstone_lamp", "Redstone Lamp",),
-    ("minecraft:redstone_ore", "Redstone Ore",),
-    ("minecraft:redstone_torch", "Redstone Torch",),
-    ("minecraft:redstone_wire", "Redstone Dust",),
-    ("minecraft:reeds", "Sugar cane",),
-    ("minecraft:repeating_command_block", "Repeating Command Block",),
-    ("minecraft:sand", "Sand",),
-    ("minecraft:sandstone", "Sandstone",),
-    ("minecraft:sandstone_stairs", "Sandstone Stairs",),
-    ("minecraft:sapling", "Oak Sapling",),
-    ("minecraft:sea_lantern", "Sea Lantern",),
-    ("minecraft:silver_glazed_terracotta", "Light Gray Glazed Terracotta",),
-    ("minecraft:silver_shulker_box", "Light Gray Shulker Box",),
-    ("minecraft:skull", "tile.skull.skeleton.name",),
-    ("minecraft:slime", "Slime Block",),
-    ("minecraft:snow", "Snow",),
-    ("minecraft:snow_layer", "Snow",),
-    ("minecraft:soul_sand", "Soul Sand",),
-    ("minecraft:sponge", "Sponge",),
-    ("minecraft:spruce_door", "Spruce Door",),
-    ("minecraft:spruce_fence", "Spruce Fence",),
-    ("minecraft:spruce_fence_gate", "Spruce Fence Gate",),
-    ("minecraft:spruce_stairs", "Spruce Wood Stairs",),
-    ("minecraft:stained_glass", "Stained Glass",),
-    ("minecraft:stained_glass_pane", "Stained Glass Pane",),
-    ("minecraft:stained_hardened_clay", "Stained Terracotta",),
-    ("minecraft:standing_banner", "White Banner",),
-    ("minecraft:standing_sign", "Sign",),
-    ("minecraft:sticky_piston", "Sticky Piston",),
-    ("minecraft:stone", "Stone",),
-    ("minecraft:stone_brick_stairs", "Stone Brick Stairs",),
-    ("minecraft:stone_button", "Button",),
-    ("minecraft:stone_pressure_plate", "Stone Pressure Plate",),
-    ("minecraft:stone_slab", "Stone Slab",),
-    ("minecraft:stone_slab2", "Red Sandstone Slab",),
-    ("minecraft:stone_stairs", "Cobblestone Stairs",),
-    ("minecraft:stonebrick", "Stone Bricks",),
-    ("minecraft:structure_block", "Structure Block",),
-    ("minecraft:structure_void", "Structure Void",),
-    ("minecraft:tallgrass", "Grass",),
-    ("minecraft:tnt", "TNT",),
-    ("minecraft:torch", "Torch",),
-    ("minecraft:trapdoor", "Oak Trapdoor",),
-    ("minecraft:trapped_chest", "Oak Trapped Chest",),
-    ("minecraft:tripwire", "Tripwire",),
-    ("minecraft:tripwire_hook", "Tripwire Hook",),
-    ("minecraft:unlit_redstone_torch", "Redstone Torch",),
-    ("minecraft:unpowered_comparator", "Redstone Comparator",),
-    ("minecraft:unpowered_repeater", "Redstone Repeater",),
-    ("minecraft:vine", "Vines",),
-    ("minecraft:wall_banner", "White Banner",),
-    ("minecraft:wall_sign", "Sign",),
-    ("minecraft:water", "Water",),
-    ("minecraft:waterlily", "Lily Pad",),
-    ("minecraft:web", "Cobweb",),
-    ("minecraft:wheat", "Crops",),
-    ("minecraft:white_glazed_terracotta", "White Glazed Terracotta",),
-    ("minecraft:white_shulker_box", "White Shulker Box",),
-    ("minecraft:wooden_button", "Button",),
-    ("minecraft:wooden_door", "Oak Door",),
-    ("minecraft:wooden_pressure_plate", "Wooden Pressure Plate",),
-    ("minecraft:wooden_slab", "Wood Slab",),
-    ("minecraft:wool", "Wool",),
-    ("minecraft:yellow_flower", "Flower",),
-    ("minecraft:yellow_glazed_terracotta", "Yellow Glazed Terracotta",),
-    ("minecraft:yellow_shulker_box", "Yellow Shulker Box",),
-    ("mobtotems:incense_kindling_box", "Incense Kindling Box",),
-    ("mobtotems:offering_box", "Offering Box",),
-    ("mobtotems:sacred_light", "Sacred Light",),
-    ("mobtotems:totem_wood", "tiles.mobtotems:totem_wood.name",),
-    ("mysticalagradditions:awakened_draconium_crop", "Awakened Draconium Crop",),
-    ("mysticalagradditions:dragon_egg_crop", "Dragon Egg Crop",),
-    ("mysticalagradditions:molten_base_essence", "Molten Base Essence",),
-    ("mysticalagradditions:molten_inferium", "Molten Inferium",),
-    ("mysticalagradditions:molten_intermedium", "Molten Intermedium",),
-    ("mysticalagradditions:molten_prudentium", "Molten Prudentium",),
-    ("mysticalagradditions:molten_soulium", "Molten Soulium",),
-    ("mysticalagradditions:molten_superium", "Molten Superium",),
-    ("mysticalagradditions:molten_supremium", "Molten Supremium",),
-    ("mysticalagradditions:nether_star_crop", "Nether Star Crop",),
-    ("mysticalagradditions:special", "tile.ma.special.name",),
-    ("mysticalagradditions:storage", "tile.ma.storage.name",),
-    ("mysticalagradditions:tier6_inferium_crop", "Tier 6 Inferium Crop",),
-    ("mysticalagradditions:tinkering_table", "Tinkering Table",),
-    ("mysticalagriculture:aluminum_brass_crop", "Aluminum Brass Crop",),
-    ("mysticalagriculture:aluminum_crop", "Aluminum Crop",),
-    ("mysticalagriculture:amber_crop", "Amber Crop",),
-    ("mysticalagriculture:apatite_crop", "Apatite Crop",),
-    ("mysticalagriculture:aquamarine_crop", "Aquamarine Crop",),
-    ("mysticalagriculture:ardite_crop", "Ardite Crop",),
-    ("mysticalagriculture:basalt_crop", "Basalt Crop",),
-    ("mysticalagriculture:basalz_crop", "Basalz Crop",),
-    ("mysticalagriculture:black_quartz_crop", "Black Quartz Crop",),
-    ("mysticalagriculture:blaze_crop", "Blaze Crop",),
-    ("mysticalagriculture:blitz_crop", "Blitz Crop",),
-    ("mysticalagriculture:blizz_crop", "Blizz Crop",),
-    ("mysticalagriculture:brass_crop", "Brass Crop",),
-    ("mysticalagriculture:bronze_crop", "Bronze Crop",),
-    ("mysticalagriculture:certus_quartz_crop", "Certus Quartz Crop",),
-    ("mysticalagriculture:chicken_crop", "Chicken Crop",),
-    ("mysticalagriculture:chrome_crop", "Chrome Crop",),
-    ("mysticalagriculture:coal_block", "tile.ma.coal_block.name",),
-    ("mysticalagriculture:coal_crop", "Coal Crop",),
-    ("mysticalagriculture:cobalt_crop", "Cobalt Crop",),
-    ("mysticalagriculture:cobbled_soulstone_slab", "Cobbled Soulstone Slab",),
-    ("mysticalagriculture:cobbled_soulstone_slab_full", "tile.ma.cobbled_soulstone_slab_full.name",),
-    ("mysticalagriculture:cobbled_soulstone_stairs", "Cobbled Soulstone Stairs",),
-    ("mysticalagriculture:cobbled_soulstone_wall", "tile.ma.cobbled_soulstone_wall.normal.name",),
-    ("mysticalagriculture:constantan_crop", "Constantan Crop",),
-    ("mysticalagriculture:copper_crop", "Copper Crop",),
-    ("mysticalagriculture:cow_crop", "Cow Crop",),
-    ("mysticalagriculture:creeper_crop", "Creeper Crop",),
-    ("mysticalagriculture:dawnstone_crop", "Dawnstone Crop",),
-    ("mysticalagriculture:diamond_crop", "Diamond Crop",),
-    ("mysticalagriculture:dirt_crop", "Dirt Crop",),
-    ("mysticalagriculture:draconium_crop", "Draconium Crop",),
-    ("mysticalagriculture:dye_crop", "Dye Crop",),
-    ("mysticalagriculture:electrum_crop", "Electrum Crop",),
-    ("mysticalagriculture:elementium_crop", "Elementium Crop",),
-    ("mysticalagriculture:emerald_crop", "Emerald Crop",),
-    ("mysticalagriculture:end_crop", "End Crop",),
-    ("mysticalagriculture:end_inferium_ore", "End Inferium Ore",),
-    ("mysticalagriculture:end_prosperity_ore", "End Prosperity Ore",),
-    ("mysticalagriculture:ender_amethyst_crop", "Ender Amethyst Crop",),
-    ("mysticalagriculture:ender_biotite_crop", "Ender Biotite Crop",),
-    ("mysticalagriculture:enderium_crop", "Enderium Crop",),
-    ("mysticalagriculture:enderman_crop", "Enderman Crop",),
-    ("mysticalagriculture:experience_crop", "Experience Crop",),
-    ("mysticalagriculture:fire_crop", "Fire Crop",),
-    ("mysticalagriculture:fluix_crop", "Fluix Crop",),
-    ("mysticalagriculture:fluxed_electrum_crop", "Fluxed Electrum Crop",),
-    ("mysticalagriculture:ghast_crop", "Ghast Crop",),
-    ("mysticalagriculture:glowstone_crop", "Glowstone Crop",),
-    ("mysticalagriculture:glowstone_ingot_crop", "Glowstone Ingot Crop",),
-    ("mysticalagriculture:glowstone_lamp", "Glowstone Lamp",),
-    ("mysticalagriculture:gold_crop", "Gold Crop",),
-    ("mysticalagriculture:growth_accelerator", "Growth Accelerator",),
-    ("mysticalagriculture:guardian_crop", "Guardian Crop",),
-    ("mysticalagriculture:ice_crop", "Ice Crop",),
-    ("mysticalagriculture:inferium_furnace", "Inferium Furnace",),
-    ("mysticalagriculture:inferium_furnace_active", "Inferium Furnace",),
-    ("mysticalagriculture:inferium_ore", "Inferium Ore",),
-    ("mysticalagriculture:ingot_storage", "tile.ma.ingot_storage.name",),
-    ("mysticalagriculture:intermedium_furnace", "Intermedium Furnace",),
-    ("mysticalagriculture:intermedium_furnace_active", "Intermedium Furnace",),
-    ("mysticalagriculture:invar_crop", "Invar Crop",),
-    ("mysticalagriculture:iridium_crop", "Iridium Crop",),
-    ("mysticalagriculture:iridium_ore_crop", "Iridium Ore Crop",),
-    ("mysticalagriculture:iron_crop", "Iron Crop",),
-    ("mysticalagriculture:knightslime_crop", "Knightslime Crop",),
-    ("mysticalagriculture:lapis_lazuli_crop", "Lapis Lazuli Crop",),
-    ("mysticalagriculture:lead_crop", "Lead Crop",),
-    ("mysticalagriculture:limestone_crop", "Limestone Crop",),
-    ("mysticalagriculture:lumium_crop", "Lumium Crop",),
-    ("mysticalagriculture:malachite_crop", "Malachite Crop",),
-    ("mysticalagriculture:manasteel_crop", "Manasteel Crop",),
-    ("mysticalagriculture:manyullyn_crop", "Manyullyn Crop",),
-    ("mysticalagriculture:marble_crop", "Marble Crop",),
-    ("mysticalagriculture:menril_crop", "Menril Crop",),
-    ("mysticalagriculture:miners_torch", "Miner's Torch",),
-    ("mysticalagriculture:mithril_crop", "Mithril Crop",),
-    ("mysticalagriculture:mystical_flower_crop", "Mystical Flower Crop",),
-    ("mysticalagriculture:mystical_machine_frame", "Mystical Machine Frame",),
-    ("mysticalagriculture:nature_crop", "Nature Crop",),
-    ("mysticalagriculture:nether_crop", "Nether Crop",),
-    ("mysticalagriculture:nether_inferium_ore", "Nether Inferium Ore",),
-    ("mysticalagriculture:nether_prosperity_ore", "Nether Prosperity Ore",),
-    ("mysticalagriculture:nether_quartz_crop", "Nether Quartz Crop",),
-    ("mysticalagriculture:nickel_crop", "Nickel Crop",),
-    ("mysticalagriculture:obsidian_crop", "Obsidian Crop",),
-    ("mysticalagriculture:osmium_crop", "Osmium Crop",),
-    ("mysticalagriculture:peridot_crop", "Peridot Crop",),
-    ("mysticalagriculture:pig_crop", "Pig Crop",),
-    ("mysticalagriculture:platinum_crop", "Platinum Crop",),
-    ("mysticalagriculture:prosperity_ore", "Prosperity Ore",),
-    ("mysticalagriculture:prudentium_furnace", "Prudentium Furnace",),
-    ("mysticalagriculture:prudentium_furnace_active", "Prudentium Furnace",),
-    ("mysticalagriculture:quartz_enriched_iron_crop", "Quartz Enriched Iron Crop",),
-    ("mysticalagriculture:rabbit_crop", "Rabbit Crop",),
-    ("mysticalagriculture:redstone_crop", "Redstone Crop",),
-    ("mysticalagriculture:refined_obsidian_crop", "Refined Obsidian Crop",),
-    ("mysticalagriculture:rock_crystal_crop", "Rock Crystal Crop",),
-    ("mysticalagriculture:rubber_crop", "Rubber Crop",),
-    ("mysticalagriculture:ruby_crop", "Ruby Crop",),
-    ("mysticalagriculture:saltpeter_crop", "Saltpeter Crop",),
-    ("mysticalagriculture:sapphire_crop", "Sapphire Crop",),
-    ("mysticalagriculture:seed_reprocessor", "Seed Reprocessor",),
-    ("mysticalagriculture:sheep_crop", "Sheep Crop",),
-    ("mysticalagriculture:signalum_crop", "Signalum Crop",),
-    ("mysticalagriculture:silicon_crop", "Silicon Crop",),
-    ("mysticalagriculture:silver_crop", "Silver Crop",),
-    ("mysticalagriculture:skeleton_crop", "Skeleton Crop",),
-    ("mysticalagriculture:sky_stone_crop", "Sky Stone Crop",),
-    ("mysticalagriculture:slate_crop", "Slate Crop",),
-    ("mysticalagriculture:slime_crop", "Slime Crop",),
-    ("mysticalagriculture:soul_glass", "Soul Glass",),
-    ("mysticalagriculture:soul_glass_pane", "Soul Glass Pane",),
-    ("mysticalagriculture:soulstone", "tile.ma.soulstone.name",),
-    ("mysticalagriculture:soulstone_brick_slab", "Soulstone Brick Slab",),
-    ("mysticalagriculture:soulstone_brick_slab_full", "tile.ma.soulstone_brick_slab_full.name",),
-    ("mysticalagriculture:soulstone_brick_stairs", "Soulstone Brick Stairs",),
-    ("mysticalagriculture:soulstone_brick_wall", "tile.ma.soulstone_brick_wall.normal.name",),
-    ("mysticalagriculture:soulstone_slab", "Soulstone Slab",),
-    ("mysticalagriculture:soulstone_slab_full", "tile.ma.soulstone_slab_full.name",),
-    ("mysticalagriculture:spider_crop", "Spider Crop",),
-    ("mysticalagriculture:starmetal_crop", "Starmetal Crop",),
-    ("mysticalagriculture:steel_crop", "Steel Crop",),
-    ("mysticalagriculture:stone_crop", "Stone Crop",),
-    ("mysticalagriculture:storage", "tile.ma.storage.name",),
-    ("mysticalagriculture:sulfur_crop", "Sulfur Crop",),
-    ("mysticalagriculture:superium_furnace", "Superium Furnace",),
-    ("mysticalagriculture:superium_furnace_active", "Superium Furnace",),
-    ("mysticalagriculture:supremium_furnace", "Supremium Furnace",),
-    ("mysticalagriculture:supremium_furnace_active", "Supremium Furnace",),
-    ("mysticalagriculture:tanzanite_crop", "Tanzanite Crop",),
-    ("mysticalagriculture:terrasteel_crop", "Terrasteel Crop",),
-    ("mysticalagriculture:tier1_inferium_crop", "Tier 1 Inferium Crop",),
-    ("mysticalagriculture:tier2_inferium_crop", "Tier 2 Inferium Crop",),
-    ("mysticalagriculture:tier3_inferium_crop", "Tier 3 Inferium Crop",),
-    ("mysticalagriculture:tier4_inferium_crop", "Tier 4 Inferium Crop",),
-    ("mysticalagriculture:tier5_inferium_crop", "Tier 5 Inferium Crop",),
-    ("mysticalagriculture:tin_crop", "Tin Crop",),
-    ("mysticalagriculture:tinkering_table", "Tinkering Table",),
-    ("mysticalagriculture:titanium_crop", "Titanium Crop",),
-    ("mysticalagriculture:topaz_crop", "Topaz Crop",),
-    ("mysticalagriculture:tungsten_crop", "Tungsten Crop",),
-    ("mysticalagriculture:ultimate_furnace", "Ultimate Furnace",),
-    ("mysticalagriculture:ultimate_furnace_active", "Ultimate Furnace",),
-    ("mysticalagriculture:uranium_238_crop", "Uranium 238 Crop",),
-    ("mysticalagriculture:uranium_crop", "Uranium Crop",),
-    ("mysticalagriculture:water_crop", "Water Crop",),
-    ("mysticalagriculture:wither_skeleton_crop", "Wither Skeleton Crop",),
-    ("mysticalagriculture:witherproof_block", "Witherproof Block",),
-    ("mysticalagriculture:witherproof_glass", "Witherproof Glass",),
-    ("mysticalagriculture:wood_crop", "Wood Crop",),
-    ("mysticalagriculture:yellorium_crop", "Yellorium Crop",),
-    ("mysticalagriculture:zinc_crop", "Zinc Crop",),
-    ("mysticalagriculture:zombie_crop", "Zombie Crop",),
-    ("natura:amaranth_button", "Amaranth Button",),
-    ("natura:amaranth_fence", "Amaranth Fence",),
-    ("natura:amaranth_fence_gate", "Amaranth Fence Gate",),
-    ("natura:amaranth_pressure_plate", "Amaranth Pressure Plate",),
-    ("natura:amaranth_trap_door", "Amaranth Trap Door",),
-    ("natura:barley_crop", "tile.natura.barley_crop.name",),
-    ("natura:blaze_hopper", "Blaze Hopper",),
-    ("natura:blaze_rail", "Blaze Rail",),
-    ("natura:blaze_rail_activator", "Activator Blaze Rail",),
-    ("natura:blaze_rail_detector", "Detector Blaze Rail",),
-    ("natura:blaze_rail_golden", "Powered Blaze Rail",),
-    ("natura:bloodwood_button", "Bloodwood Button",),
-    ("natura:bloodwood_fence", "Bloodwood Fence",),
-    ("natura:bloodwood_fence_gate", "Bloodwood Fence Gate",),
-    ("natura:bloodwood_pressure_plate", "Bloodwood Pressure Plate",),
-    ("natura:bloodwood_trap_door", "Bloodwood Trap Door",),
-    ("natura:bluebells_flower", "Bluebells",),
-    ("natura:clouds", "tile.natura.clouds.name",),
-    ("natura:colored_grass", "tile.natura.colored_grass.name",),
-    ("natura:colored_grass_slab", "tile.natura.colored_grass_slab.name",),
-    ("natura:colored_grass_stairs_autumnal", "Autumnal Grass Stairs",),
-    ("natura:colored_grass_stairs_bluegrass", "Bluegrass Stairs",),
-    ("natura:colored_grass_stairs_topiary", "Topiary Grass Stairs",),
-    ("natura:cotton_crop", "tile.natura.cotton_crop.name",),
-    ("natura:darkwood_button", "Darkwood Button",),
-    ("natura:darkwood_fence", "Darkwood Fence",),
-    ("natura:darkwood_fence_gate", "Darkwood Fence Gate",),
-    ("natura:darkwood_pressure_plate", "Darkwood Pressure Plate",),
-    ("natura:darkwood_trap_door", "Darkwood Trap Door",),
-    ("natura:eucalyptus_button", "Eucalyptus Button",),
-    ("natura:eucalyptus_fence", "Eucalyptus Fence",),
-    ("natura:eucalyptus_fence_gate", "Eucalyptus Fence Gate",),
-    ("natura:eucalyptus_pressure_plate", "Eucalyptus Pressure Plate",),
-    ("natura:eucalyptus_trap_door", "Eucalyptus Trap Door",),
-    ("natura:fusewood_button", "Fusewood Button",),
-    ("natura:fusewood_fence", "Fusewood Fence",),
-    ("natura:fusewood_fence_gate", "Fusewood Fence Gate",),
-    ("natura:fusewood_pressure_plate", "Fusewood Pressure Plate",),
-    ("natura:fusewood_trap_door", "Fusewood Trap Door",),
-    ("natura:ghostwood_button", "Ghostwood Button",),
-    ("natura:ghostwood_fence", "Ghostwood Fence",),
-    ("natura:ghostwood_fence_gate", "Ghostwood Fence Gate",),
-    ("natura:ghostwood_pressure_plate", "Ghostwood Pressure Plate",),
-    ("natura:ghostwood_trap_door", "Ghostwood Trap Door",),
-    ("natura:hopseed_button", "Hopseed Button",),
-    ("natura:hopseed_fence", "Hopseed Fence",),
-    ("natura:hopseed_fence_gate", "Hopseed Fence Gate",),
-    ("natura:hopseed_pressure_plate", "Hopseed Pressure Plate",),
-    ("natura:hopseed_trap_door", "Hopseed Trap Door",),
-    ("natura:lit_netherrack_furnace", "Nether Furnace",),
-    ("natura:maple_button", "Maple Button",),
-    ("natura:maple_fence", "Maple Fence",),
-    ("natura:maple_fence_gate", "Maple Fence Gate",),
-    ("natura:maple_pressure_plate", "Maple Pressure Plate",),
-    ("natura:maple_trap_door", "Maple Trap Door",),
-    ("natura:nether_berrybush_blightberry", "Blightberry Bush",),
-    ("natura:nether_berrybush_duskberry", "Duskberry Bush",),
-    ("natura:nether_berrybush_skyberry", "Skyberry Bush",),
-    ("natura:nether_berrybush_stingberry", "Stingberry Bush",),
-    ("natura:nether_blue_large_glowshroom", "tile.natura.nether_blue_large_glowshroom.name",),
-    ("natura:nether_bookshelves", "tile.natura.nether_bookshelves.name",),
-    ("natura:nether_button", "Button",),
-    ("natura:nether_door_bloodwood", "item.natura.nether_door_bloodwood.name",),
-    ("natura:nether_door_ghostwood", "item.natura.nether_door_ghostwood.name",),
-    ("natura:nether_glass", "tile.natura.nether_glass.name",),
-    ("natura:nether_glowshroom", "tile.natura.nether_glowshroom.name",),
-    ("natura:nether_green_large_glowshroom", "tile.natura.nether_green_large_glowshroom.name",),
-    ("natura:nether_heat_sand", "Heat Sand",),
-    ("natura:nether_leaves", "tile.natura.nether_leaves.name",),
-    ("natura:nether_leaves2", "tile.natura.nether_leaves2.name",),
-    ("natura:nether_lever", "Lever",),
-    ("natura:nether_logs", "tile.natura.nether_logs.name",),
-    ("natura:nether_logs2", "Bloodwood",),
-    ("natura:nether_planks", "tile.natura.nether_planks.name",),
-    ("natura:nether_pressure_plate", "Pressure Plate",),
-    ("natura:nether_purple_large_glowshroom", "tile.natura.nether_purple_large_glowshroom.name",),
-    ("natura:nether_sapling", "tile.natura.nether_sapling.oak.name",),
-    ("natura:nether_sapling2", "tile.natura.nether_sapling2.oak.name",),
-    ("natura:nether_slab", "tile.natura.nether_slab.name",),
-    ("natura:nether_stairs_bloodwood", "Blood Stairs",),
-    ("natura:nether_stairs_darkwood", "Darkwood Stairs",),
-    ("natura:nether_stairs_fusewood", "Fusewood Stairs",),
-    ("natura:nether_stairs_ghostwood", "Ghostwood Stairs",),
-    ("natura:nether_tainted_soil", "tile.natura.nether_tainted_soil.name",),
-    ("natura:nether_thorn_vines", "Thornvines",),
-    ("natura:nether_workbenches", "tile.natura.nether_workbenches.name",),
-    ("natura:netherrack_furnace", "Nether Furnace",),
-    ("natura:overworld_berrybush_blackberry", "Blackberry Bush",),
-    ("natura:overworld_berrybush_blueberry", "Blueberry Bush",),
-    ("natura:overworld_berrybush_maloberry", "Maloberry Bush",),
-    ("natura:overworld_berrybush_raspberry", "Raspberry Bush",),
-    ("natura:overworld_bookshelves", "tile.natura.overworld_bookshelves.name",),
-    ("natura:overworld_door_eucalyptus", "item.natura.overworld_door_eucalyptus.name",),
-    ("natura:overworld_door_hopseed", "item.natura.overworld_door_hopseed.name",),
-    ("natura:overworld_door_redwood", "item.natura.overworld_door_redwood.name",),
-    ("natura:overworld_door_redwood_bark", "item.natura.overworld_door_redwood_bark.name",),
-    ("natura:overworld_door_sakura", "item.natura.overworld_door_sakura.name",),
-    ("natura:overworld_leaves", "tile.natura.overworld_leaves.name",),
-    ("natura:overworld_leaves2", "tile.natura.overworld_leaves2.name",),
-    ("natura:overworld_logs", "tile.natura.overworld_logs.name",),
-    ("natura:overworld_logs2", "tile.natura.overworld_logs2.name",),
-    ("natura:overworld_planks", "tile.natura.overworld_planks.name",),
-    ("natura:overworld_sapling", "tile.natura.overworld_sapling.oak.name",),
-    ("natura:overworld_sapling2", "tile.natura.overworld_sapling2.oak.name",),
-    ("natura:overworld_slab", "tile.natura.overworld_slab.name",),
-    ("natura:overworld_slab2", "tile.natura.overworld_slab2.name",),
-    ("natura:overworld_stairs_amaranth", "Amaranth Stairs",),
-    ("natura:overworld_stairs_eucalyptus", "Eucalyptus Stairs",),
-    ("natura:overworld_stairs_hopseed", "Hopseed Stairs",),
-    ("natura:overworld_stairs_maple", "Maple Stairs",),
-    ("natura:overworld_stairs_redwood", "Redwood Stairs",),
-    ("natura:overworld_stairs_sakura", "Sakura Stairs",),
-    ("natura:overworld_stairs_silverbell", "Silverbell Stairs",),
-    ("natura:overworld_stairs_tiger", "Tiger Stairs",),
-    ("natura:overworld_stairs_willow", "Willow Stairs",),
-    ("natura:overworld_workbenches", "tile.natura.overworld_workbenches.name",),
-    ("natura:redwood_button", "Redwood Button",),
-    ("natura:redwood_fence", "Redwood Fence",),
-    ("natura:redwood_fence_gate", "Redwood Fence Gate",),
-    ("natura:redwood_leaves", "tile.natura.redwood_leaves.name",),
-    ("natura:redwood_logs", "tile.natura.redwood_logs.name",),
-    ("natura:redwood_pressure_plate", "Redwood Pressure Plate",),
-    ("natura:redwood_sapling", "tile.natura.redwood_sapling.oak.name",),
-    ("natura:redwood_trap_door", "Redwood Trap Door",),
-    ("natura:respawn_obelisk", "tile.natura.respawn_obelisk.name",),
-    ("natura:saguaro", "Saguaro Cactus",),
-    ("natura:saguaro_baby", "Baby Saguaro Cactus",),
-    ("natura:saguaro_fruit", "Saguaro Fruit",),
-    ("natura:sakura_button", "Sakura Button",),
-    ("natura:sakura_fence", "Sakura Fence",),
-    ("natura:sakura_fence_gate", "Sakura Fence Gate",),
-    ("natura:sakura_pressure_plate", "Sakura Pressure Plate",),
-    ("natura:sakura_trap_door", "Sakura Trap Door",),
-    ("natura:silverbell_button", "Silverbell Button",),
-    ("natura:silverbell_fence", "Silverbell Fence",),
-    ("natura:silverbell_fence_gate", "Silverbell Fence Gate",),
-    ("natura:silverbell_pressure_plate", "Silverbell Pressure Plate",),
-    ("natura:silverbell_trap_door", "Silverbell Trap Door",),
-    ("natura:tiger_button", "Tiger Button",),
-    ("natura:tiger_fence", "Tiger Fence",),
-    ("natura:tiger_fence_gate", "Tiger Fence Gate",),
-    ("natura:tiger_pressure_plate", "Tiger Pressure Plate",),
-    ("natura:tiger_trap_door", "Tiger Trap Door",),
-    ("natura:willow_button", "Willow Button",),
-    ("natura:willow_fence", "Willow Fence",),
-    ("natura:willow_fence_gate", "Willow Fence Gate",),
-    ("natura:willow_pressure_plate", "Willow Pressure Plate",),
-    ("natura:willow_trap_door", "Willow Trap Door",),
-    ("notenoughwands:lightblock", "Illuminating Orb",),
-    ("nuclearcraft:accelerator_electromagnet_active", "Superconducting Electromagnet",),
-    ("nuclearcraft:accelerator_electromagnet_idle", "Superconducting Electromagnet",),
-    ("nuclearcraft:active_cooler", "Active Fluid Cooler",),
-    ("nuclearcraft:alloy_furnace_active", "Alloy Furnace",),
-    ("nuclearcraft:alloy_furnace_idle", "Alloy Furnace",),
-    ("nuclearcraft:bin", "Universal Bin",),
-    ("nuclearcraft:block_depleted_americium", "Depleted Americium Block",),
-    ("nuclearcraft:block_depleted_berkelium", "Depleted Berkelium Block",),
-    ("nuclearcraft:block_depleted_californium", "Depleted Californium Block",),
-    ("nuclearcraft:block_depleted_curium", "Depleted Curium Block",),
-    ("nuclearcraft:block_depleted_neptunium", "Depleted Neptunium Block",),
-    ("nuclearcraft:block_depleted_plutonium", "Depleted Plutonium Block",),
-    ("nuclearcraft:block_depleted_thorium", "Depleted Thorium Block",),
-    ("nuclearcraft:block_depleted_uranium", "Depleted Uranium Block",),
-    ("nuclearcraft:block_ice", "Supercold Ice",),
-    ("nuclearcraft:buffer", "Buffer",),
-    ("nuclearcraft:cell_block", "Reactor Cell",),
-    ("nuclearcraft:chemical_reactor_active", "Chemical Reactor",),
-    ("nuclearcraft:chemical_reactor_idle", "Chemical Reactor",),
-    ("nuclearcraft:cobblestone_generator", "Cobblestone Generator",),
-    ("nuclearcraft:cobblestone_generator_compact", "Compact Cobblestone Generator",),
-    ("nuclearcraft:cobblestone_generator_dense", "Dense Cobblestone Generator",),
-    ("nuclearcraft:cooler", "tile.nuclearcraft.cooler.name",),
-    ("nuclearcraft:crystallizer_active", "Crystallizer",),
-    ("nuclearcraft:crystallizer_idle", "Crystallizer",),
-    ("nuclearcraft:decay_generator", "Decay Generator",),
-    ("nuclearcraft:decay_hastener_active", "Decay Hastener",),
-    ("nuclearcraft:decay_hastener_idle", "Decay Hastener",),
-    ("nuclearcraft:dissolver_active", "Fluid Enricher",),
-    ("nuclearcraft:dissolver_idle", "Fluid Enricher",),
-    ("nuclearcraft:electrolyser_active", "Electrolyzer",),
-    ("nuclearcraft:electrolyser_idle", "Electrolyzer",),
-    ("nuclearcraft:electromagnet_supercooler_active", "Superconducting Supercooler",),
-    ("nuclearcraft:electromagnet_supercooler_idle", "Superconducting Supercooler",),
-    ("nuclearcraft:extractor_active", "Fluid Extractor",),
-    ("nuclearcraft:extractor_idle", "Fluid Extractor",),
-    ("nuclearcraft:fission_block", "tile.nuclearcraft.fission_block.name",),
-    ("nuclearcraft:fission_controller_active", "Fission Controller",),
-    ("nuclearcraft:fission_controller_idle", "Fission Controller (Old)",),
-    ("nuclearcraft:fission_controller_new_active", "Fission Controller",),
-    ("nuclearcraft:fission_controller_new_idle", "Fission Controller",),
-    ("nuclearcraft:fission_port", "Fission Reactor Port",),
-    ("nuclearcraft:fluid_americium_241", "Molten Americium-241",),
-    ("nuclearcraft:fluid_americium_241_fluoride", "Molten Americium-241 Fluoride",),
-    ("nuclearcraft:fluid_americium_241_fluoride_flibe", "Molten FLiBe Salt Solution of Americium-241 Fluoride",),
-    ("nuclearcraft:fluid_americium_242", "Molten Americium-242",),
-    ("nuclearcraft:fluid_americium_242_fluoride", "Molten Americium-242 Fluoride",),
-    ("nuclearcraft:fluid_americium_242_fluoride_flibe", "Molten FLiBe Salt Solution of Americium-242 Fluoride",),
-    ("nuclearcraft:fluid_americium_243", "Molten Americium-243",),
-    ("nuclearcraft:fluid_americium_243_fluoride", "Molten Americium-243 Fluoride",),
-    ("nuclearcraft:fluid_americium_243_fluoride_flibe", "Molten FLiBe Salt Solution of Americium-243 Fluoride",),
-    ("nuclearcraft:fluid_ammonia", "Ammonia",),
-    ("nuclearcraft:fluid_bef2", "Molten Beryllium Fluoride",),
-    ("nuclearcraft:fluid_berkelium_247", "Molten Berkelium-247",),
-    ("nuclearcraft:fluid_berkelium_247_fluoride", "Molten Berkelium-247 Fluoride",),
-    ("nuclearcraft:fluid_berkelium_247_fluoride_flibe", "Molten FLiBe Salt Solution of Berkelium-247 Fluoride",),
-    ("nuclearcraft:fluid_berkelium_248", "Molten Berkelium-248",),
-    ("nuclearcraft:fluid_berkelium_248_fluoride", "Molten Berkelium-248 Fluoride",),
-    ("nuclearcraft:fluid_berkelium_248_fluoride_flibe", "Molten FLiBe Salt Solution of Berkelium-248 Fluoride",),
-    ("nuclearcraft:fluid_beryllium", "Molten Beryllium",),
-    ("nuclearcraft:fluid_boric_acid", "Boric Acid",),
-    ("nuclearcraft:fluid_boron10", "Molten Boron-10",),
-    ("nuclearcraft:fluid_boron11", "Molten Boron-11",),
-    ("nuclearcraft:fluid_boron_nitride_solution", "Boron Nitride Solution",),
-    ("nuclearcraft:fluid_calcium_sulfate_solution", "Calcium Sulfate Solution",),
-    ("nuclearcraft:fluid_californium_249", "Molten Californium-249",),
-    ("nuclearcraft:fluid_californium_249_fluoride", "Molten Californium-249 Fluoride",),
-    ("nuclearcraft:fluid_californium_249_fluoride_flibe", "Molten FLiBe Salt Solution of Californium-249 Fluoride",),
-    ("nuclearcraft:fluid_californium_250", "Molten Californium-250",),
-    ("nuclearcraft:fluid_californium_250_fluoride", "Molten Californium-250 Fluoride",),
-    ("nuclearcraft:fluid_californium_250_fluoride_flibe", "Molten FLiBe Salt Solution of Californium-250 Fluoride",),
-    ("nuclearcraft:fluid_californium_251", "Molten Californium-251",),
-    ("nuclearcraft:fluid_californium_251_fluoride", "Molten Californium-251 Fluoride",),
-    ("nuclearcraft:fluid_californium_251_fluoride_flibe", "Molten FLiBe Salt Solution of Californium-251 Fluoride",),
-    ("nuclearcraft:fluid_californium_252", "Molten Californium-252",),
-    ("nuclearcraft:fluid_californium_252_fluoride", "Molten Californium-252 Fluoride",),
-    ("nuclearcraft:fluid_californium_252_fluoride_flibe", "Molten FLiBe Salt Solution of Californium-252 Fluoride",),
-    ("nuclearcraft:fluid_coolant", "Standard Coolant",),
-    ("nuclearcraft:fluid_curium_243", "Molten Curium-243",),
-    ("nuclearcraft:fluid_curium_243_fluoride", "Molten Curium-243 Fluoride",),
-    ("nuclearcraft:fluid_curium_243_fluoride_flibe", "Molten FLiBe Salt Solution of Curium-243 Fluoride",),
-    ("nuclearcraft:fluid_curium_245", "Molten Curium-245",),
-    ("nuclearcraft:fluid_curium_245_fluoride", "Molten Curium-245 Fluoride",),
-    ("nuclearcraft:fluid_curium_245_fluoride_flibe", "Molten FLiBe Salt Solution of Curium-245 Fluoride",),
-    ("nuclearcraft:fluid_curium_246", "Molten Curium-246",),
-    ("nuclearcraft:fluid_curium_246_fluoride", "Molten Curium-246 Fluoride",),
-    ("nuclearcraft:fluid_curium_246_fluoride_flibe", "Molten FLiBe Salt Solution of Curium-246 Fluoride",),
-    ("nuclearcraft:fluid_curium_247", "Molten Curium-247",),
-    ("nuclearcraft:fluid_curium_247_fluoride", "Molten Curium-247 Fluoride",),
-    ("nuclearcraft:fluid_curium_247_fluoride_flibe", "Molten FLiBe Salt Solution of Curium-247 Fluoride",),
-    ("nuclearcraft:fluid_depleted_fuel_hea_242", "Molten Depleted HEA-242 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hea_242_fluoride", "Molten Depleted HEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hea_242_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heb_248", "Molten Depleted HEB-248 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heb_248_fluoride", "Molten Depleted HEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heb_248_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_249", "Molten Depleted HECf-249 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_249_fluoride", "Molten Depleted HECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_249_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_251", "Molten Depleted HECf-251 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_251_fluoride", "Molten Depleted HECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecf_251_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_243", "Molten Depleted HECm-243 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_243_fluoride", "Molten Depleted HECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_243_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_245", "Molten Depleted HECm-245 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_245_fluoride", "Molten Depleted HECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_245_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_247", "Molten Depleted HECm-247 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_247_fluoride", "Molten Depleted HECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hecm_247_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hen_236", "Molten Depleted HEN-236 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hen_236_fluoride", "Molten Depleted HEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hen_236_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_239", "Molten Depleted HEP-239 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_239_fluoride", "Molten Depleted HEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_239_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_241", "Molten Depleted HEP-241 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_241_fluoride", "Molten Depleted HEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_hep_241_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_233", "Molten Depleted HEU-233 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_233_fluoride", "Molten Depleted HEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_233_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_235", "Molten Depleted HEU-235 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_235_fluoride", "Molten Depleted HEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_heu_235_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted HEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lea_242", "Molten Depleted LEA-242 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lea_242_fluoride", "Molten Depleted LEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lea_242_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leb_248", "Molten Depleted LEB-248 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leb_248_fluoride", "Molten Depleted LEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leb_248_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_249", "Molten Depleted LECf-249 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_249_fluoride", "Molten Depleted LECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_249_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_251", "Molten Depleted LECf-251 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_251_fluoride", "Molten Depleted LECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecf_251_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_243", "Molten Depleted LECm-243 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_243_fluoride", "Molten Depleted LECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_243_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_245", "Molten Depleted LECm-245 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_245_fluoride", "Molten Depleted LECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_245_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_247", "Molten Depleted LECm-247 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_247_fluoride", "Molten Depleted LECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lecm_247_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_len_236", "Molten Depleted LEN-236 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_len_236_fluoride", "Molten Depleted LEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_len_236_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_239", "Molten Depleted LEP-239 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_239_fluoride", "Molten Depleted LEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_239_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_241", "Molten Depleted LEP-241 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_241_fluoride", "Molten Depleted LEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_lep_241_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_233", "Molten Depleted LEU-233 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_233_fluoride", "Molten Depleted LEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_233_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_235", "Molten Depleted LEU-235 Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_235_fluoride", "Molten Depleted LEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_leu_235_fluoride_flibe",
-     "Molten FLiBe Salt Solution of Depleted LEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_tbu", "Molten Depleted TBU Fuel",),
-    ("nuclearcraft:fluid_depleted_fuel_tbu_fluoride", "Molten Depleted TBU Fluoride Fuel",),
-    (
-    "nuclearcraft:fluid_depleted_fuel_tbu_fluoride_flibe", "Molten FLiBe Salt Solution of Depleted TBU Fluoride Fuel",),
-    ("nuclearcraft:fluid_deuterium", "Deuterium",),
-    ("nuclearcraft:fluid_diborane", "Diborane",),
-    ("nuclearcraft:fluid_ethanol", "Ethanol",),
-    ("nuclearcraft:fluid_flibe", "Molten FLiBe Salt Mixture",),
-    ("nuclearcraft:fluid_fluorine", "Fluorine",),
-    ("nuclearcraft:fluid_fluorite_water", "Fluorite Water",),
-    ("nuclearcraft:fluid_fuel_hea_242", "Molten HEA-242 Fuel",),
-    ("nuclearcraft:fluid_fuel_hea_242_fluoride", "Molten HEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hea_242_fluoride_flibe", "Molten FLiBe Salt Solution of HEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heb_248", "Molten HEB-248 Fuel",),
-    ("nuclearcraft:fluid_fuel_heb_248_fluoride", "Molten HEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heb_248_fluoride_flibe", "Molten FLiBe Salt Solution of HEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_249", "Molten HECf-249 Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_249_fluoride", "Molten HECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_249_fluoride_flibe", "Molten FLiBe Salt Solution of HECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_251", "Molten HECf-251 Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_251_fluoride", "Molten HECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecf_251_fluoride_flibe", "Molten FLiBe Salt Solution of HECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_243", "Molten HECm-243 Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_243_fluoride", "Molten HECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_243_fluoride_flibe", "Molten FLiBe Salt Solution of HECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_245", "Molten HECm-245 Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_245_fluoride", "Molten HECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_245_fluoride_flibe", "Molten FLiBe Salt Solution of HECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_247", "Molten HECm-247 Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_247_fluoride", "Molten HECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hecm_247_fluoride_flibe", "Molten FLiBe Salt Solution of HECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hen_236", "Molten HEN-236 Fuel",),
-    ("nuclearcraft:fluid_fuel_hen_236_fluoride", "Molten HEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hen_236_fluoride_flibe", "Molten FLiBe Salt Solution of HEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_239", "Molten HEP-239 Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_239_fluoride", "Molten HEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_239_fluoride_flibe", "Molten FLiBe Salt Solution of HEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_241", "Molten HEP-241 Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_241_fluoride", "Molten HEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_hep_241_fluoride_flibe", "Molten FLiBe Salt Solution of HEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_233", "Molten HEU-233 Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_233_fluoride", "Molten HEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_233_fluoride_flibe", "Molten FLiBe Salt Solution of HEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_235", "Molten HEU-235 Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_235_fluoride", "Molten HEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_heu_235_fluoride_flibe", "Molten FLiBe Salt Solution of HEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lea_242", "Molten LEA-242 Fuel",),
-    ("nuclearcraft:fluid_fuel_lea_242_fluoride", "Molten LEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lea_242_fluoride_flibe", "Molten FLiBe Salt Solution of LEA-242 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leb_248", "Molten LEB-248 Fuel",),
-    ("nuclearcraft:fluid_fuel_leb_248_fluoride", "Molten LEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leb_248_fluoride_flibe", "Molten FLiBe Salt Solution of LEB-248 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_249", "Molten LECf-249 Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_249_fluoride", "Molten LECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_249_fluoride_flibe", "Molten FLiBe Salt Solution of LECf-249 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_251", "Molten LECf-251 Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_251_fluoride", "Molten LECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecf_251_fluoride_flibe", "Molten FLiBe Salt Solution of LECf-251 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_243", "Molten LECm-243 Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_243_fluoride", "Molten LECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_243_fluoride_flibe", "Molten FLiBe Salt Solution of LECm-243 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_245", "Molten LECm-245 Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_245_fluoride", "Molten LECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_245_fluoride_flibe", "Molten FLiBe Salt Solution of LECm-245 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_247", "Molten LECm-247 Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_247_fluoride", "Molten LECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lecm_247_fluoride_flibe", "Molten FLiBe Salt Solution of LECm-247 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_len_236", "Molten LEN-236 Fuel",),
-    ("nuclearcraft:fluid_fuel_len_236_fluoride", "Molten LEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_len_236_fluoride_flibe", "Molten FLiBe Salt Solution of LEN-236 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_239", "Molten LEP-239 Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_239_fluoride", "Molten LEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_239_fluoride_flibe", "Molten FLiBe Salt Solution of LEP-239 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_241", "Molten LEP-241 Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_241_fluoride", "Molten LEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_lep_241_fluoride_flibe", "Molten FLiBe Salt Solution of LEP-241 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_233", "Molten LEU-233 Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_233_fluoride", "Molten LEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_233_fluoride_flibe", "Molten FLiBe Salt Solution of LEU-233 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_235", "Molten LEU-235 Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_235_fluoride", "Molten LEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_leu_235_fluoride_flibe", "Molten FLiBe Salt Solution of LEU-235 Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_tbu", "Molten TBU Fuel",),
-    ("nuclearcraft:fluid_fuel_tbu_fluoride", "Molten TBU Fluoride Fuel",),
-    ("nuclearcraft:fluid_fuel_tbu_fluoride_flibe", "Molten FLiBe Salt Solution of TBU Fluoride Fuel",),
-    ("nuclearcraft:fluid_helium", "Helium",),
-    ("nuclearcraft:fluid_helium3", "Helium-3",),
-    ("nuclearcraft:fluid_hydrofluoric_acid", "Hydrofluoric Acid",),
-    ("nuclearcraft:fluid_hydrogen", "Hydrogen",),
-    ("nuclearcraft:fluid_lif", "Molten Lithium Fluoride",),
-    ("nuclearcraft:fluid_liquidhelium", "Liquid Helium",),
-    ("nuclearcraft:fluid_lithium6", "Molten Lithium-6",),
-    ("nuclearcraft:fluid_lithium7", "Molten Lithium-7",),
-    ("nuclearcraft:fluid_neptunium_236", "Molten Neptunium-236",),
-    ("nuclearcraft:fluid_neptunium_236_fluoride", "Molten Neptunium-236 Fluoride",),
-    ("nuclearcraft:fluid_neptunium_236_fluoride_flibe", "Molten FLiBe Salt Solution of Neptunium-236 Fluoride",),
-    ("nuclearcraft:fluid_neptunium_237", "Molten Neptunium-237",),
-    ("nuclearcraft:fluid_neptunium_237_fluoride", "Molten Neptunium-237 Fluoride",),
-    ("nuclearcraft:fluid_neptunium_237_fluoride_flibe", "Molten FLiBe Salt Solution of Neptunium-237 Fluoride",),
-    ("nuclearcraft:fluid_neutron", "Neutron Fluid",),
-    ("nuclearcraft:fluid_nitrogen", "Nitrogen",),
-    ("nuclearcraft:fluid_oxygen", "Oxygen",),
-    ("nuclearcraft:fluid_oxygen_difluoride", "Oxygen Difluoride",),
-    ("nuclearcraft:fluid_plasma", "Plasma",),
-    ("nuclearcraft:fluid_plutonium", "Molten Plutonium",),
-    ("nuclearcraft:fluid_plutonium_238", "Molten Plutonium-238",),
-    ("nuclearcraft:fluid_plutonium_238_fluoride", "Molten Plutonium-238 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_238_fluoride_flibe", "Molten FLiBe Salt Solution of Plutonium-238 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_239", "Molten Plutonium-239",),
-    ("nuclearcraft:fluid_plutonium_239_fluoride", "Molten Plutonium-239 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_239_fluoride_flibe", "Molten FLiBe Salt Solution of Plutonium-239 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_241", "Molten Plutonium-241",),
-    ("nuclearcraft:fluid_plutonium_241_fluoride", "Molten Plutonium-241 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_241_fluoride_flibe", "Molten FLiBe Salt Solution of Plutonium-241 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_242", "Molten Plutonium-242",),
-    ("nuclearcraft:fluid_plutonium_242_fluoride", "Molten Plutonium-242 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_242_fluoride_flibe", "Molten FLiBe Salt Solution of Plutonium-242 Fluoride",),
-    ("nuclearcraft:fluid_plutonium_fluoride", "Molten Plutonium Fluoride",),
-    ("nuclearcraft:fluid_plutonium_fluoride_flibe", "Molten FLiBe Salt Solution of Plutonium Fluoride",),
-    ("nuclearcraft:fluid_radaway", "RadAway Fluid",),
-    ("nuclearcraft:fluid_steam", "Steam",),
-    ("nuclearcraft:fluid_sulfur", "Molten Sulfur",),
-    ("nuclearcraft:fluid_sulfur_dioxide", "Sulfur Dioxide",),
-    ("nuclearcraft:fluid_sulfur_trioxide", "Sulfur Trioxide",),
-    ("nuclearcraft:fluid_sulfuric_acid", "Sulfuric Acid",),
-    ("nuclearcraft:fluid_thorium", "Molten Thorium",),
-    ("nuclearcraft:fluid_thorium_230", "Molten Thorium-230",),
-    ("nuclearcraft:fluid_thorium_230_fluoride", "Molten Thorium-230 Fluoride",),
-    ("nuclearcraft:fluid_thorium_230_fluoride_flibe", "Molten FLiBe Salt Solution of Thorium-230 Fluoride",),
-    ("nuclearcraft:fluid_thorium_232", "Molten Thorium-232",),
-    ("nuclearcraft:fluid_thorium_232_fluoride", "Molten Thorium-232 Fluoride",),
-    ("nuclearcraft:fluid_thorium_232_fluoride_flibe", "Molten FLiBe Salt Solution of Thorium-232 Fluoride",),
-    ("nuclearcraft:fluid_thorium_fluoride", "Molten Thorium Fluoride",),
-    ("nuclearcraft:fluid_thorium_fluoride_flibe", "Molten FLiBe Salt Solution of Thorium Fluoride",),
-    ("nuclearcraft:fluid_tritium", "Tritium",),
-    ("nuclearcraft:fluid_uranium", "Molten Uranium",),
-    ("nuclearcraft:fluid_uranium_233", "Molten Uranium-233",),
-    ("nuclearcraft:fluid_uranium_233_fluoride", "Molten Uranium-233 Fluoride",),
-    ("nuclearcraft:fluid_uranium_233_fluoride_flibe", "Molten FLiBe Salt Solution of Uranium-233 Fluoride",),
-    ("nuclearcraft:fluid_uranium_235", "Molten Uranium-235",),
-    ("nuclearcraft:fluid_uranium_235_fluoride", "Molten Uranium-235 Fluoride",),
-    ("nuclearcraft:fluid_uranium_235_fluoride_flibe", "Molten FLiBe Salt Solution of Uranium-235 Fluoride",),
-    ("nuclearcraft:fluid_uranium_238", "Molten Uranium-238",),
-    ("nuclearcraft:fluid_uranium_238_fluoride", "Molten Uranium-238 Fluoride",),
-    ("nuclearcraft:fluid_uranium_238_fluoride_flibe", "Molten FLiBe Salt Solution of Uranium-238 Fluoride",),
-    ("nuclearcraft:fluid_uranium_fluoride", "Molten Uranium Fluoride",),
-    ("nuclearcraft:fluid_uranium_fluoride_flibe", "Molten FLiBe Salt Solution of Uranium Fluoride",),
-    ("nuclearcraft:fuel_reprocessor_active", "Fuel Reprocessor",),
-    ("nuclearcraft:fuel_reprocessor_idle", "Fuel Reprocessor",),
-    ("nuclearcraft:fusion_connector", "Fusion Connector",),
-    ("nuclearcraft:fusion_core", "Fusion Core",),
-    ("nuclearcraft:fusion_dummy_side", "Fusion Core",),
-    ("nuclearcraft:fusion_dummy_top", "Fusion Core",),
-    ("nuclearcraft:fusion_electromagnet_active", "Fusion Electromagnet",),
-    ("nuclearcraft:fusion_electromagnet_idle", "Fusion Electromagnet",),
-    ("nuclearcraft:fusion_electromagnet_transparent_active", "Transparent Fusion Electromagnet",),
-    ("nuclearcraft:fusion_electromagnet_transparent_idle", "Transparent Fusion Electromagnet",),
-    ("nuclearcraft:glowing_mushroom", "Glowing Mushroom",),
-    ("nuclearcraft:helium_collector", "Helium Collector",),
-    ("nuclearcraft:helium_collector_compact", "Compact Helium Collector",),
-    ("nuclearcraft:helium_collector_dense", "Dense Helium Collector",),
-    ("nuclearcraft:infuser_active", "Fluid Infuser",),
-    ("nuclearcraft:infuser_idle", "Fluid Infuser",),
-    ("nuclearcraft:ingot_block", "tile.nuclearcraft.ingot_block.name",),
-    ("nuclearcraft:ingot_former_active", "Ingot Former",),
-    ("nuclearcraft:ingot_former_idle", "Ingot Former",),
-    ("nuclearcraft:irradiator_active", "Neutron Irradiator",),
-    ("nuclearcraft:irradiator_idle", "Neutron Irradiator",),
-    ("nuclearcraft:isotope_separator_active", "Isotope Separator",),
-    ("nuclearcraft:isotope_separator_idle", "Isotope Separator",),
-    ("nuclearcraft:lithium_ion_battery_basic", "Basic Lithium Ion Battery (WIP)",),
-    ("nuclearcraft:machine_interface", "Machine Interface",),
-    ("nuclearcraft:manufactory_active", "Manufactory",),
-    ("nuclearcraft:manufactory_idle", "Manufactory",),
-    ("nuclearcraft:melter_active", "Melter",),
-    ("nuclearcraft:melter_idle", "Melter",),
-    ("nuclearcraft:nitrogen_collector", "Nitrogen Collector",),
-    ("nuclearcraft:nitrogen_collector_compact", "Compact Nitrogen Collector",),
-    ("nuclearcraft:nitrogen_collector_dense", "Dense Nitrogen Collector",),
-    ("nuclearcraft:nuclear_furnace_active", "Nuclear Furnace",),
-    ("nuclearcraft:nuclear_furnace_idle", "Nuclear Furnace",),
-    ("nuclearcraft:ore", "tile.nuclearcraft.ore.name",),
-    ("nuclearcraft:pressurizer_active", "Pressurizer",),
-    ("nuclearcraft:pressurizer_idle", "Pressurizer",),
-    ("nuclearcraft:reactor_casing_transparent", "Transparent Reactor Casing",),
-    ("nuclearcraft:reactor_door", "item.nuclearcraft.reactor_door.name",),
-    ("nuclearcraft:reactor_trapdoor", "Reactor Trapdoor",),
-    ("nuclearcraft:rtg_americium", "Americium RTG",),
-    ("nuclearcraft:rtg_californium", "Californium RTG",),
-    ("nuclearcraft:rtg_plutonium", "Plutonium RTG",),
-    ("nuclearcraft:rtg_uranium", "Uranium RTG",),
-    ("nuclearcraft:salt_mixer_active", "Salt Mixer",),
-    ("nuclearcraft:salt_mixer_idle", "Salt Mixer",),
-    ("nuclearcraft:solar_panel_basic", "Basic Solar Panel",),
-    ("nuclearcraft:supercooler_active", "Supercooler",),
-    ("nuclearcraft:supercooler_idle", "Supercooler",),
-    ("nuclearcraft:voltaic_pile_basic", "Basic Voltaic Pile (WIP)",),
-    ("nuclearcraft:water_source", "Infinite Water Source",),
-    ("nuclearcraft:water_source_compact", "Compact Infinite Water Source",),
-    ("nuclearcraft:water_source_dense", "Dense Infinite Water Source",),
-    ("openblocks:auto_anvil", "Auto Anvil",),
-    ("openblocks:auto_enchantment_table", "Auto Enchantment Table",),
-    ("openblocks:beartrap", "Bear Trap",),
-    ("openblocks:big_button", "Stone Big Button",),
-    ("openblocks:big_button_wood", "Wooden Big Button",),
-    ("openblocks:block_breaker", "Block Breaker",),
-    ("openblocks:block_placer", "Block Placer",),
-    ("openblocks:builder_guide", "Enhanced Building Guide",),
-    ("openblocks:cannon", "Item Cannon",),
-    ("openblocks:canvas", "Canvas",),
-    ("openblocks:canvas_glass", "Canvas",),
-    ("openblocks:donation_station", "Donation Station",),
-    ("openblocks:drawing_table", "Drawing Table",),
-    ("openblocks:elevator", "Elevator",),
-    ("openblocks:elevator_rotating", "Rotating Elevator",),
-    ("openblocks:fan", "Fan",),
-    ("openblocks:flag", "Flag",),
-    ("openblocks:golden_egg", "Golden Egg",),
-    ("openblocks:grave", "Grave",),
-    ("openblocks:guide", "Building Guide",),
-    ("openblocks:heal", "Healer",),
-    ("openblocks:imaginary", "tile.openblocks.imaginary.name",),
-    ("openblocks:item_dropper", "Item Dropper",),
-    ("openblocks:ladder", "Jaded Ladder",),
-    ("openblocks:paint_can", "Paint Can",),
-    ("openblocks:paint_mixer", "Paint Mixer",),
-    ("openblocks:path", "Path",),
-    ("openblocks:projector", "Height Map Projector",),
-    ("openblocks:rope_ladder", "Rope Ladder",),
-    ("openblocks:scaffolding", "Scaffolding",),
-    ("openblocks:sky", "Sky Block",),
-    ("openblocks:sponge", "Sponge",),
-    ("openblocks:sprinkler", "Sprinkler",),
-    ("openblocks:tank", "Tank",),
-    ("openblocks:target", "Target",),
-    ("openblocks:trophy", "Trophy",),
-    ("openblocks:vacuum_hopper", "Vacuum Hopper",),
-    ("openblocks:village_highlighter", "Village Highlighter",),
-    ("openblocks:xp_bottler", "XP Bottler",),
-    ("openblocks:xp_drain", "XP Drain",),
-    ("openblocks:xp_shower", "XP Shower",),
-    ("opencomputers:adapter", "Adapter",),
-    ("opencomputers:assembler", "Electronics Assembler",),
-    ("opencomputers:cable", "Cable",),
-    ("opencomputers:capacitor", "Capacitor",),
-    ("opencomputers:carpetedcapacitor", "Carpeted Capacitor",),
-    ("opencomputers:case1", "Computer Case (Tier 1)",),
-    ("opencomputers:case2", "Computer Case (Tier 2)",),
-    ("opencomputers:case3", "Computer Case (Tier 3)",),
-    ("opencomputers:casecreative", "Computer Case (Creative)",),
-    ("opencomputers:chameliumblock", "Block of Chamelium",),
-    ("opencomputers:charger", "Charger",),
-    ("opencomputers:disassembler", "Disassembler",),
-    ("opencomputers:diskdrive", "Disk Drive",),
-    ("opencomputers:endstone", "End Stone",),
-    ("opencomputers:geolyzer", "Geolyzer",),
-    ("opencomputers:hologram1", "Hologram Projector (Tier 1)",),
-    ("opencomputers:hologram2", "Hologram Projector (Tier 2)",),
-    ("opencomputers:keyboard", "Keyboard",),
-    ("opencomputers:microcontroller", "Microcontroller",),
-    ("opencomputers:motionsensor", "Motion Sensor",),
-    ("opencomputers:netsplitter", "Net Splitter",),
-    ("opencomputers:powerconverter", "Power Converter",),
-    ("opencomputers:powerdistributor", "Power Distributor",),
-    ("opencomputers:print", "3D Print",),
-    ("opencomputers:printer", "3D Printer",),
-    ("opencomputers:rack", "Rack",),
-    ("opencomputers:raid", "Raid",),
-    ("opencomputers:redstone", "Redstone I/O",),
-    ("opencomputers:relay", "Relay",),
-    ("opencomputers:robot", "robot.name",),
-    ("opencomputers:robotafterimage", "Robot",),
-    ("opencomputers:screen1", "Screen (Tier 1)",),
-    ("opencomputers:screen2", "Screen (Tier 2)",),
-    ("opencomputers:screen3", "Screen (Tier 3)",),
-    ("opencomputers:transposer", "Transposer",),
-    ("opencomputers:waypoint", "Waypoint",),
-    ("overloaded:compressed_aluminum", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_apatite", "tile.for.resource_storage.name",),
-    ("overloaded:compressed_ardite", "tile.tconstruct.metal.name",),
-    ("overloaded:compressed_black_quartz", "tile.actuallyadditions.block_misc.name",),
-    ("overloaded:compressed_certus", "Certus Quartz Block",),
-    ("overloaded:compressed_coal_block", "Block of Coal",),
-    ("overloaded:compressed_cobalt", "tile.tconstruct.metal.name",),
-    ("overloaded:compressed_cobblestone", "Cobblestone",),
-    ("overloaded:compressed_copper", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_crafting_table", "Crafting Table",),
-    ("overloaded:compressed_diamond_block", "Block of Diamond",),
-    ("overloaded:compressed_dirt", "Dirt",),
-    ("overloaded:compressed_draconium", "Draconium Block",),
-    ("overloaded:compressed_emerald_block", "Block of Emerald",),
-    ("overloaded:compressed_end_stone", "End Stone",),
-    ("overloaded:compressed_glowstone", "Glowstone",),
-    ("overloaded:compressed_gold_block", "Block of Gold",),
-    ("overloaded:compressed_gravel", "Gravel",),
-    ("overloaded:compressed_iridium", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_iron_block", "Block of Iron",),
-    ("overloaded:compressed_lapis", "Lapis Lazuli Block",),
-    ("overloaded:compressed_lead", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_log", "Wood",),
-    ("overloaded:compressed_magma", "Magma Block",),
-    ("overloaded:compressed_mana", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_marble", "Marble",),
-    ("overloaded:compressed_mossy_cobblestone", "Moss Stone",),
-    ("overloaded:compressed_nether_brick", "Nether Brick",),
-    ("overloaded:compressed_nether_star_block", "Nether Star Block",),
-    ("overloaded:compressed_netherrack", "Netherrack",),
-    ("overloaded:compressed_nickel", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_obsidian", "Obsidian",),
-    ("overloaded:compressed_osmium", "tile.BasicBlock.name",),
-    ("overloaded:compressed_platinum", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_quartz_block", "Block of Quartz",),
-    ("overloaded:compressed_redstone_block", "Block of Redstone",),
-    ("overloaded:compressed_saltblock", "Salt Block",),
-    ("overloaded:compressed_sand", "Sand",),
-    ("overloaded:compressed_sandstone", "Sandstone",),
-    ("overloaded:compressed_sea_lantern", "Sea Lantern",),
-    ("overloaded:compressed_silver", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_slate", "Slate",),
-    ("overloaded:compressed_slime", "Slime Block",),
-    ("overloaded:compressed_soul_sand", "Soul Sand",),
-    ("overloaded:compressed_steel", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_stone", "Stone",),
-    ("overloaded:compressed_tin", "tile.thermalfoundation.storage.name",),
-    ("overloaded:compressed_tnt", "TNT",),
-    ("overloaded:compressed_tungsten", "tile.techreborn:storage.name",),
-    ("overloaded:compressed_uranium", "tile.immersiveengineering.storage.name",),
-    ("overloaded:compressed_wool", "Wool",),
-    ("overloaded:creative_generator", "Creative Generator",),
-    ("overloaded:energy_extractor", "Energy Extractor",),
-    ("overloaded:hyper_energy_receiver", "Hyper Energy Receiver",),
-    ("overloaded:hyper_energy_sender", "Hyper Energy Sender",),
-    ("overloaded:hyper_fluid_receiver", "Hyper Fluid Receiver",),
-    ("overloaded:hyper_fluid_sender", "Hyper Fluid Sender",),
-    ("overloaded:hyper_item_receiver", "Hyper Item Receiver",),
-    ("overloaded:hyper_item_sender", "Hyper Item Sender",),
-    ("overloaded:infinite_barrel", "Infinity Barrel",),
-    ("overloaded:infinite_capacitor", "Infinity Capacitor",),
-    ("overloaded:infinite_tank", "Infinity Tank",),
-    ("overloaded:infinite_water_source", "Infinite Water Source",),
-    ("overloaded:item_interface", "Item Interface",),
-    ("overloaded:nether_star_block", "Nether Star Block",),
-    ("overloaded:player_interface", "Player Interface",),
-    ("plants2:aakore", "Aakore",),
-    ("plants2:adlumia_f", "Mountain Fringe",),
-    ("plants2:afgekia_m", "Kan Pai Mahidol",),
-    ("plants2:akebia_q_vine", "Chocolate Vine",),
-    ("plants2:ampelopsis_a_vine", "Pepper Vine",),
-    ("plants2:androsace_a", "Alpine Rock Jasmine",),
-    ("plants2:aphrireroot", "Aphrireroot",),
-    ("plants2:ash_slab", "Ashen Wood Slab",),
-    ("plants2:ash_stairs", "Ashen Wood Stairs",),
-    ("plants2:black_kauri_slab", "Black Kauri Wood Slab",),
-    ("plants2:black_kauri_stairs", "Black Kauri Wood Stairs",),
-    ("plants2:blaze_slab", "Blazing Wood Slab",),
-    ("plants2:blaze_stairs", "Blazing Wood Stairs",),
-    ("plants2:brazillian_pine_slab", "Brazillian Pine Wood Slab",),
-    ("plants2:brazillian_pine_stairs", "Brazillian Pine Wood Stairs",),
-    ("plants2:brewing_cauldron", "Magical Brewing Cauldron",),
-    ("plants2:briblebum", "Briblebum",),
-    ("plants2:bush", "tile.plants2.bush.name",),
-    ("plants2:bushling", "tile.plants2.bushling.name",),
-    ("plants2:cataplant", "Cataplant",),
-    ("plants2:cosmetic_0", "tile.plants2.name",),
-    ("plants2:cosmetic_1", "tile.plants2.name",),
-    ("plants2:cosmetic_2", "tile.plants2.name",),
-    ("plants2:cosmetic_3", "tile.plants2.name",),
-    ("plants2:cosmetic_4", "tile.plants2.name",),
-    ("plants2:cosmetic_5", "tile.plants2.name",),
-    ("plants2:cosmetic_6", "tile.plants2.name",),
-    ("plants2:crop_0", "tile.plants2.name",),
-    ("plants2:crop_1", "tile.plants2.name",),
-    ("plants2:crystal", "tile.plants2.crystal.name",),
-    ("plants2:crystal_leaves", "tile.plants2.leaves.name",),
-    ("plants2:crystal_log", "tile.plants2.log.name",),
-    ("plants2:crystal_planks", "tile.plants2.planks.name",),
-    ("plants2:crystal_sapling", "tile.plants2.sapling.name",),
-    ("plants2:crystal_slab", "Crystal Wood Slab",),
-    ("plants2:crystal_stairs", "Crystal Wood Stairs",),
-    ("plants2:dark_crystal_slab", "Dark Crystal Wood Slab",),
-    ("plants2:dark_crystal_stairs", "Dark Crystal Wood Stairs",),
-    ("plants2:desert_0", "tile.plants2.name",),
-    ("plants2:desert_1", "tile.plants2.name",),
-    ("plants2:double_0", "tile.plants2.name",),
-    ("plants2:double_harvest_0", "tile.plants2.name",),
-    ("plants2:groundcover", "Crystal Groundcover",),
-    ("plants2:harvest_0", "tile.plants2.name",),
-    ("plants2:harvest_1", "tile.plants2.name",),
-    ("plants2:incense_cedar_slab", "Incense Cedar Wood Slab",),
-    ("plants2:incense_cedar_stairs", "Incense Cedar Wood Stairs",),
-    ("plants2:jar", "Flower Pot",),
-    ("plants2:leaves_0", "tile.plants2.leaves.name",),
-    ("plants2:log_0", "tile.plants2.log.name",),
-    ("plants2:murray_pine_slab", "Murray Pine Wood Slab",),
-    ("plants2:murray_pine_stairs", "Murray Pine Wood Stairs",),
-    ("plants2:nether_harvest", "tile.plants2.name",),
-    ("plants2:nether_leaves", "tile.plants2.leaves.name",),
-    ("plants2:nether_log", "tile.plants2.log.name",),
-    ("plants2:nether_sapling", "tile.plants2.sapling.name",),
-    ("plants2:planks", "tile.plants2.planks.name",),
-    ("plants2:saimbaire", "Saimbaire",),
-    ("plants2:sapling_0", "tile.plants2.sapling.name",),
-    ("plants2:small_flower_aithotus", "Small Flower Aithotus",),
-    ("platforms:platform", "tile.platforms.platform.name",),
-    ("plustic:alumiteblock", "Alumite Block",),
-    ("plustic:invarblock", "Invar Block",),
-    ("plustic:mirionblock", "Mirion Block",),
-    ("plustic:osgloglasblock", "Osgloglas Block",),
-    ("plustic:osmiridiumblock", "Osmiridium Block",),
-    ("plustic:plustic.molten_alumite", "Molten Alumite",),
-    ("plustic:plustic.molten_elementium", "Molten Elementium",),
-    ("plustic:plustic.molten_enderium", "fluid.enderium.name",),
-    ("plustic:plustic.molten_invar", "Molten Invar",),
-    ("plustic:plustic.molten_iridium", "Molten Iridium",),
-    ("plustic:plustic.molten_lumium", "fluid.lumium.name",),
-    ("plustic:plustic.molten_manasteel", "Molten Manasteel",),
-    ("plustic:plustic.molten_mirion", "Molten Mirion",),
-    ("plustic:plustic.molten_osgloglas", "Molten Osgloglas",),
-    ("plustic:plustic.molten_osmiridium", "Molten Osmiridium",),
-    ("plustic:plustic.molten_osmium", "Molten Osmium",),
-    ("plustic:plustic.molten_platinum", "Molten Platinum",),
-    ("plustic:plustic.molten_psimetal", "Molten Psimetal",),
-    ("plustic:plustic.molten_refinedglowstone", "Refined Glowstone",),
-    ("plustic:plustic.molten_refinedobsidian", "Molten Refined Obsidian",),
-    ("plustic:plustic.molten_signalum", "fluid.signalum.name",),
-    ("plustic:plustic.molten_terrasteel", "Molten Terrasteel",),
-    ("plustic:plustic.molten_titanium", "Molten Titanium",),
-    ("portalgun:block_portal", "tile.portalgun.block.portal.name",),
-    ("pressure:check_valve", "High Pressure Check Valve",),
-    ("pressure:creative_source", "Creative Fluid Source",),
-    ("pressure:drain", "Fluid Drain",),
-    ("pressure:gas_input", "Pressurized Gas Input",),
-    ("pressure:gas_output", "Pressurized Gas Output",),
-    ("pressure:input", "High Pressure Input",),
-    ("pressure:output", "High Pressure Output",),
-    ("pressure:pipe", "High Pressure Pipe",),
-    ("pressure:pipe_sensor", "High Pressure Pipe Sensor",),
-    ("pressure:pump", "High Pressure Pump",),
-    ("pressure:router", "High Pressure Router",),
-    ("pressure:sluice", "Sluice",),
-    ("pressure:tank_block", "Tank Block",),
-    ("pressure:tank_controller", "Tank Controller",),
-    ("pressure:tank_data_port", "Tank Data Port",),
-    ("pressure:tank_filter", "Tank Fluid Filter",),
-    ("pressure:tank_fluid_access", "Tank Access Port",),
-    ("pressure:tank_fluid_input", "Tank Fluid Intake",),
-    ("pressure:tank_fluid_output", "Tank Fluid Outlet",),
-    ("pressure:tank_fluid_output_auto", "Powered Tank Fluid Outlet",),
-    ("pressure:tank_gas_input", "Tank Gas Intake",),
-    ("pressure:tank_gas_output", "Tank Gas Outlet",),
-    ("pressure:tank_indicator", "Tank Indicator Block",),
-    ("pressure:tank_interface", "Tank Interface",),
-    ("pressure:tank_pressure_input", "Tank Pressure Intake",),
-    ("pressure:tank_pressure_output", "Tank Pressure Outlet",),
-    ("pressure:tank_sensor", "Tank Sensor",),
-    ("pressure:water_source", "Infinite Water Source",),
-    ("psi:cad_assembler", "tile.cad_assembler.name",),
-    ("psi:conjured", "tile.conjured.name",),
-    ("psi:programmer", "tile.programmer.name",),
-    ("psi:psi_decorative", "tile.psi_decorative.name",),
-    ("quantumstorage:chest_diamond", "Diamond Storage Crate",),
-    ("quantumstorage:chest_gold", "Gold Storage Crate",),
-    ("quantumstorage:chest_iron", "Iron Storage Crate",),
-    ("quantumstorage:crater", "Crating Machine",),
-    ("quantumstorage:quantum_barrel", "Quantum Barrel",),
-    ("quantumstorage:quantum_storage_unit", "Quantum Storage Unit",),
-    ("quantumstorage:quantum_tank", "Quantum Tank",),
-    ("quantumstorage:quantumcrafter", "Quantum Crafter",),
-    ("quantumstorage:trashcan", "Trash Can",),
-    ("quantumstorage:trashcanfluid", "Fluid Trash Can",),
-    ("quark:acacia_trapdoor", "tile.acacia_trapdoor.name",),
-    ("quark:bark", "tile.bark.name",),
-    ("quark:bark_acacia_slab", "tile.bark_acacia_slab.name",),
-    ("quark:bark_acacia_slab_double", "tile.bark_acacia_slab_double.name",),
-    ("quark:bark_acacia_stairs", "tile.bark_acacia_stairs.name",),
-    ("quark:bark_acacia_wall", "tile.bark_acacia_wall.name",),
-    ("quark:bark_birch_slab", "tile.bark_birch_slab.name",),
-    ("quark:bark_birch_slab_double", "tile.bark_birch_slab_double.name",),
-    ("quark:bark_birch_stairs", "tile.bark_birch_stairs.name",),
-    ("quark:bark_birch_wall", "tile.bark_birch_wall.name",),
-    ("quark:bark_dark_oak_slab", "tile.bark_dark_oak_slab.name",),
-    ("quark:bark_dark_oak_slab_double", "tile.bark_dark_oak_slab_double.name",),
-    ("quark:bark_dark_oak_stairs", "tile.bark_dark_oak_stairs.name",),
-    ("quark:bark_dark_oak_wall", "tile.bark_dark_oak_wall.name",),
-    ("quark:bark_jungle_slab", "tile.bark_jungle_slab.name",),
-    ("quark:bark_jungle_slab_double", "tile.bark_jungle_slab_double.name",),
-    ("quark:bark_jungle_stairs", "tile.bark_jungle_stairs.name",),
-    ("quark:bark_jungle_wall", "tile.bark_jungle_wall.name",),
-    ("quark:bark_oak_slab", "tile.bark_oak_slab.name",),
-    ("quark:bark_oak_slab_double", "tile.bark_oak_slab_double.name",),
-    ("quark:bark_oak_stairs", "tile.bark_oak_stairs.name",),
-    ("quark:bark_oak_wall", "tile.bark_oak_wall.name",),
-    ("quark:bark_spruce_slab", "tile.bark_spruce_slab.name",),
-    ("quark:bark_spruce_slab_double", "tile.bark_spruce_slab_double.name",),
-    ("quark:bark_spruce_stairs", "tile.bark_spruce_stairs.name",),
-    ("quark:bark_spruce_wall", "tile.bark_spruce_wall.name",),
-    ("quark:basalt", "tile.basalt.name",),
-    ("quark:basalt_wall", "tile.basalt_wall.name",),
-    ("quark:biome_cobblestone", "tile.biome_cobblestone.name",),
-    ("quark:biotite_block", "tile.biotite_block.name",),
-    ("quark:biotite_ore", "tile.biotite_ore.name",),
-    ("quark:biotite_slab", "tile.biotite_slab.name",),
-    ("quark:biotite_slab_double", "tile.biotite_slab_double.name",),
-    ("quark:biotite_stairs", "tile.biotite_stairs.name",),
-    ("quark:biotite_wall", "tile.biotite_wall.name",),
-    ("quark:birch_trapdoor", "tile.birch_trapdoor.name",),
-    ("quark:black_ash", "tile.black_ash.name",),
-    ("quark:blaze_lantern", "tile.blaze_lantern.name",),
-    ("quark:candle", "tile.candle.name",),
-    ("quark:carved_wood", "tile.carved_wood.name",),
-    ("quark:charred_nether_brick_slab", "tile.charred_nether_brick_slab.name",),
-    ("quark:charred_nether_brick_slab_double", "tile.charred_nether_brick_slab_double.name",),
-    ("quark:charred_nether_brick_stairs", "tile.charred_nether_brick_stairs.name",),
-    ("quark:charred_nether_bricks", "tile.charred_nether_bricks.name",),
-    ("quark:colored_flowerpot_black", "tile.colored_flowerpot_black.name",),
-    ("quark:colored_flowerpot_blue", "tile.colored_flowerpot_blue.name",),
-    ("quark:colored_flowerpot_brown", "tile.colored_flowerpot_brown.name",),
-    ("quark:colored_flowerpot_cyan", "tile.colored_flowerpot_cyan.name",),
-    ("quark:colored_flowerpot_gray", "tile.colored_flowerpot_gray.name",),
-    ("quark:colored_flowerpot_green", "tile.colored_flowerpot_green.name",),
-    ("quark:colored_flowerpot_light_blue", "tile.colored_flowerpot_light_blue.name",),
-    ("quark:colored_flowerpot_lime", "tile.colored_flowerpot_lime.name",),
-    ("quark:colored_flowerpot_magenta", "tile.colored_flowerpot_magenta.name",),
-    ("quark:colored_flowerpot_orange", "tile.colored_flowerpot_orange.name",),
-    ("quark:colored_flowerpot_pink", "tile.colored_flowerpot_pink.name",),
-    ("quark:colored_flowerpot_purple", "tile.colored_flowerpot_purple.name",),
-    ("quark:colored_flowerpot_red", "tile.colored_flowerpot_red.name",),
-    ("quark:colored_flowerpot_silver", "tile.colored_flowerpot_silver.name",),
-    ("quark:colored_flowerpot_white", "tile.colored_flowerpot_white.name",),
-    ("quark:colored_flowerpot_yellow", "tile.colored_flowerpot_yellow.name",),
-    ("quark:crystal", "Celestial Crystal",),
-    ("quark:custom_bookshelf", "tile.custom_bookshelf.name",),
-    ("quark:custom_chest", "tile.custom_chest.name",),
-    ("quark:custom_chest_trap", "tile.custom_chest_trap.name",),
-    ("quark:dark_oak_trapdoor", "tile.dark_oak_trapdoor.name",),
-    ("quark:dark_prismarine_wall", "tile.dark_prismarine_wall.name",),
-    ("quark:duskbound_block", "tile.duskbound_block.name",),
-    ("quark:duskbound_block_slab", "tile.duskbound_block_slab.name",),
-    ("quark:duskbound_block_slab_double", "tile.duskbound_block_slab_double.name",),
-    ("quark:duskbound_block_stairs", "tile.duskbound_block_stairs.name",),
-    ("quark:duskbound_block_wall", "tile.duskbound_block_wall.name",),
-    ("quark:duskbound_lantern", "tile.duskbound_lantern.name",),
-    ("quark:end_bricks_slab", "tile.end_bricks_slab.name",),
-    ("quark:end_bricks_slab_double", "tile.end_bricks_slab_double.name",),
-    ("quark:end_bricks_stairs", "tile.end_bricks_stairs.name",),
-    ("quark:end_bricks_wall", "tile.end_bricks_wall.name",),
-    ("quark:fire_stone_slab", "tile.fire_stone_slab.name",),
-    ("quark:fire_stone_slab_double", "tile.fire_stone_slab_double.name",),
-    ("quark:fire_stone_stairs", "tile.fire_stone_stairs.name",),
-    ("quark:fire_stone_wall", "tile.fire_stone_wall.name",),
-    ("quark:glowcelium", "tile.glowcelium.name",),
-    ("quark:glowshroom", "tile.glowshroom.name",),
-    ("quark:glowstone_dust_block", "tile.glowstone_dust_block.name",),
-    ("quark:gunpowder_block", "tile.gunpowder_block.name",),
-    ("quark:hardened_clay_tiles", "tile.hardened_clay_tiles.name",),
-    ("quark:hardened_clay_tiles_slab", "tile.hardened_clay_tiles_slab.name",),
-    ("quark:hardened_clay_tiles_slab_double", "tile.hardened_clay_tiles_slab_double.name",),
-    ("quark:hardened_clay_tiles_stairs", "tile.hardened_clay_tiles_stairs.name",),
-    ("quark:icy_stone_slab", "tile.icy_stone_slab.name",),
-    ("quark:icy_stone_slab_double", "tile.icy_stone_slab_double.name",),
-    ("quark:icy_stone_stairs", "tile.icy_stone_stairs.name",),
-    ("quark:icy_stone_wall", "tile.icy_stone_wall.name",),
-    ("quark:iron_ladder", "tile.iron_ladder.name",),
-    ("quark:iron_plate", "tile.iron_plate.name",),
-    ("quark:iron_plate_slab", "tile.iron_plate_slab.name",),
-    ("quark:iron_plate_slab_double", "tile.iron_plate_slab_double.name",),
-    ("quark:iron_plate_stairs", "tile.iron_plate_stairs.name",),
-    ("quark:iron_rod", "tile.iron_rod.name",),
-    ("quark:jungle_trapdoor", "tile.jungle_trapdoor.name",),
-    ("quark:leaf_carpet", "tile.leaf_carpet.name",),
-    ("quark:limestone", "tile.limestone.name",),
-    ("quark:limestone_wall", "tile.limestone_wall.name",),
-    ("quark:lit_lamp", "tile.lit_lamp.name",),
-    ("quark:magma_bricks", "tile.magma_bricks.name",),
-    ("quark:magma_bricks_slab", "tile.magma_bricks_slab.name",),
-    ("quark:magma_bricks_slab_double", "tile.magma_bricks_slab_double.name",),
-    ("quark:magma_bricks_stairs", "tile.magma_bricks_stairs.name",),
-    ("quark:marble", "tile.marble.name",),
-    ("quark:marble_wall", "tile.marble_wall.name",),
-    ("quark:midori_block", "tile.midori_block.name",),
-    ("quark:midori_block_slab", "tile.midori_block_slab.name",),
-    ("quark:midori_block_slab_double", "tile.midori_block_slab_double.name",),
-    ("quark:midori_block_stairs", "tile.midori_block_stairs.name",),
-    ("quark:midori_block_wall", "tile.midori_block_wall.name",),
-    ("quark:midori_pillar", "tile.midori_pillar.name",),
-    ("quark:nether_brick_fence_gate", "tile.nether_brick_fence_gate.name",),
-    ("quark:obsidian_pressure_plate", "tile.obsidian_pressure_plate.name",),
-    ("quark:paper_wall", "tile.paper_wall.name",),
-    ("quark:polished_netherrack", "tile.polished_netherrack.name",),
-    ("quark:polished_netherrack_bricks_slab", "tile.polished_netherrack_bricks_slab.name",),
-    ("quark:polished_netherrack_bricks_slab_double", "tile.polished_netherrack_bricks_slab_double.name",),
-    ("quark:polished_netherrack_bricks_stairs", "tile.polished_netherrack_bricks_stairs.name",),
-    ("quark:polished_netherrack_bricks_wall", "tile.polished_netherrack_bricks_wall.name",),
-    ("quark:polished_stone", "tile.polished_stone.name",),
-    ("quark:prismarine_bricks_slab", "tile.prismarine_bricks_slab.name",),
-    ("quark:prismarine_bricks_slab_double", "tile.prismarine_bricks_slab_double.name",),
-    ("quark:prismarine_bricks_stairs", "tile.prismarine_bricks_stairs.name",),
-    ("quark:prismarine_bricks_wall", "tile.prismarine_bricks_wall.name",),
-    ("quark:prismarine_dark_slab", "tile.prismarine_dark_slab.name",),
-    ("quark:prismarine_dark_slab_double", "tile.prismarine_dark_slab_double.name",),
-    ("quark:prismarine_dark_stairs", "tile.prismarine_dark_stairs.name",),
-    ("quark:prismarine_rough_wall", "tile.prismarine_rough_wall.name",),
-    ("quark:prismarine_slab", "tile.prismarine_slab.name",),
-    ("quark:prismarine_slab_double", "tile.prismarine_slab_double.name",),
-    ("quark:prismarine_stairs", "tile.prismarine_stairs.name",),
-    ("quark:purpur_block_wall", "tile.purpur_block_wall.name",),
-    ("quark:quartz_wall", "tile.quartz_wall.name",),
-    ("quark:quilted_wool", "tile.quilted_wool.name",),
-    ("quark:rain_detector", "tile.rain_detector.name",),
-    ("quark:red_nether_brick_slab", "tile.red_nether_brick_slab.name",),
-    ("quark:red_nether_brick_slab_double", "tile.red_nether_brick_slab_double.name",),
-    ("quark:red_nether_brick_stairs", "tile.red_nether_brick_stairs.name",),
-    ("quark:red_sandstone_bricks_slab", "tile.red_sandstone_bricks_slab.name",),
-    ("quark:red_sandstone_bricks_slab_double", "tile.red_sandstone_bricks_slab_double.name",),
-    ("quark:red_sandstone_bricks_stairs", "tile.red_sandstone_bricks_stairs.name",),
-    ("quark:red_sandstone_smooth_slab", "tile.red_sandstone_smooth_slab.name",),
-    ("quark:red_sandstone_smooth_slab_double", "tile.red_sandstone_smooth_slab_double.name",),
-    ("quark:red_sandstone_wall", "tile.red_sandstone_wall.name",),
-    ("quark:reed_block", "tile.reed_block.name",),
-    ("quark:reed_block_slab", "tile.reed_block_slab.name",),
-    ("quark:reed_block_slab_double", "tile.reed_block_slab_double.name",),
-    ("quark:reed_block_stairs", "tile.reed_block_stairs.name",),
-    ("quark:reed_block_wall", "tile.reed_block_wall.name",),
-    ("quark:sandstone_bricks_slab", "tile.sandstone_bricks_slab.name",),
-    ("quark:sandstone_bricks_slab_double", "tile.sandstone_bricks_slab_double.name",),
-    ("quark:sandstone_bricks_stairs", "tile.sandstone_bricks_stairs.name",),
-    ("quark:sandstone_new", "tile.sandstone_new.name",),
-    ("quark:sandstone_smooth_slab", "tile.sandstone_smooth_slab.name",),
-    ("quark:sandstone_smooth_slab_double", "tile.sandstone_smooth_slab_double.name",),
-    ("quark:sandstone_wall", "tile.sandstone_wall.name",),
-    ("quark:sandy_bricks", "tile.sandy_bricks.name",),
-    ("quark:sandy_bricks_slab", "tile.sandy_bricks_slab.name",),
-    ("quark:sandy_bricks_slab_double", "tile.sandy_bricks_slab_double.name",),
-    ("quark:sandy_bricks_stairs", "tile.sandy_bricks_stairs.name",),
-    ("quark:sandy_bricks_wall", "tile.sandy_bricks_wall.name",),
-    ("quark:smoker", "tile.smoker.name",),
-    ("quark:snow_bricks", "tile.snow_bricks.name",),
-    ("quark:snow_bricks_slab", "tile.snow_bricks_slab.name",),
-    ("quark:snow_bricks_slab_double", "tile.snow_bricks_slab_double.name",),
-    ("quark:snow_bricks_stairs", "tile.snow_bricks_stairs.name",),
-    ("quark:snow_bricks_wall", "tile.snow_bricks_wall.name",),
-    ("quark:soul_sandstone", "tile.soul_sandstone.name",),
-    ("quark:soul_sandstone_bricks_slab", "tile.soul_sandstone_bricks_slab.name",),
-    ("quark:soul_sandstone_bricks_slab_double", "tile.soul_sandstone_bricks_slab_double.name",),
-    ("quark:soul_sandstone_bricks_stairs", "tile.soul_sandstone_bricks_stairs.name",),
-    ("quark:soul_sandstone_slab", "tile.soul_sandstone_slab.name",),
-    ("quark:soul_sandstone_slab_double", "tile.soul_sandstone_slab_double.name",),
-    ("quark:soul_sandstone_smooth_slab", "tile.soul_sandstone_smooth_slab.name",),
-    ("quark:soul_sandstone_smooth_slab_double", "tile.soul_sandstone_smooth_slab_double.name",),
-    ("quark:soul_sandstone_stairs", "tile.soul_sandstone_stairs.name",),
-    ("quark:soul_sandstone_wall", "tile.soul_sandstone_wall.name",),
-    ("quark:spruce_trapdoor", "tile.spruce_trapdoor.name",),
-    ("quark:stained_clay_tiles", "tile.stained_clay_tiles.name",),
-    ("quark:stained_clay_tiles_black_slab", "tile.stained_clay_tiles_black_slab.name",),
-    ("quark:stained_clay_tiles_black_slab_double", "tile.stained_clay_tiles_black_slab_double.name",),
-    ("quark:stained_clay_tiles_black_stairs", "tile.stained_clay_tiles_black_stairs.name",),
-    ("quark:stained_clay_tiles_blue_slab", "tile.stained_clay_tiles_blue_slab.name",),
-    ("quark:stained_clay_tiles_blue_slab_double", "tile.stained_clay_tiles_blue_slab_double.name",),
-    ("quark:stained_clay_tiles_blue_stairs", "tile.stained_clay_tiles_blue_stairs.name",),
-    ("quark:stained_clay_tiles_brown_slab", "tile.stained_clay_tiles_brown_slab.name",),
-    ("quark:stained_clay_tiles_brown_slab_double", "tile.stained_clay_tiles_brown_slab_double.name",),
-    ("quark:stained_clay_tiles_brown_stairs", "tile.stained_clay_tiles_brown_stairs.name",),
-    ("quark:stained_clay_tiles_cyan_slab", "tile.stained_clay_tiles_cyan_slab.name",),
-    ("quark:stained_clay_tiles_cyan_slab_double", "tile.stained_clay_tiles_cyan_slab_double.name",),
-    ("quark:stained_clay_tiles_cyan_stairs", "tile.stained_clay_tiles_cyan_stairs.name",),
-    ("quark:stained_clay_tiles_gray_slab", "tile.stained_clay_tiles_gray_slab.name",),
-    ("quark:stained_clay_tiles_gray_slab_double", "tile.stained_clay_tiles_gray_slab_double.name",),
-    ("quark:stained_clay_tiles_gray_stairs", "tile.stained_clay_tiles_gray_stairs.name",),
-    ("quark:stained_clay_tiles_green_slab", "tile.stained_clay_tiles_green_slab.name",),
-    ("quark:stained_clay_tiles_green_slab_double", "tile.stained_clay_tiles_green_slab_double.name",),
-    ("quark:stained_clay_tiles_green_stairs", "tile.stained_clay_tiles_green_stairs.name",),
-    ("quark:stained_clay_tiles_light_blue_slab", "tile.stained_clay_tiles_light_blue_slab.name",),
-    ("quark:stained_clay_tiles_light_blue_slab_double", "tile.stained_clay_tiles_light_blue_slab_double.name",),
-    ("quark:stained_clay_tiles_light_blue_stairs", "tile.stained_clay_tiles_light_blue_stairs.name",),
-    ("quark:stained_clay_tiles_lime_slab", "tile.stained_clay_tiles_lime_slab.name",),
-    ("quark:stained_clay_tiles_lime_slab_double", "tile.stained_clay_tiles_lime_slab_double.name",),
-    ("quark:stained_clay_tiles_lime_stairs", "tile.stained_clay_tiles_lime_stairs.name",),
-    ("quark:stained_clay_tiles_magenta_slab", "tile.stained_clay_tiles_magenta_slab.name",),
-    ("quark:stained_clay_tiles_magenta_slab_double", "tile.stained_clay_tiles_magenta_slab_double.name",),
-    ("quark:stained_clay_tiles_magenta_stairs", "tile.stained_clay_tiles_magenta_stairs.name",),
-    ("quark:stained_clay_tiles_orange_slab", "tile.stained_clay_tiles_orange_slab.name",),
-    ("quark:stained_clay_tiles_orange_slab_double", "tile.stained_clay_tiles_orange_slab_double.name",),
-    ("quark:stained_clay_tiles_orange_stairs", "tile.stained_clay_tiles_orange_stairs.name",),
-    ("quark:stained_clay_tiles_pink_slab", "tile.stained_clay_tiles_pink_slab.name",),
-    ("quark:stained_clay_tiles_pink_slab_double", "tile.stained_clay_tiles_pink_slab_double.name",),
-    ("quark:stained_clay_tiles_pink_stairs", "tile.stained_clay_tiles_pink_stairs.name",),
-    ("quark:stained_clay_tiles_purple_slab", "tile.stained_clay_tiles_purple_slab.name",),
-    ("quark:stained_clay_tiles_purple_slab_double", "tile.stained_clay_tiles_purple_slab_double.name",),
-    ("quark:stained_clay_tiles_purple_stairs", "tile.stained_clay_tiles_purple_stairs.name",),
-    ("quark:stained_clay_tiles_red_slab", "tile.stained_clay_tiles_red_slab.name",),
-    ("quark:stained_clay_tiles_red_slab_double", "tile.stained_clay_tiles_red_slab_double.name",),
-    ("quark:stained_clay_tiles_red_stairs", "tile.stained_clay_tiles_red_stairs.name",),
-    ("quark:stained_clay_tiles_silver_slab", "tile.stained_clay_tiles_silver_slab.name",),
-    ("quark:stained_clay_tiles_silver_slab_double", "tile.stained_clay_tiles_silver_slab_double.name",),
-    ("quark:stained_clay_tiles_silver_stairs", "tile.stained_clay_tiles_silver_stairs.name",),
-    ("quark:stained_clay_tiles_white_slab", "tile.stained_clay_tiles_white_slab.name",),
-    ("quark:stained_clay_tiles_white_slab_double", "tile.stained_clay_tiles_white_slab_double.name",),
-    ("quark:stained_clay_tiles_white_stairs", "tile.stained_clay_tiles_white_stairs.name",),
-    ("quark:stained_clay_tiles_yellow_slab", "tile.stained_clay_tiles_yellow_slab.name",),
-    ("quark:stained_clay_tiles_yellow_slab_double", "tile.stained_clay_tiles_yellow_slab_double.name",),
-    ("quark:stained_clay_tiles_yellow_stairs", "tile.stained_clay_tiles_yellow_stairs.name",),
-    ("quark:stained_planks", "tile.stained_planks.name",),
-    ("quark:stained_planks_black_slab", "tile.stained_planks_black_slab.name",),
-    ("quark:stained_planks_black_slab_double", "tile.stained_planks_black_slab_double.name",),
-    ("quark:stained_planks_black_stairs", "tile.stained_planks_black_stairs.name",),
-    ("quark:stained_planks_blue_slab", "tile.stained_planks_blue_slab.name",),
-    ("quark:stained_planks_blue_slab_double", "tile.stained_planks_blue_slab_double.name",),
-    ("quark:stained_planks_blue_stairs", "tile.stained_planks_blue_stairs.name",),
-    ("quark:stained_planks_brown_slab", "tile.stained_planks_brown_slab.name",),
-    ("quark:stained_planks_brown_slab_double", "tile.stained_planks_brown_slab_double.name",),
-    ("quark:stained_planks_brown_stairs", "tile.stained_planks_brown_stairs.name",),
-    ("quark:stained_planks_cyan_slab", "tile.stained_planks_cyan_slab.name",),
-    ("quark:stained_planks_cyan_slab_double", "tile.stained_planks_cyan_slab_double.name",),
-    ("quark:stained_planks_cyan_stairs", "tile.stained_planks_cyan_stairs.name",),
-    ("quark:stained_planks_gray_slab", "tile.stained_planks_gray_slab.name",),
-    ("quark:stained_planks_gray_slab_double", "tile.stained_planks_gray_slab_double.name",),
-    ("quark:stained_planks_gray_stairs", "tile.stained_planks_gray_stairs.name",),
-    ("quark:stained_planks_green_slab", "tile.stained_planks_green_slab.name",),
-    ("quark:stained_planks_green_slab_double", "tile.stained_planks_green_slab_double.name",),
-    ("quark:stained_planks_green_stairs", "tile.stained_planks_green_stairs.name",),
-    ("quark:stained_planks_light_blue_slab", "tile.stained_planks_light_blue_slab.name",),
-    ("quark:stained_planks_light_blue_slab_double", "tile.stained_planks_light_blue_slab_double.name",),
-    ("quark:stained_planks_light_blue_stairs", "tile.stained_planks_light_blue_stairs.name",),
-    ("quark:stained_planks_lime_slab", "tile.stained_planks_lime_slab.name",),
-    ("quark:stained_planks_lime_slab_double", "tile.stained_planks_lime_slab_double.name",),
-    ("quark:stained_planks_lime_stairs", "tile.stained_planks_lime_stairs.name",),
-    ("quark:stained_planks_magenta_slab", "tile.stained_planks_magenta_slab.name",),
-    ("quark:stained_planks_magenta_slab_double", "tile.stained_planks_magenta_slab_double.name",),
-    ("quark:stained_planks_magenta_stairs", "tile.stained_planks_magenta_stairs.name",),
-    ("quark:stained_planks_orange_slab", "tile.stained_planks_orange_slab.name",),
-    ("quark:stained_planks_orange_slab_double", "tile.stained_planks_orange_slab_double.name",),
-    ("quark:stained_planks_orange_stairs", "tile.stained_planks_orange_stairs.name",),
-    ("quark:stained_planks_pink_slab", "tile.stained_planks_pink_slab.name",),
-    ("quark:stained_planks_pink_slab_double", "tile.stained_planks_pink_slab_double.name",),
-    ("quark:stained_planks_pink_stairs", "tile.stained_planks_pink_stairs.name",),
-    ("quark:stained_planks_purple_slab", "tile.stained_planks_purple_slab.name",),
-    ("quark:stained_planks_purple_slab_double", "tile.stained_planks_purple_slab_double.name",),
-    ("quark:stained_planks_purple_stairs", "tile.stained_planks_purple_stairs.name",),
-    ("quark:stained_planks_red_slab", "tile.stained_planks_red_slab.name",),
-    ("quark:stained_planks_red_slab_double", "tile.stained_planks_red_slab_double.name",),
-    ("quark:stained_planks_red_stairs", "tile.stained_planks_red_stairs.name",),
-    ("quark:stained_planks_silver_slab", "tile.stained_planks_silver_slab.name",),
-    ("quark:stained_planks_silver_slab_double", "tile.stained_planks_silver_slab_double.name",),
-    ("quark:stained_planks_silver_stairs", "tile.stained_planks_silver_stairs.name",),
-    ("quark:stained_planks_white_slab", "tile.stained_planks_white_slab.name",),
-    ("quark:stained_planks_white_slab_double", "tile.stained_planks_white_slab_double.name",),
-    ("quark:stained_planks_white_stairs", "tile.stained_planks_white_stairs.name",),
-    ("quark:stained_planks_yellow_slab", "tile.stained_planks_yellow_slab.name",),
-    ("quark:stained_planks_yellow_slab_double", "tile.stained_planks_yellow_slab_double.name",),
-    ("quark:stained_planks_yellow_stairs", "tile.stained_planks_yellow_stairs.name",),
-    ("quark:stone_andesite_bricks_slab", "tile.stone_andesite_bricks_slab.name",),
-    ("quark:stone_andesite_bricks_slab_double", "tile.stone_andesite_bricks_slab_double.name",),
-    ("quark:stone_andesite_bricks_stairs", "tile.stone_andesite_bricks_stairs.name",),
-    ("quark:stone_andesite_bricks_wall", "tile.stone_andesite_bricks_wall.name",),
-    ("quark:stone_andesite_slab", "tile.stone_andesite_slab.name",),
-    ("quark:stone_andesite_slab_double", "tile.stone_andesite_slab_double.name",),
-    ("quark:stone_andesite_stairs", "tile.stone_andesite_stairs.name",),
-    ("quark:stone_andesite_wall", "tile.stone_andesite_wall.name",),
-    ("quark:stone_basalt_bricks_slab", "tile.stone_basalt_bricks_slab.name",),
-    ("quark:stone_basalt_bricks_slab_double", "tile.stone_basalt_bricks_slab_double.name",),
-    ("quark:stone_basalt_bricks_stairs", "tile.stone_basalt_bricks_stairs.name",),
-    ("quark:stone_basalt_bricks_wall", "tile.stone_basalt_bricks_wall.name",),
-    ("quark:stone_basalt_slab", "tile.stone_basalt_slab.name",),
-    ("quark:stone_basalt_slab_double", "tile.stone_basalt_slab_double.name",),
-    ("quark:stone_basalt_stairs", "tile.stone_basalt_stairs.name",),
-    ("quark:stone_diorite_bricks_slab", "tile.stone_diorite_bricks_slab.name",),
-    ("quark:stone_diorite_bricks_slab_double", "tile.stone_diorite_bricks_slab_double.name",),
-    ("quark:stone_diorite_bricks_stairs", "tile.stone_diorite_bricks_stairs.name",),
-    ("quark:stone_diorite_bricks_wall", "tile.stone_diorite_bricks_wall.name",),
-    ("quark:stone_diorite_slab", "tile.stone_diorite_slab.name",),
-    ("quark:stone_diorite_slab_double", "tile.stone_diorite_slab_double.name",),
-    ("quark:stone_diorite_stairs", "tile.stone_diorite_stairs.name",),
-    ("quark:stone_diorite_wall", "tile.stone_diorite_wall.name",),
-    ("quark:stone_granite_bricks_slab", "tile.stone_granite_bricks_slab.name",),
-    ("quark:stone_granite_bricks_slab_double", "tile.stone_granite_bricks_slab_double.name",),
-    ("quark:stone_granite_bricks_stairs", "tile.stone_granite_bricks_stairs.name",),
-    ("quark:stone_granite_bricks_wall", "tile.stone_granite_bricks_wall.name",),
-    ("quark:stone_granite_slab", "tile.stone_granite_slab.name",),
-    ("quark:stone_granite_slab_double", "tile.stone_granite_slab_double.name",),
-    ("quark:stone_granite_stairs", "tile.stone_granite_stairs.name",),
-    ("quark:stone_granite_wall", "tile.stone_granite_wall.name",),
-    ("quark:stone_limestone_bricks_slab", "tile.stone_limestone_bricks_slab.name",),
-    ("quark:stone_limestone_bricks_slab_double", "tile.stone_limestone_bricks_slab_double.name",),
-    ("quark:stone_limestone_bricks_stairs", "tile.stone_limestone_bricks_stairs.name",),
-    ("quark:stone_limestone_bricks_wall", "tile.stone_limestone_bricks_wall.name",),
-    ("quark:stone_limestone_slab", "tile.stone_limestone_slab.name",),
-    ("quark:stone_limestone_slab_double", "tile.stone_limestone_slab_double.name",),
-    ("quark:stone_limestone_stairs", "tile.stone_limestone_stairs.name",),
-    ("quark:stone_marble_bricks_slab", "tile.stone_marble_bricks_slab.name",),
-    ("quark:stone_marble_bricks_slab_double", "tile.stone_marble_bricks_slab_double.name",),
-    ("quark:stone_marble_bricks_stairs", "tile.stone_marble_bricks_stairs.name",),
-    ("quark:stone_marble_bricks_wall", "tile.stone_marble_bricks_wall.name",),
-    ("quark:stone_marble_slab", "tile.stone_marble_slab.name",),
-    ("quark:stone_marble_slab_double", "tile.stone_marble_slab_double.name",),
-    ("quark:stone_marble_stairs", "tile.stone_marble_stairs.name",),
-    ("quark:stone_stairs", "tile.stone_stairs.name",),
-    ("quark:stone_wall", "tile.stone_wall.name",),
-    ("quark:stonebrick_wall", "tile.stonebrick_wall.name",),
-    ("quark:sturdy_stone", "tile.sturdy_stone.name",),
-    ("quark:thatch", "Thatch",),
-    ("quark:thatch_slab", "tile.thatch_slab.name",),
-    ("quark:thatch_slab_double", "tile.thatch_slab_double.name",),
-    ("quark:thatch_stairs", "tile.thatch_stairs.name",),
-    ("quark:vertical_planks", "tile.vertical_planks.name",),
-    ("quark:vertical_stained_planks", "tile.vertical_stained_planks.name",),
-    ("quark:world_stone_bricks", "tile.world_stone_bricks.name",),
-    ("rangedpumps:pump", "Pump",),
-    ("realfilingcabinet:manacabinet", "Mana Cabinet",),
-    ("realfilingcabinet:modelcabinet", "Filing Cabinet",),
-    ("rebornstorage:multicrafter", "tile.rebornstorage.multicrafter.name",),
-    ("redstonearsenal:storage", "tile.redstonearsenal.storage.name",),
-    ("refinedstorage:cable", "Cable",),
-    ("refinedstorage:constructor", "Constructor",),
-    ("refinedstorage:controller", "block.refinedstorage:controller.name",),
-    ("refinedstorage:crafter", "Crafter",),
-    ("refinedstorage:crafting_monitor", "Crafting Monitor",),
-    ("refinedstorage:destructor", "Destructor",),
-    ("refinedstorage:detector", "Detector",),
-    ("refinedstorage:disk_drive", "Disk Drive",),
-    ("refinedstorage:disk_manipulator", "Disk Manipulator",),
-    ("refinedstorage:exporter", "Exporter",),
-    ("refinedstorage:external_storage", "External Storage",),
-    ("refinedstorage:fluid_interface", "Fluid Interface",),
-    ("refinedstorage:fluid_storage", "block.refinedstorage:fluid_storage.name",),
-    ("refinedstorage:grid", "block.refinedstorage:grid.name",),
-    ("refinedstorage:importer", "Importer",),
-    ("refinedstorage:interface", "Interface",),
-    ("refinedstorage:machine_casing", "Machine Casing",),
-    ("refinedstorage:network_receiver", "Network Receiver",),
-    ("refinedstorage:network_transmitter", "Network Transmitter",),
-    ("refinedstorage:portable_grid", "block.refinedstorage:portable_grid.name",),
-    ("refinedstorage:quartz_enriched_iron_block", "Block of Quartz Enriched Iron",),
-    ("refinedstorage:reader", "Reader",),
-    ("refinedstorage:relay", "Relay",),
-    ("refinedstorage:security_manager", "Security Manager",),
-    ("refinedstorage:solderer", "Solderer",),
-    ("refinedstorage:storage", "block.refinedstorage:storage.name",),
-    ("refinedstorage:storage_monitor", "Storage Monitor",),
-    ("refinedstorage:wireless_transmitter", "Wireless Transmitter",),
-    ("refinedstorage:writer", "Writer",),
-    ("refinedstorageaddons:infinite_wireless_transmitter", "Infinite Wireless Transmitter",),
-    ("rftools:analog_block", "Analog",),
-    ("rftools:block_protector", "Block Protector",),
-    ("rftools:booster", "Booster",),
-    ("rftools:builder", "Builder",),
-    ("rftools:camo_shield_block", "Camo Shield Block",),
-    ("rftools:coalgenerator", "Coal Generator",),
-    ("rftools:composer", "Composer",),
-    ("rftools:counter_block", "Counter",),
-    ("rftools:crafter1", "Crafter Tier 1",),
-    ("rftools:crafter2", "Crafter Tier 2",),
-    ("rftools:crafter3", "Crafter Tier 3",),
-    ("rftools:creative_screen", "Creative Screen",),
-    ("rftools:destination_analyzer", "Destination Analyzer",),
-    ("rftools:dialing_device", "Dialing Device",),
-    ("rftools:digit_block", "Digit",),
-    ("rftools:dimensional_shard_ore", "Dimensional Shard Ore",),
-    ("rftools:elevator", "Elevator",),
-    ("rftools:ender_monitor", "Ender Monitor",),
-    ("rftools:endergenic", "Endergenic Generator",),
-    ("rftools:environmental_controller", "Environmental Controller",),
-    ("rftools:invchecker_block", "Inventory Checker",),
-    ("rftools:invisible_shield_block", "Invisible Shield Block",),
-    ("rftools:item_filter", "Item Filter",),
-    ("rftools:level_emitter", "Level Emitter",),
-    ("rftools:liquid_monitor", "Liquid Monitor",),
-    ("rftools:locator", "Locator",),
-    ("rftools:logic_block", "Logic Gate",),
-    ("rftools:machine_base", "Machine Base",),
-    ("rftools:machine_frame", "Machine Frame",),
-    ("rftools:machine_infuser", "Machine Infuser",),
-    ("rftools:matter_beamer", "Matter Beamer",),
-    ("rftools:matter_booster", "Matter Booster",),
-    ("rftools:matter_receiver", "Matter Receiver",),
-    ("rftools:matter_transmitter", "Matter Transmitter",),
-    ("rftools:modular_storage", "Modular Storage",),
-    ("rftools:notick_camo_shield_block", "Camo Shield Block",),
-    ("rftools:notick_invisible_shield_block", "Invisible Shield Block",),
-    ("rftools:notick_solid_shield_block", "Solid Shield Block",),
-    ("rftools:pearl_injector", "Pearl Injector",),
-    ("rftools:powercell", "Powercell",),
-    ("rftools:powercell_advanced", "Advanced Powercell",),
-    ("rftools:powercell_creative", "Creative Powercell",),
-    ("rftools:powercell_simple", "Simple Powercell",),
-    ("rftools:projector", "Projector",),
-    ("rftools:redstone_receiver_block", "Redstone Receiver",),
-    ("rftools:redstone_transmitter_block", "Redstone Transmitter",),
-    ("rftools:relay", "Power Relay",),
-    ("rftools:remote_scanner", "Remote Scanner",),
-    ("rftools:remote_storage", "Remote Storage",),
-    ("rftools:rf_monitor", "RF Monitor",),
-    ("rftools:scanner", "Scanner",),
-    ("rftools:screen", "Screen",),
-    ("rftools:screen_controller", "Screen Controller",),
-    ("rftools:screen_hitblock", "Screen",),
-    ("rftools:security_manager", "Security Manager",),
-    ("rftools:sensor_block", "Sensor",),
-    ("rftools:sequencer_block", "Sequencer",),
-    ("rftools:shield_block1", "Shield Projector Tier 1",),
-    ("rftools:shield_block2", "Shield Projector Tier 2",),
-    ("rftools:shield_block3", "Shield Projector Tier 3",),
-    ("rftools:shield_block4", "Shield Projector Tier 4",),
-    ("rftools:shield_template_block", "Shield Template",),
-    ("rftools:simple_dialer", "Simple Dialer",),
-    ("rftools:solid_shield_block", "Solid Shield Block",),
-    ("rftools:space_chamber", "Space Chamber Corner Block",),
-    ("rftools:space_chamber_controller", "Space Chamber Controller Block",),
-    ("rftools:spawner", "Spawner",),
-    ("rftools:storage_scanner", "Storage Scanner",),
-    ("rftools:storage_terminal", "Storage Terminal",),
-    ("rftools:support_block", "Support Block",),
-    ("rftools:timer_block", "Timer",),
-    ("rftools:wire_block", "Wire",),
-    ("rftoolscontrol:craftingstation", "Crafting Station",),
-    ("rftoolscontrol:node", "Node",),
-    ("rftoolscontrol:processor", "Processor",),
-    ("rftoolscontrol:programmer", "Programmer",),
-    ("rftoolscontrol:tank", "Multi Tank",),
-    ("rftoolscontrol:workbench", "Workbench",),
-    ("rftoolsdim:activity_probe", "Activity Probe",),
-    ("rftoolsdim:biome_absorber", "Biome Absorber",),
-    ("rftoolsdim:dimension_builder", "Dimension Builder",),
-    ("rftoolsdim:dimension_editor", "Dimension Editor",),
-    ("rftoolsdim:dimension_enscriber", "Dimension Enscriber",),
-    ("rftoolsdim:dimensional_blank_block", "Dimensional Blank Block",),
-    ("rftoolsdim:dimensional_block", "Dimensional Block",),
-    ("rftoolsdim:dimensional_cross2_block", "Dimensional Cross 2 Block",),
-    ("rftoolsdim:dimensional_cross_block", "Dimensional Cross Block",),
-    ("rftoolsdim:dimensional_pattern1_block", "Dimensional Pattern 1 Block",),
-    ("rftoolsdim:dimensional_pattern2_block", "Dimensional Pattern 2 Block",),
-    ("rftoolsdim:dimensional_small_blocks", "Dimensional Small Blocks",),
-    ("rftoolsdim:dimlet_workbench", "Dimlet Workbench",),
-    ("rftoolsdim:energy_extractor", "Energy Extractor",),
-    ("rftoolsdim:fake_gravel", "levarG",),
-    ("rftoolsdim:fake_sand", "dnaS",),
-    ("rftoolsdim:fake_water", "retaW",),
-    ("rftoolsdim:feature_absorber", "Feature Absorber",),
-    ("rftoolsdim:liquid_absorber", "Liquid Absorber",),
-    ("rftoolsdim:material_absorber", "Material Absorber",),
-    ("rftoolsdim:terrain_absorber", "Terrain Absorber",),
-    ("rftoolsdim:time_absorber", "Time Absorber",),
-    ("rftoolspower:cell1", "Powercell (Low)",),
-    ("rftoolspower:cell2", "Powercell (Medium)",),
-    ("rftoolspower:cell3", "Powercell (High)",),
-    ("rftoolspower:information_screen", "Information Screen",),
-    ("roots:aubergine", "Aubergine",),
-    ("roots:bonfire", "Pyre",),
-    ("roots:chiseled_runestone", "Chiseled Runestone",),
-    ("roots:fairy_dust", "Fairy Dust",),
-    ("roots:imbuer", "Imbuer",),
-    ("roots:moonglow", "Moonglow",),
-    ("roots:mortar", "Mortar",),
-    ("roots:offertory_plate", "Offering Plate",),
-    ("roots:pereskia", "Pereskia Flower",),
-    ("roots:runestone", "Runestone",),
-    ("roots:runestone_brick", "Runestone Brick",),
-    ("roots:spirit_herb", "Spirit Herb",),
-    ("roots:structure_marker", "tile.structure_marker.name",),
-    ("roots:terra_moss", "Terra Moss",),
-    ("roots:thatch", "Thatch",),
-    ("roots:wildroot", "Wildroot",),
-    ("rustic:ale_wort", "Ale Wort",),
-    ("rustic:aloe_vera", "Aloe Vera",),
-    ("rustic:andesite_pillar", "Andesite Pillar",),
-    ("rustic:apiary", "Apiary",),
-    ("rustic:apple_juice", "Apple Juice",),
-    ("rustic:apple_seeds", "Apple Seeds",),
-    ("rustic:barrel", "Barrel",),
-    ("rustic:beehive", "Beehive",),
-    ("rustic:blood_orchid", "Blood Orchid",),
-    ("rustic:brewing_barrel", "Brewing Barrel",),
-    ("rustic:cabinet", "Cabinet",),
-    ("rustic:candle", "Candle",),
-    ("rustic:chain", "Iron Chain",),
-    ("rustic:chair_acacia", "Acacia Chair",),
-    ("rustic:chair_big_oak", "Dark Oak Chair",),
-    ("rustic:chair_birch", "Birch Chair",),
-    ("rustic:chair_ironwood", "Ironwood Chair",),
-    ("rustic:chair_jungle", "Jungle Chair",),
-    ("rustic:chair_oak", "Oak Chair",),
-    ("rustic:chair_olive", "Olive Wood Chair",),
-    ("rustic:chair_spruce", "Spruce Chair",),
-    ("rustic:chamomile", "Chamomile",),
-    ("rustic:chandelier", "Chandelier Ring",),
-    ("rustic:chili_crop", "Chili Crop",),
-    ("rustic:clay_wall", "Clay Wall",),
-    ("rustic:clay_wall_cross", "Crossed Clay Wall",),
-    ("rustic:clay_wall_diag", "Diagonal Clay Wall",),
-    ("rustic:cloudsbluff", "Cloudsbluff",),
-    ("rustic:cohosh", "Cohosh",),
-    ("rustic:condenser", "Alchemic Condenser",),
-    ("rustic:condenser_advanced", "Advanced Alchemic Condenser",),
-    ("rustic:core_root", "Core Root",),
-    ("rustic:crop_stake", "Wooden Stake",),
-    ("rustic:crushing_tub", "Crushing Tub",),
-    ("rustic:deathstalk_mushroom", "Deathstalk Mushroom",),
-    ("rustic:diorite_pillar", "Diorite Pillar",),
-    ("rustic:evaporating_basin", "Drying Basin",),
-    ("rustic:fence_gate_ironwood", "Ironwood Fence Gate",),
-    ("rustic:fence_gate_olive", "Olive Wood Fence Gate",),
-    ("rustic:fence_ironwood", "Ironwood Fence",),
-    ("rustic:fence_olive", "Olive Wood Fence",),
-    ("rustic:fertile_soil", "Fertile Soil",),
-    ("rustic:gargoyle", "Gargoyle",),
-    ("rustic:ginseng", "Ginseng",),
-    ("rustic:granite_pillar", "Granite Pillar",),
-    ("rustic:grape_juice", "Grape Juice",),
-    ("rustic:grape_leaves", "Grape Leaves",),
-    ("rustic:grape_stem", "Grape Seeds",),
-    ("rustic:honey", "Honey",),
-    ("rustic:horsetail", "Horsetail",),
-    ("rustic:iron_lantern", "Iron Lantern",),
-    ("rustic:iron_lattice", "Iron Lattice",),
-    ("rustic:ironberry_juice", "Ironberry Juice",),
-    ("rustic:ironwood_door", "item.rustic.ironwood_door.name",),
-    ("rustic:ironwood_doubleslab", "tile.rustic.ironwood_doubleslab.name",),
-    ("rustic:ironwood_slab", "Ironwood Slab",),
-    ("rustic:leaves", "tile.rustic.leaves.name",),
-    ("rustic:leaves_apple", "Apple Leaves",),
-    ("rustic:liquid_barrel", "Liquid Barrel",),
-    ("rustic:log", "tile.rustic.log.name",),
-    ("rustic:marsh_mallow", "Marsh Mallow",),
-    ("rustic:mooncap_mushroom", "Mooncap Mushroom",),
-    ("rustic:olive_door", "item.rustic.olive_door.name",),
-    ("rustic:olive_doubleslab", "tile.rustic.olive_doubleslab.name",),
-    ("rustic:olive_oil", "Olive Oil",),
-    ("rustic:olive_slab", "Olive Wood Slab",),
-    ("rustic:painted_wood_black", "Black Painted Wood",),
-    ("rustic:painted_wood_blue", "Blue Painted Wood",),
-    ("rustic:painted_wood_brown", "Brown Painted Wood",),
-    ("rustic:painted_wood_cyan", "Cyan Painted Wood",),
-    ("rustic:painted_wood_gray", "Gray Painted Wood",),
-    ("rustic:painted_wood_green", "Green Painted Wood",),
-    ("rustic:painted_wood_light_blue", "Light Blue Painted Wood",),
-    ("rustic:painted_wood_lime", "Lime Painted Wood",),
-    ("rustic:painted_wood_magenta", "Magenta Painted Wood",),
-    ("rustic:painted_wood_orange", "Orange Painted Wood",),
-    ("rustic:painted_wood_pink", "Pink Painted Wood",),
-    ("rustic:painted_wood_purple", "Purple Painted Wood",),
-    ("rustic:painted_wood_red", "Red Painted Wood",),
-    ("rustic:painted_wood_silver", "Light Gray Painted Wood",),
-    ("rustic:painted_wood_white", "White Painted Wood",),
-    ("rustic:painted_wood_yellow", "Yellow Painted Wood",),
-    ("rustic:planks", "tile.rustic.planks.name",),
-    ("rustic:retort", "Alchemic Retort",),
-    ("rustic:retort_advanced", "Advanced Alchemic Retort",),
-    ("rustic:rope", "Rope",),
-    ("rustic:sapling", "tile.rustic.sapling.name",),
-    ("rustic:sapling_apple", "Apple Sapling",),
-    ("rustic:slate", "Slate",),
-    ("rustic:slate_brick", "Slate Brick",),
-    ("rustic:slate_brick_doubleslab", "tile.rustic.slate_brick_doubleslab.name",),
-    ("rustic:slate_brick_slab", "Slate Brick Slab",),
-    ("rustic:slate_chiseled", "Chiseled Slate",),
-    ("rustic:slate_pillar", "Slate Pillar",),
-    ("rustic:slate_roof", "Slate Roof",),
-    ("rustic:slate_roof_doubleslab", "tile.rustic.slate_roof_doubleslab.name",),
-    ("rustic:slate_roof_slab", "Slate Roof Slab",),
-    ("rustic:slate_tile", "Slate Tile",),
-    ("rustic:stairs_ironwood", "Ironwood Stairs",),
-    ("rustic:stairs_olive", "Olive Wood Stairs",),
-    ("rustic:stairs_slate_brick", "Slate Brick Stairs",),
-    ("rustic:stairs_slate_roof", "Slate Roof Stairs",),
-    ("rustic:stake_tied", "Stake With Rope",),
-    ("rustic:stone_pillar", "Stone Pillar",),
-    ("rustic:table_acacia", "Acacia Table",),
-    ("rustic:table_big_oak", "Dark Oak Table",),
-    ("rustic:table_birch", "Birch Table",),
-    ("rustic:table_ironwood", "Ironwood Table",),
-    ("rustic:table_jungle", "Jungle Table",),
-    ("rustic:table_oak", "Oak Table",),
-    ("rustic:table_olive", "Olive Wood Table",),
-    ("rustic:table_spruce", "Spruce Table",),
-    ("rustic:tomato_crop", "Tomato Crop",),
-    ("rustic:vase", "Pot",),
-    ("rustic:wildberry_bush", "Wildberry Bush",),
-    ("rustic:wildberry_juice", "Wildberry Juice",),
-    ("rustic:wind_thistle", "Wind Thistle",),
-    ("soulshardstow:cage", "Soul Cage",),
-    ("stevescarts:blockactivator", "Module Toggler",),
-    ("stevescarts:blockadvdetector", "Advanced Detector Rail",),
-    ("stevescarts:blockcargomanager", "Cargo Manager",),
-    ("stevescarts:blockcartassembler", "Cart Assembler",),
-    ("stevescarts:blockdetector", "tile.SC2:BlockDetector.name",),
-    ("stevescarts:blockdistributor", "External Distributor",),
-    ("stevescarts:blockjunction", "Junction Rail",),
-    ("stevescarts:blockliquidmanager", "Liquid Manager",),
-    ("stevescarts:blockmetalstorage", "tile.SC2:BlockMetalStorage.name",),
-    ("stevescarts:upgrade", "tile.SC2:upgrade.name",),
-    ("storagedrawers:basicdrawers", "tile.storagedrawers.basicDrawers.name",),
-    ("storagedrawers:compdrawers", "Compacting Drawer",),
-    ("storagedrawers:controller", "Drawer Controller",),
-    ("storagedrawers:controllerslave", "Controller Slave",),
-    ("storagedrawers:customdrawers", "tile.storagedrawers.customDrawers.name",),
-    ("storagedrawers:customtrim", "Framed Trim",),
-    ("storagedrawers:framingtable", "Framing Table",),
-    ("storagedrawers:keybutton", "tile.storagedrawers.keyButton.name",),
-    ("storagedrawers:trim", "tile.storagedrawers.trim.name",),
-    ("storagedrawersextra:extra_drawers", "tile.extraDrawers.name",),
-    ("storagedrawersextra:extra_trim_0", "tile.extraTrim0.name",),
-    ("storagedrawersextra:extra_trim_1", "tile.extraTrim1.name",),
-    ("storagedrawersextra:extra_trim_2", "tile.extraTrim2.name",),
-    ("storagedrawersextra:extra_trim_3", "tile.extraTrim3.name",),
-    ("tconstruct:blood", "fluid.blood.name",),
-    ("tconstruct:blueslime", "Liquid Blue Slime",),
-    ("tconstruct:brownstone", "tile.tconstruct.brownstone.name",),
-    ("tconstruct:brownstone_slab", "tile.tconstruct.brownstone_slab.name",),
-    ("tconstruct:brownstone_slab2", "tile.tconstruct.brownstone_slab2.name",),
-    ("tconstruct:brownstone_stairs_brick", "Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_brick_cracked", "Cracked Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_brick_fancy", "Fancy Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_brick_small", "Small Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_brick_square", "Square Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_brick_triangle", "Triangle Brownstone Bricks Stairs",),
-    ("tconstruct:brownstone_stairs_creeper", "Brownstone Creeperface Stairs",),
-    ("tconstruct:brownstone_stairs_paver", "Brownstone Paver Stairs",),
-    ("tconstruct:brownstone_stairs_road", "Brownstone Road Stairs",),
-    ("tconstruct:brownstone_stairs_rough", "Rough Brownstone Stairs",),
-    ("tconstruct:brownstone_stairs_smooth", "Smooth Brownstone Stairs",),
-    ("tconstruct:brownstone_stairs_tile", "Brownstone Tile Stairs",),
-    ("tconstruct:casting", "tile.tconstruct.casting.name",),
-    ("tconstruct:channel", "Casting Channel",),
-    ("tconstruct:clear_glass", "Clear Glass",),
-    ("tconstruct:clear_stained_glass", "tile.tconstruct.clear_stained_glass.name",),
-    ("tconstruct:deco_ground", "tile.tconstruct.deco_ground.name",),
-    ("tconstruct:deco_ground_slab", "tile.tconstruct.deco_ground_slab.name",),
-    ("tconstruct:dried_brick_stairs", "Dried Bricks Stairs",),
-    ("tconstruct:dried_clay", "tile.tconstruct.dried_clay.name",),
-    ("tconstruct:dried_clay_slab", "tile.tconstruct.dried_clay_slab.name",),
-    ("tconstruct:dried_clay_stairs", "Dried Clay Stairs",),
-    ("tconstruct:faucet", "Faucet",),
-    ("tconstruct:firewood", "tile.tconstruct.firewood.name",),
-    ("tconstruct:firewood_slab", "tile.tconstruct.firewood_slab.name",),
-    ("tconstruct:firewood_stairs", "Firewood Stairs",),
-    ("tconstruct:glow", "Glow",),
-    ("tconstruct:lavawood_stairs", "Lavawood Stairs",),
-    ("tconstruct:metal", "tile.tconstruct.metal.name",),
-    ("tconstruct:milk", "fluid.milk.name",),
-    ("tconstruct:molten_alubrass", "Molten Aluminum Brass",),
-    ("tconstruct:molten_aluminum", "Molten Aluminum",),
-    ("tconstruct:molten_ardite", "Molten Ardite",),
-    ("tconstruct:molten_brass", "Molten Brass",),
-    ("tconstruct:molten_bronze", "Molten Bronze",),
-    ("tconstruct:molten_clay", "Molten Clay",),
-    ("tconstruct:molten_cobalt", "Molten Cobalt",),
-    ("tconstruct:molten_copper", "Molten Copper",),
-    ("tconstruct:molten_dirt", "Liquid Dirt",),
-    ("tconstruct:molten_electrum", "Molten Electrum",),
-    ("tconstruct:molten_emerald", "Molten Emerald",),
-    ("tconstruct:molten_glass", "fluid.glass.name",),
-    ("tconstruct:molten_gold", "Molten Gold",),
-    ("tconstruct:molten_iron", "Molten Iron",),
-    ("tconstruct:molten_knightslime", "Molten Knightslime",),
-    ("tconstruct:molten_lead", "Molten Lead",),
-    ("tconstruct:molten_manyullyn", "Molten Manyullyn",),
-    ("tconstruct:molten_nickel", "Molten Nickel",),
-    ("tconstruct:molten_obsidian", "Molten Obsidian",),
-    ("tconstruct:molten_pigiron", "Molten Pigiron",),
-    ("tconstruct:molten_silver", "Molten Silver",),
-    ("tconstruct:molten_steel", "Molten Steel",),
-    ("tconstruct:molten_stone", "Seared Stone",),
-    ("tconstruct:molten_tin", "Molten Tin",),
-    ("tconstruct:molten_zinc", "Molten Zinc",),
-    ("tconstruct:mudbrick_stairs", "Mud Bricks Stairs",),
-    ("tconstruct:ore", "tile.tconstruct.ore.name",),
-    ("tconstruct:punji", "Punji Sticks",),
-    ("tconstruct:purpleslime", "Liquid Purple Slime",),
-    ("tconstruct:rack", "tile.tconstruct.rack.name",),
-    ("tconstruct:seared", "tile.tconstruct.seared.name",),
-    ("tconstruct:seared_furnace_controller", "Seared Furnace Controller",),
-    ("tconstruct:seared_glass", "tile.tconstruct.seared_glass.name",),
-    ("tconstruct:seared_slab", "tile.tconstruct.seared_slab.name",),
-    ("tconstruct:seared_slab2", "tile.tconstruct.seared_slab2.name",),
-    ("tconstruct:seared_stairs_brick", "Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_brick_cracked", "Cracked Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_brick_fancy", "Fancy Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_brick_small", "Small Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_brick_square", "Square Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_brick_triangle", "Triangle Seared Bricks Stairs",),
-    ("tconstruct:seared_stairs_cobble", "Seared Cobblestone Stairs",),
-    ("tconstruct:seared_stairs_creeper", "Seared Creeperface Stairs",),
-    ("tconstruct:seared_stairs_paver", "Seared Paver Stairs",),
-    ("tconstruct:seared_stairs_road", "Seared Road Stairs",),
-    ("tconstruct:seared_stairs_stone", "Seared Stone Stairs",),
-    ("tconstruct:seared_stairs_tile", "Seared Tile Stairs",),
-    ("tconstruct:seared_tank", "tile.tconstruct.seared_tank.name",),
-    ("tconstruct:slime", "tile.tconstruct.slime.name",),
-    ("tconstruct:slime_channel", "tile.tconstruct.slime_channel.name",),
-    ("tconstruct:slime_congealed", "tile.tconstruct.slime_congealed.name",),
-    ("tconstruct:slime_dirt", "tile.tconstruct.slime_dirt.name",),
-    ("tconstruct:slime_grass", "tile.tconstruct.slime_grass.name",),
-    ("tconstruct:slime_grass_tall", "tile.tconstruct.slime_grass_tall.name",),
-    ("tconstruct:slime_leaves", "tile.tconstruct.slime_leaves.name",),
-    ("tconstruct:slime_sapling", "tile.tconstruct.slime_sapling.oak.name",),
-    ("tconstruct:slime_vine_blue", "Blue Slimy Vine",),
-    ("tconstruct:slime_vine_blue_end", "Blue Slimy Vine",),
-    ("tconstruct:slime_vine_blue_mid", "Blue Slimy Vine",),
-    ("tconstruct:slime_vine_purple", "Purple Slimy Vine",),
-    ("tconstruct:slime_vine_purple_end", "Purple Slimy Vine",),
-    ("tconstruct:slime_vine_purple_mid", "Purple Slimy Vine",),
-    ("tconstruct:smeltery_controller", "Smeltery Controller",),
-    ("tconstruct:smeltery_io", "tile.tconstruct.smeltery_io.name",),
-    ("tconstruct:soil", "tile.tconstruct.soil.name",),
-    ("tconstruct:stone_ladder", "Stone Ladder",),
-    ("tconstruct:stone_torch", "Stone Torch",),
-    ("tconstruct:tinker_tank_controller", "Tinker Tank Controller",),
-    ("tconstruct:toolforge", "Tool Forge",),
-    ("tconstruct:tooltables", "tile.tconstruct.tooltables.name",),
-    ("tconstruct:wood_rail", "Wooden Rail",),
-    ("tconstruct:wood_rail_trapdoor", "Wooden Rail with a Trapdoor",),
-    ("techreborn:adjustable_su", "Adjustable SU",),
-    ("techreborn:alarm", "Alarm",),
-    ("techreborn:alloy_smelter", "Alloy Smelter",),
-    ("techreborn:assembly_machine", "Assembling Machine",),
-    ("techreborn:auto_crafting_table", "Auto Crafting Table",),
-    ("techreborn:cable", "tile.techreborn:cable.name",),
-    ("techreborn:charge_o_mat", "Charge-O-Mat",),
-    ("techreborn:chemical_reactor", "Chemical Reactor",),
-    ("techreborn:chunk_loader", "Industrial Chunkloader",),
-    ("techreborn:compressor", "Compressor",),
-    ("techreborn:computer_cube", "Tech Reborn Computer Cube",),
-    ("techreborn:creative_solar_panel", "Creative Panel",),
-    ("techreborn:diesel_generator", "Diesel Generator",),
-    ("techreborn:digital_chest", "Digital Chest",),
-    ("techreborn:distillation_tower", "Distillation Tower",),
-    ("techreborn:dragon_egg_syphon", "Dragon Egg Energy Siphon",),
-    ("techreborn:electric_furnace", "Electric Furnace",),
-    ("techreborn:extractor", "Extractor",),
-    ("techreborn:fusion_coil", "Fusion Coil",),
-    ("techreborn:fusion_control_computer", "Fusion Control Computer",),
-    ("techreborn:gas_turbine", "Gas Turbine",),
-    ("techreborn:grinder", "Grinder",),
-    ("techreborn:high_voltage_su", "MFSU",),
-    ("techreborn:hv_transformer", "HV Transformer",),
-    ("techreborn:implosion_compressor", "Implosion Compressor",),
-    ("techreborn:industrial_blast_furnace", "Industrial Blast Furnace",),
-    ("techreborn:industrial_centrifuge", "Industrial Centrifuge",),
-    ("techreborn:industrial_electrolyzer", "Industrial Electrolyzer",),
-    ("techreborn:industrial_grinder", "Industrial Grinder",),
-    ("techreborn:industrial_sawmill", "Sawmill",),
-    ("techreborn:interdimensional_su", "Interdimensional SU",),
-    ("techreborn:iron_alloy_furnace", "Iron Alloy Furnace",),
-    ("techreborn:iron_furnace", "Iron Furnace",),
-    ("techreborn:lamp_incandescent", "Incandescent Lamp",),
-    ("techreborn:lamp_led", "LED Lamp",),
-    ("techreborn:lapotronic_su", "LESU Controller",),
-    ("techreborn:lightning_rod", "Lightning Rod",),
-    ("techreborn:low_voltage_su", "Battery Box",),
-    ("techreborn:lsu_storage", "LESU Storage",),
-    ("techreborn:lv_transformer", "LV Transformer",),
-    ("techreborn:machine_casing", "tile.techreborn:machine_casing.name",),
-    ("techreborn:machine_frame", "tile.techreborn:machine_frame.name",),
-    ("techreborn:magic_energy_absorber", "Magic Energy Absorber",),
-    ("techreborn:magic_energy_converter", "Magic Energy Converter",),
-    ("techreborn:matter_fabricator", "Matter Fabricator",),
-    ("techreborn:medium_voltage_su", "MFE",),
-    ("techreborn:mv_transformer", "MV Transformer",),
-    ("techreborn:nuke", "Nuke",),
-    ("techreborn:ore", "tile.techreborn:ore.name",),
-    ("techreborn:ore2", "tile.techreborn:ore2.name",),
-    ("techreborn:plasma_generator", "Plasma Generator",),
-    ("techreborn:player_detector", "tile.techreborn:player_detector.name",),
-    ("techreborn:quantum_chest", "Quantum Chest",),
-    ("techreborn:quantum_tank", "Quantum Tank",),
-    ("techreborn:recycler", "Recycler",),
-    ("techreborn:refined_iron_fence", "Iron Fence",),
-    ("techreborn:reinforced_glass", "Reinforced Glass",),
-    ("techreborn:rolling_machine", "Rolling Machine",),
-    ("techreborn:rubber_leaves", "Rubber Leaves",),
-    ("techreborn:rubber_log", "Rubber Wood",),
-    ("techreborn:rubber_planks", "Rubber Wood Planks",),
-    ("techreborn:rubber_sapling", "tile.techreborn:rubber_sapling.oak.name",),
-    ("techreborn:scrapboxinator", "Scrapbox-inator",),
-    ("techreborn:semi_fluid_generator", "Semi Fluid Generator",),
-    ("techreborn:solar_panel", "tile.techreborn:solar_panel.name",),
-    ("techreborn:solid_fuel_generator", "Generator",),
-    ("techreborn:storage", "tile.techreborn:storage.name",),
-    ("techreborn:storage2", "tile.techreborn:storage2.name",),
-    ("techreborn:techreborn_techreborn.berylium", "tile.techreborn.berylium.name",),
-    ("techreborn:techreborn_techreborn.calcium", "tile.techreborn.calcium.name",),
-    ("techreborn:techreborn_techreborn.calciumcarbonate", "tile.techreborn.calciumcarbonate.name",),
-    ("techreborn:techreborn_techreborn.carbon", "tile.techreborn.carbon.name",),
-    ("techreborn:techreborn_techreborn.carbonfiber", "tile.techreborn.carbonfiber.name",),
-    ("techreborn:techreborn_techreborn.chlorite", "tile.techreborn.chlorite.name",),
-    ("techreborn:techreborn_techreborn.compressedair", "tile.techreborn.compressedair.name",),
-    ("techreborn:techreborn_techreborn.deuterium", "tile.techreborn.deuterium.name",),
-    ("techreborn:techreborn_techreborn.diesel", "tile.techreborn.diesel.name",),
-    ("techreborn:techreborn_techreborn.electrolyzedwater", "tile.techreborn.electrolyzedwater.name",),
-    ("techreborn:techreborn_techreborn.glyceryl", "tile.techreborn.glyceryl.name",),
-    ("techreborn:techreborn_techreborn.helium", "tile.techreborn.helium.name",),
-    ("techreborn:techreborn_techreborn.helium3", "tile.techreborn.helium3.name",),
-    ("techreborn:techreborn_techreborn.heliumplasma", "tile.techreborn.heliumplasma.name",),
-    ("techreborn:techreborn_techreborn.hydrogen", "tile.techreborn.hydrogen.name",),
-    ("techreborn:techreborn_techreborn.lithium", "tile.techreborn.lithium.name",),
-    ("techreborn:techreborn_techreborn.mercury", "tile.techreborn.mercury.name",),
-    ("techreborn:techreborn_techreborn.methane", "tile.techreborn.methane.name",),
-    ("techreborn:techreborn_techreborn.nitrocarbon", "tile.techreborn.nitrocarbon.name",),
-    ("techreborn:techreborn_techreborn.nitrocoalfuel", "tile.techreborn.nitrocoalfuel.name",),
-    ("techreborn:techreborn_techreborn.nitrodiesel", "tile.techreborn.nitrodiesel.name",),
-    ("techreborn:techreborn_techreborn.nitrofuel", "tile.techreborn.nitrofuel.name",),
-    ("techreborn:techreborn_techreborn.nitrogen", "tile.techreborn.nitrogen.name",),
-    ("techreborn:techreborn_techreborn.nitrogendioxide", "tile.techreborn.nitrogendioxide.name",),
-    ("techreborn:techreborn_techreborn.oil", "tile.techreborn.oil.name",),
-    ("techreborn:techreborn_techreborn.potassium", "tile.techreborn.potassium.name",),
-    ("techreborn:techreborn_techreborn.silicon", "tile.techreborn.silicon.name",),
-    ("techreborn:techreborn_techreborn.sodium", "tile.techreborn.sodium.name",),
-    ("techreborn:techreborn_techreborn.sodiumpersulfate", "tile.techreborn.sodiumpersulfate.name",),
-    ("techreborn:techreborn_techreborn.sodiumsulfide", "tile.techreborn.sodiumsulfide.name",),
-    ("techreborn:techreborn_techreborn.sulfur", "tile.techreborn.sulfur.name",),
-    ("techreborn:techreborn_techreborn.sulfuricacid", "tile.techreborn.sulfuricacid.name",),
-    ("techreborn:techreborn_techreborn.tritium", "tile.techreborn.tritium.name",),
-    ("techreborn:techreborn_techreborn.wolframium", "tile.techreborn.wolframium.name",),
-    ("techreborn:thermal_generator", "Thermal Generator",),
-    ("techreborn:vacuum_freezer", "Vacuum Freezer",),
-    ("techreborn:water_mill", "Water Mill",),
-    ("techreborn:wind_mill", "Wind Mill",),
-    ("terraqueous:border", "Border",),
-    ("terraqueous:cloudfancy", "tile.terraqueous.cloudfancy.name",),
-    ("terraqueous:clouds", "tile.terraqueous.clouds.name",),
-    ("terraqueous:crafting", "tile.terraqueous.crafting.name",),
-    ("terraqueous:doodads", "tile.terraqueous.doodad.name",),
-    ("terraqueous:earth_ore", "tile.terraqueous.earthore.name",),
-    ("terraqueous:ender_table", "tile.terraqueous.endertable.name",),
-    ("terraqueous:flowerpot", "tile.terraqueous.flowerpot.name",),
-    ("terraqueous:flowers_cluster", "tile.terraqueous.flowercluster.name",),
-    ("terraqueous:flowers_single", "tile.terraqueous.flowersingle.name",),
-    ("terraqueous:foliage1", "tile.terraqueous.foliage.name",),
-    ("terraqueous:foliage2", "tile.terraqueous.foliage.name",),
-    ("terraqueous:foliage3", "tile.terraqueous.foliage.name",),
-    ("terraqueous:foliage4", "tile.terraqueous.foliage.name",),
-    ("terraqueous:foliage5", "tile.terraqueous.foliage.name",),
-    ("terraqueous:hay", "tile.terraqueous.hay.name",),
-    ("terraqueous:pergola", "tile.terraqueous.pergola.name",),
-    ("terraqueous:planks", "tile.terraqueous.planks.name",),
-    ("terraqueous:plants", "tile.terraqueous.plants.name",),
-    ("terraqueous:sapling", "tile.terraqueous.sapling.name",),
-    ("terraqueous:tall_grass", "tile.terraqueous.tallgrass.name",),
-    ("terraqueous:trunk1", "tile.terraqueous.trunk.name",),
-    ("terraqueous:trunk2", "tile.terraqueous.trunk.name",),
-    ("terraqueous:type_cloud", "tile.terraqueous.typecloud.name",),
-    ("terraqueous:type_earth", "tile.terraqueous.typeearth.name",),
-    ("thermalcultivation:soil", "tile.thermalcultivation.soil.name",),
-    ("thermaldynamics:duct_0", "tile.thermaldynamics.duct.name",),
-    ("thermaldynamics:duct_16", "tile.thermaldynamics.duct.name",),
-    ("thermaldynamics:duct_32", "tile.thermaldynamics.duct.name",),
-    ("thermaldynamics:duct_48", "tile.thermaldynamics.duct.name",),
-    ("thermaldynamics:duct_64", "tile.thermaldynamics.duct.name",),
-    ("thermalexpansion:apparatus", "tile.thermalexpansion.apparatus.name",),
-    ("thermalexpansion:cache", "tile.thermalexpansion.cache.name",),
-    ("thermalexpansion:cell", "tile.thermalexpansion.cell.name",),
-    ("thermalexpansion:device", "tile.thermalexpansion.device.name",),
-    ("thermalexpansion:dynamo", "tile.thermalexpansion.thermalexpansion.dynamo.name",),
-    ("thermalexpansion:machine", "tile.thermalexpansion.machine.name",),
-    ("thermalexpansion:strongbox", "tile.thermalexpansion.strongbox.name",),
-    ("thermalexpansion:tank", "tile.thermalexpansion.tank.name",),
-    ("thermalfoundation:fluid_aerotheum", "Zephyrean Aerotheum",),
-    ("thermalfoundation:fluid_crude_oil", "Crude Oil",),
-    ("thermalfoundation:fluid_cryotheum", "Gelid Cryotheum",),
-    ("thermalfoundation:fluid_ender", "Resonant Ender",),
-    ("thermalfoundation:fluid_glowstone", "Energized Glowstone",),
-    ("thermalfoundation:fluid_mana", "Primal Mana",),
-    ("thermalfoundation:fluid_petrotheum", "Tectonic Petrotheum",),
-    ("thermalfoundation:fluid_pyrotheum", "Blazing Pyrotheum",),
-    ("thermalfoundation:fluid_redstone", "Destabilized Redstone",),
-    ("thermalfoundation:glass", "tile.thermalfoundation.glass.name",),
-    ("thermalfoundation:glass_alloy", "tile.thermalfoundation.glass.name",),
-    ("thermalfoundation:ore", "tile.thermalfoundation.ore.name",),
-    ("thermalfoundation:ore_fluid", "tile.thermalfoundation.ore.name",),
-    ("thermalfoundation:rockwool", "tile.thermalfoundation.rockwool.name",),
-    ("thermalfoundation:storage", "tile.thermalfoundation.storage.name",),
-    ("thermalfoundation:storage_alloy", "tile.thermalfoundation.storage.name",),
-    ("thermalfoundation:storage_resource", "tile.thermalfoundation.storage.name",),
-    ("tinker_io:blockpuremetal", "tile.blockPureMetal.name",),
-    ("tinker_io:fuel_input_machine", "Fuel Input Machine",),
-    ("tinker_io:ore_crusher", "Ore Crusher",),
-    ("tinker_io:smart_output", "Smart Output",),
-    ("tinker_io:stirling_engine", "Stirling Engine",),
-    ("tinker_io:what_a_beautiful_block", "What a beautiful block",),
-    ("traverse:blue_rock", "Crag Rock",),
-    ("traverse:blue_rock_bricks", "Crag Rock Bricks",),
-    ("traverse:blue_rock_bricks_chiseled", "Chiseled Crag Rock Bricks",),
-    ("traverse:blue_rock_bricks_double_slab", "tile.traverse:blue_rock_bricks_double_slab.name",),
-    ("traverse:blue_rock_bricks_slab", "Crag Rock Bricks Slab",),
-    ("traverse:blue_rock_bricks_stairs", "Crag Rock Brick Stairs",),
-    ("traverse:blue_rock_cobblestone", "Crag Rock Cobblestone",),
-    ("traverse:blue_rock_cobblestone_double_slab", "tile.traverse:blue_rock_cobblestone_double_slab.name",),
-    ("traverse:blue_rock_cobblestone_slab", "Crag Rock Cobblestone Slab",),
-    ("traverse:blue_rock_cobblestone_stairs", "Crag Rock Cobblestone Stairs",),
-    ("traverse:blue_rock_cobblestone_wall", "tile.traverse:blue_rock_cobblestone_wall.normal.name",),
-    ("traverse:blue_rock_double_slab", "tile.traverse:blue_rock_double_slab.name",),
-    ("traverse:blue_rock_slab", "Crag Rock Slab",),
-    ("traverse:brown_autumnal_leaves", "Brown Autumnal Leaves",),
-    ("traverse:brown_autumnal_sapling", "tile.traverse:brown_autumnal_sapling.oak.name",),
-    ("traverse:cold_grass", "Cold Grass",),
-    ("traverse:dead_grass", "Dead Grass",),
-    ("traverse:fir_door", "item.traverse:fir_door.name",),
-    ("traverse:fir_double_slab", "tile.traverse:fir_double_slab.name",),
-    ("traverse:fir_fence", "Fir Fence",),
-    ("traverse:fir_fence_gate", "Fir Fence Gate",),
-    ("traverse:fir_leaves", "Fir Leaves",),
-    ("traverse:fir_log", "Fir Wood",),
-    ("traverse:fir_planks", "Fir Wood Planks",),
-    ("traverse:fir_sapling", "tile.traverse:fir_sapling.oak.name",),
-    ("traverse:fir_slab", "Fir Wood Slab",),
-    ("traverse:fir_stairs", "Fir Wood Stairs",),
-    ("traverse:orange_autumnal_leaves", "Orange Autumnal Leaves",),
-    ("traverse:orange_autumnal_sapling", "tile.traverse:orange_autumnal_sapling.oak.name",),
-    ("traverse:red_autumnal_leaves", "Red Autumnal Leaves",),
-    ("traverse:red_autumnal_sapling", "tile.traverse:red_autumnal_sapling.oak.name",),
-    ("traverse:red_rock", "Red Rock",),
-    ("traverse:red_rock_bricks", "Red Rock Bricks",),
-    ("traverse:red_rock_bricks_chiseled", "Chiseled Red Rock Bricks",),
-    ("traverse:red_rock_bricks_double_slab", "tile.traverse:red_rock_bricks_double_slab.name",),
-    ("traverse:red_rock_bricks_slab", "Red Rock Bricks Slab",),
-    ("traverse:red_rock_bricks_stairs", "Red Rock Brick Stairs",),
-    ("traverse:red_rock_cobblestone", "Red Rock Cobblestone",),
-    ("traverse:red_rock_cobblestone_double_slab", "tile.traverse:red_rock_cobblestone_double_slab.name",),
-    ("traverse:red_rock_cobblestone_slab", "Red Rock Cobblestone Slab",),
-    ("traverse:red_rock_cobblestone_stairs", "Red Rock Cobblestone Stairs",),
-    ("traverse:red_rock_cobblestone_wall", "tile.traverse:red_rock_cobblestone_wall.normal.name",),
-    ("traverse:red_rock_double_slab", "tile.traverse:red_rock_double_slab.name",),
-    ("traverse:red_rock_slab", "Red Rock Slab",),
-    ("traverse:yellow_autumnal_leaves", "Yellow Autumnal Leaves",),
-    ("traverse:yellow_autumnal_sapling", "tile.traverse:yellow_autumnal_sapling.oak.name",),
-    ("usefulnullifiers:energyvoidnullifierblock", "Energy Nullifier",),
-    ("usefulnullifiers:fluidvoidnullifierblock", "Fluid Nullifier",),
-    ("usefulnullifiers:voidnullifierblock", "Item Nullifier",),
-    ("waterstrainer:strainer_base", "Strainer Base",),
-    ("waystones:waystone", "Waystone",),
-    ("wificharge:personalcharger", "Personal Charger",),
-    ("wificharge:wirelesscharger", "Wireless Charger",),
-    ("wizardry:cloud", "tile.cloud.name",),
-    ("wizardry:crafting_plate", "tile.crafting_plate.name",),
-    ("wizardry:creative_mana_battery", "tile.creative_mana_battery.name",),
-    ("wizardry:jar_block", "tile.jar_block.name",),
-    ("wizardry:light", "tile.light.name",),
-    ("wizardry:magicians_worktable", "tile.magicians_worktable.name",),
-    ("wizardry:mana", "tile.mana.name",),
-    ("wizardry:mana_battery", "tile.mana_battery.name",),
-    ("wizardry:mana_magnet", "tile.mana_magnet.name",),
-    ("wizardry:nacre", "tile.nacre.name",),
-    ("wizardry:nacre_block", "tile.nacre_block.name",),
-    ("wizardry:nacre_block_brick", "tile.nacre_block_brick.name",),
-    ("wizardry:pearl_holder", "tile.pearl_holder.name",),
-    ("wizardry:torikki_grass", "tile.torikki_grass.name",),
-    ("wizardry:unicorn_trail", "tile.unicorn_trail.name",),
-    ("wizardry:wisdom_leaves", "tile.wisdom_leaves.name",),
-    ("wizardry:wisdom_wood_door", "item.wisdom_wood_door.name",),
-    ("wizardry:wisdom_wood_fence", "tile.wisdom_wood_fence.name",),
-    ("wizardry:wisdom_wood_fence_gate", "tile.wisdom_wood_fence_gate.name",),
-    ("wizardry:wisdom_wood_log", "tile.wisdom_wood_log.name",),
-    ("wizardry:wisdom_wood_pigmented_planks", "tile.wisdom_wood_pigmented_planks.name",),
-    ("wizardry:wisdom_wood_planks", "tile.wisdom_wood_planks.name",),
-    ("wizardry:wisdom_wood_slab", "tile.wisdom_wood_slab.name",),
-    ("wizardry:wisdom_wood_slab_full", "tile.wisdom_wood_slab_full.name",),
-    ("wizardry:wisdom_wood_stairs", "tile.wisdom_wood_stairs.name",),
-    ("wizardry:wisdom_wood_trapdoor", "tile.wisdom_wood_trapdoor.name",),
-    ("woot:anvil", "Stygian Iron Anvil",),
-    ("woot:cell", "tile.woot.cell.name",),
-    ("woot:controller", "Factory Controller",),
-    ("woot:exporter", "Factory Exporter",),
-    ("woot:factory", "Factory Heart",),
-    ("woot:importer", "Factory Importer",),
-    ("woot:layout", "Factory Layout",),
-    ("woot:soulstone", "Soul Stone",),
-    ("woot:structure", "tile.woot.structure.name",),
-    ("woot:stygianiron", "Stygian Iron Block",),
-    ("woot:stygianironore", "Stygian Iron Ore",),
-    ("woot:upgrade", "tile.woot.upgrade.name",),
-    ("woot:upgradeb", "tile.woot.upgradeb.name",),
-    ("xnet:advanced_connector", "Advanced Connector",),
-    ("xnet:connector", "Connector",),
-    ("xnet:controller", "Controller",),
-    ("xnet:facade", "Facade",),
-    ("xnet:netcable", "Network Cable",),
-    ("xnet:redstone_proxy", "Redstone Proxy",),
-    ("xnet:redstone_proxy_upd", "Redstone Proxy (update)",),
-    ("xnet:router", "Router",),
-    ("xreliquary:altar", "Altar",),
-    ("xreliquary:apothecary_cauldron", "tile.apothecary_cauldron.name",),
-    ("xreliquary:apothecary_mortar", "tile.apothecary_mortar.name",),
-    ("xreliquary:fertile_lilypad", "tile.fertile_lilypad.name",),
-    ("xreliquary:interdiction_torch", "tile.interdiction_torch.name",),
-    ("xreliquary:pedestal", "tile.pedestal.name",),
-    ("xreliquary:pedestal_passive", "tile.pedestal_passive.name",),
-    ("xreliquary:wraith_node", "tile.wraith_node.name",),
-    ("xtones:agon", "Agon",),
-    ("xtones:azur", "Azur",),
-    ("xtones:base", "tile.xtones.base.name",),
-    ("xtones:bitt", "Bitt",),
-    ("xtones:cray", "Cray",),
-    ("xtones:fort", "Fort",),
-    ("xtones:glaxx", "Glaxx",),
-    ("xtones:iszm", "Iszm",),
-    ("xtones:jelt", "Jelt",),
-    ("xtones:korp", "Korp",),
-    ("xtones:kryp", "Kryp",),
-    ("xtones:lair", "Lair",),
-    ("xtones:lamp_flat", "Flat Lamp",),
-    ("xtones:lave", "Lave",),
-    ("xtones:mint", "Mint",),
-    ("xtones:myst", "Myst",),
-    ("xtones:reds", "Reds",),
-    ("xtones:reed", "Reed",),
-    ("xtones:roen", "Roen",),
-    ("xtones:sols", "Sols",),
-    ("xtones:sync", "Sync",),
-    ("xtones:tank", "Tank",),
-    ("xtones:vect", "Vect",),
-    ("xtones:vena", "Vena",),
-    ("xtones:zane", "Zane",),
-    ("xtones:zech", "Zech",),
-    ("xtones:zest", "Zest",),
-    ("xtones:zeta", "Zeta",),
-    ("xtones:zion", "Zion",),
-    ("xtones:zkul", "Zkul",),
-    ("xtones:zoea", "Zoea",),
-    ("xtones:zome", "Zome",),
-    ("xtones:zone", "Zone",),
-    ("xtones:zorg", "Zorg",),
-    ("xtones:ztyl", "Ztyl",),
-    ("xtones:zyth", "Zyth",),
-]
@@ -1,3578 +0,0 @@
-oredict = [
-    "logWood",
-    "plankWood",
-    "slabWood",
-    "stairWood",
-    "stickWood",
-    "treeSapling",
-    "treeLeaves",
-    "vine",
-    "oreGold",
-    "oreIron",
-    "oreLapis",
-    "oreDiamond",
-    "oreRedstone",
-    "oreEmerald",
-    "oreQuartz",
-    "oreCoal",
-    "ingotIron",
-    "ingotGold",
-    "ingotBrick",
-    "ingotBrickNether",
-    "nuggetGold",
-    "nuggetIron",
-    "gemDiamond",
-    "gemEmerald",
-    "gemQuartz",
-    "gemPrismarine",
-    "dustPrismarine",
-    "dustRedstone",
-    "dustGlowstone",
-    "gemLapis",
-    "blockGold",
-    "blockIron",
-    "blockLapis",
-    "blockDiamond",
-    "blockRedstone",
-    "blockEmerald",
-    "blockQuartz",
-    "blockCoal",
-    "cropWheat",
-    "cropPotato",
-    "cropCarrot",
-    "cropNetherWart",
-    "sugarcane",
-    "blockCactus",
-    "dye",
-    "paper",
-    "slimeball",
-    "enderpearl",
-    "bone",
-    "gunpowder",
-    "string",
-    "netherStar",
-    "leather",
-    "feather",
-    "egg",
-    "record",
-    "dirt",
-    "grass",
-    "stone",
-    "cobblestone",
-    "gravel",
-    "sand",
-    "sandstone",
-    "netherrack",
-    "obsidian",
-    "glowstone",
-    "endstone",
-    "torch",
-    "workbench",
-    "blockSlime",
-    "blockPrismarine",
-    "blockPrismarineBrick",
-    "blockPrismarineDark",
-    "stoneGranite",
-    "stoneGranitePolished",
-    "stoneDiorite",
-    "stoneDioritePolished",
-    "stoneAndesite",
-    "stoneAndesitePolished",
-    "blockGlassColorless",
-    "blockGlass",
-    "paneGlassColorless",
-    "paneGlass",
-    "chest",
-    "chestWood",
-    "chestEnder",
-    "chestTrapped",
-    "dyeBlack",
-    "blockGlassBlack",
-    "paneGlassBlack",
-    "dyeRed",
-    "blockGlassRed",
-    "paneGlassRed",
-    "dyeGreen",
-    "blockGlassGreen",
-    "paneGlassGreen",
-    "dyeBrown",
-    "blockGlassBrown",
-    "paneGlassBrown",
-    "dyeBlue",
-    "blockGlassBlue",
-    "paneGlassBlue",
-    "dyePurple",
-    "blockGlassPurple",
-    "paneGlassPurple",
-    "dyeCyan",
-    "blockGlassCyan",
-    "paneGlassCyan",
-    "dyeLightGray",
-    "blockGlassLightGray",
-    "paneGlassLightGray",
-    "dyeGray",
-    "blockGlassGray",
-    "paneGlassGray",
-    "dyePink",
-    "blockGlassPink",
-    "paneGlassPink",
-    "dyeLime",
-    "blockGlassLime",
-    "paneGlassLime",
-    "dyeYellow",
-    "blockGlassYellow",
-    "paneGlassYellow",
-    "dyeLightBlue",
-    "blockGlassLightBlue",
-    "paneGlassLightBlue",
-    "dyeMagenta",
-    "blockGlassMagenta",
-    "paneGlassMagenta",
-    "dyeOrange",
-    "blockGlassOrange",
-    "paneGlassOrange",
-    "dyeWhite",
-    "blockGlassWhite",
-    "paneGlassWhite",
-    "blockWool",
-    "coal",
-    "charcoal",
-    "bookshelf",
-    "ingotUnstable",
-    "nuggetUnstable",
-    "compressed1xCobblestone",
-    "compressed2xCobblestone",
-    "compressed3xCobblestone",
-    "compressed4xCobblestone",
-    "compressed5xCobblestone",
-    "compressed6xCobblestone",
-    "compressed7xCobblestone",
-    "compressed8xCobblestone",
-    "compressed1xDirt",
-    "compressed2xDirt",
-    "compressed3xDirt",
-    "compressed4xDirt",
-    "compressed1xSand",
-    "compressed2xSand",
-    "compressed1xGravel",
-    "compressed2xGravel",
-    "compressed1xNetherrack",
-    "compressed2xNetherrack",
-    "compressed3xNetherrack",
-    "compressed4xNetherrack",
-    "compressed5xNetherrack",
-    "compressed6xNetherrack",
-    "gemRedstone",
-    "gearRedstone",
-    "eyeofredstone",
-    "dustLunar",
-    "coalPowered",
-    "gemMoon",
-    "xuUpgradeSpeed",
-    "xuUpgradeStack",
-    "xuUpgradeMining",
-    "xuUpgradeBlank",
-    "dropofevil",
-    "ingotDemonicMetal",
-    "ingotEnchantedMetal",
-    "xuRedstoneCoil",
-    "xuUpgradeSpeedEnchanted",
-    "ingotEvilMetal",
-    "blockEnchantedMetal",
-    "blockDemonicMetal",
-    "blockEvilMetal",
-    "blockMagicalWood",
-    "bricksStone",
-    "dustIron",
-    "dustGold",
-    "oreCopper",
-    "dustCopper",
-    "dustTin",
-    "ingotCopper",
-    "oreTin",
-    "ingotTin",
-    "oreLead",
-    "dustLead",
-    "dustSilver",
-    "ingotLead",
-    "oreSilver",
-    "ingotSilver",
-    "oreNickel",
-    "dustNickel",
-    "dustPlatinum",
-    "ingotNickel",
-    "orePlatinum",
-    "ingotPlatinum",
-    "mushroomAny",
-    "tallow",
-    "gemEnderBiotite",
-    "woodRubber",
-    "dustLapis",
-    "oreUranium",
-    "dustStone",
-    "dustBronze",
-    "dustClay",
-    "dustCoal",
-    "dustObsidian",
-    "dustSulfur",
-    "dustLithium",
-    "dustDiamond",
-    "dustSiliconDioxide",
-    "dustHydratedCoal",
-    "dustAshes",
-    "dustTinyCopper",
-    "dustTinyGold",
-    "dustTinyIron",
-    "dustTinySilver",
-    "dustTinyTin",
-    "dustTinyLead",
-    "dustTinySulfur",
-    "dustTinyLithium",
-    "dustTinyBronze",
-    "dustTinyLapis",
-    "dustTinyObsidian",
-    "itemRubber",
-    "ingotBronze",
-    "ingotSteel",
-    "plateIron",
-    "plateGold",
-    "plateCopper",
-    "plateTin",
-    "plateLead",
-    "plateLapis",
-    "plateObsidian",
-    "plateBronze",
-    "plateSteel",
-    "plateDenseSteel",
-    "plateDenseIron",
-    "plateDenseGold",
-    "plateDenseCopper",
-    "plateDenseTin",
-    "plateDenseLead",
-    "plateDenseLapis",
-    "plateDenseObsidian",
-    "plateDenseBronze",
-    "crushedIron",
-    "crushedGold",
-    "crushedSilver",
-    "crushedLead",
-    "crushedCopper",
-    "crushedTin",
-    "crushedUranium",
-    "crushedPurifiedIron",
-    "crushedPurifiedGold",
-    "crushedPurifiedSilver",
-    "crushedPurifiedLead",
-    "crushedPurifiedCopper",
-    "crushedPurifiedTin",
-    "crushedPurifiedUranium",
-    "blockBronze",
-    "blockCopper",
-    "blockTin",
-    "blockUranium",
-    "blockLead",
-    "blockSilver",
-    "blockSteel",
-    "circuitBasic",
-    "circuitAdvanced",
-    "craftingToolForgeHammer",
-    "craftingToolWireCutter",
-    "gemApatite",
-    "brickPeat",
-    "dustAsh",
-    "gearBronze",
-    "gearCopper",
-    "gearTin",
-    "pulpWood",
-    "itemBeeswax",
-    "cropCherry",
-    "fruitForestry",
-    "cropWalnut",
-    "cropChestnut",
-    "cropLemon",
-    "cropPlum",
-    "cropDate",
-    "cropPapaya",
-    "oreApatite",
-    "blockApatite",
-    "craftingTableWood",
-    "trapdoorWood",
-    "blockCharcoal",
-    "dropHoney",
-    "itemPollen",
-    "dropHoneydew",
-    "dropRoyalJelly",
-    "beeComb",
-    "fenceWood",
-    "fenceGateWood",
-    "doorWood",
-    "emptiedLetter",
-    "weedkiller",
-    "toolTrowel",
-    "binnie_database",
-    "pigment",
-    "cropApple",
-    "cropCrabapple",
-    "cropOrange",
-    "cropKumquat",
-    "cropLime",
-    "cropWildCherry",
-    "cropSourCherry",
-    "cropBlackCherry",
-    "cropBlackthorn",
-    "cropCherryPlum",
-    "cropAlmond",
-    "cropApricot",
-    "cropGrapefruit",
-    "cropPeach",
-    "cropSatsuma",
-    "cropBuddhaHand",
-    "cropCitron",
-    "cropFingerLime",
-    "cropKeyLime",
-    "cropManderin",
-    "cropNectarine",
-    "cropPomelo",
-    "cropTangerine",
-    "cropPear",
-    "cropSandPear",
-    "cropHazelnut",
-    "cropButternut",
-    "cropBeechnut",
-    "cropPecan",
-    "cropBanana",
-    "cropRedBanana",
-    "cropPlantain",
-    "cropBrazilNut",
-    "cropFig",
-    "cropAcorn",
-    "cropElderberry",
-    "cropOlive",
-    "cropGingkoNut",
-    "cropCoffee",
-    "cropOsangeOrange",
-    "cropClove",
-    "cropHops",
-    "seedWheat",
-    "seedBarley",
-    "seedCorn",
-    "seedRye",
-    "seedRoasted",
-    "ballMud",
-    "blockMeatRaw",
-    "blockMud",
-    "foodMushroompowder",
-    "foodFruitsalad",
-    "foodVeggiesalad",
-    "foodMushroomsalad",
-    "foodFilledhoneycomb",
-    "foodAmbrosia",
-    "foodBowlofrice",
-    "cropPersimmon",
-    "cropTurnip",
-    "listAllfruit",
-    "listAllrootveggie",
-    "listAllveggie",
-    "seedTurnip",
-    "listAllseed",
-    "gemAmethyst",
-    "oreAmethyst",
-    "gemRuby",
-    "oreRuby",
-    "gemPeridot",
-    "orePeridot",
-    "gemTopaz",
-    "oreTopaz",
-    "gemTanzanite",
-    "oreTanzanite",
-    "gemMalachite",
-    "oreMalachite",
-    "gemSapphire",
-    "oreSapphire",
-    "gemAmber",
-    "oreAmber",
-    "flowerClover",
-    "flowerSwampflower",
-    "flowerDeathbloom",
-    "flowerGlowflower",
-    "flowerBlueHydrangea",
-    "flowerOrangeCosmos",
-    "flowerPinkDaffodil",
-    "flowerWildflower",
-    "flowerViolet",
-    "flowerWhiteAnemone",
-    "flowerEnderlotus",
-    "flowerBromeliad",
-    "flowerWiltedLily",
-    "flowerPinkHibiscus",
-    "flowerLilyOfTheValley",
-    "flowerBurningBlossom",
-    "flowerLavender",
-    "flowerGoldenrod",
-    "flowerBluebells",
-    "flowerMinersDelight",
-    "flowerIcyIris",
-    "flowerRose",
-    "plantShortgrass",
-    "plantMediumgrass",
-    "plantBush",
-    "plantSprout",
-    "plantPoisonivy",
-    "plantBerrybush",
-    "plantShrub",
-    "plantWheatgrass",
-    "plantDampgrass",
-    "plantKoru",
-    "plantCloverpatch",
-    "plantLeafpile",
-    "plantDeadleafpile",
-    "plantDeadgrass",
-    "plantDesertgrass",
-    "plantDesertsprouts",
-    "plantDunegrass",
-    "plantSpectralfern",
-    "plantThorn",
-    "plantWildrice",
-    "plantCattail",
-    "plantRivercane",
-    "plantTinycactus",
-    "plantDevilweed",
-    "plantReed",
-    "plantRoot",
-    "plantRafflesia",
-    "plantFlax",
-    "blockWoolWhite",
-    "blockWoolOrange",
-    "blockWoolMagenta",
-    "blockWoolLightBlue",
-    "blockWoolYellow",
-    "blockWoolLime",
-    "blockWoolPink",
-    "blockWoolGray",
-    "blockWoolLightGray",
-    "blockWoolCyan",
-    "blockWoolPurple",
-    "blockWoolBlue",
-    "blockWoolBrown",
-    "blockWoolGreen",
-    "blockWoolRed",
-    "blockWoolBlack",
-    "flower",
-    "craftingPiston",
-    "torchRedstoneActive",
-    "materialEnderPearl",
-    "oc:wlanCard",
-    "chipDiamond",
-    "oc:stoneEndstone",
-    "oreAluminum",
-    "oreIridium",
-    "oreMithril",
-    "oreFluidCrudeOilSand",
-    "oreFluidCrudeOilShale",
-    "oreFluidRedstone",
-    "oreFluidGlowstone",
-    "oreFluidEnder",
-    "blockAluminum",
-    "blockNickel",
-    "blockPlatinum",
-    "blockIridium",
-    "blockMithril",
-    "blockElectrum",
-    "blockInvar",
-    "blockConstantan",
-    "blockSignalum",
-    "blockLumium",
-    "blockEnderium",
-    "blockFuelCoke",
-    "blockGlassHardened",
-    "blockRockwool",
-    "coinIron",
-    "coinGold",
-    "coinCopper",
-    "coinTin",
-    "coinSilver",
-    "coinLead",
-    "coinAluminum",
-    "coinNickel",
-    "coinPlatinum",
-    "coinIridium",
-    "coinMithril",
-    "coinSteel",
-    "coinElectrum",
-    "coinInvar",
-    "coinBronze",
-    "coinConstantan",
-    "coinSignalum",
-    "coinLumium",
-    "coinEnderium",
-    "nuggetDiamond",
-    "nuggetEmerald",
-    "gearIron",
-    "gearGold",
-    "dustAluminum",
-    "dustIridium",
-    "dustMithril",
-    "dustSteel",
-    "dustElectrum",
-    "dustInvar",
-    "dustConstantan",
-    "dustSignalum",
-    "dustLumium",
-    "dustEnderium",
-    "ingotAluminum",
-    "ingotIridium",
-    "ingotMithril",
-    "ingotElectrum",
-    "ingotInvar",
-    "ingotConstantan",
-    "ingotSignalum",
-    "ingotLumium",
-    "ingotEnderium",
-    "nuggetCopper",
-    "nuggetTin",
-    "nuggetSilver",
-    "nuggetLead",
-    "nuggetAluminum",
-    "nuggetNickel",
-    "nuggetPlatinum",
-    "nuggetIridium",
-    "nuggetMithril",
-    "nuggetSteel",
-    "nuggetElectrum",
-    "nuggetInvar",
-    "nuggetBronze",
-    "nuggetConstantan",
-    "nuggetSignalum",
-    "nuggetLumium",
-    "nuggetEnderium",
-    "gearSilver",
-    "gearLead",
-    "gearAluminum",
-    "gearNickel",
-    "gearPlatinum",
-    "gearIridium",
-    "gearMithril",
-    "gearSteel",
-    "gearElectrum",
-    "gearInvar",
-    "gearConstantan",
-    "gearSignalum",
-    "gearLumium",
-    "gearEnderium",
-    "plateSilver",
-    "plateAluminum",
-    "plateNickel",
-    "platePlatinum",
-    "plateIridium",
-    "plateMithril",
-    "plateElectrum",
-    "plateInvar",
-    "plateConstantan",
-    "plateSignalum",
-    "plateLumium",
-    "plateEnderium",
-    "dustCharcoal",
-    "dustWood",
-    "crystalSlag",
-    "crystalSlagRich",
-    "crystalCinnabar",
-    "crystalCrudeOil",
-    "crystalRedstone",
-    "crystalGlowstone",
-    "crystalEnder",
-    "dustPyrotheum",
-    "dustCryotheum",
-    "dustAerotheum",
-    "dustPetrotheum",
-    "dustMana",
-    "rodBlizz",
-    "dustBlizz",
-    "rodBlitz",
-    "dustBlitz",
-    "rodBasalz",
-    "dustBasalz",
-    "dustSaltpeter",
-    "fuelCoke",
-    "itemSlag",
-    "itemSlagRich",
-    "itemCinnabar",
-    "dragonEgg",
-    "oreDraconium",
-    "blockDraconium",
-    "blockDraconiumAwakened",
-    "ingotDraconium",
-    "dustDraconium",
-    "ingotDraconiumAwakened",
-    "nuggetDraconium",
-    "nuggetDraconiumAwakened",
-    "dustPsi",
-    "substanceEbony",
-    "ingotPsi",
-    "substanceIvory",
-    "ingotEbonyPsi",
-    "ingotIvoryPsi",
-    "gemPsi",
-    "crystalsPrismarine",
-    "shardPrismarine",
-    "oreThorium",
-    "oreBoron",
-    "oreLithium",
-    "oreMagnesium",
-    "blockThorium",
-    "blockBoron",
-    "blockLithium",
-    "blockMagnesium",
-    "blockGraphite",
-    "blockBeryllium",
-    "blockZirconium",
-    "blockDepletedThorium",
-    "blockDepletedUranium",
-    "blockDepletedNeptunium",
-    "blockDepletedPlutonium",
-    "blockDepletedAmericium",
-    "blockDepletedCurium",
-    "blockDepletedBerkelium",
-    "blockDepletedCalifornium",
-    "ingotThorium",
-    "ingotUranium",
-    "ingotBoron",
-    "ingotLithium",
-    "ingotMagnesium",
-    "ingotGraphite",
-    "ingotBeryllium",
-    "ingotZirconium",
-    "ingotThoriumOxide",
-    "ingotUraniumOxide",
-    "ingotManganeseOxide",
-    "ingotManganeseDioxide",
-    "dustThorium",
-    "dustUranium",
-    "dustBoron",
-    "dustMagnesium",
-    "dustGraphite",
-    "dustBeryllium",
-    "dustZirconium",
-    "dustThoriumOxide",
-    "dustUraniumOxide",
-    "dustManganeseOxide",
-    "dustManganeseDioxide",
-    "gemRhodochrosite",
-    "gemBoronNitride",
-    "gemFluorite",
-    "dustRhodochrosite",
-    "dustQuartz",
-    "dustNetherQuartz",
-    "dustBoronNitride",
-    "dustFluorite",
-    "ingotTough",
-    "ingotHardCarbon",
-    "ingotMagnesiumDiboride",
-    "ingotLithiumManganeseDioxide",
-    "ingotFerroboron",
-    "ingotShibuichi",
-    "ingotTinSilver",
-    "ingotLeadPlatinum",
-    "dustCalciumSulfate",
-    "dustCrystalBinder",
-    "plateBasic",
-    "plateAdvanced",
-    "plateDU",
-    "plateElite",
-    "solenoidCopper",
-    "solenoidMagnesiumDiboride",
-    "bioplastic",
-    "tinyDustLead",
-    "ingotThorium230Base",
-    "ingotThorium230",
-    "ingotThorium230Oxide",
-    "nuggetThorium230",
-    "nuggetThorium230Oxide",
-    "ingotThorium232Base",
-    "ingotThorium232",
-    "ingotThorium232Oxide",
-    "nuggetThorium232",
-    "nuggetThorium232Oxide",
-    "ingotUranium233Base",
-    "ingotUranium233",
-    "ingotUranium233Oxide",
-    "nuggetUranium233",
-    "nuggetUranium233Oxide",
-    "ingotUranium235Base",
-    "ingotUranium235",
-    "ingotUranium235Oxide",
-    "nuggetUranium235",
-    "nuggetUranium235Oxide",
-    "ingotUranium238Base",
-    "ingotUranium238",
-    "ingotUranium238Oxide",
-    "nuggetUranium238",
-    "nuggetUranium238Oxide",
-    "ingotNeptunium236Base",
-    "ingotNeptunium236",
-    "ingotNeptunium236Oxide",
-    "nuggetNeptunium236",
-    "nuggetNeptunium236Oxide",
-    "ingotNeptunium237Base",
-    "ingotNeptunium237",
-    "ingotNeptunium237Oxide",
-    "nuggetNeptunium237",
-    "nuggetNeptunium237Oxide",
-    "ingotPlutonium238Base",
-    "ingotPlutonium238",
-    "ingotPlutonium238Oxide",
-    "nuggetPlutonium238",
-    "nuggetPlutonium238Oxide",
-    "ingotPlutonium239Base",
-    "ingotPlutonium239",
-    "ingotPlutonium239Oxide",
-    "nuggetPlutonium239",
-    "nuggetPlutonium239Oxide",
-    "ingotPlutonium241Base",
-    "ingotPlutonium241",
-    "ingotPlutonium241Oxide",
-    "nuggetPlutonium241",
-    "nuggetPlutonium241Oxide",
-    "ingotPlutonium242Base",
-    "ingotPlutonium242",
-    "ingotPlutonium242Oxide",
-    "nuggetPlutonium242",
-    "nuggetPlutonium242Oxide",
-    "ingotAmericium241Base",
-    "ingotAmericium241",
-    "ingotAmericium241Oxide",
-    "nuggetAmericium241",
-    "nuggetAmericium241Oxide",
-    "ingotAmericium242Base",
-    "ingotAmericium242",
-    "ingotAmericium242Oxide",
-    "nuggetAmericium242",
-    "nuggetAmericium242Oxide",
-    "ingotAmericium243Base",
-    "ingotAmericium243",
-    "ingotAmericium243Oxide",
-    "nuggetAmericium243",
-    "nuggetAmericium243Oxide",
-    "ingotCurium243Base",
-    "ingotCurium243",
-    "ingotCurium243Oxide",
-    "nuggetCurium243",
-    "nuggetCurium243Oxide",
-    "ingotCurium245Base",
-    "ingotCurium245",
-    "ingotCurium245Oxide",
-    "nuggetCurium245",
-    "nuggetCurium245Oxide",
-    "ingotCurium246Base",
-    "ingotCurium246",
-    "ingotCurium246Oxide",
-    "nuggetCurium246",
-    "nuggetCurium246Oxide",
-    "ingotCurium247Base",
-    "ingotCurium247",
-    "ingotCurium247Oxide",
-    "nuggetCurium247",
-    "nuggetCurium247Oxide",
-    "ingotBerkelium247Base",
-    "ingotBerkelium247",
-    "ingotBerkelium247Oxide",
-    "nuggetBerkelium247",
-    "nuggetBerkelium247Oxide",
-    "ingotBerkelium248Base",
-    "ingotBerkelium248",
-    "ingotBerkelium248Oxide",
-    "nuggetBerkelium248",
-    "nuggetBerkelium248Oxide",
-    "ingotCalifornium249Base",
-    "ingotCalifornium249",
-    "ingotCalifornium249Oxide",
-    "nuggetCalifornium249",
-    "nuggetCalifornium249Oxide",
-    "ingotCalifornium250Base",
-    "ingotCalifornium250",
-    "ingotCalifornium250Oxide",
-    "nuggetCalifornium250",
-    "nuggetCalifornium250Oxide",
-    "ingotCalifornium251Base",
-    "ingotCalifornium251",
-    "ingotCalifornium251Oxide",
-    "nuggetCalifornium251",
-    "nuggetCalifornium251Oxide",
-    "ingotCalifornium252Base",
-    "ingotCalifornium252",
-    "ingotCalifornium252Oxide",
-    "nuggetCalifornium252",
-    "nuggetCalifornium252Oxide",
-    "fuelTBU",
-    "fuelTBUOxide",
-    "fuelLEU233",
-    "fuelLEU233Oxide",
-    "fuelHEU233",
-    "fuelHEU233Oxide",
-    "fuelLEU235",
-    "fuelLEU235Oxide",
-    "fuelHEU235",
-    "fuelHEU235Oxide",
-    "fuelLEN236",
-    "fuelLEN236Oxide",
-    "fuelHEN236",
-    "fuelHEN236Oxide",
-    "fuelLEP239",
-    "fuelLEP239Oxide",
-    "fuelHEP239",
-    "fuelHEP239Oxide",
-    "fuelLEP241",
-    "fuelLEP241Oxide",
-    "fuelHEP241",
-    "fuelHEP241Oxide",
-    "fuelMOX239",
-    "fuelMOX241",
-    "fuelLEA242",
-    "fuelLEA242Oxide",
-    "fuelHEA242",
-    "fuelHEA242Oxide",
-    "fuelLECm243",
-    "fuelLECm243Oxide",
-    "fuelHECm243",
-    "fuelHECm243Oxide",
-    "fuelLECm245",
-    "fuelLECm245Oxide",
-    "fuelHECm245",
-    "fuelHECm245Oxide",
-    "fuelLECm247",
-    "fuelLECm247Oxide",
-    "fuelHECm247",
-    "fuelHECm247Oxide",
-    "fuelLEB248",
-    "fuelLEB248Oxide",
-    "fuelHEB248",
-    "fuelHEB248Oxide",
-    "fuelLECf249",
-    "fuelLECf249Oxide",
-    "fuelHECf249",
-    "fuelHECf249Oxide",
-    "fuelLECf251",
-    "fuelLECf251Oxide",
-    "fuelHECf251",
-    "fuelHECf251Oxide",
-    "fuelRodTBU",
-    "fuelRodTBUOxide",
-    "fuelRodLEU233",
-    "fuelRodLEU233Oxide",
-    "fuelRodHEU233",
-    "fuelRodHEU233Oxide",
-    "fuelRodLEU235",
-    "fuelRodLEU235Oxide",
-    "fuelRodHEU235",
-    "fuelRodHEU235Oxide",
-    "fuelRodLEN236",
-    "fuelRodLEN236Oxide",
-    "fuelRodHEN236",
-    "fuelRodHEN236Oxide",
-    "fuelRodLEP239",
-    "fuelRodLEP239Oxide",
-    "fuelRodHEP239",
-    "fuelRodHEP239Oxide",
-    "fuelRodLEP241",
-    "fuelRodLEP241Oxide",
-    "fuelRodHEP241",
-    "fuelRodHEP241Oxide",
-    "fuelRodMOX239",
-    "fuelRodMOX241",
-    "fuelRodLEA242",
-    "fuelRodLEA242Oxide",
-    "fuelRodHEA242",
-    "fuelRodHEA242Oxide",
-    "fuelRodLECm243",
-    "fuelRodLECm243Oxide",
-    "fuelRodHECm243",
-    "fuelRodHECm243Oxide",
-    "fuelRodLECm245",
-    "fuelRodLECm245Oxide",
-    "fuelRodHECm245",
-    "fuelRodHECm245Oxide",
-    "fuelRodLECm247",
-    "fuelRodLECm247Oxide",
-    "fuelRodHECm247",
-    "fuelRodHECm247Oxide",
-    "fuelRodLEB248",
-    "fuelRodLEB248Oxide",
-    "fuelRodHEB248",
-    "fuelRodHEB248Oxide",
-    "fuelRodLECf249",
-    "fuelRodLECf249Oxide",
-    "fuelRodHECf249",
-    "fuelRodHECf249Oxide",
-    "fuelRodLECf251",
-    "fuelRodLECf251Oxide",
-    "fuelRodHECf251",
-    "fuelRodHECf251Oxide",
-    "depletedFuelRodTBU",
-    "depletedFuelRodTBUOxide",
-    "depletedFuelRodLEU233",
-    "depletedFuelRodLEU233Oxide",
-    "depletedFuelRodHEU233",
-    "depletedFuelRodHEU233Oxide",
-    "depletedFuelRodLEU235",
-    "depletedFuelRodLEU235Oxide",
-    "depletedFuelRodHEU235",
-    "depletedFuelRodHEU235Oxide",
-    "depletedFuelRodLEN236",
-    "depletedFuelRodLEN236Oxide",
-    "depletedFuelRodHEN236",
-    "depletedFuelRodHEN236Oxide",
-    "depletedFuelRodLEP239",
-    "depletedFuelRodLEP239Oxide",
-    "depletedFuelRodHEP239",
-    "depletedFuelRodHEP239Oxide",
-    "depletedFuelRodLEP241",
-    "depletedFuelRodLEP241Oxide",
-    "depletedFuelRodHEP241",
-    "depletedFuelRodHEP241Oxide",
-    "depletedFuelRodMOX239",
-    "depletedFuelRodMOX241",
-    "depletedFuelRodLEA242",
-    "depletedFuelRodLEA242Oxide",
-    "depletedFuelRodHEA242",
-    "depletedFuelRodHEA242Oxide",
-    "depletedFuelRodLECm243",
-    "depletedFuelRodLECm243Oxide",
-    "depletedFuelRodHECm243",
-    "depletedFuelRodHECm243Oxide",
-    "depletedFuelRodLECm245",
-    "depletedFuelRodLECm245Oxide",
-    "depletedFuelRodHECm245",
-    "depletedFuelRodHECm245Oxide",
-    "depletedFuelRodLECm247",
-    "depletedFuelRodLECm247Oxide",
-    "depletedFuelRodHECm247",
-    "depletedFuelRodHECm247Oxide",
-    "depletedFuelRodLEB248",
-    "depletedFuelRodLEB248Oxide",
-    "depletedFuelRodHEB248",
-    "depletedFuelRodHEB248Oxide",
-    "depletedFuelRodLECf249",
-    "depletedFuelRodLECf249Oxide",
-    "depletedFuelRodHECf249",
-    "depletedFuelRodHECf249Oxide",
-    "depletedFuelRodLECf251",
-    "depletedFuelRodLECf251Oxide",
-    "depletedFuelRodHECf251",
-    "depletedFuelRodHECf251Oxide",
-    "ingotBoron10",
-    "nuggetBoron10",
-    "ingotBoron11",
-    "nuggetBoron11",
-    "ingotLithium6",
-    "nuggetLithium6",
-    "ingotLithium7",
-    "nuggetLithium7",
-    "gemCoal",
-    "gemCharcoal",
-    "nuggetAlumite",
-    "ingotAlumite",
-    "blockAlumite",
-    "ingotOsmium",
-    "ingotRefinedObsidian",
-    "ingotRefinedGlowstone",
-    "nuggetOsgloglas",
-    "ingotOsgloglas",
-    "blockOsgloglas",
-    "nuggetOsmiridium",
-    "ingotOsmiridium",
-    "blockOsmiridium",
-    "ingotTitanium",
-    "gemQuartzBlack",
-    "crystalCertusQuartz",
-    "crystalFluix",
-    "blockElectrumFlux",
-    "blockCrystalFlux",
-    "dustElectrumFlux",
-    "ingotElectrumFlux",
-    "nuggetElectrumFlux",
-    "gearElectrumFlux",
-    "plateElectrumFlux",
-    "gemCrystalFlux",
-    "cropIronberry",
-    "listAllberry",
-    "cropWildberry",
-    "cropGrape",
-    "cropChilipepper",
-    "listAllpepper",
-    "cropTomato",
-    "treeWood",
-    "wax",
-    "particleCustomizer",
-    "oreGalena",
-    "oreBauxite",
-    "orePyrite",
-    "oreCinnabar",
-    "oreSphalerite",
-    "oreTungsten",
-    "oreSheldonite",
-    "oreSodalite",
-    "blockAluminium",
-    "blockTitanium",
-    "blockChrome",
-    "blockBrass",
-    "blockZinc",
-    "blockTungsten",
-    "blockTungstensteel",
-    "blockRuby",
-    "blockSapphire",
-    "blockPeridot",
-    "blockYellowGarnet",
-    "blockRedGarnet",
-    "crafterWood",
-    "machineBasic",
-    "saplingRubber",
-    "logRubber",
-    "plankRubber",
-    "leavesRubber",
-    "fenceIron",
-    "machineBlockBasic",
-    "machineBlockAdvanced",
-    "machineBlockHighlyAdvanced",
-    "reBattery",
-    "lapotronCrystal",
-    "energyCrystal",
-    "drillBasic",
-    "drillDiamond",
-    "drillAdvanced",
-    "industrialTnt",
-    "craftingIndustrialDiamond",
-    "fertilizer",
-    "hvTransformer",
-    "uran235",
-    "uran238",
-    "smallUran238",
-    "smallUran235",
-    "rubberWood",
-    "glassReinforced",
-    "plateIridiumAlloy",
-    "circuitStorage",
-    "circuitElite",
-    "circuitMaster",
-    "machineBlockElite",
-    "insulatedGoldCableItem",
-    "ic2Generator",
-    "ic2SolarPanel",
-    "ic2Macerator",
-    "ic2Extractor",
-    "ic2Windmill",
-    "ic2Watermill",
-    "craftingDiamondGrinder",
-    "craftingTungstenGrinder",
-    "craftingSuperconductor",
-    "materialResin",
-    "materialRubber",
-    "plateruby",
-    "platesapphire",
-    "plateperidot",
-    "gemRedGarnet",
-    "plateredGarnet",
-    "gemYellowGarnet",
-    "plateyellowGarnet",
-    "platealuminum",
-    "ingotBrass",
-    "platebrass",
-    "platebronze",
-    "ingotChrome",
-    "platechrome",
-    "platecopper",
-    "plateelectrum",
-    "plateinvar",
-    "plateiridium",
-    "platelead",
-    "platenickel",
-    "plateplatinum",
-    "platesilver",
-    "platesteel",
-    "platetin",
-    "platetitanium",
-    "ingotTungsten",
-    "platetungsten",
-    "ingotHotTungstensteel",
-    "ingotTungstensteel",
-    "platetungstensteel",
-    "ingotZinc",
-    "platezinc",
-    "ingotRefinedIron",
-    "platerefinedIron",
-    "ingotAdvancedAlloy",
-    "plateadvancedAlloy",
-    "ingotMixedMetal",
-    "ingotIridiumAlloy",
-    "plateCarbon",
-    "plateWood",
-    "plateRedstone",
-    "plateDiamond",
-    "plateEmerald",
-    "plateCoal",
-    "plateLazurite",
-    "plateRuby",
-    "plateSapphire",
-    "platePeridot",
-    "plateRedGarnet",
-    "plateYellowGarnet",
-    "plateBrass",
-    "plateChrome",
-    "plateTitanium",
-    "plateTungsten",
-    "plateTungstensteel",
-    "plateZinc",
-    "plateRefinedIron",
-    "plateAdvancedAlloy",
-    "platemagnalium",
-    "plateMagnalium",
-    "plateiridiumAlloy",
-    "dustAlmandine",
-    "dustAndradite",
-    "dustBasalt",
-    "dustBauxite",
-    "dustBrass",
-    "dustCalcite",
-    "dustChrome",
-    "dustCinnabar",
-    "dustDarkAshes",
-    "dustEmerald",
-    "dustEnderEye",
-    "dustEnderPearl",
-    "dustEndstone",
-    "dustFlint",
-    "dustGalena",
-    "dustGrossular",
-    "dustLazurite",
-    "dustManganese",
-    "dustMarble",
-    "dustNetherrack",
-    "dustPeridot",
-    "dustPhosphorous",
-    "dustPyrite",
-    "dustPyrope",
-    "dustRedGarnet",
-    "dustRuby",
-    "dustSapphire",
-    "dustSawDust",
-    "dustSodalite",
-    "dustSpessartine",
-    "dustSphalerite",
-    "dustTitanium",
-    "dustTungsten",
-    "dustUvarovite",
-    "dustYellowGarnet",
-    "dustZinc",
-    "dustAndesite",
-    "dustDiorite",
-    "dustGranite",
-    "dustSmallAlmandine",
-    "dustSmallAluminum",
-    "dustSmallAndradite",
-    "dustSmallAshes",
-    "dustSmallBasalt",
-    "dustSmallBauxite",
-    "dustSmallBrass",
-    "dustSmallBronze",
-    "dustSmallCalcite",
-    "dustSmallCharcoal",
-    "dustSmallChrome",
-    "dustSmallCinnabar",
-    "dustSmallClay",
-    "dustSmallCoal",
-    "dustSmallCopper",
-    "dustSmallDarkAshes",
-    "dustSmallDiamond",
-    "dustSmallElectrum",
-    "dustSmallEmerald",
-    "dustSmallEnderEye",
-    "dustSmallEnderPearl",
-    "dustSmallEndstone",
-    "dustSmallFlint",
-    "dustSmallGalena",
-    "dustSmallGold",
-    "dustSmallGrossular",
-    "dustSmallInvar",
-    "dustSmallIron",
-    "dustSmallLazurite",
-    "dustSmallLead",
-    "dustSmallMagnesium",
-    "dustSmallManganese",
-    "dustSmallMarble",
-    "dustSmallNetherrack",
-    "dustSmallNickel",
-    "dustSmallObsidian",
-    "dustSmallPeridot",
-    "dustSmallPhosphorous",
-    "dustSmallPlatinum",
-    "dustSmallPyrite",
-    "dustSmallPyrope",
-    "dustSmallRedGarnet",
-    "dustSmallRuby",
-    "dustSmallSaltpeter",
-    "dustSmallSapphire",
-    "dustSmallSawDust",
-    "dustSmallSilver",
-    "dustSmallSodalite",
-    "dustSmallSpessartine",
-    "dustSmallSphalerite",
-    "dustSmallSteel",
-    "dustSmallSulfur",
-    "dustSmallTin",
-    "dustSmallTitanium",
-    "dustSmallTungsten",
-    "dustSmallUvarovite",
-    "dustSmallYellowGarnet",
-    "dustSmallZinc",
-    "dustSmallRedstone",
-    "dustSmallGlowstone",
-    "dustSmallAndesite",
-    "dustSmallDiorite",
-    "dustSmallGranite",
-    "nuggetBrass",
-    "nuggetChrome",
-    "nuggetTitanium",
-    "nuggetTungsten",
-    "nuggetHotTungstensteel",
-    "nuggetTungstensteel",
-    "nuggetZinc",
-    "nuggetRefinedIron",
-    "dustApatite",
-    "dustAmethyst",
-    "dustTopaz",
-    "dustTanzanite",
-    "dustMalachite",
-    "dustAmber",
-    "dustDilithium",
-    "crystalDilithium",
-    "oreDilithium",
-    "stickIron",
-    "sheetIron",
-    "coilGold",
-    "blockCoil",
-    "dustSilicon",
-    "ingotSilicon",
-    "bouleSilicon",
-    "nuggetSilicon",
-    "plateSilicon",
-    "stickCopper",
-    "sheetCopper",
-    "coilCopper",
-    "stickSteel",
-    "fanSteel",
-    "sheetSteel",
-    "stickTitanium",
-    "sheetTitanium",
-    "gearTitanium",
-    "coilTitanium",
-    "oreRutile",
-    "oreTitanium",
-    "sheetAluminum",
-    "coilAluminum",
-    "stickIridium",
-    "coilIridium",
-    "dustTitaniumAluminide",
-    "ingotTitaniumAluminide",
-    "nuggetTitaniumAluminide",
-    "plateTitaniumAluminide",
-    "stickTitaniumAluminide",
-    "sheetTitaniumAluminide",
-    "gearTitaniumAluminide",
-    "blockTitaniumAluminide",
-    "dustTitaniumIridium",
-    "ingotTitaniumIridium",
-    "nuggetTitaniumIridium",
-    "plateTitaniumIridium",
-    "stickTitaniumIridium",
-    "sheetTitaniumIridium",
-    "gearTitaniumIridium",
-    "blockTitaniumIridium",
-    "stoneBasalt",
-    "stoneBasaltPolished",
-    "bookshelfOak",
-    "bookshelfSpruce",
-    "bookshelfBirch",
-    "bookshelfJungle",
-    "bookshelfAcacia",
-    "bookshelfDarkOak",
-    "blockCobalt",
-    "blockCoalCoke",
-    "blockMossy",
-    "blockConcrete",
-    "blockConcreteBlack",
-    "blockConcreteRed",
-    "blockConcreteGreen",
-    "blockConcreteBrown",
-    "blockConcreteBlue",
-    "blockConcretePurple",
-    "blockConcreteCyan",
-    "blockConcreteLightGray",
-    "blockConcreteGray",
-    "blockConcretePink",
-    "blockConcreteLime",
-    "blockConcreteYellow",
-    "blockConcreteLightBlue",
-    "blockConcreteMagenta",
-    "blockConcreteOrange",
-    "blockConcreteWhite",
-    "hardenedClay",
-    "ice",
-    "blockIce",
-    "stoneLimestone",
-    "stoneLimestonePolished",
-    "stoneMarble",
-    "stoneMarblePolished",
-    "prismarine",
-    "prismarineBrick",
-    "prismarineDark",
-    "brickStone",
-    "fish",
-    "boneWithered",
-    "listAllmeatcooked",
-    "lexicaBotania",
-    "petalWhite",
-    "runeWaterB",
-    "petalOrange",
-    "runeFireB",
-    "petalMagenta",
-    "runeEarthB",
-    "petalLightBlue",
-    "runeAirB",
-    "petalYellow",
-    "runeSpringB",
-    "petalLime",
-    "runeSummerB",
-    "petalPink",
-    "runeAutumnB",
-    "petalGray",
-    "runeWinterB",
-    "petalLightGray",
-    "runeManaB",
-    "petalCyan",
-    "runeLustB",
-    "petalPurple",
-    "runeGluttonyB",
-    "petalBlue",
-    "runeGreedB",
-    "petalBrown",
-    "runeSlothB",
-    "petalGreen",
-    "runeWrathB",
-    "petalRed",
-    "runeEnvyB",
-    "petalBlack",
-    "runePrideB",
-    "quartzDark",
-    "quartzMana",
-    "quartzBlaze",
-    "quartzLavender",
-    "quartzRed",
-    "quartzElven",
-    "quartzSunny",
-    "pestleAndMortar",
-    "ingotManasteel",
-    "manaPearl",
-    "manaDiamond",
-    "livingwoodTwig",
-    "ingotTerrasteel",
-    "eternalLifeEssence",
-    "redstoneRoot",
-    "ingotElvenElementium",
-    "elvenPixieDust",
-    "elvenDragonstone",
-    "bPlaceholder",
-    "bRedString",
-    "dreamwoodTwig",
-    "gaiaIngot",
-    "bEnderAirBottle",
-    "manaString",
-    "nuggetManasteel",
-    "nuggetTerrasteel",
-    "nuggetElvenElementium",
-    "livingRoot",
-    "pebble",
-    "clothManaweave",
-    "powderMana",
-    "bVial",
-    "bFlask",
-    "rodBlaze",
-    "powderBlaze",
-    "mysticFlowerWhite",
-    "mysticFlowerOrange",
-    "mysticFlowerMagenta",
-    "mysticFlowerLightBlue",
-    "mysticFlowerYellow",
-    "mysticFlowerLime",
-    "mysticFlowerPink",
-    "mysticFlowerGray",
-    "mysticFlowerLightGray",
-    "mysticFlowerCyan",
-    "mysticFlowerPurple",
-    "mysticFlowerBlue",
-    "mysticFlowerBrown",
-    "mysticFlowerGreen",
-    "mysticFlowerRed",
-    "mysticFlowerBlack",
-    "livingrock",
-    "livingwood",
-    "dreamwood",
-    "mysticFlowerWhiteDouble",
-    "mysticFlowerLightGrayDouble",
-    "mysticFlowerOrangeDouble",
-    "mysticFlowerCyanDouble",
-    "mysticFlowerMagentaDouble",
-    "mysticFlowerPurpleDouble",
-    "mysticFlowerLightBlueDouble",
-    "mysticFlowerBlueDouble",
-    "mysticFlowerYellowDouble",
-    "mysticFlowerBrownDouble",
-    "mysticFlowerLimeDouble",
-    "mysticFlowerGreenDouble",
-    "mysticFlowerPinkDouble",
-    "mysticFlowerRedDouble",
-    "mysticFlowerGrayDouble",
-    "mysticFlowerBlackDouble",
-    "blockBlaze",
-    "snowLayer",
-    "mycelium",
-    "podzol",
-    "soulSand",
-    "slabCobblestone",
-    "drawerBasic",
-    "drawerTrim",
-    "slabCopper",
-    "slabAluminum",
-    "slabLead",
-    "slabSilver",
-    "slabNickel",
-    "slabUranium",
-    "slabConstantan",
-    "slabElectrum",
-    "slabSteel",
-    "blockSheetmetalCopper",
-    "blockSheetmetalAluminum",
-    "blockSheetmetalLead",
-    "blockSheetmetalSilver",
-    "blockSheetmetalNickel",
-    "blockSheetmetalUranium",
-    "blockSheetmetalConstantan",
-    "blockSheetmetalElectrum",
-    "blockSheetmetalSteel",
-    "blockSheetmetalIron",
-    "blockSheetmetalGold",
-    "slabSheetmetalCopper",
-    "slabSheetmetalAluminum",
-    "slabSheetmetalLead",
-    "slabSheetmetalSilver",
-    "slabSheetmetalNickel",
-    "slabSheetmetalUranium",
-    "slabSheetmetalConstantan",
-    "slabSheetmetalElectrum",
-    "slabSheetmetalSteel",
-    "slabSheetmetalIron",
-    "slabSheetmetalGold",
-    "nuggetUranium",
-    "plateUranium",
-    "stickTreatedWood",
-    "stickAluminum",
-    "fiberHemp",
-    "fabricHemp",
-    "dustCoke",
-    "dustHOPGraphite",
-    "ingotHOPGraphite",
-    "wireCopper",
-    "wireElectrum",
-    "wireAluminum",
-    "wireSteel",
-    "electronTube",
-    "plankTreatedWood",
-    "slabTreatedWood",
-    "fenceTreatedWood",
-    "scaffoldingTreatedWood",
-    "concrete",
-    "fenceSteel",
-    "fenceAluminum",
-    "scaffoldingSteel",
-    "scaffoldingAluminum",
-    "blockPackedIce",
-    "blockSnow",
-    "oreYellorite",
-    "oreYellorium",
-    "blockYellorium",
-    "blockCyanite",
-    "blockBlutonium",
-    "blockLudicrite",
-    "dustYellorium",
-    "dustCyanite",
-    "dustBlutonium",
-    "dustLudicrite",
-    "dustPlutonium",
-    "ingotYellorium",
-    "ingotCyanite",
-    "ingotBlutonium",
-    "ingotLudicrite",
-    "ingotPlutonium",
-    "nuggetMirion",
-    "ingotMirion",
-    "blockMirion",
-    "gearDiamond",
-    "gearStone",
-    "gearWood",
-    "ingotAbyssalnite",
-    "ingotLiquifiedCoralium",
-    "gemCoralium",
-    "oreAbyssalnite",
-    "oreCoralium",
-    "oreDreadedAbyssalnite",
-    "oreCoraliumStone",
-    "gemShadow",
-    "liquidCoralium",
-    "materialCoraliumPearl",
-    "liquidAntimatter",
-    "blockAbyssalnite",
-    "blockLiquifiedCoralium",
-    "blockDreadium",
-    "ingotCoraliumBrick",
-    "ingotDreadium",
-    "materialMethane",
-    "oreSaltpeter",
-    "crystalIron",
-    "crystalGold",
-    "crystalSulfur",
-    "crystalCarbon",
-    "crystalOxygen",
-    "crystalHydrogen",
-    "crystalNitrogen",
-    "crystalPhosphorus",
-    "crystalPotassium",
-    "crystalNitrate",
-    "crystalMethane",
-    "crystalAbyssalnite",
-    "crystalCoralium",
-    "crystalDreadium",
-    "crystalBlaze",
-    "crystalTin",
-    "crystalCopper",
-    "crystalSilicon",
-    "crystalMagnesium",
-    "crystalAluminium",
-    "crystalSilica",
-    "crystalAlumina",
-    "crystalMagnesia",
-    "crystalZinc",
-    "foodFriedEgg",
-    "orePearlescentCoralium",
-    "oreLiquifiedCoralium",
-    "ingotEthaxiumBrick",
-    "ingotEthaxium",
-    "blockEthaxium",
-    "nuggetAbyssalnite",
-    "nuggetLiquifiedCoralium",
-    "nuggetDreadium",
-    "nuggetEthaxium",
-    "crystalShardIron",
-    "crystalShardGold",
-    "crystalShardSulfur",
-    "crystalShardCarbon",
-    "crystalShardOxygen",
-    "crystalShardHydrogen",
-    "crystalShardNitrogen",
-    "crystalShardPhosphorus",
-    "crystalShardPotassium",
-    "crystalShardNitrate",
-    "crystalShardMethane",
-    "crystalShardRedstone",
-    "crystalShardAbyssalnite",
-    "crystalShardCoralium",
-    "crystalShardDreadium",
-    "crystalShardBlaze",
-    "crystalShardTin",
-    "crystalShardCopper",
-    "crystalShardSilicon",
-    "crystalShardMagnesium",
-    "crystalShardAluminium",
-    "crystalShardSilica",
-    "crystalShardAlumina",
-    "crystalShardMagnesia",
-    "crystalShardZinc",
-    "crystalFragmentIron",
-    "crystalFragmentGold",
-    "crystalFragmentSulfur",
-    "crystalFragmentCarbon",
-    "crystalFragmentOxygen",
-    "crystalFragmentHydrogen",
-    "crystalFragmentNitrogen",
-    "crystalFragmentPhosphorus",
-    "crystalFragmentPotassium",
-    "crystalFragmentNitrate",
-    "crystalFragmentMethane",
-    "crystalFragmentRedstone",
-    "crystalFragmentAbyssalnite",
-    "crystalFragmentCoralium",
-    "crystalFragmentDreadium",
-    "crystalFragmentBlaze",
-    "crystalFragmentTin",
-    "crystalFragmentCopper",
-    "crystalFragmentSilicon",
-    "crystalFragmentMagnesium",
-    "crystalFragmentAluminium",
-    "crystalFragmentSilica",
-    "crystalFragmentAlumina",
-    "crystalFragmentMagnesia",
-    "crystalFragmentZinc",
-    "dustAbyssalnite",
-    "dustLiquifiedCoralium",
-    "dustDreadium",
-    "dustQuartzBlack",
-    "oreQuartzBlack",
-    "seedCanola",
-    "cropCanola",
-    "seedRice",
-    "cropRice",
-    "seedFlax",
-    "cropFlax",
-    "seedCoffee",
-    "slimeballPink",
-    "blockInferiumEssence",
-    "blockPrudentiumEssence",
-    "blockIntermediumEssence",
-    "blockSuperiumEssence",
-    "blockSupremiumEssence",
-    "blockProsperity",
-    "blockBaseEssence",
-    "blockInferium",
-    "blockPrudentium",
-    "blockIntermedium",
-    "blockSuperium",
-    "blockSupremium",
-    "blockSoulium",
-    "blockInferiumCoal",
-    "blockPrudentiumCoal",
-    "blockIntermediumCoal",
-    "blockSuperiumCoal",
-    "blockSupremiumCoal",
-    "seedsTier3",
-    "essenceTier5",
-    "essenceTier2",
-    "seedsTier2",
-    "seedsTier5",
-    "essenceTier1",
-    "essenceTier3",
-    "coalInferium",
-    "essenceTier4",
-    "seedsTier4",
-    "ingotBaseEssence",
-    "essenceSupremium",
-    "ingotIntermedium",
-    "essencePrudentium",
-    "ingotPrudentium",
-    "seedsTier1",
-    "nuggetPrudentium",
-    "coalSupremium",
-    "nuggetIntermedium",
-    "ingotSupremium",
-    "coalIntermedium",
-    "essenceSuperium",
-    "shardProsperity",
-    "ingotSoulium",
-    "nuggetSuperium",
-    "coalPrudentium",
-    "ingotSuperium",
-    "ingotInferium",
-    "nuggetSupremium",
-    "nuggetInferium",
-    "nuggetBaseEssence",
-    "nuggetSoulium",
-    "essenceIntermedium",
-    "coalSuperium",
-    "essenceInferium",
-    "blockInsaniumEssence",
-    "blockInsanium",
-    "blockInsaniumCoal",
-    "essenceInsanium",
-    "ingotInsanium",
-    "nuggetInsanium",
-    "essenceTier6",
-    "seedsTier6",
-    "toolPot",
-    "toolSkillet",
-    "toolSaucepan",
-    "toolBakeware",
-    "toolCuttingboard",
-    "toolMortarandpestle",
-    "toolMixingbowl",
-    "toolJuicer",
-    "coinGarlic",
-    "cropCotton",
-    "seedCotton",
-    "materialCloth",
-    "cropCandle",
-    "cropCandleberry",
-    "seedCandleberry",
-    "materialPressedwax",
-    "dustSalt",
-    "itemSalt",
-    "foodHoneydrop",
-    "flowerRed",
-    "flowerYellow",
-    "blockTorch",
-    "listAllmeatraw",
-    "listAllchickenraw",
-    "listAllegg",
-    "listAllchickencooked",
-    "listAllporkraw",
-    "listAllporkcooked",
-    "listAllbeefraw",
-    "listAllbeefcooked",
-    "listAllmuttonraw",
-    "listAllmuttoncooked",
-    "listAllturkeyraw",
-    "listAllturkeycooked",
-    "listAllrabbitraw",
-    "listAllrabbitcooked",
-    "listAllvenisonraw",
-    "listAllvenisoncooked",
-    "listAllduckraw",
-    "listAllduckcooked",
-    "listAllfishraw",
-    "listAllfishcooked",
-    "listAllheavycream",
-    "listAllicecream",
-    "listAllmilk",
-    "listAllwater",
-    "foodGroundbeef",
-    "foodGroundchicken",
-    "foodGroundduck",
-    "foodGroundfish",
-    "foodGroundmutton",
-    "foodGroundpork",
-    "foodGroundrabbit",
-    "foodGroundturkey",
-    "foodGroundvenison",
-    "flourEqualswheat",
-    "bread",
-    "foodBread",
-    "cropPumpkin",
-    "cropBeet",
-    "listAllgrain",
-    "listAllmushroom",
-    "salmonRaw",
-    "listAllsugar",
-    "listAllgreenveggie",
-    "cropAsparagus",
-    "seedAsparagus",
-    "foodGrilledasparagus",
-    "cropBarley",
-    "cropBean",
-    "seedBean",
-    "seedBeet",
-    "cropBroccoli",
-    "seedBroccoli",
-    "cropCauliflower",
-    "seedCauliflower",
-    "cropCelery",
-    "seedCelery",
-    "cropCranberry",
-    "seedCranberry",
-    "cropGarlic",
-    "listAllherb",
-    "seedGarlic",
-    "cropGinger",
-    "listAllspice",
-    "seedGinger",
-    "cropLeek",
-    "seedLeek",
-    "cropLettuce",
-    "seedLettuce",
-    "cropOats",
-    "seedOats",
-    "cropOnion",
-    "seedOnion",
-    "cropParsnip",
-    "seedParsnip",
-    "listAllnut",
-    "cropPeanut",
-    "seedPeanut",
-    "cropPineapple",
-    "seedPineapple",
-    "cropRadish",
-    "seedRadish",
-    "foodRicecake",
-    "cropRutabaga",
-    "seedRutabaga",
-    "cropRye",
-    "cropScallion",
-    "seedScallion",
-    "cropSoybean",
-    "seedSoybean",
-    "cropSpiceleaf",
-    "seedSpiceleaf",
-    "cropSunflower",
-    "cropSweetpotato",
-    "seedSweetpotato",
-    "cropTea",
-    "seedTea",
-    "foodTea",
-    "cropWhitemushroom",
-    "seedWhitemushroom",
-    "cropArtichoke",
-    "seedArtichoke",
-    "cropBellpepper",
-    "seedBellpepper",
-    "cropBlackberry",
-    "seedBlackberry",
-    "cropBlueberry",
-    "seedBlueberry",
-    "cropBrusselsprout",
-    "seedBrusselsprout",
-    "cropCabbage",
-    "seedCabbage",
-    "cropCactusfruit",
-    "seedCactusfruit",
-    "cropCantaloupe",
-    "seedCantaloupe",
-    "seedChilipepper",
-    "foodCoffee",
-    "cropCorn",
-    "cropCucumber",
-    "seedCucumber",
-    "cropEggplant",
-    "seedEggplant",
-    "foodGrilledeggplant",
-    "seedGrape",
-    "foodRaisins",
-    "cropKiwi",
-    "seedKiwi",
-    "cropMustard",
-    "seedMustard",
-    "cropOkra",
-    "seedOkra",
-    "cropPeas",
-    "seedPeas",
-    "cropRaspberry",
-    "seedRaspberry",
-    "cropRhubarb",
-    "seedRhubarb",
-    "cropSeaweed",
-    "seedSeaweed",
-    "cropStrawberry",
-    "seedStrawberry",
-    "seedTomato",
-    "cropWintersquash",
-    "seedWintersquash",
-    "cropZucchini",
-    "seedZucchini",
-    "cropBambooshoot",
-    "seedBambooshoot",
-    "cropSpinach",
-    "seedSpinach",
-    "cropCurryleaf",
-    "seedCurryleaf",
-    "cropSesame",
-    "seedSesameseed",
-    "cropWaterchestnut",
-    "seedGigapickle",
-    "foodGigapickle",
-    "foodPickles",
-    "seedWaterchestnut",
-    "cropAvocado",
-    "cropCinnamon",
-    "cropCoconut",
-    "foodToastedcoconut",
-    "cropDragonfruit",
-    "listAllcitrus",
-    "cropMango",
-    "cropNutmeg",
-    "cropPeppercorn",
-    "cropPomegranate",
-    "cropStarfruit",
-    "cropVanillabean",
-    "foodVanilla",
-    "cropGooseberry",
-    "cropCashew",
-    "cropDurian",
-    "cropMaplesyrup",
-    "cropPistachio",
-    "foodSalt",
-    "foodFlour",
-    "foodDough",
-    "foodToast",
-    "foodPasta",
-    "foodHeavycream",
-    "foodButter",
-    "foodCheese",
-    "foodIcecream",
-    "foodGrilledcheese",
-    "foodApplesauce",
-    "foodApplejuice",
-    "foodApplepie",
-    "foodCaramelapple",
-    "foodPumpkinbread",
-    "foodRoastedpumpkinseeds",
-    "foodPumpkinsoup",
-    "foodMelonjuice",
-    "foodMelonsmoothie",
-    "listAllsmoothie",
-    "foodCarrotjuice",
-    "foodCarrotcake",
-    "foodCarrotsoup",
-    "foodGlazedcarrots",
-    "foodButteredpotato",
-    "foodLoadedbakedpotato",
-    "foodMashedpotatoes",
-    "foodPotatosalad",
-    "foodPotatosoup",
-    "foodFries",
-    "foodGrilledmushroom",
-    "foodStuffedmushroom",
-    "foodChickensandwich",
-    "foodChickennoodlesoup",
-    "foodChickenpotpie",
-    "foodBreadedporkchop",
-    "foodHotdog",
-    "foodBakedham",
-    "foodHamburger",
-    "foodCheeseburger",
-    "foodBaconcheeseburger",
-    "foodPotroast",
-    "foodFishsandwich",
-    "foodFishsticks",
-    "foodFishandchips",
-    "foodMayo",
-    "foodFriedegg",
-    "foodScrambledegg",
-    "foodBoiledegg",
-    "foodEggsalad",
-    "foodCaramel",
-    "foodTaffy",
-    "foodSpidereyesoup",
-    "foodZombiejerky",
-    "foodCocoapowder",
-    "foodChocolatebar",
-    "foodHotchocolate",
-    "foodChocolateicecream",
-    "foodVegetablesoup",
-    "foodStock",
-    "foodSpagetti",
-    "foodSpagettiandmeatballs",
-    "foodTomatosoup",
-    "foodKetchup",
-    "foodChickenparmasan",
-    "foodPizza",
-    "foodSpringsalad",
-    "foodPorklettucewrap",
-    "foodFishlettucewrap",
-    "foodBlt",
-    "foodLeafychickensandwich",
-    "foodLeafyfishsandwich",
-    "foodDeluxecheeseburger",
-    "foodDelightedmeal",
-    "foodOnionsoup",
-    "foodPotatocakes",
-    "foodHash",
-    "foodBraisedonions",
-    "foodHeartyBreakfast",
-    "foodCornonthecob",
-    "foodCornmeal",
-    "foodCornbread",
-    "foodTortilla",
-    "foodNachoes",
-    "foodTaco",
-    "foodFishtaco",
-    "foodCreamedcorn",
-    "foodStrawberrysmoothie",
-    "foodStrawberrypie",
-    "foodStrawberrysalad",
-    "foodStrawberryjuice",
-    "foodChocolatestrawberry",
-    "foodPeanutbutter",
-    "listAllnutbutter",
-    "foodTrailmix",
-    "foodPbandj",
-    "foodPeanutbuttercookies",
-    "listAllcookie",
-    "foodGrapejuice",
-    "foodVinegar",
-    "foodGrapejelly",
-    "foodGrapesalad",
-    "foodRaisincookies",
-    "foodCucumbersalad",
-    "foodCucumbersoup",
-    "foodVegetarianlettucewrap",
-    "foodMarinatedcucumbers",
-    "foodRicesoup",
-    "foodFriedrice",
-    "foodMushroomrisotto",
-    "foodCurry",
-    "foodRainbowcurry",
-    "foodRefriedbeans",
-    "foodBakedbeans",
-    "foodBeansandrice",
-    "foodChili",
-    "foodBeanburrito",
-    "foodStuffedpepper",
-    "foodVeggiestirfry",
-    "foodGrilledskewers",
-    "foodSupremepizza",
-    "foodOmelet",
-    "foodHotwings",
-    "foodChilipoppers",
-    "foodExtremechili",
-    "foodChilichocolate",
-    "foodLemonaide",
-    "foodLemonbar",
-    "foodFishdinner",
-    "foodLemonsmoothie",
-    "foodLemonmeringue",
-    "foodCandiedlemon",
-    "foodLemonchicken",
-    "foodBlueberrysmoothie",
-    "foodBlueberrypie",
-    "foodBlueberrymuffin",
-    "foodBlueberryjuice",
-    "foodPancakes",
-    "foodBlueberrypancakes",
-    "foodCherryjuice",
-    "foodCherrypie",
-    "foodChocolatecherry",
-    "foodCherrysmoothie",
-    "foodCheesecake",
-    "foodCherrycheesecake",
-    "foodStuffedeggplant",
-    "foodEggplantparm",
-    "foodRaspberryicedtea",
-    "foodChaitea",
-    "foodEspresso",
-    "foodCoffeeconleche",
-    "foodMochaicecream",
-    "foodPickledbeets",
-    "foodBeetsalad",
-    "foodBeetsoup",
-    "foodBakedbeets",
-    "foodBroccolimac",
-    "foodBroccolindip",
-    "foodCreamedbroccolisoup",
-    "foodSweetpotatopie",
-    "foodCandiedsweetpotatoes",
-    "foodMashedsweetpotatoes",
-    "foodSteamedpeas",
-    "foodSplitpeasoup",
-    "foodPineappleupsidedowncake",
-    "foodPineappleham",
-    "foodPineappleyogurt",
-    "foodTurnipsoup",
-    "foodRoastedrootveggiemedley",
-    "foodBakedturnips",
-    "foodGingerbread",
-    "foodGingersnaps",
-    "foodCandiedginger",
-    "foodMustard",
-    "foodSoftpretzelandmustard",
-    "foodSpicymustardpork",
-    "foodSpicygreens",
-    "foodGarlicbread",
-    "foodGarlicmashedpotatoes",
-    "foodGarlicchicken",
-    "foodSummerradishsalad",
-    "foodSummersquashwithradish",
-    "foodCeleryandpeanutbutter",
-    "foodChickencelerycasserole",
-    "foodPeasandcelery",
-    "foodCelerysoup",
-    "foodZucchinibread",
-    "foodZucchinifries",
-    "foodZestyzucchini",
-    "foodZucchinibake",
-    "foodAsparagusquiche",
-    "foodAsparagussoup",
-    "foodWalnutraisinbread",
-    "foodCandiedwalnuts",
-    "foodBrownie",
-    "foodPapayajuice",
-    "foodPapayasmoothie",
-    "foodPapayayogurt",
-    "foodStarfruitjuice",
-    "foodStarfruitsmoothie",
-    "foodStarfruityogurt",
-    "foodGuacamole",
-    "foodCreamofavocadosoup",
-    "foodAvocadoburrito",
-    "foodPoachedpear",
-    "foodFruitcrumble",
-    "foodPearyogurt",
-    "foodPlumyogurt",
-    "foodBananasplit",
-    "foodBanananutbread",
-    "foodBananasmoothie",
-    "foodBananayogurt",
-    "foodCoconutmilk",
-    "foodChickencurry",
-    "foodCoconutshrimp",
-    "foodCoconutyogurt",
-    "foodOrangejuice",
-    "foodOrangechicken",
-    "foodOrangesmoothie",
-    "foodOrangeyogurt",
-    "foodPeachjuice",
-    "foodPeachcobbler",
-    "foodPeachsmoothie",
-    "foodPeachyogurt",
-    "foodLimejuice",
-    "foodKeylimepie",
-    "foodLimesmoothie",
-    "foodLimeyogurt",
-    "foodMangojuice",
-    "foodMangosmoothie",
-    "foodMangoyogurt",
-    "foodPomegranatejuice",
-    "foodPomegranatesmoothie",
-    "foodPomegranateyogurt",
-    "foodVanillayogurt",
-    "foodCinnamonroll",
-    "foodFrenchtoast",
-    "foodMarshmellows",
-    "foodDonut",
-    "foodChocolatedonut",
-    "foodPowdereddonut",
-    "foodJellydonut",
-    "foodFrosteddonut",
-    "foodCactussoup",
-    "foodWaffles",
-    "foodSeedsoup",
-    "foodSoftpretzel",
-    "foodJellybeans",
-    "foodBiscuit",
-    "foodCreamcookie",
-    "foodJaffa",
-    "foodFriedchicken",
-    "foodChocolatesprinklecake",
-    "foodRedvelvetcake",
-    "foodFootlong",
-    "foodBlueberryyogurt",
-    "foodLemonyogurt",
-    "foodCherryyogurt",
-    "foodStrawberryyogurt",
-    "foodGrapeyogurt",
-    "foodChocolateyogurt",
-    "foodBlackberryjuice",
-    "foodBlackberrycobbler",
-    "foodBlackberrysmoothie",
-    "foodBlackberryyogurt",
-    "foodChocolatemilk",
-    "foodPumpkinyogurt",
-    "foodRaspberryjuice",
-    "foodRaspberrypie",
-    "foodRaspberrysmoothie",
-    "foodRaspberryyogurt",
-    "foodCinnamonsugardonut",
-    "foodMelonyogurt",
-    "foodKiwijuice",
-    "foodKiwismoothie",
-    "foodKiwiyogurt",
-    "foodPlainyogurt",
-    "foodAppleyogurt",
-    "foodSaltedsunflowerseeds",
-    "foodSunflowerwheatrolls",
-    "foodSunflowerbroccolisalad",
-    "foodCranberryjuice",
-    "foodCranberrysauce",
-    "foodCranberrybar",
-    "foodPeppermint",
-    "foodCactusfruitjuice",
-    "foodBlackpepper",
-    "foodGroundcinnamon",
-    "foodGroundnutmeg",
-    "foodOliveoil",
-    "foodBaklava",
-    "foodGummybears",
-    "foodBaconmushroomburger",
-    "foodFruitpunch",
-    "foodMeatystew",
-    "foodMixedsalad",
-    "foodPinacolada",
-    "foodSaladdressing",
-    "foodShepherdspie",
-    "foodEggnog",
-    "foodCustard",
-    "foodSushi",
-    "foodGardensoup",
-    "foodMuttonraw",
-    "foodMuttoncooked",
-    "foodCalamariraw",
-    "foodCalamaricooked",
-    "foodApplejelly",
-    "foodApplejellysandwich",
-    "foodBlackberryjelly",
-    "foodBlackberryjellysandwich",
-    "foodBlueberryjelly",
-    "foodBlueberryjellysandwich",
-    "foodCherryjelly",
-    "foodCherryjellysandwich",
-    "foodCranberryjelly",
-    "foodCranberryjellysandwich",
-    "foodKiwijelly",
-    "foodKiwijellysandwich",
-    "foodLemonjelly",
-    "foodLemonjellysandwich",
-    "foodLimejelly",
-    "foodLimejellysandwich",
-    "foodMangojelly",
-    "foodMangojellysandwich",
-    "foodOrangejelly",
-    "foodOrangejellysandwich",
-    "foodPapayajelly",
-    "foodPapayajellysandwich",
-    "foodPeachjelly",
-    "foodPeachjellysandwich",
-    "foodPomegranatejelly",
-    "foodPomegranatejellysandwich",
-    "foodRaspberryjelly",
-    "foodRaspberryjellysandwich",
-    "foodStarfruitjelly",
-    "foodStarfruitjellysandwich",
-    "foodStrawberryjelly",
-    "foodStrawberryjellysandwich",
-    "foodWatermelonjelly",
-    "foodWatermelonjellysandwich",
-    "foodBubblywater",
-    "foodCherrysoda",
-    "foodColasoda",
-    "foodGingersoda",
-    "foodGrapesoda",
-    "foodLemonlimesoda",
-    "foodOrangesoda",
-    "foodRootbeersoda",
-    "foodStrawberrysoda",
-    "listAllsoda",
-    "foodCaramelicecream",
-    "foodMintchocolatechipicecream",
-    "foodStrawberryicecream",
-    "foodVanillaicecream",
-    "cropEdibleroot",
-    "foodGingerchicken",
-    "foodOldworldveggiesoup",
-    "foodSpicebun",
-    "foodGingeredrhubarbtart",
-    "foodLambbarleysoup",
-    "foodHoneylemonlamb",
-    "foodPumpkinoatscones",
-    "foodBeefjerky",
-    "foodPlumjuice",
-    "foodPearjuice",
-    "foodOvenroastedcauliflower",
-    "foodLeekbaconsoup",
-    "foodHerbbutterparsnips",
-    "foodScallionbakedpotato",
-    "foodSoymilk",
-    "foodFirmtofu",
-    "foodSilkentofu",
-    "foodBamboosteamedrice",
-    "foodRoastedchestnut",
-    "foodSweetpotatosouffle",
-    "foodCashewchicken",
-    "foodApricotjuice",
-    "foodApricotyogurt",
-    "foodApricotglazedpork",
-    "foodApricotjelly",
-    "foodApricotjellysandwich",
-    "foodApricotsmoothie",
-    "foodFigbar",
-    "foodFigjelly",
-    "foodFigjellysandwich",
-    "foodFigsmoothie",
-    "foodFigyogurt",
-    "foodFigjuice",
-    "foodGrapefruitjuice",
-    "foodGrapefruitjelly",
-    "foodGrapefruitjellysandwich",
-    "foodGrapefruitjellysmoothie",
-    "foodGrapefruityogurt",
-    "foodGrapefruitsoda",
-    "foodCitrussalad",
-    "foodPecanpie",
-    "foodPralines",
-    "foodPersimmonjuice",
-    "foodPersimmonyogurt",
-    "foodPersimmonsmoothie",
-    "foodPersimmonjelly",
-    "foodPersimmonjellysanwich",
-    "foodPistachiobakedsalmon",
-    "foodBaconwrappeddates",
-    "foodDatenutbread",
-    "foodMaplesyruppancakes",
-    "foodMaplesyrupwaffles",
-    "foodMaplesausage",
-    "foodMapleoatmeal",
-    "foodPeachesandcreamoatmeal",
-    "foodCinnamonappleoatmeal",
-    "foodMaplecandiedbacon",
-    "foodToastsandwich",
-    "foodPotatoandcheesepirogi",
-    "foodZeppole",
-    "foodSausageinbread",
-    "foodChocolatecaramelfudge",
-    "foodLavendershortbread",
-    "foodBeefwellington",
-    "foodEpicbacon",
-    "foodManjuu",
-    "foodChickengumbo",
-    "foodGeneraltsochicken",
-    "foodCaliforniaroll",
-    "foodFutomaki",
-    "foodBeansontoast",
-    "foodVegemite",
-    "foodHoneycombchocolatebar",
-    "foodCherrycoconutchocolatebar",
-    "foodFairybread",
-    "foodLamington",
-    "foodTimtam",
-    "foodMeatpie",
-    "foodChikoroll",
-    "foodDamper",
-    "foodBeetburger",
-    "foodPavlova",
-    "foodGherkin",
-    "foodMcpam",
-    "foodCeasarsalad",
-    "foodChaoscookie",
-    "foodChocolatebacon",
-    "foodLambkebab",
-    "foodNutella",
-    "foodSnickersbar",
-    "foodSpinachpie",
-    "foodSteamedspinach",
-    "foodVegemiteontoast",
-    "foodSalmonraw",
-    "foodAnchovyraw",
-    "foodBassraw",
-    "foodCarpraw",
-    "foodCatfishraw",
-    "foodCharrraw",
-    "foodClamraw",
-    "foodCrabraw",
-    "foodCrayfishraw",
-    "foodEelraw",
-    "foodFrograw",
-    "foodGrouperraw",
-    "foodHerringraw",
-    "foodJellyfishraw",
-    "foodMudfishraw",
-    "foodOctopusraw",
-    "foodPerchraw",
-    "foodScallopraw",
-    "foodShrimpraw",
-    "foodSnailraw",
-    "foodSnapperraw",
-    "foodTilapiaraw",
-    "foodTroutraw",
-    "foodTunaraw",
-    "foodTurtleraw",
-    "foodWalleyraw",
-    "foodHolidaycake",
-    "foodClamcooked",
-    "foodCrabcooked",
-    "foodCrayfishcooked",
-    "foodFrogcooked",
-    "foodOctopuscooked",
-    "foodScallopcooked",
-    "foodShrimpcooked",
-    "foodSnailcooked",
-    "foodTurtlecooked",
-    "foodApplecider",
-    "foodBangersandmash",
-    "foodBatteredsausage",
-    "foodBatter",
-    "foodchorizo",
-    "foodColeslaw",
-    "foodEnergydrink",
-    "foodFriedonions",
-    "foodMeatfeastpizza",
-    "foodMincepie",
-    "foodOnionhamburger",
-    "foodPepperoni",
-    "foodPickledonions",
-    "foodPorksausage",
-    "foodRaspberrytrifle",
-    "foodTurkeyraw",
-    "foodTurkeycooked",
-    "foodRabbitraw",
-    "foodRabbitcooked",
-    "foodVenisonraw",
-    "foodVenisoncooked",
-    "foodStrawberrymilkshake",
-    "foodChocolatemilkshake",
-    "foodBananamilkshake",
-    "foodCornflakes",
-    "foodColeslawburger",
-    "foodRoastchicken",
-    "foodRoastpotatoes",
-    "foodSundayroast",
-    "foodBbqpulledpork",
-    "foodLambwithmintsauce",
-    "foodSteakandchips",
-    "foodCherryicecream",
-    "foodPistachioicecream",
-    "foodNeapolitanicecream",
-    "foodSpumoniicecream",
-    "foodAlmondbutter",
-    "foodCashewbutter",
-    "foodChestnutbutter",
-    "foodCornishpasty",
-    "foodCottagepie",
-    "foodCroissant",
-    "foodCurrypowder",
-    "foodDimsum",
-    "foodFriedpecanokra",
-    "foodGooseberryjelly",
-    "foodGooseberryjellysandwich",
-    "foodGooseberrymilkeshake",
-    "foodGooseberrypie",
-    "foodGooseberrysmoothie",
-    "foodGooseberryyogurt",
-    "foodGreenheartfish",
-    "foodHamsweetpicklesandwich",
-    "foodHushpuppies",
-    "foodKimchi",
-    "foodMochi",
-    "foodMuseli",
-    "foodNaan",
-    "foodOkrachips",
-    "foodOkracreole",
-    "foodPistachiobutter",
-    "foodPloughmanslunch",
-    "foodPorklomein",
-    "foodSalmonpatties",
-    "foodSausage",
-    "foodSausageroll",
-    "foodSesameball",
-    "foodSesamesnaps",
-    "foodShrimpokrahushpuppies",
-    "foodSoysauce",
-    "foodSweetpickle",
-    "foodVeggiestrips",
-    "foodVindaloo",
-    "foodApplesmoothie",
-    "foodCheeseontoast",
-    "foodChocolateroll",
-    "foodCoconutcream",
-    "foodCoconutsmoothie",
-    "foodCracker",
-    "foodCranberrysmoothie",
-    "foodCranberryyogurt",
-    "foodDeluxechickencurry",
-    "foodGarammasala",
-    "foodGrapesmoothie",
-    "foodGravy",
-    "foodHoneysandwich",
-    "foodJamroll",
-    "foodMangochutney",
-    "foodMarzipan",
-    "foodPaneer",
-    "foodPaneertikkamasala",
-    "foodPeaandhamsoup",
-    "foodPearjelly",
-    "foodPearjellysandwich",
-    "foodPearsmoothie",
-    "foodPlumjelly",
-    "foodPlumjellysandwich",
-    "foodPlumsmoothie",
-    "foodPotatoandleeksoup",
-    "foodToadinthehole",
-    "foodTunapotato",
-    "foodYorkshirepudding",
-    "foodSesameoil",
-    "foodHotandsoursoup",
-    "foodNoodles",
-    "foodChickenchowmein",
-    "foodKungpaochicken",
-    "foodHoisinsauce",
-    "foodFivespice",
-    "foodCharsiu",
-    "foodSweetandsoursauce",
-    "foodSweetandsourchicken",
-    "foodBaconandeggs",
-    "foodBiscuitsandgravy",
-    "foodApplefritter",
-    "foodSweettea",
-    "foodCreepercookie",
-    "foodPatreonpie",
-    "foodHoneybread",
-    "foodHoneybun",
-    "foodHoneyglazedcarrots",
-    "foodHoneyglazedham",
-    "foodHoneysoyribs",
-    "foodAnchovypepperonipizza",
-    "foodChocovoxels",
-    "foodCinnamontoast",
-    "foodCornedbeefhash",
-    "foodCornedbeef",
-    "foodCottoncandy",
-    "foodCrackers",
-    "foodCreeperwings",
-    "foodDhal",
-    "foodDurianmilkshake",
-    "foodDurianmuffin",
-    "foodHomestylelunch",
-    "foodHotsauce",
-    "foodIronbrew",
-    "foodHummus",
-    "foodLasagna",
-    "foodLemondrizzlecake",
-    "foodMeatloaf",
-    "foodMontecristosandwich",
-    "foodMushroomlasagna",
-    "foodMusselcooked",
-    "foodMusselraw",
-    "foodNetherwings",
-    "foodPizzasoup",
-    "foodPoutine",
-    "foodSalsa",
-    "foodSardineraw",
-    "foodSardinesinhotsauce",
-    "foodTeriyakichicken",
-    "foodToastedwestern",
-    "foodTurkishdelight",
-    "foodCornedbeefbreakfast",
-    "foodGreeneggsandham",
-    "foodSpaghettidinner",
-    "foodTheatrebox",
-    "foodCookiesandmilk",
-    "foodCrackersandcheese",
-    "foodChickendinner",
-    "foodBbqplatter",
-    "foodWeekendpicnic",
-    "foodCorndog",
-    "foodChilidog",
-    "foodHamandcheesesandwich",
-    "foodTunafishsandwich",
-    "foodTunasalad",
-    "foodGrits",
-    "foodSouthernstylebreakfast",
-    "foodChimichanga",
-    "foodClamchowder",
-    "foodBreakfastburrito",
-    "foodButtercookie",
-    "foodSugarcookie",
-    "foodPotatochips",
-    "foodBbqpotatochips",
-    "foodSourcreamandonionpotatochips",
-    "foodCheddarandsourcreampotatochips",
-    "foodTortillachips",
-    "foodChipsandsalsa",
-    "foodChipsanddip",
-    "foodCheezepuffs",
-    "foodSurfandturf",
-    "foodLiverandonions",
-    "foodFortunecookie",
-    "foodDeviledegg",
-    "foodMozzerellasticks",
-    "foodGumbo",
-    "foodJambalaya",
-    "foodSuccotash",
-    "foodEggsbenedict",
-    "foodFriedgreentomatoes",
-    "foodChickenandwaffles",
-    "foodPotatoesobrien",
-    "foodTatertots",
-    "foodSmores",
-    "foodThankfuldinner",
-    "foodSteakfajita",
-    "foodRamen",
-    "foodMisosoup",
-    "foodOnigiri",
-    "foodGrilledcheesevegemitetoast",
-    "foodMonsterfrieddumplings",
-    "foodSalisburysteak",
-    "foodCrispyricepuffcereal",
-    "foodCrispyricepuffbars",
-    "foodBabaganoush",
-    "foodBerryvinaigrettesalad",
-    "foodTomatoherbchicken",
-    "foodPastagardenia",
-    "foodFiestacornsalad",
-    "foodThreebeansalad",
-    "foodSweetandsourmeatballs",
-    "foodPepperjelly",
-    "foodPepperjellyandcrackers",
-    "foodSaltedcaramel",
-    "foodSpidereyepie",
-    "foodCheesyshrimpquinoa",
-    "foodBulgogi",
-    "foodOmurice",
-    "foodKoreandinner",
-    "foodPemmican",
-    "foodDriedsoup",
-    "foodCrabkimbap",
-    "foodFroglegstirfry",
-    "foodCrawfishetoufee",
-    "foodHaggis",
-    "foodChickenkatsu",
-    "foodChocolateorange",
-    "foodFestivalbread",
-    "foodFruitcreamfestivalbread",
-    "foodPho",
-    "foodBubbletea",
-    "foodDuckraw",
-    "foodDuckcooked",
-    "foodWontonsoup",
-    "foodSpringroll",
-    "foodMeatystirfry",
-    "foodPotstickers",
-    "foodOrangeduck",
-    "foodPekingduck",
-    "foodStuffedduck",
-    "foodRoux",
-    "foodCandiedpecans",
-    "foodEnchilada",
-    "foodStuffing",
-    "foodGreenbeancasserole",
-    "foodHamandpineapplepizza",
-    "foodSaucedlambkebab",
-    "foodCobblestonecobbler",
-    "foodCrayfishsalad",
-    "foodCeviche",
-    "foodDeluxenachoes",
-    "foodBakedcactus",
-    "foodGarlicsteak",
-    "foodMushroomsteak",
-    "foodHotdishcasserole",
-    "foodSausagebeanmelt",
-    "foodMettbrotchen",
-    "foodPorkrinds",
-    "foodCracklins",
-    "foodChorusfruitsoup",
-    "foodAkutuq",
-    "foodCantonesegreens",
-    "foodCantonesenoodles",
-    "foodDango",
-    "foodEarlgreytea",
-    "foodEggroll",
-    "foodEggtart",
-    "foodGreentea",
-    "foodMeesua",
-    "foodOystercooked",
-    "foodOysterraw",
-    "foodOystersauce",
-    "foodSpringfieldcashewchicken",
-    "foodSquidinkspaghetti",
-    "foodSteaktartare",
-    "foodSzechuaneggplant",
-    "foodTakoyaki",
-    "oreDimensionalShard",
-    "oreAluminium",
-    "coinAluminium",
-    "dustAluminium",
-    "ingotAluminium",
-    "nuggetAluminium",
-    "gearAluminium",
-    "plateAluminium",
-    "blockChromium",
-    "ingotChromium",
-    "plateChromium",
-    "dustChromium",
-    "dustSmallAluminium",
-    "dustSmallChromium",
-    "nuggetChromium",
-    "sheetAluminium",
-    "coilAluminium",
-    "slabAluminium",
-    "blockSheetmetalAluminium",
-    "slabSheetmetalAluminium",
-    "stickAluminium",
-    "wireAluminium",
-    "fenceAluminium",
-    "scaffoldingAluminium",
-    "crystalAluminum",
-    "crystalShardAluminum",
-    "crystalFragmentAluminum",
-    "universalCable",
-    "battery",
-    "blockSalt",
-    "alloyBasic",
-    "alloyAdvanced",
-    "alloyElite",
-    "alloyUltimate",
-    "dustRefinedObsidian",
-    "nuggetRefinedObsidian",
-    "nuggetOsmium",
-    "nuggetRefinedGlowstone",
-    "blockOsmium",
-    "blockRefinedObsidian",
-    "blockRefinedGlowstone",
-    "dustDirtyIron",
-    "clumpIron",
-    "shardIron",
-    "dustDirtyGold",
-    "clumpGold",
-    "shardGold",
-    "dustOsmium",
-    "dustDirtyOsmium",
-    "clumpOsmium",
-    "shardOsmium",
-    "crystalOsmium",
-    "dustDirtyCopper",
-    "clumpCopper",
-    "shardCopper",
-    "dustDirtyTin",
-    "clumpTin",
-    "shardTin",
-    "dustDirtySilver",
-    "clumpSilver",
-    "shardSilver",
-    "crystalSilver",
-    "dustDirtyLead",
-    "clumpLead",
-    "shardLead",
-    "crystalLead",
-    "oreOsmium",
-    "circuitUltimate",
-    "itemCompressedCarbon",
-    "itemCompressedRedstone",
-    "itemCompressedDiamond",
-    "itemCompressedObsidian",
-    "itemEnrichedAlloy",
-    "itemBioFuel",
-    "slimeballGreen",
-    "slimeballBlue",
-    "slimeballPurple",
-    "slimeballBlood",
-    "slimeballMagma",
-    "nuggetCobalt",
-    "ingotCobalt",
-    "nuggetArdite",
-    "ingotArdite",
-    "blockArdite",
-    "nuggetManyullyn",
-    "ingotManyullyn",
-    "blockManyullyn",
-    "nuggetKnightslime",
-    "ingotKnightslime",
-    "blockKnightslime",
-    "nuggetPigiron",
-    "ingotPigiron",
-    "blockPigiron",
-    "nuggetAlubrass",
-    "ingotAlubrass",
-    "blockAlubrass",
-    "blockMetal",
-    "ingotBrickSeared",
-    "slimecrystal",
-    "slimecrystalGreen",
-    "slimecrystalBlue",
-    "slimecrystalMagma",
-    "oreCobalt",
-    "oreArdite",
-    "partPickHead",
-    "partBinding",
-    "partToolRod",
-    "pattern",
-    "cast",
-    "blockSeared",
-    "blockSlimeCongealed",
-    "blockSlimeDirt",
-    "blockSlimeGrass",
-    "rodStone",
-    "oreEnderBiotite",
-    "gemDimensionalShard",
-    "blockMarble",
-    "oreAstralStarmetal",
-    "ingotAstralStarmetal",
-    "dustAstralStarmetal",
-    "oreAquamarine",
-    "gemAquamarine",
-    "gemCertusQuartz",
-    "gemChargedCertusQuartz",
-    "gemFluix",
-    "fenceAbyssalnite",
-    "fenceArdite",
-    "fenceAstralStarmetal",
-    "fenceBoron",
-    "fenceCobalt",
-    "fenceCopper",
-    "fenceDraconium",
-    "fenceGold",
-    "fenceIridium",
-    "fenceLead",
-    "fenceLiquifiedCoralium",
-    "fenceLithium",
-    "fenceMagnesium",
-    "fenceMithril",
-    "fenceNickel",
-    "fenceOsmium",
-    "fencePlatinum",
-    "fenceSilver",
-    "fenceThorium",
-    "fenceTin",
-    "fenceTitanium",
-    "fenceTungsten",
-    "fenceUranium",
-    "fenceYellorium",
-    "fenceAmber",
-    "fenceAmethyst",
-    "fenceApatite",
-    "fenceAquamarine",
-    "fenceCoal",
-    "fenceCoralium",
-    "fenceDiamond",
-    "fenceDimensionalShard",
-    "fenceEmerald",
-    "fenceEnderBiotite",
-    "fenceLapis",
-    "fenceMalachite",
-    "fencePeridot",
-    "fenceQuartz",
-    "fenceQuartzBlack",
-    "fenceRuby",
-    "fenceSapphire",
-    "fenceTanzanite",
-    "fenceTopaz",
-    "wallArdite",
-    "wallCobalt",
-    "wallCopper",
-    "wallDraconium",
-    "wallGold",
-    "wallIridium",
-    "wallIron",
-    "wallLead",
-    "wallMithril",
-    "wallNickel",
-    "wallOsmium",
-    "wallPlatinum",
-    "wallSilver",
-    "wallTin",
-    "wallTungsten",
-    "wallUranium",
-    "wallYellorium",
-    "wallAmber",
-    "wallAmethyst",
-    "wallApatite",
-    "wallCoal",
-    "wallDiamond",
-    "wallDimensionalShard",
-    "wallEmerald",
-    "wallEnderBiotite",
-    "wallLapis",
-    "wallMalachite",
-    "wallPeridot",
-    "wallQuartz",
-    "wallQuartzBlack",
-    "wallRuby",
-    "wallSapphire",
-    "wallTanzanite",
-    "wallTopaz",
-    "glassHardenedAbyssalnite",
-    "glassHardenedArdite",
-    "glassHardenedAstralStarmetal",
-    "glassHardenedBoron",
-    "glassHardenedCobalt",
-    "glassHardenedDraconium",
-    "glassHardenedGold",
-    "glassHardenedIron",
-    "glassHardenedLiquifiedCoralium",
-    "glassHardenedLithium",
-    "glassHardenedMagnesium",
-    "glassHardenedOsmium",
-    "glassHardenedThorium",
-    "glassHardenedTitanium",
-    "glassHardenedTungsten",
-    "glassHardenedUranium",
-    "glassHardenedYellorium",
-    "blockAmber",
-    "blockAmethyst",
-    "blockDimensionalShard",
-    "blockEnderBiotite",
-    "blockMalachite",
-    "blockQuartzBlack",
-    "blockTanzanite",
-    "blockTopaz",
-    "blockBauxite",
-    "blockCinnabar",
-    "blockGalena",
-    "blockPyrite",
-    "blockSodalite",
-    "blockSphalerite",
-    "crystalClusterArdite",
-    "crystalClusterAstralStarmetal",
-    "crystalClusterBoron",
-    "crystalClusterCobalt",
-    "crystalClusterDraconium",
-    "crystalClusterIridium",
-    "crystalClusterLead",
-    "crystalClusterLithium",
-    "crystalClusterMithril",
-    "crystalClusterNickel",
-    "crystalClusterOsmium",
-    "crystalClusterPlatinum",
-    "crystalClusterSilver",
-    "crystalClusterThorium",
-    "crystalClusterTitanium",
-    "crystalClusterTungsten",
-    "crystalClusterUranium",
-    "crystalClusterYellorium",
-    "dustArdite",
-    "dustCobalt",
-    "dustAquamarine",
-    "dustCoralium",
-    "dustDimensionalShard",
-    "dustEnderBiotite",
-    "nuggetAstralStarmetal",
-    "nuggetBoron",
-    "nuggetLithium",
-    "nuggetMagnesium",
-    "nuggetThorium",
-    "nuggetYellorium",
-    "nuggetAmber",
-    "nuggetAmethyst",
-    "nuggetApatite",
-    "nuggetAquamarine",
-    "nuggetCoal",
-    "nuggetCoralium",
-    "nuggetDimensionalShard",
-    "nuggetEnderBiotite",
-    "nuggetLapis",
-    "nuggetMalachite",
-    "nuggetPeridot",
-    "nuggetQuartz",
-    "nuggetQuartzBlack",
-    "nuggetRuby",
-    "nuggetSapphire",
-    "nuggetTanzanite",
-    "nuggetTopaz",
-    "coinAbyssalnite",
-    "coinArdite",
-    "coinAstralStarmetal",
-    "coinBoron",
-    "coinCobalt",
-    "coinDraconium",
-    "coinLiquifiedCoralium",
-    "coinLithium",
-    "coinMagnesium",
-    "coinOsmium",
-    "coinThorium",
-    "coinTitanium",
-    "coinTungsten",
-    "coinUranium",
-    "coinYellorium",
-    "gearAbyssalnite",
-    "gearArdite",
-    "gearAstralStarmetal",
-    "gearBoron",
-    "gearCobalt",
-    "gearDraconium",
-    "gearLiquifiedCoralium",
-    "gearLithium",
-    "gearMagnesium",
-    "gearOsmium",
-    "gearThorium",
-    "gearTungsten",
-    "gearUranium",
-    "gearYellorium",
-    "gearAmber",
-    "gearAmethyst",
-    "gearApatite",
-    "gearAquamarine",
-    "gearCoal",
-    "gearCoralium",
-    "gearDimensionalShard",
-    "gearEmerald",
-    "gearEnderBiotite",
-    "gearLapis",
-    "gearMalachite",
-    "gearPeridot",
-    "gearQuartz",
-    "gearQuartzBlack",
-    "gearRuby",
-    "gearSapphire",
-    "gearTanzanite",
-    "gearTopaz",
-    "plateAbyssalnite",
-    "plateArdite",
-    "plateAstralStarmetal",
-    "plateBoron",
-    "plateCobalt",
-    "plateDraconium",
-    "plateLiquifiedCoralium",
-    "plateLithium",
-    "plateMagnesium",
-    "plateOsmium",
-    "plateThorium",
-    "plateYellorium",
-    "plateAmber",
-    "plateAmethyst",
-    "plateApatite",
-    "plateAquamarine",
-    "plateCoralium",
-    "plateDimensionalShard",
-    "plateEnderBiotite",
-    "plateMalachite",
-    "plateQuartz",
-    "plateQuartzBlack",
-    "plateTanzanite",
-    "plateTopaz",
-    "stickAbyssalnite",
-    "stickArdite",
-    "stickAstralStarmetal",
-    "stickBoron",
-    "stickCobalt",
-    "stickDraconium",
-    "stickGold",
-    "stickLead",
-    "stickLiquifiedCoralium",
-    "stickLithium",
-    "stickMagnesium",
-    "stickMithril",
-    "stickNickel",
-    "stickOsmium",
-    "stickPlatinum",
-    "stickSilver",
-    "stickThorium",
-    "stickTin",
-    "stickTungsten",
-    "stickUranium",
-    "stickYellorium",
-    "stickAmber",
-    "stickAmethyst",
-    "stickApatite",
-    "stickAquamarine",
-    "stickCoal",
-    "stickCoralium",
-    "stickDiamond",
-    "stickDimensionalShard",
-    "stickEmerald",
-    "stickEnderBiotite",
-    "stickLapis",
-    "stickMalachite",
-    "stickPeridot",
-    "stickQuartz",
-    "stickQuartzBlack",
-    "stickRuby",
-    "stickSapphire",
-    "stickTanzanite",
-    "stickTopaz",
-    "dustDirtyAbyssalnite",
-    "dustDirtyAluminium",
-    "dustDirtyArdite",
-    "dustDirtyAstralStarmetal",
-    "dustDirtyBoron",
-    "dustDirtyCobalt",
-    "dustDirtyDraconium",
-    "dustDirtyIridium",
-    "dustDirtyLiquifiedCoralium",
-    "dustDirtyLithium",
-    "dustDirtyMagnesium",
-    "dustDirtyMithril",
-    "dustDirtyNickel",
-    "dustDirtyPlatinum",
-    "dustDirtyThorium",
-    "dustDirtyTitanium",
-    "dustDirtyTungsten",
-    "dustDirtyUranium",
-    "dustDirtyYellorium",
-    "clumpAbyssalnite",
-    "clumpAluminium",
-    "clumpArdite",
-    "clumpAstralStarmetal",
-    "clumpBoron",
-    "clumpCobalt",
-    "clumpDraconium",
-    "clumpIridium",
-    "clumpLiquifiedCoralium",
-    "clumpLithium",
-    "clumpMagnesium",
-    "clumpMithril",
-    "clumpNickel",
-    "clumpPlatinum",
-    "clumpThorium",
-    "clumpTitanium",
-    "clumpTungsten",
-    "clumpUranium",
-    "clumpYellorium",
-    "shardAbyssalnite",
-    "shardAluminium",
-    "shardArdite",
-    "shardAstralStarmetal",
-    "shardBoron",
-    "shardCobalt",
-    "shardDraconium",
-    "shardIridium",
-    "shardLiquifiedCoralium",
-    "shardLithium",
-    "shardMagnesium",
-    "shardMithril",
-    "shardNickel",
-    "shardPlatinum",
-    "shardThorium",
-    "shardTitanium",
-    "shardTungsten",
-    "shardUranium",
-    "shardYellorium",
-    "crystalArdite",
-    "crystalAstralStarmetal",
-    "crystalBoron",
-    "crystalCobalt",
-    "crystalDraconium",
-    "crystalIridium",
-    "crystalLiquifiedCoralium",
-    "crystalLithium",
-    "crystalMithril",
-    "crystalNickel",
-    "crystalPlatinum",
-    "crystalThorium",
-    "crystalTitanium",
-    "crystalTungsten",
-    "crystalUranium",
-    "crystalYellorium",
-    "crushedAbyssalnite",
-    "crushedAluminium",
-    "crushedArdite",
-    "crushedAstralStarmetal",
-    "crushedBoron",
-    "crushedCobalt",
-    "crushedDraconium",
-    "crushedIridium",
-    "crushedLiquifiedCoralium",
-    "crushedLithium",
-    "crushedMagnesium",
-    "crushedMithril",
-    "crushedNickel",
-    "crushedOsmium",
-    "crushedPlatinum",
-    "crushedThorium",
-    "crushedTitanium",
-    "crushedTungsten",
-    "crushedYellorium",
-    "crushedPurifiedAbyssalnite",
-    "crushedPurifiedAluminium",
-    "crushedPurifiedArdite",
-    "crushedPurifiedAstralStarmetal",
-    "crushedPurifiedBoron",
-    "crushedPurifiedCobalt",
-    "crushedPurifiedDraconium",
-    "crushedPurifiedIridium",
-    "crushedPurifiedLiquifiedCoralium",
-    "crushedPurifiedLithium",
-    "crushedPurifiedMagnesium",
-    "crushedPurifiedMithril",
-    "crushedPurifiedNickel",
-    "crushedPurifiedOsmium",
-    "crushedPurifiedPlatinum",
-    "crushedPurifiedThorium",
-    "crushedPurifiedTitanium",
-    "crushedPurifiedTungsten",
-    "crushedPurifiedYellorium",
-    "dustTinyAbyssalnite",
-    "dustTinyAluminium",
-    "dustTinyArdite",
-    "dustTinyAstralStarmetal",
-    "dustTinyBoron",
-    "dustTinyCobalt",
-    "dustTinyDraconium",
-    "dustTinyIridium",
-    "dustTinyLiquifiedCoralium",
-    "dustTinyMagnesium",
-    "dustTinyMithril",
-    "dustTinyNickel",
-    "dustTinyOsmium",
-    "dustTinyPlatinum",
-    "dustTinyThorium",
-    "dustTinyTitanium",
-    "dustTinyTungsten",
-    "dustTinyUranium",
-    "dustTinyYellorium",
-    "dustTinyAmber",
-    "dustTinyAmethyst",
-    "dustTinyApatite",
-    "dustTinyAquamarine",
-    "dustTinyCoal",
-    "dustTinyCoralium",
-    "dustTinyDiamond",
-    "dustTinyDimensionalShard",
-    "dustTinyEmerald",
-    "dustTinyEnderBiotite",
-    "dustTinyMalachite",
-    "dustTinyPeridot",
-    "dustTinyQuartz",
-    "dustTinyQuartzBlack",
-    "dustTinyRuby",
-    "dustTinySapphire",
-    "dustTinyTanzanite",
-    "dustTinyTopaz",
-    "crystalFragmentArdite",
-    "crystalFragmentAstralStarmetal",
-    "crystalFragmentBoron",
-    "crystalFragmentCobalt",
-    "crystalFragmentDraconium",
-    "crystalFragmentIridium",
-    "crystalFragmentLead",
-    "crystalFragmentLithium",
-    "crystalFragmentMithril",
-    "crystalFragmentNickel",
-    "crystalFragmentOsmium",
-    "crystalFragmentPlatinum",
-    "crystalFragmentSilver",
-    "crystalFragmentThorium",
-    "crystalFragmentTitanium",
-    "crystalFragmentTungsten",
-    "crystalFragmentUranium",
-    "crystalFragmentYellorium",
-    "crystalShardArdite",
-    "crystalShardAstralStarmetal",
-    "crystalShardBoron",
-    "crystalShardCobalt",
-    "crystalShardDraconium",
-    "crystalShardIridium",
-    "crystalShardLead",
-    "crystalShardLithium",
-    "crystalShardMithril",
-    "crystalShardNickel",
-    "crystalShardOsmium",
-    "crystalShardPlatinum",
-    "crystalShardSilver",
-    "crystalShardThorium",
-    "crystalShardTitanium",
-    "crystalShardTungsten",
-    "crystalShardUranium",
-    "crystalShardYellorium",
-    "dustSmallAbyssalnite",
-    "dustSmallArdite",
-    "dustSmallAstralStarmetal",
-    "dustSmallBoron",
-    "dustSmallCobalt",
-    "dustSmallDraconium",
-    "dustSmallIridium",
-    "dustSmallLiquifiedCoralium",
-    "dustSmallLithium",
-    "dustSmallMithril",
-    "dustSmallOsmium",
-    "dustSmallThorium",
-    "dustSmallUranium",
-    "dustSmallYellorium",
-    "dustSmallAmber",
-    "dustSmallAmethyst",
-    "dustSmallApatite",
-    "dustSmallAquamarine",
-    "dustSmallCoralium",
-    "dustSmallDimensionalShard",
-    "dustSmallEnderBiotite",
-    "dustSmallLapis",
-    "dustSmallMalachite",
-    "dustSmallQuartz",
-    "dustSmallQuartzBlack",
-    "dustSmallTanzanite",
-    "dustSmallTopaz",
-    "dustSmallDilithium",
-    "rodAbyssalnite",
-    "rodArdite",
-    "rodAstralStarmetal",
-    "rodBoron",
-    "rodCobalt",
-    "rodDraconium",
-    "rodGold",
-    "rodLead",
-    "rodLiquifiedCoralium",
-    "rodLithium",
-    "rodMagnesium",
-    "rodMithril",
-    "rodNickel",
-    "rodOsmium",
-    "rodPlatinum",
-    "rodSilver",
-    "rodThorium",
-    "rodTin",
-    "rodTungsten",
-    "rodUranium",
-    "rodYellorium",
-    "rodAmber",
-    "rodAmethyst",
-    "rodApatite",
-    "rodAquamarine",
-    "rodCoal",
-    "rodCoralium",
-    "rodDiamond",
-    "rodDimensionalShard",
-    "rodEmerald",
-    "rodEnderBiotite",
-    "rodLapis",
-    "rodMalachite",
-    "rodPeridot",
-    "rodQuartz",
-    "rodQuartzBlack",
-    "rodRuby",
-    "rodSapphire",
-    "rodTanzanite",
-    "rodTopaz",
-    "dustEnder",
-    "glass",
-    "wool",
-    "crystalNetherQuartz",
-    "dustCertusQuartz",
-    "dustFluix",
-    "itemIlluminatedPanel",
-    "bowlWood",
-    "cropMaloberry",
-    "ingotHoneyComb",
-    "clayPorcelain",
-    "itemSilicon",
-    "crystalPladium",
-    "crystalLonsdaleite",
-    "crystalLitherite",
-    "crystalKyronite",
-    "crystalIonite",
-    "crystalErodium",
-    "crystalAethium",
-    "blockAethium",
-    "etLaserLens",
-    "blockIonite",
-    "blockPladium",
-    "blockKyronite",
-    "blockErodium",
-    "blockLitherite",
-    "etLaserLensColored",
-    "etSolarCell",
-    "dustVile",
-    "dustCorrupted",
-    "ingotCorrupted",
-    "gemEndimium",
-    "itemSkull",
-    "gemPearl",
-    "blockPearl",
-    "bed",
-    "dustWheat",
-    "pearlFluix",
-    "blockStainedHardenedClay",
-    "crystalPureFluix",
-    "oreCertusQuartz",
-    "oreChargedCertusQuartz",
-    "ingotDawnstone",
-    "nuggetDawnstone",
-    "blockDawnstone",
-    "plateDawnstone",
-    "plant",
-    "rootsHerb",
-    "shardGlass",
-    "steelAxe",
-    "steelPickaxe",
-    "steelShovel",
-    "obsidianAxe",
-    "obsidianPickaxe",
-    "obsidianShovel",
-    "bronzeAxe",
-    "bronzePickaxe",
-    "bronzeShovel",
-    "fieryItem",
-    "fieryBlock",
-    "creativeATMStar",
-    "astralGemCrystals",
-    "blockSlate",
-    "stoneSlate",
-    "oreDimensional",
-    "buttonWood",
-    "listAllSeed",
-    "seed",
-    "blockMagma",
-    "fusionExtreme",
-    "uuMatterItem",
-    "beehiveForestry",
-    "basicPump",
-    "growGlass",
-    "nuclearcraftDepletedRod",
-    "ic2DepletedRod",
-    "chunkloaderUpgrade",
-    "itemBattery",
-    "blockMotor",
-    "dustThermite",
-    "ingotCarbon",
-    "waferSilicon",
-    "itemLens",
-    "turfMoon",
-    "blockPsiDust",
-    "blockPsiMetal",
-    "blockPsiGem",
-    "blockCandle",
-    "stonePolished",
-    "plankStained",
-    "listAllGrain",
-    "foodEqualswheat",
-    "dustSulphur",
-    "cropBlightberry",
-    "cropDuskberry",
-    "cropSkyberry",
-    "cropStingberry",
-    "taintedSoil",
-    "glassSoul",
-    "cropVine",
-    "tallgrass",
-    "lilypad",
-    "mushroom",
-    "hopper",
-    "cropBeetroot",
-    "blockNetherWart",
-    "blockBone",
-    "shulkerShell",
-    "shulkerBox",
-    "rail",
-    "arrow",
-    "careerBeesYing",
-    "careerBeesYang",
-    "plateClayRaw",
-    "plateClay",
-    "plateBrick",
-    "oc:adapter",
-    "oc:assembler",
-    "oc:cable",
-    "oc:capacitor",
-    "oc:case1",
-    "oc:case3",
-    "oc:case2",
-    "oc:chameliumBlock",
-    "oc:charger",
-    "oc:disassembler",
-    "oc:diskDrive",
-    "oc:geolyzer",
-    "oc:hologram1",
-    "oc:hologram2",
-    "oc:keyboard",
-    "oc:motionSensor",
-    "oc:powerConverter",
-    "oc:powerDistributor",
-    "oc:printer",
-    "oc:raid",
-    "oc:redstone",
-    "oc:relay",
-    "oc:screen1",
-    "oc:screen3",
-    "oc:screen2",
-    "oc:rack",
-    "oc:waypoint",
-    "oc:netSplitter",
-    "oc:transposer",
-    "oc:carpetedCapacitor",
-    "oc:materialCuttingWire",
-    "oc:materialAcid",
-    "oc:materialCircuitBoardRaw",
-    "oc:materialCircuitBoard",
-    "oc:materialCircuitBoardPrinted",
-    "oc:materialCard",
-    "oc:materialTransistor",
-    "oc:circuitChip1",
-    "oc:circuitChip2",
-    "oc:circuitChip3",
-    "oc:materialALU",
-    "oc:materialCU",
-    "oc:materialDisk",
-    "oc:materialInterweb",
-    "oc:materialButtonGroup",
-    "oc:materialArrowKey",
-    "oc:materialNumPad",
-    "oc:tabletCase1",
-    "oc:tabletCase2",
-    "oc:microcontrollerCase1",
-    "oc:microcontrollerCase2",
-    "oc:droneCase1",
-    "oc:droneCase2",
-    "oc:inkCartridgeEmpty",
-    "oc:inkCartridge",
-    "oc:chamelium",
-    "oc:analyzer",
-    "oc:terminal",
-    "oc:texturePicker",
-    "oc:manual",
-    "oc:wrench",
-    "oc:hoverBoots",
-    "oc:nanomachines",
-    "oc:cpu1",
-    "oc:cpu2",
-    "oc:cpu3",
-    "oc:componentBus1",
-    "oc:componentBus2",
-    "oc:componentBus3",
-    "oc:ram1",
-    "oc:ram2",
-    "oc:ram3",
-    "oc:ram4",
-    "oc:ram5",
-    "oc:ram6",
-    "oc:server1",
-    "oc:server2",
-    "oc:server3",
-    "oc:apu1",
-    "oc:apu2",
-    "oc:terminalServer",
-    "oc:diskDriveMountable",
-    "oc:graphicsCard1",
-    "oc:graphicsCard2",
-    "oc:graphicsCard3",
-    "oc:redstoneCard1",
-    "oc:redstoneCard2",
-    "oc:lanCard",
-    "oc:wlanCard2",
-    "oc:internetCard",
-    "oc:linkedCard",
-    "oc:dataCard1",
-    "oc:dataCard2",
-    "oc:dataCard3",
-    "oc:angelUpgrade",
-    "oc:batteryUpgrade1",
-    "oc:batteryUpgrade2",
-    "oc:batteryUpgrade3",
-    "oc:chunkloaderUpgrade",
-    "oc:cardContainer1",
-    "oc:cardContainer2",
-    "oc:cardContainer3",
-    "oc:upgradeContainer1",
-    "oc:upgradeContainer2",
-    "oc:upgradeContainer3",
-    "oc:craftingUpgrade",
-    "oc:databaseUpgrade1",
-    "oc:databaseUpgrade2",
-    "oc:databaseUpgrade3",
-    "oc:experienceUpgrade",
-    "oc:generatorUpgrade",
-    "oc:inventoryUpgrade",
-    "oc:inventoryControllerUpgrade",
-    "oc:navigationUpgrade",
-    "oc:pistonUpgrade",
-    "oc:signUpgrade",
-    "oc:solarGeneratorUpgrade",
-    "oc:tankUpgrade",
-    "oc:tankControllerUpgrade",
-    "oc:tractorBeamUpgrade",
-    "oc:leashUpgrade",
-    "oc:hoverUpgrade1",
-    "oc:hoverUpgrade2",
-    "oc:tradingUpgrade",
-    "oc:mfu",
-    "oc:wlanCard1",
-    "oc:eeprom",
-    "oc:floppy",
-    "oc:hdd1",
-    "oc:hdd2",
-    "oc:hdd3",
-    "blockWither",
-    "blockLonsdaleite",
-    "blockCompactRawPorkchop",
-    "oreProsperity",
-    "oreNetherProsperity",
-    "oreEndProsperity",
-    "oreInferium",
-    "oreNetherInferium",
-    "oreEndInferium",
-    "oreEndimium",
-    "oreBurnium",
-    "blockEndimium",
-    "blockBurnium",
-    "gateWood",
-    "cropPricklyPear",
-    "cropGrapes",
-    "cropLifeFruit",
-    "cropDeathFruit",
-    "listAllCitrus",
-    "gemBurnium",
-    "dustTinyBurnium",
-    "dustBurnium",
-    "dustTinyEndimium",
-    "dustEndimium",
-    "dustTinyEnder",
-    "dustTinyRedstone",
-    "lumpSandstone",
-    "lumpGravel",
-    "lumpRedSandstone",
-]
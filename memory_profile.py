@@ -0,0 +1,201 @@
+import sys
+import tracemalloc
+import unittest
+from collections import OrderedDict
+
+try:
+    import resource  # Unix only.
+except ImportError:
+    resource = None
+
+# Per-stage memory profiling with tracemalloc.
+#
+# A snapshot is taken at the start and end of every stage. For each stage we report:
+#  - the net memory the stage left allocated (i.e. the rows it produced),
+#  - the peak traced memory while the stage was running, above what was allocated when it started,
+#  - the top allocation sites, by file and line,
+#  - bytes per row, for stages that were told how many rows they handled.
+#
+# tracemalloc only sees memory allocated through Python's allocator. lxml builds its trees with libxml2, which
+# calls malloc() directly, so most of the memory behind an lxml tree doesn't show up here. The maximum RSS is
+# printed as well so that the difference can be seen.
+
+# Allocations made by the profiler itself aren't interesting.
+_ignored = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class StageMemory:
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+        self.net_bytes = 0
+        self.peak_bytes = 0
+        self.top_sites = []  # list of (site, size_diff_bytes, count_diff)
+
+    @property
+    def bytes_per_row(self):
+        if not self.rows:
+            return None
+        return self.net_bytes / self.rows
+
+
+class _NullStage:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class _Stage:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.memory = StageMemory(name)
+
+    @property
+    def rows(self):
+        return self.memory.rows
+
+    @rows.setter
+    def rows(self, value):
+        self.memory.rows = value
+
+    def __enter__(self):
+        self.before = tracemalloc.take_snapshot().filter_traces(_ignored)
+        tracemalloc.reset_peak()
+        self.current_before = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(_ignored)
+
+        self.memory.net_bytes = current - self.current_before
+        self.memory.peak_bytes = peak - self.current_before
+        for stat in after.compare_to(self.before, "lineno")[:self.profiler.top]:
+            frame = stat.traceback[0]
+            site = "%s:%d" % (frame.filename, frame.lineno)
+            self.memory.top_sites.append((site, stat.size_diff, stat.count_diff))
+
+        self.profiler.stages[self.memory.name] = self.memory
+        return False
+
+
+class MemoryProfiler:
+    # Usage:
+    #
+    # profiler = MemoryProfiler(enabled=args.profile_memory)
+    # with profiler:
+    #     with profiler.stage("get_table_data") as stage:
+    #         table_data = get_table_data(worksheet, table)
+    #         stage.rows = len(table_data)
+    # print(profiler.report())
+    #
+    # A disabled profiler hands out do-nothing stages, so the calling code doesn't need two code paths.
+
+    def __init__(self, enabled=True, top=10):
+        self.enabled = enabled
+        self.top = top
+        self.stages = OrderedDict()
+        self.overall_peak_bytes = 0
+
+    def __enter__(self):
+        if self.enabled:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.enabled:
+            self.overall_peak_bytes = max([s.peak_bytes for s in self.stages.values()] + [0])
+            tracemalloc.stop()
+        return False
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NullStage()
+        return _Stage(self, name)
+
+    def report(self) -> str:
+        lines = []
+        for memory in self.stages.values():
+            line = "%s: net %s, peak %s" % (memory.name, _format_bytes(memory.net_bytes),
+                                            _format_bytes(memory.peak_bytes))
+            if memory.bytes_per_row is not None:
+                line += ", %s per row (%d rows)" % (_format_bytes(memory.bytes_per_row), memory.rows)
+            lines.append(line)
+            for site, size_diff, count_diff in memory.top_sites:
+                lines.append("    %10s %+9d blocks  %s" % (_format_bytes(size_diff), count_diff, site))
+
+        lines.append("Peak traced memory in any stage: %s" % _format_bytes(self.overall_peak_bytes))
+        max_rss = _max_rss_bytes()
+        if max_rss is not None:
+            lines.append("Maximum RSS of the process: %s (includes memory tracemalloc can't see, i.e. libxml2)"
+                         % _format_bytes(max_rss))
+        return "\n".join(lines)
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux, and in bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _format_bytes(n) -> str:
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return "%s%.1f %s" % (sign, n, unit)
+        n /= 1024
+    return "%s%.1f GiB" % (sign, n)
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def test_stage_records_allocations(self):
+        with MemoryProfiler(top=3) as profiler:
+            with profiler.stage("allocate") as stage:
+                data = [{"value": i} for i in range(10000)]
+                stage.rows = len(data)
+
+        memory = profiler.stages["allocate"]
+        self.assertGreater(memory.net_bytes, 10000 * 50)
+        self.assertGreaterEqual(memory.peak_bytes, memory.net_bytes)
+        self.assertGreater(memory.bytes_per_row, 50)
+        self.assertTrue(any(site.startswith(__file__) for site, size, count in memory.top_sites))
+        self.assertFalse(tracemalloc.is_tracing())
+        del data
+
+    def test_report(self):
+        with MemoryProfiler() as profiler:
+            with profiler.stage("get_table_data") as stage:
+                data = ["x" * 100 for _ in range(100)]
+                stage.rows = 100
+        report = profiler.report()
+        self.assertIn("get_table_data: net", report)
+        self.assertIn("per row (100 rows)", report)
+        del data
+
+    def test_disabled(self):
+        with MemoryProfiler(enabled=False) as profiler:
+            with profiler.stage("get_table_data") as stage:
+                stage.rows = 10
+            self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(profiler.stages, {})
+
+    def test_format_bytes(self):
+        self.assertEqual(_format_bytes(512), "512.0 B")
+        self.assertEqual(_format_bytes(1536), "1.5 KiB")
+        self.assertEqual(_format_bytes(-3 * 1024 * 1024), "-3.0 MiB")
+
+
+if __name__ == '__main__':
+    unittest.main()
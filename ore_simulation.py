@@ -0,0 +1,305 @@
+import argparse
+import math
+import time
+import unittest
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from excel_table import TableLocation, iter_workbook_tables
+from presets import PresetResolver
+from setting_sampling import SettingDistribution, SettingTable, generator, row_settings as _row_settings, sample
+
+# Estimates how much ore a Veins distribution places per chunk, by simulating millions of chunks with NumPy.
+# This replaces the hand formulas of "Ore Amount Calculation Assistant.xlsx", which only work with the avg of each
+# setting and so can't say what a "normal" or "uniform" spread does to the amount of ore.
+#
+# Usage:
+#   python ore_simulation.py "Sprocket2 Spreadsheet.xlsx" --chunks 1000000 --salt 1 --histogram
+#
+# The model is the spreadsheet's, with every setting drawn from its avg, range and type by setting_sampling:
+#   motherlodes per chunk:    MotherlodeFrequency (the fraction is the chance of one more)
+#   motherlode:               a sphere of radius MotherlodeSize
+#   branches per motherlode:  BranchFrequency (the fraction is the chance of one more)
+#   branch:                   a cylinder of radius SegmentRadius and length BranchLength
+#   ore:                      OreDensity * (volume of the motherlode and its branches)
+# One OreDensity is drawn per motherlode, for it and its branches. Overlap, clipping at bedrock and ground level and
+# blocks that can't be replaced are not modelled.
+#
+# Chunks are simulated in batches. Each batch draws every motherlode of every chunk in one array, then every branch
+# of every motherlode in another, and adds them back up per chunk with np.bincount(), so the work is a handful of
+# NumPy calls per batch whatever the settings are. Each distribution's random numbers come from its own generator,
+# seeded by its seed attribute (or name), so its estimate doesn't change when other distributions are added.
+
+simulated_settings = ("MotherlodeFrequency", "MotherlodeSize", "BranchFrequency", "BranchLength", "SegmentRadius",
+                      "OreDensity")
+
+# The settings drawn once per motherlode, and once per branch.
+motherlode_settings = ("MotherlodeSize", "BranchFrequency", "OreDensity")
+branch_settings = ("BranchLength", "SegmentRadius")
+
+# Values for settings that a row, and everything it inherits, leaves blank. The other settings are required.
+setting_defaults = {"BranchFrequency": 0.0, "BranchLength": 0.0, "SegmentRadius": 0.0, "OreDensity": 1.0}
+
+# The table whose rows are Veins distributions.
+veins_table = "Veins_Presets"
+
+default_chunks = 1000000
+default_batch_size = 1 << 18
+default_percentiles = (5, 25, 50, 75, 95)
+default_bins = 20
+
+# Quantiles per setting for expected_ore().
+default_quantiles = 32
+
+# percentiles is an OrderedDict of percentile -> ore per chunk. histogram is (counts, bin edges) as from
+# np.histogram(). analytic is the spreadsheet's estimate, from the avg of each setting.
+OreEstimate = namedtuple("OreEstimate", "workbook name cell chunks mean std percentiles histogram analytic")
+
+
+def row_settings(row, bindings=None) -> OrderedDict:
+    # The simulated settings of a resolved row, as {setting name: SettingDistribution}.
+    # ":=" expressions are evaluated with bindings (by default, cog_expressions.default_bindings).
+    # Raises ValueError if a required setting is blank, or a cell can't be evaluated.
+    return _row_settings(row, simulated_settings, bindings, setting_defaults)
+
+
+def counts_from_frequencies(frequencies, rng) -> np.ndarray:
+    # Whole numbers from frequencies: the integer part of each, plus one more with a chance of its fractional part.
+    # So a frequency of 0.25 gives one in four chunks a motherlode.
+    counts = np.floor(frequencies)
+    counts += rng.random(len(frequencies)) < frequencies - counts
+    return counts.astype(np.int64)
+
+
+def analytic_mean(settings) -> float:
+    # The spreadsheet's ore per chunk: every setting at its avg. Also works for {setting name: SettingTable}, giving
+    # an array.
+    avg = {name: setting.avg for name, setting in settings.items()}
+    motherlode = 4.0 / 3.0 * math.pi * avg["MotherlodeSize"] ** 3
+    branches = avg["BranchFrequency"] * math.pi * avg["SegmentRadius"] ** 2 * avg["BranchLength"]
+    return avg["MotherlodeFrequency"] * avg["OreDensity"] * (motherlode + branches)
+
+
+def expected_ore(settings_list, quantiles=default_quantiles):
+    # The expected ore per chunk of the model above, for many settings at once and without sampling.
+    # Returns two arrays, one value per item of settings_list: the ore in motherlodes, and the ore in branches.
+    return expected_ore_columns(OrderedDict((name, SettingTable.from_column(settings_list, name))
+                                            for name in simulated_settings), quantiles)
+
+
+def expected_ore_columns(columns, quantiles=default_quantiles):
+    # The same as expected_ore(), for {setting name: SettingTable} with a row per distribution. The mean of each
+    # setting (or of its cube or square, where the model needs that) is taken over its values at evenly spaced
+    # quantiles, for every distribution in one array per setting.
+    means = {}
+    for name in simulated_settings:
+        values = np.maximum(columns[name].quantiles(quantiles), 0.0)
+        power = 3 if name == "MotherlodeSize" else 2 if name == "SegmentRadius" else 1
+        means[name] = (values ** power).mean(axis=1)
+    motherlodes = means["MotherlodeFrequency"] * means["OreDensity"]
+    return (motherlodes * 4.0 / 3.0 * math.pi * means["MotherlodeSize"],
+            motherlodes * means["BranchFrequency"] * math.pi * means["SegmentRadius"] * means["BranchLength"])
+
+
+def _simulate_batch(settings, chunks, rng) -> np.ndarray:
+    # settings is (frequency, motherlode table, branch table); none of the values drawn may be negative.
+    frequency, motherlode_table, branch_table = settings
+    motherlodes = counts_from_frequencies(np.maximum(sample(frequency, chunks, rng), 0.0), rng)
+    total = int(motherlodes.sum())
+    if total == 0:
+        return np.zeros(chunks)
+
+    sizes, branch_frequencies, densities = np.maximum(motherlode_table.sample(total, rng), 0.0)
+    volumes = sizes ** 3 * (4.0 / 3.0 * math.pi)
+    branches = counts_from_frequencies(branch_frequencies, rng)
+    total_branches = int(branches.sum())
+    if total_branches:
+        lengths, radii = np.maximum(branch_table.sample(total_branches, rng), 0.0)
+        owners = np.repeat(np.arange(total), branches)
+        volumes += np.bincount(owners, weights=math.pi * radii * radii * lengths, minlength=total)
+    ores = volumes * densities
+    return np.bincount(np.repeat(np.arange(chunks), motherlodes), weights=ores, minlength=chunks)
+
+
+@instrumentation.timed("simulate_veins")
+def simulate(settings, chunks=default_chunks, seed=None, batch_size=default_batch_size) -> np.ndarray:
+    # Ore per chunk for each of chunks simulated chunks. seed is a seed or a np.random.Generator, i.e. from
+    # setting_sampling.generator(row); the same seed gives the same result.
+    rng = np.random.default_rng(seed)
+    tables = (settings["MotherlodeFrequency"],
+              SettingTable.from_settings(OrderedDict((name, settings[name]) for name in motherlode_settings)),
+              SettingTable.from_settings(OrderedDict((name, settings[name]) for name in branch_settings)))
+    result = np.empty(chunks)
+    for start in range(0, chunks, batch_size):
+        stop = min(start + batch_size, chunks)
+        result[start:stop] = _simulate_batch(tables, stop - start, rng)
+    if instrumentation.is_enabled():
+        instrumentation.count("simulate_veins", "chunks", chunks)
+    return result
+
+
+def estimate(settings, chunks=default_chunks, seed=None, percentiles=default_percentiles, bins=default_bins,
+             workbook=None, name=None, cell=None) -> OreEstimate:
+    ores = simulate(settings, chunks, seed)
+    return OreEstimate(workbook, name, cell, chunks, float(ores.mean()), float(ores.std()),
+                       OrderedDict(zip(percentiles, np.percentile(ores, percentiles).tolist())),
+                       np.histogram(ores, bins), analytic_mean(settings))
+
+
+def veins_distributions(tables):
+    # Yields (row, cell, resolved row) for every enabled Veins distribution in tables (as produced by
+    # iter_workbook_tables()). The resolved row has the values it inherits filled in.
+    tables = list(tables)
+    resolver = PresetResolver(row for table_name, table_data, location in tables for row in table_data)
+    for table_name, table_data, location in tables:
+        if table_name != veins_table:
+            continue
+        for row_index, row in enumerate(table_data):
+            if row.get("Type") == "Distribution" and not row.get("OFF?"):
+                yield row, location.row_reference(row_index), resolver.resolve(row)
+
+
+def estimate_tables(workbook, tables, chunks=default_chunks, salt=0, bindings=None, **options):
+    # Estimates every enabled Veins distribution in tables, each with the generator of its seed; a different salt
+    # gives another, independent, run.
+    # Returns (estimates, skipped): a list of OreEstimate, and a list of (cell, name, reason) for the rows whose
+    # settings couldn't be worked out.
+    estimates, skipped = [], []
+    for row, cell, resolved in veins_distributions(tables):
+        try:
+            settings = row_settings(resolved, bindings)
+        except ValueError as e:
+            skipped.append((cell, row.get("name"), str(e)))
+            continue
+        estimates.append(estimate(settings, chunks, generator(row, salt), workbook=workbook, name=row.get("name"),
+                                  cell=cell, **options))
+    return estimates, skipped
+
+
+def format_estimate(estimate: OreEstimate, histogram=False) -> str:
+    text = "%s %s: %.2f ore/chunk (std %.2f; spreadsheet %.2f); %s" % (
+        estimate.cell, estimate.name, estimate.mean, estimate.std, estimate.analytic,
+        ", ".join("p%g %.1f" % (p, value) for p, value in estimate.percentiles.items()))
+    if histogram:
+        counts, edges = estimate.histogram
+        widest = max(counts.max(), 1)
+        for count, low, high in zip(counts, edges, edges[1:]):
+            text += "\n  %10.1f - %-10.1f %9d %s" % (low, high, count, "#" * int(round(40 * count / widest)))
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate the ore per chunk of Veins distributions.")
+    parser.add_argument("workbooks", nargs="+", help="Excel workbooks (.xlsx) to read distributions from.")
+    parser.add_argument("--chunks", type=int, default=default_chunks, help="Chunks to simulate per distribution.")
+    parser.add_argument("--salt", type=int, default=0,
+                        help="Combined with each distribution's seed; change it for another independent run.")
+    parser.add_argument("--bins", type=int, default=default_bins, help="Number of histogram bins.")
+    parser.add_argument("--histogram", action="store_true", help="Print a histogram of each distribution.")
+    args = parser.parse_args(argv)
+
+    for path in args.workbooks:
+        start = time.perf_counter()
+        estimates, skipped = estimate_tables(path, iter_workbook_tables(openpyxl.load_workbook(path)), args.chunks,
+                                             args.salt, bins=args.bins)
+        for result in estimates:
+            print(format_estimate(result, args.histogram))
+        for cell, name, reason in skipped:
+            print("%s %s: skipped, %s" % (cell, name, reason))
+        print("%s: %d distributions in %.2fs" % (path, len(estimates), time.perf_counter() - start))
+
+
+def _settings(**values):
+    settings = OrderedDict((name, SettingDistribution(setting_defaults.get(name, 0.0), 0.0, "uniform"))
+                           for name in simulated_settings)
+    settings.update(values)
+    return settings
+
+
+class TestSettings(unittest.TestCase):
+    def test_counts(self):
+        counts = counts_from_frequencies(np.full(100000, 1.25), np.random.default_rng(1))
+        self.assertEqual(set(counts.tolist()), {1, 2})
+        self.assertAlmostEqual(counts.mean(), 1.25, delta=0.01)
+
+    def test_row_settings(self):
+        settings = row_settings({"MotherlodeFrequency_avg": ":= 0.5 * oreFreq", "MotherlodeSize_avg": "2"},
+                                {"oreFreq": 2})
+        self.assertEqual(settings["MotherlodeFrequency"], SettingDistribution(1.0, 0.0, "uniform"))
+        self.assertEqual(settings["OreDensity"].avg, 1.0)
+        with self.assertRaises(ValueError):
+            row_settings({"MotherlodeFrequency_avg": "1"})
+        with self.assertRaises(ValueError):
+            row_settings({"MotherlodeFrequency_avg": "1", "MotherlodeSize_avg": ":= 1.5 * oreSize'"})
+
+
+class TestSimulate(unittest.TestCase):
+    def test_matches_spreadsheet_without_spread(self):
+        settings = _settings(MotherlodeFrequency=SettingDistribution(0.5, 0.0, "uniform"),
+                             MotherlodeSize=SettingDistribution(2.0, 0.0, "uniform"),
+                             BranchFrequency=SettingDistribution(3.0, 0.0, "uniform"),
+                             BranchLength=SettingDistribution(40.0, 0.0, "uniform"),
+                             SegmentRadius=SettingDistribution(1.0, 0.0, "uniform"),
+                             OreDensity=SettingDistribution(0.5, 0.0, "uniform"))
+        ores = simulate(settings, 200000, seed=1, batch_size=30000)
+        self.assertAlmostEqual(ores.mean() / analytic_mean(settings), 1.0, delta=0.01)
+        self.assertEqual(set(np.round(ores, 6).tolist()), {0.0, round(2 * analytic_mean(settings), 6)})
+
+    def test_expected_ore(self):
+        settings = _settings(MotherlodeFrequency=SettingDistribution(0.5, 0.2, "normal"),
+                             MotherlodeSize=SettingDistribution(2.0, 1.0, "uniform"),
+                             BranchFrequency=SettingDistribution(2.0, 1.0, "uniform"),
+                             BranchLength=SettingDistribution(40.0, 20.0, "normal"),
+                             SegmentRadius=SettingDistribution(1.0, 0.5, "uniform"))
+        motherlode, branches = expected_ore([settings, settings], quantiles=100)
+        self.assertEqual(motherlode.shape, (2,))
+        ores = simulate(settings, 400000, seed=1)
+        self.assertAlmostEqual((motherlode[0] + branches[0]) / ores.mean(), 1.0, delta=0.02)
+
+    def test_spread_raises_mean(self):
+        # E[size^3] > avg^3, which the spreadsheet can't see.
+        settings = _settings(MotherlodeFrequency=SettingDistribution(1.0, 0.0, "uniform"),
+                             MotherlodeSize=SettingDistribution(2.0, 2.0, "uniform"))
+        ores = simulate(settings, 200000, seed=1)
+        expected = 4.0 / 3.0 * math.pi * (4.0 ** 4 / 4 / 4)  # E[U(0, 4)^3] = 4^3 / 4
+        self.assertAlmostEqual(ores.mean() / expected, 1.0, delta=0.02)
+        self.assertGreater(ores.mean(), 1.5 * analytic_mean(settings))
+
+    def test_seeded(self):
+        settings = _settings(MotherlodeFrequency=SettingDistribution(0.3, 0.2, "normal"),
+                             MotherlodeSize=SettingDistribution(2.0, 1.0, "normal"))
+        np.testing.assert_array_equal(simulate(settings, 1000, seed=7), simulate(settings, 1000, seed=7))
+
+    def test_workbook(self):
+        path = "Sprocket2 Spreadsheet.xlsx"
+        tables = list(iter_workbook_tables(openpyxl.load_workbook(path)))
+        start = time.perf_counter()
+        estimates, skipped = estimate_tables(path, tables)
+        self.assertTrue(estimates)
+        self.assertLess(time.perf_counter() - start, 1.0 * len(estimates))
+        iron = next(result for result in estimates if result.name == "LotsOfIron")
+        self.assertEqual(list(iron.percentiles), list(default_percentiles))
+        self.assertEqual(iron.histogram[0].sum(), default_chunks)
+        self.assertGreater(iron.mean, iron.analytic)
+        self.assertIn("LotsOfIron", format_estimate(iron, histogram=True))
+        self.assertEqual(estimate_tables(path, tables, 1000)[0][0].mean, estimate_tables(path, tables, 1000)[0][0].mean)
+        self.assertNotEqual(estimate_tables(path, tables, 1000)[0][0].mean,
+                            estimate_tables(path, tables, 1000, salt=1)[0][0].mean)
+
+    def test_skipped(self):
+        location = TableLocation("Veins", 1, 1, ("Type", "name", "MotherlodeFrequency_avg"))
+        rows = [{"Type": "Distribution", "name": "Broken", "MotherlodeFrequency_avg": "1"},
+                {"Type": "Distribution", "name": "Complex", "MotherlodeFrequency_avg": "1",
+                 "MotherlodeSize_avg": ":= (dimension.groundLevel - 80)^0.5"}]
+        estimates, skipped = estimate_tables("a.xlsx", [(veins_table, rows, location)], 1000)
+        self.assertEqual(estimates, [])
+        self.assertEqual(skipped[0], ("Veins!A2:C2", "Broken", "MotherlodeSize_avg is blank."))
+        self.assertEqual(skipped[1][:2], ("Veins!A3:C3", "Complex"))
+        self.assertIn("not a real number", skipped[1][2])
+
+
+if __name__ == '__main__':
+    main()
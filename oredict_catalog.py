@@ -0,0 +1,197 @@
+import re
+import unittest
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+from typing import Iterable, Tuple
+
+from catalog_store import PackedCatalog, oredict_path
+from fuzzy_index import TrigramIndex
+from weighted_list import weighted_list_references
+
+# Columns whose weighted lists name ore dictionary entries.
+oredict_columns = ("ReplacesOre",)
+
+# kind is "wrong case" (i.e. "oreiron" for "oreIron") or "unknown".
+OreDictProblem = namedtuple("OreDictProblem", "cell name kind suggestions")
+
+# "oreIron" -> "ore", "ingotGold" -> "ingot", "oc:wlanCard" -> "oc". Names without a family, like "stone", don't match.
+_family_pattern = re.compile(r"([a-z]+)[^a-z]")
+
+
+def _prefix_range(sorted_names, prefix):
+    # All names in sorted_names that start with prefix, found with two binary searches.
+    start = bisect_left(sorted_names, prefix)
+    end = bisect_left(sorted_names, prefix + "\U0010ffff", start)
+    return sorted_names[start:end]
+
+
+class OreDictCatalog:
+    # An index over ore dictionary names, such as the packed catalog in linting_data/oredict.txt.
+    #
+    # catalog = OreDictCatalog.default()
+    # "oreIron" in catalog                     -> True
+    # catalog.find_casefold("OREIRON")         -> ("oreIron",)
+    # catalog.with_prefix("ingotG")            -> ("ingotGold", ...)
+    # catalog.family("ore")                    -> ("oreAluminum", "oreCoal", ...)
+    # catalog.suggest("oreIrn")                -> ("oreIron", ...)
+
+    _default = None
+
+    def __init__(self, names: Iterable[str] = None, packed: PackedCatalog = None):
+        # Pass either names, or a PackedCatalog. As with BlockCatalog, every index is built on first use.
+        self._packed = packed
+        self._sorted = sorted(set(names)) if names is not None else None
+        self._names = None
+        self._by_casefold = None
+        self._sorted_casefold = None
+        self._families = None
+        self._trigram_index = None
+
+    @classmethod
+    def default(cls):
+        # The catalog in linting_data/oredict.txt. Nothing is read until it is first used.
+        if cls._default is None:
+            cls._default = cls(packed=PackedCatalog(oredict_path))
+        return cls._default
+
+    def _sorted_names(self) -> list:
+        if self._sorted is None:
+            self._sorted = list(self._packed.keys())
+        return self._sorted
+
+    @property
+    def names(self) -> frozenset:
+        if self._names is None:
+            self._names = frozenset(self._sorted_names())
+        return self._names
+
+    @property
+    def families(self) -> dict:
+        self._build_indexes()
+        return self._families
+
+    def _build_indexes(self):
+        if self._by_casefold is not None:
+            return
+        by_casefold = defaultdict(list)
+        families = defaultdict(list)
+        for name in self._sorted_names():
+            by_casefold[name.casefold()].append(name)
+            match = _family_pattern.match(name)
+            if match:
+                families[match.group(1)].append(name)
+        self._by_casefold = {key: tuple(names) for key, names in by_casefold.items()}
+        self._sorted_casefold = sorted(self._by_casefold)
+        self._families = {prefix: tuple(names) for prefix, names in families.items()}
+
+    def __contains__(self, name: str) -> bool:
+        if self._names is None and self._packed is not None:
+            return name in self._packed
+        return name in self.names
+
+    def __len__(self):
+        return len(self._sorted_names())
+
+    def find_casefold(self, name: str) -> Tuple[str]:
+        self._build_indexes()
+        return self._by_casefold.get(name.casefold(), ())
+
+    def with_prefix(self, prefix: str, case_sensitive: bool = True) -> Tuple[str]:
+        if case_sensitive:
+            if self._sorted is None:
+                return self._packed.with_prefix(prefix)
+            return tuple(_prefix_range(self._sorted, prefix))
+        self._build_indexes()
+        keys = _prefix_range(self._sorted_casefold, prefix.casefold())
+        return tuple(name for key in keys for name in self._by_casefold[key])
+
+    def family(self, prefix: str) -> Tuple[str]:
+        # Precomputed prefix families: "ore", "ingot", "dust", "gem", "nugget", "block", ...
+        return self.families.get(prefix, ())
+
+    def suggest(self, name: str, k: int = 3) -> Tuple[str]:
+        if self._trigram_index is None:
+            self._trigram_index = TrigramIndex(self._sorted_names())
+        return self._trigram_index.suggest(name, k)
+
+    def check(self, name: str):
+        # Returns None if name is a known ore dictionary name.
+        # Otherwise returns (kind, suggestions).
+        if name in self:
+            return None
+        case_matches = self.find_casefold(name)
+        if case_matches:
+            return "wrong case", case_matches
+        return "unknown", self.suggest(name)
+
+    def problems(self, tables) -> list:
+        # Checks every ReplacesOre list in a workbook.
+        #
+        # tables is an iterable of (table_name, table_data, location), as produced by
+        # excel_table.iter_workbook_tables().
+        # Returns a list of OreDictProblem(cell, name, kind, suggestions).
+        problems = []
+        for name, cells in weighted_list_references(tables, oredict_columns).items():
+            result = self.check(name)
+            if result is not None:
+                kind, suggestions = result
+                problems.extend(OreDictProblem(cell, name, kind, suggestions) for cell in cells)
+        return problems
+
+
+class TestOreDictCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = OreDictCatalog(["oreIron", "oreGold", "ingotIron", "ingotGold", "dustIron", "stone",
+                                       "oc:wlanCard"])
+
+    def test_exact(self):
+        self.assertIn("oreIron", self.catalog)
+        self.assertNotIn("oreiron", self.catalog)
+        self.assertEqual(len(self.catalog), 7)
+
+    def test_casefold(self):
+        self.assertEqual(self.catalog.find_casefold("OREIRON"), ("oreIron",))
+        self.assertEqual(self.catalog.find_casefold("oreCopper"), ())
+
+    def test_prefix(self):
+        self.assertEqual(self.catalog.with_prefix("ingot"), ("ingotGold", "ingotIron"))
+        self.assertEqual(self.catalog.with_prefix("INGOTI", case_sensitive=False), ("ingotIron",))
+        self.assertEqual(self.catalog.with_prefix("gem"), ())
+
+    def test_families(self):
+        self.assertEqual(self.catalog.family("ore"), ("oreGold", "oreIron"))
+        self.assertEqual(self.catalog.family("oc"), ("oc:wlanCard",))
+        self.assertEqual(self.catalog.family("stone"), ())
+
+    def test_check(self):
+        self.assertIsNone(self.catalog.check("stone"))
+        self.assertEqual(self.catalog.check("oreiron"), ("wrong case", ("oreIron",)))
+        kind, suggestions = self.catalog.check("oreIrn")
+        self.assertEqual(kind, "unknown")
+        self.assertEqual(suggestions[0], "oreIron")
+
+    def test_problems(self):
+        from excel_table import TableLocation
+        table_data = [
+            {"name": "a", "ReplacesOre": "stone, 1.0; oreiron, 1.0;"},
+            {"name": "b", "ReplacesOre": "oreCoppr, 1.0;"},
+        ]
+        location = TableLocation("Veins", 1, 1, ["name", "ReplacesOre"])
+
+        problems = self.catalog.problems([("Veins_Presets", table_data, location)])
+        self.assertEqual([(p.cell, p.name, p.kind) for p in problems],
+                         [("Veins!B2", "oreiron", "wrong case"), ("Veins!B3", "oreCoppr", "unknown")])
+
+    def test_default_catalog(self):
+        catalog = OreDictCatalog(packed=PackedCatalog(oredict_path))
+        self.assertIn("oreIron", catalog)
+        self.assertIn("oreIron", catalog.with_prefix("oreI"))
+        self.assertIsNone(catalog._names)  # Answered straight from the packed file.
+
+        self.assertIn("oreIron", catalog.family("ore"))
+        self.assertIn("ingotGold", catalog.family("ingot"))
+        self.assertIn("dustRedstone", catalog.family("dust"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import tempfile
+import unittest
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    # Returns the digest of the file at path, or None if the file doesn't exist.
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def write_if_changed(path: str, content: bytes) -> bool:
+    # Writes content to path, unless the file already holds exactly that content.
+    # Returns True if the file was written, False if it was skipped.
+    #
+    # Rewriting an identical file still wakes up file watchers, shows up in git, and makes COG reload its configs,
+    # so we compare digests first. A file of a different size can't match, so we don't even read it in that case.
+    #
+    # The new content goes to a temporary file in the same directory, which is then renamed over the target.
+    # os.replace() is atomic, so a reader never sees a half-written config file.
+
+    try:
+        existing_size = os.stat(path).st_size
+    except FileNotFoundError:
+        existing_size = None
+
+    if existing_size == len(content) and file_digest(path) == content_digest(content):
+        return False
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp() creates the file readable by its owner only.
+        # Keep the old file's permissions, or use the normal umask-derived permissions for a new file.
+        if existing_size is not None:
+            mode = os.stat(path).st_mode & 0o777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return True
+
+
+class OutputSummary:
+    # Keeps track of which output files were written, and which were skipped because they hadn't changed.
+
+    def __init__(self):
+        self.written = []
+        self.skipped = []
+
+    def write(self, path: str, content: bytes):
+        if write_if_changed(path, content):
+            self.written.append(path)
+        else:
+            self.skipped.append(path)
+
+    def __str__(self):
+        return "Wrote %d file(s), skipped %d unchanged file(s)." % (len(self.written), len(self.skipped))
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "ores.xml")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_new_file_is_written(self):
+        self.assertTrue(write_if_changed(self.path, b"<Config/>"))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"<Config/>")
+
+    def test_identical_file_is_skipped(self):
+        write_if_changed(self.path, b"<Config/>")
+        mtime = os.stat(self.path).st_mtime_ns
+
+        self.assertFalse(write_if_changed(self.path, b"<Config/>"))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+
+    def test_changed_file_is_replaced(self):
+        write_if_changed(self.path, b"<Config/>")
+        os.chmod(self.path, 0o640)
+
+        self.assertTrue(write_if_changed(self.path, b"<Config></Config>"))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"<Config></Config>")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    def test_no_temporary_files_left_behind(self):
+        write_if_changed(self.path, b"one")
+        write_if_changed(self.path, b"two")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["ores.xml"])
+
+    def test_missing_directories_are_created(self):
+        path = os.path.join(self.temp_dir.name, "config", "CustomOreGen", "ores.xml")
+        self.assertTrue(write_if_changed(path, b"<Config/>"))
+        self.assertTrue(os.path.exists(path))
+
+
+class TestOutputSummary(unittest.TestCase):
+    def test_counts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            a = os.path.join(temp_dir, "a.xml")
+            b = os.path.join(temp_dir, "b.xml")
+            write_if_changed(a, b"<Config/>")
+
+            summary = OutputSummary()
+            summary.write(a, b"<Config/>")
+            summary.write(b, b"<Config/>")
+
+            self.assertEqual(summary.written, [b])
+            self.assertEqual(summary.skipped, [a])
+            self.assertEqual(str(summary), "Wrote 1 file(s), skipped 1 unchanged file(s).")
+
+
+if __name__ == '__main__':
+    unittest.main()
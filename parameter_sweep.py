@@ -0,0 +1,338 @@
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from excel_table import iter_workbook_tables
+from ore_simulation import (analytic_mean, default_percentiles, default_quantiles, expected_ore_columns, row_settings,
+                            simulate, simulated_settings, veins_distributions)
+from setting_sampling import SettingTable, distribution_seed, generator
+
+# Works out the ore per chunk of a Veins distribution over a grid of setting values, i.e. to see which
+# MotherlodeFrequency and BranchLength give a target amount of ore, rather than changing one cell at a time in Excel.
+#
+# Usage:
+#   python parameter_sweep.py "Sprocket2 Spreadsheet.xlsx" LotsOfIron \
+#       --vary MotherlodeFrequency_avg=0.01:0.05:10 --vary BranchLength_avg=60,120,180 --output sweep.csv
+#   python parameter_sweep.py ... --estimator sampled --chunks 100000 --jobs 4
+#
+# A --vary takes a setting's _avg or _range cell, and either start:stop:count (count evenly spaced values, start and
+# stop included) or a list of values. Every combination of the values is a point of the sweep; the other cells come
+# from the distribution, after filling in what it inherits.
+#
+# Estimators:
+#   expected: the expected ore per chunk of the ore_simulation model (ore_simulation.expected_ore), for a whole block
+#             of points in one set of array operations. 100k points take about a second.
+#   sampled:  ore_simulation.simulate() for each point, which adds the std and percentiles. Every point is run with
+#             the same seed (the distribution's), so differences between points aren't sampling noise.
+#
+# Blocks of points are shared out over a process pool. Each result is cached in a JSON lines file, keyed by a hash
+# of model_version, the estimator, its options and the settings of the point, so running a sweep again (or a wider
+# one) only works out the points that are new.
+
+estimator_names = ("expected", "sampled")
+
+# Part of every cache key. Change it whenever the results would change for the same settings, i.e. a change to
+# ore_simulation's model or to setting_sampling, or to the format of the cached results, so that the cache isn't
+# read for results of the old model.
+model_version = 1
+
+default_cache_path = "sweep_cache.jsonl"
+default_chunks = 100000
+
+# Points per unit of work, for each estimator.
+block_sizes = {"expected": 20000, "sampled": 8}
+
+# values is the point's value of each varied cell. std and percentiles are None for the expected estimator.
+SweepResult = namedtuple("SweepResult", "values mean std percentiles analytic")
+
+
+def parse_range(text) -> list:
+    # "0.01:0.05:5" -> [0.01, 0.02, 0.03, 0.04, 0.05]; "1,2,4" -> [1.0, 2.0, 4.0]. Raises ValueError.
+    if ":" in text:
+        parts = text.split(":")
+        if len(parts) != 3:
+            raise ValueError("%r is not start:stop:count." % text)
+        start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+        if count < 1:
+            raise ValueError("%r has no values." % text)
+        return np.linspace(start, stop, count).tolist()
+    return [float(value) for value in text.split(",") if value.strip()]
+
+
+def parse_vary(text):
+    # "MotherlodeFrequency_avg=0.01:0.05:10" -> ("MotherlodeFrequency_avg", [...]). Raises ValueError.
+    cell, separator, values = text.partition("=")
+    setting, underscore, attribute = cell.strip().rpartition("_")
+    if not separator or setting not in simulated_settings or attribute not in ("avg", "range"):
+        raise ValueError("%r should be <setting>_avg=... or <setting>_range=..., with one of %s." %
+                         (text, ", ".join(simulated_settings)))
+    return cell.strip(), parse_range(values)
+
+
+class SweepCache:
+    # Results by key, kept in a JSON lines file that new results are appended to. path=None keeps them in memory.
+    def __init__(self, path=None):
+        self.path = path
+        self._results = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._results[entry["key"]] = entry["result"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # i.e. a line cut short when a sweep was interrupted
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key):
+        return self._results.get(key)
+
+    def update(self, results):
+        # results is {key: result}; the results must be JSON-serializable.
+        self._results.update(results)
+        if self.path is not None and results:
+            with open(self.path, "a") as f:
+                for key, result in results.items():
+                    f.write(json.dumps({"key": key, "result": result}) + "\n")
+
+
+def _point_settings(base_settings, cells, values):
+    settings = OrderedDict(base_settings)
+    for cell, value in zip(cells, values):
+        setting, attribute = cell.rsplit("_", 1)
+        settings[setting] = settings[setting]._replace(**{attribute: float(value)})
+    return settings
+
+
+def _columns(base_settings, cells, points) -> OrderedDict:
+    # {setting name: SettingTable} with a row per point; points is an array of shape (points, cells).
+    arrays = {}
+    for name, setting in base_settings.items():
+        arrays[name, "avg"] = np.full(len(points), float(setting.avg))
+        arrays[name, "range"] = np.full(len(points), float(setting.range))
+    for i, cell in enumerate(cells):
+        arrays[tuple(cell.rsplit("_", 1))] = points[:, i]
+    return OrderedDict((name, SettingTable(range(len(points)), arrays[name, "avg"], arrays[name, "range"],
+                                           np.full(len(points), setting.type)))
+                       for name, setting in base_settings.items())
+
+
+def _evaluate_block(work):
+    # Runs in a worker process. Returns a result dictionary for each point.
+    estimator, options, base_settings, cells, points = work
+    if estimator == "expected":
+        motherlode, branches = expected_ore_columns(_columns(base_settings, cells, points), options["quantiles"])
+        return [{"mean": mean} for mean in (motherlode + branches).tolist()]
+
+    results = []
+    for values in points:
+        ores = simulate(_point_settings(base_settings, cells, values), options["chunks"],
+                        generator({"seed": options["seed"]}, options["salt"]))
+        results.append({"mean": float(ores.mean()), "std": float(ores.std()),
+                        "percentiles": np.percentile(ores, default_percentiles).tolist()})
+    return results
+
+
+@instrumentation.timed("sweep")
+def sweep(row, ranges, estimator="expected", chunks=default_chunks, salt=0, quantiles=default_quantiles,
+          bindings=None, jobs=None, cache: SweepCache = None) -> list:
+    # Works out every combination of ranges ({cell: [values]}, i.e. {"MotherlodeSize_avg": [1, 2, 3]}) for a
+    # resolved Veins row. Returns a SweepResult per point, in itertools.product() order.
+    # jobs is the number of worker processes (default: one per CPU); with jobs=1 everything runs in this process.
+    # Raises ValueError if the row's settings can't be worked out.
+    if estimator not in estimator_names:
+        raise ValueError("Unknown estimator %r." % estimator)
+    base_settings = row_settings(row, bindings)
+    cells = list(ranges)
+    points = np.array(list(itertools.product(*ranges.values())), dtype=float).reshape(-1, len(cells))
+    options = {"quantiles": quantiles} if estimator == "expected" else \
+        {"chunks": chunks, "seed": distribution_seed(row), "salt": salt}
+    cache = cache if cache is not None else SweepCache()
+
+    # The key of a point covers everything its result depends on: a hash of the model version, the estimator, its
+    # options, the settings and the varied cells, extended with the bytes of the point's values.
+    prefix = hashlib.sha1(json.dumps([model_version, estimator, options,
+                                      [[name] + list(setting) for name, setting in base_settings.items()],
+                                      cells]).encode("utf-8"))
+    keys = []
+    for values in points:
+        key = prefix.copy()
+        key.update(values.tobytes())
+        keys.append(key.hexdigest())
+    missing = [i for i, key in enumerate(keys) if cache.get(key) is None]
+
+    size = block_sizes[estimator]
+    blocks = [missing[start:start + size] for start in range(0, len(missing), size)]
+    work = [(estimator, options, base_settings, cells, points[block]) for block in blocks]
+    executor = ProcessPoolExecutor(jobs) if jobs != 1 and len(work) > 1 else None
+    map_function = executor.map if executor is not None else map
+    try:
+        for block, results in zip(blocks, map_function(_evaluate_block, work)):
+            cache.update({keys[i]: result for i, result in zip(block, results)})
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    if instrumentation.is_enabled():
+        instrumentation.count("sweep", "points", len(points))
+        instrumentation.count("sweep", "new points", len(missing))
+
+    analytic = analytic_mean(_columns(base_settings, cells, points)).tolist()
+    results = []
+    for values, key, spreadsheet in zip(map(tuple, points.tolist()), keys, analytic):
+        result = cache.get(key)
+        percentiles = result.get("percentiles")
+        results.append(SweepResult(values, result["mean"], result.get("std"),
+                                   OrderedDict(zip(default_percentiles, percentiles)) if percentiles else None,
+                                   spreadsheet))
+    return results
+
+
+def write_results(cells, results, file):
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(cells + ["mean", "std"] + ["p%g" % p for p in default_percentiles] + ["spreadsheet"])
+    for result in results:
+        percentiles = list(result.percentiles.values()) if result.percentiles else [None] * len(default_percentiles)
+        writer.writerow(["%.6g" % value for value in result.values] +
+                        ["" if value is None else "%.6g" % value
+                         for value in [result.mean, result.std] + percentiles + [result.analytic]])
+
+
+def find_distribution(path, name):
+    # The resolved row of the enabled Veins distribution called name in a workbook, or None.
+    for row, cell, resolved in veins_distributions(iter_workbook_tables(openpyxl.load_workbook(path))):
+        if row.get("name") == name:
+            return resolved
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Work out the ore per chunk of a Veins distribution over a grid of "
+                                                 "setting values.")
+    parser.add_argument("workbook", help="Excel workbook (.xlsx) with the distribution.")
+    parser.add_argument("distribution", help="Name of the Veins distribution to start from.")
+    parser.add_argument("--vary", action="append", default=[], metavar="CELL=VALUES", required=True,
+                        help="A cell and its values: start:stop:count, or a list such as 1,2,4. Can be repeated.")
+    parser.add_argument("--estimator", choices=estimator_names, default="expected")
+    parser.add_argument("--chunks", type=int, default=default_chunks, help="Chunks per point, for --estimator sampled.")
+    parser.add_argument("--salt", type=int, default=0, help="Changes the seed, for --estimator sampled.")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of worker processes. Default: one per CPU.")
+    parser.add_argument("--cache", default=default_cache_path, help="File to keep results in between sweeps.")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the cache file.")
+    parser.add_argument("--output", metavar="FILE", help="Write the results here, rather than to stdout.")
+    args = parser.parse_args(argv)
+
+    try:
+        ranges = OrderedDict(parse_vary(text) for text in args.vary)
+    except ValueError as e:
+        parser.error(str(e))
+    row = find_distribution(args.workbook, args.distribution)
+    if row is None:
+        parser.error("%s has no Veins distribution called %r." % (args.workbook, args.distribution))
+
+    start = time.perf_counter()
+    cache = SweepCache(None if args.no_cache else args.cache)
+    cached = len(cache)
+    try:
+        results = sweep(row, ranges, args.estimator, args.chunks, args.salt, jobs=args.jobs, cache=cache)
+    except ValueError as e:
+        parser.error("%s in %s: %s" % (args.distribution, args.workbook, e))
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_results(list(ranges), results, f)
+    else:
+        write_results(list(ranges), results, sys.stdout)
+    print("%d points (%d new) in %.2fs" % (len(results), len(cache) - cached, time.perf_counter() - start),
+          file=sys.stderr)
+
+
+class TestParse(unittest.TestCase):
+    def test_ranges(self):
+        self.assertEqual(parse_range("1:3:3"), [1.0, 2.0, 3.0])
+        self.assertEqual(parse_range("0.5, 2,"), [0.5, 2.0])
+        for text in ("1:2", "1:2:0", "a,b"):
+            with self.assertRaises(ValueError):
+                parse_range(text)
+
+    def test_vary(self):
+        self.assertEqual(parse_vary("BranchLength_range=1,2"), ("BranchLength_range", [1.0, 2.0]))
+        for text in ("BranchLength=1", "SegmentAngle_avg=1", "BranchLength_type=1", "BranchLength_avg"):
+            with self.assertRaises(ValueError):
+                parse_vary(text)
+
+
+class TestSweep(unittest.TestCase):
+    row = {"name": "Iron", "MotherlodeFrequency_avg": "1", "MotherlodeSize_avg": "2", "MotherlodeSize_range": "1",
+           "BranchFrequency_avg": "2", "BranchLength_avg": "20", "SegmentRadius_avg": "1"}
+
+    def test_expected(self):
+        ranges = OrderedDict([("MotherlodeFrequency_avg", [0.5, 1.0]), ("BranchLength_avg", [10.0, 20.0, 40.0])])
+        results = sweep(self.row, ranges, jobs=1)
+        self.assertEqual([result.values for result in results],
+                         [(0.5, 10.0), (0.5, 20.0), (0.5, 40.0), (1.0, 10.0), (1.0, 20.0), (1.0, 40.0)])
+        self.assertAlmostEqual(results[4].mean, 2 * results[1].mean)
+        self.assertGreater(results[5].mean, results[4].mean)
+        self.assertIsNone(results[0].std)
+        self.assertAlmostEqual(results[3].analytic, 4 / 3 * np.pi * 8 + 2 * np.pi * 10)
+
+    def test_sampled_matches_expected(self):
+        ranges = OrderedDict([("MotherlodeSize_avg", [1.0, 3.0])])
+        expected = sweep(self.row, ranges, jobs=1)
+        sampled = sweep(self.row, ranges, "sampled", 200000, jobs=1)
+        for a, b in zip(expected, sampled):
+            self.assertAlmostEqual(b.mean / a.mean, 1.0, delta=0.02)
+        self.assertEqual(list(sampled[0].percentiles), list(default_percentiles))
+
+    def test_cache_makes_sweeps_incremental(self):
+        handle, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        try:
+            first = sweep(self.row, {"BranchLength_avg": [10.0, 20.0]}, jobs=1, cache=SweepCache(path))
+            cache = SweepCache(path)
+            self.assertEqual(len(cache), 2)
+            wider = sweep(self.row, {"BranchLength_avg": [10.0, 20.0, 30.0]}, jobs=1, cache=cache)
+            self.assertEqual(len(SweepCache(path)), 3)
+            self.assertEqual(wider[:2], first)
+            sweep(self.row, {"BranchLength_avg": [10.0]}, "sampled", 1000, jobs=1, cache=cache)
+            self.assertEqual(len(cache), 4)
+            global model_version
+            version, model_version = model_version, model_version + 1
+            try:
+                sweep(self.row, {"BranchLength_avg": [10.0, 20.0]}, jobs=1, cache=cache)
+            finally:
+                model_version = version
+            self.assertEqual(len(cache), 6)
+        finally:
+            os.remove(path)
+
+    def test_parallel_matches_serial(self):
+        ranges = OrderedDict([("MotherlodeFrequency_avg", parse_range("0.1:1:10")),
+                              ("BranchLength_avg", parse_range("10:100:10"))])
+        serial = sweep(self.row, ranges, "sampled", 2000, jobs=1)
+        parallel = sweep(self.row, ranges, "sampled", 2000, jobs=2)
+        self.assertEqual(serial, parallel)
+
+    def test_big_sweep(self):
+        ranges = OrderedDict((name + "_avg", parse_range("1:2:10")) for name in simulated_settings[:5])
+        start = time.perf_counter()
+        results = sweep(self.row, ranges, jobs=1)
+        self.assertEqual(len(results), 100000)
+        self.assertLess(time.perf_counter() - start, 10.0)
+
+
+if __name__ == '__main__':
+    main()
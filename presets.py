@@ -0,0 +1,108 @@
+import unittest
+from collections import OrderedDict
+
+
+class PresetResolver:
+    # Works out the effective values of a row, by filling its blank cells in from the row it inherits from, and so on
+    # up the chain. The built-in COG presets (PresetLayeredVeins, ...) are rows of the workbook like any other.
+    #
+    # resolver = PresetResolver(table_data)
+    # resolver.resolve({"name": "Iron", "inherits": "PresetLayeredVeins", "MotherlodeSize_avg": "2"})
+    #   -> the PresetLayeredVeins row's values, with MotherlodeSize_avg and name replaced.
+    #
+    # Inherited rows are looked up by name in a dictionary, and each resolved name is cached, so resolving many rows
+    # that inherit the same preset only resolves its chain once.
+    # An inherits that names no row, or a cycle of inherits, just stops the chain.
+
+    # Cells that describe the row itself, rather than a setting to pass on.
+    not_inherited = ("Type", "name", "inherits", "filename", "Description", "OFF?")
+
+    def __init__(self, rows=()):
+        self._rows = OrderedDict()
+        self._cache = {}
+        self.add(rows)
+
+    def add(self, rows):
+        for row in rows:
+            name = row.get("name")
+            if name is not None and name not in self._rows:
+                self._rows[name] = row
+        self._cache.clear()
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def resolve(self, row) -> OrderedDict:
+        # Returns a new dictionary; row is not modified.
+        return self._inherit(self.resolve_name(row.get("inherits")), row)
+
+    def resolve_name(self, name) -> OrderedDict:
+        if name not in self._rows:
+            return None
+        if name not in self._cache:
+            self._cache[name] = self._resolve(self._rows[name], {name})
+        return self._cache[name]
+
+    def _resolve(self, row, seen):
+        parent = row.get("inherits")
+        if parent is None or parent in seen or parent not in self._rows:
+            inherited = None
+        elif parent in self._cache:
+            inherited = self._cache[parent]
+        else:
+            inherited = self._resolve(self._rows[parent], seen | {parent})
+        return self._inherit(inherited, row)
+
+    def _inherit(self, inherited, row):
+        # row's values over the ones it inherits (a resolved row, or None).
+        resolved = OrderedDict()
+        if inherited is not None:
+            resolved.update(inherited)
+            for key in self.not_inherited:
+                resolved.pop(key, None)
+        for key, value in row.items():
+            if value is not None:
+                resolved[key] = value
+            else:
+                resolved.setdefault(key, None)
+        return resolved
+
+
+class TestPresetResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = PresetResolver([
+            {"Type": "Preset", "name": "PresetHugeVeins", "inherits": None, "Size_avg": "10", "Size_range": "2"},
+            {"Type": "Preset", "name": "BigGold", "inherits": "PresetHugeVeins", "Size_avg": "20", "Size_range": None},
+            {"Type": "Preset", "name": "LoopA", "inherits": "LoopB", "Size_avg": "1"},
+            {"Type": "Preset", "name": "LoopB", "inherits": "LoopA", "Size_range": "1"},
+        ])
+
+    def test_chain(self):
+        resolved = self.resolver.resolve({"Type": "Distribution", "name": "Gold", "inherits": "BigGold",
+                                          "Size_avg": None, "Height_avg": "32"})
+        self.assertEqual(resolved["Size_avg"], "20")
+        self.assertEqual(resolved["Size_range"], "2")
+        self.assertEqual(resolved["Height_avg"], "32")
+        self.assertEqual(resolved["name"], "Gold")
+        self.assertEqual(resolved["Type"], "Distribution")
+
+    def test_unknown_parent(self):
+        resolved = self.resolver.resolve({"name": "Tin", "inherits": "Nope", "Size_avg": "1"})
+        self.assertEqual(resolved, {"name": "Tin", "inherits": "Nope", "Size_avg": "1"})
+
+    def test_cycle(self):
+        resolved = self.resolver.resolve_name("LoopA")
+        self.assertEqual((resolved["Size_avg"], resolved["Size_range"]), ("1", "1"))
+
+    def test_cached(self):
+        self.assertIs(self.resolver.resolve_name("BigGold"), self.resolver.resolve_name("BigGold"))
+        self.assertIsNone(self.resolver.resolve_name("Nope"))
+        resolver = PresetResolver(self.resolver._rows.values())
+        resolver.resolve({"name": "Gold", "inherits": "BigGold"})
+        self.assertEqual(set(resolver._cache), {"BigGold"})
+        self.assertEqual(resolver.resolve({"name": "LoopA", "inherits": "LoopB", "Size_avg": "1"}),
+                         {"name": "LoopA", "inherits": "LoopB", "Size_avg": "1", "Size_range": "1"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+import functools
+import math
+import unittest
+import zlib
+from collections import OrderedDict, namedtuple
+from statistics import NormalDist
+
+import numpy as np
+
+from cog_expressions import setting_value
+
+# Draws values of <Setting> elements the way COG does, so that simulations and previews don't each have their own
+# idea of what avg, range and type mean.
+#
+#   uniform: avg + range * U(-1, 1)
+#   normal:  avg + range * clip(N(0, 1) / 2.5, -1, 1)
+#
+# COG's normal type never leaves avg +- range, and most of its values are near avg; a standard normal scaled so that
+# the range is 2.5 standard deviations, and clipped there, matches that closely enough for estimates.
+#
+# Each distribution gets its own generator, seeded from its seed attribute, or from its name if it has none. So the
+# values drawn for a distribution are the same from run to run, and don't change when other distributions are added.
+#
+# A SettingTable holds many settings as arrays, and draws samples for all of them with one NumPy call per type.
+# For expectations without sampling noise, it also gives each setting's values at evenly spaced quantiles.
+
+setting_types = ("uniform", "normal")
+
+# How many standard deviations of the normal type fit in its range.
+normal_spread = 2.5
+
+# COG's default BranchHeightLimit, for Veins that don't set one.
+default_branch_height_limit = 16.0
+
+# One setting: avg and range are numbers, type is one of setting_types.
+SettingDistribution = namedtuple("SettingDistribution", "avg range type")
+
+
+def row_settings(row, setting_names, bindings=None, defaults=None) -> OrderedDict:
+    # The settings of a (resolved) row, as {setting name: SettingDistribution}. ":=" expressions are evaluated with
+    # bindings. A blank avg takes its value from defaults; settings that aren't in defaults are required.
+    # Raises ValueError if a required setting is blank, a cell can't be evaluated, or a type is unknown.
+    defaults = defaults or {}
+    settings = OrderedDict()
+    for name in setting_names:
+        avg = setting_value(row.get(name + "_avg"), bindings)
+        if avg is None:
+            if name not in defaults:
+                raise ValueError("%s_avg is blank." % name)
+            avg = defaults[name]
+        spread = setting_value(row.get(name + "_range"), bindings) or 0.0
+        setting_type = str(row.get(name + "_type") or "uniform").strip().lower()  # str() for i.e. a number.
+        if setting_type not in setting_types:
+            raise ValueError("%s_type %r is neither uniform nor normal." % (name, setting_type))
+        settings[name] = SettingDistribution(avg, spread, setting_type)
+    return settings
+
+
+def distribution_seed(row) -> int:
+    # The seed of a distribution row: its seed cell as an integer (decimal, or "0x..." hex), or failing that a hash
+    # of the text in it or of the distribution's name. Unlike hash(), the same on every run. A seed of nan or inf
+    # counts as blank.
+    seed = row.get("seed")
+    if isinstance(seed, float) and not math.isfinite(seed):
+        seed = None
+    if isinstance(seed, (int, float)):
+        return int(seed)
+    if seed is not None:
+        try:
+            return int(str(seed).strip(), 0)
+        except ValueError:
+            pass
+    else:
+        seed = row.get("name") or ""
+    return zlib.crc32(str(seed).encode("utf-8"))
+
+
+def generator(row, salt=0) -> np.random.Generator:
+    # A generator for a distribution row. Different salts give independent streams from the same seed, i.e. for
+    # repeated runs of a simulation.
+    return np.random.default_rng([distribution_seed(row) & 0xFFFFFFFFFFFFFFFF, salt])
+
+
+def _offsets(setting_type, shape, rng) -> np.ndarray:
+    # Offsets in [-1, 1], to be multiplied by the range.
+    if setting_type == "normal":
+        offsets = rng.standard_normal(shape)
+        offsets /= normal_spread
+        return np.clip(offsets, -1.0, 1.0, out=offsets)
+    return rng.uniform(-1.0, 1.0, shape)
+
+
+@functools.lru_cache(maxsize=None)
+def quantile_offsets(setting_type, n) -> np.ndarray:
+    # The offsets (in [-1, 1], to be multiplied by the range) at the middles of n equally likely slices of a type.
+    # The mean of a function of the n values is a deterministic estimate of its expected value. Read-only, as it is
+    # cached.
+    quantiles = (np.arange(n) + 0.5) / n
+    if setting_type == "normal":
+        normal = NormalDist()
+        offsets = np.clip(np.array([normal.inv_cdf(q) for q in quantiles]) / normal_spread, -1.0, 1.0)
+    else:
+        offsets = 2.0 * quantiles - 1.0
+    offsets.flags.writeable = False
+    return offsets
+
+
+def sample(setting: SettingDistribution, size, rng) -> np.ndarray:
+    # Draws size values of one setting.
+    if setting.range == 0:
+        return np.full(size, float(setting.avg))
+    values = _offsets(setting.type, size, rng)
+    values *= setting.range
+    values += setting.avg
+    return values
+
+
+class SettingTable:
+    # Many settings, as arrays: the settings of one distribution, or of every distribution in a table.
+    #
+    # table = SettingTable.from_settings(row_settings(row, veins_setting_names))
+    # values = table.sample(100000, generator(row))  # shape (settings, 100000)
+
+    def __init__(self, names, avg, spread, types):
+        self.names = list(names)
+        self.avg = np.asarray(avg, dtype=float)
+        self.range = np.asarray(spread, dtype=float)
+        self.types = np.asarray(types)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._rows_by_type = [(setting_type, np.flatnonzero((self.types == setting_type) & (self.range != 0)))
+                              for setting_type in setting_types]
+
+    @classmethod
+    def from_settings(cls, settings):
+        # settings is {name: SettingDistribution}, i.e. from row_settings().
+        return cls(settings.keys(), [s.avg for s in settings.values()], [s.range for s in settings.values()],
+                   [s.type for s in settings.values()])
+
+    @classmethod
+    def from_column(cls, settings_list, name):
+        # One setting of many rows, i.e. the MotherlodeSize of every distribution, with a row of the table per item
+        # of settings_list (each {name: SettingDistribution}). The rows are named 0, 1, ...
+        return cls(range(len(settings_list)), [settings[name].avg for settings in settings_list],
+                   [settings[name].range for settings in settings_list],
+                   [settings[name].type for settings in settings_list])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, name) -> SettingDistribution:
+        i = self._index[name]
+        return SettingDistribution(float(self.avg[i]), float(self.range[i]), str(self.types[i]))
+
+    def sample(self, n, rng) -> np.ndarray:
+        # Returns an array of shape (settings, n): n values of each setting, in the order of names.
+        # Settings with no range are filled with their avg, and use up no random numbers.
+        offsets = np.zeros((len(self.names), n))
+        for setting_type, rows in self._rows_by_type:
+            if len(rows):
+                offsets[rows] = _offsets(setting_type, (len(rows), n), rng)
+        offsets *= self.range[:, np.newaxis]
+        offsets += self.avg[:, np.newaxis]
+        return offsets
+
+    def quantiles(self, n) -> np.ndarray:
+        # Returns an array of shape (settings, n): each setting at n evenly spaced quantiles (see quantile_offsets).
+        offsets = np.zeros((len(self.names), n))
+        for setting_type, rows in self._rows_by_type:
+            offsets[rows] = quantile_offsets(setting_type, n)
+        offsets *= self.range[:, np.newaxis]
+        offsets += self.avg[:, np.newaxis]
+        return offsets
+
+    def sample_dict(self, n, rng) -> OrderedDict:
+        # The same as sample(), as {name: array of n values}.
+        return OrderedDict(zip(self.names, self.sample(n, rng)))
+
+
+class TestRowSettings(unittest.TestCase):
+    def test_row_settings(self):
+        settings = row_settings({"Size_avg": ":= 0.5 * oreSize", "Size_range": 1, "Size_type": "Normal",
+                                 "Freq_avg": "2"}, ["Size", "Freq", "Density"], {"oreSize": 4}, {"Density": 1.0})
+        self.assertEqual(list(settings.values()), [SettingDistribution(2.0, 1.0, "normal"),
+                                                   SettingDistribution(2.0, 0.0, "uniform"),
+                                                   SettingDistribution(1.0, 0.0, "uniform")])
+        for setting_type in ("poisson", 2.5):
+            with self.assertRaises(ValueError):
+                row_settings({"Size_avg": "1", "Size_type": setting_type}, ["Size"])
+        with self.assertRaises(ValueError):
+            row_settings({}, ["Size"])
+
+    def test_seed(self):
+        self.assertEqual(distribution_seed({"seed": "1234", "name": "Iron"}), 1234)
+        self.assertEqual(distribution_seed({"seed": "0x10"}), 16)
+        self.assertEqual(distribution_seed({"seed": 7.0}), 7)
+        for seed in (math.nan, math.inf):
+            self.assertEqual(distribution_seed({"seed": seed, "name": "Iron"}), zlib.crc32(b"Iron"))
+        self.assertEqual(distribution_seed({"name": "Iron"}), zlib.crc32(b"Iron"))
+        self.assertNotEqual(distribution_seed({"name": "Iron"}), distribution_seed({"name": "Gold"}))
+
+
+class TestSettingTable(unittest.TestCase):
+    def setUp(self):
+        self.table = SettingTable.from_settings(OrderedDict([
+            ("Uniform", SettingDistribution(10.0, 2.0, "uniform")),
+            ("Normal", SettingDistribution(10.0, 2.0, "normal")),
+            ("Fixed", SettingDistribution(3.0, 0.0, "normal")),
+        ]))
+
+    def test_sample(self):
+        values = self.table.sample_dict(200000, np.random.default_rng(1))
+        for name in ("Uniform", "Normal"):
+            self.assertTrue(((values[name] >= 8) & (values[name] <= 12)).all())
+            self.assertAlmostEqual(values[name].mean(), 10.0, delta=0.02)
+        self.assertAlmostEqual(values["Uniform"].std(), 2.0 / 3 ** 0.5, delta=0.01)
+        # A little less than range / normal_spread, because of the clipping.
+        self.assertTrue(0.77 < values["Normal"].std() < 2.0 / normal_spread)
+        self.assertTrue((values["Fixed"] == 3.0).all())
+        self.assertEqual(self.table["Normal"], SettingDistribution(10.0, 2.0, "normal"))
+
+    def test_reproducible(self):
+        row = {"name": "Iron"}
+        np.testing.assert_array_equal(self.table.sample(100, generator(row)), self.table.sample(100, generator(row)))
+        self.assertFalse(np.array_equal(self.table.sample(100, generator(row)),
+                                        self.table.sample(100, generator({"name": "Gold"}))))
+        self.assertFalse(np.array_equal(self.table.sample(100, generator(row, 0)),
+                                        self.table.sample(100, generator(row, 1))))
+
+    def test_quantiles(self):
+        values = self.table.quantiles(1000)
+        self.assertEqual(values.shape, (3, 1000))
+        self.assertTrue(np.allclose(values.mean(axis=1), [10.0, 10.0, 3.0]))
+        self.assertAlmostEqual(values[0].std(), 2.0 / 3 ** 0.5, delta=0.01)
+        self.assertTrue(0.77 < values[1].std() < 2.0 / normal_spread)
+        self.assertEqual((values[1].min(), values[1].max()), (8.0, 12.0))
+
+    def test_from_column(self):
+        column = SettingTable.from_column([{"Size": SettingDistribution(1.0, 0.5, "normal")},
+                                           {"Size": SettingDistribution(2.0, 0.0, "uniform")}], "Size")
+        self.assertEqual((len(column), column[1]), (2, SettingDistribution(2.0, 0.0, "uniform")))
+
+    def test_single_setting(self):
+        values = sample(SettingDistribution(1.0, 0.5, "normal"), 1000, np.random.default_rng(1))
+        self.assertTrue(((values >= 0.5) & (values <= 1.5)).all())
+        self.assertTrue((sample(SettingDistribution(2, 0, "uniform"), 5, None) == 2.0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,402 @@
+import argparse
+import math
+import os
+import tempfile
+import time
+import unittest
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import openpyxl
+
+import instrumentation
+from cog_expressions import default_bindings
+from excel_table import TableLocation, iter_workbook_tables
+from ore_simulation import analytic_mean, counts_from_frequencies, veins_distributions
+from setting_sampling import SettingDistribution, SettingTable, default_branch_height_limit, generator, \
+    row_settings as _row_settings, sample
+
+# Counts the blocks a Veins distribution would actually replace, by drawing its motherlodes and branches into
+# boolean grids of blocks. Unlike the volume formulas (ore_simulation.analytic_mean, and the Ore Amount workbook),
+# this sees shapes overlapping each other, being cut off at bedrock and at ground level, and running through blocks
+# that aren't there to be replaced (caves, or other ores).
+#
+# Usage:
+#   python voxel_simulation.py "Sprocket2 Spreadsheet.xlsx" --chunks 8 --stone-fraction 0.9
+#
+# The region is a square of chunks that wraps around at its edges, so a vein leaving one side comes back in at the
+# other and the region stands for an endless world. Every chunk gets its motherlodes (MotherlodeFrequency) at a
+# random x and z and at MotherlodeHeight. A motherlode is a sphere of radius MotherlodeSize, with BranchFrequency
+# branches. A branch heads off in a random direction, pitched up or down by BranchInclination, and is a chain of
+# segments: each SegmentLength long, SegmentRadius thick, and turned by SegmentAngle and SegmentPitch from the one
+# before, until it is BranchLength long. After each segment, a fork of SegmentForkLengthMult times the length that
+# is left starts with a chance of SegmentForkFrequency. Branches stay within BranchHeightLimit of their motherlode.
+# Each block inside a shape is ore with a chance of OreDensity.
+#
+# A shape is drawn by working out the blocks in its bounding box that are inside it, and OR-ing that mask into the
+# grid, so blocks covered by two shapes are only counted once. Grids larger than memmap_threshold are kept in a
+# np.memmap file rather than in memory, and are counted a chunk's width at a time.
+
+geometry_settings = ("MotherlodeFrequency", "MotherlodeSize", "MotherlodeHeight", "BranchFrequency",
+                     "BranchInclination", "BranchLength", "BranchHeightLimit", "SegmentForkFrequency",
+                     "SegmentForkLengthMult", "SegmentLength", "SegmentAngle", "SegmentPitch", "SegmentRadius",
+                     "OreDensity")
+
+# Values for settings that a row, and everything it inherits, leaves blank. The other settings are required.
+geometry_defaults = {"BranchFrequency": 0.0, "BranchInclination": 0.0, "BranchLength": 0.0,
+                     "BranchHeightLimit": default_branch_height_limit, "SegmentForkFrequency": 0.0,
+                     "SegmentForkLengthMult": 0.75, "SegmentLength": 8.0, "SegmentAngle": 0.0, "SegmentPitch": 0.0,
+                     "SegmentRadius": 0.0, "OreDensity": 1.0}
+
+# The settings drawn once per motherlode, per branch and per segment.
+motherlode_settings = ("MotherlodeSize", "MotherlodeHeight", "BranchFrequency", "OreDensity")
+branch_settings = ("BranchLength", "BranchInclination", "BranchHeightLimit", "SegmentForkFrequency",
+                   "SegmentForkLengthMult")
+segment_settings = ("SegmentLength", "SegmentAngle", "SegmentPitch", "SegmentRadius")
+
+chunk_width = 16
+
+# Grids with more blocks than this are memory-mapped.
+memmap_threshold = 256 << 20
+
+# Segments shorter than this are made this long, so a branch always gets somewhere.
+min_segment_length = 1.0
+
+# Forks of forks of ... stop here.
+max_fork_depth = 4
+
+default_region_chunks = 4
+
+# levels is the number of ore blocks at each y. replaced_blocks is the number of those that would replace a block,
+# given the fraction of replaceable blocks at each y.
+VoxelResult = namedtuple("VoxelResult", "workbook name cell chunks ore_blocks replaced_blocks levels analytic")
+
+
+def row_settings(row, bindings=None) -> OrderedDict:
+    # The geometry settings of a resolved row, as {setting name: SettingDistribution}.
+    # Raises ValueError if a required setting is blank, or a cell can't be evaluated.
+    return _row_settings(row, geometry_settings, bindings, geometry_defaults)
+
+
+def replaceable_levels(height, ground_level, stone_fraction=1.0) -> np.ndarray:
+    # The fraction of blocks at each y that ore can replace: none in the bedrock floor at y = 0 or from ground level
+    # up, and stone_fraction in between.
+    levels = np.zeros(height)
+    levels[1:max(1, min(int(ground_level), height))] = stone_fraction
+    return levels
+
+
+class VoxelGrid:
+    # A boolean grid of chunks_x by chunks_z chunks, height blocks high, indexed [x, y, z]. It wraps around in x and
+    # z; y is cut off at 0 and height.
+    #
+    # Grids with more than memmap_threshold blocks (or if path is given) are kept in a np.memmap file. Use the grid
+    # as a context manager, or call close(), to remove a temporary file.
+
+    def __init__(self, chunks_x, chunks_z, height, path=None):
+        self.shape = (chunks_x * chunk_width, int(height), chunks_z * chunk_width)
+        self._temporary = None
+        if path is None and self.shape[0] * self.shape[1] * self.shape[2] > memmap_threshold:
+            handle, path = tempfile.mkstemp(suffix=".voxels")
+            os.close(handle)
+            self._temporary = path
+        if path is None:
+            self.voxels = np.zeros(self.shape, dtype=bool)
+        else:
+            self.voxels = np.memmap(path, dtype=bool, mode="w+", shape=self.shape)
+
+    @property
+    def is_memmap(self) -> bool:
+        return isinstance(self.voxels, np.memmap)
+
+    def fill(self, corner, mask):
+        # ORs mask into the grid, with mask[0, 0, 0] at block corner = (x, y, z).
+        width, height, depth = self.shape
+        x, y, z = corner
+        low, high = max(y, 0), min(y + mask.shape[1], height)
+        if low >= high:
+            return
+        mask = mask[:width, low - y:high - y, :depth]
+        if 0 <= x and x + mask.shape[0] <= width and 0 <= z and z + mask.shape[2] <= depth:
+            self.voxels[x:x + mask.shape[0], low:high, z:z + mask.shape[2]] |= mask
+        else:
+            xs = (x + np.arange(mask.shape[0])) % width
+            zs = (z + np.arange(mask.shape[2])) % depth
+            index = np.ix_(xs, np.arange(low, high), zs)
+            self.voxels[index] |= mask
+
+    def level_counts(self) -> np.ndarray:
+        # The number of set blocks at each y, read a chunk's width of the grid at a time.
+        counts = np.zeros(self.shape[1], dtype=np.int64)
+        for x in range(0, self.shape[0], chunk_width):
+            counts += np.count_nonzero(self.voxels[x:x + chunk_width], axis=(0, 2))
+        return counts
+
+    def close(self):
+        if self.is_memmap:
+            self.voxels.flush()
+        self.voxels = None
+        if self._temporary is not None:
+            os.remove(self._temporary)
+            self._temporary = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def _block_centres(low, high):
+    # The block centres from the block containing low to the one containing high, along each axis, as open grids.
+    corner = np.floor(low).astype(int)
+    size = np.floor(high).astype(int) - corner + 1
+    axes = np.ogrid[0:size[0], 0:size[1], 0:size[2]]
+    return corner, [axis + corner[i] + 0.5 for i, axis in enumerate(axes)]
+
+
+def sphere_mask(centre, radius):
+    # (corner, mask) of the blocks whose centres are within radius of centre.
+    centre = np.asarray(centre, dtype=float)
+    corner, (x, y, z) = _block_centres(centre - radius, centre + radius)
+    return corner, (x - centre[0]) ** 2 + (y - centre[1]) ** 2 + (z - centre[2]) ** 2 <= radius * radius
+
+
+def capsule_mask(start, end, radius):
+    # (corner, mask) of the blocks whose centres are within radius of the line from start to end.
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    corner, (x, y, z) = _block_centres(np.minimum(start, end) - radius, np.maximum(start, end) + radius)
+    direction = end - start
+    length_squared = direction @ direction
+    dx, dy, dz = x - start[0], y - start[1], z - start[2]
+    if length_squared == 0:
+        along = 0.0
+    else:
+        along = np.clip((dx * direction[0] + dy * direction[1] + dz * direction[2]) / length_squared, 0.0, 1.0)
+    return corner, ((dx - along * direction[0]) ** 2 + (dy - along * direction[1]) ** 2 +
+                    (dz - along * direction[2]) ** 2 <= radius * radius)
+
+
+class _Draws:
+    # Values of a SettingTable, drawn block values at a time and handed out one column per call.
+    def __init__(self, table, rng, block=64):
+        self._table, self._rng, self._block = table, rng, block
+        self._values, self._next = None, block
+
+    def __call__(self):
+        if self._next == self._block:
+            self._values = self._table.sample(self._block, self._rng).T
+            self._next = 0
+        self._next += 1
+        return self._values[self._next - 1]
+
+
+class _Rasterizer:
+    def __init__(self, settings, grid, rng):
+        self.grid, self.rng = grid, rng
+        self.segment = _Draws(SettingTable.from_settings(OrderedDict((name, settings[name])
+                                                                     for name in segment_settings)), rng)
+
+    def shape(self, corner, mask, density):
+        if density < 1.0:
+            mask &= self.rng.random(mask.shape) < density
+        self.grid.fill(corner, mask)
+
+    def branch(self, position, heading, pitch, length, limits, fork_frequency, fork_length_mult, density, depth=0):
+        while length > 0:
+            segment_length, angle, turn_pitch, radius = self.segment()
+            segment_length = min(max(segment_length, min_segment_length), length)
+            direction = np.array([math.cos(pitch) * math.cos(heading), math.sin(pitch),
+                                  math.cos(pitch) * math.sin(heading)])
+            end = position + segment_length * direction
+            end[1] = min(max(end[1], limits[0]), limits[1])
+            if radius > 0:
+                self.shape(*capsule_mask(position, end, radius), density)
+            length -= segment_length
+            position = end
+            if length > 0 and depth < max_fork_depth and self.rng.random() < fork_frequency:
+                self.branch(position, heading - angle, pitch, length * fork_length_mult, limits, fork_frequency,
+                            fork_length_mult, density, depth + 1)
+            heading += angle * self.rng.choice((-1.0, 1.0))
+            pitch += turn_pitch * self.rng.choice((-1.0, 1.0))
+
+
+@instrumentation.timed("rasterize_veins")
+def rasterize(settings, chunks=default_region_chunks, seed=None, bindings=None, stone_fraction=1.0, path=None,
+              workbook=None, name=None, cell=None) -> VoxelResult:
+    # Draws a region of chunks by chunks chunks, and counts its ore. settings is from row_settings(); bindings give
+    # the dimension's ground level and height (by default, cog_expressions.default_bindings). seed is a seed or a
+    # np.random.Generator. path, if given, is where the grid is memory-mapped.
+    bindings = dict(default_bindings, **(bindings or {}))
+    height = int(bindings["dimension.height"])
+    rng = np.random.default_rng(seed)
+    motherlode_table = SettingTable.from_settings(OrderedDict((n, settings[n]) for n in motherlode_settings))
+    branch_table = SettingTable.from_settings(OrderedDict((n, settings[n]) for n in branch_settings))
+
+    with VoxelGrid(chunks, chunks, height, path) as grid:
+        rasterizer = _Rasterizer(settings, grid, rng)
+        counts = counts_from_frequencies(np.maximum(sample(settings["MotherlodeFrequency"], chunks * chunks, rng),
+                                                    0.0), rng)
+        for chunk, count in enumerate(counts):
+            for size, y, branch_frequency, density in motherlode_table.sample(int(count), rng).T:
+                centre = np.array([(chunk // chunks + rng.random()) * chunk_width, y,
+                                   (chunk % chunks + rng.random()) * chunk_width])
+                if size > 0:
+                    rasterizer.shape(*sphere_mask(centre, size), density)
+                branches = counts_from_frequencies(np.array([max(branch_frequency, 0.0)]), rng)[0]
+                for length, inclination, limit, fork_frequency, fork_length_mult in \
+                        branch_table.sample(int(branches), rng).T:
+                    rasterizer.branch(centre, rng.uniform(0, 2 * math.pi), inclination, length,
+                                      (y - limit, y + limit), fork_frequency, fork_length_mult, density)
+        levels = grid.level_counts()
+
+    if instrumentation.is_enabled():
+        instrumentation.count("rasterize_veins", "chunks", chunks * chunks)
+    replaced = float(levels @ replaceable_levels(height, bindings["dimension.groundLevel"], stone_fraction))
+    return VoxelResult(workbook, name, cell, chunks * chunks, int(levels.sum()), replaced, levels,
+                       analytic_mean(settings))
+
+
+def rasterize_tables(workbook, tables, chunks=default_region_chunks, salt=0, bindings=None, **options):
+    # Rasterizes every enabled Veins distribution in tables (as produced by iter_workbook_tables()), each with the
+    # generator of its seed. Returns (results, skipped), like ore_simulation.estimate_tables().
+    results, skipped = [], []
+    for row, cell, resolved in veins_distributions(tables):
+        try:
+            settings = row_settings(resolved, bindings)
+        except ValueError as e:
+            skipped.append((cell, row.get("name"), str(e)))
+            continue
+        results.append(rasterize(settings, chunks, generator(row, salt), bindings, workbook=workbook,
+                                 name=row.get("name"), cell=cell, **options))
+    return results, skipped
+
+
+def format_result(result: VoxelResult) -> str:
+    return "%s %s: %.2f replaced blocks/chunk (%.2f ore blocks/chunk; volume formula %.2f)" % (
+        result.cell, result.name, result.replaced_blocks / result.chunks, result.ore_blocks / result.chunks,
+        result.analytic)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count the blocks Veins distributions replace, block by block.")
+    parser.add_argument("workbooks", nargs="+", help="Excel workbooks (.xlsx) to read distributions from.")
+    parser.add_argument("--chunks", type=int, default=default_region_chunks,
+                        help="Width of the (square) region to simulate, in chunks.")
+    parser.add_argument("--salt", type=int, default=0,
+                        help="Combined with each distribution's seed; change it for another independent run.")
+    parser.add_argument("--stone-fraction", type=float, default=1.0,
+                        help="Fraction of the blocks between bedrock and ground level that can be replaced.")
+    parser.add_argument("--memmap", metavar="FILE", default=None,
+                        help="Keep the grid in this file, rather than in memory or a temporary file.")
+    args = parser.parse_args(argv)
+
+    for path in args.workbooks:
+        start = time.perf_counter()
+        results, skipped = rasterize_tables(path, iter_workbook_tables(openpyxl.load_workbook(path)), args.chunks,
+                                            args.salt, stone_fraction=args.stone_fraction, path=args.memmap)
+        for result in results:
+            print(format_result(result))
+        for cell, name, reason in skipped:
+            print("%s %s: skipped, %s" % (cell, name, reason))
+        print("%s: %d distributions in %.2fs" % (path, len(results), time.perf_counter() - start))
+
+
+def _settings(**values):
+    settings = OrderedDict((name, SettingDistribution(geometry_defaults.get(name, 0.0), 0.0, "uniform"))
+                           for name in geometry_settings)
+    settings.update((name, SettingDistribution(float(value), 0.0, "uniform")) for name, value in values.items())
+    return settings
+
+
+class TestShapes(unittest.TestCase):
+    def test_sphere(self):
+        corner, mask = sphere_mask((10.0, 20.0, 30.0), 6.0)
+        self.assertAlmostEqual(mask.sum() / (4 / 3 * math.pi * 6 ** 3), 1.0, delta=0.05)
+        self.assertEqual(tuple(corner), (4, 14, 24))
+
+    def test_capsule(self):
+        corner, mask = capsule_mask((0.3, 10.2, 0.4), (40.3, 10.2, 0.4), 3.0)
+        volume = math.pi * 3 ** 2 * 40 + 4 / 3 * math.pi * 3 ** 3
+        self.assertAlmostEqual(mask.sum() / volume, 1.0, delta=0.1)
+        self.assertEqual(capsule_mask((1.5, 1.5, 1.5), (1.5, 1.5, 1.5), 0.5)[1].sum(), 1)
+
+
+class TestVoxelGrid(unittest.TestCase):
+    def test_overlap_and_clipping(self):
+        grid = VoxelGrid(2, 2, 64)
+        corner, mask = sphere_mask((16.0, 32.0, 16.0), 5.0)
+        grid.fill(corner, mask)
+        grid.fill(corner, mask)
+        self.assertEqual(grid.level_counts().sum(), mask.sum())
+        corner, mask = sphere_mask((16.0, 0.0, 16.0), 5.0)
+        grid = VoxelGrid(2, 2, 64)
+        grid.fill(corner, mask)
+        self.assertEqual(grid.level_counts().sum(), mask[:, -corner[1]:, :].sum())
+
+    def test_wraps_around(self):
+        grid = VoxelGrid(1, 1, 64)
+        corner, mask = sphere_mask((0.0, 32.0, 15.5), 4.0)
+        grid.fill(corner, mask)
+        self.assertEqual(grid.level_counts().sum(), mask.sum())
+        self.assertTrue(grid.voxels[15, 32, 0] and grid.voxels[0, 32, 15])
+
+    def test_memmap(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "grid.voxels")
+        corner, mask = sphere_mask((8.0, 32.0, 8.0), 5.0)
+        with VoxelGrid(1, 1, 64, path) as grid:
+            self.assertTrue(grid.is_memmap)
+            grid.fill(corner, mask)
+            self.assertEqual(grid.level_counts().sum(), mask.sum())
+        os.remove(path)
+        os.rmdir(directory)
+
+    def test_replaceable_levels(self):
+        levels = replaceable_levels(8, 4, 0.5)
+        self.assertEqual(levels.tolist(), [0, 0.5, 0.5, 0.5, 0, 0, 0, 0])
+
+
+class TestRasterize(unittest.TestCase):
+    def test_motherlodes(self):
+        settings = _settings(MotherlodeFrequency=1, MotherlodeSize=3, MotherlodeHeight=32)
+        result = rasterize(settings, 4, seed=1)
+        self.assertEqual(result.chunks, 16)
+        self.assertAlmostEqual(result.ore_blocks / 16 / result.analytic, 1.0, delta=0.15)
+        self.assertEqual(result.replaced_blocks, result.ore_blocks)
+        self.assertEqual(result.levels[:28].sum() + result.levels[37:].sum(), 0)
+
+    def test_cut_off_at_ground_level(self):
+        settings = _settings(MotherlodeFrequency=1, MotherlodeSize=3, MotherlodeHeight=64)
+        result = rasterize(settings, 2, seed=1)
+        self.assertAlmostEqual(result.replaced_blocks / result.ore_blocks, 0.5, delta=0.1)
+        half = rasterize(settings, 2, seed=1, stone_fraction=0.5)
+        self.assertAlmostEqual(half.replaced_blocks, result.replaced_blocks / 2)
+
+    def test_branches_stay_near_motherlode(self):
+        settings = _settings(MotherlodeFrequency=1, MotherlodeSize=0, MotherlodeHeight=32, BranchFrequency=2,
+                             BranchLength=100, BranchInclination=1.0, BranchHeightLimit=8, SegmentLength=10,
+                             SegmentRadius=1.5, SegmentForkFrequency=0.3)
+        result = rasterize(settings, 2, seed=1)
+        self.assertGreater(result.ore_blocks, 0)
+        self.assertEqual(result.levels[:22].sum() + result.levels[43:].sum(), 0)
+
+    def test_workbook(self):
+        path = "Sprocket2 Spreadsheet.xlsx"
+        results, skipped = rasterize_tables(path, iter_workbook_tables(openpyxl.load_workbook(path)), 2)
+        iron = next(result for result in results if result.name == "LotsOfIron")
+        self.assertLessEqual(iron.replaced_blocks, iron.ore_blocks)
+        self.assertIn("LotsOfIron", format_result(iron))
+
+    def test_skipped(self):
+        location = TableLocation("Veins", 1, 1, ("Type", "name", "MotherlodeSize_avg"))
+        rows = [{"Type": "Distribution", "name": "Broken", "MotherlodeFrequency_avg": "1",
+                 "MotherlodeSize_avg": ":= min()", "MotherlodeHeight_avg": "32"}]
+        results, skipped = rasterize_tables("a.xlsx", [("Veins_Presets", rows, location)], 1)
+        self.assertEqual(results, [])
+        self.assertEqual([(cell, name) for cell, name, reason in skipped], [("Veins!A2:C2", "Broken")])
+
+
+if __name__ == '__main__':
+    main()
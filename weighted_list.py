@@ -1,9 +1,12 @@
 import re
 import unittest
+from collections import defaultdict
 
 from contracts import contract
 from lxml import etree
 
+import instrumentation
+
 
 @contract(parent_xml_element=etree._Element, type_of_element=str, name_of_attribute=str, weighted_pair_list=str)
 def weighted_list_generator(parent_xml_element, type_of_element: str, name_of_attribute: str, weighted_pair_list: str):
@@ -43,6 +46,7 @@ def weighted_list_generator(parent_xml_element, type_of_element: str, name_of_at
     # The xml_parent_element is modified in place.
 
 
+@instrumentation.timed("weighted_pair_list_parser")
 @contract(weighted_pair_list=str)
 def weighted_pair_list_parser(weighted_pair_list: str, ):
     # Given a string such as:
@@ -74,19 +78,47 @@ def weighted_pair_list_parser(weighted_pair_list: str, ):
     weighted_pairs = [pair.split(sep=",") for pair in pair_strings]
 
     # Check that each pair contains two strings
-    if any([len(pair) != 2 for pair in weighted_pairs]):
-        raise ValueError
+    for pair in weighted_pairs:
+        if len(pair) != 2:
+            raise ValueError("%r is not a pair. Expected pairs like 'minecraft:stone, 1.00;', separated by semicolons."
+                             % ",".join(pair))
 
     # Check that second item of each pair represents a number
     for a, b in weighted_pairs:
         try:
             float(b)
         except ValueError:
-            raise
+            raise ValueError("The weight of %s, %r, is not a number." % (a, b)) from None
 
     return weighted_pairs
 
 
+def weighted_list_references(tables, columns):
+    # Collects the names used in the weighted lists of the given columns, across a whole workbook.
+    #
+    # tables is an iterable of (table_name, table_data, location), as produced by
+    # excel_table.iter_workbook_tables().
+    # Returns a dictionary of {name: [cell_reference, ...]}, i.e. {"minecraft:iron_ore": ["Veins!K12", "Veins!K14"]},
+    # so that each distinct name only needs to be checked once.
+    #
+    # Cells that aren't valid weighted lists are skipped; rendering reports those.
+    references = defaultdict(list)
+    for table_name, table_data, location in tables:
+        for row_index, row in enumerate(table_data):
+            for column in columns:
+                value = row.get(column)
+                if not isinstance(value, str):
+                    continue
+                try:
+                    pairs = weighted_pair_list_parser(value)
+                except ValueError:
+                    continue
+                cell = location.cell_reference(row_index, column)
+                for name, weight in pairs:
+                    references[name].append(cell)
+    return references
+
+
 class TestWeightedPairListParser(unittest.TestCase):
     def test_one_pair(self):
         weighted_pair_list = "iron,0.95;"
@@ -164,5 +196,20 @@ class TestWeightedListGenerator(unittest.TestCase):
         self.assertEqual(output, expected)
 
 
+class TestWeightedListReferences(unittest.TestCase):
+    def test_references(self):
+        from excel_table import TableLocation
+        header = ["name", "OreBlock", "Biome"]
+        table_data = [
+            {"name": "a", "OreBlock": "iron, 1.0; gold, 1.0;", "Biome": "Plains, 1.0;"},
+            {"name": "b", "OreBlock": "iron, 1.0;", "Biome": "not a weighted list"},
+            {"name": "c", "OreBlock": None, "Biome": 1.0},
+        ]
+        location = TableLocation("Veins", 1, 1, header)
+
+        references = weighted_list_references([("Veins_Presets", table_data, location)], ["OreBlock", "Biome"])
+        self.assertEqual(references, {"iron": ["Veins!B2", "Veins!B3"], "gold": ["Veins!B2"], "Plains": ["Veins!C2"]})
+
+
 if __name__ == '__main__':
     unittest.main()